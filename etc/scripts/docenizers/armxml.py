@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""Parsing shared by the docenizers for the ARM ISA XML releases (arm32, aarch64).
+
+Each XML file is streamed with iterparse and only read as far as the
+instruction title and the first few description paragraphs. Files are parsed
+in a process pool (in-process when profiling), and the results are cached by
+file content. Each docenizer has its own cache file, as the arm32 and aarch64
+ones may run concurrently in the same input folder.
+"""
+import hashlib
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+from docenizer import PROFILER, DocenizerError, Instruction, profile_document
+
+# The maximum number of paragraphs from the description to copy.
+MAX_DESC_PARAS = 5
+STRIP_SUFFIX = re.compile(r'\s*(\(.*\))?\s*--.*')
+# Bump whenever the parsed records change shape, to invalidate existing caches.
+CACHE_VERSION = 1
+CACHE_NAME = 'armxml-cache-{arch}.json'
+
+
+def paragraph_html(para):
+    """Serializes a <para> the way it is shown in the tooltip: as a <p>."""
+    inner = ET.tostring(para, encoding='unicode', short_empty_elements=False)
+    inner = inner[inner.index('>') + 1:inner.rindex('<')]
+    return f'<p>{inner}</p>'
+
+
+def read_instruction_section(path):
+    """Streams an ARM XML file, reading only what the docs need.
+
+    Returns the title of the first <instructionsection> and the first
+    MAX_DESC_PARAS <para>s of its <desc><authored> (or None where missing).
+    Reading stops as soon as those are complete, and every element outside
+    of the kept paragraphs is cleared once it has been parsed.
+    """
+    title = desc = authored = None
+    paragraphs = []
+    kept = set()
+    open_paragraphs = 0
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            if title is None:
+                if elem.tag == 'instructionsection':
+                    title = elem.get('title')
+            elif desc is None:
+                if elem.tag == 'desc':
+                    desc = elem
+            elif authored is None:
+                if elem.tag == 'authored':
+                    authored = elem
+            elif elem.tag == 'para' and len(paragraphs) < MAX_DESC_PARAS:
+                paragraphs.append(elem)
+                kept.add(id(elem))
+                open_paragraphs += 1
+            continue
+        if id(elem) in kept:
+            open_paragraphs -= 1
+        if elem is desc or elem is authored:
+            break
+        if len(paragraphs) == MAX_DESC_PARAS and open_paragraphs == 0:
+            break
+        if open_paragraphs == 0 and id(elem) not in kept:
+            elem.clear()
+    if title is None:
+        return None, None
+    if authored is None:
+        return title, None
+    return title, paragraphs
+
+
+def parse_file(path):
+    """Returns the [title, tooltip, html] record for an XML file, or None."""
+    filename = os.path.splitext(os.path.basename(path))[0]
+    try:
+        title, paragraphs = read_instruction_section(path)
+    except ET.ParseError as e:
+        print(f"{filename}: Failed to parse XML: {e}")
+        return None
+    if title is None:
+        print(filename + ": Failed to find instructionsection")
+        return None
+    if not paragraphs:
+        return None
+    return [title,
+            ''.join(paragraphs[0].itertext()).strip(),
+            ''.join(map(paragraph_html, paragraphs)).strip()]
+
+
+def parse_file_profiled(path):
+    with profile_document(os.path.basename(path)):
+        return parse_file(path)
+
+
+def hash_file(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class ParseCache(object):
+    """Parsed records keyed by the SHA-1 of the XML file they came from."""
+
+    def __init__(self, path):
+        self.path = path
+        self.records = self._load()
+        self.dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get('version') != CACHE_VERSION or cache.get('max_desc_paras') != MAX_DESC_PARAS:
+            return {}
+        return cache['records']
+
+    def get(self, key):
+        return self.records.get(key)
+
+    def __contains__(self, key):
+        return key in self.records
+
+    def put(self, key, record):
+        self.records[key] = record
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        partial = f'{self.path}.{os.getpid()}'
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'max_desc_paras': MAX_DESC_PARAS, 'records': self.records}, f)
+        os.replace(partial, self.path)
+        self.dirty = False
+
+
+def find_xml_files(directory, ignored):
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            if file.endswith(".xml") and file != "onebigfile.xml":
+                if os.path.splitext(file)[0] in ignored:
+                    continue
+                paths.append(os.path.join(root, file))
+    return sorted(paths)
+
+
+def parse_xml(arch, directory, inputfolder, get_url, ignored=(), upper_case=False, jobs=None):
+    """Parses all XML files in `directory` into `Instruction`s.
+
+    Only files that are not in the parse cache of `arch` in `inputfolder` are
+    parsed, in a process pool of `jobs` workers.
+    """
+    print("Parsing instructions...")
+    cache = ParseCache(os.path.join(inputfolder, CACHE_NAME.format(arch=arch)))
+    paths = find_xml_files(directory, ignored)
+    keys = [hash_file(path) for path in paths]
+    missing = [(path, key) for path, key in zip(paths, keys) if key not in cache]
+    print(f"{len(paths) - len(missing)} of {len(paths)} files found in the parse cache")
+    if missing and PROFILER.active:
+        for path, key in missing:
+            cache.put(key, parse_file_profiled(path))
+        cache.save()
+    elif missing:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            records = executor.map(parse_file, [path for path, _ in missing], chunksize=16)
+            for (_, key), record in zip(missing, records):
+                cache.put(key, record)
+        cache.save()
+
+    instructions = []
+    for path, key in zip(paths, keys):
+        record = cache.get(key)
+        if record is None:
+            continue
+        title, tooltip, body = record
+        names = set()
+        for name in STRIP_SUFFIX.sub('', title).split(','):
+            name = name.strip()
+            names.add(name.upper() if upper_case else name)
+        instruction = Instruction(os.path.splitext(os.path.basename(path))[0], sorted(names), tooltip, body)
+        instruction.url = get_url(instruction)
+        instructions.append(instruction)
+    instructions.sort(key=lambda b: b.name)
+    return instructions
+
+
+def self_test(instructions, directory):
+    # For each generated instruction, check that there is a path to a file in
+    # the documentation.
+    ok = True
+    for inst in instructions:
+        if not os.path.isfile(os.path.join(directory, inst.name + ".xml")):
+            print("Warning: {} has not file associated".format(inst.name))
+            ok = False
+    return ok
+
+
+def check_instructions(instructions, directory):
+    if not self_test(instructions, directory):
+        raise DocenizerError("Tests do not pass. Not writing output file. Aborting.", exit_code=3)
+    return instructions
@@ -0,0 +1,156 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark and output-regression harness for the docenizers.
+
+Every Python docenizer is run offline on the small frozen corpus in
+test/fixtures/<arch>/, which mirrors the files it downloads (and, for archives,
+their extracted folder). The time of each stage, the number of instructions
+and a hash of everything written are compared against test/baselines.json.
+A changed count or hash is a regression; so is a stage getting more than
+--tolerance times slower than its baseline.
+
+Run with --update after an intended change of the output to store new
+baselines.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+
+import docenizer
+from docenizer import DownloadCache, STAGES
+
+FIXTURES_DIR = os.path.join(docenizer.SCRIPT_DIR, 'test', 'fixtures')
+BASELINES_FILE = os.path.join(docenizer.SCRIPT_DIR, 'test', 'baselines.json')
+# Slowdowns smaller than this many seconds are noise on the fixtures.
+MIN_SLOWDOWN = 0.05
+
+
+def fixture_archs():
+    return sorted(os.path.basename(path) for path in glob.glob(os.path.join(FIXTURES_DIR, '*'))
+                  if os.path.isdir(path))
+
+
+def hash_output(directory):
+    """Hashes the names and contents of all files in `directory`."""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        digest.update(name.encode() + b'\0')
+        with open(os.path.join(directory, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def configure_local_sources(pipeline, fixtures):
+    """Points each optional local input at `fixtures/<option>.*`, if there is one."""
+    for source in pipeline.local_sources:
+        matches = glob.glob(os.path.join(fixtures, f'{source.option}.*'))
+        source.path = matches[0] if matches else None
+
+
+def run_pipeline(arch, log):
+    """Runs a docenizer on its fixtures in a scratch folder. Returns its timings, count and output hash."""
+    fixtures = os.path.join(FIXTURES_DIR, arch)
+    pipeline = docenizer.load_docenizer(os.path.join(docenizer.SCRIPT_DIR, f'docenizer-{arch}.py'))
+    configure_local_sources(pipeline, fixtures)
+    with tempfile.TemporaryDirectory() as tmp:
+        # Parsers may write caches into their input folder; keep those out of the fixtures.
+        inputfolder = os.path.join(tmp, 'input')
+        shutil.copytree(fixtures, inputfolder)
+        outputdir = os.path.join(tmp, 'output')
+        os.makedirs(outputdir)
+        cache = DownloadCache(os.path.join(tmp, 'cache'), mirror=fixtures)
+        with redirect_stdout(log), redirect_stderr(log):
+            timings, count = pipeline.run(cache, os.path.join(outputdir, f'asm-docs-{arch}.ts'), inputfolder)
+        return timings, count, hash_output(outputdir)
+
+
+def benchmark(arch, repeat, log):
+    """Returns the result of `arch`, with the fastest time of each stage over `repeat` runs.
+
+    The docenizers log to the `log` file object.
+    """
+    best = {}
+    for _ in range(repeat):
+        timings, count, digest = run_pipeline(arch, log)
+        for stage, seconds in timings.items():
+            best[stage] = min(seconds, best.get(stage, seconds))
+    return {'instructions': count, 'sha256': digest,
+            'timings': {stage: round(seconds, 6) for stage, seconds in best.items()}}
+
+
+def load_baselines():
+    try:
+        with open(BASELINES_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(baselines):
+    with open(BASELINES_FILE, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(result, baseline, tolerance):
+    """Returns the list of regressions of `result` against its baseline."""
+    if baseline is None:
+        return ['no baseline, run with --update to store one']
+    problems = []
+    if result['instructions'] != baseline['instructions']:
+        problems.append(f"{baseline['instructions']} -> {result['instructions']} instructions")
+    if result['sha256'] != baseline['sha256']:
+        problems.append('output changed')
+    for stage, seconds in result['timings'].items():
+        before = baseline.get('timings', {}).get(stage)
+        if before is not None and seconds > before * tolerance and seconds - before > MIN_SLOWDOWN:
+            problems.append(f"{stage} more than {tolerance:g}x slower ({before:.3f}s -> {seconds:.3f}s)")
+    return problems
+
+
+def format_result(arch, result):
+    stages = '  '.join(f"{stage} {result['timings'][stage]:7.3f}s" if stage in result['timings'] else ' ' * 14
+                       for stage in STAGES)
+    return f"{arch:8}  {result['instructions']:5} instructions  {stages}"
+
+
+def main():
+    archs = fixture_archs()
+    parser = argparse.ArgumentParser(description='Benchmarks the docenizers on frozen fixtures and checks their output')
+    parser.add_argument('--only', type=str, nargs='+', metavar='ARCH', choices=archs,
+                        help='Only run the docenizers for these architectures')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='Number of runs, keeping the fastest time of each stage. Default is 3')
+    parser.add_argument('-t', '--tolerance', type=float, default=3.0,
+                        help='How many times slower than its baseline a stage may get. Default is 3')
+    parser.add_argument('--update', action='store_true', help='Store the results as the new baselines')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Show the output of the docenizers')
+    args = parser.parse_args()
+
+    baselines = load_baselines()
+    log = sys.stderr if args.verbose else open(os.devnull, 'w')
+    failed = False
+    for arch in args.only or archs:
+        result = benchmark(arch, args.repeat, log)
+        print(format_result(arch, result))
+        if args.update:
+            baselines[arch] = result
+            continue
+        for problem in compare(result, baselines.get(arch), args.tolerance):
+            print(f"{arch}: REGRESSION: {problem}")
+            failed = True
+    if args.update:
+        save_baselines(baselines)
+        print(f"Baselines written to {BASELINES_FILE}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Compressed bundles of the generated instruction docs.
+
+The html of the generated docs is very repetitive, within and across
+architectures: boilerplate phrases, <p> wrappers, link targets. A bundle
+stores every record as its own raw deflate stream, compressed against a preset
+dictionary trained once from the records of all architectures, so looking up
+one instruction only inflates that record.
+
+The dictionary is written to lib/asm-docs/generated/asm-docs-bundle-dictionary.ts
+and each architecture to asm-docs-bundle-<arch>.ts, which exports the same
+`getAsmOpcode` as asm-docs-<arch>.ts, so a provider can import either. zlib is
+used rather than zstd as node's zlib supports preset dictionaries on every
+version we run on.
+
+Run directly to bundle the generated docs on disk, or with --measure to
+compare the bundles against the plain generated files.
+"""
+import argparse
+import base64
+import glob
+import json
+import os
+import re
+import statistics
+import time
+import zlib
+
+from docenizer import GENERATED_DIR
+
+BUNDLE_PREFIX = 'asm-docs-bundle-'
+DICTIONARY_NAME = f'{BUNDLE_PREFIX}dictionary.ts'
+# zlib only looks back 32KiB, so a larger dictionary would not help.
+DICTIONARY_SIZE = 32 * 1024
+# The most records of one architecture to train the dictionary on.
+MAX_TRAINING_RECORDS = 2000
+# Phrases are made of up to this many tokens.
+MAX_PHRASE_TOKENS = 6
+COMPRESSION_LEVEL = 9
+
+CASE_RE = re.compile(r'^\s*case (".*"|\'.*\'):$')
+# Records written by `TsEmitter` are JSON, the ones of the TypeScript docenizers template literals.
+JSON_FIELD_RE = re.compile(r'^\s*("\w+"): (.*?),?$')
+TEMPLATE_FIELD_RE = re.compile(r'^\s*(\w+): `(.*)`,?$')
+TEMPLATE_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)')
+TEMPLATE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+BUNDLE_OPCODES_RE = re.compile(r'^const OPCODES = new Map<string, number>\(Object\.entries\((.*)\)\);$')
+BUNDLE_RECORD_RE = re.compile(r"^    '([A-Za-z0-9+/=]*)',$")
+PHRASE_TOKEN_RE = re.compile(r'<[^>]*>|[^<\s]+\s*|\s+')
+DICTIONARY_HEADER = """// Preset dictionary of the compressed docs bundles, see etc/scripts/docenizers/bundle.py.
+"""
+BUNDLE_HEADER = """import zlib from 'zlib';
+
+import {{AssemblyInstructionInfo}} from '../base.js';
+import {{DICTIONARY}} from './{dictionary}';
+
+"""
+# Each record is inflated on its own, against the dictionary decoded on the first lookup.
+BUNDLE_FOOTER = """
+let dictionary: Buffer | undefined;
+
+export function getAsmOpcode(opcode: string | undefined): AssemblyInstructionInfo | undefined {
+    if (!opcode) return;
+    const index = OPCODES.get(UPPER_CASE ? opcode.toUpperCase() : opcode);
+    if (index === undefined) return;
+    if (!dictionary) dictionary = Buffer.from(DICTIONARY, 'base64');
+    const record = zlib.inflateRawSync(Buffer.from(RECORDS[index], 'base64'), {dictionary});
+    return JSON.parse(record.toString('utf8'));
+}
+"""
+
+
+def unescape_template(text):
+    """The value of the text of a template literal, e.g. ` for \\`."""
+
+    def unescape(match):
+        escape = match.group(1)
+        if len(escape) > 1:
+            return chr(int(escape[1:].strip('{}'), 16))
+        return TEMPLATE_ESCAPES.get(escape, escape)
+
+    return TEMPLATE_ESCAPE_RE.sub(unescape, text)
+
+
+def read_records(path):
+    """Reads back the records of a generated asm-docs-<arch>.ts.
+
+    Returns a list of (names, record) pairs and whether opcodes are looked up
+    in upper case. Both the layout written by `TsEmitter` and the one of the
+    TypeScript docenizers are understood.
+    """
+    records, names, record = [], [], None
+    upper_case = False
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if 'opcode.toUpperCase()' in line:
+                upper_case = True
+            if record is None:
+                case = CASE_RE.match(line)
+                if case:
+                    name = case.group(1)
+                    names.append(json.loads(name) if name.startswith('"') else name[1:-1])
+                elif line.strip() == 'return {' and names:
+                    record = {}
+            elif line.strip().startswith('}'):
+                records.append((names, record))
+                names, record = [], None
+            else:
+                field = JSON_FIELD_RE.match(line)
+                if field:
+                    record[json.loads(field.group(1))] = json.loads(field.group(2))
+                    continue
+                field = TEMPLATE_FIELD_RE.match(line)
+                if field:
+                    record[field.group(1)] = unescape_template(field.group(2))
+    return records, upper_case
+
+
+def generated_archs(directory):
+    """The architectures with generated docs in `directory`."""
+    archs = []
+    for path in sorted(glob.glob(os.path.join(directory, 'asm-docs-*.ts'))):
+        arch = os.path.basename(path)[len('asm-docs-'):-len('.ts')]
+        if not arch.startswith(('search', 'bundle-')) and not arch.endswith('-versions'):
+            archs.append(arch)
+    return archs
+
+
+def serialize(record):
+    return json.dumps(record, separators=(',', ':'), sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
+def train_dictionary(samples, size=DICTIONARY_SIZE):
+    """Builds a preset dictionary from the phrases most shared between `samples`.
+
+    A phrase is a run of up to MAX_PHRASE_TOKENS tags or words. Each one is
+    scored by the bytes it would save: its length times the number of samples
+    it appears in, beyond the first. The best ones go last, as deflate codes
+    nearer matches in fewer bits.
+    """
+    frequency = {}
+    for sample in samples:
+        tokens = PHRASE_TOKEN_RE.findall(sample.decode('utf-8'))
+        phrases = set()
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(start + MAX_PHRASE_TOKENS, len(tokens)) + 1):
+                phrases.add(''.join(tokens[start:end]))
+        for phrase in phrases:
+            frequency[phrase] = frequency.get(phrase, 0) + 1
+    scored = sorted(((count - 1) * len(phrase.encode('utf-8')), phrase)
+                    for phrase, count in frequency.items() if count > 1 and len(phrase) > 3)
+    chosen, used = [], 0
+    for _, phrase in reversed(scored):
+        data = phrase.encode('utf-8')
+        if used + len(data) > size:
+            continue
+        # Phrases already covered by a longer one add nothing.
+        if any(phrase in other for other in chosen):
+            continue
+        chosen.append(phrase)
+        used += len(data)
+        if size - used < 8:
+            break
+    return ''.join(reversed(chosen)).encode('utf-8')
+
+
+def training_samples(records_by_arch):
+    """An even sample of each architecture's records, so large ones don't crowd out the others."""
+    samples = []
+    for records in records_by_arch.values():
+        step = max(1, len(records) // MAX_TRAINING_RECORDS)
+        samples.extend(serialize(record) for _, record in records[::step])
+    return samples
+
+
+def compress(data, dictionary):
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, -15, zdict=dictionary) if dictionary \
+        else zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def decompress(data, dictionary):
+    decompressor = zlib.decompressobj(-15, zdict=dictionary) if dictionary else zlib.decompressobj(-15)
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+def bundle_path(directory, arch):
+    return os.path.join(directory, f'{BUNDLE_PREFIX}{arch}.ts')
+
+
+def write_dictionary(dictionary, directory):
+    path = os.path.join(directory, DICTIONARY_NAME)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(DICTIONARY_HEADER)
+        f.write(f"export const DICTIONARY = '{base64.b64encode(dictionary).decode()}';\n")
+    return path
+
+
+def write_bundle(arch, records, upper_case, dictionary, directory):
+    """Writes the bundle of `arch`: an opcode -> record index map and the compressed records."""
+    opcodes, blobs = {}, []
+    for names, record in records:
+        # As in the switch of the plain docs, an opcode listed in several cases gets the first, and cases
+        # in lower case are never reached when opcodes are looked up in upper case.
+        names = [name for name in names if name not in opcodes and not (upper_case and name != name.upper())]
+        if not names:
+            continue
+        for name in names:
+            opcodes[name] = len(blobs)
+        blobs.append(base64.b64encode(compress(serialize(record), dictionary)).decode())
+    path = bundle_path(arch=arch, directory=directory)
+    print(f"Writing {len(blobs)} compressed records to {path}")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(BUNDLE_HEADER.format(dictionary=DICTIONARY_NAME[:-len('.ts')] + '.js'))
+        f.write(f'const UPPER_CASE = {json.dumps(upper_case)};\n')
+        # A map, so that opcodes like "constructor" don't find the prototype of an object.
+        opcodes_json = json.dumps(opcodes, separators=(",", ":"))
+        f.write(f'const OPCODES = new Map<string, number>(Object.entries({opcodes_json}));\n')
+        f.write('const RECORDS = [\n')
+        for blob in blobs:
+            f.write(f"    '{blob}',\n")
+        f.write('];\n')
+        f.write(BUNDLE_FOOTER)
+    return path
+
+
+def read_bundle(path, dictionary):
+    """Reads back the records of a bundle written by `write_bundle`, by opcode."""
+    opcodes, blobs = {}, []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            match = BUNDLE_OPCODES_RE.match(line)
+            if match:
+                opcodes = json.loads(match.group(1))
+                continue
+            match = BUNDLE_RECORD_RE.match(line)
+            if match:
+                blobs.append(match.group(1))
+    return {opcode: json.loads(decompress(base64.b64decode(blobs[index]), dictionary))
+            for opcode, index in opcodes.items()}
+
+
+def read_all(directory):
+    return {arch: read_records(os.path.join(directory, f'asm-docs-{arch}.ts')) for arch in generated_archs(directory)}
+
+
+def bundle_generated(directory):
+    """Trains a dictionary on the generated docs in `directory` and bundles every architecture."""
+    generated = {arch: result for arch, result in read_all(directory).items() if result[0]}
+    dictionary = train_dictionary(training_samples({arch: records for arch, (records, _) in generated.items()}))
+    print(f"Trained a {len(dictionary)} byte dictionary on {len(generated)} architectures")
+    write_dictionary(dictionary, directory)
+    for arch, (records, upper_case) in generated.items():
+        write_bundle(arch, records, upper_case, dictionary, directory)
+
+
+def lookup_latency(blobs, dictionary, rounds=5):
+    """The median time, in microseconds, to inflate and decode one record."""
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for blob in blobs:
+            json.loads(decompress(base64.b64decode(blob), dictionary))
+        times.append((time.perf_counter() - start) / len(blobs) * 1e6)
+    return statistics.median(times)
+
+
+def measure(directory):
+    """Compares the plain generated docs with bundles with and without the shared dictionary.
+
+    On disk is the size of the modules. Held is what stays in memory once a
+    module is loaded: the record strings for the plain docs, the base64 of
+    the compressed records for the bundles.
+    """
+    generated = {arch: result for arch, result in read_all(directory).items() if result[0]}
+    dictionary = train_dictionary(training_samples({arch: records for arch, (records, _) in generated.items()}))
+    rows = [('arch', 'records', 'plain', 'no dict', 'shared dict', 'held plain', 'held bundle', 'lookup')]
+    totals = [0, 0, 0, 0, 0]
+    for arch, (records, _) in generated.items():
+        plain = os.path.getsize(os.path.join(directory, f'asm-docs-{arch}.ts'))
+        held_plain = sum(len(serialize(record)) for _, record in records)
+        undictionaried = [base64.b64encode(compress(serialize(record), b'')) for _, record in records]
+        blobs = [base64.b64encode(compress(serialize(record), dictionary)) for _, record in records]
+        # The opcode map and the quotes around each record.
+        overhead = sum(len(name) + 8 for names, _ in records for name in names) + 8 * len(records)
+        no_dict = sum(map(len, undictionaried)) + overhead
+        shared = sum(map(len, blobs)) + overhead
+        held = sum(map(len, blobs))
+        for i, value in enumerate((plain, no_dict, shared, held_plain, held)):
+            totals[i] += value
+        rows.append((arch, str(len(records)), kib(plain), kib(no_dict), kib(shared), kib(held_plain), kib(held),
+                     f'{lookup_latency(blobs, dictionary):.1f}us'))
+    rows.append(('total', '', *(kib(value) for value in totals[:3]), *(kib(value) for value in totals[3:]), ''))
+    rows.append(('dictionary', '', '', '', kib(len(base64.b64encode(dictionary))), '', kib(len(dictionary)), ''))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return '\n'.join('  '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+
+
+def kib(size):
+    return f'{size / 1024:.0f}KiB'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bundles the generated instruction docs into compressed modules')
+    parser.add_argument('-g', '--generated', type=str, default=GENERATED_DIR,
+                        help='Folder of the generated docs. Default is lib/asm-docs/generated/')
+    parser.add_argument('--measure', action='store_true',
+                        help='Compare the size and lookup time of the bundles with the plain docs, writing nothing')
+    args = parser.parse_args()
+    if args.measure:
+        print(measure(args.generated))
+    else:
+        bundle_generated(args.generated)
+
+
+if __name__ == '__main__':
+    main()
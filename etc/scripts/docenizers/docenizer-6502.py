@@ -1,17 +1,15 @@
 #!/usr/bin/env python3
-import argparse
 import enum
-import json
-import os.path
 import re
-import urllib.request
+
+import docenizer
+from docenizer import UrlSource
 
 
 DOC_URL_BASE = "https://raw.githubusercontent.com/mist64/c64ref/4274bd8782c5d3b18c68e6b9479b0ec751eb96b1/Source/6502/"
-doc_files = {f"{DOC_URL_BASE}{filename}":cpu_type for filename, cpu_type in {
+doc_files = {
     "cpu_6502.txt" : "6502",
     "cpu_65c02.txt" : "65c02",
-    }.items()
 }
 mode_change_regex = re.compile(r"\[(?P<mode_name>.*)\]")
 comment_regex = re.compile(r"##")
@@ -37,28 +35,40 @@ class Instruction:
     def html_description(self):
         if self.description:
             return "".join(
-                f"<p>{escape_quotes(desc_line)}</p>"
+                f"<p>{desc_line}</p>"
                 for desc_line in self.description
             )
         elif self.long_name:
-            return f"<p>{escape_quotes(self.long_name)}</p>"
+            return f"<p>{self.long_name}</p>"
         elif self.name:
-            return f"<p>{escape_quotes(self.name)}</p>"
+            return f"<p>{self.name}</p>"
         else:
             return f"<p>{self.mnemonic}</p>"
 
+    def tooltip(self):
+        return self.long_name or self.name or self.mnemonic
+
+    def url(self):
+        # Will need to be replaced when other 65xx CPUs are added
+        return f"https://www.pagetable.com/c64ref/6502/?cpu={self.cpu_type}&tab=2#{self.mnemonic}"
+
+    def to_instruction(self):
+        return docenizer.Instruction(
+            self.mnemonic, [self.mnemonic], self.tooltip(), self.html_description(), self.url())
+
 
-def get_instructions():
-    """Gathers all instruction data and returns it in a dictionary."""
+def get_instructions(inputs, inputfolder):
+    """Gathers all instruction data and returns it as a list."""
     instructions = {}
-    for f, t in doc_files.items():
-        instructions_from_file(f, t, instructions)
-    return instructions
+    for f, t in zip(inputs, doc_files.values()):
+        with docenizer.profile_document(f):
+            instructions_from_file(f, t, instructions)
+    return [inst.to_instruction() for inst in instructions.values()]
 
 
 def instructions_from_file(filename, cpu_type, instructions):
     """Gathers instruction data from a file and adds it to the dictionary."""
-    with open_file(filename) as response:
+    with open(filename, "rb") as response:
         print(f"Reading from {filename}...")
         parse_mode = ParseMode.IGNORE
         parse_funcs = {ParseMode.MNEMONICS: parse_mnemonics,
@@ -77,13 +87,8 @@ def instructions_from_file(filename, cpu_type, instructions):
             parse_funcs[parse_mode](line, line_num, cpu_type, instructions)
 
 
-def open_file(filename):
-    """Opens a documentation file from the internet."""
-    return urllib.request.urlopen(filename)
-
-
 def response_to_lines(response):
-    """Converts an HTTP response to a list containing each line of text."""
+    """Converts a documentation file to a list containing each line of text."""
     return response.read().decode("utf-8").replace("\xad", "").split("\n")
 
 
@@ -134,65 +139,12 @@ def parse_descriptions(line, line_num, cpu_type, instructions):
         instructions[mnemonic].description.append(description)
 
 
-def write_script(filename, instructions):
-    script = ["import {AssemblyInstructionInfo} from '../base.js';",
-              "",
-              "export function getAsmOpcode(opcode: string | undefined): AssemblyInstructionInfo | undefined {",
-              "    if (!opcode) return;",
-              "    switch (opcode.toUpperCase()) {"]
-    for inst in instructions.values():
-        script.append(f"        case \"{inst.mnemonic}\":")
-        script.append("            return {")
-        html = f"{16 * ' '}\"html\": \""
-        html += inst.html_description()
-        html += "\","
-        script.append(html)
-        if inst.long_name:
-            safe_ln = escape_quotes(inst.long_name)
-            script.append(f"{16 * ' '}\"tooltip\": \"{safe_ln}\",")
-        elif inst.name:
-            safe_n = escape_quotes(inst.name)
-            script.append(f"{16 * ' '}\"tooltip\": \"{safe_n}\",")
-        else:
-            script.append(f"{16 * ' '}\"tooltip\": \"{inst.mnemonic}\",")
-        # Will need to be replaced when other 65xx CPUs are added
-        s = "https://www.pagetable.com/c64ref/6502/?cpu="
-        e = "&tab=2#"
-        t = inst.cpu_type
-        m = inst.mnemonic
-        script.append(f"{16 * ' '}\"url\": \"{s}{t}{e}{m}\",")
-        script.append(12 * " " + "};")
-        script.append("")
-    script.append("    }")
-    script.append("}")
-    with open(filename, "w") as f:
-        print(f"Writing output to {filename}...")
-        f.write("\n".join(script))
-    #print("\n".join(script))
-
-
-def escape_quotes(string):
-    return string.replace("\"", "\\\"")
-
-
-def get_arguments():
-    parser = argparse.ArgumentParser()
-    help_text = "the location to which the script will be written"
-    relative_path = "../../../../lib/asm-docs/generated/asm-docs-6502.ts"
-    script_path = os.path.realpath(__file__)
-    script_dir = os.path.dirname(script_path)
-    default_path = os.path.normpath(script_dir + relative_path)
-    parser.add_argument("-o", "--output", help=help_text, default=default_path)
-    return parser.parse_args()
-
-
-def main():
-    args = get_arguments()
-    instructions = get_instructions()
-    #for inst in instructions.values():
-        #print(inst.__dict__)
-    write_script(args.output, instructions)
+DOCENIZER = docenizer.Docenizer(
+    '6502',
+    [UrlSource(f"{DOC_URL_BASE}{filename}", filename) for filename in doc_files],
+    get_instructions,
+    inputfolder='6502-inst-docs')
 
 
 if __name__ == "__main__":
-    main()
+    docenizer.main(DOCENIZER, "Docenizes the 6502 and 65C02 documentation from c64ref")
@@ -0,0 +1,35 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+import armxml
+import docenizer
+from docenizer import ArchiveSource
+
+# Some files contain instructions which cannot be parsed and which compilers are unlikely to emit
+IGNORED_FILE_NAMES = []
+# Where to get the asmdoc archive.
+ARCHIVE_URL = "https://developer.arm.com/-/media/developer/products/architecture/armv8-a-architecture/2020-12/A64_ISA_xml_v87A-2020-12.tar.gz"
+ARCHIVE_NAME = "A64_ISA_xml_v87A-2020-12.tar.gz"
+ARCHIVE_SUBDIR = "ISA_A64_xml_v87A-2020-12"
+
+
+def get_url_for_instruction(instr):
+    return "https://developer.arm.com/documentation/ddi0602/2020-12/"
+
+
+def parse_instructions(inputs, inputfolder):
+    instructions = armxml.parse_xml('aarch64', inputs[0], inputfolder, get_url_for_instruction,
+                                    ignored=IGNORED_FILE_NAMES, upper_case=True)
+    return armxml.check_instructions(instructions, inputs[0])
+
+
+# Shares its input folder with the arm32 docenizer. Not run by `make` nor docenizer-all.py until a provider
+# in lib/asm-docs serves its output.
+DOCENIZER = docenizer.Docenizer(
+    'aarch64',
+    [ArchiveSource(ARCHIVE_URL, ARCHIVE_NAME, ARCHIVE_SUBDIR)],
+    parse_instructions,
+    inputfolder='asm-docs-arm')
+
+
+if __name__ == '__main__':
+    docenizer.main(DOCENIZER, 'Docenizes XML version of the official ARM AArch64 documents')
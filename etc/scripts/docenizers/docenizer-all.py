@@ -0,0 +1,72 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+import argparse
+import os
+import sys
+import time
+
+import bundle
+import docenizer
+
+# The Python docenizers, run in-process through their DOCENIZER pipeline.
+PYTHON_DOCENIZERS = ['6502', 'amd64', 'arm32', 'avr', 'evm', 'hermes', 'python']
+# The TypeScript docenizers, run through their wrapper script.
+COMMAND_DOCENIZERS = {
+    'java': ['./docenizer-java.sh'],
+    'llvm': ['./docenizer-llvm.sh'],
+}
+
+parser = argparse.ArgumentParser(description='Runs all docenizers concurrently')
+parser.add_argument('-d', '--downloadfolder', type=str,
+                    help=f'Folder shared by all docenizers for downloads. Default is ./{docenizer.DEFAULT_CACHE_DIR}/',
+                    default=docenizer.DEFAULT_CACHE_DIR)
+parser.add_argument('-o', '--outputfolder', type=str,
+                    help='Folder where the .ts files are written. Default is lib/asm-docs/generated/')
+parser.add_argument('-j', '--jobs', type=int, help='Number of parser processes. Default is the number of CPUs')
+parser.add_argument('--only', type=str, nargs='+', metavar='ARCH',
+                    choices=PYTHON_DOCENIZERS + list(COMMAND_DOCENIZERS),
+                    help='Only run the docenizers for these architectures')
+parser.add_argument('--bundle', action='store_true',
+                    help='Also write the compressed docs bundles of all generated docs, see bundle.py')
+docenizer.add_offline_arguments(parser)
+
+
+def get_docenizers(archs):
+    docenizers = []
+    for arch in archs:
+        if arch in COMMAND_DOCENIZERS:
+            docenizers.append(docenizer.CommandDocenizer(arch, COMMAND_DOCENIZERS[arch]))
+        else:
+            docenizers.append(docenizer.load_docenizer(os.path.join(docenizer.SCRIPT_DIR, f'docenizer-{arch}.py')))
+    return docenizers
+
+
+def main():
+    args, _ = parser.parse_known_args()
+    archs = args.only or PYTHON_DOCENIZERS + list(COMMAND_DOCENIZERS)
+    docenizers = get_docenizers(archs)
+    # The options of optional local inputs depend on the docenizers being run.
+    local_sources = [source for d in docenizers if isinstance(d, docenizer.Docenizer) for source in d.local_sources]
+    for source in local_sources:
+        source.add_argument(parser)
+    args = parser.parse_args()
+    for source in local_sources:
+        source.configure(args)
+    start = time.perf_counter()
+    results = docenizer.run_all(docenizers, docenizer.get_download_cache(args),
+                                args.outputfolder, args.jobs)
+    wall_time = time.perf_counter() - start
+    failed = False
+    for arch, (_, _, error) in sorted(results.items()):
+        if error:
+            print(f"{arch}: failed: {error}")
+            failed = True
+    print(docenizer.format_timings(results, wall_time))
+    if failed:
+        sys.exit(1)
+    if args.bundle:
+        bundle.bundle_generated(args.outputfolder or docenizer.GENERATED_DIR)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,10 @@
 #! /usr/bin/env python3
 # -*- coding: utf-8 -*-
-import argparse
-import json
 import os
 import re
-import sys
-import tarfile
 import urllib
-from urllib import request
+from collections import Counter
+import xml.etree.ElementTree as ET
 from urllib import parse
 
 try:
@@ -15,14 +12,8 @@ try:
 except ImportError:
     raise ImportError("Please install BeautifulSoup (apt-get install python3-bs4 or pip install beautifulsoup4 should do it)")
 
-parser = argparse.ArgumentParser(description='Docenizes HTML version of the official Intel Asm PDFs')
-parser.add_argument('-i', '--inputfolder', type=str,
-                    help='Folder where the input files reside as .html. Default is ./asm-docs/',
-                    default='asm-docs')
-parser.add_argument('-o', '--outputpath', type=str, help='Final path of the .ts file. Default is ./asm-docs-amd64.ts',
-                    default='./asm-docs-amd64.ts')
-parser.add_argument('-d', '--downloadfolder', type=str,
-                    help='Folder where the archive will be downloaded and extracted', default='asm-docs')
+import docenizer
+from docenizer import ArchiveSource, DocenizerError, Instruction, LocalSource
 
 # The maximum number of paragraphs from the description to copy.
 MAX_DESC_PARAS = 5
@@ -105,50 +96,21 @@ IGNORED_DUPLICATES = [
     "VPGATHERDD:VPGATHERQD",
     "VPGATHERDQ:VPGATHERQQ",
 ]
-# Where to extract the asmdoc archive.
-ASMDOC_DIR = "asm-docs"
+# Where to get the asmdoc archive.
 ARCHIVE_URL = "https://www.felixcloutier.com/x86/x86.tbz2"
 ARCHIVE_NAME = "x86.tbz2"
-
-
-class Instruction(object):
-    def __init__(self, name, names, tooltip, body):
-        self.name = name
-        self.names = names
-        self.tooltip = tooltip.rstrip(': ,')
-        self.body = body
-
-    def __str__(self):
-        return f"{self.name} = {self.tooltip}\n{self.body}"
+# Instruction prefixes in the asm attribute of the uops.info table, e.g. "LOCK ADD" or "{load} MOV".
+UOPS_ASM_PREFIXES = re.compile(r'^((LOCK|REPN?E?|REPZ|REPNZ|\{[a-z0-9]+\})\s+)*')
+# The operands of a uops.info operand form, e.g. "R64, M64" in "ADD (R64, M64)".
+UOPS_OPERANDS = re.compile(r'\((.*)\)')
+# Masking and rounding decorations of operands in the docs, e.g. "xmm1 {k1}{z}".
+OPERAND_DECORATIONS = re.compile(r'\s*\{[^}]*\}')
 
 
 def get_url_for_instruction(instr):
     return f"https://www.felixcloutier.com/x86/{urllib.parse.quote(instr.name)}.html"
 
 
-def download_asm_doc_archive(downloadfolder):
-    if not os.path.exists(downloadfolder):
-        print(f"Creating {downloadfolder} as download folder")
-        os.makedirs(downloadfolder)
-    elif not os.path.isdir(downloadfolder):
-        print(f"Error: download folder {downloadfolder} is not a directory")
-        sys.exit(1)
-    archive_name = os.path.join(downloadfolder, ARCHIVE_NAME)
-    print("Downloading archive...")
-    urllib.request.urlretrieve(ARCHIVE_URL, archive_name)
-
-
-def extract_asm_doc_archive(downloadfolder, inputfolder):
-    print("Extracting file...")
-    if os.path.isdir(os.path.join(inputfolder, "html")):
-        for root, dirs, files in os.walk(os.path.join(inputfolder, "html")):
-            for file in files:
-                if os.path.splitext(file)[1] == ".html":
-                    os.remove(os.path.join(root, file))
-    tar = tarfile.open(os.path.join(downloadfolder, ARCHIVE_NAME))
-    tar.extractall(path=inputfolder)
-
-
 def strip_non_instr(i):
     # removes junk from encodings where the opcode is in the middle
     # of prefix stuff. e.g.
@@ -162,6 +124,51 @@ def instr_name(i):
         return match.group(1)
 
 
+def instr_operands(i):
+    """The operands of an instruction, e.g. ('r/m64', 'r64') for "01 /r ADD r/m64, r64"."""
+    stripped = strip_non_instr(i)
+    match = INSTRUCTION_RE.match(stripped)
+    if match:
+        operands = OPERAND_DECORATIONS.sub('', stripped[match.end():])
+        return tuple(operand.strip() for operand in operands.split(',') if operand.strip())
+
+
+def operand_pattern(operand):
+    """A regex of the uops.info operand types an operand of the docs stands for, e.g. R64|M64 for r/m64."""
+    operand = operand.lower()
+    if re.fullmatch(r'r/m\d+', operand):
+        return f'R{operand[3:]}|M{operand[3:]}'
+    alternatives = []
+    for part in operand.split('/'):
+        if re.fullmatch(r'r\d+', part):
+            alternatives.append(part.upper())
+        elif part == 'reg':
+            alternatives.append(r'R(16|32|64)')
+        elif re.fullmatch(r'm\d+', part):
+            alternatives.append(part.upper())
+        elif re.match(r'm(\d|em|offs|$)', part):
+            alternatives.append(r'M\d*')
+        elif re.fullmatch(r'imm\d+', part):
+            alternatives.append(f'I{part[3:]}')
+        elif re.fullmatch(r'([xyz]?mm|k|bnd)\d*', part):
+            alternatives.append(part.rstrip('0123456789').upper())
+        elif re.match(r'(cr|dr)\d', part):
+            alternatives.append(f'{part[:2].upper()}\\d+')
+        else:
+            alternatives.append(re.escape(part.upper()))
+    return '|'.join(alternatives)
+
+
+def documents_form(operand_forms, form):
+    """Whether a uops.info operand form, e.g. "ADD (M64, R64)", is one of `operand_forms` of the docs."""
+    match = UOPS_OPERANDS.search(form)
+    operands = [operand.strip().upper() for operand in match.group(1).split(',')] if match else []
+    return any(len(operands) == len(documented)
+               and all(re.fullmatch(operand_pattern(pattern), operand)
+                       for pattern, operand in zip(documented, operands))
+               for documented in operand_forms)
+
+
 def get_description_paragraphs(document_soup):
     description_header_node = document_soup.find(id="description")
     i = 0
@@ -183,12 +190,15 @@ def parse(filename, f):
         return None
     table = read_table(doc.table)
     names = set()
+    # The operand forms of each name, to match timings against.
+    operand_forms = {}
 
     def add_all(instrs):
         for i in instrs:
             instruction_name = instr_name(i)
             if instruction_name:
                 names.add(instruction_name)
+                operand_forms.setdefault(instruction_name, set()).add(instr_operands(i))
 
     for inst in table:
         if 'Opcode/Instruction' in inst:
@@ -207,6 +217,7 @@ def parse(filename, f):
                 print(f"Unable to get instruction from: {inst['Instruction']}")
             else:
                 names.add(instruction_name)
+                operand_forms.setdefault(instruction_name, set()).add(instr_operands(inst['Instruction']))
         # else, skip the line
     if not names:
         if filename in UNPARSEABLE_INSTR_NAMES:
@@ -226,11 +237,14 @@ def parse(filename, f):
             link['target'] = '_blank'
             link['rel'] = 'noreferrer noopener'
 
-    return Instruction(
+    instruction = Instruction(
         filename,
-        names,
+        sorted(names),
         description_paragraphs[0].text.strip(),
         ''.join(map(lambda x: str(x), description_paragraphs)).strip())
+    instruction.url = get_url_for_instruction(instruction)
+    instruction.operand_forms = operand_forms
+    return instruction
 
 
 def read_table(start_table):
@@ -289,7 +303,8 @@ def parse_html(directory):
                     if name in IGNORED_DUPLICATES or name in IGNORED_FILE_NAMES:
                         continue
                     try:
-                        instruction = parse(name, f2)
+                        with docenizer.profile_document(file):
+                            instruction = parse(name, f2)
                         if not instruction:
                             continue
                         patch_instruction(instruction)
@@ -322,57 +337,102 @@ def patch_instruction(instruction):
         instruction.tooltip = old_tooltip.replace("stores the double-precision", "stores the single-precision")
 
 
-def main():
-    args = parser.parse_args()
-    print(f"Called with: {args}")
-    # If we don't have the html folder already...
-    if not os.path.isdir(os.path.join(args.inputfolder, 'html')):
-        # We don't, try with the compressed file
-        if not os.path.isfile(os.path.join(args.downloadfolder, "x86.tbz2")):
-            # We can't find that either. Download it
-            try:
-                download_asm_doc_archive(args.downloadfolder)
-                extract_asm_doc_archive(args.downloadfolder, args.inputfolder)
-            except IOError as e:
-                print("Error when downloading archive:")
-                print(e)
-                sys.exit(1)
-        else:
-            # We have a file already downloaded
-            extract_asm_doc_archive(args.downloadfolder, args.inputfolder)
-    instructions = parse_html(args.inputfolder)
-    instructions.sort(key=lambda b: b.name)
-    self_test(instructions, args.inputfolder)
-    all_inst = set()
+def number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def uops_timing(measurement):
+    """The latency, reciprocal throughput and port usage of a uops.info <measurement>.
+
+    The latency is the largest one between any pair of operands.
+    """
+    timing = {}
+    latencies = [number(value) for latency in measurement.iter('latency')
+                 for key, value in latency.attrib.items()
+                 if key.startswith('cycles') and not key.endswith('upper_bound')]
+    if latencies:
+        timing['latency'] = max(latencies)
+    throughput = measurement.get('TP_unrolled') or measurement.get('TP_loop') or measurement.get('TP')
+    if throughput:
+        timing['throughput'] = number(throughput)
+    if measurement.get('ports'):
+        timing['ports'] = measurement.get('ports')
+    return timing
+
+
+def read_uops_table(path, mnemonics):
+    """Reads a uops.info-style instructions.xml, keeping only the given mnemonics.
+
+    Returns an index of mnemonic -> list of {"form", "uarchs"} with one entry
+    per operand form, e.g. "ADD (R64, M64)", and the timing of each
+    microarchitecture measured for it. The same form may be listed by several
+    extensions, e.g. VEX and EVEX encodings, of which the first is kept.
+    """
+    print(f"Reading instruction timings from {path}...")
+    index = {}
+    seen = set()
+    extension = None
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == 'extension':
+                extension = elem.get('name')
+            continue
+        if elem.tag != 'instruction':
+            continue
+        mnemonic = UOPS_ASM_PREFIXES.sub('', elem.get('asm', '')).upper()
+        form = elem.get('string')
+        key = (form, elem.get('extension', extension))
+        if mnemonic in mnemonics and form and key not in seen:
+            uarchs = {}
+            for architecture in elem.iter('architecture'):
+                measurement = architecture.find('measurement')
+                if measurement is not None:
+                    uarchs[architecture.get('name')] = uops_timing(measurement)
+            if uarchs:
+                seen.add(key)
+                index.setdefault(mnemonic, []).append({'form': form, 'uarchs': uarchs})
+        elem.clear()
+    return index
+
+
+def add_timings(instructions, path):
+    """Adds the timings of a uops.info table to the instructions, as their `performance` field.
+
+    Most mnemonics are documented on a single page, which gets all their
+    operand forms. Those documented on several, e.g. MOV to general, control
+    and debug registers, only get on each page the forms matching an operand
+    form of its instruction table.
+    """
+    index = read_uops_table(path, {name for inst in instructions for name in inst.names})
+    pages = Counter(name for inst in instructions for name in inst.names)
+    matched = 0
     for inst in instructions:
-        if not all_inst.isdisjoint(inst.names):
-            print(f"Overlap in instruction names: {inst.names.intersection(all_inst)} for {inst.name}")
-        all_inst = all_inst.union(inst.names)
-    if not self_test(instructions, args.inputfolder):
-        print("Tests do not pass. Not writing output file. Aborting.")
-        sys.exit(3)
-    print(f"Writing {len(instructions)} instructions")
-    with open(args.outputpath, 'w') as f:
-        f.write("""
-import {AssemblyInstructionInfo} from '../base.js';
-
-export function getAsmOpcode(opcode: string | undefined): AssemblyInstructionInfo | undefined {
-    if (!opcode) return;
-    switch (opcode.toUpperCase()) {
-""".lstrip())
-        for inst in instructions:
-            for name in sorted(inst.names):
-                f.write(f'        case "{name}":\n')
-            f.write('            return {}'.format(json.dumps({
-                "tooltip": inst.tooltip,
-                "html": inst.body,
-                "url": get_url_for_instruction(inst)
-            }, indent=16, separators=(',', ': '), sort_keys=True))[:-1] + '            };\n\n')
-        f.write("""
-    }
-}
-""")
+        forms = [form for name in inst.names for form in index.get(name, [])
+                 if pages[name] == 1 or documents_form(inst.operand_forms.get(name, ()), form['form'])]
+        if forms:
+            inst.fields['performance'] = forms
+            matched += 1
+    print(f"Found timings for {matched} of {len(instructions)} instructions")
+
+
+def parse_instructions(inputs, inputfolder):
+    instructions = parse_html(inputs[0])
+    instructions.sort(key=lambda b: b.name)
+    if inputs[1]:
+        add_timings(instructions, inputs[1])
+    if not self_test(instructions, inputfolder):
+        raise DocenizerError("Tests do not pass. Not writing output file. Aborting.", exit_code=3)
+    return instructions
+
+
+DOCENIZER = docenizer.Docenizer(
+    'amd64',
+    [ArchiveSource(ARCHIVE_URL, ARCHIVE_NAME, 'html'),
+     LocalSource('uops', 'Path to a uops.info instructions.xml to add per-microarchitecture timings from')],
+    parse_instructions,
+    inputfolder='asm-docs')
 
 
 if __name__ == '__main__':
-    main()
+    docenizer.main(DOCENIZER, 'Docenizes HTML version of the official Intel Asm PDFs')
@@ -1,77 +1,318 @@
 #!/usr/bin/env python3
-import argparse
+import hashlib
 import io
-import os.path
-import pdfminer.high_level
+import json
+import os
+import pdfminer.converter
 import pdfminer.layout
+import pdfminer.pdfdocument
+import pdfminer.pdfinterp
+import pdfminer.pdfpage
+import pdfminer.pdfparser
+import pdfminer.pdftypes
+import pdfminer.psparser
 import re
 import sys
-import urllib.request
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
+import docenizer
+from docenizer import Instruction, UrlSource
 
 
 FILE = ("https://ww1.microchip.com/downloads/en/DeviceDoc/"
         "AVR-InstructionSet-Manual-DS40002198.pdf")
+FILE_NAME = "AVR-InstructionSet-Manual-DS40002198.pdf"
 
-section_regex = re.compile(r"^(6\.\d{1,3}?)\s+?(?P<mnemonic>\w+?)\s+?(?:\((?P<mnemonic_2>\w+?)\)\s+?)?[-\u2013]\s+?(?P<name>.+?)\s*?$\s+?\1\.1\s+?Description\s+(?P<description>(?s:.+?))\s+?Operation:", re.MULTILINE)
+# The manual is split into sections in a single pass over its lines, looking for
+# a section header line, e.g. "6.1 ADC - Add with Carry", followed by its
+# "6.1.1 Description" heading. The description runs up to the next "Operation:".
+section_header_regex = re.compile(r"(6\.\d{1,3})\s+(?P<mnemonic>\w+?)\s+(?:\((?P<mnemonic_2>\w+?)\)\s+)?[-\u2013]\s+(?P<name>.+?)\s*$")
+description_heading_regex = re.compile(r"(6\.\d{1,3})\.1\s+Description(\s+)")
+operation_regex = re.compile(r"(?<=\s)Operation:")
+non_space_regex = re.compile(r"\S")
 header_footer_regex = re.compile(r"\s+?\w+?-page \d{1,3}?\s+?Manual\s+?\u00a9 2021 Microchip Technology Inc.\s+?AVR\u00ae Instruction Set Manual\s+?Instruction Description\s*", re.MULTILINE)
 page_num_regex = re.compile(r"\b\w+?-page (\d{1,3})")
+# The "Words" and "Cycles" entries following the description. Cycles are either
+# given once, or by device family.
+words_regex = re.compile(r"^\s*Words\s*:?\s*(\d+)", re.MULTILINE)
+cycles_regex = re.compile(r"^\s*Cycles\s*:?[ \t]*", re.MULTILINE)
+family_regex = re.compile(r"\bAVR(?:e|xm|xt|rc)\b")
+family_value_regex = re.compile(r"\b(AVR(?:e|xm|xt|rc))\s*:\s*(N/A|\d+)")
+cycle_value_regex = re.compile(r"N/A|\b\d+\b")
+footnote_regex = re.compile(r"\(\d+\)")
+note_regex = re.compile(r"^\s*Notes?:", re.MULTILINE)
+# The outline entry of the chapter holding the instruction descriptions.
+instruction_chapter_regex = re.compile(r"Instruction Description$", re.IGNORECASE)
+# How many pages a worker process extracts at a time.
+PAGES_PER_CHUNK = 8
+
+
+def parse_manual(inputs, inputfolder):
+    docs = get_docs_as_string(inputs[0], inputfolder)
+    with docenizer.profile_document("instruction sections"):
+        return list(parse_docs(docs).values())
+
+
+def get_docs_as_string(path, inputfolder, jobs=None):
+    """Extracts the text of the instruction description chapter.
+
+    Pages are extracted in parallel and cached in `inputfolder`, keyed by the
+    hash of the PDF, so reruns on the same manual don't need pdfminer at all.
+    """
+    cache_dir = os.path.join(inputfolder, hash_file(path))
+    index_path = os.path.join(cache_dir, "pages.json")
+    if os.path.isfile(index_path):
+        with open(index_path) as f:
+            pages = json.load(f)
+    else:
+        log_message(f"finding instruction pages in {path}...")
+        pages = get_instruction_pages(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(index_path, "w") as f:
+            json.dump(pages, f)
+    missing = [page for page in pages if not os.path.isfile(page_cache_path(cache_dir, page))]
+    if missing:
+        log_message(f"extracting text from {len(missing)} of {len(pages)} pages...")
+        chunks = [missing[i:i + PAGES_PER_CHUNK] for i in range(0, len(missing), PAGES_PER_CHUNK)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Pages are extracted in-process when profiling, so each one is seen.
+            extracted = map if docenizer.PROFILER.active else executor.map
+            for texts in extracted(extract_pages, [path] * len(chunks), chunks):
+                for page, text in texts:
+                    with open(page_cache_path(cache_dir, page), "w", encoding="utf-8") as f:
+                        f.write(text)
+    else:
+        log_message(f"using cached text of {len(pages)} pages from {cache_dir}...")
+    texts = []
+    for page in pages:
+        with open(page_cache_path(cache_dir, page), encoding="utf-8") as f:
+            texts.append(f.read())
+    return "".join(texts)
+
+
+def hash_file(path):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def page_cache_path(cache_dir, page):
+    return os.path.join(cache_dir, f"page-{page}.txt")
+
+
+def get_instruction_pages(path):
+    """Returns the zero-based page numbers of the instruction description chapter.
+
+    The chapter is found through the PDF outline; if that fails, all pages are
+    returned.
+    """
+    with open(path, "rb") as f:
+        doc = pdfminer.pdfdocument.PDFDocument(pdfminer.pdfparser.PDFParser(f))
+        page_numbers = {page.pageid: number
+                        for number, page in enumerate(pdfminer.pdfpage.PDFPage.create_pages(doc))}
+        all_pages = sorted(page_numbers.values())
+        try:
+            outlines = list(doc.get_outlines())
+        except pdfminer.pdfdocument.PDFNoOutlines:
+            return all_pages
+        start = end = chapter_level = None
+        for level, title, dest, action, _ in outlines:
+            if start is None:
+                if instruction_chapter_regex.search(title.strip()):
+                    start = outline_page(doc, dest, action, page_numbers)
+                    chapter_level = level
+            elif level <= chapter_level:
+                end = outline_page(doc, dest, action, page_numbers)
+                break
+    if start is None:
+        return all_pages
+    if end is None:
+        end = len(all_pages)
+    # The next chapter may start on the last page of this one.
+    return list(range(start, min(end + 1, len(all_pages))))
+
 
+def outline_page(doc, dest, action, page_numbers):
+    """Resolves an outline destination to a zero-based page number."""
+    resolve = pdfminer.pdftypes.resolve1
+    if dest is None and action is not None:
+        dest = resolve(action).get("D")
+    dest = resolve(dest)
+    if isinstance(dest, pdfminer.psparser.PSLiteral):
+        dest = dest.name
+    if isinstance(dest, (str, bytes)):
+        dest = resolve(doc.get_dest(dest))
+    if isinstance(dest, dict):
+        dest = resolve(dest["D"])
+    if isinstance(dest, list) and dest:
+        return page_numbers.get(getattr(dest[0], "objid", None))
+    return None
 
-class Instruction:
-    def __init__(self, mnemonic):
+
+def extract_pages(path, pages):
+    """Extracts the text of the given pages, one (page, text) pair per page."""
+    laparams = pdfminer.layout.LAParams(boxes_flow=None)
+    rsrcmgr = pdfminer.pdfinterp.PDFResourceManager(caching=True)
+    texts = []
+    with open(path, "rb") as f:
+        for page, pdf_page in zip(pages, pdfminer.pdfpage.PDFPage.get_pages(f, set(pages), caching=True)):
+            with io.StringIO() as output, docenizer.profile_document(f"page {page + 1}"):
+                device = pdfminer.converter.TextConverter(rsrcmgr, output, codec="utf-8", laparams=laparams)
+                pdfminer.pdfinterp.PDFPageInterpreter(rsrcmgr, device).process_page(pdf_page)
+                texts.append((page, output.getvalue()))
+    return texts
+
+
+class Section:
+    def __init__(self, mnemonic, mnemonic_2, name, description, page, start=0, details_start=0):
         self.mnemonic = mnemonic
-        self.name = mnemonic
-        self.description = ""
-        self.page = 2
-        self.mnemonic_2 = ""
+        self.mnemonic_2 = mnemonic_2
+        self.name = name
+        self.description = description
+        self.page = page
+        # Where the section starts, and where the text following its description does.
+        self.start = start
+        self.details_start = details_start
+
+
+def tokenize_sections(docs):
+    """Yields the instruction sections of the manual as `Section`s.
+
+    Positions of "Operation:" headings and page footers are indexed once up
+    front, so each section costs a couple of bisections instead of rescanning
+    the rest of the manual.
+    """
+    operations = [match.start() for match in operation_regex.finditer(docs)]
+    footers = [(match.start(), match.group(1)) for match in page_num_regex.finditer(docs)]
+    footer_offsets = [offset for offset, _ in footers]
+    # Headers inside the previous section (up to its "Operation:") are skipped.
+    resume = 0
+    line_start = 0
+    for line in docs.split("\n"):
+        line_end = line_start + len(line)
+        header_start = line_start
+        line_start = line_end + 1
+        if header_start < resume or not line.startswith("6."):
+            continue
+        header = section_header_regex.match(line)
+        if not header:
+            continue
+        heading_start = non_space_regex.search(docs, line_end)
+        if not heading_start:
+            continue
+        heading = description_heading_regex.match(docs, heading_start.start())
+        if not heading or heading.group(1) != header.group(1) or heading.end() == len(docs):
+            continue
+        description_start = heading.end()
+        # An "Operation:" directly following the heading means an empty description.
+        operation = bisect_left(operations, description_start)
+        if operation == len(operations):
+            continue
+        description = docs[description_start:operations[operation]].rstrip()
+        resume = operations[operation] + len("Operation:")
+        footer = bisect_left(footer_offsets, header_start)
+        yield Section(header.group("mnemonic"),
+                      header.group("mnemonic_2"),
+                      header.group("name"),
+                      description,
+                      footers[footer][1] if footer < len(footers) else None,
+                      header_start,
+                      resume)
+
 
+def value_range(values):
+    """Summarizes the values of a column, e.g. ["1", "2", "2"] as "1-2"."""
+    numbers = sorted({int(value) for value in values if value.isdigit()})
+    if not numbers:
+        return values[0]
+    return str(numbers[0]) if len(numbers) == 1 else f"{numbers[0]}-{numbers[-1]}"
 
-def main():
-    args = get_arguments()
-    docs = get_docs_as_string(FILE)
-    instructions = parse_docs(docs)
-    write_script(args.output, instructions)
 
+def parse_cycles(text):
+    """Reads the cycle counts of the "Cycles" entry starting `text`.
 
-def get_arguments():
-    parser = argparse.ArgumentParser()
-    help_text = "the location to which the script will be written"
-    relative_path = "../../../../lib/asm-docs/generated/asm-docs-avr.ts"
-    script_path = os.path.realpath(__file__)
-    script_dir = os.path.dirname(script_path)
-    default_path = os.path.normpath(script_dir + relative_path)
-    parser.add_argument("-o", "--output", help=help_text, default=default_path)
-    return parser.parse_args()
+    Returns {family: cycles}, or {"all": cycles} when the manual doesn't
+    distinguish device families. Tables with a row per operand form are
+    summarized as a range per family.
+    """
+    text = footnote_regex.sub("", text).lstrip()
+    families = family_regex.findall(text)
+    if families:
+        pairs = family_value_regex.findall(text)
+        if pairs:
+            return dict(pairs)
+        families = list(dict.fromkeys(families))
+        header_end = max(match.end() for match in family_regex.finditer(text))
+        # A row per line, possibly labelled with its operand form, up to the table notes.
+        rows = []
+        for line in note_regex.split(text[header_end:], 1)[0].split("\n"):
+            values = cycle_value_regex.findall(line)
+            if len(values) >= len(families):
+                rows.append(values[-len(families):])
+            elif rows and line.strip():
+                break
+        if not rows:
+            # Cells extracted one per line instead.
+            values = cycle_value_regex.findall(note_regex.split(text[header_end:], 1)[0])
+            if not values or len(values) % len(families):
+                return {}
+            rows = [values[i:i + len(families)] for i in range(0, len(values), len(families))]
+        return {family: value_range([row[i] for row in rows]) for i, family in enumerate(families)}
+    paragraph = " ".join(text.split("\n\n", 1)[0].split())
+    return {"all": paragraph[:80]} if paragraph else {}
 
 
-def get_docs_as_string(url):
-    with urllib.request.urlopen(url) as u:
-        log_message(f"reading PDF from {url}...")
-        pdf_bytes = u.read()
-    with io.BytesIO(pdf_bytes) as pdf_io:
-        pdf_params = pdfminer.layout.LAParams(boxes_flow=None)
-        log_message("extracting text from PDF...")
-        return pdfminer.high_level.extract_text(pdf_io, laparams=pdf_params)
+def parse_timing(details):
+    """The "words" and "cycles" fields of an instruction, from the text following its description."""
+    details = header_footer_regex.sub("\n", details)
+    fields = {}
+    words = words_regex.search(details)
+    if words:
+        fields["words"] = words.group(1)
+    cycles = cycles_regex.search(details)
+    if cycles:
+        # Only read up to the next entry, if the cycles come first.
+        end = words.start() if words and words.start() > cycles.end() else len(details)
+        counts = parse_cycles(details[cycles.end():end])
+        if counts:
+            fields["cycles"] = counts
+    return fields
+
+
+def timing_html(fields):
+    html = ""
+    if "words" in fields:
+        html += f"<p>Words: {fields['words']}</p>"
+    if "cycles" in fields:
+        html += "<p>Cycles: " + ", ".join(
+            value if family == "all" else f"{family}: {value}" for family, value in fields["cycles"].items()) + "</p>"
+    return html
 
 
 def parse_docs(docs):
     instructions = {}
-    log_message("searching for pattern matches...")
-    for match in section_regex.finditer(docs):
-        if match.group("mnemonic") not in instructions:
-            instr = Instruction(match.group("mnemonic"))
-            instr.name = match.group("name")
-            instr.description = process_description(match.group("description"))
-            instr.page = page_num_regex.search(docs, match.start()).group(1)
-            #print(40 * "-")
-            #print(f"Mnemonic: {instr.mnemonic}\nName: {instr.name}")
-            #print(f"Description: {instr.description}")
-            #print(instr.description)
-            instructions[instr.mnemonic] = instr
+    log_message("searching for instruction sections...")
+    sections = list(tokenize_sections(docs))
+    for i, section in enumerate(sections):
+        if section.mnemonic not in instructions:
+            description = process_description(section.description)
+            end = sections[i + 1].start if i + 1 < len(sections) else len(docs)
+            timing = parse_timing(docs[section.details_start:end])
+            instr = Instruction(
+                section.mnemonic,
+                [section.mnemonic],
+                section.name,
+                "<p>" + description.replace("\n\n", "</p><p>") + "</p>" + timing_html(timing),
+                f"{FILE}#page={section.page}" if section.page else FILE,
+                fields=timing)
+            instructions[section.mnemonic] = instr
         else:
-            instr = instructions[match.group("mnemonic")]
-        if match.group("mnemonic_2"):
-            instr.mnemonic_2 = match.group("mnemonic_2")
+            instr = instructions[section.mnemonic]
+        if section.mnemonic_2 and section.mnemonic_2 not in instr.names:
+            instr.names.append(section.mnemonic_2)
     return instructions
 
 
@@ -86,32 +327,16 @@ def process_description(desc):
     return desc
 
 
-def write_script(filename, instructions):
-    log_message(f"writing to {filename}...")
-    with open(filename, "w") as script:
-        script.write("import {AssemblyInstructionInfo} from '../base.js';\n")
-        script.write("\n")
-        script.write("export function getAsmOpcode(opcode: string | undefined): AssemblyInstructionInfo | undefined {\n")
-        script.write("    if (!opcode) return;\n")
-        script.write("    switch (opcode.toUpperCase()) {\n")
-        for inst in instructions.values():
-            script.write(f"        case \"{inst.mnemonic}\":\n")
-            if inst.mnemonic_2:
-                script.write(f"        case \"{inst.mnemonic_2}\":\n")
-            script.write("            return {\n")
-            html = f"{16 * ' '}\"html\": \"<p>"
-            html += inst.description.replace("\n\n", "</p><p>")
-            html += "</p>\",\n"
-            script.write(html)
-            script.write(f"{16 * ' '}\"tooltip\": \"{inst.name}\",\n")
-            script.write(f"{16 * ' '}\"url\": \"{FILE}#page={inst.page}\",\n")
-            script.write(12 * " " + "};\n\n")
-        script.write("    }\n}")
-
-
 def log_message(msg):
     print(f"{sys.argv[0]}: {msg}", file=sys.stderr)
 
 
+DOCENIZER = docenizer.Docenizer(
+    'avr',
+    [UrlSource(FILE, FILE_NAME)],
+    parse_manual,
+    inputfolder='avr-inst-docs')
+
+
 if __name__ == "__main__":
-    main()
+    docenizer.main(DOCENIZER, "Docenizes the AVR Instruction Set Manual")
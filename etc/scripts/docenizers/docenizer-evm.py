@@ -1,22 +1,12 @@
 #! /usr/bin/env python3
 # -*- coding: utf-8 -*-
-import argparse
 import json
-import os
-import sys
 import urllib
 import re
-from urllib import request
 from urllib import parse
 
-parser = argparse.ArgumentParser(description='Docenizes the EVM documentation')
-parser.add_argument('-i', '--inputfolder', type=str,
-                    help='Folder where the input files reside as .html. Default is ./evm-inst-docs/',
-                    default='evm-inst-docs')
-parser.add_argument('-o', '--outputpath', type=str, help='Final path of the .ts file. Default is ./asm-docs-evm.ts',
-                    default='./asm-docs-evm.ts')
-parser.add_argument('-d', '--downloadfolder', type=str,
-                    help='Folder where the archive will be downloaded and extracted', default='evm-inst-docs')
+import docenizer
+from docenizer import DocenizerError, Instruction, UrlSource
 
 # | `0x00` | STOP | Halts execution | - | 0 |
 MNEMONIC_RE = re.compile('^\| `0x([A-Za-z0-9]+)` \| (.*) \| .* \| .* \| .* \|$')
@@ -27,42 +17,93 @@ ARCHIVE_DESC_NAME = "opcodes.json"
 ARCHIVE_MNEM_URL = "https://raw.githubusercontent.com/crytic/evm-opcodes/master/README.md"
 ARCHIVE_MNEM_NAME = "README.md"
 
-
-class Instruction(object):
-    def __init__(self, opcode, mnemonic, tooltip, body):
-        self.opcode = opcode
-        self.mnemonic = mnemonic
-        self.tooltip = tooltip.rstrip(': ,')
-        self.body = body
-
-    def __str__(self):
-        return f"{self.opcode} = {self.tooltip}\n{self.body}"
+# The hardforks, oldest first, named as in the --evm-version option of solc.
+FORKS = ['frontier', 'homestead', 'tangerineWhistle', 'spuriousDragon', 'byzantium', 'constantinople',
+         'petersburg', 'istanbul', 'berlin', 'london', 'paris', 'shanghai', 'cancun']
+WARM_COLD_ACCOUNT = '100 (warm) / 2600 (cold)'
+# Static gas costs which changed between forks, as mnemonic -> [(first fork, cost)].
+# opcodes.json only has the current costs. EIP-150 (tangerineWhistle), EIP-1884
+# (istanbul) and EIP-2929 (berlin) repriced state access.
+GAS_HISTORY = {
+    'BALANCE': [('frontier', '20'), ('tangerineWhistle', '400'), ('istanbul', '700'), ('berlin', WARM_COLD_ACCOUNT)],
+    'EXTCODESIZE': [('frontier', '20'), ('tangerineWhistle', '700'), ('berlin', WARM_COLD_ACCOUNT)],
+    'EXTCODECOPY': [('frontier', '20'), ('tangerineWhistle', '700'), ('berlin', WARM_COLD_ACCOUNT)],
+    'EXTCODEHASH': [('constantinople', '400'), ('istanbul', '700'), ('berlin', WARM_COLD_ACCOUNT)],
+    'SLOAD': [('frontier', '50'), ('tangerineWhistle', '200'), ('istanbul', '800'),
+              ('berlin', '100 (warm) / 2100 (cold)')],
+    'SSTORE': [('frontier', '20000 (set) / 5000 (reset)'),
+               ('constantinople', '200 (no-op) / 5000 (reset) / 20000 (set)'),
+               ('petersburg', '20000 (set) / 5000 (reset)'),
+               ('istanbul', '800 (no-op) / 5000 (reset) / 20000 (set)'),
+               ('berlin', '100 (no-op) / 2900 (reset) / 20000 (set), +2100 (cold)')],
+    'CALL': [('frontier', '40'), ('tangerineWhistle', '700'), ('berlin', WARM_COLD_ACCOUNT)],
+    'CALLCODE': [('frontier', '40'), ('tangerineWhistle', '700'), ('berlin', WARM_COLD_ACCOUNT)],
+    'DELEGATECALL': [('homestead', '40'), ('tangerineWhistle', '700'), ('berlin', WARM_COLD_ACCOUNT)],
+    'STATICCALL': [('byzantium', '700'), ('berlin', WARM_COLD_ACCOUNT)],
+    'SELFDESTRUCT': [('frontier', '0'), ('tangerineWhistle', '5000')],
+}
 
 
 def get_url_for_instruction(instr):
-    return f"https://www.evm.codes/#{urllib.parse.quote(instr.opcode)}"
-
-
-def download_asm_doc_archive(downloadfolder):
-    if not os.path.exists(downloadfolder):
-        print(f"Creating {downloadfolder} as download folder")
-        os.makedirs(downloadfolder)
-    elif not os.path.isdir(downloadfolder):
-        print(f"Error: download folder {downloadfolder} is not a directory")
-        sys.exit(1)
-    archive_desc_name = os.path.join(downloadfolder, ARCHIVE_DESC_NAME)
-    print("Downloading archive...")
-    urllib.request.urlretrieve(ARCHIVE_DESC_URL, archive_desc_name)
+    return f"https://www.evm.codes/#{urllib.parse.quote(instr.name)}"
 
-    archive_mnem_name = os.path.join(downloadfolder, ARCHIVE_MNEM_NAME)
-    print("Downloading archive...")
-    urllib.request.urlretrieve(ARCHIVE_MNEM_URL, archive_mnem_name)
 
-
-def get_description_paragraphs(opcode):
+def get_description_paragraphs(opcode, gas):
     stack_input = 'Input: ' + (f'<code>{opcode["input"]}</code>' if opcode["input"] != "" else '-')
     stack_output = 'Output: ' + (f'<code>{opcode["output"]}</code>' if opcode["output"] != "" else '-')
-    return [opcode["description"], stack_input, stack_output]
+    paragraphs = [opcode["description"], stack_input, stack_output]
+    if 'static' in gas:
+        paragraphs.append(f'Gas: {gas["static"]}')
+    if 'dynamic' in gas:
+        paragraphs.append(f'Dynamic gas: {gas["dynamic"]}')
+    return paragraphs
+
+
+def get_fork(name):
+    """Maps the fork names of opcodes.json, e.g. "Tangerine Whistle", to FORKS.
+
+    Fails on forks missing from FORKS, whose instructions would otherwise be
+    documented as existing since frontier.
+    """
+    if not name:
+        return None
+    key = name.replace(' ', '').lower()
+    fork = next((fork for fork in FORKS if fork.lower() == key), None)
+    if fork is None:
+        raise DocenizerError(f"Unknown fork '{name}' in {ARCHIVE_DESC_NAME}, add it to FORKS (and GAS_HISTORY if "
+                             f"it repriced instructions)")
+    return fork
+
+
+def get_gas(mnemonic, opcode):
+    """The gas fields of an instruction record.
+
+    `static` is the current static cost and `dynamic` a note on the part of
+    the cost depending on the operands. For instructions which were added or
+    repriced after frontier, `forks` maps every fork to the static cost in
+    that fork, or to null if the instruction did not exist yet.
+    """
+    gas = {}
+    static = opcode.get("staticGas", opcode.get("minimumFee"))
+    if static not in (None, ""):
+        gas['static'] = str(static)
+    # Either a note on the dynamic cost or a mere flag saying there is one.
+    dynamic = str(opcode.get("dynamicGas", "")).strip()
+    if dynamic.lower() in ('1', 'true'):
+        gas['dynamic'] = 'Depends on the operands, see the documentation'
+    elif dynamic and dynamic.lower() not in ('0', 'false'):
+        gas['dynamic'] = dynamic
+
+    history = dict(GAS_HISTORY.get(mnemonic, []))
+    since = get_fork(opcode.get("fork")) or (next(iter(history)) if history else 'frontier')
+    if history or since != 'frontier':
+        cost = gas.get('static')
+        gas['forks'] = {}
+        for fork in FORKS:
+            cost = history.get(fork, cost)
+            gas['forks'][fork] = cost if FORKS.index(fork) >= FORKS.index(since) else None
+        gas['since'] = since
+    return gas
 
 
 def generate_opcode_mnemonic_map(mnemonic_file):
@@ -80,70 +121,43 @@ def is_valid_opcode(opcode, mnemonic_map):
 def parse(descriptions_file, mnemonic_file):
     descriptions = json.load(descriptions_file)
     mnemonic_map = generate_opcode_mnemonic_map(mnemonic_file)
-    print(mnemonic_map)
     opcodes = descriptions.items()
     instructions = []
     for opcode, body in opcodes:
         if is_valid_opcode(opcode, mnemonic_map):
             mnemonic = mnemonic_map[opcode]
-            opcode_desc = get_description_paragraphs(body)
-            instructions.append(Instruction(
+            gas = get_gas(mnemonic, body)
+            opcode_desc = get_description_paragraphs(body, gas)
+            instruction = Instruction(
                 opcode,
-                mnemonic,
+                [mnemonic],
                 opcode_desc[0],
-                '\n'.join(opcode_desc))
-            )
+                '\n'.join(opcode_desc),
+                fields={'gas': gas} if gas else None)
+            instruction.url = get_url_for_instruction(instruction)
+            instructions.append(instruction)
     return instructions
 
 
-def parse_html(directory):
+def parse_html(inputs, inputfolder):
     print("Parsing instructions...")
-    instructions = []
-    try:
-        with open(os.path.join(directory, ARCHIVE_DESC_NAME), encoding='utf-8') as description_file:
-            with open(os.path.join(directory, ARCHIVE_MNEM_NAME), encoding='utf-8') as mnemonic_file:
-                instructions = parse(description_file, mnemonic_file)
-    except Exception as e:
-        print(f"Error parsing files:\n{e}")
-
+    description_path, mnemonic_path = inputs
+    # Errors fail the run: writing no instructions would wipe the generated docs.
+    with open(description_path, encoding='utf-8') as description_file:
+        with open(mnemonic_path, encoding='utf-8') as mnemonic_file, \
+                docenizer.profile_document(ARCHIVE_DESC_NAME):
+            instructions = parse(description_file, mnemonic_file)
+    instructions.sort(key=lambda b: b.name)
     return instructions
 
 
-def main():
-    args = parser.parse_args()
-    print(f"Called with: {args}")
-    # If we don't have the html folder already...
-    if not os.path.isdir(os.path.join(args.inputfolder, 'html')):
-        try:
-            download_asm_doc_archive(args.downloadfolder)
-        except IOError as e:
-            print("Error when downloading archive:")
-            print(e)
-            sys.exit(1)
-    instructions = parse_html(args.inputfolder)
-    instructions.sort(key=lambda b: b.opcode)
-    all_inst = set()
-    print(f"Writing {len(instructions)} instructions")
-    with open(args.outputpath, 'w') as f:
-        f.write("""
-import {AssemblyInstructionInfo} from '../base.js';
-
-export function getAsmOpcode(opcode: string | undefined): AssemblyInstructionInfo | undefined {
-    if (!opcode) return;
-    switch (opcode.toUpperCase()) {
-""".lstrip())
-        for inst in instructions:
-            f.write(f'        case "{inst.mnemonic}":\n')
-            f.write('            return {}'.format(json.dumps({
-                "tooltip": inst.tooltip,
-                "html": inst.body,
-                "url": get_url_for_instruction(inst)
-            }, indent=16, separators=(',', ': '), sort_keys=True))[:-1] + '            };\n\n')
-        f.write("""
-    }
-}
-""")
+DOCENIZER = docenizer.Docenizer(
+    'evm',
+    [UrlSource(ARCHIVE_DESC_URL, ARCHIVE_DESC_NAME), UrlSource(ARCHIVE_MNEM_URL, ARCHIVE_MNEM_NAME)],
+    parse_html,
+    inputfolder='evm-inst-docs',
+    check_overlaps=False)
 
 
 if __name__ == '__main__':
-    main()
+    docenizer.main(DOCENIZER, 'Docenizes the EVM documentation')
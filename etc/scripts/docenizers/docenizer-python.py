@@ -1,11 +1,9 @@
 #! /usr/bin/env python3
 # -*- coding: utf-8 -*-
-import argparse
 import json
 import os
-import sys
+import re
 import urllib
-from urllib import request
 from urllib import parse
 
 try:
@@ -14,48 +12,42 @@ except ImportError:
     raise ImportError(
         "Please install BeautifulSoup (apt-get install python3-bs4 or pip install beautifulsoup4 should do it)")
 
-parser = argparse.ArgumentParser(description='Docenizes HTML version of the official Python documentation')
-parser.add_argument('-i', '--inputfolder', type=str,
-                    help='Folder where the input files reside as .html. Default is ./python-inst-docs/',
-                    default='python-inst-docs')
-parser.add_argument('-o', '--outputpath', type=str, help='Final path of the .ts file. Default is ./asm-docs-python.ts',
-                    default='./asm-docs-python.ts')
-parser.add_argument('-d', '--downloadfolder', type=str,
-                    help='Folder where the archive will be downloaded and extracted', default='python-inst-docs')
+import docenizer
+from docenizer import Instruction, TsEmitter, UrlSource
 
 # The maximum number of paragraphs from the description to copy.
 MAX_DESC_PARAS = 5
 
-# Where to extract the asmdoc archive.
-ARCHIVE_URL = "https://docs.python.org/3/library/dis.html"
-ARCHIVE_NAME = "dis.html"
+# The docs of the latest version are the base, the other versions are stored as
+# deltas to it.
+BASE_VERSION = "3"
+# The versions of the interpreters we run are read from the compiler config.
+CONFIG_FILE = os.path.join(docenizer.SCRIPT_DIR, '..', '..', 'config', 'python.amazon.properties')
+SEMVER_RE = re.compile(r'^compiler\.[^.]+\.semver=(\d+\.\d+)\s*$', re.MULTILINE)
 
 
-class Instruction(object):
-    def __init__(self, name, names, tooltip, body):
-        self.name = name
-        self.names = names
-        self.tooltip = tooltip.rstrip(': ,')
-        self.body = body
+def get_archive_url(version):
+    return f"https://docs.python.org/{version}/library/dis.html"
 
-    def __str__(self):
-        return f"{self.name} = {self.tooltip}\n{self.body}"
 
+def get_archive_name(version):
+    return "dis.html" if version == BASE_VERSION else f"dis-{version}.html"
 
-def get_url_for_instruction(instr):
-    return f"https://docs.python.org/3/library/dis.html#opcode-{urllib.parse.quote(instr.name)}"
 
+def get_versions():
+    try:
+        with open(CONFIG_FILE, encoding='utf-8') as f:
+            versions = set(SEMVER_RE.findall(f.read()))
+    except OSError:
+        return []
+    return sorted(versions, key=lambda v: tuple(map(int, v.split('.'))))
+
+
+VERSIONS = get_versions()
 
-def download_asm_doc_archive(downloadfolder):
-    if not os.path.exists(downloadfolder):
-        print(f"Creating {downloadfolder} as download folder")
-        os.makedirs(downloadfolder)
-    elif not os.path.isdir(downloadfolder):
-        print(f"Error: download folder {downloadfolder} is not a directory")
-        sys.exit(1)
-    archive_name = os.path.join(downloadfolder, ARCHIVE_NAME)
-    print("Downloading archive...")
-    urllib.request.urlretrieve(ARCHIVE_URL, archive_name)
+
+def get_url_for_instruction(instr, version=BASE_VERSION):
+    return f"{get_archive_url(version)}#opcode-{urllib.parse.quote(instr.name)}"
 
 
 def get_description_paragraphs(opcode):
@@ -63,76 +55,107 @@ def get_description_paragraphs(opcode):
     return [p.text for p in ps]
 
 
-def parse(f):
+def get_opcode_name(opcode):
+    name = opcode.find('span', {'class': 'pre'})
+    if name is not None:
+        return name.text
+    # Older docs only have the name in a <code> or in the id, "opcode-<name>".
+    return opcode.find('dt').get('id', '')[len('opcode-'):]
+
+
+def parse(f, version=BASE_VERSION):
     doc = BeautifulSoup(f, 'html.parser')
-    table = doc.find('section', {'id': 'python-bytecode-instructions'})
+    # Older versions of the docs were built with older Sphinx releases, which
+    # use a <div> for the section and only "opcode" as class.
+    table = doc.find(id='python-bytecode-instructions')
 
-    opcodes = table.findAll('dl', {'class': 'std opcode'})
+    opcodes = table.findAll('dl', class_='opcode')
     instructions = []
     for opcode in opcodes:
-        opcode_name = opcode.find('span', {'class': 'pre'}).text
+        opcode_name = get_opcode_name(opcode)
         opcode_desc = get_description_paragraphs(opcode)
-        instructions.append(Instruction(
+        instruction = Instruction(
             opcode_name,
             [opcode_name],
             opcode_desc[0],
             '\n'.join(opcode_desc))
-        )
+        instruction.url = get_url_for_instruction(instruction, version)
+        instructions.append(instruction)
     return instructions
 
 
-def parse_html(directory):
-    print("Parsing instructions...")
+def parse_file(path, version=BASE_VERSION):
     instructions = []
     try:
-        with open(os.path.join(directory, ARCHIVE_NAME), encoding='utf-8') as f:
-            instructions = parse(f)
+        with open(path, encoding='utf-8') as f, docenizer.profile_document(os.path.basename(path)):
+            instructions = parse(f, version)
     except Exception as e:
-        print(f"Error parsing {ARCHIVE_NAME}:\n{e}")
-
+        print(f"Error parsing {os.path.basename(path)}:\n{e}")
+    instructions.sort(key=lambda b: b.name)
     return instructions
 
 
-def main():
-    args = parser.parse_args()
-    print(f"Called with: {args}")
-    # If we don't have the html folder already...
-    if not os.path.isdir(os.path.join(args.inputfolder, 'html')):
-        try:
-            download_asm_doc_archive(args.downloadfolder)
-        except IOError as e:
-            print("Error when downloading archive:")
-            print(e)
-            sys.exit(1)
-    instructions = parse_html(args.inputfolder)
-    instructions.sort(key=lambda b: b.name)
-    all_inst = set()
+class VersionedInstructions(list):
+    """The instructions of the base version, with the deltas of the other versions in `deltas`."""
+
+    def __init__(self, instructions, deltas):
+        super().__init__(instructions)
+        self.deltas = deltas
+
+
+def get_delta(base, instructions):
+    """What differs in a version from the base: the opcodes it doesn't have and the ones it documents differently.
+
+    URLs are not compared, they only differ by the version.
+    """
+    base = {inst.name: inst for inst in base}
+    names = {inst.name for inst in instructions}
+    changed = {}
     for inst in instructions:
-        if not all_inst.isdisjoint(inst.names):
-            print(f"Overlap in instruction names: {inst.names.intersection(all_inst)} for {inst.name}")
-        all_inst = all_inst.union(inst.names)
-    print(f"Writing {len(instructions)} instructions")
-    with open(args.outputpath, 'w') as f:
-        f.write("""
-import {AssemblyInstructionInfo} from '../base.js';
-
-export function getAsmOpcode(opcode: string | undefined): AssemblyInstructionInfo | undefined {
-    if (!opcode) return;
-    switch (opcode.toUpperCase()) {
-""".lstrip())
-        for inst in instructions:
-            for name in sorted(inst.names):
-                f.write(f'        case "{name}":\n')
-            f.write('            return {}'.format(json.dumps({
-                "tooltip": inst.tooltip,
-                "html": inst.body,
-                "url": get_url_for_instruction(inst)
-            }, indent=16, separators=(',', ': '), sort_keys=True))[:-1] + '            };\n\n')
-        f.write("""
-    }
-}
-""")
+        original = base.get(inst.name)
+        if original is None or (original.tooltip, original.body) != (inst.tooltip, inst.body):
+            changed[inst.name] = {"tooltip": inst.tooltip, "html": inst.body, "url": inst.url}
+    return {"removed": sorted(set(base) - names), "changed": changed}
+
+
+def parse_html(inputs, inputfolder):
+    print("Parsing instructions...")
+    instructions = parse_file(inputs[0])
+    deltas = {}
+    for version, path in zip(VERSIONS, inputs[1:]):
+        version_instructions = parse_file(path, version)
+        if version_instructions:
+            deltas[version] = get_delta(instructions, version_instructions)
+            print(f"{version}: {len(deltas[version]['removed'])} removed and "
+                  f"{len(deltas[version]['changed'])} added or changed opcodes")
+    return VersionedInstructions(instructions, deltas)
+
+
+class VersionedTsEmitter(TsEmitter):
+    """Writes the base version as usual, and the deltas of the other versions next to it."""
+
+    def emit(self, instructions, outputpath):
+        super().emit(instructions, outputpath)
+        deltas = getattr(instructions, 'deltas', {})
+        path = os.path.splitext(outputpath)[0] + '-versions.ts'
+        print(f"Writing the deltas of {len(deltas)} versions to {path}")
+        with open(path, 'w') as f:
+            f.write("import {AsmDocsVersionDelta} from '../base.js';\n\n")
+            f.write(f"export const BASE_VERSION = {json.dumps(BASE_VERSION)};\n\n")
+            f.write("export const VERSION_DELTAS: Record<string, AsmDocsVersionDelta> = {\n")
+            for version, delta in deltas.items():
+                f.write(f"    {json.dumps(version)}: {json.dumps(delta, separators=(',', ':'), sort_keys=True)},\n")
+            f.write("};\n")
+
+
+DOCENIZER = docenizer.Docenizer(
+    'python',
+    [UrlSource(get_archive_url(BASE_VERSION), get_archive_name(BASE_VERSION))] +
+    [UrlSource(get_archive_url(version), get_archive_name(version)) for version in VERSIONS],
+    parse_html,
+    inputfolder='python-inst-docs',
+    emitter=VersionedTsEmitter())
 
 
 if __name__ == '__main__':
-    main()
+    docenizer.main(DOCENIZER, 'Docenizes HTML version of the official Python documentation')
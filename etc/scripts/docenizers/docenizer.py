@@ -0,0 +1,581 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared plumbing for the docenizer scripts.
+
+Every docenizer is described by a `Docenizer` pipeline made of three pluggable
+stages: a list of sources which are fetched into a shared download cache, a
+parser which turns the fetched inputs into `Instruction`s and an emitter which
+writes the generated TypeScript. The instructions are then added to the search
+index (see searchindex.py). The individual docenizer-*.py scripts define
+a module level `DOCENIZER` and call `main()`; docenizer-all.py loads all of them
+and runs the pipelines concurrently.
+"""
+import argparse
+import cProfile
+import hashlib
+import importlib.util
+import json
+import os
+import pstats
+import shutil
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import tracemalloc
+import urllib.error
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+GENERATED_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, '..', '..', '..', 'lib', 'asm-docs', 'generated'))
+DEFAULT_CACHE_DIR = 'docenizer-cache'
+
+TS_HEADER = """
+import {{AssemblyInstructionInfo}} from '../base.js';
+
+export function getAsmOpcode(opcode: string | undefined): AssemblyInstructionInfo | undefined {{
+    if (!opcode) return;
+    switch ({switch_expr}) {{
+""".lstrip()
+TS_FOOTER = """
+    }
+}
+"""
+
+STAGES = ('fetch', 'parse', 'emit', 'index')
+# How many documents the --profile report lists by default.
+DEFAULT_PROFILE_TOP = 20
+
+
+class DocenizerError(Exception):
+    def __init__(self, message, exit_code=1):
+        super().__init__(message)
+        self.exit_code = exit_code
+
+
+class Instruction(object):
+    """One documented instruction. `fields` holds structured extra data, e.g. timings, added to its record."""
+
+    def __init__(self, name, names, tooltip, body, url='', fields=None):
+        self.name = name
+        self.names = names
+        self.tooltip = tooltip.rstrip(': ,')
+        self.body = body
+        self.url = url
+        self.fields = fields or {}
+
+    def __str__(self):
+        return f"{self.name} = {self.tooltip}\n{self.body}"
+
+
+def default_output_path(arch):
+    return os.path.join(GENERATED_DIR, f'asm-docs-{arch}.ts')
+
+
+class DownloadCache(object):
+    """A download folder shared by all docenizers.
+
+    Each URL is only fetched once per run, even when several pipelines ask for
+    it from different threads at the same time. The ETag and Last-Modified
+    headers of a download are kept next to it in `<name>.meta.json`, so later
+    runs only revalidate it with a conditional request and download it again
+    when it changed. When the server cannot be reached the previous download
+    is used.
+
+    In offline mode nothing is requested: sources are read from the `mirror`
+    folder when given, and from previous downloads otherwise.
+    """
+
+    def __init__(self, directory, offline=False, mirror=None, timeout=60):
+        self.directory = directory
+        self.offline = offline or mirror is not None
+        self.mirror = mirror
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._url_locks = {}
+        self._fetched = {}
+
+    def _url_lock(self, url):
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def path_for(self, name):
+        return os.path.join(self.directory, name)
+
+    def _meta_path(self, name):
+        return self.path_for(name + '.meta.json')
+
+    def _read_meta(self, name):
+        try:
+            with open(self._meta_path(name)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def fetch(self, url, name):
+        with self._url_lock(url):
+            if url not in self._fetched:
+                self._fetched[url] = self._find_offline(name) if self.offline else self._download(url, name)
+            return self._fetched[url]
+
+    def _find_offline(self, name):
+        for path in ([os.path.join(self.mirror, name)] if self.mirror else []) + [self.path_for(name)]:
+            if os.path.isfile(path):
+                return path
+        raise DocenizerError(f"Error: {name} is not available offline in {self.mirror or self.directory}")
+
+    def _download(self, url, name):
+        path = self.path_for(name)
+        if not os.path.exists(self.directory):
+            print(f"Creating {self.directory} as download folder")
+            os.makedirs(self.directory, exist_ok=True)
+        elif not os.path.isdir(self.directory):
+            raise DocenizerError(f"Error: download folder {self.directory} is not a directory")
+
+        headers = {}
+        meta = self._read_meta(name)
+        cached = os.path.isfile(path) and meta.get('url') == url
+        if cached:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=self.timeout) as response:
+                print(f"Downloading {url}...")
+                partial = path + '.part'
+                with open(partial, 'wb') as f:
+                    shutil.copyfileobj(response, f)
+                meta = {
+                    'url': url,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                print(f"{name} is up to date")
+                return path
+            raise
+        except (urllib.error.URLError, OSError) as e:
+            if not os.path.isfile(path):
+                raise
+            print(f"Warning: could not revalidate {url} ({e}), using the previous download")
+            return path
+        os.replace(partial, path)
+        with open(self._meta_path(name), 'w') as f:
+            json.dump(meta, f)
+        return path
+
+
+class UrlSource(object):
+    """A single file fetched into the download cache."""
+
+    def __init__(self, url, name):
+        self.url = url
+        self.name = name
+
+    def fetch(self, cache, inputfolder):
+        return cache.fetch(self.url, self.name)
+
+
+class LocalSource(object):
+    """An optional local file given with the --`option` command line option.
+
+    For inputs which cannot be downloaded, e.g. tables the user fetched
+    themselves. Fetching it yields None when the option was not given.
+    """
+
+    def __init__(self, option, help):
+        self.option = option
+        self.help = help
+        self.path = None
+
+    def add_argument(self, parser):
+        parser.add_argument(f'--{self.option}', type=str, help=self.help)
+
+    def configure(self, args):
+        self.path = getattr(args, self.option.replace('-', '_'))
+
+    def fetch(self, cache, inputfolder):
+        if self.path and not os.path.isfile(self.path):
+            raise DocenizerError(f"Error: {self.path} given with --{self.option} does not exist")
+        return self.path
+
+
+class ArchiveSource(UrlSource):
+    """A tarball fetched into the download cache and extracted into `inputfolder`.
+
+    The archive is extracted again whenever it is newer than the last
+    extraction. Offline, an existing `inputfolder/subdir` is used as is.
+    """
+
+    def __init__(self, url, name, subdir):
+        super().__init__(url, name)
+        self.subdir = subdir
+
+    def fetch(self, cache, inputfolder):
+        extracted = os.path.join(inputfolder, self.subdir)
+        stamp = extracted + '.extracted'
+        try:
+            archive = super().fetch(cache, inputfolder)
+        except DocenizerError:
+            if cache.offline and os.path.isdir(extracted):
+                return extracted
+            raise
+        if os.path.isdir(extracted) and os.path.isfile(stamp) and \
+                os.path.getmtime(stamp) >= os.path.getmtime(archive):
+            return extracted
+        print(f"Extracting {archive}...")
+        with tarfile.open(archive) as tar:
+            tar.extractall(path=inputfolder)
+        with open(stamp, 'w') as f:
+            f.write(archive)
+        return extracted
+
+
+class TsEmitter(object):
+    """Writes a `getAsmOpcode` switch statement, the format used by lib/asm-docs."""
+
+    def __init__(self, upper_case=True):
+        self.upper_case = upper_case
+
+    def emit(self, instructions, outputpath):
+        print(f"Writing {len(instructions)} instructions to {outputpath}")
+        switch_expr = 'opcode.toUpperCase()' if self.upper_case else 'opcode'
+        with open(outputpath, 'w') as f:
+            f.write(TS_HEADER.format(switch_expr=switch_expr))
+            for inst in instructions:
+                for name in inst.names:
+                    f.write(f'        case "{name}":\n')
+                record = {**inst.fields, "tooltip": inst.tooltip, "html": inst.body, "url": inst.url}
+                # Structured fields are kept on a single line each to keep the files small.
+                f.write('            return {\n' + ',\n'.join(
+                    f'                {json.dumps(key)}: {json.dumps(value, separators=(",", ":"), sort_keys=True)}'
+                    for key, value in sorted(record.items())) + '\n            };\n\n')
+            f.write(TS_FOOTER)
+
+
+def report_overlaps(instructions):
+    all_inst = set()
+    for inst in instructions:
+        names = set(inst.names)
+        if not all_inst.isdisjoint(names):
+            print(f"Overlap in instruction names: {names.intersection(all_inst)} for {inst.name}")
+        all_inst.update(names)
+
+
+class DocumentProfiler(object):
+    """Records the wall time and the memory allocated for each input document parsed.
+
+    Parsers wrap the handling of each document, e.g. a felixcloutier page or
+    an ARM XML file, in `profile_document()`, which costs nothing unless
+    profiling was started with --profile. While profiling, parsers which
+    usually use a process pool parse in-process so every document is seen.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.documents = []
+
+    def start(self):
+        tracemalloc.start()
+        self.active = True
+
+    def stop(self):
+        self.active = False
+        tracemalloc.stop()
+
+    @contextmanager
+    def document(self, name):
+        if not self.active:
+            yield
+            return
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            self.documents.append((name, elapsed, peak - before))
+
+    def format_report(self, top=DEFAULT_PROFILE_TOP):
+        if not self.documents:
+            return "No documents were parsed (all of them may have come from a cache)"
+        total = sum(elapsed for _, elapsed, _ in self.documents)
+        lines = [f"Parsed {len(self.documents)} documents in {total:.2f}s, the {min(top, len(self.documents))} slowest:",
+                 f"{'seconds':>9}  {'peak KiB':>9}  document"]
+        for name, elapsed, allocated in sorted(self.documents, key=lambda d: -d[1])[:top]:
+            lines.append(f"{elapsed:9.4f}  {allocated / 1024:9.1f}  {name}")
+        return '\n'.join(lines)
+
+
+PROFILER = DocumentProfiler()
+
+
+def profile_document(name):
+    """Context manager timing the parsing of one input document when --profile is given."""
+    return PROFILER.document(name)
+
+
+class Docenizer(object):
+    """A docenizer pipeline: sources -> parser -> emitter.
+
+    `parse` is called with the list of fetched inputs (paths, in the order of
+    `sources`) and the input folder, and must return the list of `Instruction`s
+    in output order. It has to be a module level function so the pipeline can
+    be run in a worker process.
+
+    An `incremental` pipeline skips parsing and emitting when its inputs and
+    parser are unchanged since it last wrote the same output path, as recorded
+    in a stamp file in the input folder.
+    """
+
+    def __init__(self, arch, sources, parse, inputfolder, emitter=None, check_overlaps=True, search_index=True,
+                 incremental=False):
+        self.arch = arch
+        self.sources = sources
+        self.parser = parse
+        self.inputfolder = inputfolder
+        self.emitter = emitter or TsEmitter()
+        self.check_overlaps = check_overlaps
+        self.search_index = search_index
+        self.incremental = incremental
+        # Set by load_docenizer() so worker processes can find the pipeline again.
+        self.script = None
+
+    @property
+    def local_sources(self):
+        return [source for source in self.sources if isinstance(source, LocalSource)]
+
+    def fetch(self, cache, inputfolder=None):
+        inputfolder = inputfolder or self.inputfolder
+        if len(self.sources) == 1:
+            return [self.sources[0].fetch(cache, inputfolder)]
+        with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+            return list(executor.map(lambda source: source.fetch(cache, inputfolder), self.sources))
+
+    def parse(self, inputs, inputfolder=None):
+        instructions = self.parser(inputs, inputfolder or self.inputfolder)
+        if self.check_overlaps:
+            report_overlaps(instructions)
+        return instructions
+
+    def emit(self, instructions, outputpath):
+        self.emitter.emit(instructions, outputpath)
+
+    def inputs_hash(self, inputs):
+        """Hashes the fetched input files and the module of the parser."""
+        digest = hashlib.sha256()
+        for path in [sys.modules[self.parser.__module__].__file__] + [path for path in inputs if path]:
+            with open(path, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    def _stamp_path(self, inputfolder):
+        return os.path.join(inputfolder or self.inputfolder, f'{self.arch}.stamp.json')
+
+    def read_stamp(self, inputfolder, outputpath, digest):
+        """Returns the instruction count recorded when `outputpath` was written from inputs hashing to `digest`."""
+        try:
+            with open(self._stamp_path(inputfolder)) as f:
+                stamp = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if stamp.get('sha256') != digest or stamp.get('outputpath') != os.path.abspath(outputpath) or \
+                not os.path.isfile(outputpath):
+            return None
+        return stamp.get('instructions')
+
+    def write_stamp(self, inputfolder, outputpath, digest, count):
+        os.makedirs(inputfolder or self.inputfolder, exist_ok=True)
+        with open(self._stamp_path(inputfolder), 'w') as f:
+            json.dump({'sha256': digest, 'outputpath': os.path.abspath(outputpath), 'instructions': count}, f)
+
+    def index(self, instructions, directory):
+        # Imported here as searchindex itself depends on this module.
+        import searchindex
+        searchindex.write_segment(self.arch, instructions, directory)
+
+    def run(self, cache, outputpath, inputfolder=None, parse_executor=None):
+        """Runs all stages, returning a {stage: seconds} dict and the instruction count."""
+        timings = {}
+        start = time.perf_counter()
+        inputs = self.fetch(cache, inputfolder)
+        timings['fetch'] = time.perf_counter() - start
+
+        if self.incremental:
+            digest = self.inputs_hash(inputs)
+            count = self.read_stamp(inputfolder, outputpath, digest)
+            if count is not None:
+                print(f"{outputpath} is up to date")
+                return timings, count
+
+        start = time.perf_counter()
+        if parse_executor is None:
+            instructions = self.parse(inputs, inputfolder)
+        else:
+            instructions = parse_executor.submit(_parse_in_worker, self.script, inputs, inputfolder).result()
+        timings['parse'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.emit(instructions, outputpath)
+        timings['emit'] = time.perf_counter() - start
+
+        if self.search_index:
+            start = time.perf_counter()
+            self.index(instructions, os.path.dirname(os.path.abspath(outputpath)))
+            timings['index'] = time.perf_counter() - start
+        if self.incremental:
+            self.write_stamp(inputfolder, outputpath, digest, len(instructions))
+        return timings, len(instructions)
+
+
+class CommandDocenizer(object):
+    """A docenizer implemented outside of Python, e.g. the TypeScript ones run via a shell script."""
+
+    def __init__(self, arch, command):
+        self.arch = arch
+        self.command = command
+
+    def run(self, cache, outputpath, inputfolder=None, parse_executor=None):
+        timings = {}
+        start = time.perf_counter()
+        subprocess.run(self.command, cwd=SCRIPT_DIR, check=True)
+        timings['parse'] = time.perf_counter() - start
+        # The commands write their docs into GENERATED_DIR, which are indexed from there.
+        import searchindex
+        start = time.perf_counter()
+        searchindex.index_generated(GENERATED_DIR, [self.arch])
+        timings['index'] = time.perf_counter() - start
+        return timings, None
+
+
+def load_docenizer(script):
+    """Imports a docenizer-*.py script by path and returns its `DOCENIZER`."""
+    module_name = os.path.splitext(os.path.basename(script))[0].replace('-', '_')
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, script)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    module.DOCENIZER.script = script
+    return module.DOCENIZER
+
+
+def _parse_in_worker(script, inputs, inputfolder):
+    return load_docenizer(script).parse(inputs, inputfolder)
+
+
+def _run_one(docenizer, cache, outputpath, parse_executor):
+    try:
+        timings, count = docenizer.run(cache, outputpath, parse_executor=parse_executor)
+        return timings, count, None
+    except Exception as e:
+        return {}, None, e
+
+
+def run_all(docenizers, cache, outputdir=None, jobs=None):
+    """Runs several pipelines at once.
+
+    Fetching and emitting happen on one thread per pipeline, parsing in a
+    process pool of `jobs` workers. Returns {arch: (timings, count, error)}.
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as processes, \
+            ThreadPoolExecutor(max_workers=len(docenizers)) as threads:
+        futures = {}
+        for docenizer in docenizers:
+            outputpath = os.path.join(outputdir, f'asm-docs-{docenizer.arch}.ts') if outputdir \
+                else default_output_path(docenizer.arch)
+            futures[docenizer.arch] = threads.submit(_run_one, docenizer, cache, outputpath, processes)
+        for arch, future in futures.items():
+            results[arch] = future.result()
+    return results
+
+
+def format_timings(results, wall_time=None):
+    """Formats the per-stage timings returned by `run_all` as a table."""
+    rows = [('arch',) + STAGES + ('total', 'instructions')]
+    for arch, (timings, count, error) in sorted(results.items()):
+        stages = tuple(f"{timings[stage]:.2f}s" if stage in timings else '-' for stage in STAGES)
+        total = f"{sum(timings.values()):.2f}s" if timings else '-'
+        rows.append((arch,) + stages + (total, 'FAILED' if error else ('-' if count is None else str(count))))
+    if wall_time is not None:
+        rows.append(('wall',) + ('',) * len(STAGES) + (f"{wall_time:.2f}s", ''))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return '\n'.join('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
+
+
+def get_arguments(docenizer, description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('-i', '--inputfolder', type=str,
+                        help=f'Folder where archives are extracted. Default is ./{docenizer.inputfolder}/',
+                        default=docenizer.inputfolder)
+    parser.add_argument('-o', '--outputpath', type=str,
+                        help=f'Final path of the .ts file. Default is lib/asm-docs/generated/asm-docs-{docenizer.arch}.ts',
+                        default=default_output_path(docenizer.arch))
+    parser.add_argument('-d', '--downloadfolder', type=str,
+                        help=f'Folder where the sources will be downloaded. Default is ./{DEFAULT_CACHE_DIR}/',
+                        default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--profile', type=str, nargs='?', const=f'docenizer-{docenizer.arch}.pstats', metavar='PSTATS',
+                        help='Report the time and memory spent on each input document, and dump a cProfile of '
+                             f'the run to PSTATS. Default is ./docenizer-{docenizer.arch}.pstats')
+    parser.add_argument('--profile-top', type=int, default=DEFAULT_PROFILE_TOP, metavar='N',
+                        help=f'Number of the slowest documents to report with --profile. Default is {DEFAULT_PROFILE_TOP}')
+    add_offline_arguments(parser)
+    for source in docenizer.local_sources:
+        source.add_argument(parser)
+    args = parser.parse_args()
+    for source in docenizer.local_sources:
+        source.configure(args)
+    return args
+
+
+def add_offline_arguments(parser):
+    parser.add_argument('--offline', action='store_true',
+                        help='Do not access the network, only use previously downloaded sources')
+    parser.add_argument('--mirror', type=str,
+                        help='Folder holding a local copy of the sources, implies --offline')
+
+
+def get_download_cache(args):
+    return DownloadCache(args.downloadfolder, offline=args.offline, mirror=args.mirror)
+
+
+def run_profiled(docenizer, args):
+    """Runs a pipeline under cProfile and the document profiler, then reports on both."""
+    profile = cProfile.Profile()
+    PROFILER.start()
+    try:
+        timings, _ = profile.runcall(docenizer.run, get_download_cache(args), args.outputpath, args.inputfolder)
+    finally:
+        PROFILER.stop()
+        profile.dump_stats(args.profile)
+    print(PROFILER.format_report(args.profile_top))
+    print(', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items()))
+    print(f"cProfile stats written to {args.profile}, e.g. python3 -m pstats {args.profile}")
+    pstats.Stats(profile).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(args.profile_top)
+
+
+def main(docenizer, description):
+    """Entry point used by the individual docenizer-*.py scripts."""
+    args = get_arguments(docenizer, description)
+    print(f"Called with: {args}")
+    try:
+        if args.profile:
+            run_profiled(docenizer, args)
+        else:
+            docenizer.run(get_download_cache(args), args.outputpath, args.inputfolder)
+    except IOError as e:
+        print("Error when downloading sources:")
+        print(e)
+        sys.exit(1)
+    except DocenizerError as e:
+        print(e)
+        sys.exit(e.exit_code)
@@ -0,0 +1,367 @@
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import benchmark
+import bundle
+import docenizer
+import searchindex
+from docenizer import DocenizerError, DocumentProfiler, DownloadCache
+
+LAST_MODIFIED = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+
+class SourceHandler(BaseHTTPRequestHandler):
+    """Serves `server.files` with an ETag, answering conditional requests with a 304."""
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.path not in self.server.files:
+            self.send_error(404)
+            return
+        body = self.server.files[self.path]
+        etag = f'"{hash(body)}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DownloadCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), SourceHandler)
+        self.server.files = {'/dis.html': b'<html>dis</html>'}
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}/dis.html'
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = os.path.join(tmp.name, 'cache')
+        self.mirror = os.path.join(tmp.name, 'mirror')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_download(self):
+        path = DownloadCache(self.directory).fetch(self.url, 'dis.html')
+        self.assertEqual(self.read(path), b'<html>dis</html>')
+        self.assertEqual(self.server.requests, [('/dis.html', None)])
+
+    def test_revalidate_unchanged(self):
+        DownloadCache(self.directory).fetch(self.url, 'dis.html')
+        path = DownloadCache(self.directory).fetch(self.url, 'dis.html')
+        self.assertEqual(self.read(path), b'<html>dis</html>')
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertIsNotNone(self.server.requests[1][1])
+
+    def test_revalidate_changed(self):
+        DownloadCache(self.directory).fetch(self.url, 'dis.html')
+        self.server.files['/dis.html'] = b'<html>new dis</html>'
+        path = DownloadCache(self.directory).fetch(self.url, 'dis.html')
+        self.assertEqual(self.read(path), b'<html>new dis</html>')
+
+    def test_fetched_once_per_run(self):
+        cache = DownloadCache(self.directory)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            paths = set(executor.map(lambda _: cache.fetch(self.url, 'dis.html'), range(8)))
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_server_unreachable(self):
+        DownloadCache(self.directory).fetch(self.url, 'dis.html')
+        self.server.shutdown()
+        self.server.server_close()
+        path = DownloadCache(self.directory, timeout=1).fetch(self.url, 'dis.html')
+        self.assertEqual(self.read(path), b'<html>dis</html>')
+
+    def test_offline(self):
+        DownloadCache(self.directory).fetch(self.url, 'dis.html')
+        path = DownloadCache(self.directory, offline=True).fetch(self.url, 'dis.html')
+        self.assertEqual(self.read(path), b'<html>dis</html>')
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_offline_mirror(self):
+        os.makedirs(self.mirror)
+        with open(os.path.join(self.mirror, 'dis.html'), 'wb') as f:
+            f.write(b'<html>mirrored dis</html>')
+        path = DownloadCache(self.directory, mirror=self.mirror).fetch(self.url, 'dis.html')
+        self.assertEqual(self.read(path), b'<html>mirrored dis</html>')
+        self.assertEqual(self.server.requests, [])
+
+    def test_offline_missing(self):
+        with self.assertRaises(DocenizerError):
+            DownloadCache(self.directory, offline=True).fetch(self.url, 'dis.html')
+
+
+class DocumentProfilerTests(unittest.TestCase):
+    def test_inactive(self):
+        profiler = DocumentProfiler()
+        with profiler.document('dis.html'):
+            pass
+        self.assertEqual(profiler.documents, [])
+
+    def test_documents(self):
+        profiler = DocumentProfiler()
+        profiler.start()
+        try:
+            with profiler.document('small.html'):
+                bytearray(1024)
+            with profiler.document('large.html'):
+                bytearray(1024 * 1024)
+        finally:
+            profiler.stop()
+        self.assertEqual([name for name, _, _ in profiler.documents], ['small.html', 'large.html'])
+        self.assertGreaterEqual(profiler.documents[1][2], 1024 * 1024)
+        self.assertIn('large.html', profiler.format_report(1))
+        self.assertNotIn('small.html', profiler.format_report(1))
+
+
+class BundleTests(unittest.TestCase):
+    RECORDS = [
+        {'html': '<p>Adds the source operand to the destination operand.</p>', 'tooltip': 'Add', 'url': 'add'},
+        {'html': '<p>Subtracts the source operand from the destination operand.</p>', 'tooltip': 'Sub', 'url': 'sub'},
+        {'html': '<p>Moves the source operand to the destination operand.</p>', 'tooltip': 'Move', 'url': 'mov'},
+    ]
+
+    def test_dictionary(self):
+        dictionary = bundle.train_dictionary([bundle.serialize(record) for record in self.RECORDS])
+        self.assertIn(b' the destination operand.</p>', dictionary)
+        self.assertNotIn(b'Subtracts', dictionary)
+
+    def test_records_decompress_on_their_own(self):
+        dictionary = bundle.train_dictionary([bundle.serialize(record) for record in self.RECORDS])
+        blobs = [bundle.compress(bundle.serialize(record), dictionary) for record in self.RECORDS]
+        self.assertLess(len(blobs[1]), len(bundle.compress(bundle.serialize(self.RECORDS[1]), b'')))
+        for blob, record in reversed(list(zip(blobs, self.RECORDS))):
+            self.assertEqual(json.loads(bundle.decompress(blob, dictionary)), record)
+
+    def test_read_records(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'asm-docs-java.ts')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("""    switch (opcode.toUpperCase()) {
+        case 'IADD':
+        case 'LADD':
+            return {
+                url: `https://docs.oracle.com/iadd`,
+                html: `<p>Add <code>int</code></p>`,
+                tooltip: `Add int`,
+            };
+""")
+            records, upper_case = bundle.read_records(path)
+        self.assertTrue(upper_case)
+        self.assertEqual(records, [(['IADD', 'LADD'], {'url': 'https://docs.oracle.com/iadd',
+                                                       'html': '<p>Add <code>int</code></p>', 'tooltip': 'Add int'})])
+
+
+    def test_unescape_template(self):
+        self.assertEqual(bundle.unescape_template(r'<cite>llvm.maxnum.*\`</cite> \\n \${x} \u00e9\n'),
+                         '<cite>llvm.maxnum.*`</cite> \\n ${x} \u00e9\n')
+
+    @unittest.skipIf(shutil.which('node') is None, 'node is not available')
+    def test_bundles_match_the_generated_docs(self):
+        """Bundles every generated file, and checks each record against the one its module returns in node."""
+        generated = {arch: result for arch, result in bundle.read_all(docenizer.GENERATED_DIR).items() if result[0]}
+        self.assertIn('llvm', generated)
+        dictionary = bundle.train_dictionary(
+            bundle.training_samples({arch: records for arch, (records, _) in generated.items()}))
+        with tempfile.TemporaryDirectory() as tmp:
+            for arch, (records, upper_case) in generated.items():
+                bundled = bundle.read_bundle(bundle.write_bundle(arch, records, upper_case, dictionary, tmp),
+                                             dictionary)
+                self.assertEqual(bundled, self.evaluate(arch, tmp, sorted(bundled)), arch)
+
+    @staticmethod
+    def evaluate(arch, tmp, opcodes):
+        """The records asm-docs-<arch>.ts returns for `opcodes`, with its types stripped to run it in node."""
+        with open(os.path.join(docenizer.GENERATED_DIR, f'asm-docs-{arch}.ts'), encoding='utf-8') as f:
+            source = f.read()
+        source = re.sub(r'^import .*$', '', source, flags=re.M)
+        source = re.sub(r'^export function getAsmOpcode\(.*\{$', 'export function getAsmOpcode(opcode) {', source,
+                        flags=re.M)
+        path = os.path.join(tmp, f'{arch}.mjs')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+            f.write(f'console.log(JSON.stringify(Object.fromEntries({json.dumps(opcodes)}'
+                    f'.map(opcode => [opcode, getAsmOpcode(opcode)]))));\n')
+        return json.loads(subprocess.run(['node', path], capture_output=True, check=True).stdout)
+
+
+class SearchIndexTests(unittest.TestCase):
+    def test_typescript_docenizers_are_indexed(self):
+        llvm = searchindex.read_generated(os.path.join(docenizer.GENERATED_DIR, 'asm-docs-llvm.ts'))
+        self.assertIn('ATOMICRMW', [inst.name for inst in llvm])
+        results = searchindex.SearchIndex().search('add int', arch='java', limit=3)
+        self.assertIn('IADD', [opcode for _, _, opcode, _ in results])
+
+    def test_unknown_arch(self):
+        with self.assertRaisesRegex(ValueError, "No search index for 'z80'"):
+            searchindex.SearchIndex().search('add', arch='z80')
+
+
+class AvrTests(unittest.TestCase):
+    def test_empty_last_description(self):
+        docenizer.load_docenizer(os.path.join(docenizer.SCRIPT_DIR, 'docenizer-avr.py'))
+        avr = sys.modules['docenizer_avr']
+        docs = ('6.1 ADD - Add without Carry\n6.1.1 Description\nAdds two registers.\nOperation:\n(i) Rd <- Rd + Rr\n'
+                '6.2 NOP - No Operation\n6.2.1 Description\n   Operation:\n(i) No\n')
+        self.assertEqual([(section.mnemonic, section.description) for section in avr.tokenize_sections(docs)],
+                         [('ADD', 'Adds two registers.'), ('NOP', '')])
+
+    def test_empty_description_before_another_section(self):
+        docenizer.load_docenizer(os.path.join(docenizer.SCRIPT_DIR, 'docenizer-avr.py'))
+        avr = sys.modules['docenizer_avr']
+        docs = ('6.1 NOP - No Operation\n6.1.1 Description\n   Operation:\n(i) No\n'
+                '6.2 ADD - Add without Carry\n6.2.1 Description\nAdds two registers.\nOperation:\n(i) Rd <- Rd + Rr\n')
+        self.assertEqual([(section.mnemonic, section.description) for section in avr.tokenize_sections(docs)],
+                         [('NOP', ''), ('ADD', 'Adds two registers.')])
+
+
+UOPS_TABLE = """<root>
+  <extension name="BASE">
+    <instruction asm="MOV" string="MOV (R64, R64)"><architecture name="SKL"><measurement TP="0.25"/></architecture></instruction>
+    <instruction asm="MOV" string="MOV (R64, CR0)"><architecture name="SKL"><measurement TP="20"/></architecture></instruction>
+  </extension>
+  <extension name="AVX">
+    <instruction asm="MOV" string="MOV (R64, R64)"><architecture name="ZEN3"><measurement TP="0.5"/></architecture></instruction>
+  </extension>
+</root>
+"""
+
+
+class Amd64Tests(unittest.TestCase):
+    def test_timings_of_shared_mnemonics(self):
+        docenizer.load_docenizer(os.path.join(docenizer.SCRIPT_DIR, 'docenizer-amd64.py'))
+        amd64 = sys.modules['docenizer_amd64']
+        general = docenizer.Instruction('MOV', ['MOV'], 'Move.', '')
+        general.operand_forms = {'MOV': {amd64.instr_operands('MOV r64, r/m64')}}
+        control = docenizer.Instruction('MOV-1', ['MOV'], 'Move to/from control registers.', '')
+        control.operand_forms = {'MOV': {amd64.instr_operands('MOV r64, CR0\u2013CR7')}}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'instructions.xml')
+            with open(path, 'w') as f:
+                f.write(UOPS_TABLE)
+            with redirect_stdout(io.StringIO()):
+                amd64.add_timings([general, control], path)
+        self.assertEqual([(form['form'], list(form['uarchs'])) for form in general.fields['performance']],
+                         [('MOV (R64, R64)', ['SKL']), ('MOV (R64, R64)', ['ZEN3'])])
+        self.assertEqual([form['form'] for form in control.fields['performance']], ['MOV (R64, CR0)'])
+
+
+class EvmTests(unittest.TestCase):
+    def test_unknown_fork(self):
+        docenizer.load_docenizer(os.path.join(docenizer.SCRIPT_DIR, 'docenizer-evm.py'))
+        evm = sys.modules['docenizer_evm']
+        fixtures = os.path.join(docenizer.SCRIPT_DIR, 'test', 'fixtures', 'evm')
+        with open(os.path.join(fixtures, 'opcodes.json'), encoding='utf-8') as f:
+            opcodes = json.load(f)
+        opcodes['01']['fork'] = 'Fusaka'
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'opcodes.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(opcodes, f)
+            with redirect_stdout(io.StringIO()), self.assertRaisesRegex(DocenizerError, "Unknown fork 'Fusaka'"):
+                evm.parse_html([path, os.path.join(fixtures, 'README.md')], tmp)
+
+
+class PythonTests(unittest.TestCase):
+    def setUp(self):
+        docenizer.load_docenizer(os.path.join(docenizer.SCRIPT_DIR, 'docenizer-python.py'))
+        self.python = sys.modules['docenizer_python']
+        self.fixtures = os.path.join(docenizer.SCRIPT_DIR, 'test', 'fixtures', 'python')
+        with redirect_stdout(io.StringIO()):
+            self.base = self.python.parse_file(os.path.join(self.fixtures, 'dis.html'))
+
+    def delta(self, version):
+        with redirect_stdout(io.StringIO()):
+            instructions = self.python.parse_file(os.path.join(self.fixtures, f'dis-{version}.html'), version)
+        return self.python.get_delta(self.base, instructions)
+
+    def test_delta_of_an_older_version(self):
+        delta = self.delta('3.8')
+        self.assertEqual(delta['removed'], ['BINARY_OP', 'END_FOR', 'RESUME'])
+        self.assertEqual(sorted(delta['changed']), ['BINARY_ADD', 'ROT_FOUR'])
+        self.assertEqual(delta['changed']['BINARY_ADD']['tooltip'], 'Implements TOS = TOS1 + TOS.')
+        self.assertEqual(delta['changed']['BINARY_ADD']['url'],
+                         'https://docs.python.org/3.8/library/dis.html#opcode-BINARY_ADD')
+
+    def test_delta_ignores_urls(self):
+        self.assertEqual(self.delta('3.11'), {'removed': ['END_FOR'], 'changed': {}})
+
+    def test_delta_of_a_changed_description(self):
+        pop_top = next(inst for inst in self.base if inst.name == 'POP_TOP')
+        changed = docenizer.Instruction('POP_TOP', ['POP_TOP'], 'Removes the top-of-stack item.', '<p>Removes.</p>',
+                                        url=pop_top.url.replace('/3/', '/3.6/'))
+        self.assertEqual(self.python.get_delta([pop_top], [changed]),
+                         {'removed': [], 'changed': {'POP_TOP': {'tooltip': 'Removes the top-of-stack item.',
+                                                                 'html': '<p>Removes.</p>', 'url': changed.url}}})
+
+
+class IncrementalTests(unittest.TestCase):
+    """Runs the Hermes docenizer, which is incremental, on its fixture."""
+
+    def run_hermes(self, spec, outputpath):
+        pipeline = docenizer.load_docenizer(os.path.join(docenizer.SCRIPT_DIR, 'docenizer-hermes.py'))
+        pipeline.local_sources[0].path = spec
+        output = io.StringIO()
+        with redirect_stdout(output):
+            timings, count = pipeline.run(None, outputpath, os.path.dirname(spec))
+        return 'parse' in timings, count, output.getvalue()
+
+    def test_unchanged_inputs_are_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            spec = os.path.join(tmp, 'IR.md')
+            shutil.copy(os.path.join(benchmark.FIXTURES_DIR, 'hermes', 'IR.md'), spec)
+            outputpath = os.path.join(tmp, 'asm-docs-hermes.ts')
+            parsed, count, _ = self.run_hermes(spec, outputpath)
+            self.assertTrue(parsed)
+            self.assertEqual(self.run_hermes(spec, outputpath), (False, count, f"{outputpath} is up to date\n"))
+            with open(spec, 'a', encoding='utf-8') as f:
+                f.write('\n## NewInst\n\nNewInst | _\n--- | ---\nDescription | A new instruction.\n')
+            parsed, changed_count, _ = self.run_hermes(spec, outputpath)
+            self.assertTrue(parsed)
+            self.assertEqual(changed_count, count + 1)
+            os.remove(outputpath)
+            self.assertTrue(self.run_hermes(spec, outputpath)[0])
+
+
+class OutputRegressionTests(unittest.TestCase):
+    """Runs every docenizer on its fixtures, comparing the output against test/baselines.json."""
+
+    def test_fixtures(self):
+        baselines = benchmark.load_baselines()
+        with open(os.devnull, 'w') as log:
+            for arch in benchmark.fixture_archs():
+                with self.subTest(arch=arch):
+                    self.assertIn(arch, baselines)
+                    result = benchmark.benchmark(arch, 1, log)
+                    self.assertEqual(result['instructions'], baselines[arch]['instructions'])
+                    self.assertEqual(result['sha256'], baselines[arch]['sha256'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Full-text search index over the generated instruction docs.
+
+Every docenizer run, including the TypeScript ones run by docenizer-all.py,
+writes one segment per architecture next to the generated docs, lib/asm-docs/generated/asm-docs-search-<arch>.ts, holding an inverted
+index of the tokenized and stemmed tooltip and html of its instructions. A
+segment is only rebuilt when the instructions it was built from changed.
+asm-docs-search.ts lists all segments; lib/asm-docs/search.ts loads them on
+the first query and ranks the matches with BM25. The tokenizer and stemmer
+here must stay in sync with the ones in lib/asm-docs/search.ts.
+
+Run directly to query the index, or with --from-generated to rebuild the
+segments from the generated docs already on disk.
+"""
+import argparse
+import glob
+import hashlib
+import html
+import json
+import math
+import os
+import re
+import sys
+import threading
+
+import bundle
+from docenizer import GENERATED_DIR, Instruction
+
+SEGMENT_PREFIX = 'asm-docs-search-'
+MANIFEST_NAME = 'asm-docs-search.ts'
+# Bump whenever the tokenizer, the stemmer or the segment layout changes.
+INDEX_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TAG_RE = re.compile(r'<[^>]*>')
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+STOP_WORDS = frozenset("""
+a an and are as at be by for from if in into is it its of on or that the then this to was when which with
+""".split())
+SEGMENT_RE = re.compile(r'^const segment: SearchSegment = (.*);$', re.MULTILINE)
+SEGMENT_HEADER = """import {SearchSegment} from '../search.js';
+
+"""
+MANIFEST_HEADER = """import {SearchSegment} from '../search.js';
+
+export const SEARCH_SEGMENTS: Record<string, () => Promise<{default: SearchSegment}>> = {
+"""
+
+_manifest_lock = threading.Lock()
+
+
+def stem(word):
+    """A light suffix stripper: plurals, -ing, -ed and a final e."""
+    if len(word) <= 3 or not word.isalpha():
+        return word
+    if word.endswith('ies') and len(word) > 4:
+        word = word[:-3] + 'y'
+    elif word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+    for suffix in ('ing', 'ed'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            if word[-1] == word[-2] and word[-1] not in 'lsz':
+                word = word[:-1]
+            break
+    if word.endswith('e') and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    text = html.unescape(TAG_RE.sub(' ', text)).lower()
+    return [stem(token) for token in TOKEN_RE.findall(text) if token not in STOP_WORDS]
+
+
+def instructions_hash(instructions):
+    digest = hashlib.sha1(str(INDEX_VERSION).encode())
+    for inst in instructions:
+        digest.update(json.dumps([inst.names, inst.tooltip, inst.body]).encode())
+    return digest.hexdigest()
+
+
+def build_segment(instructions, digest):
+    """Builds the index of one architecture.
+
+    `docs` holds the [opcode, tooltip] of each instruction, `lengths` their
+    token counts and `postings` maps each term to a flat [doc, tf, doc, tf...]
+    list.
+    """
+    docs, lengths, postings = [], [], {}
+    for doc, inst in enumerate(instructions):
+        tokens = tokenize(' '.join(inst.names)) + tokenize(inst.tooltip) + tokenize(inst.body)
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for term, tf in counts.items():
+            postings.setdefault(term, []).extend((doc, tf))
+        docs.append([inst.names[0], inst.tooltip])
+        lengths.append(len(tokens))
+    return {'hash': digest, 'docs': docs, 'lengths': lengths, 'postings': postings}
+
+
+def segment_path(directory, arch):
+    return os.path.join(directory, f'{SEGMENT_PREFIX}{arch}.ts')
+
+
+def read_segment(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            match = SEGMENT_RE.search(f.read())
+    except OSError:
+        return None
+    return json.loads(match.group(1)) if match else None
+
+
+def write_segment(arch, instructions, directory):
+    """Writes the segment of `arch`, unless it is already up to date. Returns whether it was written."""
+    path = segment_path(directory, arch)
+    digest = instructions_hash(instructions)
+    existing = read_segment(path)
+    if existing is not None and existing['hash'] == digest:
+        print(f"Search index for {arch} is up to date")
+        return False
+    segment = build_segment(instructions, digest)
+    print(f"Writing search index for {arch}: {len(segment['postings'])} terms")
+    partial = f'{path}.{os.getpid()}.{threading.get_ident()}'
+    with open(partial, 'w', encoding='utf-8') as f:
+        f.write(SEGMENT_HEADER)
+        f.write(f'const segment: SearchSegment = {json.dumps(segment, separators=(",", ":"), ensure_ascii=False)};\n')
+        f.write('export default segment;\n')
+    os.replace(partial, path)
+    write_manifest(directory)
+    return True
+
+
+def segment_archs(directory):
+    prefix = os.path.join(directory, SEGMENT_PREFIX)
+    return sorted(path[len(prefix):-len('.ts')] for path in glob.glob(f'{prefix}*.ts'))
+
+
+def write_manifest(directory):
+    with _manifest_lock:
+        path = os.path.join(directory, MANIFEST_NAME)
+        with open(f'{path}.{os.getpid()}', 'w', encoding='utf-8') as f:
+            f.write(MANIFEST_HEADER)
+            for arch in segment_archs(directory):
+                f.write(f"    '{arch}': () => import('./{SEGMENT_PREFIX}{arch}.js'),\n")
+            f.write('};\n')
+        os.replace(f'{path}.{os.getpid()}', path)
+
+
+class SearchIndex(object):
+    """The segments of `directory`, queried with BM25 over all architectures."""
+
+    def __init__(self, directory=GENERATED_DIR):
+        self.segments = {arch: read_segment(segment_path(directory, arch)) for arch in segment_archs(directory)}
+        self.doc_count = sum(len(segment['docs']) for segment in self.segments.values())
+        total_length = sum(sum(segment['lengths']) for segment in self.segments.values())
+        self.average_length = total_length / self.doc_count if self.doc_count else 0
+
+    def search(self, query, arch=None, limit=10):
+        """Returns up to `limit` (score, arch, opcode, tooltip) tuples, best first."""
+        if arch and arch not in self.segments:
+            raise ValueError(f"No search index for '{arch}'")
+        terms = set(tokenize(query))
+        segments = {arch: self.segments[arch]} if arch else self.segments
+        scores = {}
+        for term in terms:
+            postings = {a: s['postings'][term] for a, s in self.segments.items() if term in s['postings']}
+            df = sum(len(p) // 2 for p in postings.values())
+            if not df:
+                continue
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            for a, p in postings.items():
+                if a not in segments:
+                    continue
+                lengths = segments[a]['lengths']
+                for i in range(0, len(p), 2):
+                    doc, tf = p[i], p[i + 1]
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc] / self.average_length)
+                    scores[(a, doc)] = scores.get((a, doc), 0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(score, a, *self.segments[a]['docs'][doc]) for (a, doc), score in best]
+
+
+def read_generated(path):
+    """Reads back the instructions of a generated asm-docs-<arch>.ts, of a Python or TypeScript docenizer."""
+    records, _ = bundle.read_records(path)
+    return [Instruction(names[0], names, record.get('tooltip', ''), record.get('html', ''), record.get('url', ''))
+            for names, record in records]
+
+
+def index_generated(directory, archs=None):
+    """Writes the segments of `archs`, default all, from their generated docs in `directory`."""
+    for arch in bundle.generated_archs(directory):
+        if archs is not None and arch not in archs:
+            continue
+        instructions = read_generated(os.path.join(directory, f'asm-docs-{arch}.ts'))
+        if instructions:
+            write_segment(arch, instructions, directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Queries the search index over the generated instruction docs')
+    parser.add_argument('query', nargs='?', help='Words to search for')
+    parser.add_argument('-a', '--arch', type=str, help='Only return instructions of this architecture')
+    parser.add_argument('-n', '--limit', type=int, default=10, help='Number of results. Default is 10')
+    parser.add_argument('-g', '--generated', type=str, default=GENERATED_DIR,
+                        help='Folder of the generated docs. Default is lib/asm-docs/generated/')
+    parser.add_argument('--from-generated', action='store_true',
+                        help='Rebuild the segments from the generated docs instead of running the docenizers')
+    args = parser.parse_args()
+    if args.from_generated:
+        index_generated(args.generated)
+    if args.query:
+        try:
+            results = SearchIndex(args.generated).search(args.query, args.arch, args.limit)
+        except ValueError as e:
+            sys.exit(str(e))
+        for score, arch, opcode, tooltip in results:
+            print(f"{score:6.2f}  {arch:8}  {opcode:12}  {tooltip[:80]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023, Compiler Explorer Authors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""What changes for the server between two config trees.
+
+Both trees are resolved as configsnapshot.py does, and compared compiler by
+compiler: added, removed, moved to other groups, and changed effective
+properties, exe first. The language-level properties other than the compiler
+lists are compared too.
+
+Each tree is either a folder, or a git revision of the folder, e.g. HEAD~3 or
+origin/main, when there is no such folder. The files of revisions are read
+with one `git cat-file --batch`, without a checkout, and those with the same
+blob in both are only parsed once.
+"""
+import argparse
+import io
+import os
+import subprocess
+import sys
+from collections import Counter
+
+import configsnapshot
+from configgraph import ConfigFile, ConfigTree, PLATFORM
+
+# Longer values are cut in the report.
+MAX_VALUE_LENGTH = 80
+
+
+def git_blobs(folder: str, revision: str):
+    """The blob ids of the properties files of `folder` at `revision`, by name."""
+    listing = subprocess.run(['git', 'ls-tree', '-z', revision, '.'], cwd=folder, capture_output=True,
+                             check=True).stdout
+    blobs = {}
+    for entry in listing.split(b'\0'):
+        info, _, path = entry.partition(b'\t')
+        name = os.path.basename(path.decode('utf-8'))
+        if name.endswith('.properties') and info.split(b' ')[1:2] == [b'blob']:
+            blobs[name] = info.split(b' ')[2].decode()
+    return blobs
+
+
+def read_blobs(folder: str, blobs):
+    """The contents of the `blobs` ids, read with one `git cat-file --batch`."""
+    output = subprocess.run(['git', 'cat-file', '--batch'], cwd=folder, input=''.join(f'{blob}\n' for blob in blobs)
+                            .encode(), capture_output=True, check=True).stdout
+    contents, position = {}, 0
+    for blob in blobs:
+        header_end = output.index(b'\n', position)
+        size = int(output[position:header_end].split(b' ')[2])
+        contents[blob] = output[header_end + 1:header_end + 1 + size]
+        position = header_end + 1 + size + 1
+    return contents
+
+
+def is_revision(source):
+    return source is not None and not os.path.isdir(source)
+
+
+def load_trees(folder: str, sources):
+    """The `ConfigTree` of each of `sources`: `folder` for None, another folder, or a git revision of `folder`."""
+    blobs = {source: git_blobs(folder, source) for source in sources if is_revision(source)}
+    needed = sorted({blob for files in blobs.values() for blob in files.values()})
+    contents = read_blobs(folder, needed) if needed else {}
+    parsed = {}
+    trees = []
+    for source in sources:
+        if not is_revision(source):
+            trees.append(ConfigTree(source or folder))
+            continue
+        files = {}
+        for name, blob in blobs[source].items():
+            if (name, blob) not in parsed:
+                text = io.StringIO(contents[blob].decode('utf-8'), newline=None)
+                parsed[(name, blob)] = ConfigFile(name, text)
+            files[name] = parsed[(name, blob)]
+        trees.append(ConfigTree(folder, files))
+    return trees
+
+
+def shorten(value):
+    if value is None:
+        return '(unset)'
+    return value if len(value) <= MAX_VALUE_LENGTH else f'{value[:MAX_VALUE_LENGTH - 3]}...'
+
+
+def property_changes(old, new, first=()):
+    """Describes the properties which differ between `old` and `new`, `first` ones first."""
+    keys = sorted(key for key in set(old) | set(new) if old.get(key) != new.get(key))
+    keys.sort(key=lambda key: key not in first)
+    return [f"{key}: {shorten(old.get(key))} -> {shorten(new.get(key))}" for key in keys]
+
+
+def groups_text(groups):
+    return f"group {' in '.join(groups)}" if groups else 'no group'
+
+
+def diff(old, new):
+    """The changes from snapshot `old` to `new`, as (lang, mark, text) sorted by language.
+
+    `mark` is + for an added compiler, - for a removed one and ~ for a change.
+    """
+    changes = []
+    for name in sorted(set(old['compilers']) | set(new['compilers'])):
+        before, after = old['compilers'].get(name), new['compilers'].get(name)
+        if before == after:
+            continue
+        if before is None:
+            changes.append((after['lang'], '+', f"{name} ({groups_text(after['groups'])})"))
+        elif after is None:
+            changes.append((before['lang'], '-', f"{name} ({groups_text(before['groups'])})"))
+        else:
+            if before['lang'] != after['lang']:
+                changes.append((after['lang'], '~', f"{name}: moved from language {before['lang']}"))
+            if before['groups'] != after['groups']:
+                changes.append((after['lang'], '~', f"{name}: moved from {groups_text(before['groups'])} "
+                                                    f"to {groups_text(after['groups'])}"))
+            for change in property_changes(before['properties'], after['properties'], first=('exe',)):
+                changes.append((after['lang'], '~', f"{name}: {change}"))
+    for lang in sorted(set(old['languages']) | set(new['languages'])):
+        # Changes of the compiler lists are already told compiler by compiler.
+        before = {k: v for k, v in old['languages'].get(lang, {}).get('properties', {}).items() if k != 'compilers'}
+        after = {k: v for k, v in new['languages'].get(lang, {}).get('properties', {}).items() if k != 'compilers'}
+        changes.extend((lang, '~', change) for change in property_changes(before, after))
+        before = set(old['languages'].get(lang, {}).get('remotes', []))
+        after = set(new['languages'].get(lang, {}).get('remotes', []))
+        changes.extend((lang, '+', f'remote {remote}') for remote in sorted(after - before))
+        changes.extend((lang, '-', f'remote {remote}') for remote in sorted(before - after))
+    changes.sort(key=lambda change: change[0])
+    return changes
+
+
+def print_diff(changes):
+    counts = Counter((lang, mark) for lang, mark, _ in changes)
+    lang = None
+    for change_lang, mark, text in changes:
+        if change_lang != lang:
+            lang = change_lang
+            print(f"{lang}: {counts[lang, '+']} added, {counts[lang, '-']} removed, {counts[lang, '~']} changed")
+        print(f"  {mark} {text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shows what changes for the server between two config trees')
+    parser.add_argument('old', help='Git revision of the folder to compare from, or another folder')
+    parser.add_argument('new', nargs='?',
+                        help='Git revision of the folder to compare to, or another folder. Default is the folder')
+    parser.add_argument('--folder', default='./etc/config/',
+                        help='Folder of the properties files. Default is ./etc/config/')
+    parser.add_argument('-e', '--env', type=str, nargs='+', default=configsnapshot.DEFAULT_ENVIRONMENT,
+                        help=f"Environments to resolve for. Default is {' '.join(configsnapshot.DEFAULT_ENVIRONMENT)}")
+    parser.add_argument('--platform', type=str, default=PLATFORM,
+                        help=f'Platform to resolve for. Default is {PLATFORM}')
+    args = parser.parse_args()
+
+    try:
+        trees = load_trees(args.folder, [args.old, args.new])
+    except subprocess.CalledProcessError as e:
+        sys.exit(f"Could not read {args.folder} with git: {e.stderr.decode().strip()}")
+    old, new = (configsnapshot.resolve(tree.view(args.env, args.platform)) for tree in trees)
+    changes = diff(old, new)
+    print_diff(changes)
+    if not changes:
+        print('No changes')
+
+
+if __name__ == '__main__':
+    main()
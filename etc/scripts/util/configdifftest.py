@@ -0,0 +1,61 @@
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+import configdiff
+import configsnapshot
+from configgraph import ConfigTree
+
+
+class ConfigDiffTests(unittest.TestCase):
+    def setUp(self):
+        base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.folder = os.path.join(self.tmp.name, 'config')
+        self.fixtures = os.path.join(base_path, 'test', 'tree')
+        shutil.copytree(self.fixtures, self.folder)
+
+    def snapshots(self, old, new):
+        trees = configdiff.load_trees(self.folder, [old, new])
+        return [configsnapshot.resolve(tree.view(['amazon'])) for tree in trees]
+
+    def test_changes(self):
+        changed = os.path.join(self.tmp.name, 'changed')
+        shutil.copytree(self.folder, changed)
+        with open(os.path.join(changed, 'lang.amazon.properties'), 'a') as f:
+            f.write('group.gcc.compilers=g1\n'
+                    'group.inner.compilers=n1:g1:g2\n'
+                    'compiler.g1.exe=/opt/compiler-explorer/g1-new/bin/gcc\n'
+                    'compiler.n1.name=N1\n'
+                    'tools=\n')
+        old, new = self.snapshots(None, changed)
+        self.assertEqual(configdiff.diff(old, new), [
+            ('lang', '~', 'g1: exe: /opt/compiler-explorer/g1/bin/gcc -> /opt/compiler-explorer/g1-new/bin/gcc'),
+            ('lang', '~', 'g2: moved from group gcc to group inner in nested'),
+            ('lang', '~', 'g2: instructionSet: amd64 -> (unset)'),
+            ('lang', '~', 'n1: name: (unset) -> N1'),
+            ('lang', '~', 'tools: ltool -> '),
+        ])
+        self.assertEqual(configdiff.diff(new, new), [])
+
+    def test_revisions(self):
+        def git(*args):
+            subprocess.run(['git', *args], cwd=self.folder, check=True, capture_output=True)
+
+        git('init', '-q')
+        git('add', '.')
+        git('-c', 'user.name=test', '-c', 'user.email=test@example.org', 'commit', '-q', '-m', 'tree')
+        with open(os.path.join(self.folder, 'lang.amazon.properties'), 'a') as f:
+            f.write('group.gcc.compilers=g1:g2:g3\n')
+        old, new = self.snapshots('HEAD', None)
+        self.assertEqual(configdiff.diff(old, new), [('lang', '+', 'g3 (group gcc)')])
+        self.assertEqual(configdiff.diff(*self.snapshots('HEAD', 'HEAD')), [])
+        self.assertEqual(old, configsnapshot.resolve(ConfigTree(self.fixtures).view(['amazon'])))
+
+
+if __name__ == '__main__':
+    unittest.main()
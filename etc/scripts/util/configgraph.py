@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023, Compiler Explorer Authors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Model of the whole config tree, checked across files and layers.
+
+propscheck.py checks each file on its own and skips the defaults and local
+ones. Here every file of the tree is loaded, and the files of each language
+are layered the way the server does (lib/properties.ts, with the hierarchy of
+app.ts): defaults, then the environments, then local. The compiler list of
+each language is then resolved, following &group references into whichever
+file defines the group.
+
+A view of the tree under one hierarchy indexes which file defines each
+compiler, group, tool, library and formatter, and who references each of
+them, so both are a dict lookup. `find_problems` checks the views of all the
+environments we deploy, as something only used by one of them, e.g. the gpu
+groups of c++.amazon.properties, is fine.
+"""
+import argparse
+import sys
+from collections import namedtuple
+from os import listdir
+from os.path import join
+
+from propscheck import DISABLED_PREFIX, disabled_ids
+
+PLATFORM = 'linux'
+# The environments, and their platform, of the instances we run and of `make dev`.
+DEFAULT_ENVIRONMENTS = [
+    (('dev',), 'linux'),
+    (('dev',), 'win32'),
+    (('amazon',), 'linux'),
+    (('amazon', 'beta'), 'linux'),
+    (('amazon', 'staging'), 'linux'),
+    (('amazon', 'gpu'), 'linux'),
+]
+# What the properties `<segment>.<name>.*` define.
+DEFINITION_KINDS = {
+    'compiler': 'compiler',
+    'group': 'group',
+    'tools': 'tool',
+    'libs': 'lib',
+    'formatter': 'formatter',
+}
+# Language-level lists, and the kind of what they list. `compilers` is resolved separately.
+LIST_KINDS = {
+    'tools': 'tool',
+    'libs': 'lib',
+    'formatters': 'formatter',
+}
+
+# A property as the server sees it: its value, and where that value is set.
+Property = namedtuple('Property', 'value file line')
+# A reference to a compiler, group, etc., by `referrer`: a language, or a group of one.
+Reference = namedtuple('Reference', 'lang referrer file line')
+# A compiler reached from the compiler list of `lang`, through `groups`, innermost first.
+ResolvedCompiler = namedtuple('ResolvedCompiler', 'lang id groups reference')
+
+
+def hierarchy(environments, platform: str = PLATFORM):
+    """The layers of the properties, lowest precedence first, as app.ts builds them less the hostname."""
+    return ['defaults', *environments, *(f'{env}.{platform}' for env in environments), platform, 'local']
+
+
+def split_list(value: str):
+    return [elem for elem in value.split(':') if elem]
+
+
+def location(item):
+    return f'{item.file}:{item.line}'
+
+
+class ConfigFile:
+    """A `<lang>.<layer>.properties` file, parsed as lib/properties.ts does."""
+
+    def __init__(self, name: str, lines):
+        self.name = name
+        self.lang, _, self.layer = name[:-len('.properties')].partition('.')
+        self.properties = {}
+        self.disabled = set()
+        for line_number, text in enumerate(lines, start=1):
+            if text.startswith(DISABLED_PREFIX):
+                self.disabled.update(disabled_ids(text.strip()))
+            text = text.split('#', 1)[0].strip().lstrip('=')
+            key, eq, value = text.partition('=')
+            if eq:
+                self.properties[key.strip()] = Property(value.strip(), name, line_number)
+
+
+class ConfigTree:
+    """All properties files of a folder, by language and layer.
+
+    With `files`, a dict of already parsed `ConfigFile`s by name, those are used
+    instead of reading the folder, e.g. for the files of a git revision.
+    """
+
+    def __init__(self, folder: str, files=None):
+        self.folder = folder
+        if files is None:
+            files = {}
+            for name in listdir(folder):
+                if name.endswith('.properties'):
+                    with open(join(folder, name), encoding='utf-8') as f:
+                        files[name] = ConfigFile(name, f)
+        self.files = {}
+        self.languages = {}
+        for name in sorted(files):
+            config = files[name]
+            self.files[name] = config
+            self.languages.setdefault(config.lang, {})[config.layer] = config
+
+    def layers(self, lang: str, layers):
+        """The files of `lang` in the hierarchy `layers`, lowest precedence first."""
+        files = self.languages.get(lang, {})
+        return [files[layer] for layer in layers if layer in files]
+
+    def view(self, environments, platform: str = PLATFORM):
+        return ConfigView(self, environments, platform)
+
+
+class ConfigView:
+    """The tree as the server sees it when run with `environments` on `platform`.
+
+    Each language's properties are layered in one pass over its files,
+    recording every file which defines something. Each compiler list is then
+    walked once, recording every reference. `definitions` maps
+    (kind, lang, name) to the properties defining it, one per file, and
+    `referrers` maps (kind, name) to the references to it from any language.
+    """
+
+    def __init__(self, tree: ConfigTree, environments, platform: str = PLATFORM):
+        self.tree = tree
+        self.environments = tuple(environments)
+        self.platform = platform
+        self.hierarchy = hierarchy(environments, platform)
+        self.properties = {}
+        self.overridden = {}
+        self.files = {}
+        self.disabled = {}
+        self.definitions = {}
+        self.referrers = {}
+        self.compilers = {}
+        self.language_compilers = {}
+        self.defines_compilers = set()
+        self.remotes = {}
+        self.problems = {}
+        for lang in tree.languages:
+            self.layer(lang)
+        for lang in self.properties:
+            self.resolve(lang)
+
+    def __str__(self):
+        return f"{' '.join(self.environments)} on {self.platform}"
+
+    def layer(self, lang: str):
+        files = self.tree.layers(lang, self.hierarchy)
+        if not files:
+            return
+        properties, overridden, disabled = {}, {}, set()
+        for config in files:
+            disabled |= config.disabled
+            for key, prop in config.properties.items():
+                if key in properties:
+                    overridden.setdefault(key, []).append(properties[key])
+                properties[key] = prop
+                segment, _, rest = key.partition('.')
+                kind = DEFINITION_KINDS.get(segment)
+                name, dot, _ = rest.partition('.')
+                if kind and dot:
+                    if kind == 'compiler':
+                        self.defines_compilers.add(lang)
+                    defined = self.definitions.setdefault((kind, lang, name), [])
+                    if not defined or defined[-1].file != config.name:
+                        defined.append(prop)
+        self.properties[lang] = properties
+        self.overridden[lang] = overridden
+        self.files[lang] = files
+        self.disabled[lang] = disabled
+
+    def get(self, lang: str, key: str):
+        """The property `key` of `lang`, or None."""
+        return self.properties.get(lang, {}).get(key)
+
+    def refer(self, kind: str, name: str, reference: Reference):
+        self.referrers.setdefault((kind, name), []).append(reference)
+
+    def problem(self, kind: str, where, text: str):
+        self.problems.setdefault(kind, []).append((location(where), text))
+
+    def resolve(self, lang: str):
+        compilers = self.get(lang, 'compilers')
+        if compilers:
+            self.walk(lang, compilers, lang, ())
+        for key, kind in LIST_KINDS.items():
+            listed = self.get(lang, key)
+            if listed is None:
+                continue
+            for name in split_list(listed.value):
+                self.refer(kind, name, Reference(lang, lang, listed.file, listed.line))
+                if (kind, lang, name) not in self.definitions:
+                    self.problem(f'undefined_{kind}s', listed, f'{name} in {lang}')
+
+    def walk(self, lang: str, listed: Property, referrer: str, groups):
+        """Follows the compiler list `listed` of `referrer`, `groups` being the groups it is nested in."""
+        reference = Reference(lang, referrer, listed.file, listed.line)
+        for name in split_list(listed.value):
+            if '@' in name:
+                self.remotes.setdefault(name, []).append(reference)
+            elif name.startswith('&'):
+                group = name[1:]
+                self.refer('group', group, reference)
+                if group in groups:
+                    self.problem('group_cycles', listed, f"&{group} in {lang}: {' -> '.join(reversed(groups))}")
+                    continue
+                group_compilers = self.get(lang, f'group.{group}.compilers')
+                if group_compilers is None:
+                    self.problem('undefined_groups', listed, f'&{group} in {lang}')
+                else:
+                    self.walk(lang, group_compilers, f'&{group}', (group,) + groups)
+            elif name != 'AWS':
+                self.refer('compiler', name, reference)
+                self.compilers.setdefault(name, []).append(ResolvedCompiler(lang, name, groups, reference))
+                self.language_compilers.setdefault(lang, []).append(name)
+                # A compiler without properties runs its id, which is how some defaults list a path or a
+                # command on the PATH. Only report ones in languages which otherwise define their compilers.
+                if ('compiler', lang, name) not in self.definitions and '/' not in name \
+                        and lang in self.defines_compilers:
+                    self.problem('undefined_compilers', listed, f'{name} in {lang}')
+
+    def compiler_ids(self, lang: str):
+        """The ids and aliases of the compilers of `lang`."""
+        ids = set()
+        for name in self.language_compilers.get(lang, ()):
+            ids.add(name)
+            alias = self.get(lang, f'compiler.{name}.alias')
+            if alias:
+                ids.update(split_list(alias.value))
+        return ids
+
+    def check(self):
+        """Adds the problems of the resolved compilers to those found while resolving them."""
+        for where, text in duplicate_compilers(self.compilers):
+            self.problem('duplicate_compilers', where, text)
+        for lang in self.language_compilers:
+            default = self.get(lang, 'defaultCompiler')
+            if default and default.value not in self.compiler_ids(lang):
+                self.problem('bad_default', default, f'{default.value} in {lang}')
+        return self.problems
+
+    def unreferenced(self):
+        """The definitions of this view which nothing references, as (kind, lang, name) keys."""
+        found = set()
+        for kind, lang, name in self.definitions:
+            if (kind, name) in self.referrers and any(ref.lang == lang for ref in self.referrers[(kind, name)]):
+                continue
+            if name not in self.disabled.get(lang, ()):
+                found.add((kind, lang, name))
+        return found
+
+
+def duplicate_compilers(compilers):
+    """The compilers resolved more than once in `compilers`, by id, as (where, text) for the second listing."""
+    for name, resolved in compilers.items():
+        if len(resolved) > 1:
+            places = ', '.join(f'{location(compiler.reference)} ({compiler.lang})' for compiler in resolved)
+            yield resolved[1].reference, f'{name} also listed at {places}'
+
+
+def find_problems(tree: ConfigTree, environments=None):
+    """Checks the views of `environments`, a list of (environments, platform) pairs, of `tree`."""
+    return view_problems([tree.view(envs, platform) for envs, platform in environments or DEFAULT_ENVIRONMENTS])
+
+
+def view_problems(views):
+    """Checks `views`, the tree as seen by each environment.
+
+    A definition is only reported as unreferenced if it is in none of the
+    views which include its file.
+    """
+    problems = {}
+    unreferenced = None
+    for view in views:
+        for kind, found in view.check().items():
+            for where, text in found:
+                problems.setdefault(kind, {}).setdefault((where, text), []).append(str(view))
+        found = {(kind, lang, name, prop.file, prop.line)
+                 for kind, lang, name in view.unreferenced()
+                 for prop in view.definitions[(kind, lang, name)]}
+        seen_files = {config.name for files in view.files.values() for config in files}
+        if unreferenced is None:
+            unreferenced, all_files = found, seen_files
+        else:
+            # Keep what this view leaves unreferenced, or cannot see at all.
+            unreferenced = {item for item in unreferenced if item in found or item[3] not in seen_files} | \
+                           {item for item in found if item[3] not in all_files}
+            all_files |= seen_files
+    for kind, lang, name, file, line in sorted(unreferenced or ()):
+        problems.setdefault(f'unreferenced_{kind}s', {})[(f'{file}:{line}', f'{name} in {lang}')] = []
+    return problems
+
+
+def print_problems(problems):
+    if not problems:
+        print("No cross-file configuration problems found")
+        return
+    print(f"Found {sum(map(len, problems.values()))} cross-file configuration problem(s):")
+    for kind, found in sorted(problems.items()):
+        print(f'{kind}:')
+        for (where, text), views in sorted(found.items()):
+            print(f"  {where}: {text}" + (f" ({'; '.join(views)})" if views else ''))
+    print("To suppress unreferenced warnings on IDs that are temporally disabled, "
+          "add one or more comments to a file of the language:")
+    print("# Disabled: id1 id2 ...")
+
+
+def print_uses(tree: ConfigTree, name: str, environments):
+    """Prints where `name` is defined and who references it, in each view."""
+    for envs, platform in environments:
+        view = tree.view(envs, platform)
+        print(f'## {view}')
+        for (kind, lang, defined), props in sorted(view.definitions.items()):
+            if defined == name:
+                print(f"  {kind} {name} of {lang} defined at {', '.join(map(location, props))}")
+        for kind in sorted(set(DEFINITION_KINDS.values())):
+            for ref in view.referrers.get((kind, name), []):
+                print(f"  {kind} {name} referenced by {ref.referrer} at {location(ref)}")
+        for ref in view.remotes.get(name, []):
+            print(f"  remote {name} referenced by {ref.referrer} at {location(ref)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Checks the references between the properties files of all layers')
+    parser.add_argument('folder', nargs='?', default='./etc/config/',
+                        help='Folder of the properties files. Default is ./etc/config/')
+    parser.add_argument('-e', '--env', type=str, nargs='+', action='append',
+                        help='Check the tree as run with these environments; can be given several times. '
+                             'Default is each environment we deploy')
+    parser.add_argument('--platform', type=str, default=PLATFORM,
+                        help=f'Platform of the environments given with --env. Default is {PLATFORM}')
+    parser.add_argument('--uses', type=str, metavar='NAME',
+                        help='Show where the compiler, group, tool, library or formatter NAME is defined and '
+                             'referenced instead of checking the tree')
+    args = parser.parse_args()
+    environments = [(tuple(envs), args.platform) for envs in args.env] if args.env else DEFAULT_ENVIRONMENTS
+    tree = ConfigTree(args.folder)
+    if args.uses:
+        print_uses(tree, args.uses, environments)
+        return
+    problems = find_problems(tree, environments)
+    print_problems(problems)
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import sys
+import os
+import unittest
+
+from configgraph import ConfigTree, find_problems
+
+ENVIRONMENTS = [(('dev',), 'linux'), (('amazon',), 'linux'), (('amazon', 'gpu'), 'linux')]
+
+
+class ConfigGraphTests(unittest.TestCase):
+    def setUp(self):
+        base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
+        self.tree = ConfigTree(os.path.join(base_path, 'test', 'tree'))
+
+    def test_layers(self):
+        view = self.tree.view(['amazon', 'gpu'])
+        self.assertEqual([config.name for config in view.files['lang']],
+                         ['lang.defaults.properties', 'lang.amazon.properties', 'lang.gpu.properties'])
+        self.assertEqual(view.get('lang', 'compilers').file, 'lang.gpu.properties')
+        self.assertEqual([prop.file for prop in view.overridden['lang']['compilers']],
+                         ['lang.defaults.properties', 'lang.amazon.properties'])
+        self.assertEqual(view.get('lang', 'tools').value, 'ltool')
+
+    def test_groups_across_files(self):
+        view = self.tree.view(['amazon', 'gpu'])
+        self.assertEqual([(c.lang, c.groups) for c in view.compilers['gpu1']], [('lang', ('gpu',))])
+        self.assertEqual([(ref.referrer, ref.file) for ref in view.referrers[('group', 'gpu')]],
+                         [('lang', 'lang.gpu.properties')])
+        self.assertEqual([prop.file for prop in view.definitions[('group', 'lang', 'gpu')]],
+                         ['lang.amazon.properties'])
+
+    def test_nested_groups(self):
+        view = self.tree.view(['amazon'])
+        self.assertEqual([c.groups for c in view.compilers['n1']], [('inner', 'nested')])
+        self.assertEqual([ref.referrer for ref in view.referrers[('compiler', 'g1')]], ['&gcc', '&inner'])
+        self.assertEqual(list(view.remotes), ['www.example.org@443'])
+
+    def test_problems(self):
+        problems = find_problems(self.tree, ENVIRONMENTS)
+        self.assertEqual(sorted(problems), ['duplicate_compilers', 'group_cycles', 'undefined_groups',
+                                            'unreferenced_compilers'])
+        self.assertEqual(sorted(text.split()[0] for _, text in problems['duplicate_compilers']), ['g1', 'g2'])
+        self.assertEqual(list(problems['undefined_groups']), [('lang.amazon.properties:11', '&missing in lang')])
+        self.assertEqual(list(problems['group_cycles']), [('lang.amazon.properties:21', '&loop in lang: loop')])
+        self.assertEqual(list(problems['unreferenced_compilers']), [('lang.amazon.properties:19', 'orphan in lang')])
+
+    def test_unreferenced_in_one_environment(self):
+        problems = find_problems(self.tree, [(('amazon',), 'linux')])
+        self.assertIn(('lang.amazon.properties:16', 'gpu1 in lang'), problems['unreferenced_compilers'])
+        self.assertNotIn(('lang.amazon.properties:18', 'disabledc in lang'), problems['unreferenced_compilers'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023, Compiler Explorer Authors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Pre-resolved snapshot of the config tree under one hierarchy.
+
+The server layers every properties file and walks the compiler lists and
+their groups on each start. This does the same once, with the model of
+configgraph.py, and writes the result as a single JSON file:
+
+- `languages` has, for each language (and for compiler-explorer, aws...),
+  its layered properties other than the compiler. and group. ones, the ids
+  of its compilers in list order and its remote host@port entries.
+- `compilers` has, for each compiler, its language, its groups (innermost
+  first) and its effective properties: those of its outermost group,
+  overridden by each inner group and then by its own. Anything else falls
+  back to its language, as in CompilerFinder.compilerConfigFor. The groups'
+  own compiler lists are left out.
+
+Values are kept as written; the server converts them as it does on load.
+`hash` is the sha256 of the rest of the snapshot, serialized canonically, so
+`--check` can tell both a corrupted snapshot and one which no longer
+matches the tree.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from configgraph import ConfigTree, PLATFORM
+
+SNAPSHOT_VERSION = 1
+DEFAULT_ENVIRONMENT = ['amazon']
+
+
+def canonical(content):
+    return json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def split_properties(properties):
+    """Splits layered properties into the language's own ones and those of each compiler and group.
+
+    Returns the former and a dict of the latter, by (kind, name), without their prefix.
+    """
+    own, defined = {}, {}
+    for key, prop in properties.items():
+        segment, _, rest = key.partition('.')
+        if segment in ('compiler', 'group'):
+            name, dot, property_name = rest.partition('.')
+            if dot:
+                defined.setdefault((segment, name), {})[property_name] = prop.value
+                continue
+        own[key] = prop.value
+    return own, defined
+
+
+def resolve(view):
+    """The snapshot content of a `ConfigView`. Compilers listed more than once keep their first listing."""
+    languages, compilers, defined = {}, {}, {}
+    for lang, properties in view.properties.items():
+        own, defined[lang] = split_properties(properties)
+        languages[lang] = {
+            'properties': own,
+            'compilers': list(dict.fromkeys(view.language_compilers.get(lang, []))),
+            'remotes': sorted(name for name, refs in view.remotes.items() if any(ref.lang == lang for ref in refs)),
+        }
+    for name, resolved in view.compilers.items():
+        compiler = resolved[0]
+        effective = {}
+        for group in reversed(compiler.groups):
+            effective.update(defined[compiler.lang].get(('group', group), {}))
+        effective.pop('compilers', None)
+        effective.update(defined[compiler.lang].get(('compiler', name), {}))
+        compilers[name] = {'lang': compiler.lang, 'groups': list(compiler.groups), 'properties': effective}
+    return {
+        'version': SNAPSHOT_VERSION,
+        'hierarchy': view.hierarchy,
+        'languages': languages,
+        'compilers': compilers,
+    }
+
+
+def build(folder: str, environments, platform: str = PLATFORM):
+    """Returns the snapshot of the tree in `folder`, with its hash."""
+    content = resolve(ConfigTree(folder).view(environments, platform))
+    return {'hash': hashlib.sha256(canonical(content)).hexdigest(), **content}
+
+
+def write(snapshot, path: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = canonical(snapshot)
+    with open(f'{path}.{os.getpid()}', 'wb') as f:
+        f.write(data)
+    os.replace(f'{path}.{os.getpid()}', path)
+    return len(data)
+
+
+def differences(snapshot, live):
+    """Describes how the content of `snapshot` differs from `live`, one line per language or compiler."""
+    problems = []
+    expected = {k: v for k, v in snapshot.items() if k != 'hash'}
+    if hashlib.sha256(canonical(expected)).hexdigest() != snapshot.get('hash'):
+        problems.append('the snapshot does not match its own hash')
+    for section in ('version', 'hierarchy'):
+        if snapshot.get(section) != live[section]:
+            problems.append(f"{section} is {snapshot.get(section)}, live resolution gives {live[section]}")
+    for section in ('languages', 'compilers'):
+        mine, theirs = snapshot.get(section, {}), live[section]
+        for name in sorted(set(mine) | set(theirs)):
+            if name not in theirs:
+                problems.append(f"{section[:-1]} {name} is no longer in the tree")
+            elif name not in mine:
+                problems.append(f"{section[:-1]} {name} is missing from the snapshot")
+            elif mine[name] != theirs[name]:
+                changed = sorted(key for key in set(mine[name]) | set(theirs[name])
+                                 if mine[name].get(key) != theirs[name].get(key))
+                problems.append(f"{section[:-1]} {name} differs in {', '.join(changed)}")
+    return problems
+
+
+def check(path: str, folder: str, environments, platform: str = PLATFORM):
+    """Returns the differences between the snapshot at `path` and the live resolution of the tree."""
+    with open(path, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    live = build(folder, environments, platform)
+    if snapshot.get('hash') == live['hash'] and snapshot == live:
+        return []
+    return differences(snapshot, live) or ['the snapshot differs from live resolution']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Writes the config tree resolved for one environment as a snapshot')
+    parser.add_argument('folder', nargs='?', default='./etc/config/',
+                        help='Folder of the properties files. Default is ./etc/config/')
+    parser.add_argument('-e', '--env', type=str, nargs='+', default=DEFAULT_ENVIRONMENT,
+                        help=f"Environments to resolve for. Default is {' '.join(DEFAULT_ENVIRONMENT)}")
+    parser.add_argument('--platform', type=str, default=PLATFORM,
+                        help=f'Platform to resolve for. Default is {PLATFORM}')
+    parser.add_argument('-o', '--output', type=str,
+                        help='Snapshot file. Default is out/config-snapshot.<environments>.json')
+    parser.add_argument('--check', action='store_true',
+                        help='Check that the snapshot file matches the tree instead of writing it')
+    args = parser.parse_args()
+    output = args.output or os.path.join('out', f"config-snapshot.{'.'.join(args.env)}.json")
+    if args.check:
+        problems = check(output, args.folder, args.env, args.platform)
+        for problem in problems[:50]:
+            print(problem)
+        if problems:
+            print(f"{output} does not match {args.folder}: {len(problems)} difference(s)")
+            sys.exit(1)
+        print(f"{output} matches {args.folder}")
+        return
+    snapshot = build(args.folder, args.env, args.platform)
+    size = write(snapshot, output)
+    print(f"Wrote {len(snapshot['compilers'])} compilers of {len(snapshot['languages'])} languages to {output} "
+          f"({size // 1024}KiB, {snapshot['hash'][:12]})")
+
+
+if __name__ == '__main__':
+    main()
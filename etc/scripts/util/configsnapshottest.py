@@ -0,0 +1,58 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import configsnapshot
+
+
+class ConfigSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
+        self.folder = os.path.join(base_path, 'test', 'tree')
+
+    def test_resolved(self):
+        snapshot = configsnapshot.build(self.folder, ['amazon'])
+        self.assertEqual(snapshot['languages']['lang']['compilers'], ['g1', 'g2', 'n1'])
+        self.assertEqual(snapshot['languages']['lang']['remotes'], ['www.example.org@443'])
+        self.assertEqual(snapshot['languages']['lang']['properties']['tools'], 'ltool')
+        self.assertNotIn('group.gcc.compilers', snapshot['languages']['lang']['properties'])
+        self.assertEqual(snapshot['compilers']['g1'], {
+            'lang': 'lang',
+            'groups': ['gcc'],
+            'properties': {'instructionSet': 'amd64', 'exe': '/opt/compiler-explorer/g1/bin/gcc'},
+        })
+        self.assertEqual(snapshot['compilers']['n1']['groups'], ['inner', 'nested'])
+
+    def test_environment(self):
+        snapshot = configsnapshot.build(self.folder, ['amazon', 'gpu'])
+        self.assertEqual(snapshot['hierarchy'][:3], ['defaults', 'amazon', 'gpu'])
+        self.assertEqual(snapshot['languages']['lang']['compilers'], ['gpu1'])
+        self.assertEqual(snapshot['languages']['lang']['properties']['defaultCompiler'], 'gpu1')
+
+    def test_check(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, 'config')
+            shutil.copytree(self.folder, folder)
+            path = os.path.join(tmp, 'snapshot.json')
+            configsnapshot.write(configsnapshot.build(folder, ['amazon']), path)
+            self.assertEqual(configsnapshot.check(path, folder, ['amazon']), [])
+            self.assertNotEqual(configsnapshot.check(path, folder, ['amazon', 'gpu']), [])
+
+            with open(os.path.join(folder, 'lang.amazon.properties'), 'a') as f:
+                f.write('compiler.g2.name=GCC 2\n')
+            self.assertEqual(configsnapshot.check(path, folder, ['amazon']), ['compiler g2 differs in properties'])
+
+            with open(path) as f:
+                snapshot = json.load(f)
+            snapshot['compilers']['g2']['properties']['name'] = 'GCC 2'
+            with open(path, 'w') as f:
+                json.dump(snapshot, f)
+            self.assertEqual(configsnapshot.check(path, folder, ['amazon']),
+                             ['the snapshot does not match its own hash'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023, Compiler Explorer Authors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Checks the config tree again each time a properties file is saved.
+
+The tree is read once, and kept in memory: the propscheck.py result of each
+file, its parse for configgraph.py, and the cross-file problems and resolved
+compilers of each language. When a file changes, only it is read again and
+checked by propscheck, and only its language, whose other layers are the files
+which can reference what it defines, is checked across files again. Compilers
+listed in two languages are found by merging the resolved compilers kept for
+each language.
+
+Changes are watched with inotify, or by polling the folder where it is not
+available, and a burst of them, as editors make when saving, is checked once.
+"""
+import argparse
+import ctypes
+import io
+import os
+import select
+import struct
+import time
+from os.path import join
+
+import propscheck
+from configgraph import ConfigFile, ConfigTree, DEFAULT_ENVIRONMENTS, PLATFORM, duplicate_compilers, location, \
+    view_problems
+
+# Changes this close to each other are checked together.
+SETTLE_SECONDS = 0.01
+POLL_SECONDS = 0.25
+
+IN_CLOEXEC = 0o2000000
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+def properties_names(folder: str):
+    return {entry.name for entry in os.scandir(folder) if entry.name.endswith('.properties') and entry.is_file()}
+
+
+class InotifyWatcher:
+    """The changes of the properties files of a folder, from inotify."""
+    name = 'inotify'
+
+    def __init__(self, folder: str):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        mask = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(self.fd, os.fsencode(folder), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed on {folder}')
+
+    def read(self, changed: set):
+        """Adds the properties files of the pending events to `changed`. Returns False if events were lost."""
+        data = os.read(self.fd, 64 * 1024)
+        position = 0
+        while position < len(data):
+            _, mask, _, length = INOTIFY_EVENT.unpack_from(data, position)
+            position += INOTIFY_EVENT.size
+            name = data[position:position + length].rstrip(b'\0').decode('utf-8', errors='replace')
+            position += length
+            if mask & IN_Q_OVERFLOW:
+                return False
+            if name.endswith('.properties'):
+                changed.add(name)
+        return True
+
+    def wait(self, timeout: float = None):
+        """Returns the names of the properties files changed within `timeout` seconds, or None if any may have."""
+        changed = set()
+        complete = True
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        while ready:
+            complete = self.read(changed) and complete
+            ready, _, _ = select.select([self.fd], [], [], SETTLE_SECONDS)
+        return changed if complete else None
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """The changes of the properties files of a folder, from the size and mtime of each, every `interval` seconds."""
+    name = 'polling'
+
+    def __init__(self, folder: str, interval: float = POLL_SECONDS):
+        self.folder = folder
+        self.interval = interval
+        self.stats = self.scan()
+
+    def scan(self):
+        stats = {}
+        for entry in os.scandir(self.folder):
+            if entry.name.endswith('.properties') and entry.is_file():
+                stat = entry.stat()
+                stats[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def wait(self, timeout: float = None):
+        """Returns the names of the properties files changed within `timeout` seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval if deadline is None else max(0.0, min(self.interval,
+                                                                            deadline - time.monotonic())))
+            stats = self.scan()
+            changed = {name for name in stats.keys() | self.stats.keys() if stats.get(name) != self.stats.get(name)}
+            self.stats = stats
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def open_watcher(folder: str, poll: bool = False):
+    """An inotify watcher of `folder`, or a polling one if asked or inotify is not available."""
+    if not poll:
+        try:
+            return InotifyWatcher(folder)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(folder)
+
+
+class WatchState:
+    """What is known of the files of `folder`, as checked with each of `environments`."""
+
+    def __init__(self, folder: str, environments=None):
+        self.folder = folder
+        self.environments = environments or DEFAULT_ENVIRONMENTS
+        # The parse of each file, and the propscheck result of those propscheck checks.
+        self.files = {}
+        self.results = {}
+        # Why the files which could not be read were not.
+        self.errors = {}
+        # The cross-file problems of each language other than duplicate compilers, and its resolved
+        # compilers in each view, to find compilers listed by two languages.
+        self.problems = {}
+        self.compilers = {}
+        self.update(properties_names(folder))
+
+    def load(self, name: str):
+        """Reads and checks the file `name`. Returns its language, or None if it is gone or not UTF-8."""
+        self.files.pop(name, None)
+        self.results.pop(name, None)
+        self.errors.pop(name, None)
+        try:
+            with open(join(self.folder, name), 'rb') as f:
+                data = f.read()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            # Likely saved half-way, or in another encoding; it is left out until it is saved again.
+            self.errors[name] = f'Not valid UTF-8: {e}'
+            return None
+        self.files[name] = ConfigFile(name, io.StringIO(text, newline=None))
+        if propscheck.is_checked(name):
+            self.results[name] = propscheck.process_data(data)
+        return self.files[name].lang
+
+    def update(self, names):
+        """Reads `names` again and checks the languages they are, or were, in. Returns those languages."""
+        languages = set()
+        for name in names:
+            if name in self.files:
+                languages.add(self.files[name].lang)
+            languages.add(self.load(name))
+        languages.discard(None)
+        for lang in languages:
+            self.check_language(lang)
+        return languages
+
+    def check_language(self, lang: str):
+        files = {name: config for name, config in self.files.items() if config.lang == lang}
+        if not files:
+            self.problems.pop(lang, None)
+            self.compilers.pop(lang, None)
+            return
+        tree = ConfigTree(self.folder, files)
+        views = [tree.view(envs, platform) for envs, platform in self.environments]
+        problems = view_problems(views)
+        problems.pop('duplicate_compilers', None)
+        self.problems[lang] = problems
+        self.compilers[lang] = {str(view): view.compilers for view in views}
+
+    def languages(self):
+        """The languages, in the order the whole tree resolves them: that of their first file."""
+        first = {}
+        for name in sorted(self.files):
+            first.setdefault(self.files[name].lang, name)
+        return list(first)
+
+    def cross_file_problems(self, languages=None):
+        """The cross-file problems of `languages`, all if None, including compilers also listed by another.
+
+        For all languages, these are the problems configgraph.find_problems finds on the whole tree.
+        """
+        problems = {}
+        for lang in self.problems if languages is None else languages:
+            for kind, found in self.problems.get(lang, {}).items():
+                problems.setdefault(kind, {}).update(found)
+        merged = {}
+        for lang in self.languages():
+            for view, compilers in self.compilers.get(lang, {}).items():
+                view_compilers = merged.setdefault(view, {})
+                for name, resolved in compilers.items():
+                    view_compilers.setdefault(name, []).extend(resolved)
+        for view, compilers in merged.items():
+            if languages is not None:
+                compilers = {name: resolved for name, resolved in compilers.items()
+                             if any(compiler.lang in languages for compiler in resolved)}
+            for where, text in duplicate_compilers(compilers):
+                problems.setdefault('duplicate_compilers', {}).setdefault((location(where), text), []).append(view)
+        return problems
+
+
+def print_problems(problems):
+    for kind, found in sorted(problems.items()):
+        print(f'{kind}:')
+        for (where, text), views in sorted(found.items()):
+            print(f"  {where}: {text}" + (f" ({'; '.join(views)})" if views else ''))
+
+
+def print_changes(state: WatchState, names, languages, seconds: float):
+    print(f"[{time.strftime('%H:%M:%S')}] {', '.join(sorted(names))} checked in {seconds * 1000:.0f}ms")
+    issues = False
+    for name in sorted(names):
+        if name in state.errors:
+            issues = True
+            print(f'## {name}')
+            print(state.errors[name])
+        elif name in state.results and propscheck.problems_found(state.results[name]):
+            issues = True
+            print(f'## {name}')
+            for issue_key, found in state.results[name].items():
+                propscheck.print_issue(issue_key, found)
+    problems = state.cross_file_problems(languages)
+    if problems:
+        issues = True
+        print(f"## cross-file problems of {'the tree' if languages is None else ', '.join(sorted(languages))}")
+        print_problems(problems)
+    if not issues:
+        print('No issues')
+
+
+def watch(folder: str, environments=None, poll: bool = False):
+    start = time.perf_counter()
+    state = WatchState(folder, environments)
+    with_issues = sum(1 for result in state.results.values() if propscheck.problems_found(result))
+    problems = sum(map(len, state.cross_file_problems().values()))
+    print(f"Read {len(state.files)} files in {(time.perf_counter() - start) * 1000:.0f}ms: "
+          f"{with_issues} with issues, {problems} cross-file problem(s)")
+    for name, error in sorted(state.errors.items()):
+        print(f'{name}: {error}')
+    watcher = open_watcher(folder, poll)
+    print(f"Watching {folder} ({watcher.name}), press Ctrl-C to stop")
+    try:
+        while True:
+            names = watcher.wait()
+            if names is None:
+                names = set(state.files) | properties_names(folder)
+            if not names:
+                continue
+            start = time.perf_counter()
+            languages = state.update(names)
+            print_changes(state, names, languages, time.perf_counter() - start)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Checks the properties files again each time one is saved')
+    parser.add_argument('folder', nargs='?', default='./etc/config/',
+                        help='Folder of the properties files. Default is ./etc/config/')
+    parser.add_argument('-e', '--env', type=str, nargs='+', action='append',
+                        help='Check the tree as run with these environments; can be given several times. '
+                             'Default is each environment we deploy')
+    parser.add_argument('--platform', type=str, default=PLATFORM,
+                        help=f'Platform of the environments given with --env. Default is {PLATFORM}')
+    parser.add_argument('--poll', action='store_true', help='Poll the folder for changes instead of using inotify')
+    args = parser.parse_args()
+    environments = [(tuple(envs), args.platform) for envs in args.env] if args.env else None
+    watch(args.folder, environments, args.poll)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+import io
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import configwatch
+import propscheck
+from configgraph import ConfigTree, find_problems
+
+ENVIRONMENTS = [(('dev',), 'linux'), (('amazon',), 'linux'), (('amazon', 'gpu'), 'linux')]
+
+
+class ConfigWatchTests(unittest.TestCase):
+    def setUp(self):
+        base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.folder = os.path.join(self.tmp.name, 'config')
+        self.fixtures = os.path.join(base_path, 'test', 'tree')
+        shutil.copytree(self.fixtures, self.folder)
+
+    def append(self, name, text):
+        with open(os.path.join(self.folder, name), 'a') as f:
+            f.write(text)
+
+    def assertMatchesFullCheck(self, state):
+        self.assertEqual(state.cross_file_problems(), find_problems(ConfigTree(self.folder), ENVIRONMENTS))
+        for name, result in state.results.items():
+            expected = propscheck.process_file(os.path.join(self.folder, name))
+            self.assertEqual({k: sorted(map(str, v)) for k, v in result.items()},
+                             {k: sorted(map(str, v)) for k, v in expected.items()})
+        self.assertEqual(sorted(state.results), propscheck.properties_files(self.folder))
+
+    def test_update(self):
+        state = configwatch.WatchState(self.folder, ENVIRONMENTS)
+        self.assertMatchesFullCheck(state)
+
+        self.append('lang.gpu.properties', 'group.gpu.compilers=gpu1:g1\n')
+        self.append('other.amazon.properties', 'compilers=o1:n1\ncompiler.o1.exe=/opt/compiler-explorer/o1\n')
+        self.assertEqual(state.update({'lang.gpu.properties', 'other.amazon.properties'}), {'lang', 'other'})
+        self.assertMatchesFullCheck(state)
+        self.assertIn('n1', ' '.join(text for _, text in state.cross_file_problems({'other'})['duplicate_compilers']))
+
+        os.remove(os.path.join(self.folder, 'lang.gpu.properties'))
+        self.assertEqual(state.update({'lang.gpu.properties'}), {'lang'})
+        self.assertNotIn('lang.gpu.properties', state.files)
+        self.assertMatchesFullCheck(state)
+
+    def test_not_utf8(self):
+        state = configwatch.WatchState(self.folder, ENVIRONMENTS)
+        with open(os.path.join(self.folder, 'lang.gpu.properties'), 'ab') as f:
+            f.write(b'compiler.gpu1.name=\xff\n')
+        self.assertEqual(state.update({'lang.gpu.properties'}), {'lang'})
+        self.assertIn('Not valid UTF-8', state.errors['lang.gpu.properties'])
+        self.assertNotIn('lang.gpu.properties', state.files)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            configwatch.print_changes(state, {'lang.gpu.properties'}, {'lang'}, 0)
+        self.assertIn('## lang.gpu.properties\nNot valid UTF-8', output.getvalue())
+
+        shutil.copy(os.path.join(self.fixtures, 'lang.gpu.properties'), self.folder)
+        self.assertEqual(state.update({'lang.gpu.properties'}), {'lang'})
+        self.assertEqual(state.errors, {})
+        self.assertMatchesFullCheck(state)
+
+    def test_new_file_not_utf8(self):
+        state = configwatch.WatchState(self.folder, ENVIRONMENTS)
+        self.assertTrue(state.cross_file_problems())
+        with open(os.path.join(self.folder, 'bad.properties'), 'wb') as f:
+            f.write(b'\xff\n')
+        self.assertEqual(state.update({'bad.properties'}), set())
+        self.assertEqual(state.cross_file_problems(set()), {})
+        output = io.StringIO()
+        with redirect_stdout(output):
+            configwatch.print_changes(state, {'bad.properties'}, set(), 0)
+        self.assertIn('## bad.properties\nNot valid UTF-8', output.getvalue())
+        self.assertNotIn('cross-file problems', output.getvalue())
+
+        os.remove(os.path.join(self.folder, 'bad.properties'))
+        self.assertEqual(state.update({'bad.properties'}), set())
+        output = io.StringIO()
+        with redirect_stdout(output):
+            configwatch.print_changes(state, {'bad.properties'}, set(), 0)
+        self.assertNotIn('cross-file problems', output.getvalue())
+        self.assertIn('No issues', output.getvalue())
+        self.assertMatchesFullCheck(state)
+
+    def check_watcher(self, watcher):
+        self.addCleanup(watcher.close)
+        self.assertEqual(watcher.wait(0.05), set())
+        self.append('lang.amazon.properties', 'compiler.g1.name=G1\n')
+        with open(os.path.join(self.folder, 'notes.txt'), 'w') as f:
+            f.write('not a properties file\n')
+        self.assertEqual(watcher.wait(1), {'lang.amazon.properties'})
+        os.rename(os.path.join(self.folder, 'other.amazon.properties'), os.path.join(self.folder, 'moved.properties'))
+        self.assertEqual(watcher.wait(1), {'other.amazon.properties', 'moved.properties'})
+
+    def test_inotify(self):
+        try:
+            watcher = configwatch.InotifyWatcher(self.folder)
+        except (OSError, AttributeError):
+            self.skipTest('inotify is not available')
+        self.check_watcher(watcher)
+
+    def test_polling(self):
+        watcher = configwatch.PollingWatcher(self.folder, interval=0.01)
+        # Make sure the appended file's mtime differs even on filesystems with coarse timestamps.
+        os.utime(os.path.join(self.folder, 'lang.amazon.properties'), ns=(0, 0))
+        watcher.stats = watcher.scan()
+        self.check_watcher(watcher)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,30 +22,25 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import argparse
+import hashlib
+import io
+import json
+import os
 import sys
 from os import listdir
-from os.path import isfile, join
-import re
-
-PROP_RE = re.compile(r'([^#]*)=(.*)#*')
-COMPILERS_LIST_RE = re.compile(r'compilers=(.*)')
-ALIAS_LIST_RE = re.compile(r'alias=(.*)')
-GROUP_NAME_RE = re.compile(r'group\.(.*?)\.')
-COMPILER_EXE_RE = re.compile(r'compiler\.(.*?)\.exe=(.*)')
-COMPILER_ID_RE = re.compile(r'compiler\.(.*?)\..*')
-TYPO_COMPILERS_RE = re.compile(r'(compilers\..*)')
-DEFAULT_COMPILER_RE = re.compile(r'defaultCompiler=(.*)')
-FORMATTERS_LIST_RE = re.compile(r'formatters=(.*)')
-FORMATTER_EXE_RE = re.compile(r'formatter\.(.*?)\.exe=(.*)')
-FORMATTER_ID_RE = re.compile(r'formatter\.(.*?)\..*')
-LIBS_LIST_RE = re.compile(r'libs=(.+)')
-LIB_VERSIONS_LIST_RE = re.compile(r'libs\.(.*?)\.versions=(.*)')
-LIB_VERSION_RE = re.compile(r'libs\.(.*?)\.versions\.(.*?)\.version')
-TOOLS_LIST_RE = re.compile(r'tools=(.+)')
-TOOL_EXE_RE = re.compile(r'tools\.(.*?)\.exe=(.*)')
-TOOL_ID_RE = re.compile(r'tools\.(.*?)\..*')
-EMPTY_LIST_RE = re.compile(r'(.*(compilers|formatters|versions|tools|alias|exclude|libPath)=((.*::.*)|(:.*)|(.*:)))$')
-DISABLED_RE = re.compile(r'^# Disabled?:?\s*(.*)')
+from os.path import getsize, isfile, join
+
+# Keys of colon separated lists, which must not have empty elements.
+LIST_KEYS = ('compilers', 'formatters', 'versions', 'tools', 'alias', 'exclude', 'libPath')
+COMPILERS_LIST = 'compilers='
+DISABLED_PREFIX = '# Disable'
+# Below this many bytes of properties in total, starting worker processes takes longer than checking them.
+MIN_PARALLEL_BYTES = 512 * 1024
+DEFAULT_CACHE_FILE = '.propscheck-cache.json'
+DEFAULT_HOST_CACHE_FILE = '.propscheck-host-cache.json'
+# Directories are listed in this many threads, as on network filesystems each listing mostly waits.
+HOST_THREADS = 16
 
 
 class Line:
@@ -76,176 +71,418 @@ def as_line(text):
     return Line(-1, text)
 
 
-def match_and_add(line: Line, expr, s: set):
-    match = expr.match(line.text)
-    if match:
-        s.add(Line(line.number, match.group(1)))
-    return match
+def add(found: dict, number: int, text: str):
+    found.setdefault(text.strip(), number)
+
+
+def update(found: dict, number: int, texts):
+    for text in texts:
+        found.setdefault(text.strip(), number)
+
+
+def as_lines(found: dict):
+    return {Line(number, text) for text, number in found.items()}
+
+
+def disabled_ids(text: str):
+    """The ids listed by a `# Disabled: id1 id2` comment."""
+    ids = text[len(DISABLED_PREFIX):]
+    if ids.startswith('d'):
+        ids = ids[1:]
+    if ids.startswith(':'):
+        ids = ids[1:]
+    return ids.lstrip().split(' ')
+
+
+def has_empty_separator(text: str):
+    """Whether a list property of the line, e.g. compilers=a::b, has an empty element."""
+    if ':' not in text:
+        return False
+    eq = text.find('=')
+    while eq >= 0:
+        if text.endswith(LIST_KEYS, 0, eq):
+            value = text[eq + 1:]
+            if value.startswith(':') or value.endswith(':') or '::' in value:
+                return True
+        eq = text.find('=', eq + 1)
+    return False
+
+
+class FileScan:
+    """Everything a single pass over a properties file collects.
+
+    Each line is split once: its key is matched against the keys seen so far,
+    and its first key segment picks the handler for the rest, e.g.
+    `compiler.id.exe=path` goes to `compiler` with `id.exe=path`. The
+    collections map the text of each entry to the number of the line it was
+    first seen on, and only become `Line`s once the file is done.
+    """
+
+    def __init__(self):
+        self.default_compiler = {}
+        self.listed_groups = {}
+        self.seen_groups = {}
+        self.listed_compilers = {}
+        self.seen_compilers_exe = {}
+        self.seen_compilers_id = {}
+        self.listed_formatters = {}
+        self.seen_formatters_exe = {}
+        self.seen_formatters_id = {}
+        self.listed_tools = {}
+        self.seen_tools_exe = {}
+        self.seen_tools_id = {}
+        self.listed_libs_ids = {}
+        self.seen_libs_ids = {}
+        self.listed_libs_versions = {}
+        self.seen_libs_versions = {}
+        self.empty_separators = {}
+        self.seen_lines = set()
+        self.duplicate_lines = {}
+        self.duplicated_compiler_references = {}
+        self.duplicated_group_references = {}
+        self.suspicious_path = {}
+        self.executables = {}
+        self.seen_typo_compilers = {}
+        # By default, consider this one valid as it's in several configs.
+        self.disabled = {'/usr/bin/ldd': -1}
+
+    def scan_line(self, number: int, text: str):
+        if text.startswith(DISABLED_PREFIX):
+            self.scan_disabled(number, text)
+
+        # The key ends at the last = before any comment.
+        comment = text.find('#')
+        eq = text.rfind('=', 0, len(text) if comment < 0 else comment)
+        if eq < 0:
+            return
+        prop_key = text[:eq]
+        if prop_key in self.seen_lines:
+            add(self.duplicate_lines, number, prop_key)
+        else:
+            self.seen_lines.add(prop_key)
+
+        compilers = text.find(COMPILERS_LIST)
+        if compilers >= 0:
+            self.scan_compilers_list(number, text[compilers + len(COMPILERS_LIST):])
+        if has_empty_separator(text):
+            add(self.empty_separators, number, text)
+
+        first_eq = text.find('=')
+        dot = text.find('.', 0, first_eq)
+        if dot >= 0:
+            handler = SEGMENT_HANDLERS.get(text[:dot])
+            rest = text[dot + 1:]
+        else:
+            handler = PROPERTY_HANDLERS.get(text[:first_eq])
+            rest = text[first_eq + 1:]
+        if handler:
+            handler(self, number, text, rest)
+
+    def scan_disabled(self, number: int, text: str):
+        update(self.disabled, number, disabled_ids(text))
+
+    def scan_compilers_list(self, number: int, value: str):
+        for elem_id in value.split(':'):
+            if elem_id.startswith('&'):
+                group = elem_id[1:].strip()
+                if group in self.listed_groups:
+                    add(self.duplicated_group_references, number, group)
+                add(self.listed_groups, number, group)
+            elif '@' not in elem_id:
+                compiler = elem_id.strip()
+                if compiler in self.listed_compilers:
+                    add(self.duplicated_compiler_references, number, compiler)
+                add(self.listed_compilers, number, compiler)
+
+    def scan_exe(self, number: int, rest: str, seen_exe: dict, seen_id: dict):
+        """Handles `<segment>.id.exe=path` and any other `<segment>.id.property` line."""
+        exe = rest.find('.exe=')
+        if exe >= 0:
+            path = rest[exe + len('.exe='):]
+            add(seen_exe, number, rest[:exe])
+            add(self.executables, number, path)
+            if not path.startswith('/opt/compiler-explorer'):
+                add(self.suspicious_path, number, path)
+        end = rest.find('.')
+        if end >= 0:
+            add(seen_id, number, rest[:end])
+
+    def scan_compiler(self, number: int, text: str, rest: str):
+        self.scan_exe(number, rest, self.seen_compilers_exe, self.seen_compilers_id)
+
+    def scan_formatter(self, number: int, text: str, rest: str):
+        self.scan_exe(number, rest, self.seen_formatters_exe, self.seen_formatters_id)
+
+    def scan_tool(self, number: int, text: str, rest: str):
+        self.scan_exe(number, rest, self.seen_tools_exe, self.seen_tools_id)
+
+    def scan_group(self, number: int, text: str, rest: str):
+        end = rest.find('.')
+        if end >= 0:
+            add(self.seen_groups, number, rest[:end])
+
+    def scan_lib(self, number: int, text: str, rest: str):
+        versions = rest.find('.versions=')
+        if versions >= 0:
+            lib_id = rest[:versions]
+            add(self.seen_libs_ids, number, lib_id)
+            update(self.listed_libs_versions, number,
+                   (f"{lib_id} {v}" for v in rest[versions + len('.versions='):].split(':')))
+        versions = rest.find('.versions.')
+        if versions >= 0:
+            end = rest.find('.version', versions + len('.versions.'))
+            if end >= 0:
+                add(self.seen_libs_versions, number, f"{rest[:versions]} {rest[versions + len('.versions.'):end]}")
+
+    def scan_typo_compilers(self, number: int, text: str, rest: str):
+        add(self.seen_typo_compilers, number, text)
+
+    def scan_default_compiler(self, number: int, text: str, value: str):
+        add(self.default_compiler, number, value)
+
+    def scan_alias_list(self, number: int, text: str, value: str):
+        update(self.seen_compilers_exe, number, value.split(':'))
+
+    def scan_formatters_list(self, number: int, text: str, value: str):
+        update(self.listed_formatters, number, value.split(':'))
+
+    def scan_tools_list(self, number: int, text: str, value: str):
+        if value:
+            update(self.listed_tools, number, value.split(':'))
+
+    def scan_libs_list(self, number: int, text: str, value: str):
+        if value:
+            update(self.listed_libs_ids, number, value.split(':'))
+
+
+# Handlers of `segment.rest` lines, by their first key segment.
+SEGMENT_HANDLERS = {
+    'compiler': FileScan.scan_compiler,
+    'compilers': FileScan.scan_typo_compilers,
+    'formatter': FileScan.scan_formatter,
+    'group': FileScan.scan_group,
+    'libs': FileScan.scan_lib,
+    'tools': FileScan.scan_tool,
+}
+# Handlers of `key=value` lines whose key has a single segment.
+PROPERTY_HANDLERS = {
+    'alias': FileScan.scan_alias_list,
+    'defaultCompiler': FileScan.scan_default_compiler,
+    'formatters': FileScan.scan_formatters_list,
+    'libs': FileScan.scan_libs_list,
+    'tools': FileScan.scan_tools_list,
+}
+
+
+def scan_lines(lines):
+    scan = FileScan()
+    for line_number, text in enumerate(lines, start=1):
+        text = text.strip()
+        if text:
+            scan.scan_line(line_number, text)
+    return scan
 
 
-def match_and_update(line: Line, expr, s: set, split=':'):
-    match = expr.match(line.text)
-    if match:
-        s.update([Line(line.number, text) for text in match.group(1).split(split)])
-    return match
+def process_file(file: str):
+    with open(file) as f:
+        return process_scan(scan_lines(f))
 
 
-def check_suspicious_path_and_add(line: Line, m, s):
-    if m and not m.group(2).startswith('/opt/compiler-explorer'):
-        s.add(Line(line.number, m.group(2)))
+def process_data(data: bytes):
+    """Checks the contents of a properties file, read as `process_file` would read it from disk."""
+    return process_scan(scan_lines(io.TextIOWrapper(io.BytesIO(data))))
 
 
-def process_file(file: str):
-    default_compiler = set()
+def differing(found: dict, other: dict, excluded: dict):
+    """The Lines of the texts of only one of `found` and `other`, other than those of `excluded`.
 
-    listed_groups = set()
-    seen_groups = set()
+    The same as the symmetric difference of their `as_lines`, less those of
+    `excluded`, but with the sets of texts, so only the Lines found are made.
+    """
+    return {Line(found.get(text, other.get(text)), text) for text in (found.keys() ^ other.keys()) - excluded.keys()}
 
-    listed_compilers = set()
-    seen_compilers_exe = set()
-    seen_compilers_id = set()
 
-    listed_formatters = set()
-    seen_formatters_exe = set()
-    seen_formatters_id = set()
+def except_lines(found: dict, excluded: dict):
+    return {Line(found[text], text) for text in found.keys() - excluded.keys()}
 
-    listed_tools = set()
-    seen_tools_exe = set()
-    seen_tools_id = set()
 
-    listed_libs_ids = set()
-    seen_libs_ids = set()
+def process_scan(scan: FileScan):
+    disabled = scan.disabled
+    listed_compilers = scan.listed_compilers
 
-    listed_libs_versions = set()
-    seen_libs_versions = set()
+    if len(scan.seen_compilers_exe) > 0:
+        bad_compilers_exe = differing(listed_compilers, scan.seen_compilers_exe, disabled)
+    else:
+        bad_compilers_exe = set()
 
-    empty_separators = set()
+    if len(scan.seen_compilers_id) > 0:
+        bad_compilers_ids = differing(listed_compilers, scan.seen_compilers_id, disabled)
+    else:
+        bad_compilers_ids = set()
 
-    seen_lines = set()
-    duplicate_lines = set()
+    listed_formatters = scan.listed_formatters
+    listed_tools = scan.listed_tools
+    return {
+        "bad_compilers_exe": bad_compilers_exe,
+        "bad_compilers_id": bad_compilers_ids,
+        "bad_groups": differing(scan.listed_groups, scan.seen_groups, disabled),
+        "bad_formatters_exe": differing(listed_formatters, scan.seen_formatters_exe, disabled),
+        "bad_formatters_id": differing(listed_formatters, scan.seen_formatters_id, disabled),
+        "bad_libs_ids": differing(scan.listed_libs_ids, scan.seen_libs_ids, disabled),
+        "bad_libs_versions": differing(scan.listed_libs_versions, scan.seen_libs_versions, disabled),
+        "bad_tools_exe": differing(listed_tools, scan.seen_tools_exe, disabled),
+        "bad_tools_id": differing(listed_tools, scan.seen_tools_id, disabled),
+        "bad_default": except_lines(scan.default_compiler, listed_compilers),
+        "empty_separators": as_lines(scan.empty_separators),
+        "duplicate_lines": as_lines(scan.duplicate_lines),
+        "duplicated_compiler_references": as_lines(scan.duplicated_compiler_references),
+        "duplicated_group_references": as_lines(scan.duplicated_group_references),
+        "suspicious_path": except_lines(scan.suspicious_path, disabled),
+        "typo_compilers": except_lines(scan.seen_typo_compilers, disabled)
+    }
 
-    duplicated_compiler_references = set()
-    duplicated_group_references = set()
 
-    suspicious_path = set()
+def is_checked(name: str):
+    return name.endswith('.properties') and not name.endswith(('.defaults.properties', '.local.properties'))
 
-    seen_typo_compilers = set()
 
-    # By default, consider this one valid as it's in several configs.
-    disabled = {as_line('/usr/bin/ldd')}
+def properties_files(folder: str):
+    return sorted(f for f in listdir(folder) if isfile(join(folder, f)) and is_checked(f))
 
-    with open(file) as f:
-        for line_number, text in enumerate(f, start=1):
-            text = text.strip()
-            if not text:
-                continue
-            line = Line(line_number, text)
-            match_and_update(line, DISABLED_RE, disabled, ' ')
 
-            match_prop = PROP_RE.match(line.text)
-            if not match_prop:
-                continue
+def run_checks(check, items, size: int, jobs: int):
+    """Returns `check` of each of `items`, in order, in up to `jobs` processes if they are `size` bytes in total."""
+    if jobs <= 1 or len(items) < 2 or size < MIN_PARALLEL_BYTES:
+        return [check(item) for item in items]
+    # Imported here as it is slow to import, and incremental runs are meant to be quick.
+    from concurrent.futures import ProcessPoolExecutor
+    jobs = min(jobs, len(items))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(check, items, chunksize=max(1, len(items) // (jobs * 4))))
 
-            prop_key = match_prop.group(1)
-            if prop_key in seen_lines:
-                duplicate_lines.add(Line(line.number, prop_key))
-            else:
-                seen_lines.add(prop_key)
-
-            match_compilers_list = COMPILERS_LIST_RE.search(line.text)
-            if match_compilers_list:
-                ids = match_compilers_list.group(1).split(':')
-                for elem_id in ids:
-                    if elem_id.startswith('&'):
-                        if as_line(elem_id[1:]) in listed_groups:
-                            duplicated_group_references.add(Line(line.number, elem_id[1:]))
-                        listed_groups.add(Line(line.number, elem_id[1:]))
-                    elif '@' not in elem_id:
-                        if as_line(elem_id) in listed_compilers:
-                            duplicated_compiler_references.add(Line(line.number, elem_id))
-                        listed_compilers.add(Line(line.number, elem_id))
-
-            match_libs_versions = LIB_VERSIONS_LIST_RE.match(line.text)
-            if match_libs_versions:
-                lib_id = match_libs_versions.group(1)
-                versions = match_libs_versions.group(2).split(':')
-                seen_libs_ids.add(Line(line.number, lib_id))
-                listed_libs_versions.update([Line(line.number, f"{lib_id} {v}") for v in versions])
-
-            match_libs_version = LIB_VERSION_RE.match(line.text)
-            if match_libs_version:
-                lib_id = match_libs_version.group(1)
-                version = match_libs_version.group(2)
-                seen_libs_versions.add(Line(line.number, f"{lib_id} {version}"))
-
-            match_and_add(line, EMPTY_LIST_RE, empty_separators)
-            match_and_add(line, DEFAULT_COMPILER_RE, default_compiler)
-            match_and_add(line, GROUP_NAME_RE, seen_groups)
-
-            match_compiler_exe = match_and_add(line, COMPILER_EXE_RE, seen_compilers_exe)
-            check_suspicious_path_and_add(line, match_compiler_exe, suspicious_path)
-
-            match_formatter_exe = match_and_add(line, FORMATTER_EXE_RE, seen_formatters_exe)
-            check_suspicious_path_and_add(line, match_formatter_exe, suspicious_path)
-
-            match_tool_exe = match_and_add(line, TOOL_EXE_RE, seen_tools_exe)
-            check_suspicious_path_and_add(line, match_tool_exe, suspicious_path)
-
-            match_and_add(line, COMPILER_ID_RE, seen_compilers_id)
-            match_and_add(line, TOOL_ID_RE, seen_tools_id)
-            match_and_add(line, FORMATTER_ID_RE, seen_formatters_id)
-
-            match_and_add(line, TYPO_COMPILERS_RE, seen_typo_compilers)
-
-            match_and_update(line, ALIAS_LIST_RE, seen_compilers_exe)
-            match_and_update(line, FORMATTERS_LIST_RE, listed_formatters)
-            match_and_update(line, TOOLS_LIST_RE, listed_tools)
-            match_and_update(line, LIBS_LIST_RE, listed_libs_ids)
-
-    if len(seen_compilers_exe) > 0:
-        bad_compilers_exe = listed_compilers.symmetric_difference(seen_compilers_exe)
-    else:
-        bad_compilers_exe = set()
 
-    if len(seen_compilers_id) > 0:
-        bad_compilers_ids = listed_compilers.symmetric_difference(seen_compilers_id)
-    else:
-        bad_compilers_ids = set()
+def process_files(paths, jobs: int = 1):
+    """Returns the results of `paths`, in order, checking them in up to `jobs` processes."""
+    return run_checks(process_file, paths, sum(getsize(path) for path in paths), jobs)
+
+
+def process_files_data(contents, jobs: int = 1):
+    return run_checks(process_data, contents, sum(map(len, contents)), jobs)
+
+
+def checker_version():
+    """Hashes this script, so cached results are dropped whenever the checks change."""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
 
-    bad_groups = listed_groups.symmetric_difference(seen_groups)
-    bad_formatters_exe = listed_formatters.symmetric_difference(seen_formatters_exe)
-    bad_formatters_id = listed_formatters.symmetric_difference(seen_formatters_id)
-    bad_libs_ids = listed_libs_ids.symmetric_difference(seen_libs_ids)
-    bad_libs_versions = listed_libs_versions.symmetric_difference(seen_libs_versions)
-    bad_tools_exe = listed_tools.symmetric_difference(seen_tools_exe)
-    bad_tools_id = listed_tools.symmetric_difference(seen_tools_id)
-    bad_default = default_compiler - listed_compilers
-    return {
-        "bad_compilers_exe": bad_compilers_exe - disabled,
-        "bad_compilers_id": bad_compilers_ids - disabled,
-        "bad_groups": bad_groups - disabled,
-        "bad_formatters_exe": bad_formatters_exe - disabled,
-        "bad_formatters_id": bad_formatters_id - disabled,
-        "bad_libs_ids": bad_libs_ids - disabled,
-        "bad_libs_versions": bad_libs_versions - disabled,
-        "bad_tools_exe": bad_tools_exe - disabled,
-        "bad_tools_id": bad_tools_id - disabled,
-        "bad_default": bad_default,
-        "empty_separators": empty_separators,
-        "duplicate_lines": duplicate_lines,
-        "duplicated_compiler_references": duplicated_compiler_references,
-        "duplicated_group_references": duplicated_group_references,
-        "suspicious_path": suspicious_path - disabled,
-        "typo_compilers": seen_typo_compilers - disabled
-    }
 
+def result_to_json(result):
+    return {k: sorted([line.number, line.text] for line in v) for k, v in result.items()}
 
-def process_folder(folder: str):
-    return [(f, process_file(join(folder, f)))
-            for f in listdir(folder)
-            if isfile(join(folder, f))
-            and not (f.endswith('.defaults.properties') or f.endswith('.local.properties'))
-            and f.endswith('.properties')]
+
+def result_from_json(data):
+    return {k: {Line(number, text) for number, text in v} for k, v in data.items()}
+
+
+class ResultCache:
+    """Results of `process_file` from earlier runs, stored in a JSON file.
+
+    Each file's result is kept with the hash of the contents it was computed
+    from. The size and mtime of the file are recorded too, so that files
+    which were not touched since are not even read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.version = checker_version()
+        self.files = {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.version:
+                self.files = data['files']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def get(self, name: str, digest: str):
+        entry = self.files.get(name)
+        if entry is None or entry['sha256'] != digest:
+            return None
+        return result_from_json(entry['result'])
+
+    def get_unchanged(self, name: str, stat: os.stat_result):
+        """Returns the result of `name` if the file is the very one it was computed from."""
+        entry = self.files.get(name)
+        if entry is None or entry['stat'] != [stat.st_size, stat.st_mtime_ns]:
+            return None
+        return result_from_json(entry['result'])
+
+    def put(self, name: str, digest: str, stat, result):
+        self.files[name] = {'sha256': digest, 'stat': [stat.st_size, stat.st_mtime_ns] if stat else None,
+                            'result': result_to_json(result)}
+
+    def save(self, names):
+        """Writes the entries of the files `names` back, dropping those of files which are gone."""
+        files = {name: self.files[name] for name in sorted(names) if name in self.files}
+        partial = f'{self.path}.{os.getpid()}'
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.version, 'files': files}, f, separators=(',', ':'))
+        os.replace(partial, self.path)
+
+
+def git_staged(folder: str):
+    """Returns the staged changes to the properties files of `folder`.
+
+    That is the new contents of the changed files, by name, and the names of
+    the deleted ones.
+    """
+    import subprocess
+
+    def staged_names(diff_filter):
+        output = subprocess.run(['git', 'diff', '--cached', '--name-only', '--relative', '-z',
+                                 f'--diff-filter={diff_filter}', '--', '.'],
+                                cwd=folder, stdout=subprocess.PIPE, check=True).stdout.decode('utf-8')
+        return [name for name in output.split('\0') if '/' not in name and is_checked(name)]
+
+    staged = {name: subprocess.run(['git', 'cat-file', 'blob', f':./{name}'], cwd=folder,
+                                   stdout=subprocess.PIPE, check=True).stdout
+              for name in staged_names('d')}
+    return staged, set(staged_names('D'))
+
+
+def process_folder(folder: str, jobs: int = 1, cache: ResultCache = None, staged=None, deleted=()):
+    """Checks the properties files of `folder`, reusing the results in `cache` for unchanged files.
+
+    `staged` maps file names to contents checked in place of the ones on disk.
+    """
+    staged = staged or {}
+    files = sorted((set(properties_files(folder)) | set(staged)) - set(deleted))
+    if cache is None:
+        return list(zip(files, process_files([join(folder, f) for f in files], jobs)))
+
+    results, changed = {}, []
+    for f in files:
+        if f in staged:
+            data, stat = staged[f], None
+        else:
+            stat = os.stat(join(folder, f))
+            results[f] = cache.get_unchanged(f, stat)
+            if results[f] is not None:
+                continue
+            with open(join(folder, f), 'rb') as data_file:
+                data = data_file.read()
+        digest = hashlib.sha256(data).hexdigest()
+        results[f] = cache.get(f, digest)
+        if results[f] is None:
+            changed.append((f, data, digest, stat))
+        else:
+            cache.put(f, digest, stat, results[f])
+    checked = process_files_data([data for _, data, _, _ in changed], jobs)
+    for (f, _, digest, stat), result in zip(changed, checked):
+        results[f] = result
+        cache.put(f, digest, stat, result)
+    cache.save(files)
+    return [(f, results[f]) for f in files]
 
 
 def problems_found(file_result):
@@ -258,8 +495,96 @@ def print_issue(name, result):
         print(f"{name}:\n  {sep.join(sorted([str(issue) for issue in result]))}")
 
 
-def find_orphans(folder: str):
-    result = sorted([(f, r) for (f, r) in process_folder(folder) if problems_found(r)], key=lambda x: x[0])
+def referenced_executables(folder: str):
+    """The absolute `exe` paths of the compilers, tools and formatters of `folder`, with the lines setting them."""
+    executables = {}
+    for f in properties_files(folder):
+        with open(join(folder, f)) as properties:
+            scan = scan_lines(properties)
+        for path, number in scan.executables.items():
+            if path.startswith('/'):
+                executables.setdefault(path, []).append(Line(number, f))
+    return executables
+
+
+def file_status(entry: os.DirEntry):
+    try:
+        if not entry.is_file():
+            return 'not a file'
+        return 'ok' if entry.stat().st_mode & 0o111 else 'not executable'
+    except OSError:
+        return 'missing'
+
+
+def list_directory(directory: str, names, cached):
+    """Returns the status of each of `names` in `directory`, with the mtime of the directory.
+
+    The directory is listed once, and only the entries of `names` are
+    stat()ed. If it was not modified since `cached`, an earlier (mtime,
+    statuses) pair, that is used instead. Permissions changed in place do not
+    change the directory's mtime, so they are only seen without a cache.
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return None, {name: 'missing' for name in names}
+    if cached and cached[0] == mtime and all(name in cached[1] for name in names):
+        return cached
+    statuses = {name: 'missing' for name in names}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name in statuses:
+                statuses[entry.name] = file_status(entry)
+    return mtime, statuses
+
+
+def verify_executables(paths, cache_file: str = None, threads: int = HOST_THREADS):
+    """Returns the status of each of `paths` other than 'ok', e.g. 'missing', by path."""
+    # Imported here as it is slow to import, and incremental runs are meant to be quick.
+    from concurrent.futures import ThreadPoolExecutor
+
+    by_directory = {}
+    for path in paths:
+        directory, name = os.path.split(path)
+        by_directory.setdefault(directory, set()).add(name)
+    cache = {}
+    if cache_file:
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        listed = dict(zip(by_directory, executor.map(
+            lambda directory: list_directory(directory, by_directory[directory], cache.get(directory)),
+            by_directory)))
+    if cache_file:
+        with open(f'{cache_file}.{os.getpid()}', 'w', encoding='utf-8') as f:
+            json.dump({directory: [mtime, statuses] for directory, (mtime, statuses) in listed.items()
+                       if mtime is not None}, f, separators=(',', ':'))
+        os.replace(f'{cache_file}.{os.getpid()}', cache_file)
+    problems = {}
+    for directory, (_, statuses) in listed.items():
+        for name in by_directory[directory]:
+            if statuses[name] != 'ok':
+                problems[os.path.join(directory, name)] = statuses[name]
+    return problems
+
+
+def verify_host(folder: str, cache_file: str = None, threads: int = HOST_THREADS):
+    executables = referenced_executables(folder)
+    problems = verify_executables(executables, cache_file, threads)
+    if problems:
+        print(f"Found {len(problems)} of {len(executables)} executable(s) not installed on this host:")
+        for path, status in sorted(problems.items()):
+            print(f"  {path}: {status} ({', '.join(map(str, executables[path]))})")
+    else:
+        print(f"All {len(executables)} executables are installed")
+    return problems
+
+
+def find_orphans(folder: str, jobs: int = 1, cache: ResultCache = None, staged=None, deleted=()):
+    result = [(f, r) for (f, r) in process_folder(folder, jobs, cache, staged, deleted) if problems_found(r)]
     if result:
         print(f"Found {len(result)} property file(s) with issues:")
         for (filename, issues) in result:
@@ -276,6 +601,42 @@ def find_orphans(folder: str):
     return result
 
 
-if __name__ == '__main__':
-    if find_orphans('./etc/config/'):
+def main():
+    parser = argparse.ArgumentParser(description='Checks the properties files for mismatched and suspicious entries')
+    parser.add_argument('folder', nargs='?', default='./etc/config/',
+                        help='Folder of the properties files. Default is ./etc/config/')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help='Number of processes checking files. Default is the number of CPUs; '
+                             'small folders are always checked in this process')
+    parser.add_argument('--cache', type=str, nargs='?', const=DEFAULT_CACHE_FILE,
+                        help='Only check the files which changed since the last run, keeping the results '
+                             f'in this file. Default file is {DEFAULT_CACHE_FILE}')
+    parser.add_argument('--pre-commit', action='store_true',
+                        help='Check the staged version of staged files, and the rest as on disk. Implies --cache')
+    parser.add_argument('--verify-host', action='store_true',
+                        help='Instead of checking the files, check that the executables of the compilers, tools and '
+                             'formatters exist on this host and are executable')
+    parser.add_argument('--host-cache', type=str, nargs='?', const=DEFAULT_HOST_CACHE_FILE,
+                        help='With --verify-host, only list again the directories modified since the last run, '
+                             f'keeping what they held in this file. Default file is {DEFAULT_HOST_CACHE_FILE}')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running, checking each file again when it is saved, with the files of its '
+                             'language across layers as configgraph.py does')
+    args = parser.parse_args()
+    if args.watch:
+        # Imported here as configwatch builds on this module.
+        from configwatch import watch
+        watch(args.folder)
+        return
+    if args.verify_host:
+        if verify_host(args.folder, args.host_cache):
+            sys.exit(1)
+        return
+    cache = ResultCache(args.cache or DEFAULT_CACHE_FILE) if args.cache or args.pre_commit else None
+    staged, deleted = git_staged(args.folder) if args.pre_commit else ({}, set())
+    if find_orphans(args.folder, args.jobs, cache, staged, deleted):
         sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
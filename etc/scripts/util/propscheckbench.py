@@ -0,0 +1,255 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023, Compiler Explorer Authors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Scaling benchmark of propscheck.py on synthetic config trees.
+
+`generate` writes properties files shaped like ours: groups of compilers
+with long `group.*.compilers=` lists, libraries with versions, tools and
+formatters, all listed and defined, so that a correct check finds nothing.
+For each size, in lines, the benchmark times `process_file` on a single file
+of that size and `find_orphans` on a folder of the same lines split into
+files of FILE_LINES, and measures their peak memory with tracemalloc in
+separate runs. The results are compared against test/propscheck-baselines.json
+as benchmark.py of the docenizers does: a changed input or number of issues is
+a regression, as is a time or peak memory more than --tolerance times its
+baseline.
+
+Run with --update to store new baselines, and with --generate to only write a
+synthetic tree.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+import propscheck
+
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test', 'propscheck-baselines.json')
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+# The size of each file of the folders given to find_orphans; c++.amazon.properties is about that.
+FILE_LINES = 20_000
+# Slowdowns smaller than this many seconds, and growths smaller than this many KiB, are noise.
+MIN_SLOWDOWN = 0.05
+MIN_GROWTH_KIB = 1024
+
+
+def generate(lines: int, seed: int = 0, compilers_per_group: int = 20, lib_versions: int = 6):
+    """Returns the text of a properties file of about `lines` lines.
+
+    It has one library per group, with `lib_versions` versions, and a tool per
+    10 groups and a formatter per 50, which is about the mix of
+    c++.amazon.properties.
+    """
+    rng = random.Random(seed)
+    # Each compiler has an exe, a semver and a few an options or alias line; each group has a header of 9
+    # lines, and its library 4 lines and 2 per version.
+    group_lines = 2.3 * compilers_per_group + 9 + 4 + 2 * lib_versions
+    groups = max(1, round(lines / group_lines))
+    tools = [f'tool{t}' for t in range(max(1, groups // 10))]
+    formatters = [f'fmt{f}' for f in range(max(1, groups // 50))]
+    libs = [f'lib{g}' for g in range(groups)]
+    body = []
+    for g in range(groups):
+        ids = [f'c{g}_{c}' for c in range(compilers_per_group)]
+        body += ['', '###############################', f'# Synthetic compilers {g}',
+                 f"group.grp{g}.compilers={':'.join(ids)}",
+                 f'group.grp{g}.groupName=Synthetic {g}',
+                 f'group.grp{g}.baseName=synthetic {g}',
+                 f"group.grp{g}.instructionSet={rng.choice(['amd64', 'aarch64', 'riscv64', 'arm32'])}",
+                 f'group.grp{g}.isSemVer=true',
+                 '']
+        for c, compiler in enumerate(ids):
+            version = f'{g % 17}.{c}.{rng.randrange(5)}'
+            body += [f'compiler.{compiler}.exe=/opt/compiler-explorer/synthetic{g}-{version}/bin/cc',
+                     f'compiler.{compiler}.semver={version}']
+            if rng.random() < 0.2:
+                body.append(f'compiler.{compiler}.options=-O{rng.randrange(4)} --synthetic')
+            if rng.random() < 0.1:
+                body.append(f'compiler.{compiler}.alias=old{compiler}')
+    for lib in libs:
+        versions = [f'{v}{rng.randrange(10)}0' for v in range(1, lib_versions)] + ['trunk']
+        body += ['', f'libs.{lib}.name=Synthetic {lib}', f'libs.{lib}.url=https://example.org/{lib}',
+                 f"libs.{lib}.versions={':'.join(versions)}"]
+        for version in versions:
+            body += [f'libs.{lib}.versions.{version}.version={version}',
+                     f'libs.{lib}.versions.{version}.path=/opt/compiler-explorer/libs/{lib}/{version}/include']
+    for tool in tools:
+        body += ['', f'tools.{tool}.name={tool}', f'tools.{tool}.exe=/opt/compiler-explorer/{tool}/bin/{tool}',
+                 f'tools.{tool}.type=postcompilation', f'tools.{tool}.class=readelf-tool']
+    for formatter in formatters:
+        body += ['', f'formatter.{formatter}.name={formatter}',
+                 f'formatter.{formatter}.exe=/opt/compiler-explorer/{formatter}/bin/{formatter}',
+                 f'formatter.{formatter}.type=clangformat']
+    header = [f"compilers={':'.join(f'&grp{g}' for g in range(groups))}",
+              'defaultCompiler=c0_0',
+              f"libs={':'.join(libs)}",
+              f"tools={':'.join(tools)}",
+              f"formatters={':'.join(formatters)}"]
+    return '\n'.join(header + body) + '\n'
+
+
+def write_tree(folder: str, lines: int):
+    """Writes `lines` lines of synthetic properties files into `folder`, in files of FILE_LINES.
+
+    Returns the number of lines written and the sha256 of the files.
+    """
+    os.makedirs(folder, exist_ok=True)
+    digest = hashlib.sha256()
+    written = 0
+    for index in range(max(1, round(lines / FILE_LINES))):
+        text = generate(min(lines, FILE_LINES), seed=index)
+        with open(os.path.join(folder, f'synthetic{index}.amazon.properties'), 'w') as f:
+            f.write(text)
+        digest.update(text.encode())
+        written += text.count('\n')
+    return written, digest.hexdigest()
+
+
+def issue_count(result):
+    return sum(len(issues) for issues in result.values())
+
+
+def measure(check, repeat: int):
+    """Returns the fastest time of `check` over `repeat` runs, its peak traced memory in KiB and its result."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        check()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    tracemalloc.start()
+    try:
+        result = check()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak // 1024, result
+
+
+def benchmark(lines: int, repeat: int):
+    """Returns the result of the checks on `lines` lines of synthetic properties."""
+    with tempfile.TemporaryDirectory() as tmp:
+        text = generate(lines)
+        path = os.path.join(tmp, 'synthetic.amazon.properties')
+        with open(path, 'w') as f:
+            f.write(text)
+        file_seconds, file_peak, file_result = measure(lambda: propscheck.process_file(path), repeat)
+
+        folder = os.path.join(tmp, 'tree')
+        written, digest = write_tree(folder, lines)
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            tree_seconds, tree_peak, tree_result = measure(lambda: propscheck.find_orphans(folder), repeat)
+    return {
+        'lines': {'process_file': text.count('\n'), 'find_orphans': written},
+        'sha256': hashlib.sha256(text.encode() + digest.encode()).hexdigest(),
+        'issues': issue_count(file_result) + sum(issue_count(result) for _, result in tree_result),
+        'timings': {'process_file': round(file_seconds, 6), 'find_orphans': round(tree_seconds, 6)},
+        'peak_kib': {'process_file': file_peak, 'find_orphans': tree_peak},
+    }
+
+
+def load_baselines():
+    try:
+        with open(BASELINES_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(baselines):
+    with open(BASELINES_FILE, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(result, baseline, tolerance: float):
+    """Returns the list of regressions of `result` against its baseline."""
+    if baseline is None:
+        return ['no baseline, run with --update to store one']
+    problems = []
+    if result['sha256'] != baseline['sha256']:
+        problems.append('generated input changed, run with --update if that is intended')
+    if result['issues'] != baseline['issues']:
+        problems.append(f"{baseline['issues']} -> {result['issues']} issues found")
+    for check, seconds in result['timings'].items():
+        before = baseline['timings'].get(check)
+        if before is not None and seconds > before * tolerance and seconds - before > MIN_SLOWDOWN:
+            problems.append(f"{check} more than {tolerance:g}x slower ({before:.3f}s -> {seconds:.3f}s)")
+    for check, kib in result['peak_kib'].items():
+        before = baseline['peak_kib'].get(check)
+        if before is not None and kib > before * tolerance and kib - before > MIN_GROWTH_KIB:
+            problems.append(f"{check} peak memory more than {tolerance:g}x higher ({before}KiB -> {kib}KiB)")
+    return problems
+
+
+def format_result(lines: int, result):
+    return '  '.join([f'{lines:9} lines'] + [f"{check} {result['timings'][check]:8.3f}s "
+                                              f"{result['peak_kib'][check] / 1024:7.1f}MiB"
+                                              for check in ('process_file', 'find_orphans')])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks propscheck.py on synthetic config trees')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"Sizes of the inputs, in lines. Default is {' '.join(map(str, DEFAULT_SIZES))}")
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='Number of timed runs, keeping the fastest. Default is 3')
+    parser.add_argument('-t', '--tolerance', type=float, default=3.0,
+                        help='How many times its baseline a time or peak memory may get. Default is 3')
+    parser.add_argument('--update', action='store_true', help='Store the results as the new baselines')
+    parser.add_argument('--generate', type=str, metavar='FOLDER',
+                        help='Only write a synthetic tree of the first size into this folder')
+    args = parser.parse_args()
+
+    if args.generate:
+        written, _ = write_tree(args.generate, args.sizes[0])
+        print(f"Wrote {written} lines of properties to {args.generate}")
+        return
+    baselines = load_baselines()
+    failed = False
+    for lines in args.sizes:
+        result = benchmark(lines, args.repeat)
+        print(format_result(lines, result))
+        if args.update:
+            baselines[str(lines)] = result
+            continue
+        for problem in compare(result, baselines.get(str(lines)), args.tolerance):
+            print(f"{lines} lines: REGRESSION: {problem}")
+            failed = True
+    if args.update:
+        save_baselines(baselines)
+        print(f"Baselines written to {BASELINES_FILE}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
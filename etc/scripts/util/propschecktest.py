@@ -1,7 +1,12 @@
 import sys
 import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
 
+import propscheck
+import propscheckbench
 from propscheck import process_file, Line
 
 
@@ -65,6 +70,13 @@ class PropsCheckTests(unittest.TestCase):
     def test_duplicate_lines(self):
         self.run_test("duplicate_lines", "duplicate_lines", {"duplicated.prop"})
 
+    def test_reported_line_numbers(self):
+        base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
+        result = process_file(os.path.join(base_path, 'test', 'cases', 'duplicate_lines.properties'))
+        self.assertEqual([line.number for line in result['duplicate_lines']], [5])
+        result = process_file(os.path.join(base_path, 'test', 'cases', 'bad_duplicated_compiler.properties'))
+        self.assertEqual([line.number for line in result['duplicated_compiler_references']], [4])
+
     def test_duplicated_compiler(self):
         self.run_test("bad_duplicated_compiler", "duplicated_compiler_references", {"duplicatedname"})
 
@@ -81,6 +93,74 @@ class PropsCheckTests(unittest.TestCase):
         for k in result:
             self.assertEqual(result[k], set(), f"{k} has output in known good file")
 
+    def test_parallel_matches_serial(self):
+        base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
+        cases = os.path.join(base_path, 'test', 'cases')
+        serial = propscheck.process_folder(cases)
+        with mock.patch.object(propscheck, 'MIN_PARALLEL_BYTES', 0):
+            parallel = propscheck.process_folder(cases, jobs=3)
+        self.assertEqual([f for f, _ in parallel], sorted(f for f, _ in serial))
+        for (_, expected), (_, result) in zip(serial, parallel):
+            for k in expected:
+                self.assertEqual(sorted(map(str, result[k])), sorted(map(str, expected[k])))
+
+    def test_cache(self):
+        base_path = os.path.dirname(os.path.abspath(sys.argv[0]))
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, 'config')
+            shutil.copytree(os.path.join(base_path, 'test', 'cases'), folder)
+            cache_file = os.path.join(tmp, 'cache.json')
+            expected = propscheck.process_folder(folder)
+            self.assertEqual(propscheck.process_folder(folder, cache=propscheck.ResultCache(cache_file)), expected)
+            with mock.patch.object(propscheck, 'process_data', side_effect=AssertionError):
+                cached = propscheck.process_folder(folder, cache=propscheck.ResultCache(cache_file))
+            self.assertEqual([(f, {k: sorted(map(str, v)) for k, v in r.items()}) for f, r in cached],
+                             [(f, {k: sorted(map(str, v)) for k, v in r.items()}) for f, r in expected])
+
+            with open(os.path.join(folder, 'bad_default.properties'), 'a') as f:
+                f.write('defaultCompiler=c\n')
+            with mock.patch.object(propscheck, 'process_data', wraps=propscheck.process_data) as process_data:
+                results = dict(propscheck.process_folder(folder, cache=propscheck.ResultCache(cache_file)))
+            self.assertEqual(process_data.call_count, 1)
+            self.assertEqual(results['bad_default.properties']['duplicate_lines'], {Line(-1, 'defaultCompiler')})
+
+            staged = {'bad_default.properties':
+                      b'compilers=a\ndefaultCompiler=a\ncompiler.a.exe=/opt/compiler-explorer/a\n'}
+            results = dict(propscheck.process_folder(folder, cache=propscheck.ResultCache(cache_file), staged=staged,
+                                                     deleted={'bad_groups.properties'}))
+            self.assertFalse(propscheck.problems_found(results['bad_default.properties']))
+            self.assertNotIn('bad_groups.properties', results)
+
+    def test_verify_executables(self):
+        with tempfile.TemporaryDirectory() as root:
+            cache_file = os.path.join(root, 'cache.json')
+            tmp = os.path.join(root, 'bin')
+            os.mkdir(tmp)
+            exe, plain = os.path.join(tmp, 'exe'), os.path.join(tmp, 'plain')
+            for path in (exe, plain):
+                open(path, 'w').close()
+            os.chmod(exe, 0o755)
+            os.mkdir(os.path.join(tmp, 'dir'))
+            paths = [exe, plain, os.path.join(tmp, 'dir'), os.path.join(tmp, 'missing'),
+                     os.path.join(tmp, 'nodir', 'exe')]
+            expected = {plain: 'not executable', os.path.join(tmp, 'dir'): 'not a file',
+                        os.path.join(tmp, 'missing'): 'missing', os.path.join(tmp, 'nodir', 'exe'): 'missing'}
+            self.assertEqual(propscheck.verify_executables(paths, cache_file), expected)
+            with mock.patch.object(os, 'scandir', side_effect=AssertionError):
+                self.assertEqual(propscheck.verify_executables(paths, cache_file), expected)
+
+            os.remove(exe)
+            del expected[os.path.join(tmp, 'missing')]
+            open(os.path.join(tmp, 'missing'), 'w').close()
+            os.chmod(os.path.join(tmp, 'missing'), 0o755)
+            expected[exe] = 'missing'
+            self.assertEqual(propscheck.verify_executables(paths, cache_file), expected)
+
+    def test_synthetic_file(self):
+        text = propscheckbench.generate(3000)
+        self.assertAlmostEqual(text.count('\n'), 3000, delta=100)
+        self.assertFalse(propscheck.problems_found(propscheck.process_data(text.encode())))
+
     def test_typo_compilers(self):
         self.run_test("typo_compilers", "typo_compilers", {'compilers.a.name=A'})
 
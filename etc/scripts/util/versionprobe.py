@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023, Compiler Explorer Authors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Probes the version of every compiler of the config tree ahead of the server.
+
+On start, the server runs each compiler with its `versionFlag` (--version by
+default) and keeps the first line of the output matching its `versionRe`, as
+in BaseCompiler.initialise. This does the same for all the compilers of a
+snapshot (see configsnapshot.py), in a bounded pool of subprocesses with a
+timeout each, and writes the versions to a JSON file.
+
+The file also keeps the output of each probe with the size and mtime of the
+executable, and is read back on the next run: only the executables which
+changed since are run again. Timed out probes are not kept.
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import configsnapshot
+from configgraph import PLATFORM
+
+PROBES_VERSION = 1
+DEFAULT_VERSION_FLAG = '--version'
+DEFAULT_TIMEOUT = 30.0
+
+
+class Probe:
+    def __init__(self, exe: str, flag: str):
+        self.exe = exe
+        self.flag = flag
+        self.compilers = []
+        # The resolved path, size and mtime of the executable, once looked up.
+        self.key = None
+
+
+def compiler_probes(snapshot):
+    """Returns the probes to run for the compilers of `snapshot`, by (exe, flag), and the explicit versions by id."""
+    probes, explicit = {}, {}
+    for compiler, info in snapshot['compilers'].items():
+        language = snapshot['languages'][info['lang']]['properties']
+
+        def prop(key, default=None):
+            return info['properties'].get(key, language.get(key, default))
+
+        if prop('explicitVersion'):
+            explicit[compiler] = prop('explicitVersion')
+            continue
+        key = (prop('exe', compiler), prop('versionFlag') or DEFAULT_VERSION_FLAG)
+        probes.setdefault(key, Probe(*key)).compilers.append(compiler)
+    return probes, explicit
+
+
+def file_key(exe: str):
+    """The resolved path of `exe`, searched in PATH if it has no folder, with its size and mtime; or None."""
+    path = exe if os.sep in exe else shutil.which(exe)
+    try:
+        stat = os.stat(path) if path else None
+    except OSError:
+        stat = None
+    if stat is None:
+        return None
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+
+
+def run_probe(probe: Probe, timeout: float):
+    """Runs `probe` and returns its result, with the seconds it took."""
+    start = time.perf_counter()
+    try:
+        # In its own session, so that the processes it started are killed with it on a timeout.
+        with subprocess.Popen([probe.exe, probe.flag], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, start_new_session=True) as process:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+                result = {'code': process.returncode, 'output': (stdout + stderr).decode('utf-8', errors='replace')}
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+                process.communicate()
+                result = {'error': f'timed out after {timeout:g}s'}
+    except OSError as e:
+        result = {'error': e.strerror or str(e)}
+    result['seconds'] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def find_version(output: str, version_re):
+    """The first match of `version_re` in the lines of `output`, or None."""
+    try:
+        regex = re.compile(version_re or '.*', re.IGNORECASE)
+    except re.error:
+        return None
+    for line in output.splitlines():
+        match = regex.search(line)
+        if match and match.group(0):
+            return match.group(0)
+    return None
+
+
+def load_cache(path: str):
+    try:
+        with open(path, encoding='utf-8') as f:
+            content = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return content.get('probes', {}) if content.get('version') == PROBES_VERSION else {}
+
+
+def probe_all(snapshot, cached=None, jobs: int = None, timeout: float = DEFAULT_TIMEOUT):
+    """Probes the compilers of `snapshot`, reusing the `cached` probes of unchanged executables.
+
+    Returns the probe results, by "exe flag", and the version of each compiler.
+    """
+    cached = cached or {}
+    probes, explicit = compiler_probes(snapshot)
+    results, pending = {}, []
+    for (exe, flag), probe in probes.items():
+        name = f'{exe} {flag}'
+        probe.key = file_key(exe)
+        if probe.key is None:
+            results[name] = {'error': f'{exe} not found', 'seconds': 0}
+        elif cached.get(name, {}).get('file') == probe.key:
+            results[name] = cached[name]
+        else:
+            pending.append(probe)
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        for probe, result in zip(pending, executor.map(lambda p: run_probe(p, timeout), pending)):
+            result['file'] = probe.key
+            results[f'{probe.exe} {probe.flag}'] = result
+
+    versions = {compiler: {'version': version} for compiler, version in explicit.items()}
+    for (exe, flag), probe in probes.items():
+        result = results[f'{exe} {flag}']
+        for compiler in probe.compilers:
+            info = snapshot['compilers'][compiler]
+            if 'error' in result:
+                versions[compiler] = {'error': result['error']}
+                continue
+            version_re = info['properties'].get('versionRe',
+                                                snapshot['languages'][info['lang']]['properties'].get('versionRe'))
+            version = find_version(result['output'], version_re)
+            if version:
+                versions[compiler] = {'version': version, 'fullVersion': result['output']}
+            else:
+                versions[compiler] = {'error': f'no version matching {version_re or ".*"} (code {result["code"]})'}
+    return results, versions
+
+
+def write(results, versions, snapshot, path: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    content = {
+        'version': PROBES_VERSION,
+        'hierarchy': snapshot['hierarchy'],
+        'compilers': versions,
+        'probes': {name: result for name, result in results.items() if result.get('file') and
+                   not result.get('error', '').startswith('timed out')},
+    }
+    with open(f'{path}.{os.getpid()}', 'w', encoding='utf-8') as f:
+        json.dump(content, f, sort_keys=True, separators=(',', ':'))
+    os.replace(f'{path}.{os.getpid()}', path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Runs every compiler of the config tree to find its version')
+    parser.add_argument('folder', nargs='?', default='./etc/config/',
+                        help='Folder of the properties files. Default is ./etc/config/')
+    parser.add_argument('-e', '--env', type=str, nargs='+', default=configsnapshot.DEFAULT_ENVIRONMENT,
+                        help=f"Environments to resolve for. Default is {' '.join(configsnapshot.DEFAULT_ENVIRONMENT)}")
+    parser.add_argument('--platform', type=str, default=PLATFORM,
+                        help=f'Platform to resolve for. Default is {PLATFORM}')
+    parser.add_argument('--snapshot', type=str,
+                        help='Take the compilers from this snapshot file instead of resolving the tree')
+    parser.add_argument('-o', '--output', type=str,
+                        help='Versions file, also read back to skip unchanged executables. '
+                             'Default is out/compiler-versions.<environments>.json')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help='Number of compilers to run at once. Default is the number of CPUs')
+    parser.add_argument('-t', '--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Seconds to wait for each compiler. Default is {DEFAULT_TIMEOUT:g}')
+    parser.add_argument('--slowest', type=int, default=10,
+                        help='Number of slowest probes to report. Default is 10')
+    args = parser.parse_args()
+
+    if args.snapshot:
+        with open(args.snapshot, encoding='utf-8') as f:
+            snapshot = json.load(f)
+    else:
+        snapshot = configsnapshot.build(args.folder, args.env, args.platform)
+    output = args.output or os.path.join('out', f"compiler-versions.{'.'.join(args.env)}.json")
+    cached = load_cache(output)
+    start = time.perf_counter()
+    results, versions = probe_all(snapshot, cached, args.jobs, args.timeout)
+    elapsed = time.perf_counter() - start
+    write(results, versions, snapshot, output)
+
+    run = [(result['seconds'], name) for name, result in results.items()
+           if result is not cached.get(name) and result.get('file')]
+    failed = sorted(compiler for compiler, info in versions.items() if 'error' in info)
+    print(f"Probed {len(run)} of {len(results)} executable(s) in {elapsed:.1f}s, "
+          f"{len(versions) - len(failed)} of {len(versions)} compiler versions found; wrote {output}")
+    if run and args.slowest:
+        print("Slowest probes:")
+        for seconds, name in sorted(run, reverse=True)[:args.slowest]:
+            print(f"  {seconds:8.3f}s  {name}")
+    if failed:
+        print(f"No version for {len(failed)} compiler(s):")
+        for compiler in failed[:50]:
+            print(f"  {compiler}: {versions[compiler]['error']}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+import configsnapshot
+import versionprobe
+
+
+class VersionProbeTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = self.tmp.name
+        self.log = os.path.join(root, 'runs.log')
+        self.exe = self.script('cc', f'echo "$0 $1" >> {self.log}\necho "banner"\necho "cc version 1.2 ($1)"')
+        self.slow = self.script('slow', 'sleep 5')
+        folder = os.path.join(root, 'config')
+        os.mkdir(folder)
+        with open(os.path.join(folder, 'lang.amazon.properties'), 'w') as f:
+            f.write(f'compilers=&cc:explicit:missing:slow\n'
+                    f'versionRe=version [0-9.]+\n'
+                    f'group.cc.compilers=a:b:c\n'
+                    f'group.cc.exe={self.exe}\n'
+                    f'compiler.b.versionFlag=-V\n'
+                    f'compiler.c.versionRe=^nothing\n'
+                    f'compiler.explicit.explicitVersion=explicit 1.0\n'
+                    f'compiler.missing.exe={os.path.join(root, "missing")}\n'
+                    f'compiler.slow.exe={self.slow}\n')
+        self.snapshot = configsnapshot.build(folder, ['amazon'])
+
+    def script(self, name, body):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w') as f:
+            f.write(f'#!/bin/sh\n{body}\n')
+        os.chmod(path, 0o755)
+        return path
+
+    def runs(self):
+        with open(self.log) as f:
+            return sorted(f.read().splitlines())
+
+    def test_probe(self):
+        results, versions = versionprobe.probe_all(self.snapshot, jobs=4, timeout=0.2)
+        self.assertEqual(versions['a']['version'], 'version 1.2')
+        self.assertEqual(versions['a']['fullVersion'], 'banner\ncc version 1.2 (--version)\n')
+        self.assertEqual(versions['b']['version'], 'version 1.2')
+        self.assertIn('-V', versions['b']['fullVersion'])
+        self.assertIn('error', versions['c'])
+        self.assertEqual(versions['explicit'], {'version': 'explicit 1.0'})
+        self.assertIn('not found', versions['missing']['error'])
+        self.assertIn('timed out', versions['slow']['error'])
+        # a and c share their executable and flag, so it is only run once for both.
+        self.assertEqual(self.runs(), [f'{self.exe} --version', f'{self.exe} -V'])
+
+    def test_cache(self):
+        path = os.path.join(self.tmp.name, 'versions.json')
+        results, versions = versionprobe.probe_all(self.snapshot, jobs=2, timeout=0.2)
+        versionprobe.write(results, versions, self.snapshot, path)
+        cached = versionprobe.load_cache(path)
+        self.assertNotIn(f'{self.slow} --version', cached)
+
+        _, again = versionprobe.probe_all(self.snapshot, cached, jobs=2, timeout=0.2)
+        self.assertEqual(again, versions)
+        self.assertEqual(len(self.runs()), 2)
+
+        with open(self.exe, 'a') as f:
+            f.write('# changed\n')
+        versionprobe.probe_all(self.snapshot, cached, jobs=2, timeout=0.2)
+        self.assertEqual(len(self.runs()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,48 @@
 // ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 // POSSIBILITY OF SUCH DAMAGE.
 
-export type AssemblyInstructionInfo = Record<'tooltip' | 'html' | 'url', string>;
+/** The cost of an instruction on one microarchitecture, in cycles. */
+export type InstructionTiming = {
+    latency?: number;
+    /** Reciprocal throughput. */
+    throughput?: number;
+    ports?: string;
+};
+
+/** The timings of one operand form of an instruction, e.g. `ADD (R64, M64)`, by microarchitecture. */
+export type InstructionPerformance = {
+    form: string;
+    uarchs: Record<string, InstructionTiming>;
+};
+
+/** The gas cost of an EVM instruction. */
+export type InstructionGas = {
+    static?: string;
+    /** A note on the part of the cost depending on the operands. */
+    dynamic?: string;
+    /** The static cost by hardfork (named as in solc's --evm-version), null before the instruction existed. */
+    forks?: Record<string, string | null>;
+    since?: string;
+};
+
+export type AssemblyInstructionInfo = Record<'tooltip' | 'html' | 'url', string> & {
+    performance?: InstructionPerformance[];
+    gas?: InstructionGas;
+    /** The size of the instruction, in words. */
+    words?: string;
+    /** Cycle counts by device family (e.g. AVRe, AVRxt), or under `all` when the same for all of them. */
+    cycles?: Record<string, string>;
+};
+
+/**
+ * How the documentation of one version of an instruction set differs from the
+ * documentation of the base version: the opcodes it doesn't have, and the ones
+ * it adds or documents differently.
+ */
+export type AsmDocsVersionDelta = {
+    removed: string[];
+    changed: Record<string, AssemblyInstructionInfo>;
+};
 
 /**
  * Base class for all assembly documentation generators.
@@ -38,6 +79,29 @@ export abstract class BaseAssemblyDocumentationProvider {
      * Gather the assembly instruction information by the instruction name.
      *
      * Implementors should return null if the instruction is not supported.
+     * Providers whose documentation is loaded lazily may return a promise.
+     * Providers with documentation for several versions of the instruction set
+     * look it up for `version`, e.g. the version of the interpreter, if given.
      */
-    public abstract getInstructionInformation(instruction: string): AssemblyInstructionInfo | null;
+    public abstract getInstructionInformation(
+        instruction: string,
+        version?: string,
+    ): AssemblyInstructionInfo | null | Promise<AssemblyInstructionInfo | null>;
+}
+
+type AsmOpcodeGetter = (opcode: string | undefined) => AssemblyInstructionInfo | undefined;
+
+/**
+ * Wraps the dynamic import of a generated documentation module, so that large
+ * instruction tables are only loaded on the first request for them rather than
+ * at server startup. The import is only started once.
+ */
+export function lazyAsmOpcodeGetter(
+    load: () => Promise<{getAsmOpcode: AsmOpcodeGetter}>,
+): () => Promise<AsmOpcodeGetter> {
+    let getter: Promise<AsmOpcodeGetter> | undefined;
+    return () => {
+        if (!getter) getter = load().then(module => module.getAsmOpcode);
+        return getter;
+    };
 }
@@ -0,0 +1,6 @@
+import {AsmDocsVersionDelta} from '../base.js';
+
+export const BASE_VERSION = "3";
+
+export const VERSION_DELTAS: Record<string, AsmDocsVersionDelta> = {
+};
@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"5a277e851870aead91902601c08c23ae6cc0517b","docs":[["ADC","Add Memory to Accumulator with Carry"],["AND","\"AND\" Memory with Accumulator"],["ASL","Arithmetic Shift Left"],["BCC","Branch on Carry Clear"],["BCS","Branch on Carry Set"],["BEQ","Branch on Result Zero"],["BIT","Test Bits in Memory with Accumulator"],["BMI","Branch on Result Minus"],["BNE","Branch on Result Not Zero"],["BPL","Branch on Result Plus"],["BRK","Break Command"],["BVC","Branch on Overflow Clear"],["BVS","Branch on Overflow Set"],["CLC","Clear Carry Flag"],["CLD","Clear Decimal Mode"],["CLI","Clear Interrupt Disable"],["CLV","Clear Overflow Flag"],["CMP","Compare Memory and Accumulator"],["CPX","Compare Index Register X To Memory"],["CPY","Compare Index Register Y To Memory"],["DEC","Decrement Memory By One"],["DEX","Decrement Index Register X By One"],["DEY","Decrement Index Register Y By One"],["EOR","\"Exclusive OR\" Memory with Accumulator"],["INC","Increment Memory By One"],["INX","Increment Index Register X By One"],["INY","Increment Index Register Y By One"],["JMP","JMP Indirect"],["JSR","Jump To Subroutine"],["LDA","Load Accumulator with Memory"],["LDX","Load Index Register X From Memory"],["LDY","Load Index Register Y From Memory"],["LSR","Logical Shift Right"],["NOP","No Operation"],["ORA","\"OR\" Memory with Accumulator"],["PHA","Push Accumulator On Stack"],["PHP","Push Processor Status On Stack"],["PLA","Pull Accumulator From Stack"],["PLP","Pull Processor Status From Stack"],["ROL","Rotate Left"],["ROR","Rotate Right"],["RTI","Return From Interrupt"],["RTS","Return From Subroutme"],["SBC","Subtract Memory from Accumulator with Borrow"],["SEC","Set Carry Flag"],["SED","Set Decimal Mode"],["SEI","Set Interrupt Disable"],["STA","Store Accumulator in Memory"],["STX","Store Index Register X In Memory"],["STY","Store Index Register Y In Memory"],["TAX","Transfer Accumulator To Index X"],["TAY","Transfer Accumula Tor To Index Y"],["TSX","Transfer Stack Pointer To Index X"],["TXA","Transfer Index X To Accumulator"],["TXS","Transfer Index X To Stack Pointer"],["TYA","Transfer Index Y To Accumulator"],["SAX","Store Accumulator \"AND\" Index Register X in Memory"],["SHA","Store Accumulator \"AND\" Index Register X \"AND\" Value"],["ASR","\"AND\" then Logical Shift Right"],["ANC","\"AND\" Memory with Accumulator then Move Negative Flag to Carry Flag"],["ARR","\"AND\" Accumulator then Rotate Right"],["SBX","Subtract Memory from Accumulator \"AND\" Index Register X"],["DCP","Decrement Memory By One then Compare with Accumulator"],["ISC","Increment Memory By One then SBC then Subtract Memory from Accumulator with Borrow"],["JAM","Halt the CPU"],["LAS","\"AND\" Memory with Stack Pointer"],["LAX","Load Accumulator and Index Register X From Memory"],["RLA","Rotate Left then \"AND\" with Accumulator"],["RRA","Rotate Right and Add Memory to Accumulator"],["SHX","Store Index Register X \"AND\" Value"],["SHY","Store Index Register Y \"AND\" Value"],["SLO","Arithmetic Shift Left then \"OR\" Memory with Accumulator"],["SRE","Logical Shift Right then \"Exclusive OR\" Memory with Accumulator"],["SHS","Transfer Accumulator \"AND\" Index Register X to Stack Pointer then Store Stack Pointer \"AND\" Hi-Byte In Memory"],["XAA","Non-deterministic Operation of Accumulator, Index Register X, Memory and Bus Contents"],["BRA","Branch Always"],["PHX","Push Index Register X On Stack"],["PHY","Push Index Register Y On Stack"],["PLX","Pull Index Register X From Stack"],["PLY","Pull Index Register Y From Stack"],["STZ","Store Zero In Memory"],["TRB","Test And Reset Memory Bits With Accumulator"],["TSB","Test And Set Memory Bits With Accumulator"]],"lengths":[73,40,73,27,23,36,59,28,41,55,49,30,27,36,32,24,36,45,98,83,46,49,75,44,44,71,60,48,92,47,39,42,79,5,42,33,24,60,40,76,75,62,38,81,37,34,31,20,20,21,57,51,52,52,30,53,52,79,61,50,113,80,63,79,23,44,44,62,88,41,41,66,76,63,106,21,38,38,69,69,17,39,38],"postings":{"adc":[0,1,13,1,14,1,45,1],"add":[0,4,24,1,25,1,26,1,37,1,63,1,68,4,78,1,79,1],"memory":[0,2,1,2,2,2,6,5,13,1,17,3,18,6,19,4,20,2,23,2,24,3,27,2,29,2,30,2,31,2,32,2,34,2,37,1,39,1,40,1,43,2,44,1,47,2,48,2,49,2,56,3,57,2,58,1,59,2,60,1,61,2,62,4,63,4,65,2,66,2,67,1,68,2,69,1,70,1,71,2,72,2,73,2,74,2,78,1,79,1,80,2,81,4,82,4],"accumulator":[0,6,1,6,2,2,6,5,17,5,23,6,29,6,32,2,34,6,35,2,37,4,39,3,40,3,43,6,47,3,50,3,51,2,53,4,55,4,56,3,57,2,58,3,59,6,60,4,61,2,62,4,63,6,65,1,66,2,67,6,68,6,71,4,72,5,73,2,74,3,81,3,82,3],"carry":[0,4,2,2,3,3,4,3,13,3,17,1,18,2,19,1,20,1,21,1,22,2,24,1,25,2,26,1,29,1,32,2,37,1,39,4,40,5,43,4,44,3,50,1,51,1,52,1,53,1,55,1,58,2,59,3,60,2,61,2,62,1,63,2,65,1,67,2,68,5,71,2,72,2,78,1,79,1],"instruction":[0,2,1,2,2,3,3,1,4,1,5,1,6,2,7,1,8,1,9,2,10,2,11,1,12,1,13,3,14,2,15,1,16,1,17,1,18,2,19,2,20,2,21,1,22,2,23,2,24,2,27,2,28,5,29,1,32,3,34,2,35,2,36,2,37,4,38,3,39,3,40,3,41,4,42,3,43,2,44,3,45,2,46,1,47,2,50,1,51,2,52,2,53,1,54,1,55,1,56,2,57,1,58,2,59,2,60,2,61,2,62,2,63,2,64,2,65,2,66,1,67,2,68,2,69,1,70,1,71,1,72,2,73,1,74,1,75,1,76,2,77,2,78,4,79,4,81,1,82,1],"valu":[0,2,6,1,10,1,17,1,18,6,19,4,21,1,22,2,25,3,26,2,28,1,30,2,31,2,35,1,37,1,38,2,43,2,48,1,49,1,50,2,51,1,52,2,53,2,54,1,55,2,56,2,57,1,61,2,63,2,66,2,67,1,68,1,69,1,70,1,72,1,73,2,74,1,76,1,77,1,78,1,79,1,80,1],"previous":[0,1,8,1,9,2],"operation":[0,1,1,1,6,1,14,1,25,1,33,2,35,1,45,1,46,1,48,1,51,1,56,4,57,2,58,2,59,1,60,1,65,1,67,1,69,2,70,2,71,1,73,3,74,4,76,1,77,1,80,1],"stor":[0,1,1,1,2,2,6,1,10,1,18,1,19,1,21,1,22,1,23,1,26,1,28,1,29,1,32,1,34,1,39,3,40,1,41,1,43,1,47,1,48,2,49,1,56,4,57,2,58,1,59,1,60,1,61,1,63,1,65,1,67,3,68,1,69,2,70,2,71,2,72,2,73,3,80,2,81,1,82,1],"result":[0,4,1,3,2,2,5,2,6,3,7,1,8,2,9,5,17,1,18,2,19,2,20,2,21,3,22,4,23,3,24,2,25,3,26,3,29,1,32,2,34,3,35,1,37,2,39,1,40,1,43,6,51,1,52,2,53,1,55,1,56,2,57,1,58,3,59,3,60,7,61,6,62,2,63,7,65,3,67,4,68,5,69,1,70,1,71,4,72,5,73,3,74,4,76,1,77,1,78,2,79,2,81,2,82,2],"affect":[0,1,1,1,2,2,3,1,4,1,5,1,6,2,7,1,8,1,9,2,11,1,12,1,13,1,14,1,15,1,16,1,17,2,18,2,19,2,20,2,21,1,22,3,23,1,24,2,25,3,26,1,27,2,28,1,29,2,30,2,31,2,32,3,34,1,35,2,36,1,37,1,38,2,39,2,40,2,41,1,42,2,43,1,44,1,45,1,46,1,47,2,48,1,49,1,50,2,51,3,52,1,53,2,54,1,55,2,56,2,57,1,58,2,59,1,61,2,62,2,63,1,65,1,66,2,67,1,68,1,69,1,70,1,72,2,73,1,74,1,75,1,76,2,77,2,78,1,79,1,80,1],"set":[0,4,1,2,2,3,4,1,5,1,6,3,7,1,11,1,12,2,14,2,16,2,17,3,18,4,19,4,20,2,21,2,22,2,23,2,24,2,25,2,26,3,29,2,30,2,31,2,32,3,34,2,37,2,38,1,39,3,40,3,41,1,43,4,44,2,45,3,46,2,50,2,51,2,52,2,53,2,55,2,58,3,59,2,60,6,61,3,62,3,63,4,65,2,66,2,67,2,68,4,71,3,72,4,74,3,78,2,79,2,81,1,82,4],"flag":[0,6,1,4,2,3,3,2,4,3,5,3,6,2,7,1,8,4,9,1,10,1,11,4,12,3,13,4,14,3,15,1,16,5,17,4,18,4,19,4,20,3,21,5,22,5,23,4,24,2,25,4,26,3,27,1,28,1,29,5,30,1,31,3,32,4,34,4,35,1,36,1,37,2,38,2,39,3,40,2,41,1,42,1,43,7,44,4,45,2,46,1,47,1,48,1,49,1,50,2,51,1,52,2,53,3,54,1,55,3,56,2,57,1,58,4,59,8,60,11,61,5,62,4,63,5,65,2,66,1,67,5,68,6,69,1,70,1,71,5,72,5,73,1,74,1,75,1,76,1,77,1,78,2,79,2,80,1,81,1,82,1],"sum":[0,2,68,2],"binary":[0,1,23,1,34,1,60,1,68,1],"exc":[0,2,43,1,63,1,68,2],"255":[0,1,68,1],"decimal":[0,1,14,3,45,4,60,2,68,1],"99":[0,1,68,1],"otherwis":[0,4,1,2,2,1,6,1,17,1,18,1,19,3,20,2,21,2,22,2,23,2,24,2,25,2,26,2,29,1,30,2,31,2,32,1,34,2,37,2,39,1,40,1,43,3,50,2,51,2,52,1,53,1,55,2,58,1,59,2,60,6,61,2,62,1,63,3,65,2,66,2,67,2,68,4,71,2,72,2,74,2,78,2,79,2,81,1,82,1],"reset":[0,4,1,2,2,1,3,1,6,1,8,1,9,2,11,1,13,1,17,3,18,3,20,2,21,2,22,2,23,2,24,2,25,2,26,2,29,2,30,2,31,2,32,2,34,2,37,2,39,1,40,1,43,4,46,1,50,2,51,2,52,2,53,2,55,2,58,2,59,2,60,6,61,3,62,3,63,4,64,1,65,2,66,2,67,2,68,4,71,2,72,2,74,3,78,2,79,2,81,4,82,1],"overflow":[0,2,2,1,11,2,12,2,16,5,18,1,19,1,20,1,21,1,22,1,24,1,25,1,26,1,29,1,32,1,37,1,39,1,40,1,43,1,50,1,51,1,52,1,53,1,55,1,58,1,61,1,62,1,63,1,65,1,68,2,72,1,78,1,79,1],"sign":[0,1,68,1],"bit":[0,2,1,3,2,8,3,2,6,5,7,2,9,4,13,1,17,1,18,1,19,2,20,1,21,1,22,1,23,3,24,1,25,2,26,1,29,1,30,1,31,1,32,4,34,3,37,1,39,7,40,6,43,1,44,1,50,2,51,1,52,1,53,1,55,1,56,4,57,3,58,6,59,3,60,11,61,3,62,1,63,1,65,3,66,1,67,6,68,5,69,3,70,3,71,7,72,7,73,5,74,6,78,1,79,1,81,5,82,5],"7":[0,2,1,1,2,3,6,1,9,2,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,29,1,30,1,31,1,34,1,37,1,39,2,40,2,43,1,50,1,51,1,52,1,53,1,55,1,59,1,60,2,61,1,62,1,63,1,65,1,66,1,67,2,68,3,71,3,72,1,74,1,78,1,79,1],"chang":[0,1,10,2,16,1,32,1,37,1,38,1,52,1,54,1,68,1,78,1,79,1],"due":[0,1,68,1],"exceed":[0,1,68,1],"127":[0,1,43,2,63,2,68,1],"128":[0,1,68,1],"negativ":[0,2,1,2,23,2,29,2,34,2,43,1,59,3,61,1,63,1,67,2,68,2,71,2,72,2],"contain":[0,1,18,1,19,1,22,1,28,1,68,1,71,2,72,1],"zero":[0,2,1,2,5,1,6,1,8,2,19,1,23,2,26,1,29,3,30,1,31,1,34,2,37,1,52,1,57,2,59,2,65,1,66,1,67,2,68,2,74,1,78,1,79,1,80,1,81,2,82,2],"0":[0,1,1,1,2,3,5,1,9,2,13,1,14,2,15,1,16,2,20,1,21,1,22,3,23,1,24,1,25,1,32,3,34,1,39,3,40,3,43,3,50,1,51,1,53,1,55,1,58,3,59,1,60,2,61,3,63,3,67,2,68,2,71,3,72,3,80,1],"transfer":[1,1,10,1,23,1,28,2,29,1,34,1,35,1,36,1,38,1,41,1,47,1,48,1,49,1,50,1,51,1,52,2,53,1,54,2,55,1,56,1,57,1,69,1,70,1,73,2,74,1,76,1,77,1,80,1],"adder":[1,1,18,1,23,1,34,1],"perform":[1,1,6,1,19,1,23,1,28,1,34,1,56,2,57,1,58,1,59,1,60,1,61,1,65,1,67,1,69,1,70,1,71,1,72,1,73,2,74,1,81,1,82,1],"back":[1,1,41,1,59,1,60,1,65,1,67,1,81,1,82,1],"has":[1,1,21,1,23,1,25,1,26,1,34,1,43,2,50,1,51,1,53,1,55,1,59,1,60,1,61,1,63,1,67,1],"asl":[2,2],"arithmetic":[2,1,43,1,45,1,61,1,63,1,71,1],"shift":[2,4,32,7,39,2,40,4,58,4,60,3,67,1,68,3,71,2,72,3],"left":[2,4,39,4,67,2,71,2],"either":[2,2,10,1,32,2,39,2,40,2,51,1],"address":[2,1,18,1,20,1,24,1,28,3,37,1,39,1,40,1,48,1,49,1,56,1,57,6,62,1,63,1,67,1,68,1,69,3,70,3,71,1,73,3,78,1,79,1,80,1],"location":[2,1,6,1,18,1,19,1,20,1,24,1,27,2,28,1,32,2,35,2,37,1,41,1,48,1,49,1,56,1,57,1,62,1,63,1,69,1,70,1,71,1,72,1,73,1,76,2,77,2,78,1,79,1,80,1],"1":[2,2,9,1,20,1,24,1,25,1,29,1,30,1,31,1,32,2,35,1,37,2,39,2,40,2,44,2,45,2,46,1,57,2,58,1,60,1,62,1,63,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,1,76,1,77,1,78,2,79,2],"alway":[2,1,32,2,58,2,71,2,72,1,75,1],"being":[2,2,6,5,32,2,39,2,58,2,67,2,71,2,72,2],"input":[2,3,32,1,39,4,40,2,67,2,71,1,72,1],"read":[2,1,32,1],"modify":[2,1,32,1],"writ":[2,1,32,1],"only":[2,1,3,1,4,1,5,1,7,1,8,1,9,1,11,1,12,1,18,1,22,1,27,1,30,1,31,1,35,1,42,1,50,1,51,1,54,1,66,1,76,1,77,1],"doe":[2,1,4,1,5,1,6,2,7,1,8,1,11,1,12,1,18,3,19,1,20,2,21,1,22,2,24,2,25,3,26,1,29,1,30,1,31,1,32,2,37,1,39,2,40,2,42,1,47,1,49,1,50,1,51,1,52,1,53,2,54,1,55,2,58,1,62,2,65,1,66,1,72,1,74,1,75,1,78,1,79,1],"not":[2,1,3,1,4,1,5,1,6,2,7,1,8,5,11,2,12,1,17,1,18,4,19,2,20,2,21,1,22,2,24,2,25,3,26,1,29,1,30,1,31,1,32,2,37,1,39,2,40,2,42,1,43,1,47,1,49,1,50,1,51,1,52,1,53,2,54,1,55,2,58,1,61,1,62,2,64,1,65,1,66,1,72,1,74,1,75,1,78,1,79,1],"n":[2,1,6,2,7,2,9,2,17,1,18,2,19,1,20,1,21,2,22,2,24,1,25,2,26,2,30,2,31,2,32,1,37,1,39,1,40,1,50,2,51,1,52,1,53,1,55,1,58,1,60,1,62,1,65,1,66,2,74,2,78,1,79,1],"equal":[2,2,5,2,6,1,8,1,17,2,18,2,19,2,32,1,39,2,40,2,43,1,51,1,52,1,54,1,58,1,61,1,62,2,63,1,71,1,72,1],"6":[2,1,6,1,39,1,60,4],"z":[2,2,5,2,6,2,8,3,17,1,18,2,20,1,21,2,22,2,24,1,25,2,26,2,30,1,31,2,32,1,37,1,39,2,40,2,43,1,50,1,51,1,52,1,53,1,55,1,58,1,60,2,61,1,62,1,63,1,65,1,66,1,71,2,72,1,74,1,78,1,79,1],"bcc":[3,1],"branch":[3,2,4,2,5,3,7,2,8,3,9,6,11,2,12,2,75,2],"clear":[3,1,11,1,13,2,14,1,15,2,16,2,19,3],"test":[3,1,6,3,8,1,9,1,11,1,12,1,81,3,82,3],"stat":[3,1,16,1,41,2],"tak":[3,1,4,1,5,1,7,1,8,1,9,1,11,1,12,1,50,1,75,1],"conditional":[3,1,4,1,5,1,7,1,8,1,9,1,11,1,12,1],"no":[3,1,9,1,10,1,13,2,14,2,15,2,16,2,19,1,27,1,28,1,33,2,35,1,36,1,38,1,41,1,44,2,45,2,46,2,48,1,56,2,57,1,69,1,70,1,73,1,76,1,77,1,80,1],"register":[3,1,4,1,5,1,8,1,9,1,10,1,11,1,12,1,13,1,14,1,15,1,16,1,18,7,19,5,20,1,21,3,22,7,24,1,25,4,26,5,27,1,30,3,31,3,32,1,35,1,36,1,37,3,38,4,39,1,41,1,44,1,45,1,46,1,47,1,48,3,49,3,50,4,51,4,52,1,53,3,54,2,55,3,56,5,57,3,61,6,62,1,65,1,66,3,69,3,70,3,73,3,74,2,76,3,77,3,78,7,79,7,80,1],"other":[3,1,5,1,7,2,8,1,9,2,10,1,11,1,12,1,13,1,14,1,15,1,16,1,25,2,29,1,38,1,41,1,44,1,45,1,46,1,52,1,53,2,55,2,74,1,75,2],"than":[3,1,5,1,7,1,8,1,9,1,10,1,11,1,12,1,13,1,14,1,15,1,16,1,17,2,18,2,19,1,25,1,38,1,43,2,44,1,45,1,46,1,53,1,55,1,60,3,61,2,62,2,63,2,75,1],"program":[3,1,4,1,5,1,7,1,8,1,10,3,11,1,12,1,27,5,28,10,41,2,42,4,75,1],"counter":[3,1,4,1,5,1,7,1,8,1,9,2,10,2,11,1,12,1,27,4,28,6,41,2,42,2,75,1],"c":[3,1,18,1,30,1,31,1,60,4,66,1,74,1],"bcs":[4,2],"any":[4,1,5,1,7,2,8,1,11,1,12,1,18,1,20,1,24,1,25,1,32,1,42,1,49,1,53,1,54,1,55,1,62,1,75,2],"except":[4,1],"beq":[5,2],"could":[5,1,8,1,38,1],"also":[5,1,8,1,13,1,18,1,19,1,37,1,44,1,78,1,79,1],"call":[5,1,8,1],"whenever":[5,1],"previ":[5,1],"ous":[5,1],"between":[6,2,18,1,19,1,81,1,82,1],"but":[6,1,18,1,28,1,32,1],"v":[6,2,11,1,12,2,30,1,31,1,60,5,66,1,74,1],"bmi":[7,2],"minus":[7,1,9,3],"part":[7,1,75,1],"machin":[7,1,18,1,74,2,75,1],"bne":[8,2],"indicat":[8,1,43,2,61,1,63,1],"bpl":[9,2],"plus":[9,1,37,1,41,1,57,2,69,1,70,1,73,1,78,1,79,1],"complementary":[9,1],"used":[9,2,13,1,16,1,19,1,44,1,46,1],"off":[9,1],"determin":[9,1],"p":[9,2],"brk":[10,2],"break":[10,4],"command":[10,2,46,1],"caus":[10,1,18,1,24,1,28,1],"microprocessor":[10,2,13,1,14,1,15,2,16,1,19,1,20,1,27,1,29,1,36,1,40,1,41,3,44,1,45,1,46,1,48,1,49,1,56,2,57,1,62,1,64,1,69,1,70,1,73,1,74,3,80,1],"go":[10,1],"through":[10,1,22,1],"inter":[10,1],"rupt":[10,1],"sequenc":[10,1,27,1],"under":[10,1],"control":[10,2,28,1],"mean":[10,1],"second":[10,1],"byt":[10,1,27,2,28,2,73,1],"after":[10,1,27,2,28,1,40,1],"automatically":[10,1,35,1,76,1,77,1],"stack":[10,1,28,5,35,4,36,3,37,6,38,3,41,1,42,2,52,3,54,3,65,3,73,4,76,4,77,4,78,6,79,6],"along":[10,1],"processor":[10,1,36,2,38,2,41,1,47,1],"status":[10,1,11,1,27,1,36,2,38,4,41,1,47,1],"begin":[10,1,28,1],"interrupt":[10,1,15,4,41,7,46,5],"vector":[10,1],"bvc":[11,2],"bvs":[12,2],"clc":[13,1],"initializ":[13,1,15,1,44,2,46,1],"op":[13,1,27,1,44,1],"eration":[13,1,44,1],"should":[13,1,44,1],"normally":[13,1,44,1],"preced":[13,1,44,1],"loop":[13,1,44,1],"useful":[13,1,44,1],"r0l":[13,1],"cld":[14,2],"mod":[14,3,38,1,45,3,57,3,60,3,69,1,70,1,73,1],"all":[14,1,38,2,39,2,40,2,41,1,45,1,61,1,81,1,82,1],"subsequent":[14,1,45,1],"sbc":[14,1,43,1,44,1,45,1,63,1],"operat":[14,1,45,1],"simpl":[14,1],"cli":[15,1],"disabl":[15,3,46,3],"allow":[15,1,18,1,28,1,41,1],"receiv":[15,1],"clv":[16,2],"com":[16,1],"mand":[16,1],"conjunction":[16,1],"pin":[16,1,74,1],"can":[16,1],"external":[16,1],"signal":[16,1],"cmp":[17,2],"compar":[17,1,18,1,19,1,62,1],"subtract":[17,1,18,1,19,1,20,1,21,1,22,1,43,2,61,2,62,2,63,2],"content":[17,2,18,2,20,1,24,1,29,1,36,1,37,3,47,1,50,2,51,1,52,1,53,1,54,1,55,1,62,3,63,1,74,2,78,3,79,3],"use":[17,1,18,1,37,1,78,1,79,1],"follow":[17,1,28,2,42,1,57,1,74,1],"comparison":[17,1,18,1,62,1],"less":[17,1,43,1,61,1,62,1,63,1],"greater":[17,1,18,2,19,1,43,1,60,1,61,1,62,1,63,1],"cpx":[18,2],"index":[18,6,19,4,21,3,22,4,25,1,26,1,30,2,31,2,48,1,49,1,50,4,51,4,52,5,53,3,54,3,55,2,56,2,57,4,61,6,65,1,66,2,69,2,70,2,73,2,74,2,76,2,77,2,78,4,79,4],"x":[18,6,21,4,25,5,30,3,48,2,50,5,52,5,53,3,54,3,56,3,57,2,61,6,65,1,66,3,69,2,70,1,73,2,74,2,76,3,78,5],"using":[18,1,26,1,28,1,43,1,61,1,63,1,81,1,82,1],"therefor":[18,1,25,1,43,1],"absolut":[18,1,57,1],"data":[18,1,27,2,29,1,41,1,57,1,60,1,74,1],"subtraction":[18,1,19,2],"cpy":[19,2],"y":[19,4,22,8,26,6,31,3,49,2,51,5,55,3,57,4,69,1,70,2,73,1,77,3,79,5],"two":[19,1,20,1,43,1,57,1,61,1,62,1,63,1,74,1],"s":[19,1,20,1,43,1,57,2,60,1,61,1,62,1,63,1,69,1,70,1,73,1],"complement":[19,1,20,1,43,2,61,1,62,1,63,1],"specifi":[19,1,32,2,72,1],"anywher":[19,1],"strictly":[19,1],"will":[19,6,64,3],"tion":[19,1,28,1,50,1],"dec":[20,1],"decrement":[20,4,21,3,22,5,28,1,35,2,62,1,76,2,77,2],"one":[20,1,21,2,22,2,24,1,25,2,26,3,62,1,63,1,74,1],"internal":[20,1,24,1,32,1,39,1,40,1,62,1],"dex":[21,2,22,1],"current":[21,1,22,1,25,1,26,1,35,1,37,1,76,1,77,1,78,1,79,1],"dey":[22,1],"consider":[22,1],"so":[22,1,42,1],"ff":[22,1,25,1,74,1],"eor":[23,2],"exclusiv":[23,2,72,2],"basis":[23,1,34,1],"inc":[24,1],"increment":[24,4,25,6,26,5,37,1,42,2,63,1,78,1,79,1],"becom":[24,1],"inx":[25,3,26,1],"8":[25,1,57,1,69,1,70,1,73,1],"befor":[25,1,41,1],"00":[25,1,74,1],"iny":[26,2],"cas":[26,1,57,2],"primary":[26,1],"application":[26,1],"step":[26,1],"thru":[26,1],"jmp":[27,2],"indirect":[27,1,57,1],"locat":[27,1],"cod":[27,1,41,1],"load":[27,2,29,1,30,4,31,4,37,1,42,1,50,1,66,4,74,1,78,1,79,1],"low":[27,1,28,3,32,1,42,1,58,1,72,1],"order":[27,2],"pcl":[27,1,42,1],"next":[27,1,28,1,35,2,38,1,76,2,77,2],"high":[27,1,28,3,42,1],"pch":[27,1,42,1],"establish":[27,1],"new":[27,1,28,2],"valn":[27,1],"jsr":[28,4,42,1],"jump":[28,3],"subroutin":[28,3],"leav":[28,1],"return":[28,2,41,1,42,1],"pointer":[28,3,35,1,36,1,37,1,42,1,52,3,54,3,65,3,73,4,76,1,77,1,78,1,79,1],"user":[28,1],"main":[28,1],"complet":[28,1],"accomplish":[28,1],"point":[28,1,35,1,41,1,42,1,76,1,77,1],"last":[28,1],"instruc":[28,1],"onto":[28,1],"count":[28,2,42,2],"first":[28,1,57,1,74,1],"thereby":[28,1,38,1],"direct":[28,1],"2":[28,1],"substitut":[28,1],"lda":[29,4],"execut":[29,1,41,1],"wis":[29,1,52,1,53,1],"ldx":[30,2],"ldy":[31,2],"lsr":[32,1],"logical":[32,1,58,1,72,1,81,1,82,1],"right":[32,5,40,4,58,2,60,2,68,2,72,2],"higher":[32,1,58,1,72,1],"out":[32,1,58,1,72,1],"field":[32,1,58,1,72,1],"nop":[33,1],"ora":[34,2],"pha":[35,1],"push":[35,2,36,1,76,2,77,2],"empty":[35,1,76,1,77,1],"php":[36,2],"reg":[36,1],"ister":[36,1],"unchang":[36,1],"govern":[36,1],"pla":[37,4,78,1,79,1],"pull":[37,1,38,1,78,1,79,1],"plp":[38,2],"proc":[38,1],"sor":[38,1],"switch":[38,1],"rol":[39,3,44,1],"rotat":[39,2,40,3,60,1,67,1,68,1],"ro":[39,1],"tat":[39,1],"ror":[40,3],"regis":[40,1],"ter":[40,1],"availabl":[40,1],"jun":[40,1],"1976":[40,1],"rti":[41,4],"virtu":[41,1],"hav":[41,1],"thei":[41,1],"fact":[41,1],"reinitializ":[41,2],"sam":[41,1],"combination":[41,1],"truly":[41,1],"reentrant":[41,1],"position":[41,1],"they":[41,1],"wer":[41,1],"tim":[41,1],"taken":[41,1],"pre":[41,1],"rts":[42,2],"subroutm":[42,1],"adjust":[42,1],"twic":[42,1],"borrow":[43,5,61,1,63,3],"defin":[43,1],"resultant":[43,1,50,1,53,1,55,1],"occur":[43,1],"sec":[44,1],"sed":[45,2],"d":[45,1],"mak":[45,1,52,1,54,1],"sei":[46,1],"mask":[46,1,81,2,82,2],"request":[46,1],"dur":[46,2],"system":[46,1],"sta":[47,1],"non":[47,1,74,2],"stx":[48,1],"sty":[49,2],"tax":[50,2],"tran":[50,1],"fer":[50,1],"without":[50,1,51,1,53,1,55,1],"disturb":[50,1,53,1,55,1],"aresult":[50,1],"theopera":[50,1],"tay":[51,2],"accumula":[51,1,55,1],"tor":[51,1,55,1],"mov":[51,1,53,1,55,1,59,1],"tsx":[52,4],"txa":[53,2],"txs":[54,2],"tya":[55,2],"sax":[56,3],"undocument":[56,2,57,1,58,1,59,1,60,1,61,1,62,1,63,1,64,1,65,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,1],"sha":[57,2],"thre":[57,1,74,1],"operand":[57,3,60,2,74,2],"third":[57,2,74,1],"depend":[57,1,60,1,74,3],"pag":[57,2],"given":[57,2,69,1,70,1,73,1],"ignor":[57,2,69,1,70,1,73,1],"offset":[57,2,69,1,70,1,73,1],"upper":[57,1,69,1,70,1,73,1],"asr":[58,2],"anc":[59,2],"arr":[60,2],"different":[60,2],"original":[60,1],"0xf0":[60,1],"0x10":[60,1],"0x50":[60,1],"5":[60,1],"sbx":[61,1],"dcp":[62,2],"isc":[63,1],"jam":[64,1],"halt":[64,1],"cpu":[64,1],"stop":[64,1],"execution":[64,1],"fetch":[64,1],"further":[64,1],"neither":[64,1],"handl":[64,2],"irq":[64,1],"nor":[64,1],"nmis":[64,1],"though":[64,1],"las":[65,2],"lax":[66,3],"rla":[67,2],"rra":[68,2],"generat":[68,1],"shx":[69,2],"shy":[70,2],"slo":[71,2],"output":[71,1],"sre":[72,2],"shs":[73,2],"hi":[73,1],"xaa":[74,3],"deterministic":[74,2],"bus":[74,2],"individual":[74,2],"most":[74,1],"magic":[74,2],"component":[74,2],"usually":[74,1],"ee":[74,1],"ef":[74,1],"fe":[74,1],"may":[74,2],"influenc":[74,1],"rdy":[74,1],"leftover":[74,1],"temperatur":[74,1],"suppli":[74,1],"voltag":[74,1],"factor":[74,2],"som":[74,1],"additional":[74,1],"bra":[75,2],"unconditional":[75,1],"phx":[76,1],"phy":[77,1],"plx":[78,3],"ply":[79,3],"stz":[80,1],"trb":[81,1],"both":[81,1,82,1],"invert":[81,1],"tsb":[82,1]}};
+export default segment;
@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"9619353b09d269e215124361c8415c609a26e238","docs":[["AAA","Adjusts the sum of two unpacked BCD values to create an unpacked BCD result. The AL register is the implied source and destination operand for this instruction. The AAA instruction is only useful when it follows an ADD instruction that adds (binary addition) two unpacked BCD values and stores a byte result in the AL register. The AAA instruction then adjusts the contents of the AL register to contain the correct 1-digit unpacked BCD result."],["AAD","Adjusts two unpacked BCD digits (the least-significant digit in the AL register and the most-significant digit in the AH register) so that a division operation performed on the result will yield a correct unpacked BCD value. The AAD instruction is only useful when it precedes a DIV instruction that divides (binary division) the adjusted value in the AX register by an unpacked BCD value."],["AAM","Adjusts the result of the multiplication of two unpacked BCD values to create a pair of unpacked (base 10) BCD values. The AX register is the implied source and destination operand for this instruction. The AAM instruction is only useful when it follows an MUL instruction that multiplies (binary multiplication) two unpacked BCD values and stores a word result in the AX register. The AAM instruction then adjusts the contents of the AX register to contain the correct 2-digit unpacked (base 10) BCD result."],["AAS","Adjusts the result of the subtraction of two unpacked BCD values to create a unpacked BCD result. The AL register is the implied source and destination operand for this instruction. The AAS instruction is only useful when it follows a SUB instruction that subtracts (binary subtraction) one unpacked BCD value from another and stores a byte result in the AL register. The AAA instruction then adjusts the contents of the AL register to contain the correct 1-digit unpacked BCD result."],["ADC","Adds the destination operand (first operand), the source operand (second operand), and the carry (CF) flag and stores the result in the destination operand. The destination operand can be a register or a memory location; the source operand can be an immediate, a register, or a memory location. (However, two memory operands cannot be used in one instruction.) The state of the CF flag represents a carry from a previous addition. When an immediate value is used as an operand, it is sign-extended to the length of the destination operand format."],["ADCX","Performs an unsigned addition of the destination operand (first operand), the source operand (second operand) and the carry-flag (CF) and stores the result in the destination operand. The destination operand is a general-purpose register, whereas the source operand can be a general-purpose register or memory location. The state of CF can represent a carry from a previous addition. The instruction sets the CF flag with the carry generated by the unsigned addition of the operands."],["ADD","Adds the destination operand (first operand) and the source operand (second operand) and then stores the result in the destination operand. The destination operand can be a register or a memory location; the source operand can be an immediate, a register, or a memory location. (However, two memory operands cannot be used in one instruction.) When an immediate value is used as an operand, it is sign-extended to the length of the destination operand format."],["ADDPD","Adds two, four or eight packed double-precision floating-point values from the first source operand to the second source operand, and stores the packed double-precision floating-point result in the destination operand."],["ADDPS","Adds four, eight or sixteen packed single-precision floating-point values from the first source operand with the second source operand, and stores the packed single-precision floating-point result in the destination operand."],["ADDSD","Adds the low double-precision floating-point values from the second source operand and the first source operand and stores the double-precision floating-point result in the destination operand."],["ADDSS","Adds the low single-precision floating-point values from the second source operand and the first source operand, and stores the single-precision floating-point result in the destination operand."],["ADDSUBPD","Adds odd-numbered double-precision floating-point values of the first source operand (second operand) with the corresponding double-precision floating-point values from the second source operand (third operand); stores the result in the odd-numbered values of the destination operand (first operand). Subtracts the even-numbered double-precision floating-point values from the second source operand from the corresponding double-precision floating values in the first source operand; stores the result into the even-numbered values of the destination operand."],["ADDSUBPS","Adds odd-numbered single-precision floating-point values of the first source operand (second operand) with the corresponding single-precision floating-point values from the second source operand (third operand); stores the result in the odd-numbered values of the destination operand (first operand). Subtracts the even-numbered single-precision floating-point values from the second source operand from the corresponding single-precision floating values in the first source operand; stores the result into the even-numbered values of the destination operand."],["ADOX","Performs an unsigned addition of the destination operand (first operand), the source operand (second operand) and the overflow-flag (OF) and stores the result in the destination operand. The destination operand is a general-purpose register, whereas the source operand can be a general-purpose register or memory location. The state of OF represents a carry from a previous addition. The instruction sets the OF flag with the carry generated by the unsigned addition of the operands."],["AESDEC","This instruction performs a single round of the AES decryption flow using the Equivalent Inverse Cipher, using one/two/four (depending on vector length) 128-bit data (state) from the first source operand with one/two/four (depending on vector length) round key(s) from the second source operand, and stores the result in the destination operand."],["AESDECLAST","This instruction performs the last round of the AES decryption flow using the Equivalent Inverse Cipher, using one/two/four (depending on vector length) 128-bit data (state) from the first source operand with one/two/four (depending on vector length) round key(s) from the second source operand, and stores the result in the destination operand."],["AESENC","This instruction performs a single round of an AES encryption flow using one/two/four (depending on vector length) 128-bit data (state) from the first source operand with one/two/four (depending on vector length) round key(s) from the second source operand, and stores the result in the destination operand."],["AESENCLAST","This instruction performs the last round of an AES encryption flow using one/two/four (depending on vector length) 128-bit data (state) from the first source operand with one/two/four (depending on vector length) round key(s) from the second source operand, and stores the result in the destination operand."],["AESIMC","Perform the InvMixColumns transformation on the source operand and store the result in the destination operand. The destination operand is an XMM register. The source operand can be an XMM register or a 128-bit memory location."],["AESKEYGENASSIST","Assist in expanding the AES cipher key, by computing steps towards generating a round key for encryption, using 128-bit data specified in the source operand and an 8-bit round constant specified as an immediate, store the result in the destination operand."],["AND","Performs a bitwise AND operation on the destination (first) and source (second) operands and stores the result in the destination operand location. The source operand can be an immediate, a register, or a memory location; the destination operand can be a register or a memory location. (However, two memory operands cannot be used in one instruction.) Each bit of the result is set to 1 if both corresponding bits of the first and second operands are 1; otherwise, it is set to 0."],["ANDN","Performs a bitwise logical AND of inverted second operand (the first source operand) with the third operand (the"],["ANDNPD","Performs a bitwise logical AND NOT of the two, four or eight packed double-precision floating-point values from the first source operand and the second source operand, and stores the result in the destination operand."],["ANDNPS","Performs a bitwise logical AND NOT of the four, eight or sixteen packed single-precision floating-point values from the first source operand and the second source operand, and stores the result in the destination operand."],["ANDPD","Performs a bitwise logical AND of the two, four or eight packed double-precision floating-point values from the first source operand and the second source operand, and stores the result in the destination operand."],["ANDPS","Performs a bitwise logical AND of the four, eight or sixteen packed single-precision floating-point values from the first source operand and the second source operand, and stores the result in the destination operand."],["ARPL","Compares the RPL fields of two segment selectors. The first operand (the destination operand) contains one segment selector and the second operand (source operand) contains the other. (The RPL field is located in bits 0 and 1 of each operand.) If the RPL field of the destination operand is less than the RPL field of the source operand, the ZF flag is set and the RPL field of the destination operand is increased to match that of the source operand. Otherwise, the ZF flag is cleared and no change is made to the destination operand. (The destination operand can be a word register or a memory location; the source operand must be a word register.)"],["BEXTR","Extracts contiguous bits from the first source operand (the second operand) using an index value and length value specified in the second source operand (the third operand). Bit 7:0 of the second source operand specifies the starting bit position of bit extraction. A START value exceeding the operand size will not extract any bits from the second source operand. Bit 15:8 of the second source operand specifies the maximum number of bits (LENGTH) beginning at the START position to extract. Only bit positions up to (OperandSize -1) of the first source operand are extracted. The extracted bits are written to the destination register, starting from the least significant bit. All higher order bits in the destination operand (starting at bit position LENGTH) are zeroed. The destination register is cleared if no bits are extracted."],["BLENDPD","Double-precision floating-point values from the second source operand (third operand) are conditionally merged with values from the first source operand (second operand) and written to the destination operand (first operand). The immediate bits [3:0] determine whether the corresponding double-precision floating-point value in the destination is copied from the second source or first source. If a bit in the mask, corresponding to a word, is ”1”, then the double-precision floating-point value in the second source operand is copied, else the value in the first source operand is copied."],["BLENDPS","Packed single-precision floating-point values from the second source operand (third operand) are conditionally merged with values from the first source operand (second operand) and written to the destination operand (first operand). The immediate bits [7:0] determine whether the corresponding single precision floating-point value in the destination is copied from the second source or first source. If a bit in the mask, corresponding to a word, is “1”, then the single-precision floating-point value in the second source operand is copied, else the value in the first source operand is copied."],["BLENDVPD","Conditionally copy each quadword data element of double-precision floating-point value from the second source operand and the first source operand depending on mask bits defined in the mask register operand. The mask bits are the most significant bit in each quadword element of the mask register."],["BLENDVPS","Conditionally copy each dword data element of single-precision floating-point value from the second source operand and the first source operand depending on mask bits defined in the mask register operand. The mask bits are the most significant bit in each dword element of the mask register."],["BLSI","Extracts the lowest set bit from the source operand and set the corresponding bit in the destination register. All other bits in the destination operand are zeroed. If no bits are set in the source operand, BLSI sets all the bits in the destination to 0 and sets ZF and CF."],["BLSMSK","Sets all the lower bits of the destination operand to “1” up to and including lowest set bit (=1) in the source operand. If source operand is zero, BLSMSK sets all bits of the destination operand to 1 and also sets CF to 1."],["BLSR","Copies all bits from the source operand to the destination operand and resets (=0) the bit position in the destination operand that corresponds to the lowest set bit of the source operand. If the source operand is zero BLSR sets CF."],["BNDCL","Compare the address in the second operand with the lower bound in bnd. The second operand can be either a register or memory operand. If the address is lower than the lower bound in bnd.LB, it will set BNDSTATUS to 01H and signal a #BR exception."],["BNDCN","Compare the address in the second operand with the upper bound in bnd. The second operand can be either a register or a memory operand. If the address is higher than the upper bound in bnd.UB, it will set BNDSTATUS to 01H and signal a #BR exception."],["BNDLDX","BNDLDX uses the linear address constructed from the base register and displacement of the SIB-addressing form of the memory operand (mib) to perform address translation to access a bound table entry and conditionally load the bounds in the BTE to the destination. The destination register is updated with the bounds in the BTE, if the content of the index register of mib matches the pointer value stored in the BTE."],["BNDMK","Makes bounds from the second operand and stores the lower and upper bounds in the bound register bnd. The second operand must be a memory operand. The content of the base register from the memory operand is stored in the lower bound bnd.LB. The 1's complement of the effective address of m32/m64 is stored in the upper bound b.UB. Computation of m32/m64 has identical behavior to LEA."],["BNDMOV","BNDMOV moves a pair of lower and upper bound values from the source operand (the second operand) to the destination (the first operand). Each operation is 128-bit move. The exceptions are same as the MOV instruction. The memory format for loading/store bounds in 64-bit mode is shown in Figure 3-5."],["BNDSTX","BNDSTX uses the linear address constructed from the displacement and base register of the SIB-addressing form of the memory operand (mib) to perform address translation to store to a bound table entry. The bounds in the source operand bnd are written to the lower and upper bounds in the BTE. The content of the index register of mib is written to the pointer value field in the BTE."],["BOUND","BOUND determines if the first operand (array index) is within the bounds of an array specified the second operand (bounds operand). The array index is a signed integer located in a register. The bounds operand is a memory location that contains a pair of signed doubleword-integers (when the operand-size attribute is 32) or a pair of signed word-integers (when the operand-size attribute is 16). The first doubleword (or word) is the lower bound of the array and the second doubleword (or word) is the upper bound of the array. The array index must be greater than or equal to the lower bound and less than or equal to the upper bound plus the operand size in bytes. If the index is not within bounds, a BOUND range exceeded exception (#BR) is signaled. When this exception is generated, the saved return instruction pointer points to the BOUND instruction."],["BSF","Searches the source operand (second operand) for the least significant set bit (1 bit). If a least significant 1 bit is found, its bit index is stored in the destination operand (first operand). The source operand can be a register or a memory location; the destination operand is a register. The bit index is an unsigned offset from bit 0 of the source operand. If the content of the source operand is 0, the content of the destination operand is undefined."],["BSR","Searches the source operand (second operand) for the most significant set bit (1 bit). If a most significant 1 bit is found, its bit index is stored in the destination operand (first operand). The source operand can be a register or a memory location; the destination operand is a register. The bit index is an unsigned offset from bit 0 of the source operand. If the content source operand is 0, the content of the destination operand is undefined."],["BSWAP","Reverses the byte order of a 32-bit or 64-bit (destination) register. This instruction is provided for converting little-endian values to big-endian format and vice versa. To swap bytes in a word value (16-bit register), use the XCHG instruction. When the BSWAP instruction references a 16-bit register, the result is undefined."],["BT","Selects the bit in a bit string (specified with the first operand, called the bit base) at the bit-position designated by the bit offset (specified by the second operand) and stores the value of the bit in the CF flag. The bit base operand can be a register or a memory location; the bit offset operand can be a register or an immediate value"],["BTC","Selects the bit in a bit string (specified with the first operand, called the bit base) at the bit-position designated by the bit offset operand (second operand), stores the value of the bit in the CF flag, and complements the selected bit in the bit string. The bit base operand can be a register or a memory location; the bit offset operand can be a register or an immediate value"],["BTR","Selects the bit in a bit string (specified with the first operand, called the bit base) at the bit-position designated by the bit offset operand (second operand), stores the value of the bit in the CF flag, and clears the selected bit in the bit string to 0. The bit base operand can be a register or a memory location; the bit offset operand can be a register or an immediate value"],["BTS","Selects the bit in a bit string (specified with the first operand, called the bit base) at the bit-position designated by the bit offset operand (second operand), stores the value of the bit in the CF flag, and sets the selected bit in the bit string to 1. The bit base operand can be a register or a memory location; the bit offset operand can be a register or an immediate value"],["BZHI","BZHI copies the bits of the first source operand (the second operand) into the destination operand (the first operand) and clears the higher bits in the destination according to the INDEX value specified by the second source operand (the third operand). The INDEX is specified by bits 7:0 of the second source operand. The INDEX value is saturated at the value of OperandSize -1. CF is set, if the number contained in the 8 low bits of the third operand is greater than OperandSize -1."],["CALL","Saves procedure linking information on the stack and branches to the called procedure specified using the target operand. The target operand specifies the address of the first instruction in the called procedure. The operand can be an immediate value, a general-purpose register, or a memory location."],["CBW","Double the size of the source operand by means of sign extension. The CBW (convert byte to word) instruction copies the sign (bit 7) in the source operand into every bit in the AH register. The CWDE (convert word to double-word) instruction copies the sign (bit 15) of the word in the AX register into the high 16 bits of the EAX register."],["CLAC","Clears the AC flag bit in EFLAGS register. This disables any alignment checking of user-mode data accesses. If the SMAP bit is set in the CR4 register, this disallows explicit supervisor-mode data accesses to user-mode pages."],["CLC","Clears the CF flag in the EFLAGS register. Operation is the same in all modes."],["CLD","Clears the DF flag in the EFLAGS register. When the DF flag is set to 0, string operations increment the index registers (ESI and/or EDI). Operation is the same in all modes."],["CLDEMOTE","Hints to hardware that the cache line that contains the linear address specified with the memory operand should be moved (“demoted”) from the cache(s) closest to the processor core to a level more distant from the processor core. This may accelerate subsequent accesses to the line by other cores in the same coherence domain, especially if the line was written by the core that demotes the line. Moving the line in such a manner is a performance optimization, i.e., it is a hint which does not modify architectural state. Hardware may choose which level in the cache hierarchy to retain the line (e.g., L3 in typical server designs). The source operand is a byte memory location."],["CLFLUSH","Invalidates from every level of the cache hierarchy in the cache coherence domain the cache line that contains the linear address specified with the memory operand. If that cache line contains modified data at any level of the cache hierarchy, that data is written back to memory. The source operand is a byte memory location."],["CLI","In most cases, CLI clears the IF flag in the EFLAGS register and no other flags are affected. Clearing the IF flag causes the processor to ignore maskable external interrupts. The IF flag and the CLI and STI instruction have no effect on the generation of exceptions and NMI interrupts."],["CLRSSBSY","Clear busy flag in supervisor shadow stack token reference by m64. Subsequent to marking the shadow stack as not busy the SSP is loaded with value 0."],["CLTS","Clears the task-switched (TS) flag in the CR0 register. This instruction is intended for use in operating-system procedures. It is a privileged instruction that can only be executed at a CPL of 0. It is allowed to be executed in real-address mode to allow initialization for protected mode."],["CLWB","Writes back to memory the cache line (if modified) that contains the linear address specified with the memory operand from any level of the cache hierarchy in the cache coherence domain. The line may be retained in the cache hierarchy in non-modified state. Retaining the line in the cache hierarchy is a performance optimization (treated as a hint by hardware) to reduce the possibility of cache miss on a subsequent access. Hardware may choose to retain the line at any of the levels in the cache hierarchy, and in some cases, may invalidate the line from the cache hierarchy. The source operand is a byte memory location."],["CMC","Complements the CF flag in the EFLAGS register. CMC operation is the same in non-64-bit modes and 64-bit mode."],["CMOVA","Each of the CMOVcc instructions performs a move operation if the status flags in the EFLAGS register (CF, OF, PF, SF, and ZF) are in a specified state (or condition). A condition code (cc) is associated with each instruction to indicate the condition being tested for. If the condition is not satisfied, a move is not performed and execution continues with the instruction following the CMOVcc instruction."],["CMP","Compares the first source operand with the second source operand and sets the status flags in the EFLAGS register according to the results. The comparison is performed by subtracting the second operand from the first operand and then setting the status flags in the same manner as the SUB instruction. When an immediate value is used as an operand, it is sign-extended to the length of the first operand."],["CMPPD","Performs a SIMD compare of the packed double-precision floating-point values in the second source operand and the first source operand and returns the result of the comparison to the destination operand. The comparison predicate operand (immediate byte) specifies the type of comparison performed on each pair of packed values in the two source operands."],["CMPPS","Performs a SIMD compare of the packed single-precision floating-point values in the second source operand and the first source operand and returns the result of the comparison to the destination operand. The comparison predicate operand (immediate byte) specifies the type of comparison performed on each of the pairs of packed values."],["CMPS","Compares the byte, word, doubleword, or quadword specified with the first source operand with the byte, word, doubleword, or quadword specified with the second source operand and sets the status flags in the EFLAGS register according to the results."],["CMPSS","Compares the low single-precision floating-point values in the second source operand and the first source operand and returns the result of the comparison to the destination operand. The comparison predicate operand (immediate operand) specifies the type of comparison performed."],["CMPXCHG","Compares the value in the AL, AX, EAX, or RAX register with the first operand (destination operand). If the two values are equal, the second operand (source operand) is loaded into the destination operand. Otherwise, the destination operand is loaded into the AL, AX, EAX or RAX register. RAX register is available only in 64-bit mode."],["CMPXCHG8B","Compares the 64-bit value in EDX:EAX (or 128-bit value in RDX:RAX if operand size is 128 bits) with the operand (destination operand). If the values are equal, the 64-bit value in ECX:EBX (or 128-bit value in RCX:RBX) is stored in the destination operand. Otherwise, the value in the destination operand is loaded into EDX:EAX (or RDX:RAX). The destination operand is an 8-byte memory location (or 16-byte memory location if operand size is 128 bits). For the EDX:EAX and ECX:EBX register pairs, EDX and ECX contain the high-order 32 bits and EAX and EBX contain the low-order 32 bits of a 64-bit value. For the RDX:RAX and RCX:RBX register pairs, RDX and RCX contain the high-order 64 bits and RAX and RBX contain the low-order 64bits of a 128-bit value."],["COMISD","Compares the double-precision floating-point values in the low quadwords of operand 1 (first operand) and operand 2 (second operand), and sets the ZF, PF, and CF flags in the EFLAGS register according to the result (unordered, greater than, less than, or equal). The OF, SF and AF flags in the EFLAGS register are set to 0. The unordered result is returned if either source operand is a NaN (QNaN or SNaN)."],["COMISS","Compares the single-precision floating-point values in the low quadwords of operand 1 (first operand) and operand 2 (second operand), and sets the ZF, PF, and CF flags in the EFLAGS register according to the result (unordered, greater than, less than, or equal). The OF, SF and AF flags in the EFLAGS register are set to 0. The unordered result is returned if either source operand is a NaN (QNaN or SNaN)."],["CPUID","The ID flag (bit 21) in the EFLAGS register indicates support for the CPUID instruction. If a software procedure can set and clear this flag, the processor executing the procedure supports the CPUID instruction. This instruction operates the same in non-64-bit modes and 64-bit mode."],["CRC32","Starting with an initial value in the first operand (destination operand), accumulates a CRC32 (polynomial 11EDC6F41H) value for the second operand (source operand) and stores the result in the destination operand. The source operand can be a register or a memory location. The destination operand must be an r32 or r64 register. If the destination is an r64 register, then the 32-bit result is stored in the least significant double word and 00000000H is stored in the most significant double word of the r64 register."],["CVTDQ2PD","Converts two, four or eight packed signed doubleword integers in the source operand (the second operand) to two, four or eight packed double-precision floating-point values in the destination operand (the first operand)."],["CVTDQ2PS","Converts four, eight or sixteen packed signed doubleword integers in the source operand to four, eight or sixteen packed single-precision floating-point values in the destination operand."],["CVTPD2DQ","Converts packed double-precision floating-point values in the source operand (second operand) to packed signed doubleword integers in the destination operand (first operand)."],["CVTPD2PI","Converts two packed double-precision floating-point values in the source operand (second operand) to two packed signed doubleword integers in the destination operand (first operand)."],["CVTPD2PS","Converts two, four or eight packed double-precision floating-point values in the source operand (second operand) to two, four or eight packed single-precision floating-point values in the destination operand (first operand)."],["CVTPI2PD","Converts two packed signed doubleword integers in the source operand (second operand) to two packed double-precision floating-point values in the destination operand (first operand)."],["CVTPI2PS","Converts two packed signed doubleword integers in the source operand (second operand) to two packed single-precision floating-point values in the destination operand (first operand)."],["CVTPS2DQ","Converts four, eight or sixteen packed single-precision floating-point values in the source operand to four, eight or sixteen signed doubleword integers in the destination operand."],["CVTPS2PD","Converts two, four or eight packed single-precision floating-point values in the source operand (second operand) to two, four or eight packed double-precision floating-point values in the destination operand (first operand)."],["CVTPS2PI","Converts two packed single-precision floating-point values in the source operand (second operand) to two packed signed doubleword integers in the destination operand (first operand)."],["CVTSD2SI","Converts a double-precision floating-point value in the source operand (the second operand) to a signed double-word integer in the destination operand (first operand). The source operand can be an XMM register or a 64-bit memory location. The destination operand is a general-purpose register. When the source operand is an XMM register, the double-precision floating-point value is contained in the low quadword of the register."],["CVTSD2SS","Converts a double-precision floating-point value in the “convert-from” source operand (the second operand in SSE2 version, otherwise the third operand) to a single-precision floating-point value in the destination operand."],["CVTSI2SD","Converts a signed doubleword integer (or signed quadword integer if operand size is 64 bits) in the “convert-from” source operand to a double-precision floating-point value in the destination operand. The result is stored in the low quadword of the destination operand, and the high quadword left unchanged. When conversion is inexact, the value returned is rounded according to the rounding control bits in the MXCSR register."],["CVTSI2SS","Converts a signed doubleword integer (or signed quadword integer if operand size is 64 bits) in the “convert-from” source operand to a single-precision floating-point value in the destination operand (first operand). The “convert-from” source operand can be a general-purpose register or a memory location. The destination operand is an XMM register. The result is stored in the low doubleword of the destination operand, and the upper three doublewords are left unchanged. When a conversion is inexact, the value returned is rounded according to the rounding control bits in the MXCSR register or the embedded rounding control bits."],["CVTSS2SD","Converts a single-precision floating-point value in the “convert-from” source operand to a double-precision floating-point value in the destination operand. When the “convert-from” source operand is an XMM register, the single-precision floating-point value is contained in the low doubleword of the register. The result is stored in the low quadword of the destination operand."],["CVTSS2SI","Converts a single-precision floating-point value in the source operand (the second operand) to a signed double-word integer (or signed quadword integer if operand size is 64 bits) in the destination operand (the first operand). The source operand can be an XMM register or a memory location. The destination operand is a general-purpose register. When the source operand is an XMM register, the single-precision floating-point value is contained in the low doubleword of the register."],["CVTTPD2DQ","Converts two, four or eight packed double-precision floating-point values in the source operand (second operand) to two, four or eight packed signed doubleword integers in the destination operand (first operand)."],["CVTTPD2PI","Converts two packed double-precision floating-point values in the source operand (second operand) to two packed signed doubleword integers in the destination operand (first operand). The source operand can be an XMM register or a 128-bit memory location. The destination operand is an MMX technology register."],["CVTTPS2DQ","Converts four, eight or sixteen packed single-precision floating-point values in the source operand to four, eight or sixteen signed doubleword integers in the destination operand."],["CVTTPS2PI","Converts two packed single-precision floating-point values in the source operand (second operand) to two packed signed doubleword integers in the destination operand (first operand). The source operand can be an XMM register or a 64-bit memory location. The destination operand is an MMX technology register. When the source operand is an XMM register, the two single-precision floating-point values are contained in the low quadword of the register."],["CVTTSD2SI","Converts a double-precision floating-point value in the source operand (the second operand) to a signed double-word integer (or signed quadword integer if operand size is 64 bits) in the destination operand (the first operand). The source operand can be an XMM register or a 64-bit memory location. The destination operand is a general purpose register. When the source operand is an XMM register, the double-precision floating-point value is contained in the low quadword of the register."],["CVTTSS2SI","Converts a single-precision floating-point value in the source operand (the second operand) to a signed doubleword integer (or signed quadword integer if operand size is 64 bits) in the destination operand (the first operand). The source operand can be an XMM register or a 32-bit memory location. The destination operand is a general purpose register. When the source operand is an XMM register, the single-precision floating-point value is contained in the low doubleword of the register."],["CDQ","Doubles the size of the operand in register AX, EAX, or RAX (depending on the operand size) by means of sign extension and stores the result in registers DX:AX, EDX:EAX, or RDX:RAX, respectively. The CWD instruction copies the sign (bit 15) of the value in the AX register into every bit position in the DX register. The CDQ instruction copies the sign (bit 31) of the value in the EAX register into every bit position in the EDX register. The CQO instruction (available in 64-bit mode only) copies the sign (bit 63) of the value in the RAX register into every bit position in the RDX register."],["DAA","Adjusts the sum of two packed BCD values to create a packed BCD result. The AL register is the implied source and destination operand. The DAA instruction is only useful when it follows an ADD instruction that adds (binary addition) two 2-digit, packed BCD values and stores a byte result in the AL register. The DAA instruction then adjusts the contents of the AL register to contain the correct 2-digit, packed BCD result. If a decimal carry is detected, the CF and AF flags are set accordingly."],["DAS","Adjusts the result of the subtraction of two packed BCD values to create a packed BCD result. The AL register is the implied source and destination operand. The DAS instruction is only useful when it follows a SUB instruction that subtracts (binary subtraction) one 2-digit, packed BCD value from another and stores a byte result in the AL register. The DAS instruction then adjusts the contents of the AL register to contain the correct 2-digit, packed BCD result. If a decimal borrow is detected, the CF and AF flags are set accordingly."],["DEC","Subtracts 1 from the destination operand, while preserving the state of the CF flag. The destination operand can be a register or a memory location. This instruction allows a loop counter to be updated without disturbing the CF flag. (To perform a decrement operation that updates the CF flag, use a SUB instruction with an immediate operand of 1.)"],["DIV","Divides unsigned the value in the AX, DX:AX, EDX:EAX, or RDX:RAX registers (dividend) by the source operand (divisor) and stores the result in the AX (AH:AL), DX:AX, EDX:EAX, or RDX:RAX registers. The source operand can be a general-purpose register or a memory location. The action of this instruction depends on the operand size (dividend/divisor). Division using 64-bit operand is available only in 64-bit mode."],["DIVPD","Performs a SIMD divide of the double-precision floating-point values in the first source operand by the floating-point values in the second source operand (the third operand). Results are written to the destination operand (the first operand)."],["DIVPS","Performs a SIMD divide of the four, eight or sixteen packed single-precision floating-point values in the first source operand (the second operand) by the four, eight or sixteen packed single-precision floating-point values in the second source operand (the third operand). Results are written to the destination operand (the first operand)."],["DIVSD","Divides the low double-precision floating-point value in the first source operand by the low double-precision floating-point value in the second source operand, and stores the double-precision floating-point result in the destination operand. The second source operand can be an XMM register or a 64-bit memory location. The first source and destination are XMM registers."],["DIVSS","Divides the low single-precision floating-point value in the first source operand by the low single-precision floating-point value in the second source operand, and stores the single-precision floating-point result in the destination operand. The second source operand can be an XMM register or a 32-bit memory location."],["DPPD","Conditionally multiplies the packed double-precision floating-point values in the destination operand (first operand) with the packed double-precision floating-point values in the source (second operand) depending on a mask extracted from bits [5:4] of the immediate operand (third operand). If a condition mask bit is zero, the corresponding multiplication is replaced by a value of 0.0 in the manner described by Section 12.8.4 of Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1."],["DPPS","Conditionally multiplies the packed single precision floating-point values in the destination operand (first operand) with the packed single-precision floats in the source (second operand) depending on a mask extracted from the high 4 bits of the immediate byte (third operand). If a condition mask bit in Imm8[7:4] is zero, the corresponding multiplication is replaced by a value of 0.0 in the manner described by Section 12.8.4 of Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1."],["EAX","This leaf function copies a page from regular main memory to the EPC. As part of the copying process, the page is cryptographically authenticated and decrypted. This instruction can only be executed when current privilege level is 0."],["EMMS","Sets the values of all the tags in the x87 FPU tag word to empty (all 1s). This operation marks the x87 FPU data registers (which are aliased to the MMX technology registers) as available for use by x87 FPU floating-point instructions. (See Figure 8-7 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for the format of the x87 FPU tag word.) All other MMX instructions (other than the EMMS instruction) set all the tags in x87 FPU tag word to valid (all 0s)."],["ENCLV","The ENCLV instruction invokes the virtualization SGX leaf functions for managing enclaves in a virtualized environment. Software specifies the leaf function by setting the appropriate value in the register EAX as input. The registers RBX, RCX, and RDX have leaf-specific purpose, and may act as input, as output, or may be unused. In non 64-bit mode, the instruction ignores upper 32 bits of the RAX register."],["ENDBR32","Terminate an indirect branch in 32 bit and compatibility mode."],["ENDBR64","Terminate an indirect branch in 64 bit mode."],["ENTER","Creates a stack frame (comprising of space for dynamic storage and 1-32 frame pointer storage) for a procedure. The first operand (imm16) specifies the size of the dynamic storage in the stack frame (that is, the number of bytes of dynamically allocated on the stack for the procedure). The second operand (imm8) gives the lexical nesting level (0 to 31) of the procedure. The nesting level (imm8 mod 32) and the OperandSize attribute determine the size in bytes of the storage space for frame pointers."],["EXTRACTPS","Extracts a single-precision floating-point value from the source operand (second operand) at the 32-bit offset specified from imm8. Immediate bits higher than the most significant offset for the vector length are ignored."],["FADD","Adds the destination and source operands and stores the sum in the destination location. The destination operand is always an FPU register; the source operand can be a register or a memory location. Source operands in memory can be in single-precision or double-precision floating-point format or in word or doubleword integer format."],["FBLD","Converts the BCD source operand into double extended-precision floating-point format and pushes the value onto the FPU stack. The source operand is loaded without rounding errors. The sign of the source operand is preserved, including that of −0."],["FCLEX","Clears the floating-point exception flags (PE, UE, OE, ZE, DE, and IE), the exception summary status flag (ES), the stack fault flag (SF), and the busy flag (B) in the FPU status word. The FCLEX instruction checks for and handles any pending unmasked floating-point exceptions before clearing the exception flags; the FNCLEX instruction does not."],["FCMOVB","Tests the status flags in the EFLAGS register and moves the source operand (second operand) to the destination operand (first operand) if the given test condition is true. The condition for each mnemonic os given in the Description column above and in Chapter 8 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1. The source operand is always in the ST(i) register and the destination operand is always ST(0)."],["FCOM","Compares the contents of register ST(0) and source value and sets condition code flags C0, C2, and C3 in the FPU status word according to the results (see the table below). The source operand can be a data register or a memory location. If no source operand is given, the value in ST(0) is compared with the value in ST(1). The sign of zero is ignored, so that –0.0 is equal to +0.0."],["FCOMI","Performs an unordered comparison of the contents of registers ST(0) and ST(i) and sets the status flags ZF, PF, and CF in the EFLAGS register according to the results (see the table below). The sign of zero is ignored for comparisons, so that –0.0 is equal to +0.0."],["FDIV","Divides the destination operand by the source operand and stores the result in the destination location. The destination operand (dividend) is always in an FPU register; the source operand (divisor) can be a register or a memory location. Source operands in memory can be in single-precision or double-precision floating-point format, word or doubleword integer format."],["FDIVR","Divides the source operand by the destination operand and stores the result in the destination location. The destination operand (divisor) is always in an FPU register; the source operand (dividend) can be a register or a memory location. Source operands in memory can be in single-precision or double-precision floating-point format, word or doubleword integer format."],["FICOM","Compares the value in ST(0) with an integer source operand and sets the condition code flags C0, C2, and C3 in the FPU status word according to the results (see table below). The integer value is converted to double extended-precision floating-point format before the comparison is made."],["FILD","Converts the signed-integer source operand into double extended-precision floating-point format and pushes the value onto the FPU register stack. The source operand can be a word, doubleword, or quadword integer. It is loaded without rounding errors. The sign of the source operand is preserved."],["FINIT","Sets the FPU control, status, tag, instruction pointer, and data pointer registers to their default states. The FPU control word is set to 037FH (round to nearest, all exceptions masked, 64-bit precision). The status word is cleared (no exception flags set, TOP is set to 0). The data registers in the register stack are left unchanged, but they are all tagged as empty (11B). Both the instruction and data pointers are cleared."],["FIST","The FIST instruction converts the value in the ST(0) register to a signed integer and stores the result in the destination operand. Values can be stored in word or doubleword integer format. The destination operand specifies the address where the first byte of the destination value is to be stored."],["FISTTP","FISTTP converts the value in ST into a signed integer using truncation (chop) as rounding mode, transfers the result to the destination, and pop ST. FISTTP accepts word, short integer, and long integer destinations."],["FLD","Pushes the source operand onto the FPU register stack. The source operand can be in single-precision, double-precision, or double extended-precision floating-point format. If the source operand is in single-precision or double-precision floating-point format, it is automatically converted to the double extended-precision floating-point format before being pushed on the stack."],["FLD1","Push one of seven commonly used constants (in double extended-precision floating-point format) onto the FPU register stack. The constants that can be loaded with these instructions include +1.0, +0.0, log210, log2e, π, log102, and loge2. For each constant, an internal 66-bit constant is rounded (as specified by the RC field in the FPU control word) to double extended-precision floating-point format. The inexact-result exception (#P) is not generated as a result of the rounding, nor is the C1 flag set in the x87 FPU status word if the value is rounded up."],["FIMUL","Multiplies the destination and source operands and stores the product in the destination location. The destination operand is always an FPU data register; the source operand can be an FPU data register or a memory location. Source operands in memory can be in single-precision or double-precision floating-point format or in word or doubleword integer format."],["FPREM","Computes the remainder obtained from dividing the value in the ST(0) register (the dividend) by the value in the ST(1) register (the divisor or modulus), and stores the result in ST(0). The remainder represents the following value"],["FPREM1","Computes the IEEE remainder obtained from dividing the value in the ST(0) register (the dividend) by the value in the ST(1) register (the divisor or modulus), and stores the result in ST(0). The remainder represents the following value"],["FPTAN","Computes the approximate tangent of the source operand in register ST(0), stores the result in ST(0), and pushes a 1.0 onto the FPU register stack. The source operand must be given in radians and must be less than ±263. The following table shows the unmasked results obtained when computing the partial tangent of various classes of numbers, assuming that underflow does not occur."],["FNSAVE","Stores the current FPU state (operating environment and register stack) at the specified destination in memory, and then re-initializes the FPU. The FSAVE instruction checks for and handles pending unmasked floating-point exceptions before storing the FPU state; the FNSAVE instruction does not."],["FSINCOS","Computes both the approximate sine and the cosine of the source operand in register ST(0), stores the sine in ST(0), and pushes the cosine onto the top of the FPU register stack. (This instruction is faster than executing the FSIN and FCOS instructions in succession.)"],["FST","The FST instruction copies the value in the ST(0) register to the destination operand, which can be a memory location or another register in the FPU register stack. When storing the value in memory, the value is converted to single-precision or double-precision floating-point format."],["FNSTCW","Stores the current value of the FPU control word at the specified destination in memory. The FSTCW instruction checks for and handles pending unmasked floating-point exceptions before storing the control word; the FNSTCW instruction does not."],["FNSTENV","Saves the current FPU operating environment at the memory location specified with the destination operand, and then masks all floating-point exceptions. The FPU operating environment consists of the FPU control word, status word, tag word, instruction pointer, data pointer, and last opcode. Figures 8-9 through 8-12 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, show the layout in memory of the stored environment, depending on the operating mode of the processor (protected or real) and the current operand-size attribute (16-bit or 32-bit). In virtual-8086 mode, the real mode layouts are used."],["FNSTSW","Stores the current value of the x87 FPU status word in the destination location. The destination operand can be either a two-byte memory location or the AX register. The FSTSW instruction checks for and handles pending unmasked floating-point exceptions before storing the status word; the FNSTSW instruction does not."],["FISUB","Subtracts the source operand from the destination operand and stores the difference in the destination location. The destination operand is always an FPU data register; the source operand can be a register or a memory location. Source operands in memory can be in single-precision or double-precision floating-point format or in word or doubleword integer format."],["FISUBR","Subtracts the destination operand from the source operand and stores the difference in the destination location. The destination operand is always an FPU register; the source operand can be a register or a memory location. Source operands in memory can be in single-precision or double-precision floating-point format or in word or doubleword integer format."],["FUCOM","Performs an unordered comparison of the contents of register ST(0) and ST(i) and sets condition code flags C0, C2, and C3 in the FPU status word according to the results (see the table below). If no operand is specified, the contents of registers ST(0) and ST(1) are compared. The sign of zero is ignored, so that –0.0 is equal to +0.0."],["FXCH","Exchanges the contents of registers ST(0) and ST(i). If no source operand is specified, the contents of ST(0) and ST(1) are exchanged."],["FXRSTOR","Reloads the x87 FPU, MMX technology, XMM, and MXCSR registers from the 512-byte memory image specified in the source operand. This data should have been written to memory previously using the FXSAVE instruction, and in the same format as required by the operating modes. The first byte of the data should be located on a 16-byte boundary. There are three distinct layouts of the FXSAVE state map: one for legacy and compatibility mode, a second format for 64-bit mode FXSAVE/FXRSTOR with REX.W=0, and the third format is for 64-bit mode with FXSAVE64/FXRSTOR64. Table 3-43 shows the layout of the legacy/compatibility mode state information in memory and describes the fields in the memory image for the FXRSTOR and FXSAVE instructions. Table 3-46 shows the layout of the 64-bit mode state information when REX.W is set (FXSAVE64/FXRSTOR64). Table 3-47 shows the layout of the 64-bit mode state information when REX.W is clear (FXSAVE/FXRSTOR)."],["FXSAVE","Saves the current state of the x87 FPU, MMX technology, XMM, and MXCSR registers to a 512-byte memory location specified in the destination operand. The content layout of the 512 byte region depends on whether the processor is operating in non-64-bit operating modes or 64-bit sub-mode of IA-32e mode."],["FXTRACT","Separates the source value in the ST(0) register into its exponent and significand, stores the exponent in ST(0), and pushes the significand onto the register stack. Following this operation, the new top-of-stack register ST(0) contains the value of the original significand expressed as a floating-point value. The sign and significand of this value are the same as those found in the source operand, and the exponent is 3FFFH (biased value for a true exponent of zero). The ST(1) register contains the value of the original operand’s true (unbiased) exponent expressed as a floating-point value. (The operation performed by this instruction is a superset of the IEEE-recommended logb(x) function.)"],["FYL2X","Computes (ST(1) ∗ log2 (ST(0))), stores the result in register ST(1), and pops the FPU register stack. The source operand in ST(0) must be a non-zero positive number."],["FYL2XP1","Computes (ST(1) ∗ log2(ST(0) + 1.0)), stores the result in register ST(1), and pops the FPU register stack. The source operand in ST(0) must be in the range"],["VGF2P8AFFINEINVQB","The AFFINEINVB instruction computes an affine transformation in the Galois Field 28. For this instruction, an affine transformation is defined by A * inv(x) + b where “A” is an 8 by 8 bit matrix, and “x” and “b” are 8-bit vectors. The inverse of the bytes in x is defined with respect to the reduction polynomial x8 + x4 + x3 + x + 1."],["VGF2P8AFFINEQB","The AFFINEB instruction computes an affine transformation in the Galois Field 28. For this instruction, an affine transformation is defined by A * x + b where “A” is an 8 by 8 bit matrix, and “x” and “b” are 8-bit vectors. One SIMD register (operand 1) holds “x” as either 16, 32 or 64 8-bit vectors. A second SIMD (operand 2) register or memory operand contains 2, 4, or 8 “A” values, which are operated upon by the correspondingly aligned 8 “x” values in the first register. The “b” vector is constant for all calculations and contained in the immediate byte."],["VGF2P8MULB","The instruction multiplies elements in the finite field GF(28), operating on a byte (field element) in the first source operand and the corresponding byte in a second source operand. The field GF(28) is represented in polynomial representation with the reduction polynomial x8 + x4 + x3 + x + 1."],["HADDPD","Adds the double-precision floating-point values in the high and low quadwords of the destination operand and stores the result in the low quadword of the destination operand."],["HADDPS","Adds the single-precision floating-point values in the first and second dwords of the destination operand and stores the result in the first dword of the destination operand."],["HLT","Stops instruction execution and places the processor in a HALT state. An enabled interrupt (including NMI and SMI), a debug exception, the BINIT# signal, the INIT# signal, or the RESET# signal will resume execution. If an interrupt (including NMI) is used to resume execution after a HLT instruction, the saved instruction pointer (CS:EIP) points to the instruction following the HLT instruction."],["HRESET","Requests the processor to selectively reset selected components of hardware history maintained by the current logical processor. HRESET operation is controlled by the implicit EAX operand. The value of the explicit imm8 operand is ignored. This instruction can only be executed at privilege level 0."],["HSUBPD","The HSUBPD instruction subtracts horizontally the packed DP FP numbers of both operands."],["HSUBPS","Subtracts the single-precision floating-point value in the second dword of the destination operand from the first dword of the destination operand and stores the result in the first dword of the destination operand."],["IDIV","Divides the (signed) value in the AX, DX:AX, or EDX:EAX (dividend) by the source operand (divisor) and stores the result in the AX (AH:AL), DX:AX, or EDX:EAX registers. The source operand can be a general-purpose register or a memory location. The action of this instruction depends on the operand size (dividend/divisor)."],["IMUL","Performs a signed multiplication of two operands. This instruction has three forms, depending on the number of operands."],["IN","Copies the value from the I/O port specified with the second operand (source operand) to the destination operand (first operand). The source operand can be a byte-immediate or the DX register; the destination operand can be register AL, AX, or EAX, depending on the size of the port being accessed (8, 16, or 32 bits, respectively). Using the DX register as a source operand allows I/O port addresses from 0 to 65,535 to be accessed; using a byte immediate allows I/O port addresses 0 to 255 to be accessed."],["INC","Adds 1 to the destination operand, while preserving the state of the CF flag. The destination operand can be a register or a memory location. This instruction allows a loop counter to be updated without disturbing the CF flag. (Use a ADD instruction with an immediate operand of 1 to perform an increment operation that does updates the CF flag.)"],["INCSSPD","This instruction can be used to increment the current shadow stack pointer by the operand size of the instruction times the unsigned 8-bit value specified by bits 7:0 in the source operand. The instruction performs a pop and discard of the first and last element on the shadow stack in the range specified by the unsigned 8-bit value in bits 7:0 of the source operand."],["INS","Copies the data from the I/O port specified with the source operand (second operand) to the destination operand (first operand). The source operand is an I/O port address (from 0 to 65,535) that is read from the DX register. The destination operand is a memory location, the address of which is read from either the ES:DI, ES:EDI or the RDI registers (depending on the address-size attribute of the instruction, 16, 32 or 64, respectively). (The ES segment cannot be overridden with a segment override prefix.) The size of the I/O port being accessed (that is, the size of the source and destination operands) is determined by the opcode for an 8-bit I/O port or by the operand-size attribute of the instruction for a 16- or 32-bit I/O port."],["INSERTPS","(register source form)"],["INT","The INT n instruction generates a call to the interrupt or exception handler specified with the destination operand (see the section titled “Interrupts and Exceptions” in Chapter 6 of the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1). The destination operand specifies a vector from 0 to 255, encoded as an 8-bit unsigned intermediate value. Each vector provides an index to a gate descriptor in the IDT. The first 32 vectors are reserved by Intel for system use. Some of these vectors are used for internally generated exceptions."],["INVD","Invalidates (flushes) the processor’s internal caches and issues a special-function bus cycle that directs external caches to also flush themselves. Data held in internal caches is not written back to main memory."],["INVPCID","Invalidates mappings in the translation lookaside buffers (TLBs) and paging-structure caches based on process-context identifier (PCID). (See Section 4.10, “Caching Translation Information,” in Intel 64 and IA-32 Architecture Software Developer’s Manual, Volume 3A.) Invalidation is based on the INVPCID type specified in the register operand and the INVPCID descriptor specified in the memory operand."],["IRET","Returns program control from an exception or interrupt handler to a program or procedure that was interrupted by an exception, an external interrupt, or a software-generated interrupt. These instructions are also used to perform a return from a nested task. (A nested task is created when a CALL instruction is used to initiate a task switch or when an interrupt or exception causes a task switch to an interrupt or exception handler.) See the section titled “Task Linking” in Chapter 7 of the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 3A."],["JMP","Transfers program control to a different point in the instruction stream without recording return information. The destination (target) operand specifies the address of the instruction being jumped to. This operand can be an immediate value, a general-purpose register, or a memory location."],["JA","Checks the state of one or more of the status flags in the EFLAGS register (CF, OF, PF, SF, and ZF) and, if the flags are in the specified state (condition), performs a jump to the target instruction specified by the destination operand. A condition code (cc) is associated with each instruction to indicate the condition being tested for. If the condition is not satisfied, the jump is not performed and execution continues with the instruction following the Jcc instruction."],["KADDB","Adds the vector mask k2 and the vector mask k3, and writes the result into vector mask k1."],["KANDNB","Performs a bitwise AND NOT between the vector mask k2 and the vector mask k3, and writes the result into vector mask k1."],["KANDB","Performs a bitwise AND between the vector mask k2 and the vector mask k3, and writes the result into vector mask k1."],["KMOVB","Copies values from the source operand (second operand) to the destination operand (first operand). The source and destination operands can be mask registers, memory location or general purpose. The instruction cannot be used to transfer data between general purpose registers and or memory locations."],["KNOTB","Performs a bitwise NOT of vector mask k2 and writes the result into vector mask k1."],["KORTESTB","Performs a bitwise OR between the vector mask register k2, and the vector mask register k1, and sets CF and ZF based on the operation result."],["KORB","Performs a bitwise OR between the vector mask k2 and the vector mask k3, and writes the result into vector mask k1 (three-operand form)."],["KSHIFTLB","Shifts 8/16/32/64 bits in the second operand (source operand) left by the count specified in immediate byte and place the least significant 8/16/32/64 bits of the result in the destination operand. The higher bits of the destination are zero-extended. The destination is set to zero if the count value is greater than 7 (for byte shift), 15 (for word shift), 31 (for doubleword shift) or 63 (for quadword shift)."],["KSHIFTRB","Shifts 8/16/32/64 bits in the second operand (source operand) right by the count specified in immediate and place the least significant 8/16/32/64 bits of the result in the destination operand. The higher bits of the destination are zero-extended. The destination is set to zero if the count value is greater than 7 (for byte shift), 15 (for word shift), 31 (for doubleword shift) or 63 (for quadword shift)."],["KTESTB","Performs a bitwise comparison of the bits of the first source operand and corresponding bits in the second source operand. If the AND operation produces all zeros, the ZF is set else the ZF is clear. If the bitwise AND operation of the inverted first source operand with the second source operand produces all zeros the CF is set else the CF is clear. Only the EFLAGS register is updated."],["KUNPCKBW","Unpacks the lower 8/16/32 bits of the second and third operands (source operands) into the low part of the first operand (destination operand), starting from the low bytes. The result is zero-extended in the destination."],["KXNORB","Performs a bitwise XNOR between the vector mask k2 and the vector mask k3, and writes the result into vector mask k1 (three-operand form)."],["KXORB","Performs a bitwise XOR between the vector mask k2 and the vector mask k3, and writes the result into vector mask k1 (three-operand form)."],["LAR","Loads the access rights from the segment descriptor specified by the second operand (source operand) into the first operand (destination operand) and sets the ZF flag in the flag register. The source operand (which can be a register or a memory location) contains the segment selector for the segment descriptor being accessed. If the source operand is a memory address, only 16 bits of data are accessed. The destination operand is a general-purpose register."],["LDDQU","The instruction is functionally similar to (V)MOVDQU ymm/xmm, m256/m128 for loading from memory. That is: 32/16 bytes of data starting at an address specified by the source memory operand (second operand) are fetched from memory and placed in a destination register (first operand). The source operand need not be aligned on a 32/16-byte boundary. Up to 64/32 bytes may be loaded from memory; this is implementation dependent."],["LDMXCSR","Loads the source operand into the MXCSR control/status register. The source operand is a 32-bit memory location. See “MXCSR Control and Status Register” in Chapter 10, of the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for a description of the MXCSR register and its contents."],["LDS","Loads a far pointer (segment selector and offset) from the second operand (source operand) into a segment register and the first operand (destination operand). The source operand specifies a 48-bit or a 32-bit pointer in memory depending on the current setting of the operand-size attribute (32 bits or 16 bits, respectively). The instruction opcode and the destination operand specify a segment register/general-purpose register pair. The 16-bit segment selector from the source operand is loaded into the segment register specified with the opcode (DS, SS, ES, FS, or GS). The 32-bit or 16-bit offset is loaded into the register specified with the destination operand."],["LEA","Computes the effective address of the second operand (the source operand) and stores it in the first operand (destination operand). The source operand is a memory address (offset part) specified with one of the processors addressing modes; the destination operand is a general-purpose register. The address-size and operand-size attributes affect the action performed by this instruction, as shown in the following table. The operand-size attribute of the instruction is determined by the chosen register; the address-size attribute is determined by the attribute of the code segment."],["LEAVE","Releases the stack frame set up by an earlier ENTER instruction. The LEAVE instruction copies the frame pointer (in the EBP register) into the stack pointer register (ESP), which releases the stack space allocated to the stack frame. The old frame pointer (the frame pointer for the calling procedure that was saved by the ENTER instruction) is then popped from the stack into the EBP register, restoring the calling procedure’s stack frame."],["LFENCE","Performs a serializing operation on all load-from-memory instructions that were issued prior the LFENCE instruction. Specifically, LFENCE does not execute until all prior instructions have completed locally, and no later instruction begins execution until LFENCE completes. In particular, an instruction that loads from memory and that precedes an LFENCE receives data from memory prior to completion of the LFENCE. (An LFENCE that follows an instruction that stores to memory might complete before the data being stored have become globally visible.) Instructions following an LFENCE may be fetched from memory before the LFENCE, but they will not execute (even speculatively) until the LFENCE completes."],["LGDT","Loads the values in the source operand into the global descriptor table register (GDTR) or the interrupt descriptor table register (IDTR). The source operand specifies a 6-byte memory location that contains the base address (a linear address) and the limit (size of table in bytes) of the global descriptor table (GDT) or the interrupt descriptor table (IDT). If operand-size attribute is 32 bits, a 16-bit limit (lower 2 bytes of the 6-byte data operand) and a 32-bit base address (upper 4 bytes of the data operand) are loaded into the register. If the operand-size attribute is 16 bits, a 16-bit limit (lower 2 bytes) and a 24-bit base address (third, fourth, and fifth byte) are loaded. Here, the high-order byte of the operand is not used and the high-order byte of the base address in the GDTR or IDTR is filled with zeros."],["LLDT","Loads the source operand into the segment selector field of the local descriptor table register (LDTR). The source operand (a general-purpose register or a memory location) contains a segment selector that points to a local descriptor table (LDT). After the segment selector is loaded in the LDTR, the processor uses the segment selector to locate the segment descriptor for the LDT in the global descriptor table (GDT). It then loads the segment limit and base address for the LDT from the segment descriptor into the LDTR. The segment registers DS, ES, SS, FS, GS, and CS are not affected by this instruction, nor is the LDTR field in the task state segment (TSS) for the current task."],["LMSW","Loads the source operand into the machine status word, bits 0 through 15 of register CR0. The source operand can be a 16-bit general-purpose register or a memory location. Only the low-order 4 bits of the source operand (which contains the PE, MP, EM, and TS flags) are loaded into CR0. The PG, CD, NW, AM, WP, NE, and ET flags of CR0 are not affected. The operand-size attribute has no effect on this instruction."],["LOCK","Causes the processor’s LOCK# signal to be asserted during execution of the accompanying instruction (turns the instruction into an atomic instruction). In a multiprocessor environment, the LOCK# signal ensures that the processor has exclusive use of any shared memory while the signal is asserted."],["LODS","Loads a byte, word, or doubleword from the source operand into the AL, AX, or EAX register, respectively. The source operand is a memory location, the address of which is read from the DS:ESI or the DS:SI registers (depending on the address-size attribute of the instruction, 32 or 16, respectively). The DS segment may be overridden with a segment override prefix."],["LOOP","Performs a loop operation using the RCX, ECX or CX register as a counter (depending on whether address size is 64 bits, 32 bits, or 16 bits). Note that the LOOP instruction ignores REX.W; but 64-bit address size can be over-ridden using a 67H prefix."],["LSL","Loads the unscrambled segment limit from the segment descriptor specified with the second operand (source operand) into the first operand (destination operand) and sets the ZF flag in the EFLAGS register. The source operand (which can be a register or a memory location) contains the segment selector for the segment descriptor being accessed. The destination operand is a general-purpose register."],["LTR","Loads the source operand into the segment selector field of the task register. The source operand (a general-purpose register or a memory location) contains a segment selector that points to a task state segment (TSS). After the segment selector is loaded in the task register, the processor uses the segment selector to locate the segment descriptor for the TSS in the global descriptor table (GDT). It then loads the segment limit and base address for the TSS from the segment descriptor into the task register. The task pointed to by the task register is marked busy, but a switch to the task does not occur."],["LZCNT","Counts the number of leading most significant zero bits in a source operand (second operand) returning the result into a destination (first operand)."],["MASKMOVDQU","Stores selected bytes from the source operand (first operand) into an 128-bit memory location. The mask operand (second operand) selects which bytes from the source operand are written to memory. The source and mask operands are XMM registers. The memory location specified by the effective address in the DI/EDI/RDI register (the default segment register is DS, but this may be overridden with a segment-override prefix). The memory location does not need to be aligned on a natural boundary. (The size of the store address depends on the address-size attribute.)"],["MASKMOVQ","Stores selected bytes from the source operand (first operand) into a 64-bit memory location. The mask operand (second operand) selects which bytes from the source operand are written to memory. The source and mask operands are MMX technology registers. The memory location specified by the effective address in the DI/EDI/RDI register (the default segment register is DS, but this may be overridden with a segment-override prefix). The memory location does not need to be aligned on a natural boundary. (The size of the store address depends on the address-size attribute.)"],["MAXPD","Performs a SIMD compare of the packed double-precision floating-point values in the first source operand and the second source operand and returns the maximum value for each pair of values to the destination operand."],["MAXPS","Performs a SIMD compare of the packed single-precision floating-point values in the first source operand and the second source operand and returns the maximum value for each pair of values to the destination operand."],["MAXSD","Compares the low double-precision floating-point values in the first source operand and the second source operand, and returns the maximum value to the low quadword of the destination operand. The second source operand can be an XMM register or a 64-bit memory location. The first source and destination operands are XMM registers. When the second source operand is a memory operand, only 64 bits are accessed."],["MAXSS","Compares the low single-precision floating-point values in the first source operand and the second source operand, and returns the maximum value to the low doubleword of the destination operand."],["MINPD","Performs a SIMD compare of the packed double-precision floating-point values in the first source operand and the second source operand and returns the minimum value for each pair of values to the destination operand."],["MINPS","Performs a SIMD compare of the packed single-precision floating-point values in the first source operand and the second source operand and returns the minimum value for each pair of values to the destination operand."],["MINSD","Compares the low double-precision floating-point values in the first source operand and the second source operand, and returns the minimum value to the low quadword of the destination operand. When the source operand is a memory operand, only the 64 bits are accessed."],["MINSS","Compares the low single-precision floating-point values in the first source operand and the second source operand and returns the minimum value to the low doubleword of the destination operand."],["MOV","Copies the second operand (source operand) to the first operand (destination operand). The source operand can be an immediate value, general-purpose register, segment register, or memory location; the destination register can be a general-purpose register, segment register, or memory location. Both operands must be the same size, which can be a byte, a word, a doubleword, or a quadword."],["MOVAPD","Moves 2, 4 or 8 double-precision floating-point values from the source operand (second operand) to the destination operand (first operand). This instruction can be used to load an XMM, YMM or ZMM register from an 128-bit, 256-bit or 512-bit memory location, to store the contents of an XMM, YMM or ZMM register into a 128-bit, 256-bit or 512-bit memory location, or to move data between two XMM, two YMM or two ZMM registers."],["MOVAPS","Moves 4, 8 or 16 single-precision floating-point values from the source operand (second operand) to the destination operand (first operand). This instruction can be used to load an XMM, YMM or ZMM register from an 128-bit, 256-bit or 512-bit memory location, to store the contents of an XMM, YMM or ZMM register into a 128-bit, 256-bit or 512-bit memory location, or to move data between two XMM, two YMM or two ZMM registers."],["MOVBE","Performs a byte swap operation on the data copied from the second operand (source operand) and store the result in the first operand (destination operand). The source operand can be a general-purpose register, or memory location; the destination register can be a general-purpose register, or a memory location; however, both operands can not be registers, and only one operand can be a memory location. Both operands must be the same size, which can be a word, a doubleword or quadword."],["MOVD","Copies a doubleword from the source operand (second operand) to the destination operand (first operand). The source and destination operands can be general-purpose registers, MMX technology registers, XMM registers, or 32-bit memory locations. This instruction can be used to move a doubleword to and from the low doubleword of an MMX technology register and a general-purpose register or a 32-bit memory location, or to and from the low doubleword of an XMM register and a general-purpose register or a 32-bit memory location. The instruction cannot be used to transfer data between MMX technology registers, between XMM registers, between general-purpose registers, or between memory locations."],["MOVDDUP","For 256-bit or higher versions: Duplicates even-indexed double-precision floating-point values from the source operand (the second operand) and into adjacent pair and store to the destination operand (the first operand)."],["MOVDIR64B","Moves 64-bytes as direct-store with 64-byte write atomicity from source memory address to destination memory address. The source operand is a normal memory operand. The destination operand is a memory location specified in a general-purpose register. The register content is interpreted as an offset into ES segment without any segment override. In 64-bit mode, the register operand width is 64-bits (32-bits with 67H prefix). Outside of 64-bit mode, the register width is 32-bits when CS.D=1 (16-bits with 67H prefix), and 16-bits when CS.D=0 (32-bits with 67H prefix). MOVDIR64B requires the destination address to be 64-byte aligned. No alignment restriction is enforced for source operand."],["MOVDIRI","Moves the doubleword integer in the source operand (second operand) to the destination operand (first operand) using a direct-store operation. The source operand is a general purpose register. The destination operand is a 32-bit memory location. In 64-bit mode, the instruction’s default operation size is 32 bits. Use of the REX.R prefix permits access to additional registers (R8-R15). Use of the REX.W prefix promotes operation to 64 bits. See summary chart at the beginning of this section for encoding data and limits."],["MOVDQA","Note: VEX.vvvv and EVEX.vvvv are reserved and must be 1111b otherwise instructions will #UD."],["MOVDQU","Note: VEX.vvvv and EVEX.vvvv are reserved and must be 1111b otherwise instructions will #UD."],["MOVHLPS","This instruction cannot be used for memory to register moves."],["MOVHPD","This instruction cannot be used for register to register or memory to memory moves."],["MOVHPS","This instruction cannot be used for register to register or memory to memory moves."],["MOVLHPS","This instruction cannot be used for memory to register moves."],["MOVLPD","This instruction cannot be used for register to register or memory to memory moves."],["MOVLPS","This instruction cannot be used for register to register or memory to memory moves."],["MOVMSKPD","Extracts the sign bits from the packed double-precision floating-point values in the source operand (second operand), formats them into a 2-bit mask, and stores the mask in the destination operand (first operand). The source operand is an XMM register, and the destination operand is a general-purpose register. The mask is stored in the 2 low-order bits of the destination operand. Zero-extend the upper bits of the destination."],["MOVMSKPS","Extracts the sign bits from the packed single-precision floating-point values in the source operand (second operand), formats them into a 4- or 8-bit mask, and stores the mask in the destination operand (first operand). The source operand is an XMM or YMM register, and the destination operand is a general-purpose register. The mask is stored in the 4 or 8 low-order bits of the destination operand. The upper bits of the destination operand beyond the mask are filled with zeros."],["MOVNTDQ","Moves the packed integers in the source operand (second operand) to the destination operand (first operand) using a non-temporal hint to prevent caching of the data during the write to memory. The source operand is an XMM register, YMM register or ZMM register, which is assumed to contain integer data (packed bytes, words, double-words, or quadwords). The destination operand is a 128-bit, 256-bit or 512-bit memory location. The memory operand must be aligned on a 16-byte (128-bit version), 32-byte (VEX.256 encoded version) or 64-byte (512-bit version) boundary otherwise a general-protection exception (#GP) will be generated."],["MOVNTDQA","MOVNTDQA loads a double quadword from the source operand (second operand) to the destination operand (first operand) using a non-temporal hint if the memory source is WC (write combining) memory type. For WC memory type, the nontemporal hint may be implemented by loading a temporary internal buffer with the equivalent of an aligned cache line without filling this data to the cache. Any memory-type aliased lines in the cache will be snooped and flushed. Subsequent MOVNTDQA reads to unread portions of the WC cache line will receive data from the temporary internal buffer if data is available. The temporary internal buffer may be flushed by the processor at any time for any reason, for example"],["MOVNTI","Moves the doubleword integer in the source operand (second operand) to the destination operand (first operand) using a non-temporal hint to minimize cache pollution during the write to memory. The source operand is a general-purpose register. The destination operand is a 32-bit memory location."],["MOVNTPD","Moves the packed double-precision floating-point values in the source operand (second operand) to the destination operand (first operand) using a non-temporal hint to prevent caching of the data during the write to memory. The source operand is an XMM register, YMM register or ZMM register, which is assumed to contain packed double-precision, floating-pointing data. The destination operand is a 128-bit, 256-bit or 512-bit memory location. The memory operand must be aligned on a 16-byte (128-bit version), 32-byte (VEX.256 encoded version) or 64-byte (EVEX.512 encoded version) boundary otherwise a general-protection exception (#GP) will be generated."],["MOVNTPS","Moves the packed single-precision floating-point values in the source operand (second operand) to the destination operand (first operand) using a non-temporal hint to prevent caching of the data during the write to memory. The source operand is an XMM register, YMM register or ZMM register, which is assumed to contain packed single-precision, floating-pointing. The destination operand is a 128-bit, 256-bit or 512-bit memory location. The memory operand must be aligned on a 16-byte (128-bit version), 32-byte (VEX.256 encoded version) or 64-byte (EVEX.512 encoded version) boundary otherwise a general-protection exception (#GP) will be generated."],["MOVNTQ","Moves the quadword in the source operand (second operand) to the destination operand (first operand) using a non-temporal hint to minimize cache pollution during the write to memory. The source operand is an MMX technology register, which is assumed to contain packed integer data (packed bytes, words, or doublewords). The destination operand is a 64-bit memory location."],["MOVQ2DQ","Moves the quadword from the source operand (second operand) to the low quadword of the destination operand (first operand). The source operand is an MMX technology register and the destination operand is an XMM register."],["MOVS","Moves the byte, word, or doubleword specified with the second operand (source operand) to the location specified with the first operand (destination operand). Both the source and destination operands are located in memory. The address of the source operand is read from the DS:ESI or the DS:SI registers (depending on the address-size attribute of the instruction, 32 or 16, respectively). The address of the destination operand is read from the ES:EDI or the ES:DI registers (again depending on the address-size attribute of the instruction). The DS segment may be overridden with a segment override prefix, but the ES segment cannot be overridden."],["MOVSHDUP","Duplicates odd-indexed single-precision floating-point values from the source operand (the second operand) to adjacent element pair in the destination operand (the first operand). See Figure 4-3. The source operand is an XMM, YMM or ZMM register or 128, 256 or 512-bit memory location and the destination operand is an XMM, YMM or ZMM register."],["MOVSLDUP","Duplicates even-indexed single-precision floating-point values from the source operand (the second operand). See Figure 4-4. The source operand is an XMM, YMM or ZMM register or 128, 256 or 512-bit memory location and the destination operand is an XMM, YMM or ZMM register."],["MOVSS","Moves a scalar single-precision floating-point value from the source operand (second operand) to the destination operand (first operand). The source and destination operands can be XMM registers or 32-bit memory locations. This instruction can be used to move a single-precision floating-point value to and from the low doubleword of an XMM register and a 32-bit memory location, or to move a single-precision floating-point value between the low doublewords of two XMM registers. The instruction cannot be used to transfer data between memory locations."],["MOVSX","Copies the contents of the source operand (register or memory location) to the destination operand (register) and sign extends the value to 16 or 32 bits (see Figure 7-6 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1). The size of the converted value depends on the operand-size attribute."],["MOVUPD","Note: VEX.vvvv and EVEX.vvvv is reserved and must be 1111b otherwise instructions will #UD."],["MOVUPS","Note: VEX.vvvv and EVEX.vvvv is reserved and must be 1111b otherwise instructions will #UD."],["MOVZX","Copies the contents of the source operand (register or memory location) to the destination operand (register) and zero extends the value. The size of the converted value depends on the operand-size attribute."],["MPSADBW","(V)MPSADBW calculates packed word results of sum-absolute-difference (SAD) of unsigned bytes from two blocks of 32-bit dword elements, using two select fields in the immediate byte to select the offsets of the two blocks within the first source operand and the second operand. Packed SAD word results are calculated within each 128-bit lane. Each SAD word result is calculated between a stationary block_2 (whose offset within the second source operand is selected by a two bit select control, multiplied by 32 bits) and a sliding block_1 at consecutive byte-granular position within the first source operand. The offset of the first 32-bit block of block_1 is selectable using a one bit select control, multiplied by 32 bits."],["MUL","Performs an unsigned multiplication of the first operand (destination operand) and the second operand (source operand) and stores the result in the destination operand. The destination operand is an implied operand located in register AL, AX or EAX (depending on the size of the operand); the source operand is located in a general-purpose register or a memory location. The action of this instruction and the location of the result depends on the opcode and the operand size as shown in Table 4-9."],["MULPD","Multiply packed double-precision floating-point values from the first source operand with corresponding values in the second source operand, and stores the packed double-precision floating-point results in the destination operand."],["MULPS","Multiply the packed single-precision floating-point values from the first source operand with the corresponding values in the second source operand, and stores the packed double-precision floating-point results in the destination operand."],["MULSD","Multiplies the low double-precision floating-point value in the second source operand by the low double-precision floating-point value in the first source operand, and stores the double-precision floating-point result in the destination operand. The second source operand can be an XMM register or a 64-bit memory location. The first source operand and the destination operands are XMM registers."],["MULSS","Multiplies the low single-precision floating-point value from the second source operand by the low single-precision floating-point value in the first source operand, and stores the single-precision floating-point result in the destination operand. The second source operand can be an XMM register or a 32-bit memory location. The first source operand and the destination operands are XMM registers."],["MULX","Performs an unsigned multiplication of the implicit source operand (EDX/RDX) and the specified source operand (the third operand) and stores the low half of the result in the second destination (second operand), the high half of the result in the first destination operand (first operand), without reading or writing the arithmetic flags. This enables efficient programming where the software can interleave add with carry operations and multiplications."],["MWAIT","MWAIT instruction provides hints to allow the processor to enter an implementation-dependent optimized state. There are two principal targeted usages: address-range monitor and advanced power management. Both usages of MWAIT require the use of the MONITOR instruction."],["NEG","Replaces the value of operand (the destination operand) with its two's complement. (This operation is equivalent to subtracting the operand from 0.) The destination operand is located in a general-purpose register or a memory location."],["NOP","This instruction performs no operation. It is a one-byte or multi-byte NOP that takes up space in the instruction stream but does not impact machine context, except for the EIP register."],["NOT","Performs a bitwise NOT operation (each 1 is set to 0, and each 0 is set to 1) on the destination operand and stores the result in the destination operand location. The destination operand can be a register or a memory location."],["OR","Performs a bitwise inclusive OR operation between the destination (first) and source (second) operands and stores the result in the destination operand location. The source operand can be an immediate, a register, or a memory location; the destination operand can be a register or a memory location. (However, two memory operands cannot be used in one instruction.) Each bit of the result of the OR instruction is set to 0 if both corresponding bits of the first and second operands are 0; otherwise, each bit is set to 1."],["ORPD","Performs a bitwise logical OR of the two, four or eight packed double-precision floating-point values from the first source operand and the second source operand, and stores the result in the destination operand."],["ORPS","Performs a bitwise logical OR of the four, eight or sixteen packed single-precision floating-point values from the first source operand and the second source operand, and stores the result in the destination operand"],["OUT","Copies the value from the second operand (source operand) to the I/O port specified with the destination operand (first operand). The source operand can be register AL, AX, or EAX, depending on the size of the port being accessed (8, 16, or 32 bits, respectively); the destination operand can be a byte-immediate or the DX register. Using a byte immediate allows I/O port addresses 0 to 255 to be accessed; using the DX register as a source operand allows I/O ports from 0 to 65,535 to be accessed."],["OUTS","Copies data from the source operand (second operand) to the I/O port specified with the destination operand (first operand). The source operand is a memory location, the address of which is read from either the DS:SI, DS:ESI or the RSI registers (depending on the address-size attribute of the instruction, 16, 32 or 64, respectively). (The DS segment may be overridden with a segment override prefix.) The destination operand is an I/O port address (from 0 to 65,535) that is read from the DX register. The size of the I/O port being accessed (that is, the size of the source and destination operands) is determined by the opcode for an 8-bit I/O port or by the operand-size attribute of the instruction for a 16- or 32-bit I/O port."],["PABSB","PABSB/W/D computes the absolute value of each data element of the source operand (the second operand) and stores the UNSIGNED results in the destination operand (the first operand). PABSB operates on signed bytes, PABSW operates on signed 16-bit words, and PABSD operates on signed 32-bit integers."],["PACKSSDW","Converts packed signed word integers into packed signed byte integers (PACKSSWB) or converts packed signed doubleword integers into packed signed word integers (PACKSSDW), using saturation to handle overflow conditions. See Figure 4-6 for an example of the packing operation."],["PACKUSDW","Converts packed signed doubleword integers in the first and second source operands into packed unsigned word integers using unsigned saturation to handle overflow conditions. If the signed doubleword value is beyond the range of an unsigned word (that is, greater than FFFFH or less than 0000H), the saturated unsigned word integer value of FFFFH or 0000H, respectively, is stored in the destination."],["PACKUSWB","Converts 4, 8, 16 or 32 signed word integers from the destination operand (first operand) and 4, 8, 16 or 32 signed word integers from the source operand (second operand) into 8, 16, 32 or 64 unsigned byte integers and stores the result in the destination operand. (See Figure 4-6 for an example of the packing operation.) If a signed word integer value is beyond the range of an unsigned byte integer (that is, greater than FFH or less than 00H), the saturated unsigned byte integer value of FFH or 00H, respectively, is stored in the destination."],["PADDB","Performs a SIMD add of the packed integers from the source operand (second operand) and the destination operand (first operand), and stores the packed integer results in the destination operand. See Figure 9-4 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a SIMD operation. Overflow is handled with wraparound, as described in the following paragraphs."],["PADDSB","Performs a SIMD add of the packed signed integers from the source operand (second operand) and the destination operand (first operand), and stores the packed integer results in the destination operand. See Figure 9-4 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a SIMD operation. Overflow is handled with signed saturation, as described in the following paragraphs."],["PADDUSB","Performs a SIMD add of the packed unsigned integers from the source operand (second operand) and the destination operand (first operand), and stores the packed integer results in the destination operand. See Figure 9-4 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a SIMD operation. Overflow is handled with unsigned saturation, as described in the following paragraphs."],["PALIGNR","(V)PALIGNR concatenates the destination operand (the first operand) and the source operand (the second operand) into an intermediate composite, shifts the composite at byte granularity to the right by a constant immediate, and extracts the right-aligned result into the destination. The first and the second operands can be an MMX"],["PAND","Performs a bitwise logical AND operation on the first source operand and second source operand and stores the result in the destination operand. Each bit of the result is set to 1 if the corresponding bits of the first and second operands are 1, otherwise it is set to 0."],["PANDN","Performs a bitwise logical NOT operation on the first source operand, then performs bitwise AND with second source operand and stores the result in the destination operand. Each bit of the result is set to 1 if the corresponding bit in the first operand is 0 and the corresponding bit in the second operand is 1, otherwise it is set to 0."],["PAUSE","Improves the performance of spin-wait loops. When executing a “spin-wait loop,” processors will suffer a severe performance penalty when exiting the loop because it detects a possible memory order violation. The PAUSE instruction provides a hint to the processor that the code sequence is a spin-wait loop. The processor uses this hint to avoid the memory order violation in most situations, which greatly improves processor performance. For this reason, it is recommended that a PAUSE instruction be placed in all spin-wait loops."],["PAVGB","Performs a SIMD average of the packed unsigned integers from the source operand (second operand) and the destination operand (first operand), and stores the results in the destination operand. For each corresponding pair of data elements in the first and second operands, the elements are added together, a 1 is added to the temporary sum, and that result is shifted right one bit position."],["PBLENDVB","Conditionally copies byte elements from the source operand (second operand) to the destination operand (first operand) depending on mask bits defined in the implicit third register argument, XMM0. The mask bits are the most significant bit in each byte element of the XMM0 register."],["PBLENDW","Words from the source operand (second operand) are conditionally written to the destination operand (first operand) depending on bits in the immediate operand (third operand). The immediate bits (bits 7:0) form a mask that determines whether the corresponding word in the destination is copied from the source. If a bit in the mask, corresponding to a word, is “1\", then the word is copied, else the word element in the destination operand is unchanged."],["PCLMULQDQ","Performs a carry-less multiplication of two quadwords, selected from the first source and second source operand according to the value of the immediate byte. Bits 4 and 0 are used to select which 64-bit half of each operand to use according to Table 4-13, other bits of the immediate byte are ignored."],["PCMPEQB","Performs a SIMD compare for equality of the packed bytes, words, or doublewords in the destination operand (first operand) and the source operand (second operand). If a pair of data elements is equal, the corresponding data element in the destination operand is set to all 1s; otherwise, it is set to all 0s."],["PCMPEQQ","Performs an SIMD compare for equality of the packed quadwords in the destination operand (first operand) and the source operand (second operand). If a pair of data elements is equal, the corresponding data element in the destination is set to all 1s; otherwise, it is set to 0s."],["VPCMPESTRI","The instruction compares and processes data from two string fragments based on the encoded value in the Imm8 Control Byte (see Section 4.1, “Imm8 Control Byte Operation for PCMPESTRI / PCMPESTRM / PCMPISTRI / PCMPISTRM”), and generates an index stored to the count register (ECX)."],["VPCMPESTRM","The instruction compares data from two string fragments based on the encoded value in the imm8 contol byte (see Section 4.1, “Imm8 Control Byte Operation for PCMPESTRI / PCMPESTRM / PCMPISTRI / PCMPISTRM”), and generates a mask stored to XMM0."],["PCMPGTB","Performs an SIMD signed compare for the greater value of the packed byte, word, or doubleword integers in the destination operand (first operand) and the source operand (second operand). If a data element in the destination operand is greater than the corresponding date element in the source operand, the corresponding data element in the destination operand is set to all 1s; otherwise, it is set to all 0s."],["PCMPGTQ","Performs an SIMD signed compare for the packed quadwords in the destination operand (first operand) and the source operand (second operand). If the data element in the first (destination) operand is greater than the corresponding element in the second (source) operand, the corresponding data element in the destination is set to all 1s; otherwise, it is set to 0s."],["VPCMPISTRI","The instruction compares data from two strings based on the encoded value in the Imm8 Control Byte (see Section 4.1, “Imm8 Control Byte Operation for PCMPESTRI / PCMPESTRM / PCMPISTRI / PCMPISTRM”), and generates an index stored to ECX."],["VPCMPISTRM","The instruction compares data from two strings based on the encoded value in the imm8 byte (see Section 4.1, “Imm8 Control Byte Operation for PCMPESTRI / PCMPESTRM / PCMPISTRI / PCMPISTRM”) generating a mask stored to XMM0."],["PCONFIG","PCONFIG allows software to configure certain platform features. PCONFIG supports multiple leaf functions, with a leaf function identified by the value in EAX. The registers RBX, RCX, and RDX may provide input or output information for certain leaves. All leaves write status information to EAX but do not modify RBX, RCX, or RDX unless they are being used as leaf-specific output."],["PDEP","PDEP uses a mask in the second source operand (the third operand) to transfer/scatter contiguous low order bits in the first source operand (the second operand) into the destination (the first operand). PDEP takes the low bits from the first source operand and deposit them in the destination operand at the corresponding bit locations that are set in the second source operand (mask). All other bits (bits not set in mask) in destination are set to zero."],["PEXT","PEXT uses a mask in the second source operand (the third operand) to transfer either contiguous or non-contiguous bits in the first source operand (the second operand) to contiguous low order bit positions in the destination (the first operand). For each bit set in the MASK, PEXT extracts the corresponding bits from the first source operand and writes them into contiguous lower bits of destination operand. The remaining upper bits of destination are zeroed."],["PEXTRB","Extract a byte/dword/qword integer value from the source XMM register at a byte/dword/qword offset determined from imm8[3:0]. The destination can be a register or byte/dword/qword memory location. If the destination is a register, the upper bits of the register are zero extended."],["PEXTRW","Copies the word in the source operand (second operand) specified by the count operand (third operand) to the destination operand (first operand). The source operand can be an MMX technology register or an XMM register. The destination operand can be the low word of a general-purpose register or a 16-bit memory address. The count operand is an 8-bit immediate. When specifying a word location in an MMX technology register, the 2 least-significant bits of the count operand specify the location; for an XMM register, the 3 least-significant bits specify the location. The content of the destination register above bit 16 is cleared (set to all 0s)."],["PHADDSW","(V)PHADDSW adds two adjacent signed 16-bit integers horizontally from the source and destination operands and saturates the signed results; packs the signed, saturated 16-bit results to the destination operand (first operand) When the source operand is a 128-bit memory operand, the operand must be aligned on a 16-byte boundary or a general-protection exception (#GP) will be generated."],["PHADDD","(V)PHADDW adds two adjacent 16-bit signed integers horizontally from the source and destination operands and packs the 16-bit signed results to the destination operand (first operand). (V)PHADDD adds two adjacent 32-bit signed integers horizontally from the source and destination operands and packs the 32-bit signed results to the destination operand (first operand). When the source operand is a 128-bit memory operand, the operand must be aligned on a 16-byte boundary or a general-protection exception (#GP) will be generated."],["PHMINPOSUW","Determine the minimum unsigned word value in the source operand (second operand) and place the unsigned word in the low word (bits 0-15) of the destination operand (first operand). The word index of the minimum value is stored in bits 16-18 of the destination operand. The remaining upper bits of the destination are set to zero."],["PHSUBSW","(V)PHSUBSW performs horizontal subtraction on each adjacent pair of 16-bit signed integers by subtracting the most significant word from the least significant word of each pair in the source and destination operands. The signed, saturated 16-bit results are packed to the destination operand (first operand). When the source operand is a 128-bit memory operand, the operand must be aligned on a 16-byte boundary or a general-protection exception (#GP) will be generated."],["PHSUBD","(V)PHSUBW performs horizontal subtraction on each adjacent pair of 16-bit signed integers by subtracting the most significant word from the least significant word of each pair in the source and destination operands, and packs the signed 16-bit results to the destination operand (first operand). (V)PHSUBD performs horizontal subtraction on each adjacent pair of 32-bit signed integers by subtracting the most significant doubleword from the least significant doubleword of each pair, and packs the signed 32-bit result to the destination operand. When the source operand is a 128-bit memory operand, the operand must be aligned on a 16-byte boundary or a general-protection exception (#GP) will be generated."],["PINSRB","Copies a byte/dword/qword from the source operand (second operand) and inserts it in the destination operand (first operand) at the location specified with the count operand (third operand). (The other elements in the destination register are left untouched.) The source operand can be a general-purpose register or a memory location. (When the source operand is a general-purpose register, PINSRB copies the low byte of the register.) The destination operand is an XMM register. The count operand is an 8-bit immediate. When specifying a qword[dword, byte] location in an XMM register, the [2, 4] least-significant bit(s) of the count operand specify the location."],["PINSRW","Three operand MMX and SSE instructions"],["PMADDUBSW","(V)PMADDUBSW multiplies vertically each unsigned byte of the destination operand (first operand) with the corresponding signed byte of the source operand (second operand), producing intermediate signed 16-bit integers. Each adjacent pair of signed words is added and the saturated result is packed to the destination operand. For example, the lowest-order bytes (bits 7-0) in the source and destination operands are multiplied and the intermediate signed word result is added with the corresponding intermediate result from the 2nd lowest-order bytes (bits 15-8) of the operands; the sign-saturated result is stored in the lowest word of the destination register (15-0). The same operation is performed on the other pairs of adjacent bytes. Both operands can be MMX register or XMM registers. When the source operand is a 128-bit memory operand, the operand must be aligned on a 16-byte boundary or a general-protection exception (#GP) will be generated."],["PMADDWD","Multiplies the individual signed words of the destination operand (first operand) by the corresponding signed words of the source operand (second operand), producing temporary signed, doubleword results. The adjacent double-word results are then summed and stored in the destination operand. For example, the corresponding low-order words (15-0) and (31-16) in the source and destination operands are multiplied by one another and the double-word results are added together and stored in the low doubleword of the destination register (31-0). The same operation is performed on the other pairs of adjacent words. (Figure 4-11 shows this operation when using 64-bit operands)."],["PMAXSB","Performs a SIMD compare of the packed signed byte, word, dword or qword integers in the second source operand and the first source operand and returns the maximum value for each pair of integers to the destination operand."],["PMAXUB","Performs a SIMD compare of the packed unsigned byte, word integers in the second source operand and the first source operand and returns the maximum value for each pair of integers to the destination operand."],["PMAXUD","Performs a SIMD compare of the packed unsigned dword or qword integers in the second source operand and the first source operand and returns the maximum value for each pair of integers to the destination operand."],["PMINSB","Performs a SIMD compare of the packed signed byte, word, or dword integers in the second source operand and the first source operand and returns the minimum value for each pair of integers to the destination operand."],["PMINSD","Performs a SIMD compare of the packed signed dword or qword integers in the second source operand and the first source operand and returns the minimum value for each pair of integers to the destination operand."],["PMINUB","Performs a SIMD compare of the packed unsigned byte or word integers in the second source operand and the first source operand and returns the minimum value for each pair of integers to the destination operand."],["PMINUD","Performs a SIMD compare of the packed unsigned dword/qword integers in the second source operand and the first source operand and returns the minimum value for each pair of integers to the destination operand."],["PMOVMSKB","Creates a mask made up of the most significant bit of each byte of the source operand (second operand) and stores the result in the low byte or word of the destination operand (first operand)."],["PMOVSXBD","Legacy and VEX encoded versions: Packed byte, word, or dword integers in the low bytes of the source operand (second operand) are sign extended to word, dword, or quadword integers and stored in packed signed bytes the destination operand."],["PMOVZXBD","Legacy, VEX and EVEX encoded versions: Packed byte, word, or dword integers starting from the low bytes of the source operand (second operand) are zero extended to word, dword, or quadword integers and stored in packed signed bytes the destination operand."],["PMULDQ","Multiplies packed signed doubleword integers in the even-numbered (zero-based reference) elements of the first source operand with the packed signed doubleword integers in the corresponding elements of the second source operand and stores packed signed quadword results in the destination operand."],["PMULHRSW","PMULHRSW multiplies vertically each signed 16-bit integer from the destination operand (first operand) with the corresponding signed 16-bit integer of the source operand (second operand), producing intermediate, signed 32-bit integers. Each intermediate 32-bit integer is truncated to the 18 most significant bits. Rounding is always performed by adding 1 to the least significant bit of the 18-bit intermediate result. The final result is obtained by selecting the 16 bits immediately to the right of the most significant bit of each 18-bit intermediate result and packed to the destination operand."],["PMULHUW","Performs a SIMD unsigned multiply of the packed unsigned word integers in the destination operand (first operand) and the source operand (second operand), and stores the high 16 bits of each 32-bit intermediate results in the destination operand. (Figure 4-12 shows this operation when using 64-bit operands.)"],["PMULHW","Performs a SIMD signed multiply of the packed signed word integers in the destination operand (first operand) and the source operand (second operand), and stores the high 16 bits of each intermediate 32-bit result in the destination operand. (Figure 4-12 shows this operation when using 64-bit operands.)"],["PMULLD","Performs a SIMD signed multiply of the packed signed dword/qword integers from each element of the first source operand with the corresponding element in the second source operand. The low 32/64 bits of each 64/128-bit intermediate results are stored to the destination operand."],["PMULLW","Performs a SIMD signed multiply of the packed signed word integers in the destination operand (first operand) and the source operand (second operand), and stores the low 16 bits of each intermediate 32-bit result in the destination operand. (Figure 4-12 shows this operation when using 64-bit operands.)"],["PMULUDQ","Multiplies the first operand (destination operand) by the second operand (source operand) and stores the result in the destination operand."],["POP","Loads the value from the top of the stack to the location specified with the destination operand (or explicit opcode) and then increments the stack pointer. The destination operand can be a general-purpose register, memory location, or segment register."],["POPA","Pops doublewords (POPAD) or words (POPA) from the stack into the general-purpose registers. The registers are loaded in the following order: EDI, ESI, EBP, EBX, EDX, ECX, and EAX (if the operand-size attribute is 32) and DI, SI, BP, BX, DX, CX, and AX (if the operand-size attribute is 16). (These instructions reverse the operation of the PUSHA/PUSHAD instructions.) The value on the stack for the ESP or SP register is ignored. Instead, the ESP or SP register is incremented after each register is loaded."],["POPCNT","This instruction calculates the number of bits set to 1 in the second operand (source) and returns the count in the first operand (a destination register)."],["POPF","Pops a doubleword (POPFD) from the top of the stack (if the current operand-size attribute is 32) and stores the value in the EFLAGS register, or pops a word from the top of the stack (if the operand-size attribute is 16) and stores it in the lower 16 bits of the EFLAGS register (that is, the FLAGS register). These instructions reverse the operation of the PUSHF/PUSHFD/PUSHFQ instructions."],["POR","Performs a bitwise logical OR operation on the source operand (second operand) and the destination operand (first operand) and stores the result in the destination operand. Each bit of the result is set to 1 if either or both of the corresponding bits of the first and second operands are 1; otherwise, it is set to 0."],["PREFETCHW","Fetches the cache line of data from memory that contains the byte specified with the source operand to a location in the 1st or 2nd level cache and invalidates other cached instances of the line."],["PREFETCHWT1","Fetches the line of data from memory that contains the byte specified with the source operand to a location in the cache hierarchy specified by an intent to write hint (so that data is brought into ‘Exclusive’ state via a request for ownership) and a locality hint"],["PREFETCHNTA","Fetches the line of data from memory that contains the byte specified with the source operand to a location in the cache hierarchy specified by a locality hint"],["PSADBW","Computes the absolute value of the difference of 8 unsigned byte integers from the source operand (second operand) and from the destination operand (first operand). These 8 differences are then summed to produce an unsigned word integer result that is stored in the destination operand. Figure 4-14 shows the operation of the PSADBW instruction when using 64-bit operands."],["PSHUFB","PSHUFB performs in-place shuffles of bytes in the destination operand (the first operand) according to the shuffle control mask in the source operand (the second operand). The instruction permutes the data in the destination operand, leaving the shuffle mask unaffected. If the most significant bit (bit[7]) of each byte of the shuffle control mask is set, then constant zero is written in the result byte. Each byte in the shuffle control mask forms an index to permute the corresponding byte in the destination operand. The value of each index is the least significant 4 bits (128-bit operation) or 3 bits (64-bit operation) of the shuffle control byte. When the source operand is a 128-bit memory operand, the operand must be aligned on a 16-byte boundary or a general-protection exception (#GP) will be generated."],["PSHUFD","Copies doublewords from source operand (second operand) and inserts them in the destination operand (first operand) at the locations selected with the order operand (third operand). Figure 4-16 shows the operation of the 256-bit VPSHUFD instruction and the encoding of the order operand. Each 2-bit field in the order operand selects the contents of one doubleword location within a 128-bit lane and copy to the target element in the destination operand. For example, bits 0 and 1 of the order operand targets the first doubleword element in the low and high 128-bit lane of the destination operand for 256-bit VPSHUFD. The encoded value of bits 1:0 of the order operand (see the field encoding in Figure 4-16) determines which doubleword element (from the respective 128-bit lane) of the source operand will be copied to doubleword 0 of the destination operand."],["PSHUFHW","Copies words from the high quadword of a 128-bit lane of the source operand and inserts them in the high quadword of the destination operand at word locations (of the respective lane) selected with the immediate operand. This 256-bit operation is similar to the in-lane operation used by the 256-bit VPSHUFD instruction, which is illustrated in Figure 4-16. For 128-bit operation, only the low 128-bit lane is operative. Each 2-bit field in the immediate operand selects the contents of one word location in the high quadword of the destination operand. The binary encodings of the immediate operand fields select words (0, 1, 2 or 3, 4) from the high quadword of the source operand to be copied to the destination operand. The low quadword of the source operand is copied to the low quadword of the destination operand, for each 128-bit lane."],["PSHUFLW","Copies words from the low quadword of a 128-bit lane of the source operand and inserts them in the low quadword of the destination operand at word locations (of the respective lane) selected with the immediate operand. The 256-bit operation is similar to the in-lane operation used by the 256-bit VPSHUFD instruction, which is illustrated in Figure 4-16. For 128-bit operation, only the low 128-bit lane is operative. Each 2-bit field in the immediate operand selects the contents of one word location in the low quadword of the destination operand. The binary encodings of the immediate operand fields select words (0, 1, 2 or 3) from the low quadword of the source operand to be copied to the destination operand. The high quadword of the source operand is copied to the high quadword of the destination operand, for each 128-bit lane."],["PSHUFW","Copies words from the source operand (second operand) and inserts them in the destination operand (first operand) at word locations selected with the order operand (third operand). This operation is similar to the operation used by the PSHUFD instruction, which is illustrated in Figure 4-16. For the PSHUFW instruction, each 2-bit field in the order operand selects the contents of one word location in the destination operand. The encodings of the order operand fields select words from the source operand to be copied to the destination operand."],["PSIGNB","(V)PSIGNB/(V)PSIGNW/(V)PSIGND negates each data element of the destination operand (the first operand) if the signed integer value of the corresponding data element in the source operand (the second operand) is less than zero. If the signed integer value of a data element in the source operand is positive, the corresponding data element in the destination operand is unchanged. If a data element in the source operand is zero, the corresponding data element in the destination operand is set to zero."],["PSLLDQ","Shifts the destination operand (first operand) to the left by the number of bytes specified in the count operand (second operand). The empty low-order bytes are cleared (set to all 0s). If the value specified by the count operand is greater than 15, the destination operand is set to all 0s. The count operand is an 8-bit immediate."],["PSLLD","Shifts the bits in the individual data elements (words, doublewords, or quadword) in the destination operand (first operand) to the left by the number of bits specified in the count operand (second operand). As the bits in the data elements are shifted left, the empty low-order bits are cleared (set to 0). If the value specified by the count operand is greater than 15 (for words), 31 (for doublewords), or 63 (for a quadword), then the destination operand is set to all 0s. Figure 4-17 gives an example of shifting words in a 64-bit operand."],["PSRAD","Shifts the bits in the individual data elements (words, doublewords or quadwords) in the destination operand (first operand) to the right by the number of bits specified in the count operand (second operand). As the bits in the data elements are shifted right, the empty high-order bits are filled with the initial value of the sign bit of the data element. If the value specified by the count operand is greater than 15 (for words), 31 (for doublewords), or 63 (for quadwords), each destination data element is filled with the initial value of the sign bit of the element. (Figure 4-18 gives an example of shifting words in a 64-bit operand.)"],["PSRLDQ","Shifts the destination operand (first operand) to the right by the number of bytes specified in the count operand (second operand). The empty high-order bytes are cleared (set to all 0s). If the value specified by the count operand is greater than 15, the destination operand is set to all 0s. The count operand is an 8-bit immediate."],["PSRLD","Shifts the bits in the individual data elements (words, doublewords, or quadword) in the destination operand (first operand) to the right by the number of bits specified in the count operand (second operand). As the bits in the data elements are shifted right, the empty high-order bits are cleared (set to 0). If the value specified by the count operand is greater than 15 (for words), 31 (for doublewords), or 63 (for a quadword), then the destination operand is set to all 0s. Figure 4-19 gives an example of shifting words in a 64-bit operand."],["PSUBB","Performs a SIMD subtract of the packed integers of the source operand (second operand) from the packed integers of the destination operand (first operand), and stores the packed integer results in the destination operand. See Figure 9-4 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a SIMD operation. Overflow is handled with wraparound, as described in the following paragraphs."],["PSUBQ","Subtracts the second operand (source operand) from the first operand (destination operand) and stores the result in the destination operand. When packed quadword operands are used, a SIMD subtract is performed. When a quadword result is too large to be represented in 64 bits (overflow), the result is wrapped around and the low 64 bits are written to the destination element (that is, the carry is ignored)."],["PSUBSB","Performs a SIMD subtract of the packed signed integers of the source operand (second operand) from the packed signed integers of the destination operand (first operand), and stores the packed integer results in the destination operand. See Figure 9-4 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a SIMD operation. Overflow is handled with signed saturation, as described in the following paragraphs."],["PSUBUSB","Performs a SIMD subtract of the packed unsigned integers of the source operand (second operand) from the packed unsigned integers of the destination operand (first operand), and stores the packed unsigned integer results in the destination operand. See Figure 9-4 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a SIMD operation. Overflow is handled with unsigned saturation, as described in the following paragraphs."],["PTEST","PTEST and VPTEST set the ZF flag if all bits in the result are 0 of the bitwise AND of the first source operand (first operand) and the second source operand (second operand). VPTEST sets the CF flag if all bits in the result are 0 of the bitwise AND of the second source operand (second operand) and the logical NOT of the destination operand."],["PTWRITE","This instruction reads data in the source operand and sends it to the Intel Processor Trace hardware to be encoded in a PTW packet if TriggerEn, ContextEn, FilterEn, and PTWEn are all set to 1. For more details on these values, see Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 3C, Section 32.2.2, “Software Trace Instrumentation with PTWRITE”. The size of data is 64-bit if using REX.W in 64-bit mode, otherwise 32-bits of data are copied from the source operand."],["PUNPCKHBW","Unpacks and interleaves the high-order data elements (bytes, words, doublewords, or quadwords) of the destination operand (first operand) and source operand (second operand) into the destination operand. Figure 4-20 shows the unpack operation for bytes in 64-bit operands. The low-order data elements are ignored."],["PUNPCKLBW","Unpacks and interleaves the low-order data elements (bytes, words, doublewords, and quadwords) of the destination operand (first operand) and source operand (second operand) into the destination operand. (Figure 4-22 shows the unpack operation for bytes in 64-bit operands.). The high-order data elements are ignored."],["PUSH","Decrements the stack pointer and then stores the source operand on the top of the stack. Address and operand sizes are determined and used as follows"],["PUSHA","Pushes the contents of the general-purpose registers onto the stack. The registers are stored on the stack in the following order: EAX, ECX, EDX, EBX, ESP (original value), EBP, ESI, and EDI (if the current operand-size attribute is 32) and AX, CX, DX, BX, SP (original value), BP, SI, and DI (if the operand-size attribute is 16). These instructions perform the reverse operation of the POPA/POPAD instructions. The value pushed for the ESP or SP register is its value before prior to pushing the first register (see the “Operation” section below)."],["PUSHF","Decrements the stack pointer by 4 (if the current operand-size attribute is 32) and pushes the entire contents of the EFLAGS register onto the stack, or decrements the stack pointer by 2 (if the operand-size attribute is 16) and pushes the lower 16 bits of the EFLAGS register (that is, the FLAGS register) onto the stack. These instructions reverse the operation of the POPF/POPFD instructions."],["PXOR","Performs a bitwise logical exclusive-OR (XOR) operation on the source operand (second operand) and the destination operand (first operand) and stores the result in the destination operand. Each bit of the result is 1 if the corresponding bits of the two operands are different; each bit is 0 if the corresponding bits of the operands are the same."],["RCL","Shifts (rotates) the bits of the first operand (destination operand) the number of bit positions specified in the second operand (count operand) and stores the result in the destination operand. The destination operand can be a register or a memory location; the count operand is an unsigned integer that can be an immediate or a value in the CL register. The count is masked to 5 bits (or 6 bits if in 64-bit mode and REX.W = 1)."],["RCPPS","Performs a SIMD computation of the approximate reciprocals of the four packed single-precision floating-point values in the source operand (second operand) stores the packed single-precision floating-point results in the destination operand. The source operand can be an XMM register or a 128-bit memory location. The destination operand is an XMM register. See Figure 10-5 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a SIMD single-precision floating-point operation."],["RCPSS","Computes of an approximate reciprocal of the low single-precision floating-point value in the source operand (second operand) and stores the single-precision floating-point result in the destination operand. The source operand can be an XMM register or a 32-bit memory location. The destination operand is an XMM register. The three high-order doublewords of the destination operand remain unchanged. See Figure 10-6 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a scalar single-precision floating-point operation."],["RDFSBASE","Loads the general-purpose register indicated by the modR/M:r/m field with the FS or GS segment base address."],["RDPID","Reads the value of the IA32_TSC_AUX MSR (address C0000103H) into the destination register. The value of CS.D and operand-size prefixes (66H and REX.W) do not affect the behavior of the RDPID instruction."],["RDPKRU","Reads the value of PKRU into EAX and clears EDX. ECX must be 0 when RDPKRU is executed; otherwise, a general-protection exception (#GP) occurs."],["RDPMC","Reads the contents of the performance monitoring counter (PMC) specified in ECX register into registers EDX:EAX. (On processors that support the Intel 64 architecture, the high-order 32 bits of RCX are ignored.) The EDX register is loaded with the high-order 32 bits of the PMC and the EAX register is loaded with the low-order 32 bits. (On processors that support the Intel 64 architecture, the high-order 32 bits of each of RAX and RDX are cleared.) If fewer than 64 bits are implemented in the PMC being read, unimplemented bits returned to EDX:EAX will have value zero."],["RDTSC","Reads the current value of the processor’s time-stamp counter (a 64-bit MSR) into the EDX:EAX registers. The EDX register is loaded with the high-order 32 bits of the MSR and the EAX register is loaded with the low-order 32 bits. (On processors that support the Intel 64 architecture, the high-order 32 bits of each of RAX and RDX are cleared.)"],["RDTSCP","Reads the current value of the processor’s time-stamp counter (a 64-bit MSR) into the EDX:EAX registers and also reads the value of the IA32_TSC_AUX MSR (address C0000103H) into the ECX register. The EDX register is loaded with the high-order 32 bits of the IA32_TSC MSR; the EAX register is loaded with the low-order 32 bits of the IA32_TSC MSR; and the ECX register is loaded with the low-order 32-bits of IA32_TSC_AUX MSR. On processors that support the Intel 64 architecture, the high-order 32 bits of each of RAX, RDX, and RCX are cleared."],["REP","Repeats a string instruction the number of times specified in the count register or until the indicated condition of the ZF flag is no longer met. The REP (repeat), REPE (repeat while equal), REPNE (repeat while not equal), REPZ (repeat while zero), and REPNZ (repeat while not zero) mnemonics are prefixes that can be added to one of the string instructions. The REP prefix can be added to the INS, OUTS, MOVS, LODS, and STOS instructions, and the REPE, REPNE, REPZ, and REPNZ prefixes can be added to the CMPS and SCAS instructions. (The REPZ and REPNZ prefixes are synonymous forms of the REPE and REPNE prefixes, respectively.) The F3H prefix is defined for the following instructions and undefined for the rest"],["RET","Transfers program control to a return address located on the top of the stack. The address is usually placed on the stack by a CALL instruction, and the return is made to the instruction that follows the CALL instruction."],["RORX","Rotates the bits of second operand right by the count value specified in imm8 without affecting arithmetic flags. The RORX instruction does not read or write the arithmetic flags."],["ROUNDPD","Round the 2 double-precision floating-point values in the source operand (second operand) using the rounding mode specified in the immediate operand (third operand) and place the results in the destination operand (first operand). The rounding process rounds each input floating-point value to an integer value and returns the integer result as a double-precision floating-point value."],["ROUNDPS","Round the 4 single-precision floating-point values in the source operand (second operand) using the rounding mode specified in the immediate operand (third operand) and place the results in the destination operand (first operand). The rounding process rounds each input floating-point value to an integer value and returns the integer result as a single-precision floating-point value."],["ROUNDSD","Round the DP FP value in the lower qword of the source operand (second operand) using the rounding mode specified in the immediate operand (third operand) and place the result in the destination operand (first operand). The rounding process rounds a double-precision floating-point input to an integer value and returns the integer result as a double precision floating-point value in the lowest position. The upper double precision floating-point value in the destination is retained."],["ROUNDSS","Round the single-precision floating-point value in the lowest dword of the source operand (second operand) using the rounding mode specified in the immediate operand (third operand) and place the result in the destination operand (first operand). The rounding process rounds a single-precision floating-point input to an integer value and returns the result as a single-precision floating-point value in the lowest position. The upper three single-precision floating-point values in the destination are retained."],["RSM","Returns program control from system management mode (SMM) to the application program or operating-system procedure that was interrupted when the processor received an SMM interrupt. The processor’s state is restored from the dump created upon entering SMM. If the processor detects invalid state information during state restoration, it enters the shutdown state. The following invalid information can cause a shutdown"],["RSQRTPS","Performs a SIMD computation of the approximate reciprocals of the square roots of the four packed single-precision floating-point values in the source operand (second operand) and stores the packed single-precision floating-point results in the destination operand. The source operand can be an XMM register or a 128-bit memory location. The destination operand is an XMM register. See Figure 10-5 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a SIMD single-precision floating-point operation."],["RSQRTSS","Computes an approximate reciprocal of the square root of the low single-precision floating-point value in the source operand (second operand) stores the single-precision floating-point result in the destination operand. The source operand can be an XMM register or a 32-bit memory location. The destination operand is an XMM register. The three high-order doublewords of the destination operand remain unchanged. See Figure 10-6 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 1, for an illustration of a scalar single-precision floating-point operation."],["SAHF","Loads the SF, ZF, AF, PF, and CF flags of the EFLAGS register with values from the corresponding bits in the AH register (bits 7, 6, 4, 2, and 0, respectively). Bits 1, 3, and 5 of register AH are ignored; the corresponding reserved bits (1, 3, and 5) in the EFLAGS register remain as shown in the “Operation” section below."],["SAL","Shifts the bits in the first operand (destination operand) to the left or right by the number of bits specified in the second operand (count operand). Bits shifted beyond the destination operand boundary are first shifted into the CF flag, then discarded. At the end of the shift operation, the CF flag contains the last bit shifted out of the destination operand."],["SARX","Shifts the bits of the first source operand (the second operand) to the left or right by a COUNT value specified in the second source operand (the third operand). The result is written to the destination operand (the first operand)."],["SBB","Adds the source operand (second operand) and the carry (CF) flag, and subtracts the result from the destination operand (first operand). The result of the subtraction is stored in the destination operand. The destination operand can be a register or a memory location; the source operand can be an immediate, a register, or a memory location. (However, two memory operands cannot be used in one instruction.) The state of the CF flag represents a borrow from a previous subtraction."],["SCAS","In non-64-bit modes and in default 64-bit mode: this instruction compares a byte, word, doubleword or quadword specified using a memory operand with the value in AL, AX, or EAX. It then sets status flags in EFLAGS recording the results. The memory operand address is read from ES:(E)DI register (depending on the address-size attribute of the instruction and the current operational mode). Note that ES cannot be overridden with a segment override prefix."],["SERIALIZE","Serializes instruction execution. Before the next instruction is fetched and executed, the SERIALIZE instruction ensures that all modifications to flags, registers, and memory by previous instructions are completed, draining all buffered writes to memory. This instruction is also a serializing instruction as defined in the section “Serializing Instructions” in Chapter 8 of the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 3A."],["SETSSBSY","The SETSSBSY instruction verifies the presence of a non-busy supervisor shadow stack token at the address in the IA32_PL0_SSP MSR and marks it busy. Following successful execution of the instruction, the SSP is set to the value of the IA32_PL0_SSP MSR."],["SETA","Sets the destination operand to 0 or 1 depending on the settings of the status flags (CF, SF, OF, ZF, and PF) in the EFLAGS register. The destination operand points to a byte register or a byte in memory. The condition code suffix (cc) indicates the condition being tested for."],["SFENCE","Orders processor execution relative to all memory stores prior to the SFENCE instruction. The processor ensures that every store prior to SFENCE is globally visible before any store after SFENCE becomes globally visible. The SFENCE instruction is ordered with respect to memory stores, other SFENCE instructions, MFENCE instructions, and any serializing instructions (such as the CPUID instruction). It is not ordered with respect to memory loads or the LFENCE instruction."],["SHA1MSG1","The SHA1MSG1 instruction is one of two SHA1 message scheduling instructions. The instruction performs an intermediate calculation for the next four SHA1 message dwords."],["SHA1MSG2","The SHA1MSG2 instruction is one of two SHA1 message scheduling instructions. The instruction performs the final calculation to derive the next four SHA1 message dwords."],["SHA1NEXTE","The SHA1NEXTE calculates the SHA1 state variable E after four rounds of operation from the current SHA1 state variable A in the destination operand. The calculated value of the SHA1 state variable E is added to the source operand, which contains the scheduled dwords."],["SHA1RNDS4","The SHA1RNDS4 instruction performs four rounds of SHA1 operation using an initial SHA1 state (A,B,C,D) from the first operand (which is a source operand and the destination operand) and some pre-computed sum of the next 4 round message dwords, and state variable E from the second operand (a source operand). The updated SHA1 state (A,B,C,D) after four rounds of processing is stored in the destination operand."],["SHA256MSG1","The SHA256MSG1 instruction is one of two SHA256 message scheduling instructions. The instruction performs an intermediate calculation for the next four SHA256 message dwords."],["SHA256MSG2","The SHA256MSG2 instruction is one of two SHA2 message scheduling instructions. The instruction performs the final calculation for the next four SHA256 message dwords."],["SHA256RNDS2","The SHA256RNDS2 instruction performs 2 rounds of SHA256 operation using an initial SHA256 state (C,D,G,H) from the first operand, an initial SHA256 state (A,B,E,F) from the second operand, and a pre-computed sum of the next 2 round message dwords and the corresponding round constants from the implicit operand xmm0. Note that only the two lower dwords of XMM0 are used by the instruction."],["SHLD","The SHLD instruction is used for multi-precision shifts of 64 bits or more."],["SHRD","The SHRD instruction is useful for multi-precision shifts of 64 bits or more."],["SHUFPD","Selects a double-precision floating-point value of an input pair using a bit control and move to a designated element of the destination operand. The low-to-high order of double-precision element of the destination operand is interleaved between the first source operand and the second source operand at the granularity of input pair of 128 bits. Each bit in the imm8 byte, starting from bit 0, is the select control of the corresponding element of the destination to received the shuffled result of an input pair."],["SHUFPS","Selects a single-precision floating-point value of an input quadruplet using a two-bit control and move to a designated element of the destination operand. Each 64-bit element-pair of a 128-bit lane of the destination operand is interleaved between the corresponding lane of the first source operand and the second source operand at the granularity 128 bits. Each two bits in the imm8 byte, starting from bit 0, is the select control of the corresponding element of a 128-bit lane of the destination to received the shuffled result of an input quadruplet. The two lower elements of a 128-bit lane in the destination receives shuffle results from the quadruple of the first source operand. The next two elements of the destination receives shuffle results from the quadruple of the second source operand."],["SIDT","Stores the content the interrupt descriptor table register (IDTR) in the destination operand. The destination operand specifies a 6-byte memory location."],["SLDT","Stores the segment selector from the local descriptor table register (LDTR) in the destination operand. The destination operand can be a general-purpose register or a memory location. The segment selector stored with this instruction points to the segment descriptor (located in the GDT) for the current LDT. This instruction can only be executed in protected mode."],["SMSW","Stores the machine status word (bits 0 through 15 of control register CR0) into the destination operand. The destination operand can be a general-purpose register or a memory location."],["SQRTPD","Performs a SIMD computation of the square roots of the two, four or eight packed double-precision floating-point values in the source operand (the second operand) stores the packed double-precision floating-point results in the destination operand (the first operand)."],["SQRTPS","Performs a SIMD computation of the square roots of the four, eight or sixteen packed single-precision floating-point values in the source operand (second operand) stores the packed single-precision floating-point results in the destination operand."],["SQRTSD","Computes the square root of the low double-precision floating-point value in the second source operand and stores the double-precision floating-point result in the destination operand. The second source operand can be an XMM register or a 64-bit memory location. The first source and destination operands are XMM registers."],["SQRTSS","Computes the square root of the low single-precision floating-point value in the second source operand and stores the single-precision floating-point result in the destination operand. The second source operand can be an XMM register or a 32-bit memory location. The first source and destination operands is an XMM register."],["STAC","Sets the AC flag bit in EFLAGS register. This may enable alignment checking of user-mode data accesses. This allows explicit supervisor-mode data accesses to user-mode pages even if the SMAP bit is set in the CR4 register."],["STC","Sets the CF flag in the EFLAGS register. Operation is the same in all modes."],["STD","Sets the DF flag in the EFLAGS register. When the DF flag is set to 1, string operations decrement the index registers (ESI and/or EDI). Operation is the same in all modes."],["STI","In most cases, STI sets the interrupt flag (IF) in the EFLAGS register. This allows the processor to respond to maskable hardware interrupts."],["STMXCSR","Stores the contents of the MXCSR control and status register to the destination operand. The destination operand is a 32-bit memory location. The reserved bits in the MXCSR register are stored as 0s."],["STOS","In non-64-bit and default 64-bit mode; stores a byte, word, or doubleword from the AL, AX, or EAX register (respectively) into the destination operand. The destination operand is a memory location, the address of which is read from either the ES:EDI or ES:DI register (depending on the address-size attribute of the instruction and the mode of operation). The ES segment cannot be overridden with a segment override prefix."],["STR","Stores the segment selector from the task register (TR) in the destination operand. The destination operand can be a general-purpose register or a memory location. The segment selector stored with this instruction points to the task state segment (TSS) for the currently running task."],["SUB","Subtracts the second operand (source operand) from the first operand (destination operand) and stores the result in the destination operand. The destination operand can be a register or a memory location; the source operand can be an immediate, register, or memory location. (However, two memory operands cannot be used in one instruction.) When an immediate value is used as an operand, it is sign-extended to the length of the destination operand format."],["SUBPD","Performs a SIMD subtract of the two, four or eight packed double-precision floating-point values of the second Source operand from the first Source operand, and stores the packed double-precision floating-point results in the destination operand."],["SUBPS","Performs a SIMD subtract of the packed single-precision floating-point values in the second Source operand from the First Source operand, and stores the packed single-precision floating-point results in the destination operand."],["SUBSD","Subtract the low double-precision floating-point value in the second source operand from the first source operand and stores the double-precision floating-point result in the low quadword of the destination operand."],["SUBSS","Subtract the low single-precision floating-point value from the second source operand and the first source operand and store the double-precision floating-point result in the low doubleword of the destination operand."],["SWAPGS","SWAPGS exchanges the current GS base register value with the value contained in MSR address C0000102H (IA32_KERNEL_GS_BASE). The SWAPGS instruction is a privileged instruction intended for use by system software."],["SYSCALL","SYSCALL invokes an OS system-call handler at privilege level 0. It does so by loading RIP from the IA32_LSTAR MSR (after saving the address of the instruction following SYSCALL into RCX). (The WRMSR instruction ensures that the IA32_LSTAR MSR always contain a canonical address.)"],["SYSENTER","Executes a fast call to a level 0 system procedure or routine. SYSENTER is a companion instruction to SYSEXIT. The instruction is optimized to provide the maximum performance for system calls from user code running at privilege level 3 to operating system or executive procedures running at privilege level 0."],["SYSEXIT","Executes a fast return to privilege level 3 user code. SYSEXIT is a companion instruction to the SYSENTER instruction. The instruction is optimized to provide the maximum performance for returns from system procedures executing at protections levels 0 to user procedures executing at protection level 3. It must be executed from code executing at privilege level 0."],["SYSRET","SYSRET is a companion instruction to the SYSCALL instruction. It returns from an OS system-call handler to user code at privilege level 3. It does so by loading RIP from RCX and loading RFLAGS from R11.1 With a 64-bit operand size, SYSRET remains in 64-bit mode; otherwise, it enters compatibility mode and only the low 32 bits of the registers are loaded."],["TEST","Computes the bit-wise logical AND of first operand (source 1 operand) and the second operand (source 2 operand) and sets the SF, ZF, and PF status flags according to the result. The result is then discarded."],["TPAUSE","TPAUSE instructs the processor to enter an implementation-dependent optimized state. There are two such optimized states to choose from: light-weight power/performance optimized state, and improved power/performance optimized state. The selection between the two is governed by the explicit input register bit[0] source operand."],["TZCNT","TZCNT counts the number of trailing least significant zero bits in source operand (second operand) and returns the result in destination operand (first operand). TZCNT is an extension of the BSF instruction. The key difference between TZCNT and BSF instruction is that TZCNT provides operand size as output when source operand is zero while in the case of BSF instruction, if source operand is zero, the content of destination operand are undefined. On processors that do not support TZCNT, the instruction byte encoding is executed as BSF."],["UCOMISD","Performs an unordered compare of the double-precision floating-point values in the low quadwords of operand 1 (first operand) and operand 2 (second operand), and sets the ZF, PF, and CF flags in the EFLAGS register according to the result (unordered, greater than, less than, or equal). The OF, SF and AF flags in the EFLAGS register are set to 0. The unordered result is returned if either source operand is a NaN (QNaN or SNaN)."],["UCOMISS","Compares the single-precision floating-point values in the low doublewords of operand 1 (first operand) and operand 2 (second operand), and sets the ZF, PF, and CF flags in the EFLAGS register according to the result (unordered, greater than, less than, or equal). The OF, SF and AF flags in the EFLAGS register are set to 0. The unordered result is returned if either source operand is a NaN (QNaN or SNaN)."],["UD01","Generates an invalid opcode exception. This instruction is provided for software testing to explicitly generate an invalid opcode exception. The opcodes for this instruction are reserved for this purpose."],["UMONITOR","The UMONITOR instruction arms address monitoring hardware using an address specified in the source register (the address range that the monitoring hardware checks for store operations can be determined by using the CPUID monitor leaf function, EAX=05H). A store to an address within the specified address range triggers the monitoring hardware. The state of monitor hardware is used by UMWAIT."],["UMWAIT","UMWAIT instructs the processor to enter an implementation-dependent optimized state while monitoring a range of addresses. The optimized state may be either a light-weight power/performance optimized state or an improved power/performance optimized state. The selection between the two states is governed by the explicit input register bit[0] source operand."],["UNPCKHPD","Performs an interleaved unpack of the high double-precision floating-point values from the first source operand and the second source operand. See Figure 4-15 in the Intel® 64 and IA-32 Architectures Software Developer’s Manual, Volume 2B."],["UNPCKHPS","Performs an interleaved unpack of the high single-precision floating-point values from the first source operand and the second source operand."],["UNPCKLPD","Performs an interleaved unpack of the low double-precision floating-point values from the first source operand and the second source operand."],["UNPCKLPS","Performs an interleaved unpack of the low single-precision floating-point values from the first source operand and the second source operand."],["V4FMADDPS","This instruction computes 4 sequential packed fused single-precision floating-point multiply-add instructions with a sequentially selected memory operand in each of the four steps."],["V4FMADDSS","This instruction computes 4 sequential scalar fused single-precision floating-point multiply-add instructions with a sequentially selected memory operand in each of the four steps."],["VALIGND","Concatenates and shifts right doubleword/quadword elements of the first source operand (the second operand) and the second source operand (the third operand) into a 1024/512/256-bit intermediate vector. The low 512/256/128-bit of the intermediate vector is written to the destination operand (the first operand) using the writemask k1. The destination and first source operands are ZMM/YMM/XMM registers. The second source operand can be a ZMM/YMM/XMM register, a 512/256/128-bit memory location or a 512/256/128-bit vector broadcasted from a 32/64-bit memory location."],["VBLENDMPD","Performs an element-by-element blending between float64/float32 elements in the first source operand (the second operand) with the elements in the second source operand (the third operand) using an opmask register as select control. The blended result is written to the destination register."],["VBROADCASTF128","VBROADCASTSD/VBROADCASTSS/VBROADCASTF128 load floating-point values as one tuple from the source operand (second operand) in memory and broadcast to all elements of the destination operand (first operand)."],["VCOMPRESSPD","Compress (store) up to 8 double-precision floating-point values from the source operand (the second operand) as a contiguous vector to the destination operand (the first operand) The source operand is a ZMM/YMM/XMM register, the destination operand can be a ZMM/YMM/XMM register or a 512/256/128-bit memory location."],["VCOMPRESSPS","Compress (stores) up to 16 single-precision floating-point values from the source operand (the second operand) to the destination operand (the first operand). The source operand is a ZMM/YMM/XMM register, the destination operand can be a ZMM/YMM/XMM register or a 512/256/128-bit memory location."],["VCVTNE2PS2BF16","Converts two SIMD registers of packed single data into a single register of packed BF16 data."],["VCVTNEPS2BF16","Converts one SIMD register of packed single data into a single register of packed BF16 data."],["VCVTPD2QQ","Converts packed double-precision floating-point values in the source operand (second operand) to packed quadword integers in the destination operand (first operand)."],["VCVTPD2UDQ","Converts packed double-precision floating-point values in the source operand (the second operand) to packed unsigned doubleword integers in the destination operand (the first operand)."],["VCVTPD2UQQ","Converts packed double-precision floating-point values in the source operand (second operand) to packed unsigned quadword integers in the destination operand (first operand)."],["VCVTPH2PS","Converts packed half precision (16-bits) floating-point values in the low-order bits of the source operand (the second operand) to packed single-precision floating-point values and writes the converted values into the destination operand (the first operand)."],["VCVTPS2PH","Convert packed single-precision floating values in the source operand to half-precision (16-bit) floating-point values and store to the destination operand. The rounding mode is specified using the immediate field (imm8)."],["VCVTPS2QQ","Converts eight packed single-precision floating-point values in the source operand to eight signed quadword integers in the destination operand."],["VCVTPS2UDQ","Converts sixteen packed single-precision floating-point values in the source operand to sixteen unsigned double-word integers in the destination operand."],["VCVTPS2UQQ","Converts up to eight packed single-precision floating-point values in the source operand to unsigned quadword integers in the destination operand."],["VCVTQQ2PD","Converts packed quadword integers in the source operand (second operand) to packed double-precision floating-point values in the destination operand (first operand)."],["VCVTQQ2PS","Converts packed quadword integers in the source operand (second operand) to packed single-precision floating-point values in the destination operand (first operand)."],["VCVTSD2USI","Converts a double-precision floating-point value in the source operand (the second operand) to an unsigned doubleword integer in the destination operand (the first operand). The source operand can be an XMM register or a 64-bit memory location. The destination operand is a general-purpose register. When the source operand is an XMM register, the double-precision floating-point value is contained in the low quadword of the register."],["VCVTSS2USI","Converts a single-precision floating-point value in the source operand (the second operand) to an unsigned double-word integer (or unsigned quadword integer if operand size is 64 bits) in the destination operand (the first operand). The source operand can be an XMM register or a memory location. The destination operand is a general-purpose register. When the source operand is an XMM register, the single-precision floating-point value is contained in the low doubleword of the register."],["VCVTTPD2QQ","Converts with truncation packed double-precision floating-point values in the source operand (second operand) to packed quadword integers in the destination operand (first operand)."],["VCVTTPD2UDQ","Converts with truncation packed double-precision floating-point values in the source operand (the second operand) to packed unsigned doubleword integers in the destination operand (the first operand)."],["VCVTTPD2UQQ","Converts with truncation packed double-precision floating-point values in the source operand (second operand) to packed unsigned quadword integers in the destination operand (first operand)."],["VCVTTPS2QQ","Converts with truncation packed single-precision floating-point values in the source operand to eight signed quadword integers in the destination operand."],["VCVTTPS2UDQ","Converts with truncation packed single-precision floating-point values in the source operand to sixteen unsigned doubleword integers in the destination operand."],["VCVTTPS2UQQ","Converts with truncation up to eight packed single-precision floating-point values in the source operand to unsigned quadword integers in the destination operand."],["VCVTTSD2USI","Converts with truncation a double-precision floating-point value in the source operand (the second operand) to an unsigned doubleword integer (or unsigned quadword integer if operand size is 64 bits) in the destination operand (the first operand). The source operand can be an XMM register or a 64-bit memory location. The destination operand is a general-purpose register. When the source operand is an XMM register, the double-precision floating-point value is contained in the low quadword of the register."],["VCVTTSS2USI","Converts with truncation a single-precision floating-point value in the source operand (the second operand) to an unsigned doubleword integer (or unsigned quadword integer if operand size is 64 bits) in the destination operand (the first operand). The source operand can be an XMM register or a memory location. The destination operand is a general-purpose register. When the source operand is an XMM register, the single-precision floating-point value is contained in the low doubleword of the register."],["VCVTUDQ2PD","Converts packed unsigned doubleword integers in the source operand (second operand) to packed double-precision floating-point values in the destination operand (first operand)."],["VCVTUDQ2PS","Converts packed unsigned doubleword integers in the source operand (second operand) to single-precision floating-point values in the destination operand (first operand)."],["VCVTUQQ2PD","Converts packed unsigned quadword integers in the source operand (second operand) to packed double-precision floating-point values in the destination operand (first operand)."],["VCVTUQQ2PS","Converts packed unsigned quadword integers in the source operand (second operand) to single-precision floating-point values in the destination operand (first operand)."],["VCVTUSI2SD","Converts an unsigned doubleword integer (or unsigned quadword integer if operand size is 64 bits) in the second source operand to a double-precision floating-point value in the destination operand. The result is stored in the low quadword of the destination operand. When conversion is inexact, the value returned is rounded according to the rounding control bits in the MXCSR register."],["VCVTUSI2SS","Converts a unsigned doubleword integer (or unsigned quadword integer if operand size is 64 bits) in the source operand (second operand) to a single-precision floating-point value in the destination operand (first operand). The source operand can be a general-purpose register or a memory location. The destination operand is an XMM register. The result is stored in the low doubleword of the destination operand. When a conversion is inexact, the value returned is rounded according to the rounding control bits in the MXCSR register or the embedded rounding control bits."],["VDBPSADBW","Compute packed SAD (sum of absolute differences) word results of unsigned bytes from two 32-bit dword elements. Packed SAD word results are calculated in multiples of qword superblocks, producing 4 SAD word results in each 64-bit superblock of the destination register."],["VDPBF16PS","This instruction performs a SIMD dot-product of two BF16 pairs and accumulates into a packed single precision register."],["VERR","Verifies whether the code or data segment specified with the source operand is readable (VERR) or writable (VERW) from the current privilege level (CPL). The source operand is a 16-bit register or a memory location that contains the segment selector for the segment to be verified. If the segment is accessible and readable (VERR) or writable (VERW), the ZF flag is set; otherwise, the ZF flag is cleared. Code segments are never verified as writable. This check cannot be performed on system segments."],["VEXP2PD","Computes the approximate base-2 exponential evaluation of the double-precision floating-point values in the source operand (the second operand) and stores the results to the destination operand (the first operand) using the writemask k1. The approximate base-2 exponential is evaluated with less than 2^-23 of relative error."],["VEXP2PS","Computes the approximate base-2 exponential evaluation of the single-precision floating-point values in the source operand (the second operand) and store the results in the destination operand (the first operand) using the writemask k1. The approximate base-2 exponential is evaluated with less than 2^-23 of relative error."],["VEXPANDPD","Expand (load) up to 8/4/2, contiguous, double-precision floating-point values of the input vector in the source operand (the second operand) to sparse elements in the destination operand (the first operand) selected by the writemask k1."],["VEXPANDPS","Expand (load) up to 16/8/4, contiguous, single-precision floating-point values of the input vector in the source operand (the second operand) to sparse elements of the destination operand (the first operand) selected by the writemask k1."],["VEXTRACTF128","VEXTRACTF128/VEXTRACTF32x4 and VEXTRACTF64x2 extract 128-bits of single-precision floating-point values from the source operand (the second operand) and store to the low 128-bit of the destination operand (the first operand). The 128-bit data extraction occurs at an 128-bit granular offset specified by imm8[0] (256-bit) or imm8[1:0] as the multiply factor. The destination may be either a vector register or an 128-bit memory location."],["VEXTRACTI128","VEXTRACTI128/VEXTRACTI32x4 and VEXTRACTI64x2 extract 128-bits of doubleword integer values from the source operand (the second operand) and store to the low 128-bit of the destination operand (the first operand). The 128-bit data extraction occurs at an 128-bit granular offset specified by imm8[0] (256-bit) or imm8[1:0] as the multiply factor. The destination may be either a vector register or an 128-bit memory location."],["VFIXUPIMMPD","Perform fix-up of quad-word elements encoded in double-precision floating-point format in the first source operand (the second operand) using a 32-bit, two-level look-up table specified in the corresponding quadword element of the second source operand (the third operand) with exception reporting specifier imm8. The elements that are fixed-up are selected by mask bits of 1 specified in the opmask k1. Mask bits of 0 in the opmask k1 or table response action of 0000b preserves the corresponding element of the first operand. The fixed-up elements from the first source operand and the preserved element in the first operand are combined as the final results in the destination operand (the first operand)."],["VFIXUPIMMPS","Perform fix-up of doubleword elements encoded in single-precision floating-point format in the first source operand (the second operand) using a 32-bit, two-level look-up table specified in the corresponding doubleword element of the second source operand (the third operand) with exception reporting specifier imm8. The elements that are fixed-up are selected by mask bits of 1 specified in the opmask k1. Mask bits of 0 in the opmask k1 or table response action of 0000b preserves the corresponding element of the first operand. The fixed-up elements from the first source operand and the preserved element in the first operand are combined as the final results in the destination operand (the first operand)."],["VFIXUPIMMSD","Perform a fix-up of the low quadword element encoded in double-precision floating-point format in the first source operand (the second operand) using a 32-bit, two-level look-up table specified in the low quadword element of the second source operand (the third operand) with exception reporting specifier imm8. The element that is fixed-up is selected by mask bit of 1 specified in the opmask k1. Mask bit of 0 in the opmask k1 or table response action of 0000b preserves the corresponding element of the first operand. The fixed-up element from the first source operand or the preserved element in the first operand becomes the low quadword element of the destination operand (the first operand). Bits 127:64 of the destination operand is copied from the corresponding bits of the first source operand. The destination and first source operands are XMM registers. The second source operand can be a XMM register or a 64- bit memory location."],["VFIXUPIMMSS","Perform a fix-up of the low doubleword element encoded in single-precision floating-point format in the first source operand (the second operand) using a 32-bit, two-level look-up table specified in the low doubleword element of the second source operand (the third operand) with exception reporting specifier imm8. The element that is fixed-up is selected by mask bit of 1 specified in the opmask k1. Mask bit of 0 in the opmask k1 or table response action of 0000b preserves the corresponding element of the first operand. The fixed-up element from the first source operand or the preserved element in the first operand becomes the low doubleword element of the destination operand (the first operand) Bits 127:32 of the destination operand is copied from the corresponding bits of the first source operand. The destination and first source operands are XMM registers. The second source operand can be a XMM register or a 32-bit memory location."],["VFMADD132PD","Performs a set of SIMD multiply-add computation on packed double-precision floating-point values using three source operands and writes the multiply-add results in the destination operand. The destination operand is also the first source operand. The second operand must be a SIMD register. The third source operand can be a SIMD register or a memory location."],["VFMADD132PS","Performs a set of SIMD multiply-add computation on packed single-precision floating-point values using three source operands and writes the multiply-add results in the destination operand. The destination operand is also the first source operand. The second operand must be a SIMD register. The third source operand can be a SIMD register or a memory location."],["VFMADD132SD","Performs a SIMD multiply-add computation on the low double-precision floating-point values using three source operands and writes the multiply-add result in the destination operand. The destination operand is also the first source operand. The first and second operand are XMM registers. The third source operand can be an XMM register or a 64-bit memory location."],["VFMADD132SS","Performs a SIMD multiply-add computation on single-precision floating-point values using three source operands and writes the multiply-add results in the destination operand. The destination operand is also the first source operand. The first and second operands are XMM registers. The third source operand can be a XMM register or a 32-bit memory location."],["VFMADDSUB132PD","VFMADDSUB132PD: Multiplies the two, four, or eight packed double-precision floating-point values from the first source operand to the two or four packed double-precision floating-point values in the third source operand. From the infinite precision intermediate result, adds the odd double-precision floating-point elements and subtracts the even double-precision floating-point values in the second source operand, performs rounding and stores the resulting two or four packed double-precision floating-point values to the destination operand (first source operand)."],["VFMADDSUB132PS","VFMADDSUB132PS: Multiplies the four, eight or sixteen packed single-precision floating-point values from the first source operand to the corresponding packed single-precision floating-point values in the third source operand. From the infinite precision intermediate result, adds the odd single-precision floating-point elements and subtracts the even single-precision floating-point values in the second source operand, performs rounding and stores the resulting packed single-precision floating-point values to the destination operand (first source operand)."],["VFMSUB132PD","Performs a set of SIMD multiply-subtract computation on packed double-precision floating-point values using three source operands and writes the multiply-subtract results in the destination operand. The destination operand is also the first source operand. The second operand must be a SIMD register. The third source operand can be a SIMD register or a memory location."],["VFMSUB132PS","Performs a set of SIMD multiply-subtract computation on packed single-precision floating-point values using three source operands and writes the multiply-subtract results in the destination operand. The destination operand is also the first source operand. The second operand must be a SIMD register. The third source operand can be a SIMD register or a memory location."],["VFMSUB132SD","Performs a SIMD multiply-subtract computation on the low packed double-precision floating-point values using three source operands and writes the multiply-subtract result in the destination operand. The destination operand is also the first source operand. The second operand must be a XMM register. The third source operand can be a XMM register or a 64-bit memory location."],["VFMSUB132SS","Performs a SIMD multiply-subtract computation on the low packed single-precision floating-point values using three source operands and writes the multiply-subtract result in the destination operand. The destination operand is also the first source operand. The second operand must be a XMM register. The third source operand can be a XMM register or a 32-bit memory location."],["VFMSUBADD132PD","VFMSUBADD132PD: Multiplies the two, four, or eight packed double-precision floating-point values from the first source operand to the two or four packed double-precision floating-point values in the third source operand. From the infinite precision intermediate result, subtracts the odd double-precision floating-point elements and adds the even double-precision floating-point values in the second source operand, performs rounding and stores the resulting two or four packed double-precision floating-point values to the destination operand (first source operand)."],["VFMSUBADD132PS","VFMSUBADD132PS: Multiplies the four, eight or sixteen packed single-precision floating-point values from the first source operand to the corresponding packed single-precision floating-point values in the third source operand. From the infinite precision intermediate result, subtracts the odd single-precision floating-point elements and adds the even single-precision floating-point values in the second source operand, performs rounding and stores the resulting packed single-precision floating-point values to the destination operand (first source operand)."],["VFNMADD132PD","VFNMADD132PD: Multiplies the two, four or eight packed double-precision floating-point values from the first source operand to the two, four or eight packed double-precision floating-point values in the third source operand, adds the negated infinite precision intermediate result to the two, four or eight packed double-precision floating-point values in the second source operand, performs rounding and stores the resulting two, four or eight packed double-precision floating-point values to the destination operand (first source operand)."],["VFNMADD132PS","VFNMADD132PS: Multiplies the four, eight or sixteen packed single-precision floating-point values from the first source operand to the four, eight or sixteen packed single-precision floating-point values in the third source operand, adds the negated infinite precision intermediate result to the four, eight or sixteen packed single-precision floating-point values in the second source operand, performs rounding and stores the resulting four, eight or sixteen packed single-precision floating-point values to the destination operand (first source operand)."],["VFNMADD132SD","VFNMADD132SD: Multiplies the low packed double-precision floating-point value from the first source operand to the low packed double-precision floating-point value in the third source operand, adds the negated infinite precision intermediate result to the low packed double-precision floating-point values in the second source operand, performs rounding and stores the resulting packed double-precision floating-point value to the destination operand (first source operand)."],["VFNMADD132SS","VFNMADD132SS: Multiplies the low packed single-precision floating-point value from the first source operand to the low packed single-precision floating-point value in the third source operand, adds the negated infinite precision intermediate result to the low packed single-precision floating-point value in the second source operand, performs rounding and stores the resulting packed single-precision floating-point value to the destination operand (first source operand)."],["VFNMSUB132PD","VFNMSUB132PD: Multiplies the two, four or eight packed double-precision floating-point values from the first source operand to the two, four or eight packed double-precision floating-point values in the third source operand. From negated infinite precision intermediate results, subtracts the two, four or eight packed double-precision floating-point values in the second source operand, performs rounding and stores the resulting two, four or eight packed double-precision floating-point values to the destination operand (first source operand)."],["VFNMSUB132PS","VFNMSUB132PS: Multiplies the four, eight or sixteen packed single-precision floating-point values from the first source operand to the four, eight or sixteen packed single-precision floating-point values in the third source operand. From negated infinite precision intermediate results, subtracts the four, eight or sixteen packed single-precision floating-point values in the second source operand, performs rounding and stores the resulting four, eight or sixteen packed single-precision floating-point values to the destination operand (first source operand)."],["VFNMSUB132SD","VFNMSUB132SD: Multiplies the low packed double-precision floating-point value from the first source operand to the low packed double-precision floating-point value in the third source operand. From negated infinite precision intermediate result, subtracts the low double-precision floating-point value in the second source operand, performs rounding and stores the resulting packed double-precision floating-point value to the destination operand (first source operand)."],["VFNMSUB132SS","VFNMSUB132SS: Multiplies the low packed single-precision floating-point value from the first source operand to the low packed single-precision floating-point value in the third source operand. From negated infinite precision intermediate result, the low single-precision floating-point value in the second source operand, performs rounding and stores the resulting packed single-precision floating-point value to the destination operand (first source operand)."],["VFPCLASSPD","The FPCLASSPD instruction checks the packed double precision floating point values for special categories, specified by the set bits in the imm8 byte. Each set bit in imm8 specifies a category of floating-point values that the input data element is classified against. The classified results of all specified categories of an input value are ORed together to form the final boolean result for the input element. The result of each element is written to the corresponding bit in a mask register k2 according to the writemask k1. Bits [MAX_KL-1:8/4/2] of the destination are cleared."],["VFPCLASSPS","The FPCLASSPS instruction checks the packed single-precision floating point values for special categories, specified by the set bits in the imm8 byte. Each set bit in imm8 specifies a category of floating-point values that the input data element is classified against. The classified results of all specified categories of an input value are ORed together to form the final boolean result for the input element. The result of each element is written to the corresponding bit in a mask register k2 according to the writemask k1. Bits [MAX_KL-1:16/8/4] of the destination are cleared."],["VFPCLASSSD","The FPCLASSSD instruction checks the low double precision floating point value in the source operand for special categories, specified by the set bits in the imm8 byte. Each set bit in imm8 specifies a category of floating-point values that the input data element is classified against. The classified results of all specified categories of an input value are ORed together to form the final boolean result for the input element. The result is written to the low bit in a mask register k2 according to the writemask k1. Bits MAX_KL-1: 1 of the destination are cleared."],["VFPCLASSSS","The FPCLASSSS instruction checks the low single-precision floating point value in the source operand for special categories, specified by the set bits in the imm8 byte. Each set bit in imm8 specifies a category of floating-point values that the input data element is classified against. The classified results of all specified categories of an input value are ORed together to form the final boolean result for the input element. The result is written to the low bit in a mask register k2 according to the writemask k1. Bits MAX_KL-1: 1 of the destination are cleared."],["VGATHERDPD","The instruction conditionally loads up to 2 or 4 double-precision floating-point values from memory addresses specified by the memory operand (the second operand) and using qword indices. The memory operand uses the VSIB form of the SIB byte to specify a general purpose register operand as the common base, a vector register for an array of indices relative to the base and a constant scale factor."],["VGATHERDPS","The instruction conditionally loads up to 4 or 8 single-precision floating-point values from memory addresses specified by the memory operand (the second operand) and using dword indices. The memory operand uses the VSIB form of the SIB byte to specify a general purpose register operand as the common base, a vector register for an array of indices relative to the base and a constant scale factor."],["VGATHERPF0DPD","The instruction conditionally prefetches up to sixteen 32-bit or eight 64-bit integer byte data elements. The elements are specified via the VSIB (i.e., the index register is an zmm, holding packed indices). Elements will only be prefetched if their corresponding mask bit is one."],["VGATHERPF1DPD","The instruction conditionally prefetches up to sixteen 32-bit or eight 64-bit integer byte data elements. The elements are specified via the VSIB (i.e., the index register is an zmm, holding packed indices). Elements will only be prefetched if their corresponding mask bit is one."],["VGETEXPPD","Extracts the biased exponents from the normalized DP FP representation of each qword data element of the source operand (the second operand) as unbiased signed integer value, or convert the denormal representation of input data to unbiased negative integer values. Each integer value of the unbiased exponent is converted to double-precision FP value and written to the corresponding qword elements of the destination operand (the first operand) as DP FP numbers."],["VGETEXPPS","Extracts the biased exponents from the normalized SP FP representation of each dword element of the source operand (the second operand) as unbiased signed integer value, or convert the denormal representation of input data to unbiased negative integer values. Each integer value of the unbiased exponent is converted to single-precision FP value and written to the corresponding dword elements of the destination operand (the first operand) as SP FP numbers."],["VGETEXPSD","Extracts the biased exponent from the normalized DP FP representation of the low qword data element of the source operand (the third operand) as unbiased signed integer value, or convert the denormal representation of input data to unbiased negative integer values. The integer value of the unbiased exponent is converted to double-precision FP value and written to the destination operand (the first operand) as DP FP numbers. Bits (127:64) of the XMM register destination are copied from corresponding bits in the first source operand."],["VGETEXPSS","Extracts the biased exponent from the normalized SP FP representation of the low doubleword data element of the source operand (the third operand) as unbiased signed integer value, or convert the denormal representation of input data to unbiased negative integer values. The integer value of the unbiased exponent is converted to single-precision FP value and written to the destination operand (the first operand) as SP FP numbers. Bits (127:32) of the XMM register destination are copied from corresponding bits in the first source operand."],["VGETMANTPD","Convert double-precision floating values in the source operand (the second operand) to DP FP values with the mantissa normalization and sign control specified by the imm8 byte, see Figure 5-15. The converted results are written to the destination operand (the first operand) using writemask k1. The normalized mantissa is specified by interv (imm8[1:0]) and the sign control (sc) is specified by bits 3:2 of the immediate byte."],["VGETMANTPS","Convert single-precision floating values in the source operand (the second operand) to SP FP values with the mantissa normalization and sign control specified by the imm8 byte, see Figure 5-15. The converted results are written to the destination operand (the first operand) using writemask k1. The normalized mantissa is specified by interv (imm8[1:0]) and the sign control (sc) is specified by bits 3:2 of the immediate byte."],["VGETMANTSD","Convert the double-precision floating values in the low quadword element of the second source operand (the third operand) to DP FP value with the mantissa normalization and sign control specified by the imm8 byte, see Figure 5-15. The converted result is written to the low quadword element of the destination operand (the first operand) using writemask k1. Bits (127:64) of the XMM register destination are copied from corresponding bits in the first source operand. The normalized mantissa is specified by interv (imm8[1:0]) and the sign control (sc) is specified by bits 3:2 of the immediate byte."],["VGETMANTSS","Convert the single-precision floating values in the low doubleword element of the second source operand (the third operand) to SP FP value with the mantissa normalization and sign control specified by the imm8 byte, see Figure 5-15. The converted result is written to the low doubleword element of the destination operand (the first operand) using writemask k1. Bits (127:32) of the XMM register destination are copied from corresponding bits in the first source operand. The normalized mantissa is specified by interv (imm8[1:0]) and the sign control (sc) is specified by bits 3:2 of the immediate byte."],["VINSERTF128","VINSERTF128/VINSERTF32x4 and VINSERTF64x2 insert 128-bits of packed floating-point values from the second source operand (the third operand) into the destination operand (the first operand) at an 128-bit granularity offset multiplied by imm8[0] (256-bit) or imm8[1:0]. The remaining portions of the destination operand are copied from the corresponding fields of the first source operand (the second operand). The second source operand can be either an XMM register or a 128-bit memory location. The destination and first source operands are vector registers."],["VINSERTI128","VINSERTI32x4 and VINSERTI64x2 inserts 128-bits of packed integer values from the second source operand (the third operand) into the destination operand (the first operand) at an 128-bit granular offset multiplied by imm8[0] (256-bit) or imm8[1:0]. The remaining portions of the destination are copied from the corresponding fields of the first source operand (the second operand). The second source operand can be either an XMM register or a 128-bit memory location. The high 6/7bits of the immediate are ignored. The destination operand is a ZMM/YMM register and updated at 32 and 64-bit granularity according to the writemask."],["VMASKMOVPD","Conditionally moves packed data elements from the second source operand into the corresponding data element of the destination operand, depending on the mask bits associated with each data element. The mask bits are specified in the first source operand."],["VP2INTERSECTD","This instruction writes an even/odd pair of mask registers. The mask register destination indicated in the MODRM.REG field is used to form the basis of the register pair. The low bit of that field is masked off (set to zero) to create the first register of the pair."],["VP4DPWSSD","This instruction computes 4 sequential register source-block dot-products of two signed word operands with doubleword accumulation; see Figure 7-1 below. The memory operand is sequentially selected in each of the four steps."],["VP4DPWSSDS","This instruction computes 4 sequential register source-block dot-products of two signed word operands with doubleword accumulation and signed saturation. The memory operand is sequentially selected in each of the four steps."],["VPBLENDD","Dword elements from the source operand (second operand) are conditionally written to the destination operand (first operand) depending on bits in the immediate operand (third operand). The immediate bits (bits 7:0) form a mask that determines whether the corresponding word in the destination is copied from the source. If a bit in the mask, corresponding to a word, is “1\", then the word is copied, else the word is unchanged."],["VPBLENDMB","Performs an element-by-element blending of byte/word elements between the first source operand byte vector register and the second source operand byte vector from memory or register, using the instruction mask as selector. The result is written into the destination byte vector register."],["VPBLENDMD","Performs an element-by-element blending of dword/qword elements between the first source operand (the second operand) and the elements of the second source operand (the third operand) using an opmask register as select control. The blended result is written into the destination."],["VBROADCASTI128","Load integer data from the source operand (the second operand) and broadcast to all elements of the destination operand (the first operand)."],["VPBROADCASTMB2Q","Broadcasts the zero-extended 64/32 bit value of the low byte/word of the source operand (the second operand) to each 64/32 bit element of the destination operand (the first operand). The source operand is an opmask register. The destination operand is a ZMM register (EVEX.512), YMM register (EVEX.256), or XMM register (EVEX.128)."],["VPCMPB","Performs a SIMD compare of the packed byte values in the second source operand and the first source operand and returns the results of the comparison to the mask destination operand. The comparison predicate operand (immediate byte) specifies the type of comparison performed on each pair of packed values in the two source operands. The result of each comparison is a single mask bit result of 1 (comparison true) or 0 (comparison false)."],["VPCMPD","Performs a SIMD compare of the packed integer values in the second source operand and the first source operand and returns the results of the comparison to the mask destination operand. The comparison predicate operand (immediate byte) specifies the type of comparison performed on each pair of packed values in the two source operands. The result of each comparison is a single mask bit result of 1 (comparison true) or 0 (comparison false)."],["VPCMPQ","Performs a SIMD compare of the packed integer values in the second source operand and the first source operand and returns the results of the comparison to the mask destination operand. The comparison predicate operand (immediate byte) specifies the type of comparison performed on each pair of packed values in the two source operands. The result of each comparison is a single mask bit result of 1 (comparison true) or 0 (comparison false)."],["VPCMPUW","Performs a SIMD compare of the packed integer word in the second source operand and the first source operand and returns the results of the comparison to the mask destination operand. The comparison predicate operand (immediate byte) specifies the type of comparison performed on each pair of packed values in the two source operands. The result of each comparison is a single mask bit result of 1 (comparison true) or 0 (comparison false)."],["VPCOMPRESSB","Compress (stores) up to 64 byte values or 32 word values from the source operand (second operand) to the destination operand (first operand), based on the active elements determined by the writemask operand. Note: EVEX.vvvv is reserved and must be 1111b otherwise instructions will #UD."],["VPCOMPRESSD","Compress (store) up to 16/8/4 doubleword integer values from the source operand (second operand) to the destination operand (first operand). The source operand is a ZMM/YMM/XMM register, the destination operand can be a ZMM/YMM/XMM register or a 512/256/128-bit memory location."],["VPCOMPRESSQ","Compress (stores) up to 8/4/2 quadword integer values from the source operand (second operand) to the destination operand (first operand). The source operand is a ZMM/YMM/XMM register, the destination operand can be a ZMM/YMM/XMM register or a 512/256/128-bit memory location."],["VPCONFLICTD","Test each dword/qword element of the source operand (the second operand) for equality with all other elements in the source operand closer to the least significant element. Each element’s comparison results form a bit vector, which is then zero extended and written to the destination according to the writemask."],["VPDPBUSD","Multiplies the individual unsigned bytes of the first source operand by the corresponding signed bytes of the second source operand, producing intermediate signed word results. The word results are then summed and accumulated in the destination dword element size operand."],["VPDPBUSDS","Multiplies the individual unsigned bytes of the first source operand by the corresponding signed bytes of the second source operand, producing intermediate signed word results. The word results are then summed and accumulated in the destination dword element size operand. If the intermediate sum overflows a 32b signed number the result is saturated to either 0x7FFF_FFFF for positive numbers of 0x8000_0000 for negative numbers."],["VPDPWSSD","Multiplies the individual signed words of the first source operand by the corresponding signed words of the second source operand, producing intermediate signed, doubleword results. The adjacent doubleword results are then summed and accumulated in the destination operand."],["VPDPWSSDS","Multiplies the individual signed words of the first source operand by the corresponding signed words of the second source operand, producing intermediate signed, doubleword results. The adjacent doubleword results are then summed and accumulated in the destination operand. If the intermediate sum overflows a 32b signed number, the result is saturated to either 0x7FFF_FFFF for positive numbers of 0x8000_0000 for negative numbers."],["VPERM2F128","Permute 128 bit floating-point-containing fields from the first source operand (second operand) and second source operand (third operand) using bits in the 8-bit immediate and store results in the destination operand (first operand). The first source operand is a YMM register, the second source operand is a YMM register or a 256-bit memory location, and the destination operand is a YMM register."],["VPERM2I128","Permute 128 bit integer data from the first source operand (second operand) and second source operand (third operand) using bits in the 8-bit immediate and store results in the destination operand (first operand). The first source operand is a YMM register, the second source operand is a YMM register or a 256-bit memory location, and the destination operand is a YMM register."],["VPERMB","Copies bytes from the second source operand (the third operand) to the destination operand (the first operand) according to the byte indices in the first source operand (the second operand). Note that this instruction permits a byte in the source operand to be copied to more than one location in the destination operand."],["VPERMD","Copies doublewords (or words) from the second source operand (the third operand) to the destination operand (the first operand) according to the indices in the first source operand (the second operand). Note that this instruction permits a doubleword (word) in the source operand to be copied to more than one location in the destination operand."],["VPERMI2B","Permutes byte values in the second operand (the first source operand) and the third operand (the second source operand) using the byte indices in the first operand (the destination operand) to select byte elements from the second or third source operands. The selected byte elements are written to the destination at byte granularity under the writemask k1."],["VPERMI2D","Permutes 16-bit/32-bit/64-bit values in the second operand (the first source operand) and the third operand (the second source operand) using indices in the first operand to select elements from the second and third operands. The selected elements are written to the destination operand (the first operand) according to the writemask k1."],["VPERMILPD","(variable control version)"],["VPERMILPS","(variable control version)"],["VPERMPD","The imm8 version: Copies quadword elements of double-precision floating-point values from the source operand (the second operand) to the destination operand (the first operand) according to the indices specified by the immediate operand (the third operand). Each two-bit value in the immediate byte selects a qword element in the source operand."],["VPERMPS","Copies doubleword elements of single-precision floating-point values from the second source operand (the third operand) to the destination operand (the first operand) according to the indices in the first source operand (the second operand). Note that this instruction permits a doubleword in the source operand to be copied to more than one location in the destination operand."],["VPERMQ","The imm8 version: Copies quadwords from the source operand (the second operand) to the destination operand (the first operand) according to the indices specified by the immediate operand (the third operand). Each two-bit value in the immediate byte selects a qword element in the source operand."],["VPERMT2B","Permutes byte values from two tables, comprising of the first operand (also the destination operand) and the third operand (the second source operand). The second operand (the first source operand) provides byte indices to select byte results from the two tables. The selected byte elements are written to the destination at byte granularity under the writemask k1."],["VPERMT2D","Permutes 16-bit/32-bit/64-bit values in the first operand and the third operand (the second source operand) using indices in the second operand (the first source operand) to select elements from the first and third operands. The selected elements are written to the destination operand (the first operand) according to the writemask k1."],["VPEXPANDB","Expands (loads) up to 64 byte integer values or 32 word integer values from the source operand (memory operand) to the destination operand (register operand), based on the active elements determined by the writemask operand."],["VPEXPANDD","Expand (load) up to 16 contiguous doubleword integer values of the input vector in the source operand (the second operand) to sparse elements in the destination operand (the first operand), selected by the writemask k1. The destination operand is a ZMM register, the source operand can be a ZMM register or memory location."],["VPEXPANDQ","Expand (load) up to 8 quadword integer values from the source operand (the second operand) to sparse elements in the destination operand (the first operand), selected by the writemask k1. The destination operand is a ZMM register, the source operand can be a ZMM register or memory location."],["VPGATHERDD","A set of 16 or 8 doubleword/quadword memory locations pointed to by base address BASE_ADDR and index vector VINDEX with scale SCALE are gathered. The result is written into vector zmm1. The elements are specified via the VSIB (i.e., the index register is a zmm, holding packed indices). Elements will only be loaded if their corresponding mask bit is one. If an element’s mask bit is not set, the corresponding element of the destination register (zmm1) is left unchanged. The entire mask register will be set to zero by this instruction unless it triggers an exception."],["VPGATHERQD","A set of 8 doubleword/quadword memory locations pointed to by base address BASE_ADDR and index vector VINDEX with scale SCALE are gathered. The result is written into a vector register. The elements are specified via the VSIB (i.e., the index register is a vector register, holding packed indices). Elements will only be loaded if their corresponding mask bit is one. If an element’s mask bit is not set, the corresponding element of the destination register is left unchanged. The entire mask register will be set to zero by this instruction unless it triggers an exception."],["VPLZCNTD","Counts the number of leading most significant zero bits in each dword or qword element of the source operand (the second operand) and stores the results in the destination register (the first operand) according to the writemask. If an element is zero, the result for that element is the operand size of the element."],["VPMADD52HUQ","Multiplies packed unsigned 52-bit integers in each qword element of the first source operand (the second operand) with the packed unsigned 52-bit integers in the corresponding elements of the second source operand (the third operand) to form packed 104-bit intermediate results. The high 52-bit, unsigned integer of each 104-bit product is added to the corresponding qword unsigned integer of the destination operand (the first operand) under the writemask k1."],["VPMADD52LUQ","Multiplies packed unsigned 52-bit integers in each qword element of the first source operand (the second operand) with the packed unsigned 52-bit integers in the corresponding elements of the second source operand (the third operand) to form packed 104-bit intermediate results. The low 52-bit, unsigned integer of each 104-bit product is added to the corresponding qword unsigned integer of the destination operand (the first operand) under the writemask k1."],["VPMASKMOVD","Conditionally moves packed data elements from the second source operand into the corresponding data element of the destination operand, depending on the mask bits associated with each data element. The mask bits are specified in the first source operand."],["VPMOVB2M","Converts a vector register to a mask register. Each element in the destination register is set to 1 or 0 depending on the value of most significant bit of the corresponding element in the source register."],["VPMOVDB","VPMOVDB down converts 32-bit integer elements in the source operand (the second operand) into packed bytes using truncation. VPMOVSDB converts signed 32-bit integers into packed signed bytes using signed saturation. VPMOVUSDB convert unsigned double-word values into unsigned byte values using unsigned saturation."],["VPMOVDW","VPMOVDW down converts 32-bit integer elements in the source operand (the second operand) into packed words using truncation. VPMOVSDW converts signed 32-bit integers into packed signed words using signed saturation. VPMOVUSDW convert unsigned double-word values into unsigned word values using unsigned saturation."],["VPMOVM2B","Converts a mask register to a vector register. Each element in the destination register is set to all 1’s or all 0’s depending on the value of the corresponding bit in the source mask register."],["VPMOVQB","VPMOVQB down converts 64-bit integer elements in the source operand (the second operand) into packed byte elements using truncation. VPMOVSQB converts signed 64-bit integers into packed signed bytes using signed saturation. VPMOVUSQB convert unsigned quad-word values into unsigned byte values using unsigned saturation. The source operand is a vector register. The destination operand is an XMM register or a memory location."],["VPMOVQD","VPMOVQW down converts 64-bit integer elements in the source operand (the second operand) into packed double-words using truncation. VPMOVSQW converts signed 64-bit integers into packed signed doublewords using signed saturation. VPMOVUSQW convert unsigned quad-word values into unsigned double-word values using unsigned saturation."],["VPMOVQW","VPMOVQW down converts 64-bit integer elements in the source operand (the second operand) into packed words using truncation. VPMOVSQW converts signed 64-bit integers into packed signed words using signed saturation. VPMOVUSQW convert unsigned quad-word values into unsigned word values using unsigned saturation."],["VPMOVSWB","VPMOVWB down converts 16-bit integers into packed bytes using truncation. VPMOVSWB converts signed 16-bit integers into packed signed bytes using signed saturation. VPMOVUSWB convert unsigned word values into unsigned byte values using unsigned saturation."],["VPMULTISHIFTQB","This instruction selects eight unaligned bytes from each input qword element of the second source operand (the third operand) and writes eight assembled bytes for each qword element in the destination operand (the first operand). Each byte result is selected using a byte-granular shift control within the corresponding qword element of the first source operand (the second operand). Each byte result in the destination operand is updated under the writemask k1."],["VPOPCNTB","This instruction counts the number of bits set to one in each byte, word, dword or qword element of its source (e.g., zmm2 or memory) and places the results in the destination register (zmm1). This instruction supports memory fault suppression."],["VPROLD","Rotates the bits in the individual data elements (doublewords, or quadword) in the first source operand to the left by the number of bits specified in the count operand. If the value specified by the count operand is greater than 31 (for doublewords), or 63 (for a quadword), then the count operand modulo the data size (32 or 64) is used."],["VPRORD","Rotates the bits in the individual data elements (doublewords, or quadword) in the first source operand to the right by the number of bits specified in the count operand. If the value specified by the count operand is greater than 31 (for doublewords), or 63 (for a quadword), then the count operand modulo the data size (32 or 64) is used."],["VPSCATTERDD","Stores up to 16 elements (8 elements for qword indices) in doubleword vector or 8 elements in quadword vector to the memory locations pointed by base address BASE_ADDR and index vector VINDEX, with scale SCALE. The elements are specified via the VSIB (i.e., the index register is a vector register, holding packed indices). Elements will only be stored if their corresponding mask bit is one. The entire mask register will be set to zero by this instruction unless it triggers an exception."],["VPSHLDD","Concatenate packed data, extract result shifted to the left by constant value."],["VPSHLDVD","Concatenate packed data, extract result shifted to the left by variable value."],["VPSHRDD","Concatenate packed data, extract result shifted to the right by constant value."],["VPSHRDVD","Concatenate packed data, extract result shifted to the right by variable value."],["VPSHUFBITQMB","The VPSHUFBITQMB instruction performs a bit gather select using second source as control and first source as data. Each bit uses 6 control bits (2nd source operand) to select which data bit is going to be gathered (first source operand). A given bit can only access 64 different bits of data (first 64 destination bits can access first 64 data bits, second 64 destination bits can access second 64 data bits, etc.)."],["VPSLLVD","Shifts the bits in the individual data elements (words, doublewords or quadword) in the first source operand to the left by the count value of respective data elements in the second source operand. As the bits in the data elements are shifted left, the empty low-order bits are cleared (set to 0)."],["VPSRAVD","Shifts the bits in the individual data elements (word/doublewords/quadword) in the first source operand (the second operand) to the right by the number of bits specified in the count value of respective data elements in the second source operand (the third operand). As the bits in the data elements are shifted right, the empty high-order bits are set to the MSB (sign extension)."],["VPSRLVD","Shifts the bits in the individual data elements (words, doublewords or quadword) in the first source operand to the right by the count value of respective data elements in the second source operand. As the bits in the data elements are shifted right, the empty high-order bits are cleared (set to 0)."],["VPTERNLOGD","VPTERNLOGD/Q takes three bit vectors of 512-bit length (in the first, second and third operand) as input data to form a set of 512 indices, each index is comprised of one bit from each input vector. The imm8 byte specifies a boolean logic table producing a binary value for each 3-bit index value. The final 512-bit boolean result is written to the destination operand (the first operand) using the writemask k1 with the granularity of doubleword element or quadword element into the destination."],["VPTESTMB","Performs a bitwise logical AND operation on the first source operand (the second operand) and second source operand (the third operand) and stores the result in the destination operand (the first operand) under the writemask. Each bit of the result is set to 1 if the bitwise AND of the corresponding elements of the first and second src operands is non-zero; otherwise it is set to 0."],["VPTESTNMB","Performs a bitwise logical NAND operation on the byte/word/doubleword/quadword element of the first source operand (the second operand) with the corresponding element of the second source operand (the third operand) and stores the logical comparison result into each bit of the destination operand (the first operand) according to the writemask k1. Each bit of the result is set to 1 if the bitwise AND of the corresponding elements of the first and second src operands is zero; otherwise it is set to 0."],["VRANGEPD","This instruction calculates 2/4/8 range operation outputs from two sets of packed input double-precision FP values in the first source operand (the second operand) and the second source operand (the third operand). The range outputs are written to the destination operand (the first operand) under the writemask k1."],["VRANGEPS","This instruction calculates 4/8/16 range operation outputs from two sets of packed input single-precision FP values in the first source operand (the second operand) and the second source operand (the third operand). The range outputs are written to the destination operand (the first operand) under the writemask k1."],["VRANGESD","This instruction calculates a range operation output from two input double-precision FP values in the low qword element of the first source operand (the second operand) and second source operand (the third operand). The range output is written to the low qword element of the destination operand (the first operand) under the writemask k1."],["VRANGESS","This instruction calculates a range operation output from two input single-precision FP values in the low dword element of the first source operand (the second operand) and second source operand (the third operand). The range output is written to the low dword element of the destination operand (the first operand) under the writemask k1."],["VRCP14PD","This instruction performs a SIMD computation of the approximate reciprocals of eight/four/two packed double-precision floating-point values in the source operand (the second operand) and stores the packed double-precision floating-point results in the destination operand. The maximum relative error for this approximation is less than 2-14."],["VRCP14PS","This instruction performs a SIMD computation of the approximate reciprocals of the packed single-precision floating-point values in the source operand (the second operand) and stores the packed single-precision floating-point results in the destination operand (the first operand). The maximum relative error for this approximation is less than 2-14."],["VRCP14SD","This instruction performs a SIMD computation of the approximate reciprocal of the low double-precision floating-point value in the second source operand (the third operand) stores the result in the low quadword element of the destination operand (the first operand) according to the writemask k1. Bits (127:64) of the XMM register destination are copied from corresponding bits in the first source operand (the second operand). The maximum relative error for this approximation is less than 2-14. The source operand can be an XMM register or a 64-bit memory location. The destination operand is an XMM register."],["VRCP14SS","This instruction performs a SIMD computation of the approximate reciprocal of the low single-precision floating-point value in the second source operand (the third operand) and stores the result in the low quadword element of the destination operand (the first operand) according to the writemask k1. Bits (127:32) of the XMM register destination are copied from corresponding bits in the first source operand (the second operand). The maximum relative error for this approximation is less than 2-14. The source operand can be an XMM register or a 32-bit memory location. The destination operand is an XMM register."],["VRCP28PD","Computes the reciprocal approximation of the float64 values in the source operand (the second operand) and store the results to the destination operand (the first operand). The approximate reciprocal is evaluated with less than 2^-28 of maximum relative error."],["VRCP28PS","Computes the reciprocal approximation of the float32 values in the source operand (the second operand) and store the results to the destination operand (the first operand) using the writemask k1. The approximate reciprocal is evaluated with less than 2^-28 of maximum relative error prior to final rounding. The final results are rounded to < 2^-23 relative error before written to the destination."],["VRCP28SD","Computes the reciprocal approximation of the low float64 value in the second source operand (the third operand) and store the result to the destination operand (the first operand). The approximate reciprocal is evaluated with less than 2^-28 of maximum relative error. The result is written into the low float64 element of the destination operand according to the writemask k1. Bits 127:64 of the destination is copied from the corresponding bits of the first source operand (the second operand)."],["VRCP28SS","Computes the reciprocal approximation of the low float32 value in the second source operand (the third operand) and store the result to the destination operand (the first operand). The approximate reciprocal is evaluated with less than 2^-28 of maximum relative error prior to final rounding. The final result is rounded to < 2^-23 relative error before written into the low float32 element of the destination according to writemask k1. Bits 127:32 of the destination is copied from the corresponding bits of the first source operand (the second operand)."],["VREDUCEPD","Perform reduction transformation of the packed binary encoded double-precision FP values in the source operand (the second operand) and store the reduced results in binary FP format to the destination operand (the first operand) under the writemask k1."],["VREDUCEPS","Perform reduction transformation of the packed binary encoded single-precision FP values in the source operand (the second operand) and store the reduced results in binary FP format to the destination operand (the first operand) under the writemask k1."],["VREDUCESD","Perform a reduction transformation of the binary encoded double-precision FP value in the low qword element of the second source operand (the third operand) and store the reduced result in binary FP format to the low qword element of the destination operand (the first operand) under the writemask k1. Bits 127:64 of the destination operand are copied from respective qword elements of the first source operand (the second operand)."],["VREDUCESS","Perform a reduction transformation of the binary encoded single-precision FP value in the low dword element of the second source operand (the third operand) and store the reduced result in binary FP format to the low dword element of the destination operand (the first operand) under the writemask k1. Bits 127:32 of the destination operand are copied from respective dword elements of the first source operand (the second operand)."],["VRNDSCALEPD","Round the double-precision floating-point values in the source operand by the rounding mode specified in the immediate operand (see Figure 5-29) and places the result in the destination operand."],["VRNDSCALEPS","Round the single-precision floating-point values in the source operand by the rounding mode specified in the immediate operand (see Figure 5-29) and places the result in the destination operand."],["VRNDSCALESD","Rounds a double-precision floating-point value in the low quadword (see Figure 5-29) element of the second source operand (the third operand) by the rounding mode specified in the immediate operand and places the result in the corresponding element of the destination operand (the first operand) according to the writemask. The quadword element at bits 127:64 of the destination is copied from the first source operand (the second operand)."],["VRNDSCALESS","Rounds the single-precision floating-point value in the low doubleword element of the second source operand (the third operand) by the rounding mode specified in the immediate operand (see Figure 5-29) and places the result in the corresponding element of the destination operand (the first operand) according to the writemask. The double-word elements at bits 127:32 of the destination are copied from the first source operand (the second operand)."],["VRSQRT14PD","This instruction performs a SIMD computation of the approximate reciprocals of the square roots of the eight packed double-precision floating-point values in the source operand (the second operand) and stores the packed double-precision floating-point results in the destination operand (the first operand) according to the writemask. The maximum relative error for this approximation is less than 2-14."],["VRSQRT14PS","This instruction performs a SIMD computation of the approximate reciprocals of the square roots of 16 packed single-precision floating-point values in the source operand (the second operand) and stores the packed single-precision floating-point results in the destination operand (the first operand) according to the writemask. The maximum relative error for this approximation is less than 2-14."],["VRSQRT14SD","Computes the approximate reciprocal of the square roots of the scalar double-precision floating-point value in the low quadword element of the source operand (the second operand) and stores the result in the low quadword element of the destination operand (the first operand) according to the writemask. The maximum relative error for this approximation is less than 2-14. The source operand can be an XMM register or a 32-bit memory location. The destination operand is an XMM register."],["VRSQRT14SS","Computes of the approximate reciprocal of the square root of the scalar single-precision floating-point value in the low doubleword element of the source operand (the second operand) and stores the result in the low doubleword element of the destination operand (the first operand) according to the writemask. The maximum relative error for this approximation is less than 2-14. The source operand can be an XMM register or a 32-bit memory location. The destination operand is an XMM register."],["VRSQRT28PD","Computes the reciprocal square root of the float64 values in the source operand (the second operand) and store the results to the destination operand (the first operand). The approximate reciprocal is evaluated with less than 2^-28 of maximum relative error."],["VRSQRT28PS","Computes the reciprocal square root of the float32 values in the source operand (the second operand) and store the results to the destination operand (the first operand). The approximate reciprocal is evaluated with less than 2^-28 of maximum relative error prior to final rounding. The final results is rounded to < 2^-23 relative error before written to the destination."],["VRSQRT28SD","Computes the reciprocal square root of the low float64 value in the second source operand (the third operand) and store the result to the destination operand (the first operand). The approximate reciprocal square root is evaluated with less than 2^-28 of maximum relative error. The result is written into the low float64 element of xmm1 according to the writemask k1. Bits 127:64 of the destination is copied from the corresponding bits of the first source operand (the second operand)."],["VRSQRT28SS","Computes the reciprocal square root of the low float32 value in the second source operand (the third operand) and store the result to the destination operand (the first operand). The approximate reciprocal square root is evaluated with less than 2^-28 of maximum relative error prior to final rounding. The final result is rounded to < 2^-23 relative error before written to the low float32 element of the destination according to the writemask k1. Bits 127:32 of the destination is copied from the corresponding bits of the first source operand (the second operand)."],["VSCALEFPD","Performs a floating-point scale of the packed double-precision floating-point values in the first source operand by multiplying them by 2 to the power of the double-precision floating-point values in second source operand."],["VSCALEFPS","Performs a floating-point scale of the packed single-precision floating-point values in the first source operand by multiplying them by 2 to the power of the float32 values in second source operand."],["VSCALEFSD","Performs a floating-point scale of the scalar double-precision floating-point value in the first source operand by multiplying it by 2 to the power of the double-precision floating-point value in second source operand."],["VSCALEFSS","Performs a floating-point scale of the scalar single-precision floating-point value in the first source operand by multiplying it by 2 to the power of the float32 value in second source operand."],["VSCATTERDPD","Stores up to 16 elements (or 8 elements) in doubleword/quadword vector zmm1 to the memory locations pointed by base address BASE_ADDR and index vector VINDEX, with scale SCALE. The elements are specified via the VSIB (i.e., the index register is a vector register, holding packed indices). Elements will only be stored if their corresponding mask bit is one. The entire mask register will be set to zero by this instruction unless it triggers an exception."],["VSCATTERPF0DPD","The instruction conditionally prefetches up to sixteen 32-bit or eight 64-bit integer byte data elements. The elements are specified via the VSIB (i.e., the index register is an zmm, holding packed indices). Elements will only be prefetched if their corresponding mask bit is one."],["VSCATTERPF1DPD","The instruction conditionally prefetches up to sixteen 32-bit or eight 64-bit integer byte data elements. The elements are specified via the VSIB (i.e., the index register is an zmm, holding packed indices). Elements will only be prefetched if their corresponding mask bit is one."],["VSHUFF32X4","256-bit Version: Moves one of the two 128-bit packed single-precision floating-point values from the first source operand (second operand) into the low 128-bit of the destination operand (first operand); moves one of the two packed 128-bit floating-point values from the second source operand (third operand) into the high 128-bit of the destination operand. The selector operand (third operand) determines which values are moved to the destination operand."],["VTESTPD","VTESTPS performs a bitwise comparison of all the sign bits of the packed single-precision elements in the first source operation and corresponding sign bits in the second source operand. If the AND of the source sign bits with the dest sign bits produces all zeros, the ZF is set else the ZF is clear. If the AND of the source sign bits with the inverted dest sign bits produces all zeros the CF is set else the CF is clear. An attempt to execute VTESTPS with VEX.W=1 will cause #UD."],["VZEROALL","In 64-bit mode, the instruction zeroes XMM0-XMM15, YMM0-YMM15, and ZMM0-ZMM15. Outside 64-bit mode, it zeroes only XMM0-XMM7, YMM0-YMM7, and ZMM0-ZMM7. VZEROALL does not modify ZMM16-ZMM31."],["VZEROUPPER","In 64-bit mode, the instruction zeroes the bits in positions 128 and higher in YMM0-YMM15 and ZMM0-ZMM15. Outside 64-bit mode, it zeroes those bits only in YMM0-YMM7 and ZMM0-ZMM7. VZEROUPPER does not modify the lower 128 bits of these registers and it does not modify ZMM16-ZMM31."],["FWAIT","Causes the processor to check for and handle pending, unmasked, floating-point exceptions before proceeding. (FWAIT is an alternate mnemonic for WAIT.)"],["WBINVD","Writes back all modified cache lines in the processor’s internal cache to main memory and invalidates (flushes) the internal caches. The instruction then issues a special-function bus cycle that directs external caches to also write back modified data and another bus cycle to indicate that the external caches should be invalidated."],["WBNOINVD","The WBNOINVD instruction writes back all modified cache lines in the processor’s internal cache to main memory but does not invalidate (flush) the internal caches."],["WRFSBASE","Loads the FS or GS segment base address with the general-purpose register indicated by the modR/M:r/m field."],["WRMSR","Writes the contents of registers EDX:EAX into the 64-bit model specific register (MSR) specified in the ECX register. (On processors that support the Intel 64 architecture, the high-order 32 bits of RCX are ignored.) The contents of the EDX register are copied to high-order 32 bits of the selected MSR and the contents of the EAX register are copied to low-order 32 bits of the MSR. (On processors that support the Intel 64 architecture, the high-order 32 bits of each of RAX and RDX are ignored.) Undefined or reserved bits in an MSR should be set to values previously read."],["WRPKRU","Writes the value of EAX into PKRU. ECX and EDX must be 0 when WRPKRU is executed; otherwise, a general-protection exception (#GP) occurs."],["XABORT","XABORT forces an RTM abort. Following an RTM abort, the logical processor resumes execution at the fallback address computed through the outermost XBEGIN instruction. The EAX register is updated to reflect an XABORT instruction caused the abort, and the imm8 argument will be provided in bits 31:24 of EAX."],["XACQUIRE","The XACQUIRE prefix is a hint to start lock elision on the memory address specified by the instruction and the XRELEASE prefix is a hint to end lock elision on the memory address specified by the instruction."],["XADD","Exchanges the first operand (destination operand) with the second operand (source operand), then loads the sum of the two values into the destination operand. The destination operand can be a register or a memory location; the source operand is a register."],["XBEGIN","The XBEGIN instruction specifies the start of an RTM code region. If the logical processor was not already in transactional execution, then the XBEGIN instruction causes the logical processor to transition into transactional execution. The XBEGIN instruction that transitions the logical processor into transactional execution is referred to as the outermost XBEGIN instruction. The instruction also specifies a relative offset to compute the address of the fallback code path following a transactional abort. (Use of the 16-bit operand size does not cause this address to be truncated to 16 bits, unlike a near jump to a relative offset.)"],["XCHG","Exchanges the contents of the destination (first) and source (second) operands. The operands can be two general-purpose registers or a register and a memory location. If a memory operand is referenced, the processor’s locking protocol is automatically implemented for the duration of the exchange operation, regardless of the presence or absence of the LOCK prefix or of the value of the IOPL. (See the LOCK prefix description in this chapter for more information on the locking protocol.)"],["XEND","The instruction marks the end of an RTM code region. If this corresponds to the outermost scope (that is, including this XEND instruction, the number of XBEGIN instructions is the same as number of XEND instructions), the logical processor will attempt to commit the logical processor state atomically. If the commit fails, the logical processor will rollback all architectural register and memory updates performed during the RTM execution. The logical processor will resume execution at the fallback address computed from the outermost XBEGIN instruction. The EAX register is updated to reflect RTM abort information."],["XGETBV","Reads the contents of the extended control register (XCR) specified in the ECX register into registers EDX:EAX. (On processors that support the Intel 64 architecture, the high-order 32 bits of RCX are ignored.) The EDX register is loaded with the high-order 32 bits of the XCR and the EAX register is loaded with the low-order 32 bits. (On processors that support the Intel 64 architecture, the high-order 32 bits of each of RAX and RDX are cleared.) If fewer than 64 bits are implemented in the XCR being read, the values returned to EDX:EAX in unimplemented bit locations are undefined."],["XLAT","Locates a byte entry in a table in memory, using the contents of the AL register as a table index, then copies the contents of the table entry back into the AL register. The index in the AL register is treated as an unsigned integer. The XLAT and XLATB instructions get the base address of the table in memory from either the DS:EBX or the DS:BX registers (depending on the address-size attribute of the instruction, 32 or 16, respectively). (The DS segment may be overridden with a segment override prefix.)"],["XOR","Performs a bitwise exclusive OR (XOR) operation on the destination (first) and source (second) operands and stores the result in the destination operand location. The source operand can be an immediate, a register, or a memory location; the destination operand can be a register or a memory location. (However, two memory operands cannot be used in one instruction.) Each bit of the result is 1 if the corresponding bits of the operands are different; each bit is 0 if the corresponding bits are the same."],["VXORPD","Performs a bitwise logical XOR of the two, four or eight packed double-precision floating-point values from the first source operand and the second source operand, and stores the result in the destination operand."],["VXORPS","Performs a bitwise logical XOR of the four, eight or sixteen packed single-precision floating-point values from the first source operand and the second source operand, and stores the result in the destination operand"],["XRSTOR","Performs a full or partial restore of processor state components from the XSAVE area located at the memory address specified by the source operand. The implicit EDX:EAX register pair specifies a 64-bit instruction mask. The specific state components restored correspond to the bits set in the requested-feature bitmap (RFBM), which is the logical-AND of EDX:EAX and XCR0."],["XRSTORS","Performs a full or partial restore of processor state components from the XSAVE area located at the memory address specified by the source operand. The implicit EDX:EAX register pair specifies a 64-bit instruction mask. The specific state components restored correspond to the bits set in the requested-feature bitmap (RFBM), which is the logical-AND of EDX:EAX and the logical-OR of XCR0 with the IA32_XSS MSR. XRSTORS may be executed only if CPL = 0."],["XSAVE","Performs a full or partial save of processor state components to the XSAVE area located at the memory address specified by the destination operand. The implicit EDX:EAX register pair specifies a 64-bit instruction mask. The specific state components saved correspond to the bits set in the requested-feature bitmap (RFBM), which is the logical-AND of EDX:EAX and XCR0."],["XSAVEC","Performs a full or partial save of processor state components to the XSAVE area located at the memory address specified by the destination operand. The implicit EDX:EAX register pair specifies a 64-bit instruction mask. The specific state components saved correspond to the bits set in the requested-feature bitmap (RFBM), which is the logical-AND of EDX:EAX and XCR0."],["XSAVEOPT","Performs a full or partial save of processor state components to the XSAVE area located at the memory address specified by the destination operand. The implicit EDX:EAX register pair specifies a 64-bit instruction mask. The specific state components saved correspond to the bits set in the requested-feature bitmap (RFBM), which is the logical-AND of EDX:EAX and XCR0."],["XSAVES","Performs a full or partial save of processor state components to the XSAVE area located at the memory address specified by the destination operand. The implicit EDX:EAX register pair specifies a 64-bit instruction mask. The specific state components saved correspond to the bits set in the requested-feature bitmap (RFBM), the logicalAND of EDX:EAX and the logical-OR of XCR0 with the IA32_XSS MSR. XSAVES may be executed only if CPL = 0."],["XSETBV","Writes the contents of registers EDX:EAX into the 64-bit extended control register (XCR) specified in the ECX register. (On processors that support the Intel 64 architecture, the high-order 32 bits of RCX are ignored.) The contents of the EDX register are copied to high-order 32 bits of the selected XCR and the contents of the EAX register are copied to low-order 32 bits of the XCR. (On processors that support the Intel 64 architecture, the high-order 32 bits of each of RAX and RDX are ignored.) Undefined or reserved bits in an XCR should be set to values previously read."],["XTEST","The XTEST instruction queries the transactional execution status. If the instruction executes inside a transactionally executing RTM region or a transactionally executing HLE region, then the ZF flag is cleared, else it is set."]],"lengths":[144,182,181,148,202,189,166,192,192,120,120,221,221,167,133,119,125,111,111,113,146,76,186,187,184,185,273,235,210,212,185,185,107,103,95,70,110,174,135,76,163,234,128,137,145,167,170,172,172,149,280,161,75,19,41,289,258,96,39,138,328,31,223,147,284,265,249,220,164,299,179,158,107,195,167,155,175,140,171,75,130,163,172,154,192,159,191,238,164,194,178,151,157,179,205,187,256,130,134,135,187,194,209,177,165,238,240,131,205,236,15,13,298,123,118,90,212,197,228,195,204,197,138,76,228,164,71,115,198,220,126,128,261,201,218,207,157,259,263,212,199,223,74,346,141,207,107,175,160,155,92,108,101,149,126,86,116,162,125,221,129,86,385,62,251,187,217,249,146,282,28,34,32,122,26,54,38,104,102,101,51,40,40,157,170,136,265,162,151,294,292,211,212,187,305,196,213,179,68,262,251,195,195,199,140,195,195,160,139,278,256,256,164,269,144,414,367,123,95,105,102,106,101,99,104,156,168,283,324,213,289,283,204,95,316,131,117,239,114,118,122,78,439,167,192,192,166,173,145,215,92,80,100,157,184,184,220,415,190,252,228,258,230,228,221,187,184,198,215,170,197,171,134,167,185,192,182,191,204,155,154,272,147,145,169,234,174,219,116,190,246,240,154,311,233,160,144,170,146,172,144,172,112,140,136,305,220,180,181,192,180,124,135,206,31,249,165,195,166,131,214,254,303,292,277,161,213,171,242,225,155,207,208,185,203,172,144,130,78,78,138,249,285,172,279,254,262,81,51,82,275,203,285,318,172,87,219,219,212,216,135,198,206,104,307,147,158,295,99,57,218,198,35,37,57,99,35,35,116,175,182,283,348,149,205,169,178,175,157,151,77,19,41,140,74,318,124,165,180,174,118,118,179,256,190,195,261,82,174,115,112,159,81,238,182,205,172,175,175,130,125,174,138,184,156,152,59,68,113,129,111,151,153,110,118,108,68,71,130,166,109,128,110,104,112,105,151,157,91,79,81,75,137,165,116,59,159,128,128,137,136,190,185,326,324,364,364,313,314,270,269,336,324,313,313,284,284,336,324,330,332,264,265,331,331,260,256,193,180,154,154,284,292,112,112,161,159,172,172,145,145,145,145,224,266,168,68,115,109,135,123,128,161,93,184,187,187,184,145,153,153,167,60,94,56,90,135,131,120,165,174,224,119,111,213,145,196,180,224,123,133,127,250,248,161,151,151,168,65,134,136,69,137,140,134,125,205,58,212,212,173,26,26,26,26,167,195,220,195,236,153,175,196,196,161,161,187,185,223,217,133,165,170,188,118,118,158,158,171,163,203,205,232,232,194,195,143,169,177,197,104,98,102,96,166,113,113,207,228,79,114,100,214,141,80,283,101,69,151,120,154,169,134,206,225,143,184,184,212,233,187,186,214,232,252,45],"postings":{"aaa":[0,5,3,2,506,1],"adjust":[0,4,1,6,2,6,3,4,26,1,97,4,98,4,112,1],"sum":[0,2,97,2,105,1,106,1,114,2,242,3,269,2,294,2,320,4,375,2,378,2,454,2,522,2,523,4,524,2,525,4,619,2],"two":[0,4,1,4,2,5,3,2,4,2,6,2,7,2,14,4,15,4,16,4,17,4,20,2,22,2,24,2,26,2,41,1,50,2,51,1,57,1,62,2,64,4,66,2,68,2,74,4,77,4,78,4,79,4,80,4,82,4,83,5,90,4,91,4,93,6,97,4,98,2,105,1,114,1,116,1,120,1,121,1,124,1,129,1,136,1,137,1,138,3,139,1,140,1,158,4,162,1,169,3,194,1,210,7,211,7,216,1,217,1,218,1,219,3,221,2,222,3,224,2,234,1,237,2,239,1,240,1,242,8,249,3,250,2,253,2,254,2,257,1,272,2,275,3,276,3,279,2,280,2,286,2,287,5,320,1,332,1,333,1,343,2,344,1,366,2,367,1,370,2,372,2,373,2,376,2,377,2,378,2,382,8,386,2,393,1,395,1,397,2,398,2,408,4,414,2,426,2,454,3,455,2,463,3,464,3,465,3,466,3,467,12,471,12,473,12,477,12,479,16,483,16,507,2,508,2,514,2,515,2,516,2,517,2,530,1,531,2,533,1,534,2,536,2,537,5,538,2,569,1,572,4,573,4,574,4,575,4,576,2,607,6,619,2,621,2,624,1,625,2,626,2],"unpack":[0,8,1,8,2,9,3,8,180,2,338,4,339,4,415,3,416,3,417,3,418,3],"bcd":[0,8,1,6,2,8,3,8,97,8,98,8,115,3],"valu":[0,4,1,10,2,8,3,4,4,2,6,2,7,2,8,2,9,2,10,2,11,12,12,12,22,2,23,2,24,2,25,2,27,6,28,10,29,10,30,2,31,2,37,4,39,2,40,2,44,4,45,4,46,4,47,4,48,4,49,6,50,7,51,1,56,1,58,2,60,1,62,1,63,2,64,4,65,4,66,1,67,2,68,4,69,16,70,2,71,2,72,1,73,6,74,2,75,2,76,4,77,4,78,5,79,2,80,3,81,4,82,4,83,5,84,7,85,6,86,4,87,5,88,6,89,6,90,4,91,3,92,4,93,5,94,7,95,5,96,7,97,4,98,4,100,3,101,4,102,4,103,4,104,4,105,7,106,5,108,2,109,3,112,3,113,3,114,2,115,2,117,1,118,7,119,1,120,1,121,1,122,4,123,2,125,13,126,2,127,1,128,2,129,2,130,8,131,9,132,6,133,1,134,5,135,15,136,2,138,2,139,3,140,1,141,1,142,2,145,15,147,4,148,2,149,4,151,3,152,5,154,2,155,2,156,5,157,3,158,2,159,2,161,4,163,1,164,2,166,1,168,3,169,2,173,2,177,2,178,2,185,1,186,1,190,2,194,1,195,2,196,2,201,11,202,11,203,9,204,9,205,11,206,11,207,9,208,9,209,5,210,5,211,5,212,1,214,3,217,1,218,1,219,2,220,2,221,2,222,2,223,2,224,2,225,2,226,2,230,2,231,2,234,1,235,2,236,2,237,7,238,4,239,2,240,2,241,4,244,4,245,4,246,4,247,4,249,1,250,2,254,2,255,2,256,2,258,2,259,3,260,4,261,4,263,2,264,2,265,1,272,2,275,11,276,11,277,2,279,5,280,5,281,4,284,2,287,1,288,4,295,2,296,2,297,2,298,2,299,2,300,2,301,2,312,3,313,3,315,3,318,1,320,2,321,2,322,2,326,4,327,2,328,2,329,6,330,2,331,2,332,1,333,1,334,2,335,2,337,2,340,3,341,9,342,3,344,3,345,9,346,9,348,4,349,3,350,2,351,2,352,4,353,1,355,2,356,10,357,10,358,10,359,10,361,8,362,8,363,2,364,5,365,4,366,1,367,3,369,2,370,2,374,2,379,1,380,1,381,2,382,2,383,1,386,2,387,2,388,2,389,2,395,1,397,2,398,2,399,2,400,2,401,2,402,4,403,5,404,5,405,5,406,5,408,1,410,2,411,2,414,2,415,2,416,2,417,2,418,2,421,1,422,2,423,3,424,2,425,2,428,4,429,4,430,4,431,6,432,4,433,4,434,4,435,4,436,2,437,2,438,6,439,6,440,4,441,4,442,4,443,4,444,4,445,4,446,6,447,6,448,2,449,2,450,2,451,2,452,5,453,5,456,1,457,3,458,3,459,2,460,2,461,3,462,3,463,1,464,1,465,1,466,1,467,14,468,14,469,14,470,14,471,16,472,16,473,14,474,14,475,14,476,14,477,16,478,16,479,16,480,16,481,16,482,16,483,16,484,16,485,16,486,16,487,6,488,6,489,6,490,6,491,3,492,3,493,1,494,1,495,11,496,11,497,12,498,12,499,5,500,5,501,4,502,4,503,3,504,3,510,1,511,2,513,2,514,6,515,5,516,5,517,4,518,5,519,2,520,2,530,3,531,2,532,1,533,1,534,5,535,2,536,2,537,3,538,2,539,5,540,2,541,2,548,2,549,4,550,4,551,2,552,4,553,4,554,4,555,4,558,2,559,2,561,2,562,2,563,2,564,2,566,4,567,4,568,4,569,8,572,5,573,5,574,4,575,4,576,6,577,6,578,7,579,7,580,4,581,4,582,4,583,4,584,3,585,3,586,3,587,3,588,7,589,7,590,7,591,7,592,9,593,9,594,9,595,9,596,4,597,4,598,4,599,4,600,5,601,5,602,5,603,5,605,1,606,1,607,9,615,2,616,3,619,2,621,2,623,4,626,2,627,2,634,3],"creat":[0,2,2,3,3,2,97,2,98,2,112,2,167,2,302,2,360,2,413,1,506,2],"result":[0,6,1,2,2,6,3,8,4,5,5,2,6,5,7,2,8,2,9,2,10,2,11,4,12,4,13,2,14,2,15,2,16,2,17,2,18,2,19,2,20,4,21,1,22,2,23,2,24,2,25,2,44,2,50,1,63,3,64,9,65,8,66,2,67,6,68,1,69,1,70,4,71,4,73,7,76,1,77,1,80,1,81,1,83,1,84,2,85,2,86,2,87,3,88,2,89,1,90,1,91,2,92,1,93,2,94,2,95,2,96,2,97,6,98,8,100,3,101,2,102,2,103,2,104,2,105,4,106,4,108,2,109,2,115,1,118,2,119,3,120,5,121,4,122,2,125,3,126,3,128,4,129,3,130,7,131,6,132,6,134,3,139,5,140,3,141,3,143,3,144,1,146,3,147,6,151,3,152,5,155,2,156,5,157,3,158,2,169,1,170,2,171,2,172,2,173,2,174,2,175,3,176,2,177,2,178,2,180,2,181,2,182,2,189,1,198,2,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,209,1,212,2,242,8,243,5,244,2,245,2,246,2,247,2,248,5,249,1,252,2,253,4,254,2,255,2,258,2,261,2,262,13,263,6,264,6,265,4,266,4,267,4,269,4,281,1,286,4,287,4,289,2,290,4,293,8,294,7,302,2,305,2,306,6,307,2,308,2,309,2,310,2,311,5,316,4,320,9,321,2,332,8,333,6,334,4,335,4,336,4,343,4,344,5,345,6,346,6,353,1,356,4,357,4,358,4,359,4,361,2,362,2,365,2,366,7,367,2,370,2,371,1,379,1,380,1,381,2,382,6,386,2,387,2,388,2,389,2,397,5,398,2,399,2,400,2,401,2,407,4,408,1,409,2,410,4,411,4,414,1,422,2,428,1,429,1,430,1,431,1,432,2,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,452,2,453,2,454,8,456,1,457,3,458,3,463,6,464,6,465,4,466,4,467,8,468,8,469,8,470,8,471,8,472,8,473,8,474,8,475,8,476,8,477,8,478,8,479,8,480,8,481,8,482,8,483,8,484,8,485,8,486,8,487,6,488,6,489,6,490,6,499,2,500,2,501,2,502,2,510,2,511,2,514,7,515,7,516,7,517,7,521,2,522,4,523,6,524,4,525,6,526,2,527,2,530,1,531,1,532,2,533,2,537,3,538,1,542,2,543,2,544,4,545,2,546,2,556,4,557,2,561,2,562,2,563,2,564,2,569,3,570,4,571,4,576,4,577,4,578,4,579,4,580,3,581,5,582,5,583,5,584,3,585,3,586,3,587,3,588,4,589,4,590,4,591,4,592,2,593,2,594,2,595,2,596,2,597,4,598,4,599,4,600,1,601,1,602,1,603,1,611,1,623,1,625,4,626,2,627,2,628,1,629,1,630,1,631,1,632,1,633,1],"al":[0,7,1,5,3,7,68,4,97,6,98,6,100,2,157,2,159,2,194,6,243,2,256,2,367,4,395,5,624,7],"register":[0,9,1,10,2,6,3,9,4,5,5,5,6,5,7,14,8,14,9,5,10,5,11,10,12,10,13,5,14,1,15,1,16,1,17,1,18,6,19,4,20,5,22,14,23,14,24,14,25,14,26,4,27,4,28,10,29,10,30,14,31,14,32,2,35,2,36,2,37,6,38,5,40,6,41,3,42,5,43,5,44,7,45,4,46,5,47,5,48,5,50,9,51,8,52,4,53,2,54,4,55,1,56,2,57,3,59,3,60,3,61,2,62,8,63,3,64,12,65,11,66,4,67,10,68,7,69,4,70,7,71,7,72,5,73,10,74,10,75,11,76,9,77,4,78,9,79,3,80,4,81,9,82,11,83,6,84,9,85,10,86,11,87,12,88,11,89,9,90,8,91,5,92,8,93,9,94,9,95,8,96,16,97,6,98,6,99,3,100,7,101,10,102,13,103,9,104,7,105,3,106,3,108,7,109,6,112,6,113,3,114,9,116,1,117,4,118,8,119,9,120,13,121,13,122,3,123,2,124,6,125,5,127,4,128,2,129,16,130,4,131,4,132,6,133,3,134,5,135,12,138,4,139,13,140,13,141,8,142,5,143,5,144,2,145,10,146,6,147,5,148,3,149,6,151,4,152,1,155,1,156,1,157,5,158,1,159,6,160,3,162,10,163,4,164,1,166,4,167,3,168,4,169,4,173,6,175,4,179,2,183,8,184,3,185,7,186,14,187,4,188,6,190,7,191,6,192,6,194,16,195,4,196,8,197,10,199,6,200,6,201,7,202,7,203,7,204,3,205,7,206,7,207,3,208,3,209,20,210,9,211,9,212,9,213,30,214,6,215,9,216,5,217,3,218,3,219,5,220,9,221,9,222,5,223,10,224,9,225,9,226,9,227,6,229,3,230,6,231,6,232,2,233,5,234,10,235,7,236,7,237,13,238,5,239,6,240,6,241,5,242,6,243,9,244,14,245,14,246,6,247,7,250,3,251,3,252,3,253,5,254,14,255,14,256,6,257,10,258,10,259,10,260,15,261,15,263,6,264,6,265,9,266,10,267,10,269,7,270,14,271,9,272,3,273,6,274,12,275,6,276,4,277,6,278,12,281,3,284,10,285,15,286,9,287,7,288,2,289,9,290,9,291,17,292,13,293,15,294,8,295,11,296,10,297,11,298,10,299,11,300,10,301,11,302,4,303,5,304,5,305,11,306,6,307,9,308,9,309,11,310,9,311,4,312,8,313,10,314,2,315,8,316,9,320,2,321,4,322,4,323,7,324,7,325,3,326,8,327,8,328,6,329,3,330,6,331,3,332,1,333,6,334,3,335,1,336,11,340,1,341,9,342,8,343,9,344,5,345,6,346,6,347,4,348,2,350,9,351,7,352,11,353,8,354,2,356,5,357,5,358,2,359,2,360,1,361,6,362,6,363,8,364,2,366,4,367,10,368,3,370,4,379,4,380,5,381,13,382,13,383,4,384,13,385,8,386,10,387,10,388,6,389,6,390,4,391,2,392,4,393,3,394,4,395,13,396,9,397,5,398,11,399,11,400,5,401,5,402,6,405,1,406,2,407,1,408,3,410,6,411,7,413,4,414,3,415,13,416,12,417,13,418,13,419,2,420,2,421,5,422,7,423,8,424,7,425,7,426,4,427,4,428,3,429,3,430,3,431,8,432,8,433,3,434,3,435,3,436,2,437,2,438,9,439,9,440,2,441,2,442,2,443,2,444,2,445,2,446,8,447,8,448,2,449,2,450,2,451,2,452,6,453,10,454,4,455,2,456,3,457,2,458,2,459,3,460,2,461,3,462,3,463,2,464,2,465,4,466,4,467,7,468,7,469,5,470,5,471,5,472,5,473,6,474,6,475,5,476,5,477,5,478,5,479,5,480,5,481,1,482,1,483,5,484,5,485,1,486,1,487,2,488,3,489,2,490,2,491,16,492,16,493,2,494,2,495,2,496,2,497,5,498,5,499,2,500,2,501,2,502,2,503,8,504,7,505,2,506,8,507,4,508,4,509,6,510,8,511,5,512,8,513,8,514,3,515,3,516,3,517,3,518,3,519,7,520,7,521,6,526,6,527,6,528,3,529,8,530,2,531,2,532,2,533,1,534,5,535,5,536,5,537,2,538,2,539,5,540,5,541,5,542,12,543,16,544,8,545,3,546,3,547,2,548,10,549,3,550,3,551,10,552,4,553,3,554,3,555,3,556,3,557,2,558,12,559,12,560,8,565,3,566,8,567,8,568,8,569,4,570,6,571,4,576,3,577,3,578,7,579,7,580,2,581,2,582,3,583,3,588,2,589,2,590,3,591,3,592,7,593,7,594,7,595,7,596,2,597,2,598,3,599,3,604,8,605,2,606,2,607,3,608,11,609,1,610,3,614,4,615,11,616,2,617,2,619,5,620,1,621,5,622,4,623,10,624,10,625,5,626,14,627,14,628,2,629,2,630,2,631,2,632,2,633,2,634,10],"impli":[0,2,2,2,3,2,97,2,98,2,243,2],"sourc":[0,2,2,2,3,2,4,4,5,4,6,4,7,12,8,12,9,9,10,9,11,13,12,13,13,4,14,5,15,5,16,5,17,5,18,4,19,3,20,4,21,3,22,12,23,12,24,12,25,12,26,10,27,12,28,18,29,18,30,8,31,8,32,4,33,4,34,6,39,2,40,2,42,8,43,8,49,6,51,4,55,2,56,2,60,2,62,1,63,4,64,14,65,12,66,14,67,11,68,3,69,1,70,4,71,4,73,8,74,6,75,6,76,5,77,3,78,5,79,3,80,3,81,5,82,6,83,4,84,6,85,6,86,8,87,8,88,8,89,6,90,5,91,4,92,5,93,6,94,6,95,6,97,2,98,2,100,5,101,12,102,12,103,13,104,11,105,5,106,5,113,2,114,6,115,6,117,4,118,6,120,8,121,7,122,2,123,6,125,2,127,6,129,9,132,7,134,6,139,7,140,7,142,2,143,2,145,6,146,3,147,4,150,4,151,3,152,2,155,2,156,4,157,5,159,6,161,4,162,9,163,5,173,4,175,1,177,2,178,2,179,8,180,2,183,6,184,5,185,4,186,8,187,5,190,4,191,5,192,7,193,1,194,11,196,4,197,4,198,2,199,7,200,7,201,11,202,11,203,16,204,11,205,11,206,11,207,14,208,10,209,5,210,5,211,5,212,4,213,8,214,6,215,9,216,4,217,2,218,1,220,3,221,3,223,3,224,3,225,6,226,6,227,4,228,4,229,4,230,4,231,4,232,4,233,4,234,13,235,4,236,4,237,9,238,2,239,2,240,2,241,2,242,21,243,4,244,12,245,12,246,10,247,11,248,4,253,4,254,12,255,12,256,6,257,11,258,6,259,8,260,10,261,10,262,10,263,10,264,10,265,5,266,9,267,9,269,5,270,7,271,10,272,6,273,8,274,10,277,10,278,12,282,8,283,6,284,2,285,4,286,9,287,9,288,2,289,9,290,9,291,6,292,8,293,12,294,8,295,11,296,11,297,12,298,11,299,12,300,11,301,12,302,7,303,3,304,3,305,16,306,6,307,7,308,7,309,12,310,7,311,3,314,2,316,7,317,3,318,3,319,3,320,3,321,7,322,8,323,9,324,9,325,6,326,10,327,4,328,1,329,1,330,3,332,2,333,5,334,3,335,2,336,11,337,4,338,2,339,2,340,5,343,7,345,9,346,9,347,1,353,1,354,2,356,8,357,8,358,5,359,5,361,10,362,10,365,5,366,4,374,2,375,4,379,2,380,2,381,12,382,16,386,8,387,8,388,8,389,8,395,3,397,4,398,12,399,12,400,8,401,8,407,4,408,2,409,6,410,2,411,4,413,4,414,2,415,12,416,12,417,12,418,12,419,2,420,2,421,8,422,10,423,7,424,6,425,6,428,3,429,3,430,3,431,5,432,5,433,3,434,3,435,3,436,3,437,3,438,6,439,6,440,3,441,3,442,3,443,3,444,3,445,3,446,6,447,6,448,3,449,3,450,3,451,3,452,5,453,7,454,2,456,4,457,3,458,3,459,4,460,4,461,3,462,3,463,12,464,12,465,16,466,16,467,21,468,21,469,21,470,21,471,22,472,22,473,21,474,21,475,21,476,21,477,22,478,22,479,22,480,22,481,19,482,19,483,22,484,22,485,19,486,19,488,1,489,2,490,2,495,3,496,3,497,5,498,5,499,3,500,3,501,4,502,4,503,11,504,12,505,7,507,4,508,4,509,8,510,10,511,10,512,8,513,4,514,8,515,8,516,8,517,8,518,4,519,6,520,6,521,7,522,4,523,4,524,4,525,4,526,10,527,10,528,10,529,6,530,7,531,8,532,5,533,5,534,9,535,6,536,9,537,6,538,8,539,3,540,5,541,5,544,5,545,6,546,6,547,7,548,3,549,3,550,3,551,3,552,4,553,3,554,3,555,1,556,8,557,2,558,6,559,6,565,10,566,9,567,10,568,9,569,2,570,8,571,8,572,4,573,4,574,5,575,5,576,8,577,8,578,11,579,11,580,7,581,7,582,10,583,10,584,3,585,3,586,5,587,5,588,5,589,5,590,8,591,8,592,12,593,12,594,12,595,13,596,6,597,6,598,9,599,9,600,4,601,4,602,4,603,4,607,8,608,17,614,2,619,4,621,2,625,4,626,12,627,12,628,3,629,3],"destination":[0,2,2,2,3,2,4,8,5,6,6,8,7,9,8,9,9,8,10,8,11,9,12,9,13,6,14,3,15,3,16,3,17,3,18,6,19,5,20,6,21,1,22,9,23,9,24,9,25,9,26,11,27,6,28,9,29,9,30,5,31,5,32,6,33,4,34,4,37,5,39,2,42,6,43,6,44,2,49,4,51,1,62,1,64,11,65,9,67,10,68,9,69,12,73,12,74,8,75,9,76,10,77,3,78,8,79,3,80,4,81,9,82,9,83,3,84,4,85,9,86,10,87,11,88,9,89,6,90,8,91,4,92,7,93,4,94,4,95,4,97,2,98,2,99,4,101,9,102,8,103,11,104,9,105,10,106,10,107,4,113,3,114,6,117,4,120,7,121,6,125,8,126,4,129,7,133,2,135,11,136,2,137,2,138,4,139,6,140,6,144,4,151,7,152,8,155,4,156,11,158,4,159,4,160,4,162,11,163,2,164,4,168,2,169,2,173,7,177,6,178,6,180,4,183,7,184,2,186,6,187,5,193,1,194,3,195,1,196,10,198,2,199,1,200,1,201,6,202,6,203,9,204,6,205,6,206,6,207,6,208,6,209,5,210,5,211,5,212,4,213,9,214,8,215,11,216,12,217,3,218,2,219,5,220,5,221,5,222,5,223,4,224,4,225,10,226,10,227,5,228,2,229,5,230,5,231,5,232,5,233,4,234,13,235,8,236,6,237,15,238,2,239,4,240,4,241,2,242,6,243,6,244,10,245,10,246,9,247,9,248,4,250,4,252,6,253,6,254,9,255,9,256,4,257,9,258,8,259,5,260,10,261,13,262,11,263,10,264,10,265,6,266,6,267,6,269,7,270,8,271,10,272,2,273,10,274,9,277,12,278,11,282,6,283,6,284,6,285,8,286,8,287,10,288,8,289,8,290,10,291,9,292,6,293,13,294,11,295,9,296,8,297,8,298,8,299,9,300,8,301,9,302,3,303,7,304,7,305,9,306,6,307,9,308,9,309,7,310,9,311,7,312,5,314,2,316,9,320,15,321,10,322,12,323,13,324,13,325,8,326,10,327,10,328,10,329,7,330,9,331,8,332,7,333,8,334,7,335,6,336,4,338,4,339,4,343,9,344,6,345,4,346,6,347,2,348,2,353,1,356,6,357,6,358,7,359,7,361,4,362,6,364,13,365,4,366,7,370,4,374,2,375,4,379,4,380,4,381,12,382,20,383,4,384,9,385,6,386,9,387,9,388,10,389,9,394,4,395,11,396,6,397,8,398,10,399,10,400,8,401,8,409,4,415,6,416,6,417,6,418,6,421,4,422,5,423,7,424,10,425,10,428,5,429,6,430,5,431,7,432,7,433,5,434,5,435,5,436,3,437,3,438,6,439,6,440,5,441,6,442,5,443,5,444,5,445,5,446,6,447,6,448,3,449,3,450,3,451,3,452,7,453,9,454,3,457,3,458,3,459,5,460,5,461,8,462,9,463,3,464,3,465,6,466,6,467,9,468,9,469,10,470,10,471,7,472,7,473,9,474,9,475,10,476,10,477,7,478,7,479,7,480,7,481,8,482,8,483,7,484,7,485,8,486,8,487,2,488,2,489,2,490,2,491,7,492,8,495,3,496,3,497,7,498,7,499,3,500,3,501,4,502,4,503,11,504,11,505,4,506,2,509,6,510,4,511,5,512,6,513,4,514,4,515,4,516,4,517,4,518,7,519,10,520,10,521,5,522,2,523,2,524,2,525,2,526,6,527,6,528,5,529,7,530,7,531,3,532,4,533,4,534,6,535,6,536,6,537,7,538,3,539,4,540,6,541,6,542,5,543,5,544,5,545,3,546,3,547,4,548,3,549,4,550,4,551,3,552,5,553,4,554,4,555,4,556,5,557,2,558,3,559,3,560,1,565,5,566,6,567,7,568,6,569,6,570,4,571,4,572,2,573,2,574,3,575,3,576,3,577,3,578,6,579,6,580,3,581,5,582,7,583,7,584,2,585,2,586,4,587,4,588,3,589,3,590,6,591,6,592,5,593,5,594,6,595,6,596,3,597,5,598,5,599,7,604,1,607,11,608,2,619,6,621,2,625,6,626,9,627,9,630,3,631,3,632,3,633,3],"operand":[0,2,2,2,3,2,4,21,5,18,6,21,7,15,8,15,9,11,10,11,11,23,12,23,13,18,14,9,15,9,16,9,17,9,18,8,19,6,20,12,21,11,22,15,23,15,24,15,25,15,26,27,27,22,28,22,29,22,30,15,31,15,32,8,33,10,34,12,35,6,36,6,37,2,38,8,39,6,40,4,41,14,42,18,43,18,45,12,46,11,47,11,48,11,49,18,50,12,51,9,55,4,56,4,60,4,62,3,63,12,64,33,65,30,66,19,67,27,68,15,69,18,70,14,71,14,73,22,74,16,75,12,76,14,77,10,78,14,79,11,80,11,81,10,82,16,83,11,84,14,85,17,86,17,87,20,88,15,89,16,90,14,91,12,92,10,93,14,94,16,95,17,96,8,97,2,98,2,99,6,100,9,101,25,102,22,103,16,104,16,105,11,106,9,109,1,112,5,113,8,114,11,115,6,117,12,118,11,119,4,120,17,121,15,122,3,123,6,125,8,127,6,129,16,132,6,133,1,134,5,135,7,137,4,138,2,139,15,140,15,141,6,142,2,143,2,144,4,145,6,146,3,147,5,148,3,149,6,150,4,151,6,152,10,154,4,155,8,156,15,157,7,158,13,159,15,160,6,161,6,162,28,163,2,164,4,166,6,167,2,168,6,169,3,173,11,176,2,177,6,178,6,179,8,180,8,181,2,182,2,183,15,184,9,185,4,186,20,187,20,190,15,191,7,192,9,193,4,194,21,195,1,196,18,197,6,198,9,199,14,200,14,201,20,202,20,203,20,204,13,205,20,206,20,207,17,208,13,209,14,210,20,211,20,212,16,213,16,214,15,215,10,216,12,217,8,218,5,219,6,220,6,221,6,222,6,223,5,224,6,225,19,226,21,227,14,228,8,229,12,230,14,231,14,232,12,233,12,234,26,235,13,236,9,237,25,238,6,239,9,240,9,241,7,242,26,243,21,244,16,245,16,246,17,247,18,248,15,250,8,252,6,253,12,254,15,255,15,256,15,257,28,258,16,259,11,260,13,261,21,262,25,263,24,264,23,265,19,266,15,267,17,269,16,270,18,271,21,272,7,273,17,274,20,275,1,276,1,277,22,278,26,279,1,280,1,281,2,282,18,283,16,284,4,285,24,286,18,287,22,288,10,289,18,290,20,291,22,292,19,293,28,294,18,295,14,296,14,297,15,298,14,299,15,300,14,301,15,302,15,303,9,304,9,305,24,306,18,307,19,308,19,309,15,310,19,311,14,312,8,313,10,314,4,315,9,316,18,317,3,318,3,319,3,320,20,321,28,322,40,323,26,324,26,325,27,326,21,327,22,328,24,329,20,330,19,331,22,332,10,333,17,334,15,335,13,336,14,337,4,338,12,339,12,340,12,341,8,342,10,343,23,344,16,345,11,346,13,347,3,348,2,354,3,355,4,356,18,357,18,358,17,359,17,361,10,362,12,364,20,365,17,366,19,367,19,370,4,374,4,375,12,378,8,379,14,380,14,381,19,382,21,383,5,384,12,385,7,386,15,387,13,388,14,389,13,394,4,395,21,396,8,397,21,398,16,399,16,400,11,401,11,402,1,405,1,406,2,407,8,408,2,409,16,410,12,411,14,414,2,415,14,416,14,417,14,418,14,419,5,420,5,421,16,422,13,423,18,424,15,425,15,427,2,428,9,429,10,430,9,431,15,432,10,433,5,434,6,435,5,436,9,437,9,438,14,439,16,440,10,441,10,442,9,443,5,444,6,445,5,446,16,447,16,448,10,449,10,450,10,451,10,452,11,453,19,454,3,456,5,457,10,458,10,459,11,460,11,461,14,462,15,463,23,464,23,465,29,466,29,467,31,468,32,469,30,470,31,471,29,472,29,473,31,474,31,475,30,476,30,477,29,478,29,479,28,480,29,481,23,482,24,483,28,484,28,485,23,486,23,488,1,489,2,490,2,491,14,492,14,495,10,496,10,497,13,498,13,499,10,500,10,501,10,502,10,503,28,504,31,505,12,507,7,508,7,509,17,510,6,511,13,512,15,513,12,514,17,515,17,516,17,517,17,518,16,519,15,520,15,521,12,522,6,523,6,524,6,525,6,526,18,527,18,528,20,529,22,530,21,531,23,532,8,533,7,534,26,535,20,536,26,537,19,538,23,539,15,540,13,541,13,544,14,545,15,546,15,547,12,548,2,549,9,550,9,551,2,552,11,553,9,554,9,555,5,556,18,558,23,559,23,565,7,566,12,567,16,568,12,569,10,570,20,571,18,572,12,573,12,574,14,575,14,576,9,577,11,578,17,579,17,580,10,581,10,582,17,583,15,584,8,585,8,586,14,587,14,588,11,589,11,590,17,591,17,592,15,593,15,594,14,595,14,596,10,597,10,598,15,599,15,600,6,601,6,602,6,603,6,607,34,608,3,614,3,619,14,620,2,621,7,624,6,625,12,626,15,627,15,628,3,629,3,630,3,631,3,632,3,633,3],"instruction":[0,9,1,8,2,11,3,9,4,9,5,5,6,6,11,1,12,1,13,5,14,7,15,5,16,7,17,5,18,2,19,1,20,4,21,2,26,4,27,2,30,1,31,1,32,2,33,2,34,2,35,1,36,1,37,1,38,4,39,3,40,3,41,5,42,1,43,1,44,9,46,3,47,3,48,3,49,2,50,12,51,6,52,1,55,11,56,14,57,3,59,5,60,12,62,13,63,5,66,5,68,4,69,3,70,4,71,4,72,7,73,1,74,1,77,4,79,1,80,4,83,3,84,2,86,2,87,1,89,4,91,4,93,4,94,2,95,4,96,11,97,7,98,7,99,7,100,4,107,2,108,10,109,10,112,7,113,1,114,1,115,2,116,16,117,7,118,9,119,6,120,5,121,7,122,3,123,1,124,17,125,5,126,1,127,2,128,3,129,5,130,1,131,1,132,6,133,10,134,8,135,5,136,15,137,17,138,22,139,5,140,7,141,8,142,3,143,13,145,6,146,2,147,4,148,6,149,6,150,5,151,1,152,1,153,17,154,3,155,3,156,1,157,4,158,3,159,3,160,7,161,6,162,8,164,13,165,9,167,8,168,7,169,18,173,2,179,1,183,3,184,6,185,5,186,4,187,5,188,10,189,21,190,3,191,7,192,10,193,12,194,5,195,15,196,2,197,3,198,1,199,4,200,5,201,2,202,2,203,2,204,2,205,2,206,2,207,2,208,2,209,7,210,6,211,6,212,2,213,5,215,2,216,4,217,4,218,3,219,2,220,2,221,2,222,2,223,2,224,2,225,2,226,2,227,3,228,3,229,3,230,3,231,3,232,3,233,4,234,7,237,4,238,1,239,4,240,4,241,1,243,3,248,2,249,11,250,3,251,6,252,3,253,7,256,4,257,9,262,4,266,2,267,2,268,12,269,4,270,2,272,1,273,5,275,2,276,2,277,5,279,2,280,2,282,2,283,2,284,2,285,3,287,2,288,1,291,3,292,3,294,2,302,1,307,2,308,2,310,2,311,1,313,7,314,2,315,7,316,1,317,10,318,3,319,3,320,2,321,2,322,5,323,5,324,4,325,6,326,2,328,5,329,4,330,1,331,5,332,4,333,2,334,3,335,4,336,1,337,3,341,7,342,8,343,2,344,7,345,2,346,2,347,1,348,2,350,5,351,8,352,9,353,19,354,11,355,4,360,1,361,2,362,2,363,1,364,8,365,3,366,8,367,7,368,14,369,4,370,4,371,18,372,6,373,6,375,2,376,6,377,6,378,4,379,4,380,4,383,1,384,4,385,5,390,1,393,8,394,3,395,5,396,3,397,6,402,8,403,8,404,8,405,7,406,7,408,3,409,8,411,4,412,10,413,8,414,3,419,7,420,7,421,1,422,1,424,1,425,1,426,2,427,3,428,1,429,1,430,1,433,1,434,1,435,1,436,1,437,1,439,2,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,2,448,2,449,1,450,1,451,1,452,2,453,1,455,2,456,1,457,1,458,1,459,1,460,1,461,1,463,2,464,2,465,2,466,2,487,2,488,3,489,3,490,3,491,11,492,11,493,5,494,5,495,1,496,1,504,1,505,5,506,2,507,5,508,5,510,3,511,1,512,1,513,1,518,4,519,1,520,1,521,1,522,1,523,1,524,1,525,1,526,1,527,1,528,2,529,2,530,1,534,1,535,3,536,1,537,1,539,3,540,1,541,1,542,8,543,8,544,1,547,5,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,556,2,557,4,560,5,561,1,562,1,563,1,564,1,565,4,572,3,573,3,574,2,575,2,576,5,577,5,578,4,579,4,580,1,581,1,588,1,589,1,590,1,591,1,592,3,593,3,594,2,595,2,596,2,597,2,598,1,599,1,604,5,605,5,606,5,609,3,610,4,611,7,612,13,613,12,614,1,615,6,617,4,618,13,619,5,620,12,621,4,622,10,623,1,624,7,625,4,628,3,629,3,630,3,631,3,632,3,633,3,634,4,635,4],"only":[0,2,1,2,2,2,3,2,27,2,50,1,56,1,59,2,60,1,68,2,70,1,71,1,96,2,97,2,98,2,100,2,107,2,116,1,118,1,119,3,132,1,134,1,141,3,142,1,143,1,153,1,154,3,159,1,166,2,168,1,173,1,179,2,183,2,185,1,190,2,191,1,192,3,193,2,196,1,197,1,201,1,202,1,203,3,204,1,205,1,206,1,207,3,208,1,212,2,249,2,256,1,257,1,279,1,280,1,294,1,305,3,311,1,315,2,322,1,323,2,324,2,329,1,331,1,340,1,342,1,344,2,347,1,349,1,350,1,351,1,352,1,353,1,354,1,363,1,378,2,379,1,380,1,383,1,384,2,385,1,396,2,402,2,406,2,411,1,413,1,415,1,416,1,417,1,418,1,421,1,423,2,424,1,425,1,493,2,494,2,505,1,518,1,519,1,520,1,528,1,542,2,543,2,547,1,556,1,560,2,565,4,576,2,577,2,578,2,579,2,592,1,593,1,594,1,595,1,604,2,605,2,606,2,609,3,610,3,614,1,616,1,618,2,629,2,633,2,634,1],"useful":[0,2,1,2,2,2,3,2,97,2,98,2,117,1,145,2,159,1,164,1,256,1,257,1,380,2,383,1,385,1,396,1,463,1,464,1,465,1,466,1,611,1,621,1],"follow":[0,2,2,2,3,2,4,1,26,1,45,1,50,2,57,1,62,2,72,1,97,2,98,2,105,1,106,1,116,1,118,2,119,1,122,1,124,1,125,1,126,1,130,3,131,3,132,2,133,1,134,1,136,1,137,1,138,1,139,1,140,1,141,2,142,1,145,2,146,1,147,2,148,1,153,2,154,1,164,1,167,1,169,3,183,2,187,2,188,1,189,4,193,1,195,1,196,1,199,1,200,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,209,1,215,2,216,1,262,2,263,2,264,2,272,1,312,1,313,2,332,2,334,2,335,2,340,2,341,2,351,2,352,2,353,3,354,2,360,2,366,1,369,2,385,1,393,5,403,3,404,1,405,1,406,1,408,1,412,1,413,2,414,2,454,1,456,1,569,1,617,2,618,2,620,3,628,1,629,1,630,1,631,1,632,1,633,1],"add":[0,4,4,3,5,1,6,4,7,2,8,2,9,2,10,2,11,2,12,2,13,1,97,4,114,5,151,3,152,5,160,4,170,2,193,1,248,2,262,6,263,4,264,4,286,2,287,4,366,2,419,3,420,2,467,7,468,7,469,7,470,7,471,4,472,4,477,4,478,4,479,3,480,4,481,4,482,4],"binary":[0,2,1,3,2,2,3,2,97,2,98,2,323,2,324,2,569,2,584,6,585,6,586,6,587,6],"addition":[0,3,4,3,5,8,6,1,13,8,56,1,79,1,97,2,281,1,634,1],"stor":[0,2,2,2,3,2,4,2,5,2,6,2,7,2,8,2,9,2,10,2,11,4,12,4,13,2,14,2,15,2,16,2,17,2,18,2,19,2,20,2,21,1,22,2,23,2,24,2,25,2,37,2,38,6,39,2,40,2,42,2,43,2,45,3,46,2,47,2,48,2,55,2,67,1,69,2,73,9,80,1,85,1,86,2,87,2,88,2,96,2,97,2,98,2,100,3,103,2,104,2,113,1,114,2,120,5,121,3,125,10,126,1,129,6,130,2,131,2,132,2,133,6,134,2,135,9,136,4,137,3,138,5,139,4,140,4,145,4,146,2,147,2,151,3,152,5,155,2,156,5,157,2,158,2,165,1,167,1,184,1,185,1,187,2,189,4,190,2,196,1,199,5,200,4,210,3,211,3,212,2,213,1,214,3,215,18,216,20,217,1,218,1,220,2,221,2,223,2,224,2,225,4,226,4,227,2,229,2,230,2,231,2,232,2,239,2,240,2,243,3,244,2,245,2,246,2,247,2,248,2,249,1,252,2,253,2,254,2,255,2,258,2,259,1,260,2,261,4,262,6,263,4,264,4,266,2,267,2,269,2,275,3,276,5,279,2,280,4,288,2,293,2,294,4,302,2,303,3,304,3,305,2,307,2,308,2,309,2,310,2,311,5,315,4,316,2,320,8,332,2,333,3,334,2,335,2,340,2,341,2,342,2,343,2,344,2,345,2,346,2,352,1,361,2,362,2,366,2,371,9,375,2,379,1,380,1,383,5,384,5,385,2,386,2,387,2,388,2,389,2,394,4,395,4,396,6,397,2,398,2,399,2,400,2,401,2,413,4,421,1,424,2,425,2,432,2,452,2,453,2,457,2,458,2,461,3,462,3,467,3,468,3,469,3,470,3,471,4,472,4,473,3,474,3,475,3,476,3,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4,485,4,486,4,505,2,518,3,519,2,520,2,526,2,527,2,532,1,533,1,544,2,547,2,560,4,565,1,570,2,571,2,576,2,577,2,578,2,579,2,580,2,581,2,582,2,583,2,584,2,585,2,586,2,587,2,592,2,593,2,594,2,595,2,596,2,597,2,598,2,599,2,604,4,625,2,626,2,627,2],"byt":[0,2,1,1,2,1,3,2,30,1,31,1,41,2,44,4,45,2,50,1,51,2,55,2,56,3,60,2,64,2,65,2,66,7,69,5,97,2,98,2,105,1,106,3,112,4,125,2,133,1,135,1,138,2,143,6,144,8,148,4,149,2,150,4,159,4,162,6,164,5,169,1,177,4,178,2,180,2,183,1,184,7,189,2,190,21,194,8,196,7,197,1,198,1,199,10,200,7,209,2,210,4,211,4,212,3,215,13,216,6,217,1,218,1,227,8,230,6,231,6,232,2,234,6,242,8,251,6,256,4,257,6,258,2,259,6,261,6,262,1,263,2,264,2,265,6,269,1,270,7,272,4,273,3,275,7,276,8,277,3,279,9,280,10,284,8,285,1,286,2,287,2,289,2,290,2,291,6,293,12,295,2,296,2,298,2,300,2,302,5,303,8,304,7,306,1,317,4,318,5,319,5,320,6,321,14,326,1,327,4,330,4,332,2,334,3,335,2,338,4,339,4,354,2,356,1,357,1,358,1,359,1,367,7,370,6,371,2,379,1,380,1,381,6,382,2,383,7,395,8,396,1,409,2,413,1,415,1,416,1,417,1,418,1,419,1,420,1,432,1,454,2,487,2,488,2,489,2,490,2,491,2,492,2,493,2,494,2,499,4,500,4,501,4,502,4,507,1,508,1,510,8,513,2,514,6,515,2,516,2,517,2,518,4,522,4,523,4,528,9,530,12,534,2,536,2,537,12,539,3,549,9,552,9,555,9,556,14,557,2,569,2,571,2,572,1,573,1,574,1,575,1,588,1,589,1,590,1,591,1,605,2,606,2,618,2,624,2,628,1,629,1,630,1,631,1,632,1,633,1],"content":[0,2,2,3,3,2,37,2,38,2,40,2,42,4,43,4,72,1,97,2,98,2,114,4,118,2,119,2,120,6,121,6,129,6,133,1,139,4,140,4,141,4,142,4,144,2,165,1,185,3,190,1,210,3,211,3,215,2,217,1,218,1,238,2,239,2,240,2,241,2,251,1,285,2,322,2,323,2,324,2,325,2,341,2,342,2,350,2,360,1,383,2,394,2,409,2,413,1,518,1,615,6,621,2,623,2,624,4,634,6],"contain":[0,2,2,2,3,2,26,4,41,3,49,2,50,1,55,3,56,5,60,3,69,8,73,1,83,1,84,2,85,1,88,2,89,2,93,2,94,2,95,2,97,2,98,2,107,2,143,1,144,1,145,4,146,1,148,2,149,4,157,2,183,2,190,2,191,2,192,2,196,3,197,2,227,2,230,2,231,2,232,2,243,1,248,1,249,1,265,3,275,1,276,1,279,1,280,1,317,2,318,2,319,2,364,2,374,2,402,3,403,2,404,1,408,1,414,1,419,1,420,1,438,2,439,2,446,2,447,2,456,2,507,1,508,1,526,2,530,1,531,1,537,1,538,1,569,1,624,1],"correct":[0,2,1,2,2,2,3,2,66,2,97,2,98,2,162,2,194,2,234,2,257,2,367,2,395,2,431,1,463,1,464,1,465,1,466,1,576,1,577,1,578,1,579,1,624,1],"1":[0,3,3,3,7,3,8,3,9,2,10,2,11,2,12,2,18,2,19,2,20,4,22,3,23,3,24,3,25,3,26,2,27,2,28,4,29,4,30,2,31,2,33,8,36,2,37,1,38,2,42,4,43,4,48,2,49,4,50,1,56,2,60,1,63,1,64,3,65,3,67,4,70,4,71,3,72,1,74,2,75,3,76,4,78,3,81,3,82,3,84,1,85,2,86,2,87,3,88,3,89,1,90,3,92,2,94,1,99,4,101,3,102,2,103,3,104,3,105,6,106,5,108,2,109,3,112,4,114,1,116,1,117,2,118,3,119,1,120,2,121,2,122,1,124,1,125,1,128,3,129,3,130,4,131,4,132,4,133,1,134,1,135,1,136,1,137,2,138,2,139,3,140,3,141,3,142,2,145,3,146,6,147,10,148,3,149,2,150,2,151,1,154,1,159,1,160,4,162,2,164,4,166,2,175,1,185,2,188,1,192,1,194,2,196,2,198,1,199,2,200,2,201,1,202,1,203,2,205,1,206,1,207,1,213,2,214,3,215,2,219,2,220,2,221,2,222,2,223,2,224,2,227,1,229,1,230,1,231,1,232,1,234,2,235,3,236,3,237,2,238,2,239,1,240,1,242,11,244,3,245,3,246,3,247,3,252,4,253,2,254,3,255,3,256,1,257,3,258,2,259,1,260,3,261,3,262,2,263,2,264,2,265,1,266,5,267,5,269,3,270,3,271,4,272,1,273,1,274,2,275,4,276,3,277,1,278,2,279,3,280,3,281,3,286,2,287,1,288,2,289,2,290,2,291,3,292,1,293,3,294,1,295,3,296,2,297,3,298,2,299,3,300,2,301,3,303,3,304,3,305,3,306,3,307,2,308,2,309,3,310,2,314,2,315,1,316,6,321,2,322,5,323,4,324,4,326,2,327,3,328,1,330,2,332,2,333,1,334,2,335,2,337,2,341,1,342,3,343,4,344,3,345,7,346,7,349,1,352,1,354,1,356,4,357,4,358,4,359,4,361,3,362,3,363,5,364,5,365,1,367,2,370,3,379,2,380,2,381,4,382,2,386,3,387,3,388,3,389,3,392,2,393,1,395,3,398,3,399,3,400,2,401,2,403,1,406,3,407,2,408,2,410,3,411,3,413,1,414,1,415,2,416,2,417,2,418,2,419,1,420,1,422,1,423,1,428,1,429,2,430,1,431,2,432,2,433,1,434,1,435,1,438,1,439,1,440,1,441,2,442,1,443,1,444,1,445,1,446,1,447,1,452,1,453,1,455,1,461,2,462,2,463,3,464,3,465,3,466,3,469,1,470,1,475,1,476,1,481,1,482,1,485,1,486,1,487,3,488,2,489,4,490,4,499,2,500,2,501,2,502,2,503,2,504,3,505,1,507,3,508,1,509,3,510,1,511,1,512,1,514,2,515,2,516,2,517,2,526,2,527,2,529,2,530,1,531,4,532,2,534,1,535,1,536,1,537,1,538,4,547,1,548,2,549,1,550,1,551,2,552,1,553,1,554,1,555,1,558,2,559,2,566,2,567,2,568,2,570,2,571,2,572,1,573,1,574,1,575,1,588,1,589,1,590,2,591,2,594,1,595,1,608,3,611,1,616,1,618,1,623,4,625,2,626,3,627,3,628,5,629,5,630,4,631,4,632,5,633,5,634,3],"digit":[0,2,1,8,2,3,3,2,97,4,98,4,115,2,147,1],"produc":[0,1,3,1,68,2,69,2,84,1,89,2,95,1,96,3,109,2,115,1,128,2,130,1,131,1,179,4,189,1,198,1,265,1,293,2,294,2,306,2,320,6,345,3,346,3,371,1,439,1,446,1,447,1,454,2,522,2,523,2,524,2,525,2,569,2,608,6],"decimal":[0,2,1,1,2,1,3,2,97,2,98,2,145,1],"carry":[0,2,3,2,4,5,5,7,6,1,13,5,97,2,248,2,262,3,272,2,287,1,311,1,332,1,333,3,344,2,366,2],"ah":[0,2,1,5,3,2,51,2,100,2,115,1,157,2,243,1,363,4],"increment":[0,1,54,2,118,1,119,1,120,1,121,1,122,1,125,1,129,1,135,1,139,1,140,1,141,1,160,2,161,2,162,3,194,4,234,2,257,3,312,5,313,2,351,1,352,1,367,3,395,3],"cf":[0,2,3,2,4,5,5,8,6,1,32,2,33,2,34,2,45,2,46,2,47,2,48,2,49,2,53,2,61,2,62,2,70,2,71,2,97,2,98,2,99,6,100,1,119,2,157,1,158,4,160,6,169,2,175,3,179,4,243,1,281,2,336,2,344,8,363,2,364,6,366,5,370,3,379,1,380,1,391,2,397,1,410,2,411,2,608,6],"af":[0,2,3,2,70,2,71,2,97,2,98,2,119,1,281,2,363,2,410,2,411,2],"flag":[0,2,3,2,4,6,5,4,6,2,13,4,26,4,35,1,36,1,37,1,38,1,39,1,40,1,45,2,46,2,47,2,48,2,52,2,53,2,54,4,55,1,56,1,57,9,58,2,59,6,60,1,61,2,62,4,63,5,66,2,69,1,70,4,71,4,72,4,97,2,98,2,99,6,100,1,116,12,117,2,118,4,119,5,122,3,124,2,128,2,132,2,134,2,138,2,141,4,143,1,157,1,158,4,160,6,162,3,164,2,167,4,169,5,175,1,183,5,185,1,192,7,194,4,195,3,196,4,215,1,216,1,234,3,243,2,248,2,249,1,257,3,275,1,276,1,279,1,280,1,313,1,315,8,336,4,342,8,344,11,350,3,351,3,352,3,353,7,355,4,363,2,364,6,366,6,367,5,368,3,370,4,379,3,380,3,390,2,391,2,392,4,393,4,395,3,397,2,407,2,410,4,411,4,456,5,465,1,466,1,576,1,577,1,578,1,579,1,594,1,595,1,596,4,597,4,598,4,599,4,635,2],"set":[0,2,1,2,2,1,3,2,4,1,5,2,6,1,13,2,20,4,26,2,32,10,33,8,34,4,35,2,36,2,42,2,43,2,48,2,49,2,51,1,52,2,54,2,56,1,59,1,63,5,66,2,70,4,71,4,72,2,77,2,80,2,83,2,91,2,93,2,96,1,97,2,98,2,105,1,106,1,107,1,108,4,109,4,112,1,117,2,118,4,119,5,122,3,124,8,128,3,132,1,133,1,134,1,141,4,143,4,154,3,158,1,162,1,163,1,164,2,167,2,175,4,177,2,178,2,179,4,183,2,185,1,186,2,188,2,192,2,194,2,196,4,200,2,233,2,234,1,243,1,249,2,252,4,253,4,257,1,266,4,267,4,273,4,274,4,275,3,277,4,278,4,279,4,280,1,281,3,282,6,283,2,285,2,287,1,288,2,313,1,314,2,315,1,316,4,320,2,321,2,326,2,327,4,328,4,330,4,331,4,332,1,333,1,336,4,337,2,341,1,342,1,344,2,350,1,351,1,352,1,356,1,357,1,358,1,359,1,364,2,366,1,367,3,369,2,370,11,379,1,380,1,390,4,391,2,392,4,393,3,395,1,397,1,402,1,403,1,407,2,410,4,411,4,413,1,419,1,420,1,421,2,422,1,424,1,425,1,432,1,456,3,463,2,464,2,465,3,466,3,467,2,468,2,473,2,474,2,487,4,488,4,489,4,490,4,491,6,492,6,505,1,506,2,507,1,508,1,511,1,518,1,519,1,520,1,526,2,527,2,531,1,538,1,542,10,543,10,547,1,548,2,551,2,557,2,560,4,566,2,567,2,568,2,569,2,570,4,571,4,572,2,573,2,576,2,577,2,578,2,579,2,592,1,593,1,594,1,595,1,596,4,597,4,598,4,599,4,600,1,601,1,602,1,603,1,604,4,608,6,615,3,623,1,628,2,629,2,630,2,631,2,632,2,633,2,634,6,635,2],"ther":[0,1,37,1,40,1,143,2,165,1,166,1,215,1,249,2,402,2,408,2],"no":[0,1,3,1,26,3,27,2,32,2,37,1,40,1,56,1,57,4,60,1,66,2,109,1,114,1,116,1,118,2,120,3,121,2,124,3,125,1,129,2,130,1,131,1,135,1,136,1,138,1,139,2,140,2,141,2,142,2,158,1,162,2,165,1,183,1,186,1,189,2,191,1,192,2,194,2,197,1,199,1,200,1,209,1,215,3,234,2,251,2,257,2,268,1,275,1,279,1,317,1,318,1,319,1,344,1,347,1,353,2,354,1,367,2,393,1,395,2,402,2,412,1,419,1,420,1,426,1,431,1,505,1,507,1,508,1,547,1,572,1,573,1,574,1,575,1,588,1,589,1,590,1,591,1,614,1,624,2],"clear":[0,1,1,1,3,1,26,2,27,2,47,2,49,2,50,1,52,2,53,2,54,2,57,5,58,2,59,2,67,1,72,2,107,1,108,1,109,1,116,4,124,4,143,2,158,1,167,1,169,1,179,4,183,1,185,1,192,2,237,2,243,1,249,1,281,3,285,2,320,2,327,2,328,2,330,2,331,2,342,2,347,1,349,3,350,3,351,3,352,3,364,4,379,1,380,1,384,2,396,1,403,1,421,1,456,2,487,2,488,2,489,2,490,2,566,2,568,2,590,1,591,1,608,6,614,1,623,2,634,2,635,2],"unchang":[0,1,3,1,9,1,10,1,18,1,19,1,30,1,31,1,64,1,65,1,67,1,80,1,85,1,86,3,87,3,88,1,103,1,104,1,124,2,132,1,134,1,201,1,202,1,203,2,204,2,205,1,206,1,207,2,208,2,213,1,214,1,219,2,222,1,235,1,236,1,237,1,242,1,246,1,247,1,265,1,270,2,271,3,272,1,273,1,274,1,277,1,278,1,286,1,287,1,288,1,289,1,290,1,291,1,292,1,293,1,294,1,295,1,296,1,297,1,298,1,299,1,300,1,301,1,303,1,304,1,305,1,306,1,307,1,308,1,309,1,310,1,316,1,321,1,323,1,324,1,326,3,327,1,328,1,330,1,333,1,343,1,346,2,354,1,358,1,359,1,362,2,388,2,389,1,400,1,401,1,469,1,470,1,475,1,476,1,481,1,482,1,485,1,486,1,491,1,492,1,509,2,542,2,543,2],"either":[0,1,3,1,5,1,13,1,35,2,36,2,50,1,57,1,70,3,71,3,114,1,116,1,118,2,119,2,120,1,121,1,122,1,124,1,129,1,136,1,137,1,138,3,139,1,140,1,141,2,148,1,149,2,162,2,168,1,201,3,202,3,203,3,204,3,205,3,206,3,207,3,208,3,216,1,242,2,257,2,276,1,280,1,283,2,287,1,316,2,328,2,329,1,331,1,332,1,333,1,334,1,335,1,340,1,347,1,353,1,364,1,393,1,395,2,405,1,410,2,411,3,414,2,423,3,459,1,460,1,461,3,462,3,503,3,504,4,523,2,525,2,540,1,541,1,547,1,558,2,559,2,566,3,567,3,568,3,614,1,624,2,630,1,631,1,632,1,633,1],"cas":[0,1,3,1,45,1,51,1,57,2,60,2,72,1,132,1,134,1,144,1,166,1,281,1,294,1,340,1,344,1,393,2,409,2,431,1,491,1,492,1,495,1,496,1,497,1,498,1,542,1,543,1,560,1,572,1,573,1,576,2,577,2,578,3,579,3,604,1,626,2,627,2],"bit":[0,2,1,1,2,1,3,2,4,3,5,5,6,3,7,10,8,10,9,6,10,6,11,7,12,7,13,5,14,2,15,2,16,2,17,2,18,5,19,8,20,7,21,4,22,10,23,10,24,10,25,10,26,3,27,30,28,10,29,10,30,13,31,13,32,14,33,10,34,10,38,1,39,4,41,1,42,14,43,15,44,11,45,28,46,27,47,27,48,27,49,12,50,4,51,12,52,6,55,1,56,4,59,2,60,2,61,4,62,4,63,3,64,12,65,11,67,11,68,5,69,25,70,1,71,1,72,6,73,12,74,10,75,10,76,11,77,3,78,11,79,2,80,3,81,10,82,11,83,3,84,8,85,7,86,11,87,13,88,6,89,9,90,9,91,3,92,7,93,3,94,10,95,9,96,16,97,1,98,1,99,4,100,8,101,10,102,9,103,8,104,7,105,10,106,10,107,2,108,2,109,9,110,2,111,2,113,10,115,2,116,2,117,3,118,2,122,2,123,2,124,4,126,2,127,2,128,4,132,2,133,2,134,2,135,1,136,2,137,6,138,2,141,2,143,9,144,5,145,2,148,5,149,6,151,4,152,1,153,2,154,2,155,1,156,1,157,6,158,1,159,8,160,4,161,8,162,4,163,5,164,4,166,7,167,1,168,1,169,3,173,5,177,6,178,6,179,4,180,2,183,2,184,1,185,6,186,19,187,5,188,3,189,2,190,13,191,4,192,7,194,2,195,9,196,11,197,3,198,4,199,3,200,3,201,5,202,5,203,9,204,3,205,5,206,5,207,5,208,3,210,17,211,15,212,3,213,17,214,10,215,17,216,9,217,3,218,5,219,5,220,9,221,9,222,4,223,8,224,8,225,12,226,12,227,10,229,5,230,8,231,8,232,4,233,1,235,7,236,7,237,10,238,5,239,5,240,6,241,3,242,32,243,5,244,10,245,10,246,7,247,5,248,4,249,3,250,3,251,2,252,3,253,9,254,10,255,10,256,8,257,4,258,12,259,6,260,10,261,8,262,6,263,1,264,2,265,7,266,13,267,15,268,2,269,7,270,14,271,14,272,8,273,5,274,9,275,3,276,3,277,5,278,9,279,3,280,3,281,4,282,14,283,16,284,10,285,16,286,13,287,16,288,9,289,13,290,17,291,11,292,8,293,16,294,7,295,8,296,7,297,10,298,7,299,10,300,7,301,10,302,12,303,4,304,4,305,17,306,27,307,14,308,14,309,14,310,14,311,7,312,1,313,2,314,2,315,5,316,11,318,1,319,1,320,14,321,19,322,23,323,20,324,20,325,5,326,8,327,9,328,20,329,21,330,7,331,16,332,4,333,11,334,3,335,3,336,7,337,6,338,2,339,2,340,6,341,1,342,7,343,16,344,31,345,4,346,4,347,7,349,3,350,13,351,8,352,10,355,6,356,9,357,9,358,7,359,7,360,2,361,4,362,4,363,10,364,25,365,12,367,4,370,2,371,2,379,14,380,15,381,21,382,27,383,8,384,15,385,10,386,10,387,10,388,8,389,7,390,6,394,6,395,4,396,8,397,3,398,10,399,10,400,6,401,6,403,3,404,1,405,2,406,7,407,4,408,8,409,2,410,1,411,1,412,2,413,5,414,8,415,10,416,10,417,10,418,10,419,2,420,2,421,12,422,5,423,15,424,4,425,4,428,4,429,7,430,4,431,10,432,7,433,5,434,6,435,5,436,1,437,2,438,5,439,7,440,2,441,6,442,2,443,3,444,4,445,3,446,7,447,5,448,4,449,3,450,3,451,2,452,10,453,12,454,7,456,5,457,3,458,3,459,1,460,1,461,22,462,24,463,9,464,9,465,12,466,12,467,3,468,3,469,4,470,4,471,4,472,4,473,3,474,3,475,4,476,4,477,4,478,4,479,4,480,4,481,2,482,2,483,4,484,4,485,2,486,2,487,9,488,11,489,8,490,8,491,4,492,5,493,6,494,6,495,3,496,3,497,4,498,4,499,5,500,5,501,6,502,6,503,17,504,19,505,9,506,2,507,3,508,3,509,11,510,3,511,5,512,16,513,4,514,6,515,8,516,8,517,6,518,3,519,4,520,4,521,11,526,11,527,11,528,2,529,6,530,5,531,19,532,8,533,7,534,15,535,4,536,15,537,5,538,19,539,1,542,6,543,6,544,11,545,14,546,14,547,9,548,2,549,6,550,6,551,2,552,5,553,6,554,6,555,6,556,11,557,2,558,15,559,15,560,3,565,23,566,13,567,16,568,13,569,14,570,6,571,8,572,1,573,1,574,2,575,2,576,6,577,6,578,9,579,9,580,3,581,3,582,5,583,5,584,1,585,1,586,3,587,3,588,8,589,8,590,8,591,8,592,11,593,11,594,7,595,7,596,3,597,3,598,5,599,5,600,3,601,3,602,3,603,3,604,3,605,6,606,6,607,19,608,21,609,5,610,11,611,2,612,2,613,2,614,7,615,13,616,2,617,2,619,3,620,4,621,4,623,13,624,2,625,10,626,7,627,7,628,8,629,8,630,8,631,8,632,8,633,8,634,16],"4":[0,1,12,1,30,1,31,1,45,2,105,5,106,7,148,2,149,2,150,1,162,2,164,1,166,3,183,1,190,3,192,2,194,1,196,1,210,2,211,2,216,3,226,4,234,1,235,2,236,4,242,4,243,2,257,1,259,2,261,6,262,2,263,2,264,2,268,2,270,1,272,4,275,5,276,3,279,3,280,3,281,3,291,2,294,2,307,2,308,2,310,2,312,1,315,1,317,1,319,1,320,2,321,2,322,5,323,4,324,2,325,2,328,2,329,2,331,2,332,2,334,2,335,2,338,2,339,2,340,1,342,2,345,1,346,1,349,1,353,1,356,2,357,4,358,2,359,2,363,2,367,1,375,2,379,1,380,1,381,2,382,4,383,1,384,1,395,1,415,2,419,4,420,4,454,2,459,2,460,2,487,3,488,2,491,3,492,3,507,4,508,4,515,1,516,1,519,2,520,2,526,1,527,1,528,1,530,2,531,1,537,2,538,1,572,3,573,3,574,1,575,1,584,1,585,1,586,1,587,1,588,2,589,2,590,2,591,2,615,1,616,1,628,1,629,1,630,1,631,1,632,1,633,1],"through":[0,1,56,1,60,1,99,1,115,2,133,1,137,2,160,1,186,1,189,1,192,2,318,1,319,1,320,1,344,2,371,1,379,1,380,1,385,2,514,1,515,1,516,1,517,1,617,2],"7":[0,1,27,2,29,2,30,2,31,2,49,2,50,1,51,2,57,1,105,1,106,3,108,2,161,4,167,2,168,1,177,2,178,2,183,1,188,1,238,2,242,2,265,1,270,2,271,2,293,2,317,1,319,1,321,2,322,1,350,2,363,2,364,4,381,3,382,4,395,1,408,1,413,1,414,1,487,1,503,3,504,1,507,2,509,2,514,1,515,1,516,1,517,1,526,1,527,1,584,1,585,1,586,1,587,1,588,2,589,2,590,2,591,2,630,1],"0":[0,1,3,1,5,1,20,2,21,1,26,2,27,3,28,2,29,2,30,2,31,2,32,3,33,1,34,3,42,4,43,4,47,2,49,3,52,1,54,2,58,2,59,2,64,3,65,2,67,1,70,3,71,2,73,1,77,1,80,1,83,1,84,1,87,1,88,1,91,1,93,1,94,1,100,1,105,5,106,5,107,2,109,5,112,3,114,4,115,3,117,2,118,13,119,11,120,6,121,4,122,7,124,2,125,3,127,1,128,6,129,8,130,8,131,8,132,8,134,5,135,5,139,5,140,5,141,13,142,6,143,2,145,8,146,6,147,10,153,1,154,2,157,1,159,5,161,4,162,3,164,2,165,1,166,4,191,1,192,4,194,1,195,2,196,2,197,1,199,1,200,2,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,215,2,227,1,230,1,233,1,234,1,242,2,243,1,246,1,247,1,248,1,249,2,250,2,252,4,253,4,256,5,257,3,265,1,266,2,267,4,270,3,271,2,272,2,281,1,282,1,283,1,284,4,285,2,288,3,291,2,293,4,294,4,307,1,308,1,310,1,315,3,316,2,320,2,322,7,323,3,324,2,326,1,328,2,331,2,336,4,342,1,343,2,345,8,346,8,349,2,350,7,351,3,352,2,353,1,355,1,356,1,357,1,358,1,359,1,361,6,362,6,363,3,364,1,365,1,367,1,370,3,379,4,380,3,381,5,382,6,383,1,385,3,388,1,389,1,390,1,393,2,394,1,395,1,402,2,403,4,404,6,405,4,408,4,410,2,411,2,413,1,414,4,421,1,422,2,431,1,461,6,462,6,463,6,464,6,465,6,466,6,487,3,499,2,500,2,501,2,502,2,503,5,504,7,505,2,509,2,510,1,511,2,514,3,515,3,516,3,517,3,526,1,527,1,530,3,531,7,532,1,535,2,537,3,538,7,547,2,548,2,551,2,556,1,566,3,568,3,570,2,571,2,572,3,573,3,574,2,575,2,576,4,577,4,578,4,579,4,580,4,581,4,582,4,583,4,588,1,589,1,590,1,591,1,592,4,593,4,594,4,595,4,596,1,597,1,598,1,599,1,612,1,613,1,615,2,616,2,625,2,629,2,633,2,634,6],"execut":[0,1,1,1,2,1,3,1,4,2,5,2,6,1,13,3,20,1,21,1,26,1,27,1,30,1,31,1,32,1,33,1,34,1,38,1,41,1,46,1,47,1,48,1,49,1,50,4,52,1,56,1,59,4,66,1,68,1,69,1,72,2,73,1,77,2,80,2,83,2,91,2,93,2,97,1,98,1,99,1,107,2,108,1,109,2,116,2,124,2,132,1,133,1,134,2,136,2,137,2,138,4,153,4,154,2,160,1,162,1,164,1,165,3,168,3,186,1,188,1,189,4,190,1,191,1,192,1,194,1,195,1,197,2,198,1,233,2,234,1,248,1,249,1,250,1,252,1,253,1,257,1,268,4,270,1,281,1,282,1,283,1,291,1,313,1,315,2,317,1,318,1,319,1,341,2,342,1,349,3,350,3,351,4,352,3,354,3,355,1,363,1,365,1,366,2,368,2,384,2,390,1,393,1,395,1,396,1,397,1,403,3,404,4,405,11,406,2,408,1,409,2,413,3,414,2,504,1,535,1,588,1,589,1,590,1,591,1,608,3,612,2,613,2,615,1,616,5,619,1,622,1,623,1,624,1,625,1,629,2,633,2,634,1,635,6],"describ":[0,1,1,1,2,1,3,1,26,1,41,1,97,1,98,1,105,2,106,2,130,1,131,1,143,2,144,1,262,2,263,2,264,2,313,1,317,1,318,1,319,1,332,2,334,2,335,2,341,2,363,1,408,2,413,1,414,1,455,1,618,1],"compatibility":[0,1,1,1,2,1,3,1,26,1,41,1,44,1,97,1,98,1,110,2,116,1,124,1,132,1,136,1,138,1,143,4,192,1,193,1,315,2,341,1,363,1,384,1,385,1,405,1,406,2,609,1,610,1,624,1],"mod":[0,3,1,3,2,3,3,3,4,1,5,4,6,1,11,1,12,1,13,4,20,1,21,5,26,4,27,5,30,1,31,1,32,5,33,5,34,5,38,1,39,2,41,3,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,5,50,2,51,1,52,8,53,2,54,2,57,4,59,6,61,4,63,1,68,3,69,1,72,4,77,1,79,1,80,1,83,1,84,4,87,1,89,2,91,1,93,1,94,4,95,2,96,3,97,3,98,3,99,2,100,4,108,2,109,9,110,2,111,2,112,2,113,2,115,2,116,3,117,2,118,2,122,2,123,2,124,3,125,1,126,4,127,2,128,2,132,2,133,3,134,2,135,1,136,3,137,8,138,3,141,2,143,14,144,8,145,2,151,1,152,1,153,3,155,1,156,1,157,2,159,2,160,2,164,1,165,1,166,4,167,2,168,1,173,3,184,1,185,2,186,3,187,4,188,1,189,2,190,4,191,3,192,5,194,1,197,2,198,1,209,1,212,1,213,1,215,4,216,2,225,2,226,2,229,1,232,2,233,1,238,1,241,1,243,1,248,5,249,2,250,1,251,2,252,1,253,1,256,2,265,1,266,1,267,1,268,2,269,1,270,1,273,1,277,1,281,2,282,5,283,5,284,4,285,3,286,1,287,1,289,1,290,1,291,2,293,1,294,1,302,2,306,1,307,1,308,1,310,1,311,1,312,1,313,2,315,4,316,1,321,1,322,1,323,1,324,1,325,1,326,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,337,2,341,4,342,6,343,1,344,3,345,1,346,1,347,1,350,2,354,1,355,5,356,5,357,5,358,5,359,5,360,5,361,1,362,1,363,3,364,2,365,5,367,6,371,2,379,3,380,3,383,2,384,5,385,2,390,8,391,2,392,2,393,3,394,2,395,4,396,2,397,1,404,3,405,4,406,4,407,1,408,2,412,2,413,2,414,2,426,1,427,1,432,2,439,1,446,1,447,1,452,1,453,1,455,1,456,2,588,5,589,5,590,5,591,5,600,1,601,1,602,1,603,1,609,5,610,5,611,2,612,3,613,3,614,1,615,1,619,1,621,1,624,2,625,1,628,2,629,2,630,2,631,2,632,2,633,2,634,1],"legacy":[0,1,1,1,2,1,3,1,7,1,8,1,9,1,10,1,11,1,12,1,14,1,15,1,16,1,17,1,18,1,19,1,22,1,23,1,24,1,25,1,26,1,28,1,29,1,30,1,31,1,38,1,41,1,55,1,64,1,65,1,67,1,74,1,75,1,82,1,84,1,85,1,86,1,87,1,88,1,89,1,94,1,95,1,97,1,98,1,101,1,102,1,103,1,104,1,105,1,106,1,143,4,144,1,151,1,203,1,204,1,207,1,208,1,213,1,214,1,220,1,221,1,223,1,224,1,235,1,236,1,237,1,242,1,244,1,245,1,246,1,247,1,254,1,255,1,260,1,261,1,265,1,266,2,267,2,269,2,270,1,271,1,273,2,274,1,277,2,278,1,284,1,286,2,287,2,288,1,289,2,290,2,291,1,293,1,294,2,295,2,296,2,297,1,298,2,299,1,300,2,301,1,302,2,303,3,304,3,305,1,306,2,307,2,308,2,309,1,310,2,311,1,316,2,321,2,323,1,324,1,326,2,327,1,328,2,329,1,330,1,331,1,333,2,334,1,341,1,343,2,356,1,357,1,358,1,359,1,363,1,381,1,382,1,386,1,387,1,388,1,389,1,398,1,399,1,400,1,401,1,413,2,415,1,416,1,417,1,418,1,609,1,610,2,624,1,626,1,627,1],"not":[0,1,1,1,2,1,3,1,4,1,5,1,7,1,8,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,2,19,1,21,3,22,3,23,3,24,1,25,1,26,2,27,5,28,1,29,1,32,3,33,3,34,3,35,2,36,2,37,5,38,3,39,1,40,5,41,3,44,1,45,1,49,3,50,1,55,6,56,5,58,2,60,5,62,6,66,2,68,1,69,2,70,1,71,1,89,1,95,1,97,1,98,1,99,1,102,1,105,2,106,2,109,1,115,1,116,3,117,2,118,2,119,1,124,1,125,1,128,2,130,2,131,2,132,4,133,2,134,3,135,1,136,2,137,1,138,3,141,1,143,4,144,1,147,3,148,1,149,1,150,1,151,1,154,1,160,1,162,2,165,6,166,3,168,1,169,6,171,2,173,1,174,2,179,1,184,3,185,1,187,1,189,6,190,4,191,3,192,3,193,3,194,2,195,4,197,3,198,2,199,3,200,2,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,210,1,211,1,212,2,215,2,216,4,217,2,218,2,225,1,226,1,227,2,228,3,229,1,230,2,231,2,232,1,234,2,239,2,240,2,244,1,245,1,248,3,251,4,252,3,254,1,255,1,257,2,260,1,261,1,265,1,266,2,267,4,268,1,269,2,272,1,273,1,275,1,276,1,277,1,279,1,280,1,281,3,282,5,283,3,284,2,285,1,287,2,291,1,293,1,294,1,306,1,307,1,308,1,310,1,311,1,313,1,315,2,316,1,317,4,318,1,319,1,321,1,322,3,323,2,324,2,325,1,328,1,329,2,330,1,331,2,332,2,333,3,334,1,335,1,336,5,337,1,341,2,342,3,343,1,344,1,345,3,346,3,348,2,350,1,351,2,352,2,353,6,355,5,356,1,357,1,360,1,361,1,362,1,365,3,366,1,367,4,368,1,370,2,371,2,378,2,379,1,380,1,382,1,383,1,385,1,386,1,387,1,393,1,394,1,395,3,398,1,399,1,402,1,403,3,404,2,405,3,406,4,408,1,409,2,411,2,412,1,413,3,414,1,415,1,416,1,417,1,418,1,422,1,424,1,425,1,426,2,427,2,433,1,434,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,447,1,448,1,449,1,450,1,451,1,455,1,457,2,458,2,459,2,460,2,463,2,464,2,465,2,466,2,491,3,492,3,497,1,498,1,505,2,510,1,511,1,512,1,518,3,519,2,520,2,528,2,529,2,530,1,535,2,537,1,539,2,540,3,541,3,542,4,543,4,547,2,555,1,560,1,576,4,577,4,578,4,579,4,580,2,581,2,582,2,583,2,592,1,593,1,594,3,595,3,596,1,597,1,598,1,599,1,604,1,608,2,609,3,610,5,612,2,613,3,615,3,616,1,618,1,619,1,620,4,624,2,626,1,627,1,628,1,629,1,630,1,631,1,632,1,633,1,634,1],"valid":[0,1,1,1,2,1,3,1,41,1,77,1,80,1,83,1,91,1,93,1,97,1,98,1,108,2,196,1,200,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,209,1,233,1,275,1,276,1,279,2,280,2,312,1,313,1,341,1,363,1],"64":[0,1,1,1,2,1,3,1,4,2,5,3,6,2,7,1,9,3,10,1,11,1,12,1,13,3,20,2,21,4,22,1,24,1,26,2,27,4,32,4,33,4,34,4,36,1,38,1,39,2,41,1,42,2,43,2,44,4,46,2,47,2,48,2,49,4,50,5,51,2,52,2,59,4,61,4,62,1,63,3,64,1,66,2,68,4,69,10,70,1,72,4,74,5,76,3,77,1,78,4,79,2,80,2,82,5,83,1,84,7,85,1,86,6,87,4,88,2,89,6,90,3,91,1,93,3,94,9,95,7,96,4,97,1,98,1,99,3,100,7,101,1,103,5,105,2,106,2,108,4,109,4,111,2,112,1,113,4,115,2,116,3,117,4,118,2,122,2,123,2,124,5,126,2,127,2,128,3,132,3,133,1,134,3,136,3,137,4,138,4,141,2,143,8,144,5,145,2,148,1,149,2,151,1,152,1,153,3,155,1,156,1,157,5,159,3,160,3,162,3,164,3,166,8,167,2,168,1,173,3,177,4,178,4,184,3,185,4,186,2,187,3,188,3,189,2,190,2,191,2,192,1,193,1,194,2,195,4,197,2,198,2,199,1,200,3,201,1,203,6,205,1,207,4,209,1,210,2,211,2,212,2,213,6,214,2,215,20,216,5,217,2,218,1,219,1,220,6,221,6,223,4,224,4,225,3,226,3,227,2,228,1,229,3,230,2,231,2,232,5,233,1,238,4,241,2,243,2,244,1,246,4,248,4,249,2,250,2,251,2,252,2,253,2,256,3,257,3,258,1,261,2,262,2,263,2,264,2,265,2,266,4,267,4,268,2,269,2,272,2,273,2,274,1,277,2,278,1,281,3,282,4,283,4,284,6,285,5,286,2,287,2,289,2,290,2,291,3,293,1,294,4,295,1,296,1,297,1,298,1,299,1,300,1,301,1,302,4,305,2,306,3,307,5,308,5,309,5,310,5,311,7,312,1,313,2,315,2,316,2,317,1,318,1,319,1,320,4,321,4,322,1,323,1,324,1,325,2,326,1,328,6,329,6,330,1,331,6,332,2,333,7,334,5,335,4,337,6,338,2,339,2,340,2,341,2,342,2,343,3,344,4,345,4,346,4,347,3,349,1,350,7,351,5,352,6,354,1,355,4,358,1,360,3,361,3,362,3,363,1,364,5,365,4,367,4,368,2,370,1,371,2,379,6,380,6,381,1,382,2,383,3,384,3,385,4,386,1,388,5,390,2,394,2,395,5,396,2,397,2,398,1,400,3,403,1,404,1,405,2,406,5,407,2,408,4,410,1,412,2,413,3,414,3,415,4,416,1,417,2,418,1,421,2,422,1,423,3,429,1,431,3,432,2,433,2,435,2,437,1,438,2,439,4,441,2,443,2,445,2,446,6,447,4,448,3,450,1,451,1,452,6,453,5,454,2,456,2,457,1,461,1,462,1,463,1,464,1,465,4,467,1,469,3,471,1,473,1,475,3,477,1,479,1,481,1,483,1,485,1,493,2,494,2,495,1,497,2,499,1,501,2,503,2,504,3,512,4,513,4,514,1,516,1,518,2,521,3,531,4,532,1,534,3,536,3,538,4,539,2,544,3,545,2,546,2,549,2,550,2,552,5,553,6,554,6,555,2,556,1,558,4,559,4,565,10,566,1,567,1,568,1,569,1,570,1,571,1,576,1,578,4,580,1,582,3,586,2,588,1,590,2,592,3,594,1,596,1,598,3,605,2,606,2,607,2,609,4,610,4,611,3,612,4,613,3,614,3,615,9,616,1,618,1,619,2,621,3,623,7,624,1,625,2,628,9,629,9,630,8,631,8,632,9,633,9,634,7],"aad":[1,5],"least":[1,2,27,2,42,4,73,5,105,1,106,1,135,1,177,2,178,2,276,1,279,2,280,3,284,2,285,5,289,2,290,4,291,2,292,3,306,2,315,1,321,2,344,4,364,2,409,2,420,1,432,1,491,1,492,1,521,2,542,1,543,1,549,1,550,1,552,1,553,1,554,1,555,1,560,1,565,1,604,1],"significant":[1,4,27,2,30,2,31,2,42,4,43,4,73,9,113,2,135,1,147,1,158,1,177,2,178,2,198,2,199,1,200,1,270,2,276,1,279,2,280,3,284,2,285,5,289,4,290,8,291,2,292,3,302,2,306,6,321,4,344,12,364,9,365,3,380,1,409,2,419,1,420,1,491,1,492,1,505,1,521,2,544,2,547,1,548,2,549,1,550,1,552,1,553,1,554,1,555,1,565,1],"most":[1,2,30,2,31,2,43,4,57,2,73,4,113,2,167,1,169,1,193,1,198,2,199,1,200,1,268,2,270,2,275,1,276,1,279,1,280,1,289,2,290,4,302,2,306,4,321,2,344,6,364,5,365,1,380,1,393,2,413,1,491,1,492,1,505,1,544,2,547,1,548,2],"so":[1,2,73,2,112,1,118,2,119,2,122,1,141,2,142,1,199,1,209,1,318,2,403,2,406,3,414,1,421,1,463,1,464,1,465,1,466,1,491,1,492,1,542,1,543,1,560,1,596,1,597,1,598,1,599,1,604,1],"division":[1,4,96,3,100,2,120,1,121,1,364,1],"operation":[1,3,2,1,4,2,5,2,6,2,13,2,14,1,15,1,16,1,17,1,20,4,36,1,39,2,42,2,43,2,44,2,46,2,47,2,48,2,51,1,52,1,53,2,54,4,55,1,56,1,57,1,59,3,60,1,61,2,62,2,63,2,68,2,69,2,70,2,71,2,73,2,77,1,80,1,83,1,91,1,93,1,94,1,95,1,96,1,99,4,100,2,108,3,109,4,115,1,116,1,117,2,118,5,119,5,120,1,121,2,122,1,123,1,124,1,125,3,126,1,127,1,128,1,129,1,132,2,134,1,135,2,136,1,137,1,138,1,139,1,140,2,141,6,144,1,145,6,148,1,149,1,150,1,153,1,154,2,157,2,159,1,160,4,162,4,165,1,167,1,175,4,179,4,185,1,186,2,188,2,189,3,193,1,194,4,195,2,199,1,200,1,209,1,212,4,213,3,215,4,216,6,227,1,228,1,229,3,230,1,231,1,232,2,233,1,234,4,238,2,241,2,242,5,243,2,248,2,249,3,250,4,251,4,252,4,253,4,256,1,257,4,259,2,261,2,262,2,263,2,264,2,266,2,267,2,268,2,275,3,276,3,279,3,280,3,293,2,294,4,307,2,308,2,310,2,312,1,313,2,315,3,316,2,320,2,321,4,322,3,323,6,324,6,325,4,332,2,334,2,335,2,338,2,339,2,341,4,342,4,343,2,345,2,346,2,351,1,352,3,353,3,356,1,357,1,358,1,359,1,361,2,362,2,363,2,364,3,367,3,371,1,374,2,375,2,378,2,379,2,380,2,385,2,390,1,391,2,392,4,393,1,394,1,395,8,396,1,397,2,403,1,404,1,405,1,406,1,407,1,408,1,411,2,412,1,413,4,414,2,419,1,420,1,428,1,430,1,432,1,433,1,435,1,436,1,437,1,442,1,443,1,445,1,456,1,491,1,492,1,495,1,496,1,497,1,498,1,499,1,500,1,501,1,502,1,507,1,508,1,570,2,571,2,572,9,573,9,574,5,575,5,588,1,589,1,590,1,591,1,600,1,601,1,602,1,603,1,608,3,611,1,612,2,613,2,619,2,621,4,624,1,625,3,628,2,629,2,630,2,631,2,632,2,633,2],"perform":[1,2,5,2,6,1,13,2,14,2,15,2,16,2,17,2,18,2,20,2,21,2,22,2,23,2,24,2,25,2,36,2,37,3,40,3,50,1,62,4,63,2,64,7,65,6,67,2,99,2,101,2,102,2,118,2,119,3,120,2,121,3,122,1,124,1,125,1,129,2,132,1,133,1,134,1,135,1,139,2,140,3,141,3,145,3,158,2,160,2,161,2,167,5,168,1,169,4,171,2,172,2,174,2,175,2,176,2,179,2,181,2,182,2,183,3,187,2,189,2,193,1,195,3,196,3,201,2,202,2,205,2,206,2,212,2,215,1,242,1,243,2,248,2,251,2,252,2,253,2,254,2,255,2,262,2,263,4,264,4,266,2,267,4,268,1,269,2,272,2,273,2,274,2,275,1,276,1,277,2,278,2,279,1,280,1,289,2,290,4,293,2,294,2,295,2,296,2,297,2,298,2,299,2,300,2,301,2,306,2,307,2,308,2,309,2,310,2,316,2,321,2,332,2,333,2,334,2,335,2,340,1,341,2,343,2,345,2,351,1,352,1,361,2,364,2,372,2,373,2,375,2,376,2,377,2,378,2,386,2,387,2,397,1,398,2,399,2,410,2,415,2,416,2,417,2,418,2,419,1,420,1,422,2,455,2,456,5,463,3,464,3,465,3,466,3,467,5,468,5,469,5,470,5,471,4,472,4,473,5,474,5,475,5,476,5,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4,485,4,486,4,510,2,511,2,514,8,515,7,516,7,517,8,531,1,538,1,565,2,570,2,571,2,572,1,573,1,574,1,575,1,576,2,577,2,578,2,579,2,584,2,585,2,586,2,587,2,592,3,593,3,594,1,595,1,600,2,601,2,602,2,603,2,608,3,620,1,622,2,625,2,626,2,627,2,628,2,629,2,630,2,631,2,632,2,633,2],"will":[1,2,18,1,19,1,21,1,27,3,30,2,31,2,32,1,33,1,34,1,35,2,36,2,37,1,38,1,40,3,41,1,45,1,49,1,55,2,70,1,71,1,89,1,95,1,105,1,106,1,108,1,112,1,113,1,143,3,144,1,153,2,159,1,163,3,165,1,179,1,184,1,185,2,189,2,193,1,196,1,198,1,210,3,211,3,216,1,217,3,218,2,225,1,226,1,227,3,228,4,230,3,231,3,239,2,240,2,248,2,251,1,256,1,265,1,268,2,270,3,282,1,283,1,284,2,285,2,286,2,287,2,288,1,289,2,290,2,291,3,293,2,306,1,307,1,308,1,310,1,317,1,318,2,319,1,321,2,322,2,323,1,326,1,336,1,337,1,350,3,355,1,356,2,357,2,358,2,359,2,365,1,367,1,384,1,394,2,403,2,408,2,411,1,413,2,414,1,415,1,416,1,417,1,418,1,423,1,424,1,425,1,427,1,428,1,429,1,430,1,432,1,433,1,434,1,435,1,436,1,437,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,447,1,448,1,449,1,450,1,451,1,457,1,458,1,459,1,460,1,461,1,488,1,489,1,490,1,491,2,492,2,493,5,494,5,495,1,496,1,504,1,505,2,512,3,513,1,518,2,519,1,520,1,521,1,526,1,527,1,534,1,535,1,536,1,539,1,540,1,541,1,542,5,543,5,544,1,547,2,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,560,5,569,1,576,3,577,3,578,2,579,2,580,1,581,1,596,1,597,1,604,5,605,6,606,6,608,3,609,1,610,2,612,1,613,1,615,2,616,2,617,2,618,2,622,7,632,1,634,4],"yield":[1,2,463,1,464,1,465,1,466,1],"preced":[1,2,112,1,133,1,137,1,162,1,169,1,189,2,257,1,367,1],"div":[1,2,45,1,100,1],"divid":[1,2,100,4,101,2,102,2,103,2,104,2,120,7,121,6,130,2,131,2,145,1,146,1,157,4,364,1],"ax":[1,3,2,7,51,2,68,4,96,6,100,8,138,6,157,8,159,2,194,6,243,4,256,2,313,2,341,2,367,4,395,5],"10":[1,3,2,5,128,2,166,3,185,2,199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1,345,2,346,2,361,2,362,2,569,1,631,1],"00h":[1,1,72,1,261,4,335,1],"equal":[1,1,21,1,27,1,32,1,33,1,34,1,41,4,49,1,62,1,68,2,69,2,70,2,71,2,118,2,119,2,130,1,131,2,141,2,169,1,248,1,273,2,274,2,279,1,280,1,282,1,283,1,315,1,345,2,346,2,353,4,355,1,365,1,370,3,410,2,411,2],"equivalent":[1,1,14,2,15,2,18,1,44,1,228,2,250,2,315,1,619,1],"original":[1,1,145,4,341,4,344,1,364,1],"bas":[1,6,2,9,37,6,38,3,40,7,45,4,46,4,47,4,48,4,50,3,63,1,146,1,147,3,166,4,168,1,175,2,187,1,190,9,191,2,197,3,215,1,275,3,276,3,279,2,280,2,297,1,299,1,301,1,305,2,309,1,347,3,383,2,402,8,419,1,420,1,454,1,457,4,458,4,491,4,492,4,507,1,508,1,518,2,539,2,542,4,543,4,560,4,604,4,614,3,624,7],"number":[1,5,2,4,11,8,12,8,27,2,49,2,76,1,81,1,89,1,112,3,118,1,119,1,122,1,125,1,126,1,130,2,131,2,132,2,134,1,139,1,141,1,145,1,146,3,147,1,155,2,158,2,198,2,275,1,276,1,305,7,314,2,327,2,328,3,329,3,330,2,331,3,344,2,353,2,354,2,364,2,379,1,380,1,409,2,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,463,1,464,1,465,1,466,1,495,3,496,3,497,3,498,3,523,6,525,6,544,2,557,2,558,2,559,2,567,2,584,1,585,1,586,1,587,1,588,1,589,1,590,1,591,1,596,2,597,2,598,2,599,2,622,4],"generaliz":[1,1,2,1],"version":[1,1,2,1,7,4,8,4,9,3,10,3,11,3,12,3,14,2,15,2,16,2,17,2,18,3,19,3,22,4,23,4,24,4,25,4,28,3,29,3,30,2,31,2,64,4,65,4,66,1,67,3,74,4,75,4,76,3,78,3,81,3,82,4,85,5,86,3,87,3,88,2,89,1,90,3,92,3,95,1,101,4,102,4,103,4,104,4,105,1,106,1,107,2,113,1,114,3,120,4,121,4,129,4,139,4,140,4,151,1,162,1,179,1,184,1,194,1,201,3,202,3,203,3,204,2,205,3,206,3,207,2,208,2,210,5,211,5,213,1,214,8,217,2,218,2,225,3,226,3,227,6,230,6,231,6,234,1,235,4,236,4,237,2,239,2,240,2,242,3,244,4,245,4,246,3,247,3,254,4,255,4,257,1,258,2,259,1,260,4,261,4,263,2,264,2,265,2,266,2,267,2,269,1,270,2,271,3,273,1,274,3,277,1,278,3,284,3,285,2,286,3,287,1,288,2,289,3,290,3,291,3,293,3,294,2,295,4,296,4,297,4,298,4,299,4,300,4,301,4,302,2,303,6,304,6,305,4,306,2,307,3,308,3,309,4,310,3,311,1,316,3,320,2,321,3,323,2,324,2,326,2,327,4,328,1,330,3,333,2,334,1,336,3,343,2,356,2,357,2,358,2,359,2,381,4,382,4,386,4,387,4,388,3,389,3,394,1,395,1,398,4,399,4,400,3,401,3,415,4,416,4,417,4,418,4,423,5,424,2,425,2,428,1,431,3,432,2,439,1,440,1,442,1,443,1,444,1,445,1,446,1,447,1,451,1,452,2,453,1,467,1,468,1,469,1,470,1,471,2,472,2,473,1,474,1,475,1,476,1,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2,485,2,486,2,505,2,509,2,518,2,519,2,520,2,521,3,529,1,531,3,532,4,533,4,534,6,535,2,536,6,538,3,544,3,547,2,558,3,559,3,566,2,567,2,568,2,592,3,593,3,607,3,608,2,626,4,627,4],"allow":[1,1,2,1,4,1,6,1,14,1,15,1,16,1,17,1,20,1,37,1,46,1,47,1,48,1,56,2,59,4,60,1,66,3,68,1,69,1,99,3,159,4,160,3,162,3,166,1,190,1,192,1,194,3,195,1,209,1,215,1,216,1,234,3,249,4,250,1,252,1,253,1,256,4,257,3,281,2,353,2,366,1,367,3,390,2,393,4,395,3,397,1,414,1,569,1,619,1,623,1,624,3,625,1],"adjustment":[1,1,2,1],"any":[1,1,2,1,27,2,35,2,36,2,37,1,38,2,40,2,52,2,55,2,56,4,60,6,107,1,109,1,116,2,119,1,124,1,137,1,138,1,141,1,154,1,164,2,165,1,166,1,186,1,189,2,193,3,209,1,215,2,228,7,249,1,317,2,318,1,350,1,351,1,352,1,356,1,357,1,358,1,359,1,371,5,402,1,406,1,408,1,413,1,414,1,419,1,463,1,464,1,465,1,466,1,491,3,492,3,505,1,507,1,508,1,542,3,543,3,547,1,556,1,560,1,569,1,580,3,581,3,582,3,583,3,596,1,597,1,598,1,599,1,604,1,611,1,623,2],"see":[1,1,2,1,4,1,6,1,11,1,12,1,20,1,26,1,42,1,43,1,44,1,45,1,46,3,47,3,48,3,50,2,55,1,59,2,60,1,63,1,68,1,69,2,84,1,89,1,94,1,95,1,96,1,99,1,100,2,108,2,112,1,116,1,117,1,118,3,119,3,122,3,124,1,128,1,132,1,133,1,134,1,136,1,138,2,141,3,151,2,155,2,157,2,159,1,162,1,164,2,166,3,167,2,168,1,185,2,186,1,187,1,188,2,190,2,193,1,199,1,200,1,209,2,212,1,213,1,215,1,216,3,227,1,229,2,230,1,231,1,232,1,235,2,236,2,238,3,241,1,243,1,249,1,250,1,252,1,253,1,256,1,257,2,259,2,261,2,262,2,263,2,264,2,275,4,276,3,279,3,280,3,312,1,315,1,322,2,332,2,334,2,335,2,337,2,341,2,342,1,345,3,346,3,350,1,351,1,352,2,353,1,354,1,360,1,361,2,362,2,364,3,379,1,380,1,383,1,385,1,395,1,397,1,403,1,404,1,405,1,406,1,407,1,415,2,465,1,466,1,499,2,500,2,501,2,502,2,507,2,532,1,533,1,578,1,579,1,584,1,585,1,586,1,587,1,588,2,589,2,590,2,591,2,611,1,612,1,613,1,615,2,619,1,621,4,623,1,624,1,625,1,628,2,629,2,630,1,631,1,632,2,633,2],"section":[1,1,2,1,4,1,6,1,20,1,42,1,43,1,44,1,46,1,47,1,48,1,59,1,63,1,68,1,69,1,84,1,89,1,94,1,95,1,96,1,99,1,100,1,105,2,106,2,116,1,124,1,128,1,132,1,134,1,136,1,138,2,157,1,164,2,166,2,167,2,186,1,188,1,190,1,193,1,209,1,212,1,213,1,216,2,229,1,238,1,241,1,243,1,250,1,252,1,253,1,275,4,276,3,279,3,280,3,312,1,317,1,318,1,319,1,337,2,341,2,345,1,346,1,354,1,363,2,368,2,379,1,380,1,395,1,397,1,403,1,404,1,405,1,406,1,407,1,611,2,618,1,619,1,621,1,624,1,625,1,628,4,629,4,630,3,631,3,632,4,633,4,634,1],"below":[1,1,2,1,62,2,107,1,118,2,119,2,122,2,130,1,131,1,141,2,169,2,185,1,193,1,209,1,249,1,312,1,315,1,341,2,363,2,370,1,465,1,466,1,507,2,588,2,589,2,590,2,591,2],"imm8":[1,2,2,2,30,3,31,3,106,2,112,4,113,2,154,2,242,3,265,1,270,3,272,1,275,7,276,7,279,6,280,6,284,2,355,2,381,9,382,6,432,2,461,6,462,6,463,2,464,2,465,3,466,3,487,13,488,5,489,5,490,5,499,4,500,4,501,4,502,4,503,5,504,6,526,4,527,4,534,4,536,3,569,4,572,5,573,5,574,5,575,5,584,1,585,1,586,1,587,1,588,2,589,2,590,2,591,2,617,2],"select":[1,1,2,1,45,2,46,4,47,4,48,4,66,1,127,1,154,2,186,1,194,2,199,4,200,4,234,1,242,10,272,4,306,2,317,1,318,1,319,1,322,4,323,6,324,6,325,6,356,1,357,1,358,1,359,1,367,2,381,8,382,8,395,2,419,2,420,2,422,3,424,1,425,1,459,4,460,4,463,2,464,2,465,2,466,2,507,2,508,2,510,1,511,3,519,1,520,1,526,2,527,2,528,1,530,6,531,10,532,1,533,1,534,3,536,3,537,6,538,10,540,4,541,4,556,5,565,4,572,1,573,1,574,1,575,1,588,1,589,1,590,1,591,1,615,2,634,2],"exampl":[1,1,2,1,62,1,72,1,142,1,148,1,165,2,169,2,198,1,228,3,259,2,261,2,293,2,294,2,322,2,328,2,329,2,331,2,364,1,370,2,385,1,463,1,464,1,465,1,466,1,505,1,547,1,569,1,618,1],"08h":[1,1,2,1],"octal":[1,1,2,1],"0ah":[1,1,2,1,350,3],"0ch":[1,1,2,1],"12":[1,1,2,1,105,2,106,2,133,1,137,2,196,2,307,2,308,2,310,2,345,1,346,1,361,1,362,1,432,1,629,1],"mnemonic":[1,1,2,1,51,1,62,3,66,2,96,4,117,2,120,1,121,1,129,1,139,1,140,1,162,2,164,2,167,3,169,3,194,2,234,2,257,2,313,3,315,2,341,3,342,3,353,2,367,2,370,3,395,2,514,1,515,1,516,1,517,1,611,2,624,1],"interpret":[1,1,2,1,62,1,169,1,215,2,275,1,276,1],"all":[1,1,2,1,14,1,16,1,27,2,32,4,33,4,34,2,50,1,53,2,54,2,56,2,64,4,65,4,67,4,73,2,77,1,80,1,83,1,91,1,93,1,108,11,124,4,132,1,133,1,134,1,137,4,148,1,149,2,175,1,179,4,189,4,191,1,193,1,199,1,200,2,233,1,237,2,268,3,273,4,274,2,277,4,278,2,281,2,282,2,285,2,294,1,313,2,315,2,320,1,327,4,328,2,330,4,331,2,336,4,337,2,340,1,341,2,344,3,351,1,352,2,353,1,368,4,370,1,371,2,391,2,392,2,423,3,487,2,488,2,489,2,490,2,505,1,512,2,521,2,547,1,551,4,569,2,608,9,612,2,613,2,615,1,616,1,620,1,622,2,634,1],"assembler":[1,1,2,1,45,2,46,1,47,1,48,1,51,1,96,1,116,1,120,1,121,1,124,1,129,1,136,1,137,1,138,1,139,1,140,1,167,1,187,1,272,1,313,1,315,1,341,1,342,1],"mean":[1,1,2,1,51,2,73,2,96,2,142,1,215,1,216,1,600,1,601,1,602,1,603,1],"ascii":[1,1,2,1],"another":[1,1,2,1,3,2,62,1,98,2,135,2,139,1,147,1,228,1,242,1,294,2,353,1,393,1,612,2],"must":[1,1,2,1,14,1,15,1,16,1,17,1,18,1,19,1,26,2,30,1,31,1,38,2,41,2,66,2,70,1,71,1,73,2,89,1,95,1,108,1,113,1,132,4,134,2,143,1,144,1,146,2,147,2,153,1,154,1,162,3,165,1,166,1,167,1,179,1,184,1,194,2,209,3,210,4,211,4,212,2,217,3,218,2,225,1,226,1,227,4,230,4,231,3,234,2,239,2,240,2,257,3,265,1,270,2,272,1,284,4,285,4,286,2,287,3,288,2,289,2,290,2,291,2,293,2,306,1,307,1,308,1,310,1,312,1,321,2,323,2,326,1,332,1,333,1,334,1,336,1,349,2,354,2,367,2,394,2,395,2,404,1,405,3,406,1,411,1,413,1,424,2,425,2,427,1,428,1,429,1,430,1,433,1,434,1,435,1,436,1,437,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,447,1,448,1,449,1,450,1,451,1,456,1,457,1,458,1,459,1,460,1,461,1,467,2,468,2,473,2,474,2,475,2,476,2,488,1,489,1,490,1,495,1,496,1,497,1,498,1,504,1,506,1,512,1,513,1,518,3,519,2,520,2,521,1,526,1,527,1,532,1,533,1,534,1,536,1,539,1,540,1,541,1,544,1,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,572,1,573,1,574,1,575,1,576,1,577,1,580,1,581,1,596,2,597,2,598,1,599,1,609,1,610,1,612,1,613,1,615,1,616,2,618,1,624,1,634,2],"hand":[1,1,2,1],"cod":[1,2,2,2,26,2,44,1,50,3,62,4,63,3,66,1,107,1,114,1,118,3,119,1,121,1,122,2,138,2,140,1,141,4,159,1,162,1,167,3,168,2,169,6,187,2,194,1,195,3,197,1,234,1,256,1,257,1,268,2,313,1,367,1,370,4,395,1,404,4,405,6,406,3,456,4,610,1,611,2,619,1,620,4,622,2,624,1],"machin":[1,1,2,1,159,1,169,1,192,2,195,1,251,2,256,1,318,1,319,1,385,3,615,1],"d5":[1,1],"aam":[2,6],"multiplication":[2,4,105,2,106,2,129,1,146,1,158,2,243,2,248,5,272,2],"pair":[2,2,39,2,41,4,64,2,65,2,69,4,186,2,201,2,202,2,205,2,206,2,214,2,235,2,243,2,269,2,273,2,274,2,289,4,290,8,293,4,294,3,295,2,296,2,297,2,298,2,299,2,300,2,301,2,381,6,382,2,455,2,506,6,514,4,515,3,516,3,517,4,532,3,628,2,629,2,630,2,631,2,632,2,633,2],"mul":[2,2,243,1],"multiply":[2,2,105,2,106,2,129,6,150,2,244,2,245,2,246,2,247,2,293,2,294,2,305,2,306,2,307,2,308,2,309,2,310,2,311,2,419,3,420,2,461,3,462,3,467,7,468,7,469,7,470,7,471,4,472,4,473,7,474,7,475,7,476,7,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4,485,4,486,4,522,2,523,2,524,2,525,2,545,2,546,2,600,2,601,2,602,2,603,2],"word":[2,2,26,4,28,2,29,2,41,7,44,2,51,8,66,7,73,6,77,1,80,1,83,1,84,2,89,2,91,1,93,1,94,2,96,2,108,7,114,2,116,2,118,2,120,2,121,2,122,2,123,2,124,4,125,3,126,2,128,4,129,2,132,1,133,3,134,1,135,1,136,4,137,6,138,4,139,2,140,2,141,2,162,6,177,2,178,2,192,2,194,8,200,1,209,2,212,2,218,1,227,4,232,2,233,1,234,6,242,8,257,6,258,2,259,7,260,6,261,6,262,1,263,3,264,3,269,1,271,10,273,3,275,3,276,4,277,3,279,5,280,6,284,1,285,7,288,8,289,4,290,4,292,7,293,6,294,13,295,2,296,2,298,2,300,2,302,2,303,6,304,4,307,2,308,2,310,2,313,2,315,2,320,10,323,10,324,10,325,10,326,1,328,7,329,7,331,7,332,2,334,3,335,2,338,2,339,2,354,2,367,7,385,3,395,8,434,2,439,2,454,8,463,2,507,2,508,2,509,8,510,2,513,2,517,4,518,2,522,4,523,4,524,4,525,4,529,4,539,2,549,2,550,11,552,2,553,6,554,11,555,2,557,2,566,3,567,3,568,3,571,2,591,2],"2":[2,2,59,1,70,3,71,3,76,1,81,1,89,1,97,4,98,4,128,4,132,6,134,7,146,3,147,2,148,3,149,5,150,2,154,1,162,1,166,1,190,6,191,1,194,1,210,2,225,4,234,1,242,8,257,1,285,2,291,2,292,1,294,1,312,1,322,3,323,4,324,4,325,2,337,4,340,1,342,2,345,3,346,3,356,3,357,1,358,1,359,1,361,1,362,1,363,2,364,2,367,1,378,4,381,3,383,3,395,1,396,1,407,2,410,3,411,3,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,457,6,458,6,459,2,487,3,491,3,492,1,499,3,500,3,501,3,502,3,514,1,515,1,516,2,517,1,520,2,531,5,533,2,538,5,572,4,573,2,574,2,575,2,576,2,577,2,578,2,579,2,580,2,581,4,582,2,583,4,584,4,585,4,586,4,587,4,588,1,589,1,590,1,591,1,592,2,593,2,594,2,595,2,596,2,597,4,598,2,599,4,600,3,601,3,602,3,603,3,612,1,615,1,623,1,634,1],"her":[2,1,26,1,66,2,127,1,130,1,131,1,139,1,159,1,162,2,190,2,194,2,195,1,234,2,256,1,257,2,320,1,354,1,395,2,624,1],"d4":[2,1],"aas":[3,3],"subtraction":[3,5,98,4,139,2,140,2,289,2,290,4,366,5,397,1],"sub":[3,2,55,1,63,2,98,2,99,2,144,2,193,1,281,1,366,1,397,2],"subtract":[3,2,11,2,12,2,63,2,98,2,99,2,132,1,134,1,139,8,140,6,155,4,156,5,250,2,289,2,290,4,332,5,333,4,334,4,335,4,366,2,397,2,398,2,399,2,400,2,401,2,471,4,472,4,473,7,474,7,475,7,476,7,477,4,478,4,483,4,484,4,485,4,584,1,585,1,586,1,587,1],"one":[3,2,4,2,6,2,14,4,15,4,16,4,17,4,20,2,26,2,56,1,60,1,62,1,98,2,105,1,106,1,108,1,114,1,120,1,121,1,128,2,129,2,139,2,140,1,143,2,148,1,149,2,158,1,164,5,169,2,186,1,187,2,193,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,212,2,242,2,251,2,253,2,269,2,294,3,312,1,318,1,322,4,323,3,324,3,325,3,344,1,353,3,366,2,370,1,372,2,373,2,376,2,377,2,397,2,423,2,427,2,432,1,459,1,460,1,463,2,464,2,465,2,466,2,491,4,492,4,493,2,494,2,528,2,529,2,530,1,535,2,537,1,539,1,540,1,541,1,542,6,543,6,557,2,560,5,569,2,572,2,573,2,574,2,575,2,604,5,605,2,606,2,607,4,625,2],"decrement":[3,1,99,2,162,3,194,4,195,1,234,3,257,3,340,5,342,5,353,1,367,3,370,2,392,2,395,3],"occur":[3,1,55,1,56,1,59,1,60,1,108,1,130,2,131,2,132,3,134,2,139,1,146,1,147,1,186,1,189,1,193,1,197,2,209,1,315,1,317,2,318,1,319,1,342,1,349,3,379,1,380,1,461,3,462,3,505,2,547,2,616,3],"left":[3,1,86,2,87,2,124,2,177,2,196,1,219,1,222,1,270,1,291,2,292,1,327,2,328,5,344,3,364,5,365,4,379,1,380,1,491,1,492,1,542,2,543,2,558,2,561,2,562,2,566,4],"top":[3,1,77,1,80,1,83,1,91,1,93,1,118,1,119,1,120,1,121,1,122,1,124,2,125,1,127,1,129,1,134,2,135,2,139,1,140,1,141,1,142,2,145,2,200,1,233,1,312,2,315,4,340,2,354,3],"four":[3,1,7,2,8,2,14,4,15,4,16,4,17,4,22,2,23,2,24,2,25,2,50,1,64,1,65,1,74,4,75,4,78,4,81,4,82,4,90,4,92,4,102,4,106,1,166,1,168,1,254,2,255,2,265,3,292,1,305,1,345,2,361,2,372,2,373,2,374,2,375,4,376,2,377,2,386,2,387,2,398,2,419,3,420,3,467,12,468,12,471,12,472,4,473,12,474,12,477,12,478,4,479,16,480,16,483,16,484,16,507,3,508,3,576,2,607,2,626,2,627,2],"adc":[4,4,193,1],"first":[4,2,5,2,6,2,7,6,8,6,9,6,10,6,11,9,12,9,13,2,14,3,15,3,16,3,17,3,18,1,20,4,21,3,22,6,23,6,24,6,25,6,26,2,27,4,28,11,29,11,30,4,31,4,36,1,39,2,41,4,42,2,43,2,45,2,46,2,47,2,48,2,49,4,50,2,63,6,64,9,65,9,66,3,67,8,68,2,70,2,71,2,73,2,74,2,76,2,77,2,78,2,79,2,80,2,82,2,83,2,84,2,85,2,86,3,87,4,88,2,89,2,90,2,91,2,93,2,94,2,95,2,101,8,102,8,103,9,104,7,105,3,106,3,112,3,117,2,125,2,129,1,135,1,143,2,144,2,148,1,149,2,150,2,151,1,152,5,156,5,159,2,161,2,162,2,164,3,173,2,179,4,180,2,183,2,184,2,186,2,187,2,196,3,197,1,198,2,199,2,200,2,201,5,202,5,203,6,204,4,205,5,206,5,207,5,208,4,209,2,210,3,211,3,212,2,213,2,214,3,215,1,216,2,217,1,218,1,219,4,220,2,221,2,222,4,223,2,224,2,225,2,226,2,227,2,228,2,229,2,230,2,231,2,232,2,233,2,234,2,235,2,237,4,239,2,240,2,242,14,243,2,244,6,245,6,246,6,247,7,248,5,249,1,253,4,254,6,255,6,256,2,257,2,258,2,259,5,260,7,261,7,262,6,263,6,264,6,265,5,266,7,267,7,269,6,270,4,271,5,272,3,273,3,274,7,275,2,276,1,277,3,278,9,279,1,282,6,283,6,285,2,286,4,287,5,288,2,289,4,290,4,291,2,292,2,293,5,294,4,295,5,296,5,297,6,298,5,299,6,300,5,301,6,302,2,305,11,306,3,307,4,308,4,309,6,310,4,311,2,314,2,316,6,320,2,321,5,322,4,325,2,326,4,327,2,328,3,329,3,330,2,331,2,332,2,333,3,334,2,335,2,336,7,338,2,339,2,341,2,343,4,344,3,356,3,357,3,358,3,359,3,364,4,365,5,366,2,375,2,378,3,379,1,380,1,381,6,382,8,386,3,387,1,388,4,389,4,397,2,398,6,399,6,400,5,401,5,407,2,409,2,410,2,411,2,415,6,416,6,417,6,418,6,419,1,420,1,421,6,422,5,423,3,424,2,425,2,428,2,429,2,430,2,431,2,436,2,437,2,438,2,439,2,440,2,441,2,442,2,446,2,447,2,448,2,449,2,450,2,451,2,452,2,453,4,454,1,457,2,458,2,459,2,460,2,461,3,462,3,463,14,464,14,465,17,466,17,467,9,468,9,469,11,470,11,471,10,472,10,473,9,474,9,475,9,476,9,477,10,478,10,479,10,480,10,481,9,482,9,483,10,484,10,485,9,486,9,491,1,492,1,495,2,496,2,497,4,498,4,499,2,500,2,501,4,502,4,503,8,504,8,505,3,506,2,509,4,510,5,511,5,512,2,513,2,514,4,515,4,516,4,517,4,518,3,519,2,520,2,522,2,523,2,524,2,525,2,526,7,527,7,528,5,529,7,530,7,531,10,532,2,533,2,534,6,535,6,536,6,537,7,538,11,540,2,541,2,544,2,545,5,546,5,547,3,549,1,550,1,552,1,553,1,554,1,555,1,556,5,558,3,559,3,565,9,566,5,567,5,568,5,569,5,570,8,571,8,572,4,573,4,574,5,575,5,577,2,578,4,579,4,580,2,581,2,582,5,583,5,584,2,585,2,586,4,587,4,588,1,589,1,590,5,591,5,592,2,593,2,594,3,595,3,596,2,597,2,598,5,599,5,600,2,601,2,602,2,603,2,607,7,608,6,619,2,621,2,625,2,626,6,627,6],"second":[4,2,5,2,6,2,7,6,8,6,9,3,10,3,11,8,12,8,13,2,14,2,15,2,16,2,17,2,20,4,21,3,22,6,23,6,24,6,25,6,26,2,27,10,28,11,29,11,30,3,31,3,35,4,36,4,38,4,39,2,41,4,42,2,43,2,45,2,46,2,47,2,48,2,49,6,63,4,64,10,65,10,66,3,67,8,68,2,70,2,71,2,73,2,74,2,76,2,77,2,78,2,79,2,80,2,82,2,83,2,84,2,85,3,86,2,87,1,88,1,89,2,90,2,91,2,93,2,94,2,95,2,101,10,102,9,103,4,104,4,105,3,106,3,112,2,113,2,117,2,143,2,148,1,149,2,150,2,151,1,152,4,156,4,159,2,162,2,173,2,177,2,178,2,179,4,180,2,183,3,184,2,186,2,187,2,196,2,198,2,199,2,200,2,201,9,202,9,203,9,204,6,205,9,206,9,207,7,208,6,209,2,210,3,211,3,212,2,213,2,214,3,216,2,217,1,218,1,219,4,220,1,221,1,222,4,223,1,224,1,225,2,226,2,227,2,228,2,229,2,230,2,231,2,232,2,233,2,234,2,235,2,236,2,237,4,239,2,240,2,242,11,243,2,244,7,245,7,246,4,247,4,248,5,253,4,254,6,255,6,256,2,257,2,258,2,259,5,260,6,261,6,262,6,263,6,264,6,265,5,266,6,267,6,269,5,270,3,271,5,272,3,273,3,274,7,275,2,276,2,277,3,278,9,279,1,280,1,282,6,283,4,285,2,286,3,287,2,288,2,289,3,290,3,291,2,292,2,293,5,294,4,295,5,296,5,297,6,298,5,299,6,300,5,301,6,302,2,303,3,304,3,305,6,306,4,307,4,308,4,309,6,310,4,311,2,314,2,316,6,320,2,321,4,322,2,325,2,326,4,327,2,328,2,329,3,330,2,331,2,332,2,333,3,334,2,335,2,336,10,338,2,339,2,343,4,344,2,345,2,346,2,355,2,356,4,357,4,358,2,359,2,361,2,362,2,364,2,365,4,366,2,375,2,378,3,379,1,380,1,381,6,382,7,386,4,387,4,388,4,389,4,397,2,398,6,399,6,400,3,401,3,407,2,409,2,410,2,411,2,415,6,416,6,417,6,418,6,419,1,420,1,421,6,422,7,423,3,424,2,425,2,428,2,429,2,430,2,431,2,436,2,437,2,438,2,439,2,440,2,441,2,442,2,446,2,447,2,448,2,449,2,450,2,451,2,452,3,453,3,454,1,457,2,458,2,459,2,460,2,461,3,462,3,463,5,464,5,465,6,466,6,467,6,468,6,469,6,470,6,471,6,472,6,473,6,474,6,475,6,476,6,477,6,478,6,479,6,480,6,481,5,482,5,483,6,484,6,485,5,486,5,491,2,492,2,495,2,496,2,499,2,500,2,501,2,502,2,503,9,504,12,505,4,509,4,510,5,511,7,512,2,513,2,514,4,515,4,516,4,517,4,518,3,519,2,520,2,521,2,522,2,523,2,524,2,525,2,526,7,527,7,528,6,529,7,530,7,531,9,532,3,533,3,534,6,535,6,536,6,537,8,538,8,540,2,541,2,544,2,545,5,546,5,547,4,549,2,550,2,552,2,553,2,554,2,556,6,558,1,559,1,565,7,566,4,567,6,568,4,569,3,570,8,571,8,572,4,573,4,574,4,575,4,576,2,577,2,578,4,579,4,580,2,581,2,582,5,583,5,584,2,585,2,586,4,587,4,588,1,589,1,590,4,591,4,592,2,593,2,594,2,595,2,596,2,597,2,598,5,599,5,600,2,601,2,602,2,603,2,607,7,608,5,619,2,621,2,625,2,626,6,627,6],"can":[4,5,5,5,6,5,7,3,8,3,9,1,10,1,11,2,12,2,13,2,18,2,19,1,20,5,22,2,23,2,24,2,25,2,26,4,28,2,29,2,35,2,36,2,42,2,43,2,45,4,46,5,47,5,48,5,50,4,55,2,56,5,59,2,60,4,62,2,64,4,65,4,66,1,67,3,68,1,69,1,70,1,71,1,72,2,73,2,74,1,75,1,77,1,79,1,80,1,83,1,84,2,85,1,86,2,87,3,88,1,89,2,91,2,93,2,94,2,95,2,96,3,99,3,100,2,101,4,102,4,103,2,104,2,105,1,106,1,107,2,108,1,109,2,112,1,114,5,116,1,117,1,118,2,120,4,121,4,123,2,124,1,125,2,127,3,128,2,129,4,132,3,134,2,135,3,136,1,138,4,139,4,140,4,142,2,147,3,151,1,154,5,157,2,159,4,160,3,161,2,162,2,164,1,165,2,168,4,169,1,173,3,183,3,186,1,189,3,191,1,192,4,193,1,194,1,195,2,196,3,197,1,199,1,201,3,202,3,203,3,204,2,205,3,206,3,207,2,208,2,209,8,210,3,211,3,212,10,213,5,216,1,217,1,218,1,225,1,226,1,227,1,228,2,229,1,230,1,231,1,232,1,234,1,237,4,239,2,240,2,244,4,245,4,246,2,247,2,248,2,249,2,250,1,252,3,253,5,254,2,255,2,256,4,257,2,260,1,261,1,265,3,266,4,267,4,268,2,269,3,271,2,272,1,273,3,274,3,277,3,278,3,284,2,285,4,286,2,287,4,289,2,290,2,291,2,292,3,293,3,295,3,296,3,298,3,299,1,300,3,301,1,302,1,305,4,306,1,307,1,308,1,310,1,311,2,312,2,315,2,316,3,317,2,318,1,319,1,321,1,322,2,323,2,324,2,325,1,326,1,328,2,329,1,331,1,332,1,333,2,334,1,335,1,336,2,342,2,343,1,344,4,345,2,346,2,349,2,350,3,351,3,352,2,353,8,354,3,356,1,357,1,360,2,361,2,362,2,364,3,366,5,367,2,370,1,371,1,378,1,379,2,380,2,381,4,382,4,383,1,384,4,385,3,386,1,387,1,388,2,389,2,393,1,395,1,396,3,397,5,398,1,399,1,400,1,401,1,402,2,404,1,405,1,406,1,410,1,411,1,413,3,414,1,415,3,416,2,417,3,418,3,421,2,422,1,424,2,425,2,438,2,439,2,446,2,447,2,452,1,453,3,459,1,460,1,463,2,464,2,465,3,466,3,467,2,468,2,469,2,470,2,473,2,474,2,475,2,476,2,491,1,492,1,495,1,496,1,497,1,498,1,499,1,500,1,503,3,504,4,509,1,510,1,511,1,514,2,515,2,516,2,517,2,519,2,520,2,528,1,529,3,530,2,531,1,534,3,535,2,536,3,537,2,538,1,540,2,541,2,542,1,543,1,545,1,546,1,556,2,558,3,559,3,560,1,565,6,566,3,567,3,568,3,569,1,570,2,571,2,576,1,577,1,578,3,579,2,584,2,585,2,586,2,587,2,588,1,589,1,590,1,591,1,592,1,593,1,594,2,595,2,604,1,607,1,608,2,611,1,612,3,613,1,615,1,616,2,618,2,619,3,621,3,624,1,625,5,626,2,627,2],"memory":[4,6,5,2,6,6,7,5,8,5,9,1,10,1,11,3,12,3,13,2,14,1,15,1,16,1,17,1,18,2,19,1,20,6,22,5,23,5,24,5,25,5,26,3,28,3,29,3,30,1,31,1,35,3,36,3,37,5,38,5,39,2,40,4,41,2,42,2,43,2,45,5,46,3,47,3,48,3,50,3,55,6,56,10,60,11,62,1,64,5,65,5,66,1,67,3,69,5,70,1,71,1,73,2,74,5,75,5,76,4,77,1,78,4,79,1,80,1,81,4,82,5,83,1,84,2,85,2,86,3,87,4,88,2,89,2,90,4,91,2,92,4,93,2,94,2,95,2,99,2,100,2,101,5,102,5,103,2,104,2,105,1,106,1,107,3,114,5,118,2,120,5,121,5,125,1,129,5,133,3,135,6,136,2,137,4,138,2,139,5,140,5,143,8,144,4,148,3,149,4,150,2,151,1,157,2,160,2,162,3,163,1,165,10,166,2,168,2,173,4,183,4,184,9,185,3,186,4,187,2,189,13,190,2,191,2,192,2,193,8,194,3,196,2,197,2,199,13,200,13,201,3,202,3,203,4,204,1,205,3,206,3,207,3,208,1,209,5,210,11,211,11,212,8,213,9,214,3,215,15,216,7,217,4,218,2,219,2,220,6,221,6,222,2,223,6,224,6,227,15,228,20,229,13,230,15,231,15,232,13,234,2,235,2,236,2,237,9,238,2,239,4,240,4,241,2,242,2,243,2,244,5,245,5,246,2,247,2,250,2,251,1,252,2,253,6,254,5,255,5,257,3,258,5,259,4,260,5,261,4,263,2,264,2,265,2,266,4,267,4,268,4,269,2,270,1,271,3,272,2,273,2,274,5,277,2,278,5,281,1,284,2,285,2,286,5,287,4,289,5,290,5,291,2,292,2,293,5,294,2,295,4,296,4,297,5,298,4,299,5,300,4,301,5,305,11,306,3,307,3,308,3,309,5,310,3,311,3,312,3,316,3,317,7,318,5,319,4,321,2,322,2,323,2,324,2,325,1,326,2,327,1,328,3,329,2,331,1,333,2,334,1,336,2,340,2,343,3,344,2,345,2,346,2,356,2,357,2,361,2,362,2,364,1,366,6,367,9,368,5,370,2,371,7,379,1,380,1,381,5,382,5,383,3,384,8,385,4,386,5,387,5,388,2,389,2,394,2,395,3,396,5,397,6,398,5,399,5,400,1,401,1,402,3,410,1,411,1,412,1,413,3,415,6,416,6,417,6,418,6,419,5,420,5,421,4,422,2,423,6,424,4,425,4,426,1,428,1,429,2,430,1,431,3,432,2,433,1,434,2,435,1,436,1,437,1,438,2,439,2,440,1,441,2,442,1,443,1,444,2,445,1,446,2,447,2,448,2,449,2,450,2,451,1,452,1,453,3,454,1,456,2,457,2,458,2,459,1,460,1,461,3,462,3,463,2,464,2,465,2,466,2,467,4,468,4,469,2,470,2,471,3,472,3,473,4,474,4,475,2,476,2,477,3,478,3,479,3,480,3,483,3,484,3,488,2,491,8,492,8,493,2,494,2,495,2,496,2,497,1,498,1,499,2,500,2,503,3,504,4,505,5,507,5,508,5,509,2,510,4,511,2,512,4,514,1,515,2,516,2,517,1,518,4,519,4,520,4,521,6,522,1,523,1,524,1,525,1,526,2,527,2,528,1,529,4,530,1,531,3,532,2,533,2,534,5,535,3,536,5,537,1,538,3,539,5,540,2,541,2,542,2,543,2,544,6,545,2,546,2,547,5,549,1,550,1,552,2,553,1,554,1,555,1,556,2,557,4,558,8,559,8,560,2,561,1,562,1,563,1,564,1,565,2,566,4,567,4,568,4,569,2,570,3,571,3,576,2,577,2,578,2,579,2,580,2,581,2,582,1,583,1,588,2,589,2,590,1,591,1,592,6,593,6,594,2,595,2,596,2,597,2,598,1,599,1,604,2,605,2,606,2,607,2,608,2,612,3,613,2,616,1,618,4,619,2,620,1,621,4,622,2,624,4,625,6,626,4,627,4,628,3,629,3,630,3,631,3,632,3,633,3],"location":[4,4,5,2,6,4,7,5,8,5,9,1,10,1,11,3,12,3,13,2,18,2,19,1,20,6,22,5,23,5,24,5,25,5,26,2,28,3,29,3,30,1,31,1,41,2,42,2,43,2,45,2,46,2,47,2,48,2,50,3,55,2,56,2,60,2,64,5,65,5,66,3,67,3,69,4,70,1,71,1,73,2,74,5,75,5,76,4,77,1,78,4,79,1,80,1,81,4,82,5,83,1,84,2,85,2,86,3,87,4,88,2,89,2,90,4,91,2,92,4,93,2,94,2,95,2,99,2,100,2,101,5,102,5,103,2,104,2,105,1,106,1,114,5,118,2,120,5,121,5,129,5,135,3,137,2,138,4,139,5,140,5,144,2,151,1,157,2,160,2,162,5,168,2,173,4,183,2,184,2,185,2,190,2,191,2,192,2,193,1,194,6,196,2,197,2,199,8,200,8,201,3,202,3,203,2,204,1,205,3,206,3,207,1,208,1,209,4,210,8,211,8,212,6,213,9,214,3,215,2,216,2,217,3,218,2,227,3,228,1,229,3,230,3,231,3,232,3,234,5,235,2,236,2,237,8,238,2,239,3,240,3,241,2,242,2,243,4,244,5,245,5,246,2,247,2,250,2,252,4,253,6,254,5,255,5,257,5,258,5,259,4,260,5,261,4,263,2,264,2,265,1,266,4,267,4,269,2,270,1,271,3,272,1,273,2,274,5,277,2,278,5,282,2,284,2,285,6,286,3,287,2,289,3,290,3,291,8,292,9,293,3,294,2,295,4,296,4,297,5,298,4,299,5,300,4,301,5,305,5,306,2,307,3,308,3,309,5,310,3,311,1,312,4,316,3,317,3,318,3,319,3,322,8,323,7,324,7,325,6,326,2,327,1,328,2,329,1,331,1,333,2,334,1,336,2,340,1,343,3,344,4,345,2,346,2,356,2,357,2,361,2,362,2,364,3,365,2,366,4,367,3,379,1,380,1,381,5,382,5,383,3,384,4,385,3,386,5,387,5,388,2,389,2,394,2,395,6,396,3,397,4,398,5,399,5,400,1,401,1,411,1,415,5,416,5,417,5,418,5,421,4,422,2,423,3,424,3,425,3,428,1,429,2,430,1,431,3,432,2,433,1,434,2,435,1,436,1,437,1,438,2,439,2,440,1,441,2,442,1,443,1,444,2,445,1,446,2,447,2,448,2,449,2,450,2,451,1,452,1,453,3,454,1,456,2,457,2,458,2,459,1,460,1,461,3,462,3,463,2,464,2,465,2,466,2,467,4,468,4,469,2,470,2,471,3,472,3,473,4,474,4,475,2,476,2,477,3,478,3,479,3,480,3,483,3,484,3,488,2,493,3,494,3,495,2,496,2,497,1,498,1,499,2,500,2,503,3,504,4,505,2,509,2,510,2,511,2,512,4,514,1,515,2,516,2,517,1,518,2,519,3,520,3,521,6,526,2,527,2,528,4,529,6,530,2,531,3,532,2,533,2,534,5,535,5,536,5,537,2,538,3,539,1,540,2,541,2,542,2,543,2,544,6,545,2,546,2,547,2,549,1,550,1,552,2,553,1,554,1,555,1,556,3,558,8,559,8,560,2,565,1,566,3,567,3,568,3,569,2,570,3,571,3,576,2,577,2,578,2,579,2,580,2,581,2,582,1,583,1,588,2,589,2,590,1,591,1,592,6,593,6,594,2,595,2,596,2,597,2,598,1,599,1,604,2,605,2,606,2,607,2,608,2,619,2,621,2,623,2,625,6,626,4,627,4],"immediat":[4,4,6,4,19,2,20,2,28,2,29,2,30,1,31,1,45,6,46,4,47,4,48,4,50,2,63,2,64,2,65,2,67,3,99,2,105,3,106,3,113,2,148,1,149,2,158,1,159,4,160,2,163,1,168,2,169,1,177,2,178,2,195,1,209,2,215,1,216,1,242,4,253,2,256,4,265,4,270,1,271,4,272,4,285,2,291,2,292,2,322,2,323,6,324,6,325,1,327,2,328,1,330,2,340,1,344,2,356,5,357,5,358,5,359,5,364,1,366,3,379,1,380,1,397,4,432,3,499,2,500,2,501,2,502,2,503,3,504,4,509,4,514,4,515,4,516,4,517,4,526,2,527,2,533,1,534,5,536,6,558,6,559,6,569,1,588,6,589,6,590,6,591,6,625,2],"however":[4,2,6,2,20,2,26,1,66,1,132,1,134,1,158,2,162,1,167,1,191,1,194,1,196,1,209,1,212,2,234,1,253,2,257,1,287,1,317,1,318,1,319,1,332,1,333,1,366,2,367,1,383,1,385,1,393,1,395,1,397,2,403,1,406,1,415,1,416,1,417,1,418,1,463,1,464,1,465,1,466,1,596,1,597,1,598,1,599,1,624,2,625,2],"cannot":[4,2,6,2,20,2,66,1,76,1,81,1,89,1,116,1,124,1,136,1,138,1,158,1,162,2,164,1,173,2,183,1,188,1,192,1,209,1,213,2,219,2,220,2,221,2,222,2,223,2,224,2,234,2,237,2,253,2,342,1,366,2,367,2,395,2,397,2,402,1,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,456,3,600,1,601,1,602,1,603,1,625,2],"used":[4,5,6,5,20,3,26,2,37,1,40,1,46,1,47,1,48,1,50,2,56,2,59,1,60,1,62,2,63,3,68,1,69,1,96,6,99,1,108,1,112,3,113,1,128,2,132,1,133,2,134,1,137,3,138,2,147,1,153,2,154,1,158,3,160,1,161,2,164,3,165,3,166,1,167,4,168,1,169,2,173,3,185,1,189,1,190,4,191,1,192,3,193,3,197,2,199,2,200,1,209,1,210,3,211,3,213,4,216,1,217,1,218,1,219,2,220,2,221,2,222,2,223,2,224,2,225,1,226,1,227,1,228,1,229,1,230,1,231,1,232,1,237,4,239,2,240,2,250,1,252,1,253,3,272,2,281,3,302,1,305,3,311,1,312,1,313,3,323,2,324,2,325,2,333,2,337,1,340,3,341,3,342,4,347,1,353,1,354,4,360,1,364,3,366,4,367,1,370,1,371,1,378,3,379,3,380,1,383,1,385,1,397,5,402,1,408,1,413,4,419,2,420,2,422,2,427,1,455,1,463,1,464,1,465,2,466,2,497,2,498,2,506,2,507,2,508,2,510,2,511,2,518,1,528,1,539,1,556,1,558,2,559,2,565,1,614,1,615,1,618,4,619,2,621,1,623,1,624,2,625,3,628,1,629,1,630,1,631,1,632,1,633,1],"stat":[4,2,5,4,13,2,14,2,15,2,16,2,17,2,55,2,60,2,62,3,99,2,105,1,106,1,108,1,124,2,133,6,137,1,138,1,143,14,144,3,153,2,160,2,169,5,191,2,195,1,197,2,200,1,249,4,268,1,312,1,317,1,318,2,340,1,341,1,353,3,360,9,366,2,374,6,375,6,378,6,396,2,408,9,412,1,413,3,414,11,605,1,606,1,620,1,622,2,623,3,628,7,629,7,630,6,631,6,632,7,633,7,634,3],"represent":[4,2,5,2,13,2,26,1,37,1,76,2,81,2,89,2,130,2,131,2,150,2,262,3,275,2,276,2,279,1,280,1,311,1,332,3,333,2,366,2,370,1,428,2,429,2,430,2,433,2,434,2,435,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,600,1,601,1,602,1,603,1],"previous":[4,2,5,2,13,2,73,1,351,1,352,3,366,2,368,2,403,1,421,1,505,1,547,1],"sign":[4,6,6,6,41,6,50,1,51,7,62,1,63,2,74,2,75,2,76,2,77,3,79,2,80,2,81,2,83,3,84,4,86,4,87,4,89,4,90,3,91,3,92,3,93,3,94,6,95,5,96,8,115,2,118,2,119,2,120,1,122,1,123,4,125,2,126,2,129,2,130,3,131,1,141,2,145,3,146,2,157,3,158,6,168,1,169,3,195,2,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,225,2,226,2,238,2,258,6,259,18,260,4,261,6,263,8,277,5,278,2,286,6,287,9,289,4,290,8,293,10,294,6,295,2,298,2,299,2,303,5,304,2,305,10,306,6,308,4,309,4,310,4,326,7,329,4,332,1,333,1,334,10,340,1,345,3,346,3,361,2,362,2,364,4,365,1,366,5,370,1,379,1,380,1,397,6,433,2,443,2,495,2,496,2,497,2,498,2,499,4,500,4,501,4,502,4,507,2,508,4,514,1,515,1,516,1,517,1,522,4,523,6,524,6,525,8,549,6,550,6,552,6,553,6,554,6,555,6,567,3,572,3,573,3,574,1,575,1,576,2,577,2,578,2,579,2,592,1,593,1,594,1,595,2,596,1,597,1,598,1,599,1,608,18],"extend":[4,2,6,2,63,2,113,1,115,2,120,1,121,1,122,2,123,2,127,4,128,4,129,1,135,1,139,1,140,1,145,1,158,2,173,2,177,2,178,2,180,2,213,2,225,2,238,2,241,2,276,1,280,1,284,2,303,3,304,3,340,3,366,1,384,1,396,1,397,2,513,2,521,2,623,2,634,2],"length":[4,2,6,2,14,4,15,4,16,4,17,4,27,6,63,2,113,2,158,4,275,6,276,6,366,1,397,2,424,1,425,1,518,1,519,1,520,1,569,2],"format":[4,2,6,2,39,2,44,2,76,2,81,2,89,2,108,2,114,4,115,2,118,2,119,2,120,5,121,5,122,3,123,2,125,6,126,1,127,6,128,4,129,5,135,6,139,5,140,5,141,2,143,7,145,1,158,1,212,1,225,2,226,2,366,1,397,2,428,2,429,2,430,2,432,1,433,2,434,2,435,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,463,2,464,2,465,2,466,2,584,2,585,2,586,2,587,2,628,2,629,2,630,2,631,2,632,2,633,2],"doe":[4,1,14,1,15,1,16,1,17,1,26,1,35,2,36,2,37,3,38,2,39,1,40,4,55,2,115,1,116,3,124,1,130,2,131,2,132,3,133,2,134,2,136,2,137,1,138,2,143,1,144,1,147,1,148,1,149,1,150,1,160,2,162,1,165,1,166,1,169,1,189,2,194,1,195,1,197,2,199,2,200,2,215,2,216,2,227,2,228,3,229,2,230,2,231,2,232,2,251,3,257,1,268,1,272,1,281,1,287,1,315,1,317,1,318,1,319,1,332,1,333,1,344,1,351,1,352,2,353,1,355,2,366,1,367,1,368,1,395,1,402,1,403,4,404,1,405,1,406,4,413,1,426,1,582,2,583,2,609,2,610,4,612,1,613,3,620,2,624,1],"distinguish":[4,1,366,1],"between":[4,1,171,2,172,2,173,2,175,2,176,2,181,2,182,2,189,1,192,1,210,3,211,3,213,8,217,1,218,1,237,4,239,1,240,1,242,5,253,2,345,1,346,1,366,1,370,2,371,1,379,1,380,1,381,2,382,2,406,1,408,2,409,2,414,2,422,3,510,3,511,3,514,2,515,1,516,1,517,2,610,1],"unsign":[4,2,5,4,6,2,13,4,42,2,43,2,62,1,100,3,158,2,161,4,164,2,169,1,242,2,243,2,248,2,258,2,260,8,261,6,264,8,265,1,269,4,287,1,288,4,293,2,296,2,297,2,300,2,301,2,307,4,311,3,320,6,332,1,333,1,335,10,344,2,364,1,366,2,370,1,379,1,380,1,397,2,429,2,430,2,434,2,435,2,438,2,439,4,441,2,442,2,444,2,445,2,446,4,447,4,448,2,449,2,450,2,451,2,452,4,453,4,454,2,514,1,515,1,516,1,517,1,522,2,523,2,545,8,546,8,549,6,550,6,552,6,553,6,554,6,555,6,566,1,567,1,568,1,584,1,585,1,586,1,587,1,624,2],"instead":[4,1,60,1,164,1,165,1,184,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,313,2,342,2,366,1,403,1,404,1,405,1,406,1,422,1,459,1,460,1,510,1,511,1,539,1,540,1,541,1,621,1],"processor":[4,1,44,4,45,2,50,2,55,5,56,2,57,3,59,1,60,2,66,1,68,4,69,4,70,1,72,3,87,1,88,1,112,2,116,4,117,5,118,1,119,1,120,1,121,1,122,1,124,4,125,1,129,1,133,1,135,1,136,4,137,3,138,5,139,1,140,1,141,1,144,4,153,7,154,4,159,1,162,1,165,4,166,2,167,2,168,1,183,1,187,2,189,3,190,1,191,2,192,4,193,5,196,1,197,2,198,1,199,2,200,2,215,2,216,1,227,2,228,8,229,2,230,2,231,2,232,2,246,1,247,1,249,8,251,1,256,1,257,1,268,18,317,4,318,4,319,4,337,2,340,1,341,1,349,1,350,7,351,6,352,6,354,1,356,1,357,1,358,1,359,1,360,7,366,1,370,1,371,6,383,4,384,2,385,3,388,1,389,1,393,2,395,2,403,1,404,2,405,1,408,3,409,2,412,1,414,4,588,1,589,1,590,1,591,1,611,3,612,5,613,5,615,6,616,1,617,2,619,3,620,7,621,2,622,8,623,5,624,1,628,3,629,3,630,2,631,2,632,3,633,3,634,5],"evaluat":[4,1,6,1,366,1,397,1,457,2,458,2,463,1,464,1,465,1,466,1,580,2,581,2,582,2,583,2,596,2,597,2,598,2,599,2],"both":[4,1,6,1,20,2,66,1,117,1,118,1,119,2,124,2,134,2,141,2,155,2,167,1,175,1,185,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,209,2,212,4,234,2,249,2,253,2,265,1,286,1,287,1,289,1,290,1,293,2,306,1,316,2,321,1,326,1,327,1,330,1,353,2,366,1,397,1,491,1,492,1,505,1,542,1,543,1,572,1,573,1,618,1,634,1],"data":[4,2,6,1,14,2,15,2,16,2,17,2,19,2,20,1,30,2,31,2,41,1,42,1,43,1,44,1,46,1,47,1,48,1,52,4,55,3,56,6,60,4,62,2,63,1,68,1,69,1,73,2,84,2,89,3,94,1,95,2,96,1,99,1,100,1,108,3,112,1,118,2,124,6,129,4,133,1,137,3,139,2,143,4,157,1,162,2,165,6,173,2,183,2,184,3,186,1,188,1,189,10,190,5,199,4,200,1,209,1,210,3,211,3,212,3,213,3,215,3,216,5,217,2,218,1,227,7,228,9,229,4,230,7,231,5,232,5,237,2,238,1,239,1,240,1,241,1,243,1,250,1,252,1,253,1,257,2,258,2,269,2,273,4,274,4,275,5,276,5,277,4,278,4,279,4,280,4,284,2,285,1,317,6,318,7,319,5,321,2,326,12,328,4,329,8,331,4,337,6,338,4,339,4,366,1,371,4,379,1,380,1,390,4,397,1,402,3,407,1,426,4,427,4,439,1,446,1,447,1,456,2,461,3,462,3,463,2,464,2,465,2,466,2,487,2,488,2,489,2,490,2,491,4,492,4,493,4,494,4,495,4,496,2,497,4,498,4,504,1,505,9,512,4,527,2,539,1,542,1,543,1,547,9,556,1,558,4,559,4,561,2,562,2,563,2,564,2,565,11,566,9,567,9,568,9,569,2,605,4,606,4,607,1,612,2,619,1,621,2,624,1,625,1],"typ":[4,1,50,2,55,3,56,2,60,2,64,2,65,2,66,1,67,2,162,1,166,7,167,1,168,1,183,1,189,2,194,1,199,2,200,2,215,6,216,5,227,3,228,12,229,3,230,3,231,3,232,3,234,1,257,1,317,1,354,2,364,1,366,1,367,1,371,1,395,1,413,1,419,1,420,1,463,2,464,2,465,2,466,2,507,1,508,1,514,3,515,3,516,3,517,3],"indicat":[4,2,6,2,55,1,56,2,57,1,60,2,62,2,66,1,69,1,72,2,100,1,154,1,157,1,162,1,167,1,169,2,189,1,194,1,195,1,199,2,200,2,215,1,216,1,234,1,249,1,257,1,281,1,287,1,332,1,333,1,347,3,353,2,366,2,367,1,370,2,371,1,395,1,397,2,456,1,506,2,572,1,573,1,574,1,575,1,612,2,614,3],"respectively":[4,1,6,1,66,1,96,2,159,2,162,2,167,1,186,2,194,4,234,4,243,1,256,2,257,2,259,1,260,2,261,2,263,2,320,2,334,2,353,2,363,2,364,1,366,1,395,2,397,1,624,2],"sf":[4,1,6,1,62,2,70,2,71,2,116,2,119,1,169,2,281,2,363,2,366,1,370,4,397,1,407,2,410,2,411,2],"usually":[4,1,41,1,354,2,366,1],"part":[4,1,107,2,180,2,183,1,186,1,187,2,196,1,209,1,216,2,312,1,344,1,366,1,491,3,492,3,542,2,543,2,572,1,573,1,574,1,575,1,584,1,585,1,586,1,587,1],"multibyt":[4,1,366,1],"multiword":[4,1,366,1],"lock":[4,1,6,1,20,1,46,1,47,1,48,1,56,1,60,1,68,3,69,3,99,1,107,1,160,1,193,15,250,1,252,1,253,1,317,1,366,1,397,1,618,5,619,1,621,10,625,1],"prefix":[4,3,5,2,6,3,11,1,12,1,13,2,20,3,30,1,31,1,42,1,43,2,44,2,46,3,47,3,48,3,51,1,63,2,66,1,68,3,69,2,77,1,79,1,80,1,83,1,84,1,86,1,87,1,89,1,91,1,93,1,94,1,95,1,96,1,99,4,100,2,112,1,151,1,152,1,155,1,156,1,157,2,160,4,162,5,184,1,186,2,193,6,194,3,195,2,199,2,200,2,212,2,213,2,215,6,216,6,225,1,226,1,229,2,233,1,234,2,238,2,241,2,243,2,250,3,252,3,253,3,257,5,265,2,266,1,267,1,269,1,270,1,273,1,277,1,285,1,286,1,287,1,289,1,290,1,291,1,293,1,294,1,302,1,306,1,307,1,308,1,310,1,311,1,313,1,316,1,321,1,323,1,324,1,325,1,326,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,337,1,342,1,343,1,344,1,345,1,346,1,347,2,348,2,353,16,361,1,362,1,366,1,367,3,379,2,380,2,384,1,395,2,397,3,402,1,407,2,614,2,618,11,619,3,621,6,624,2,625,3,628,1,629,1,630,1,631,1,632,1,633,1],"atomically":[4,1,6,1,20,1,46,1,47,1,48,1,68,1,69,1,99,1,160,1,250,1,252,1,253,1,366,1,397,1,619,1,622,2,625,1],"s":[4,1,6,1,14,2,15,2,16,2,17,2,20,1,26,3,36,2,37,1,38,2,42,1,43,1,44,1,46,1,47,1,48,1,50,2,52,1,55,2,59,2,62,1,63,2,68,2,69,1,72,1,99,1,100,1,105,3,106,3,108,2,112,1,115,1,116,2,117,4,118,1,122,1,123,1,124,2,126,1,127,1,128,2,132,2,133,1,134,2,135,1,136,2,137,3,138,3,141,1,145,3,153,1,157,1,159,3,160,1,162,1,163,2,164,2,165,2,166,3,167,2,168,1,173,2,175,1,185,3,186,1,187,1,188,4,189,2,190,2,193,2,199,1,200,1,209,1,212,1,213,1,215,1,216,3,227,1,228,2,229,2,230,1,231,1,232,2,238,3,241,1,243,1,249,1,250,3,251,1,252,1,253,1,256,3,257,2,262,2,263,2,264,2,268,2,287,1,291,2,313,1,332,3,333,1,334,2,335,2,337,2,341,1,342,2,345,3,346,3,350,1,351,3,352,4,354,1,360,3,361,2,362,2,364,4,368,2,370,1,371,2,379,1,380,1,383,1,385,1,390,1,394,1,395,2,397,1,403,1,406,1,408,2,412,1,413,2,414,1,415,2,456,2,491,1,492,1,521,2,542,2,543,2,551,4,611,3,612,5,613,4,615,3,618,1,619,1,621,4,623,1,624,1,628,4,629,4,630,3,631,3,632,4,633,4,634,1],"default":[4,1,5,1,6,1,13,1,20,1,37,1,40,1,42,1,43,1,44,1,46,1,47,1,48,1,51,1,63,1,68,1,69,1,99,1,100,1,112,1,113,1,124,2,133,1,157,1,160,1,173,2,185,1,186,1,187,2,188,1,199,2,200,2,212,1,213,1,216,2,225,1,226,1,229,1,238,1,241,1,243,1,250,1,252,1,253,1,284,2,285,2,302,1,342,1,354,1,367,2,379,2,380,2,395,2,397,1,413,1,619,1,621,1],"siz":[4,1,5,2,6,1,13,2,20,1,21,2,27,4,32,2,33,2,34,2,41,6,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,2,50,5,51,9,56,1,60,1,63,1,66,5,68,1,69,5,86,2,87,2,89,2,94,2,95,3,96,9,99,1,100,3,112,7,113,1,133,1,135,1,137,2,157,3,158,1,159,5,160,1,161,2,162,11,167,2,169,2,173,5,186,3,187,14,188,1,190,7,191,2,192,2,194,6,195,4,196,2,197,2,198,2,199,4,200,4,209,2,210,1,211,1,212,3,213,1,216,3,225,1,226,1,229,1,234,7,238,5,241,5,243,6,248,2,250,1,252,1,253,1,256,4,257,11,281,2,282,2,283,2,284,2,285,2,302,1,312,4,313,11,315,10,337,2,340,10,341,9,342,11,347,2,348,2,355,2,365,2,367,6,379,2,380,2,383,1,384,4,385,1,395,6,396,2,397,1,405,1,406,2,409,2,439,2,446,2,447,2,452,2,453,2,456,1,459,2,460,2,491,2,492,2,522,2,523,2,539,2,540,2,541,2,542,2,543,2,544,2,558,2,559,2,612,1,613,1,614,2,619,1,620,2,621,1,624,3],"32":[4,1,5,2,6,1,8,1,10,2,13,2,20,1,21,1,23,1,25,1,26,1,27,1,30,1,31,1,32,1,33,1,34,1,41,2,43,1,44,4,45,3,46,1,47,1,48,1,49,1,50,3,51,2,59,2,62,1,63,2,65,1,66,2,67,6,68,1,69,4,71,1,73,2,74,1,75,1,81,1,82,1,85,2,86,1,87,2,88,1,92,1,95,2,96,2,99,1,100,1,102,1,104,4,105,2,106,2,108,2,109,4,110,2,112,5,113,4,116,1,117,4,124,1,128,1,132,1,133,2,134,1,136,1,137,4,138,2,148,1,149,2,153,1,157,1,159,4,160,1,162,5,164,4,166,4,167,3,168,1,169,1,173,2,177,4,178,4,180,2,184,6,185,4,186,7,187,1,188,2,190,5,192,1,193,2,194,2,195,2,196,3,199,1,200,1,202,1,204,2,206,1,208,2,209,1,210,1,211,1,212,1,213,10,215,7,216,5,217,2,218,1,227,3,228,1,229,4,230,3,231,3,232,1,234,2,235,1,236,1,237,8,238,5,241,1,242,14,243,1,245,1,247,3,248,1,250,1,252,1,253,1,254,1,255,1,256,4,257,5,258,3,259,1,260,1,261,6,262,4,263,2,264,2,265,1,266,2,267,2,268,2,270,1,281,1,282,1,283,1,287,4,290,4,297,1,299,1,301,1,302,1,306,4,307,2,308,2,309,3,310,2,312,1,313,4,315,5,317,2,318,2,319,2,326,1,332,3,334,2,335,2,337,6,340,2,341,5,342,6,345,3,346,5,347,4,349,2,350,9,351,7,352,10,354,1,355,1,359,1,360,1,361,2,362,4,364,3,365,1,368,2,370,1,379,1,380,1,382,1,383,2,384,2,385,3,387,1,389,4,394,2,395,1,396,1,397,1,399,1,401,3,403,2,406,3,408,1,411,1,413,1,415,2,416,1,418,1,419,1,420,1,421,2,423,2,434,1,444,1,448,1,449,1,452,1,453,2,454,3,458,1,461,1,462,2,463,2,464,2,465,2,466,6,468,1,470,3,472,1,474,1,476,3,478,1,480,1,482,1,484,1,486,1,488,1,493,2,494,2,496,1,498,2,500,1,502,2,503,2,504,3,507,1,508,1,511,1,512,4,513,4,514,1,515,1,517,1,518,2,521,3,529,1,531,4,533,1,535,1,538,4,539,2,544,3,549,6,550,4,554,2,558,4,559,4,566,1,567,1,568,1,569,1,570,1,571,1,577,1,579,4,581,1,583,3,587,2,589,1,591,2,593,3,594,2,595,3,597,1,599,3,605,2,606,2,607,2,609,1,610,1,611,1,612,2,613,1,614,4,615,11,616,1,618,1,619,2,621,2,623,9,624,2,628,6,629,6,630,5,631,5,632,6,633,6,634,9],"using":[4,2,5,2,6,2,11,1,12,1,13,2,14,4,15,4,16,2,17,2,18,1,19,2,20,2,27,2,36,1,37,1,42,1,43,2,44,2,45,2,46,3,47,3,48,3,50,4,66,1,100,2,105,1,106,1,112,2,126,2,143,3,147,2,159,4,167,1,186,2,195,4,199,2,200,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,215,2,216,4,227,4,228,4,229,4,230,4,231,4,232,4,242,4,249,1,250,2,252,2,253,2,256,4,259,4,260,2,266,1,267,1,269,1,273,1,277,1,285,1,291,1,294,3,307,3,308,3,310,3,311,1,313,1,316,1,318,2,319,1,320,2,322,1,323,1,324,1,325,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,337,2,340,1,342,1,343,1,344,1,345,1,346,1,354,1,356,2,357,2,358,2,359,2,361,1,362,1,364,1,367,3,375,2,378,2,379,2,380,2,381,2,382,2,384,1,397,2,402,4,403,1,404,1,405,1,406,1,407,2,413,4,415,1,416,1,417,1,418,1,421,2,422,3,432,2,457,3,458,3,463,2,464,2,465,2,466,2,467,2,468,2,469,2,470,2,473,2,474,2,475,2,476,2,491,3,492,3,499,2,500,2,501,2,502,2,510,3,511,3,518,1,521,3,526,2,527,2,529,2,530,2,531,2,532,1,533,1,534,2,535,1,536,2,538,2,539,1,544,3,549,6,550,6,552,6,553,6,554,6,555,6,556,2,565,2,569,3,580,1,581,3,582,1,583,1,592,3,593,3,596,1,597,1,611,1,619,2,621,2,623,1,624,2,625,2],"rex":[4,4,5,4,6,4,11,2,12,2,13,4,20,4,42,2,43,4,44,4,46,4,47,4,48,4,51,1,63,2,66,1,68,2,69,1,77,1,79,1,80,1,83,1,84,3,86,1,87,1,89,1,91,1,93,1,94,3,95,1,96,1,99,3,100,3,113,1,143,6,151,1,152,1,155,1,156,1,157,3,160,3,184,1,186,4,194,1,195,2,198,1,212,2,213,3,216,6,225,1,226,1,229,2,233,1,238,2,241,2,243,2,250,4,252,4,253,4,265,1,266,2,267,2,269,2,273,2,277,2,284,1,285,2,286,1,287,1,289,1,290,1,291,3,293,1,294,2,302,1,306,1,307,2,308,2,310,2,311,2,316,2,321,1,322,1,323,2,324,2,325,2,326,1,328,2,329,2,330,2,331,2,333,2,334,2,335,2,337,2,343,2,344,5,345,2,346,2,347,2,348,2,361,2,362,2,364,2,379,4,380,4,384,2,397,4,407,4,614,2,619,4,621,4,625,4,628,1,629,1,630,1,631,1,632,1,633,1],"form":[4,2,5,2,6,2,11,1,12,1,13,2,14,1,15,1,16,1,17,1,20,2,36,1,37,2,38,1,40,3,42,1,43,2,44,2,46,2,47,2,48,2,66,8,113,1,138,1,148,2,149,2,150,2,158,6,162,8,163,2,164,1,176,2,181,2,182,2,186,2,189,1,193,1,194,8,195,2,219,2,222,2,234,8,250,2,251,1,252,2,253,2,257,8,266,1,267,1,269,1,271,2,272,1,273,1,277,1,285,1,291,1,294,1,307,1,308,1,310,1,311,1,316,1,321,2,323,1,324,1,325,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,343,1,344,1,345,1,346,1,353,2,361,1,362,1,367,8,371,1,379,2,380,2,383,1,384,1,395,8,397,2,407,2,487,2,488,2,489,2,490,2,491,2,492,2,505,4,506,2,509,2,521,2,545,2,546,2,547,4,558,4,559,4,569,2,619,2,621,2,624,8,625,2],"r":[4,1,5,1,6,1,11,1,12,1,13,1,20,1,43,1,44,1,46,1,47,1,48,1,50,3,63,1,68,1,77,1,79,1,80,1,83,1,91,1,93,1,99,1,100,1,151,1,152,1,155,1,156,1,157,1,160,1,184,1,186,1,189,1,194,2,212,1,213,1,216,2,225,1,226,1,229,1,233,1,238,1,241,1,243,1,250,1,252,1,253,1,266,1,267,1,269,1,273,1,277,1,285,1,291,1,294,1,302,1,307,1,308,1,310,1,311,1,316,1,322,1,323,1,324,1,325,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,343,1,344,1,345,1,346,1,347,2,361,1,362,1,371,1,379,1,380,1,384,1,397,1,407,1,463,1,464,1,465,1,466,1,614,2,619,1,621,1,625,1],"permit":[4,1,5,1,6,1,11,1,12,1,13,1,20,1,43,1,44,1,46,1,47,1,48,1,63,1,68,1,77,1,79,1,80,1,83,1,91,1,93,1,99,1,100,1,151,1,152,1,155,1,156,1,157,1,160,1,184,1,186,1,212,1,213,1,216,2,229,1,233,1,238,1,241,1,243,1,250,1,252,1,253,1,266,1,267,1,269,1,273,1,277,1,285,1,291,2,294,1,307,1,308,1,310,1,311,1,316,1,317,1,322,3,323,2,324,2,325,2,328,1,329,1,330,1,331,1,333,1,334,1,335,1,343,1,344,1,345,1,346,1,361,1,362,1,379,1,380,1,384,1,397,1,407,1,495,1,496,1,497,1,498,1,528,2,529,2,530,1,535,2,537,1,619,1,621,1,625,1],"access":[4,1,5,1,6,1,11,1,12,1,13,1,20,1,26,1,35,1,36,1,37,5,38,1,40,2,42,1,43,1,44,1,45,2,46,1,47,1,48,1,50,1,52,4,55,3,60,3,63,1,68,1,77,1,79,1,80,1,83,1,91,1,93,1,99,1,100,1,112,1,137,1,151,1,152,1,155,1,156,1,157,1,159,11,160,1,162,2,169,1,183,12,184,1,186,1,196,3,203,2,207,2,212,1,213,1,216,2,225,1,226,1,229,1,233,1,238,1,241,1,243,1,250,1,252,1,253,1,256,10,257,4,265,1,266,1,267,1,269,1,273,1,277,1,285,1,286,1,287,1,289,1,290,1,291,1,293,1,294,1,302,1,306,1,307,1,308,1,310,1,311,1,316,1,317,1,321,1,322,1,323,1,324,1,325,1,326,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,343,1,344,1,345,1,346,1,354,1,361,1,362,1,379,1,380,1,384,1,390,4,397,1,402,1,407,1,419,1,420,1,456,2,505,1,507,1,508,1,547,1,565,6,616,1,619,1,621,1,625,1],"additional":[4,1,5,1,6,1,11,1,12,1,13,1,20,1,42,1,43,1,44,1,46,1,47,1,48,1,50,1,63,1,68,1,77,1,79,1,80,1,83,1,91,1,93,1,99,1,100,1,107,1,112,2,120,1,121,1,129,1,139,1,140,1,151,1,152,1,155,1,156,1,157,1,160,1,183,1,184,1,186,2,212,1,213,1,216,2,225,1,226,1,229,1,233,1,238,1,241,1,243,1,250,1,252,1,253,1,265,1,266,1,267,1,268,1,269,1,273,1,277,1,285,1,286,1,287,1,289,1,290,1,291,1,294,1,302,1,307,1,308,1,310,1,311,1,316,1,317,1,318,1,319,1,323,1,324,1,325,1,326,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,343,1,344,1,345,1,346,1,361,1,362,1,379,1,380,1,384,1,395,1,397,1,403,1,406,1,407,1,413,1,612,1,619,1,621,1,625,1],"r8":[4,1,5,1,6,1,13,1,20,1,42,1,43,1,44,1,46,1,47,1,48,1,63,1,68,1,99,1,100,1,157,1,160,1,186,1,212,1,213,1,216,2,225,1,226,1,229,1,238,1,241,1,243,1,250,1,252,1,253,1,285,1,291,1,302,1,344,1,379,1,380,1,384,1,397,1,407,1,619,1,621,1,625,1],"r15":[4,1,6,1,20,1,42,1,43,1,44,1,46,1,47,1,48,1,63,1,68,1,99,1,100,1,157,1,160,1,186,1,212,1,213,1,216,2,225,1,226,1,229,1,238,1,241,1,243,1,250,1,252,1,253,1,302,1,344,1,379,1,380,1,384,1,397,1,407,1,619,1,621,1,625,1],"w":[4,1,5,1,6,1,13,1,20,1,30,1,31,1,42,1,43,1,44,1,46,1,47,1,48,1,51,1,63,1,66,1,68,1,69,1,76,2,81,2,84,7,86,1,87,1,89,3,94,7,95,1,96,1,99,1,100,2,113,1,143,6,157,2,160,1,173,1,186,1,194,1,195,2,198,1,212,1,213,2,216,4,229,1,238,1,241,1,243,1,250,1,252,1,253,1,258,3,270,1,284,1,291,1,337,2,344,3,347,2,348,2,364,2,379,1,380,1,397,1,407,1,428,2,429,2,430,2,433,2,434,2,435,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,512,1,567,1,571,1,608,3,614,2,619,1,621,1,625,1,628,1,629,1,630,1,631,1,632,1,633,1],"promot":[4,1,5,1,6,1,13,1,20,1,42,1,43,1,44,1,46,1,47,1,48,1,51,2,63,1,68,1,69,1,84,1,86,1,87,1,89,2,94,1,95,2,96,1,99,1,100,1,157,1,160,1,186,1,194,1,212,1,213,1,216,2,229,1,238,1,241,1,243,1,250,1,252,1,253,1,344,1,379,1,380,1,397,1,407,1,439,1,446,1,447,1,452,1,453,1,619,1,621,1,625,1],"summary":[4,1,6,1,20,1,42,1,43,1,44,1,46,1,47,1,48,1,63,1,68,1,69,1,84,1,89,1,94,1,95,1,96,1,99,1,100,1,116,2,157,1,186,1,188,1,190,1,212,1,213,1,216,2,229,1,238,1,241,1,243,1,250,1,252,1,253,1,379,1,380,1,397,1,407,1,619,1,621,1,624,1,625,1],"chart":[4,1,6,1,20,1,42,1,43,1,44,1,46,1,47,1,48,1,63,1,68,1,69,1,84,1,89,1,94,1,95,1,96,1,99,1,100,1,157,1,186,1,188,1,190,1,212,1,213,1,216,2,229,1,238,1,241,1,243,1,250,1,252,1,253,1,379,1,380,1,397,1,407,1,619,1,621,1,624,1,625,1],"begin":[4,1,5,1,6,1,13,1,20,1,27,2,41,1,42,1,43,1,44,1,46,1,47,1,48,1,63,1,68,1,69,1,84,1,89,1,94,1,95,1,96,1,99,1,100,1,157,1,186,1,188,1,189,2,190,1,192,1,195,1,212,1,213,1,216,2,229,1,238,1,241,1,243,1,250,1,252,1,253,1,351,1,352,1,354,1,379,1,380,1,385,1,393,1,397,1,407,1,619,1,621,1,624,1,625,1],"encod":[4,1,6,1,7,3,8,3,9,2,10,2,11,2,12,2,14,3,15,3,16,3,17,3,18,2,19,2,20,1,22,3,23,3,24,3,25,3,28,2,29,2,30,2,31,2,40,1,42,1,43,1,44,1,46,1,47,1,48,1,63,1,64,3,65,3,67,2,68,1,69,2,70,2,74,4,75,3,76,3,78,3,81,3,82,3,84,1,85,2,86,2,87,4,88,3,89,1,90,3,92,3,94,1,95,1,96,1,99,1,100,1,101,3,102,3,103,4,104,4,113,1,115,1,148,2,149,2,150,2,157,1,164,2,169,1,179,1,184,1,186,1,188,2,189,1,190,1,195,1,198,1,201,2,202,2,203,1,205,2,206,2,210,3,211,4,212,1,213,1,214,2,216,2,217,2,218,2,220,1,221,1,223,1,224,1,225,2,226,2,227,2,229,1,230,4,231,4,235,3,236,3,237,3,238,1,239,2,240,2,241,1,242,2,243,1,244,3,245,3,246,4,247,5,250,1,251,1,252,1,253,1,254,3,255,3,258,4,259,3,260,3,261,3,263,2,264,2,265,2,266,2,267,2,269,1,270,2,271,2,272,2,273,1,274,3,275,3,276,3,277,1,278,3,279,3,280,3,281,1,284,3,285,2,286,1,288,1,289,1,290,1,291,3,293,3,294,1,295,2,296,2,297,3,298,2,299,3,300,2,301,3,303,5,304,5,305,3,306,1,307,2,308,2,309,3,310,2,311,1,316,2,318,1,319,1,321,2,322,7,323,4,324,4,325,2,326,1,327,3,328,1,329,1,330,3,331,1,333,1,334,1,335,1,336,2,337,2,342,1,343,2,350,1,356,2,357,2,358,2,359,2,364,1,371,1,379,1,380,1,381,3,382,3,386,3,387,3,388,4,389,4,394,1,397,1,398,3,399,3,400,2,401,2,407,1,409,2,415,3,416,3,417,3,418,3,419,2,420,2,423,3,427,2,428,1,431,1,432,1,440,1,442,1,443,1,444,1,445,1,448,1,451,1,452,1,463,4,464,4,465,4,466,4,467,3,468,3,469,4,470,4,471,5,472,5,473,1,474,1,475,4,476,4,477,5,478,5,479,5,480,5,481,5,482,5,483,5,484,5,485,5,486,5,507,2,508,2,509,2,512,4,521,3,529,3,532,1,534,1,535,3,536,1,544,3,558,3,559,3,566,3,567,3,568,3,571,2,572,1,573,1,574,1,575,1,584,2,585,2,586,2,587,2,588,1,589,1,590,1,591,1,592,3,593,3,608,1,618,1,619,1,621,1,624,1,625,1,626,3,627,3],"limit":[4,1,6,1,20,1,41,3,42,1,43,1,44,1,46,1,47,1,48,1,63,1,68,1,69,1,84,3,89,1,94,3,95,1,96,1,99,1,100,1,157,1,186,1,188,1,190,9,191,2,196,14,197,2,212,1,213,1,216,2,229,1,238,1,241,1,243,1,250,1,252,1,253,1,364,1,379,1,380,1,383,2,397,1,407,1,619,1,621,1,624,1,625,1],"adcx":[5,3],"general":[5,4,13,4,50,3,62,2,84,2,86,3,87,4,89,2,94,2,95,2,100,2,109,1,113,1,144,1,154,1,157,2,164,1,168,2,173,5,183,2,186,3,187,2,191,3,192,2,196,2,197,2,209,5,210,2,211,2,212,4,213,8,215,2,216,2,217,1,225,4,226,4,227,2,229,2,230,2,231,2,243,2,250,2,265,1,281,1,285,3,286,2,287,2,289,2,290,2,291,5,292,4,293,2,302,1,306,1,312,2,313,2,317,1,321,2,341,2,342,1,347,3,349,2,350,2,384,2,385,2,396,2,402,2,405,1,438,2,439,2,446,2,447,2,452,1,453,3,491,2,492,2,614,3,615,3,616,2,621,2,622,1,623,1,628,1,629,1,630,1,631,1,632,1,633,1,634,3],"purpos":[5,4,13,4,50,3,62,2,84,2,86,3,87,4,89,2,94,2,95,2,100,2,109,2,113,1,157,2,168,2,173,5,183,2,186,2,187,2,191,2,192,2,196,2,197,2,209,4,212,4,213,8,215,2,216,2,225,4,226,4,229,2,243,2,250,2,285,3,291,5,292,4,302,1,312,2,313,2,341,2,347,3,350,2,384,2,385,2,396,2,402,2,405,1,412,2,438,2,439,2,446,2,447,2,452,1,453,3,491,2,492,2,614,3,621,2],"wherea":[5,2,13,2],"generat":[5,2,13,2,19,2,37,1,40,1,41,2,55,1,70,1,71,1,105,1,106,1,116,1,118,1,119,1,120,1,124,1,125,1,128,2,135,2,136,1,137,1,138,1,141,1,143,2,144,1,147,2,164,8,167,2,185,2,193,2,199,2,200,1,210,2,211,2,217,1,227,2,228,1,230,2,231,2,249,1,265,1,275,2,276,2,279,2,280,2,286,2,287,2,289,2,290,2,293,2,306,1,321,2,341,2,383,1,411,1,412,4,426,1,615,2,634,2],"context":[5,1,13,1,59,1,133,1,166,3,251,2,360,1],"multi":[5,1,13,1,251,4,379,2,380,2],"precision":[5,1,7,4,8,4,9,4,10,4,11,8,12,8,13,1,22,2,23,2,24,2,25,2,28,6,29,6,30,2,31,2,64,2,65,2,67,2,70,2,71,2,74,2,75,2,76,2,77,2,78,4,79,2,80,2,81,2,82,4,83,3,84,4,85,5,86,2,87,2,88,6,89,4,90,2,91,2,92,2,93,4,94,4,95,4,101,2,102,4,103,6,104,6,105,5,106,5,113,3,114,4,115,2,117,1,120,5,121,5,122,2,123,2,124,2,127,12,128,4,129,5,131,1,135,7,139,5,140,5,145,1,151,3,152,5,155,2,156,5,163,1,201,2,202,2,203,2,204,2,205,2,206,2,207,2,208,2,210,5,211,5,214,3,219,2,220,2,221,2,222,2,223,2,224,2,225,2,226,2,230,4,231,4,235,2,236,2,237,7,239,2,240,2,244,4,245,4,246,6,247,6,254,2,255,2,345,6,346,6,356,6,357,6,358,8,359,10,361,6,362,6,379,2,380,2,381,4,382,2,386,4,387,4,388,4,389,4,398,4,399,4,400,4,401,4,410,2,411,2,415,2,416,2,417,2,418,2,419,2,420,2,424,2,425,2,428,2,429,2,430,2,431,4,432,4,433,2,434,2,435,2,436,2,437,2,438,4,439,4,440,2,441,2,442,2,443,2,444,2,445,2,446,4,447,4,448,2,449,2,450,2,451,2,452,2,453,2,455,2,457,2,458,2,459,2,460,2,461,3,463,2,464,2,465,2,466,2,467,17,468,17,469,17,470,17,471,24,472,24,473,17,474,17,475,17,476,17,477,24,478,24,479,20,480,20,481,20,482,20,483,20,484,20,485,20,486,20,487,2,488,2,489,2,490,2,491,3,492,3,495,2,496,2,497,2,498,2,499,2,500,2,501,2,502,2,532,1,533,1,534,3,535,2,572,2,573,2,574,2,575,2,576,4,577,4,578,2,579,2,584,2,585,2,586,2,587,2,588,4,589,4,590,4,591,4,592,4,593,4,594,2,595,2,600,5,601,3,602,5,603,3,607,3,608,3,626,2,627,2],"wher":[5,1,13,1,76,1,81,1,89,1,125,2,135,1,138,1,147,1,148,2,149,2,163,1,165,1,189,1,193,1,248,2,371,1,402,1,403,1,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,463,1,464,1,465,1,466,1,584,2,585,2,586,2,587,2,612,1],"we":[5,2,13,2],"sery":[5,1,13,1],"chain":[5,2,13,2],"need":[5,2,107,1,133,3,165,1,184,2,199,3,200,2,354,1,402,1],"mak":[5,1,38,2,41,1,353,1,370,1],"sur":[5,1],"desir":[5,1,147,1,164,1,215,2,216,2],"initial":[5,2,56,1,60,1,73,3,242,3,329,4,375,2,378,4],"often":[5,1,137,1,367,1],"achiev":[5,1,189,1,371,1],"zero":[5,1,7,2,8,2,9,1,10,1,11,1,12,1,13,1,18,1,19,1,22,2,23,2,24,2,25,2,27,2,28,1,29,1,30,1,31,1,32,2,33,2,34,2,38,1,40,1,45,1,64,1,67,1,74,1,75,2,76,3,78,3,81,2,82,2,85,1,86,1,87,1,88,1,90,4,91,1,92,3,93,1,95,1,101,2,102,1,103,2,104,2,105,4,106,4,113,2,118,2,119,3,120,1,122,1,130,1,141,2,145,4,146,3,158,1,163,1,173,2,177,4,178,4,179,4,180,2,190,2,195,2,198,3,201,1,202,1,203,1,205,1,206,1,213,3,214,2,219,1,220,1,221,1,222,1,223,1,224,1,225,2,226,2,235,2,236,2,237,1,239,1,240,1,241,2,242,1,244,2,245,2,246,1,247,1,249,1,254,2,255,2,258,2,259,1,260,2,261,2,265,1,268,1,270,1,271,1,274,1,276,1,278,1,279,1,280,2,281,1,282,2,283,2,284,4,285,1,286,1,288,3,289,1,290,1,291,2,293,2,295,2,296,1,297,2,298,1,299,2,300,1,301,2,303,2,304,5,305,4,307,1,308,1,309,2,310,1,316,1,321,3,323,1,324,1,326,7,327,2,330,1,335,2,340,2,343,1,344,1,350,2,353,4,354,1,356,2,357,2,358,2,359,2,381,1,382,1,384,1,386,2,387,2,388,1,389,1,396,1,398,2,399,2,400,1,401,1,408,1,409,6,415,1,416,1,417,1,418,1,421,1,422,1,423,1,424,2,425,2,426,2,427,2,429,1,431,2,432,2,440,1,441,2,442,1,443,1,444,1,445,1,446,1,447,1,452,1,453,1,455,2,457,2,458,2,459,1,460,1,469,1,470,1,475,1,476,1,481,1,482,1,485,1,486,1,491,3,492,4,505,2,506,3,509,1,511,1,512,1,513,2,518,2,519,2,520,2,521,2,526,2,527,2,529,2,530,1,532,1,534,1,535,1,536,1,537,1,540,1,541,1,542,4,543,4,544,4,547,2,549,1,550,1,552,1,553,1,554,1,555,1,558,2,559,2,560,2,565,1,566,2,567,2,568,2,570,2,571,2,572,2,573,2,574,1,575,1,576,2,577,2,578,2,579,2,580,2,581,2,582,2,583,2,592,2,593,2,594,3,595,3,596,2,597,2,598,2,599,2,604,2,608,6,609,4,610,4,626,2,627,2],"e":[5,1,13,1,55,4,66,4,128,2,145,1,162,5,173,1,194,5,234,10,257,3,259,1,265,1,305,3,367,7,374,4,375,2,378,3,393,1,395,3,432,1,463,1,464,1,465,1,466,1,491,1,492,1,493,2,494,2,542,3,543,3,557,2,560,3,576,2,577,2,578,2,579,2,604,3,605,2,606,2,624,2],"g":[5,1,13,1,55,2,145,1,378,3,393,1,557,2],"xor":[5,1,13,1,182,2,193,1,343,2,625,3,626,2,627,2],"support":[5,1,13,1,14,1,15,1,16,1,17,1,21,1,27,1,32,1,33,1,34,1,44,1,45,1,46,1,47,1,48,1,49,1,55,1,62,1,68,1,69,1,72,4,112,1,117,3,121,1,140,1,148,1,149,1,150,2,153,1,169,1,198,1,212,1,248,1,249,2,272,1,281,4,282,1,283,1,342,1,347,1,349,1,350,7,351,2,352,2,355,1,360,1,365,1,395,1,409,2,419,1,420,1,423,3,426,1,465,1,466,1,507,1,508,1,512,1,518,1,522,1,523,1,524,1,525,1,539,1,557,2,561,1,562,1,563,1,564,1,565,1,614,1,615,4,616,1,623,6,634,5],"real":[5,1,13,1,21,1,27,1,32,1,33,1,34,1,49,1,59,2,133,2,137,4,167,1,190,1,192,2,248,1,282,1,283,1,315,1,341,1,350,1,355,1,365,1,615,1,634,1],"virtual":[5,1,13,1,21,1,27,1,32,1,33,1,34,1,49,1,133,1,137,2,153,1,192,1,248,1,282,1,283,1,342,4,350,1,355,1,365,1],"8086":[5,1,13,1,21,1,27,1,32,1,33,1,34,1,49,1,133,1,137,2,153,1,192,1,248,1,282,1,283,1,342,4,350,1,355,1,365,1],"alway":[5,1,13,1,21,1,27,1,32,1,33,1,34,1,49,1,66,1,100,1,114,2,117,4,120,3,121,3,129,4,139,3,140,3,157,1,162,1,166,1,193,1,194,1,215,1,216,1,234,1,248,1,257,1,282,1,283,1,306,2,345,1,346,1,350,1,355,1,365,1,367,1,395,1,403,2,404,1,426,2,427,2,455,2,624,1],"15":[5,1,13,1,27,2,51,2,56,1,60,1,96,2,100,1,177,2,178,2,191,1,192,2,281,1,285,1,288,2,291,1,293,4,294,2,327,2,328,2,329,2,330,2,331,2,385,2,415,2,496,1,498,1,499,2,500,2,501,2,502,2,566,1,567,1,568,1],"normally":[5,1,13,1],"insid":[5,1,13,1,408,1,635,2],"outsid":[5,1,13,1,132,2,134,2,147,1,166,3,215,2,281,1,384,1,609,2,610,2,622,1],"transaction":[5,1,13,1,215,1,216,1,413,1],"region":[5,1,13,1,56,1,60,1,144,2,189,1,227,2,228,2,229,2,230,2,231,2,232,2,317,1,408,1,532,1,533,1,620,2,622,3,635,4],"integer":[6,2,41,6,62,2,73,1,74,2,75,2,76,3,77,4,79,2,80,2,81,3,83,4,84,6,86,4,87,4,89,5,90,4,91,4,92,4,93,4,94,8,95,6,114,3,120,5,121,4,122,4,123,4,125,8,126,7,129,5,130,1,131,2,132,1,134,1,139,4,140,4,158,1,169,2,213,1,216,2,217,2,218,1,227,4,229,2,232,2,258,2,259,14,260,6,261,12,262,12,263,10,264,10,269,2,277,5,284,2,286,2,287,5,289,2,290,4,293,2,295,4,296,4,297,4,298,4,299,4,300,4,301,4,303,6,304,6,305,8,306,8,307,2,308,2,309,2,310,2,311,3,320,5,326,5,332,10,333,2,334,10,335,8,344,2,356,4,357,4,358,4,359,2,364,1,370,3,379,1,380,1,397,2,428,3,429,3,430,3,433,3,434,3,435,3,436,2,437,2,438,3,439,5,440,3,441,3,442,3,443,3,444,3,445,3,446,5,447,5,448,2,449,2,450,2,451,2,452,4,453,4,462,3,493,2,494,2,495,6,496,6,497,6,498,6,504,4,512,2,515,3,516,3,517,2,519,2,520,2,527,2,539,5,540,2,541,2,545,8,546,8,549,4,550,4,552,4,553,4,554,4,555,4,566,1,567,1,568,1,584,2,585,2,586,2,587,2,600,1,601,1,602,1,603,1,605,2,606,2,624,2],"overflow":[6,1,13,2,100,1,108,1,135,1,139,1,146,1,157,1,164,3,259,4,260,2,262,5,263,2,264,2,287,2,311,1,332,4,333,4,334,2,335,2,370,1,397,1,523,2,525,2,588,1,589,1,590,1,591,1,600,2,601,2,602,2,603,2],"addpd":[7,1],"vaddpd":[7,1],"eight":[7,2,8,2,22,2,23,2,24,2,25,2,65,1,74,4,75,4,78,4,81,4,82,4,90,4,92,4,102,4,159,1,242,3,254,2,255,2,256,1,386,2,387,2,398,2,433,4,435,2,443,2,445,2,467,12,468,12,471,4,472,4,473,12,474,12,477,4,478,4,479,16,480,16,483,16,484,16,493,4,494,4,556,4,576,2,592,2,605,4,606,4,626,2,627,2],"pack":[7,4,8,4,22,2,23,2,24,2,25,2,29,2,64,4,65,4,74,4,75,4,76,4,77,4,78,4,79,4,80,4,81,2,82,4,83,4,90,4,91,4,92,2,93,4,97,8,98,8,102,4,105,4,106,4,113,1,115,1,155,2,201,2,202,2,205,2,206,2,210,1,211,1,217,1,218,1,219,2,221,1,222,2,224,2,225,2,226,2,227,4,230,4,231,4,232,4,239,2,240,2,242,4,244,4,245,4,254,2,255,2,259,14,260,4,261,2,262,12,263,8,264,8,269,4,273,2,274,2,277,2,278,2,286,2,287,4,289,2,290,4,293,2,295,2,296,2,297,2,298,2,299,2,300,2,301,2,303,5,304,5,305,6,306,2,307,2,308,2,309,2,310,2,320,1,332,10,333,2,334,8,335,8,345,4,361,4,386,4,387,4,398,4,399,4,419,2,426,4,427,4,428,4,429,4,430,4,431,4,432,2,433,2,434,2,435,2,436,4,437,4,440,4,441,4,442,4,443,2,444,2,445,2,448,4,449,2,450,4,451,2,454,5,455,2,467,14,468,14,471,12,472,12,473,14,474,14,475,14,476,14,477,12,478,12,479,16,480,16,481,16,482,16,483,16,484,16,485,12,486,12,487,2,488,2,493,2,494,2,503,3,504,4,505,2,514,4,515,4,516,4,517,4,518,1,539,1,542,2,543,2,545,6,546,6,547,2,549,4,550,4,552,4,553,4,554,4,555,4,560,2,561,2,562,2,563,2,564,2,572,2,573,2,576,4,577,4,584,2,585,2,592,4,593,4,600,2,601,2,604,2,605,2,606,2,607,6,608,2,626,2,627,2],"doubl":[7,4,9,4,11,8,22,2,24,2,28,6,30,2,51,4,64,2,70,2,73,6,74,2,76,2,77,2,78,2,79,2,82,2,84,6,85,3,86,2,88,2,89,2,90,2,91,2,94,6,96,3,101,2,103,6,105,5,114,3,115,2,120,3,121,3,122,2,123,2,127,8,128,4,129,3,135,4,139,3,140,3,145,1,151,3,155,2,167,1,184,1,201,2,203,2,205,2,207,2,210,4,214,3,220,2,223,2,225,2,227,2,228,2,230,4,239,2,244,4,245,2,246,6,254,2,294,4,313,1,315,1,341,1,342,1,356,4,358,6,381,4,386,4,388,4,398,4,400,4,401,2,410,2,415,2,417,2,424,2,428,2,429,2,430,2,434,2,436,2,438,4,439,2,440,2,441,2,442,2,446,4,448,2,450,2,452,2,457,2,459,2,461,1,463,2,465,2,467,14,469,14,471,20,473,14,475,14,477,20,479,16,481,16,483,16,485,16,487,2,489,2,491,3,495,2,497,2,499,2,501,2,532,1,534,3,549,2,550,2,553,4,572,2,574,2,576,4,578,2,584,2,586,2,588,3,590,3,591,2,592,4,594,2,600,5,602,5,607,1,608,1,626,2],"float":[7,4,8,4,9,4,10,4,11,8,12,8,22,2,23,2,24,2,25,2,28,6,29,6,30,2,31,2,64,2,65,2,67,2,70,4,71,4,74,2,75,2,76,3,77,4,78,4,79,2,80,3,81,3,82,4,83,5,84,6,85,5,86,2,87,2,88,6,89,5,90,3,91,4,92,3,93,6,94,6,95,5,101,4,102,4,103,6,104,6,105,4,106,4,108,6,113,3,114,3,115,2,116,6,117,1,118,1,119,1,120,5,121,5,122,3,123,2,124,1,127,6,128,4,129,5,130,1,131,1,133,4,135,3,136,2,137,5,138,2,139,5,140,5,141,1,142,1,143,1,145,6,151,3,152,5,155,2,156,5,163,1,185,2,201,3,202,3,203,3,204,3,205,3,206,3,207,3,208,3,210,5,211,5,214,3,219,2,220,2,221,2,222,2,223,2,224,2,225,2,226,2,230,4,231,4,233,1,235,2,236,2,237,7,239,2,240,2,244,4,245,4,246,6,247,6,254,2,255,2,345,6,346,6,356,7,357,7,358,7,359,9,361,7,362,7,381,2,382,2,386,4,387,4,388,4,389,4,398,4,399,4,400,4,401,4,410,2,411,4,415,2,416,2,417,2,418,2,419,2,420,2,423,3,424,2,425,2,426,1,428,3,429,3,430,3,431,4,432,4,433,3,434,3,435,3,436,2,437,2,438,5,439,5,440,3,441,3,442,3,443,3,444,3,445,3,446,5,447,5,448,2,449,2,450,2,451,2,452,2,453,2,457,2,458,2,459,2,460,2,461,3,463,2,464,2,465,2,466,2,467,14,468,14,469,14,470,14,471,20,472,20,473,14,474,14,475,14,476,14,477,20,478,20,479,16,480,16,481,16,482,16,483,16,484,16,485,16,486,16,487,4,488,4,489,4,490,4,491,3,492,3,499,2,500,2,501,2,502,2,503,3,526,2,532,1,533,1,534,3,535,2,576,5,577,5,578,3,579,3,588,3,589,3,590,3,591,3,592,5,593,5,594,4,595,4,600,6,601,4,602,6,603,4,607,6,611,5,626,2,627,2],"point":[7,4,8,4,9,4,10,4,11,6,12,6,22,2,23,2,24,2,25,2,28,6,29,6,30,2,31,2,41,2,50,1,64,2,65,2,67,2,70,4,71,4,74,2,75,2,76,3,77,4,78,4,79,2,80,3,81,3,82,4,83,5,84,6,85,5,86,2,87,2,88,6,89,5,90,3,91,4,92,3,93,6,94,6,95,5,101,4,102,4,103,6,104,6,105,4,106,2,108,6,112,1,113,3,114,3,115,2,116,7,117,1,118,1,119,1,120,5,121,5,122,3,123,2,124,2,127,6,128,4,129,5,130,1,131,1,133,4,135,3,136,3,137,6,138,3,139,5,140,5,141,1,142,1,143,1,145,6,151,3,152,5,153,2,155,2,156,5,163,1,168,2,185,2,186,1,191,2,197,4,201,3,202,3,203,3,204,3,205,3,206,3,207,3,208,3,210,5,211,5,214,3,219,2,220,2,221,2,222,2,223,2,224,2,225,2,226,2,230,4,231,4,233,1,235,2,236,2,237,7,239,2,240,2,244,4,245,4,246,6,247,6,254,2,255,2,345,6,346,6,353,2,356,7,357,7,358,7,359,9,361,7,362,7,370,2,381,2,382,2,384,2,386,4,387,4,388,4,389,4,396,2,398,4,399,4,400,4,401,4,402,1,404,1,405,1,410,2,411,4,415,2,416,2,417,2,418,2,419,2,420,2,423,3,424,2,425,2,426,1,428,3,429,3,430,3,431,4,432,2,433,3,434,3,435,3,436,2,437,2,438,5,439,5,440,3,441,3,442,3,443,3,444,3,445,3,446,5,447,5,448,2,449,2,450,2,451,2,452,2,453,2,457,2,458,2,459,2,460,2,461,3,463,2,464,2,465,2,466,2,467,14,468,14,469,14,470,14,471,20,472,20,473,14,474,14,475,14,476,14,477,20,478,20,479,16,480,16,481,16,482,16,483,16,484,16,485,16,486,16,487,4,488,4,489,4,490,4,491,3,492,3,503,3,526,2,532,1,533,1,534,3,535,2,539,1,542,2,543,2,560,2,576,5,577,5,578,3,579,3,588,3,589,3,590,3,591,3,592,5,593,5,594,4,595,4,600,6,601,4,602,6,603,4,604,2,607,6,611,5,626,2,627,2],"evex":[7,1,8,1,9,3,10,3,14,2,15,2,16,2,17,2,22,1,23,1,24,1,25,1,64,1,65,1,67,1,70,1,71,1,74,2,75,1,76,1,78,1,81,1,82,1,84,2,85,2,86,3,87,2,88,1,89,2,90,1,92,1,94,2,95,2,101,1,102,1,103,3,104,3,113,3,148,1,149,1,150,1,201,1,202,1,203,1,205,1,206,1,210,4,211,4,214,4,217,6,218,3,219,1,220,1,221,1,223,1,224,1,227,1,230,3,231,3,235,1,236,1,237,3,239,3,240,4,244,1,245,1,246,2,247,2,254,1,255,1,258,2,259,2,260,1,261,3,263,1,264,1,265,2,266,2,267,2,269,1,272,1,273,1,274,1,277,1,278,1,284,3,285,3,291,3,293,3,294,1,297,1,299,1,301,1,303,3,304,3,305,1,306,1,307,1,308,1,309,1,310,1,311,1,316,1,321,1,322,1,323,1,324,1,327,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,343,1,381,1,382,1,386,1,387,1,388,2,389,2,398,3,399,3,400,2,401,2,411,1,415,1,416,1,417,1,418,1,422,1,423,1,424,3,425,3,427,2,428,2,429,1,430,1,431,1,433,1,434,1,435,1,436,1,437,1,439,2,440,2,441,1,442,2,443,2,444,2,445,2,446,1,447,2,448,2,449,1,450,1,451,2,452,3,453,1,457,1,458,1,459,2,460,2,461,1,467,2,468,2,469,2,470,2,471,1,472,1,473,1,474,1,475,2,476,2,477,1,478,1,479,1,480,1,481,3,482,3,483,1,484,1,485,3,486,3,488,1,489,1,490,1,495,1,496,1,506,2,511,1,512,2,513,7,518,4,519,3,520,3,521,4,528,3,529,2,531,1,532,1,533,1,534,2,535,1,536,2,538,1,539,1,540,2,541,2,544,4,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,558,3,559,3,566,1,567,1,568,1,569,3,571,2,576,1,577,1,580,1,581,1,592,3,593,3,596,1,597,1,626,5,627,5],"zmm":[7,6,8,6,22,5,23,6,24,5,25,6,64,4,65,3,67,1,74,3,75,2,76,4,78,3,81,4,82,4,90,3,92,4,101,3,102,5,103,1,201,4,202,4,205,4,206,4,210,9,211,9,217,1,227,2,230,2,231,2,235,4,236,4,239,2,240,2,244,5,245,5,254,5,255,5,258,4,259,7,260,5,261,4,263,3,264,3,265,3,266,4,267,4,272,2,274,2,278,2,293,1,297,2,299,2,301,2,303,1,304,1,305,4,309,5,327,3,381,5,382,5,386,5,387,5,389,1,398,2,399,2,415,5,416,5,417,5,418,5,421,4,422,2,423,2,424,4,425,4,428,2,429,2,430,2,431,1,433,1,434,2,435,1,436,2,437,1,440,2,441,1,442,2,444,2,448,1,449,2,450,2,451,1,454,2,457,2,458,2,459,2,460,2,463,2,464,2,467,3,468,3,471,2,472,2,473,2,474,2,477,2,478,2,479,2,480,2,483,2,484,2,488,1,493,2,494,2,495,2,496,2,499,2,500,2,503,3,504,3,510,2,511,2,512,2,513,2,514,2,515,2,516,2,517,2,519,4,520,4,521,2,528,3,529,5,530,2,531,2,532,2,533,1,534,3,535,2,536,3,537,2,538,2,540,4,541,4,542,2,544,2,545,3,546,3,548,1,549,1,550,1,551,1,553,1,554,1,555,1,556,3,558,6,559,6,565,2,566,3,567,2,568,3,569,4,570,4,571,4,576,2,577,2,580,2,581,2,588,2,589,2,592,2,593,2,596,2,597,2,605,2,606,2,607,1,626,5,627,5],"ymm":[7,6,8,6,11,5,12,5,18,2,19,2,22,6,23,6,24,6,25,6,28,5,29,5,30,2,31,2,64,5,65,5,67,1,74,3,75,4,76,3,78,3,81,2,82,3,90,3,92,4,101,6,102,6,104,1,105,1,106,1,151,1,184,2,201,6,202,6,205,6,206,6,210,6,211,6,213,1,214,1,225,2,226,4,227,2,230,2,231,2,235,4,236,4,239,3,240,3,242,2,244,7,245,7,247,1,254,6,255,6,258,6,259,9,260,5,261,3,263,6,264,6,265,3,266,3,267,3,270,2,271,5,272,3,273,1,274,7,277,1,278,7,286,2,287,1,289,2,290,2,291,1,292,1,293,2,294,1,295,3,296,2,297,4,298,2,299,4,300,2,301,4,303,1,304,1,305,5,306,1,307,2,308,2,309,4,310,2,316,2,321,2,323,2,324,2,326,2,327,6,328,1,330,4,333,1,336,2,343,2,356,2,357,2,358,2,359,2,381,6,382,6,386,4,387,4,389,1,398,2,399,2,415,3,416,2,417,3,418,3,421,4,422,2,423,3,424,4,425,4,428,2,429,2,430,2,431,3,432,1,433,2,434,2,435,2,436,2,437,2,440,2,441,2,442,2,443,1,444,2,445,1,448,2,449,2,450,2,451,2,454,2,459,2,460,2,463,2,464,2,471,5,472,5,473,2,474,2,477,5,478,5,479,5,480,5,483,5,484,5,488,1,495,2,496,2,499,2,500,2,503,3,504,3,505,1,509,4,510,2,512,2,513,2,514,2,515,2,516,2,517,2,519,4,520,4,521,2,526,6,527,6,528,3,529,6,530,2,531,2,532,1,533,1,534,1,535,2,536,1,537,2,538,2,544,2,545,3,546,3,547,1,548,1,549,1,550,2,551,1,553,2,554,1,555,2,556,3,558,2,559,2,566,4,567,4,568,4,569,3,570,4,571,4,588,2,592,2,593,2,608,2,626,3,627,3],"xmm":[7,8,8,8,9,3,10,3,11,4,12,4,14,1,15,1,16,1,17,1,18,4,19,2,22,8,23,8,24,8,25,8,28,5,29,5,30,2,31,2,64,6,65,6,67,6,70,2,71,2,74,8,75,6,76,5,77,1,78,6,79,1,80,1,81,2,82,8,83,2,84,4,85,6,86,4,87,4,88,7,89,4,90,6,91,2,92,4,93,4,94,4,95,4,101,7,102,8,103,6,104,4,105,2,106,2,143,3,144,2,151,2,184,2,199,2,201,3,202,3,203,5,204,2,205,3,206,3,207,2,208,2,210,6,211,6,213,8,214,2,219,4,220,3,221,3,222,4,223,4,224,2,225,2,226,2,227,2,230,2,231,2,233,2,235,4,236,4,237,9,242,4,244,8,245,8,246,4,247,5,254,8,255,8,258,6,259,6,260,8,261,6,263,3,264,3,265,2,266,6,267,6,269,3,270,2,271,4,272,2,273,2,274,6,275,2,276,2,277,2,278,6,279,1,280,1,284,2,285,4,286,4,287,2,288,2,289,4,290,4,291,4,292,3,293,6,294,2,295,4,296,4,297,6,298,4,299,6,300,4,301,6,302,1,303,1,304,1,305,7,306,2,307,4,308,4,309,6,310,4,316,4,322,4,323,4,324,4,326,4,327,3,328,2,330,1,333,2,336,2,343,4,345,4,346,4,356,3,357,3,361,4,362,4,381,8,382,8,386,5,387,5,388,4,389,4,398,4,399,4,400,3,401,3,410,2,411,2,415,5,416,5,417,5,418,5,421,4,422,2,423,2,424,4,425,4,428,2,429,2,430,2,431,6,432,3,433,3,434,2,435,3,436,2,437,3,438,4,439,4,440,2,441,3,442,2,443,2,444,2,445,2,446,4,447,4,448,3,449,2,450,2,451,3,452,2,453,4,454,2,459,2,460,2,463,2,464,2,465,4,466,4,469,4,470,4,471,2,472,2,473,2,474,2,475,4,476,4,477,2,478,2,479,2,480,2,483,2,484,2,488,1,495,2,496,2,497,4,498,4,499,2,500,2,501,2,502,2,503,2,504,3,505,1,509,2,510,2,512,3,513,2,514,2,515,2,516,2,517,2,519,4,520,4,521,2,528,3,529,2,530,2,531,2,532,1,533,1,537,2,538,2,544,2,545,3,546,3,547,1,548,1,549,2,550,3,551,1,552,2,553,3,554,2,555,3,556,3,558,4,559,4,566,4,567,4,568,4,569,3,570,4,571,4,578,6,579,6,582,3,583,3,588,2,590,2,591,2,592,2,593,2,594,5,595,5,598,3,599,3,608,2,626,5,627,5],"512":[7,2,8,2,22,2,23,2,24,2,25,2,64,2,65,2,75,2,76,2,78,2,81,2,90,2,92,2,101,2,102,2,143,2,144,4,201,2,202,2,205,2,206,2,210,9,211,9,217,2,218,1,227,4,230,4,231,4,235,2,236,2,239,2,240,3,244,2,245,2,254,2,255,2,258,3,259,3,260,2,261,2,264,1,265,2,266,2,267,2,272,1,274,2,278,2,292,1,297,2,299,2,301,2,305,2,309,2,320,1,327,1,381,2,382,2,386,2,387,3,398,3,399,3,415,3,416,3,417,3,418,3,421,8,422,2,423,3,424,2,425,2,428,1,429,2,430,1,434,2,436,1,437,1,440,1,441,2,442,1,444,2,449,2,450,2,451,1,454,1,457,2,458,2,459,1,460,1,463,2,464,2,467,2,468,2,471,2,472,2,473,2,474,2,477,2,478,2,479,2,480,2,483,2,484,2,488,2,495,2,496,2,499,2,500,2,510,2,511,2,513,2,514,1,515,2,516,2,517,1,518,1,519,2,520,2,521,3,528,2,529,3,530,1,531,3,532,2,533,2,534,5,535,2,536,5,537,1,538,3,539,1,544,3,545,2,546,2,556,2,558,5,559,5,566,2,567,3,568,2,569,9,570,3,571,3,576,2,577,2,580,2,581,2,588,2,589,2,592,3,593,3,596,2,597,2,607,3,626,1,627,1],"256":[7,5,8,5,11,2,12,2,22,5,23,5,24,5,25,5,28,2,29,2,64,4,65,4,74,3,75,5,76,3,78,5,81,3,82,4,90,5,92,5,101,5,102,4,201,5,202,5,205,5,206,5,210,5,211,5,214,6,217,3,218,2,225,1,226,1,227,4,230,4,231,4,235,4,236,4,239,5,240,6,242,1,244,5,245,5,254,5,255,5,258,6,259,6,260,5,261,4,263,2,264,3,266,2,267,2,271,2,272,1,274,4,278,4,293,4,295,3,296,2,297,5,298,2,299,5,300,2,301,5,302,1,303,3,304,2,305,7,309,5,320,2,322,4,323,4,324,4,327,3,330,1,336,2,381,4,382,4,386,5,387,5,398,4,399,4,415,2,416,2,417,2,418,2,421,8,422,2,423,4,424,2,425,2,428,1,429,3,430,1,431,3,432,1,433,1,434,2,435,1,436,1,437,1,440,1,441,3,442,1,443,1,444,2,445,1,448,2,449,2,450,2,451,1,454,1,459,1,460,1,461,9,462,9,463,2,464,2,471,4,472,4,473,2,474,2,477,4,478,4,479,4,480,4,483,4,484,4,488,2,492,1,495,2,496,2,499,2,500,2,503,5,504,5,505,1,509,2,510,2,512,2,513,2,514,1,515,1,516,1,517,1,519,2,520,2,521,3,526,2,527,2,528,2,529,5,530,3,531,3,532,4,533,2,534,2,535,2,536,2,537,3,538,3,539,1,544,3,545,2,546,2,547,1,550,2,553,2,555,2,556,2,558,2,559,2,566,4,567,6,568,4,569,4,570,3,571,3,588,2,592,3,593,3,607,4,608,2,626,4,627,4],"128":[7,8,8,8,9,3,10,3,11,6,12,6,14,2,15,2,16,2,17,2,18,6,19,7,22,8,23,8,24,8,25,8,28,6,29,6,30,5,31,5,39,2,64,8,65,8,67,4,69,11,74,7,75,8,76,4,77,1,78,6,81,3,82,7,83,1,85,3,86,3,87,3,88,3,90,5,91,2,92,5,101,8,102,8,103,5,104,5,105,3,106,3,113,1,151,3,163,1,166,1,169,1,195,1,199,2,201,2,202,2,203,3,204,1,205,2,206,2,207,1,208,1,210,5,211,5,213,3,214,6,217,2,218,1,219,4,220,4,221,4,222,4,223,5,224,5,225,1,226,1,227,4,230,4,231,4,235,6,236,6,237,2,242,12,244,8,245,8,246,3,247,3,254,8,255,8,258,6,259,3,260,8,261,7,264,1,265,4,266,5,267,5,269,3,270,5,271,6,272,2,273,3,274,8,276,1,277,3,278,8,280,1,284,2,285,2,286,8,287,5,288,4,289,8,290,8,291,6,292,1,293,9,294,3,295,6,296,6,297,8,298,6,299,8,300,6,301,8,302,2,303,5,304,4,305,12,306,4,307,6,308,6,309,10,310,6,316,6,320,2,321,8,322,10,323,14,324,14,326,6,327,7,328,4,329,2,330,5,331,1,333,3,335,1,336,2,343,6,345,2,356,6,357,6,358,3,359,3,361,2,381,10,382,18,386,8,387,8,388,3,389,3,398,7,399,7,400,3,401,3,415,6,416,6,417,6,418,6,421,6,422,2,423,3,424,2,425,2,428,1,429,2,430,1,431,4,432,3,433,1,434,2,435,1,436,1,437,1,440,1,441,2,442,1,443,1,444,2,445,1,448,2,449,2,450,2,451,1,452,1,453,1,454,1,459,1,460,1,461,11,462,12,463,2,464,2,469,2,470,2,471,2,472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2,485,2,486,2,488,2,492,1,495,2,496,2,499,2,500,2,503,6,504,9,505,1,509,3,510,2,512,2,513,2,514,1,515,1,516,1,517,1,519,2,520,2,521,3,526,5,527,5,528,2,529,3,530,3,531,3,532,3,533,3,537,3,538,3,539,1,544,3,545,2,546,2,547,1,549,2,550,2,553,2,554,2,555,2,556,2,558,2,559,2,566,4,567,6,568,4,569,3,570,3,571,3,574,1,575,1,588,2,590,1,591,1,592,3,593,3,594,1,595,1,607,10,608,2,610,4,626,7,627,7],"vector":[7,1,8,1,14,4,15,4,16,4,17,4,22,1,23,1,24,1,25,1,64,1,65,1,74,1,75,1,76,1,78,1,81,1,82,1,90,1,92,1,101,1,102,1,113,2,148,4,149,6,163,2,164,8,170,6,171,6,172,6,174,4,175,4,176,6,181,6,182,6,201,1,202,1,205,1,206,1,217,2,218,3,244,1,245,1,254,1,255,1,258,1,259,1,260,1,266,1,267,1,274,1,278,1,297,1,299,1,301,1,305,1,309,1,381,1,382,1,386,1,387,1,398,1,399,1,415,1,416,1,417,1,418,1,421,7,422,1,424,9,425,7,429,1,434,1,441,1,443,1,444,1,445,1,448,1,449,1,450,1,457,1,458,1,459,6,460,6,461,3,462,3,463,1,464,1,467,1,468,1,471,1,472,1,473,1,474,1,477,1,478,1,479,1,480,1,483,1,484,1,488,1,491,2,492,2,495,1,496,1,499,1,500,1,503,2,510,6,511,1,515,1,516,1,518,6,519,7,520,7,521,5,529,1,531,2,532,1,533,1,534,3,535,1,536,3,538,2,539,3,540,6,541,4,542,4,543,6,544,3,545,1,546,1,548,2,551,2,552,2,556,1,558,2,559,2,560,8,566,1,567,1,568,1,569,5,570,1,571,1,576,1,577,1,580,1,581,1,588,1,589,1,592,3,593,3,596,1,597,1,604,6,607,3,626,1,627,1],"broadcast":[7,1,8,1,22,1,23,1,24,1,25,1,64,1,65,1,74,1,75,1,76,1,78,1,81,1,82,1,90,1,92,1,101,1,102,1,105,4,106,4,150,1,201,1,202,1,205,1,206,1,244,1,245,1,254,1,255,1,258,1,259,1,260,1,266,1,267,1,274,1,278,1,297,1,299,1,301,1,305,1,309,1,381,1,382,1,386,1,387,1,398,1,399,1,415,1,416,1,417,1,418,1,421,2,422,1,423,3,429,1,434,1,441,1,444,1,448,1,449,1,450,1,457,1,458,1,463,1,464,1,467,1,468,1,471,1,472,1,473,1,474,1,477,1,478,1,479,1,480,1,483,1,484,1,488,1,495,1,496,1,499,1,500,1,511,1,512,2,513,2,515,1,516,1,521,3,529,1,531,2,532,1,533,1,534,2,535,1,536,2,538,2,544,3,545,1,546,1,556,1,558,2,559,2,566,1,567,1,568,1,569,1,570,1,571,1,576,1,577,1,580,1,581,1,588,1,589,1,592,3,593,3,596,1,597,1,607,1],"conditionally":[7,1,8,1,22,1,23,1,24,1,25,1,28,2,29,2,30,2,31,2,37,2,74,1,75,1,76,1,78,1,81,1,82,1,90,1,92,1,101,1,102,1,105,3,106,3,201,1,202,1,205,1,206,1,214,2,244,1,245,1,254,1,255,1,260,1,266,1,267,1,270,2,271,2,297,1,299,1,301,1,309,1,398,1,399,1,415,1,416,1,417,1,418,1,422,1,428,1,429,1,430,1,431,1,433,1,434,1,435,1,436,1,437,1,440,1,441,1,442,1,443,1,444,1,445,1,448,1,449,1,450,1,451,1,454,1,457,1,458,1,467,1,468,1,471,1,472,1,473,1,474,1,477,1,478,1,479,1,480,1,483,1,484,1,491,3,492,3,493,2,494,2,497,1,498,1,505,2,509,2,510,1,511,1,521,3,544,3,545,1,546,1,547,2,566,1,567,1,568,1,569,1,576,1,577,1,580,1,581,1,582,1,583,1,588,1,589,1,592,3,593,3,596,1,597,1,605,2,606,2,626,3,627,3],"updat":[7,1,8,1,9,1,10,1,22,1,23,1,24,1,25,1,37,3,70,1,71,1,74,1,75,1,76,1,78,1,81,1,82,1,90,1,92,1,99,4,101,1,102,1,103,1,104,1,138,1,160,4,179,2,201,1,202,1,205,1,206,1,214,2,217,1,218,1,235,1,236,1,237,1,239,1,240,1,244,1,245,1,246,1,247,1,254,1,255,1,258,2,259,2,260,1,266,1,267,1,274,1,278,1,297,1,299,1,301,1,305,1,309,1,375,2,378,2,381,1,382,1,386,1,387,1,388,1,389,1,398,1,399,1,400,1,401,1,411,1,415,1,416,1,417,1,418,1,423,2,426,1,427,1,428,1,429,1,430,1,431,1,433,1,434,1,435,1,436,1,437,1,440,1,441,1,442,1,443,1,444,1,445,1,448,1,449,1,450,1,451,1,454,1,455,1,457,1,458,1,461,2,462,3,467,1,468,1,471,1,472,1,473,1,474,1,477,1,478,1,479,1,480,1,481,1,482,1,483,1,484,1,485,1,486,1,491,3,492,3,495,1,496,1,497,2,498,2,499,1,500,1,503,3,504,3,512,2,521,3,528,1,529,2,534,2,535,1,536,2,542,2,543,2,544,3,545,1,546,1,549,1,550,1,552,1,553,1,554,1,555,1,556,2,558,1,559,1,560,1,566,1,567,1,568,1,569,1,570,2,571,2,576,1,577,1,580,1,581,1,582,1,583,1,588,1,589,1,592,3,593,3,596,1,597,1,604,1,607,1,616,1,617,2,620,1,622,4,626,3,627,3],"writemask":[7,1,8,1,9,1,10,1,22,1,23,1,24,1,25,1,64,1,65,1,67,1,74,1,75,1,76,1,78,1,81,1,82,1,85,1,87,1,90,1,92,1,101,1,102,1,103,1,104,1,201,1,202,1,205,1,206,1,214,2,217,1,218,1,235,1,236,1,237,1,239,1,240,1,244,1,245,1,246,1,247,1,254,1,255,1,258,2,259,2,260,1,266,1,267,1,274,1,278,1,297,1,299,1,301,1,303,1,304,1,305,1,309,1,381,1,382,1,386,1,387,1,388,1,389,1,398,1,399,1,400,1,401,1,415,1,416,1,417,1,418,1,421,3,422,1,423,2,428,1,429,1,430,1,431,1,433,1,434,1,435,1,436,1,437,1,440,1,441,1,442,1,443,1,444,1,445,1,448,1,449,1,450,1,451,1,454,1,457,3,458,3,459,4,460,4,461,2,462,3,481,1,482,1,485,1,486,1,487,2,488,2,489,2,490,2,495,1,496,1,497,3,498,3,499,3,500,3,501,2,502,2,503,3,504,3,510,1,511,1,512,2,514,1,515,1,516,1,517,1,518,3,521,5,528,1,529,2,530,2,531,2,532,1,533,1,534,2,535,1,536,2,537,2,538,2,539,3,540,3,541,3,544,5,545,3,546,3,549,1,550,1,552,1,553,1,554,1,555,1,556,2,558,1,559,1,566,1,567,1,568,1,569,3,570,4,571,4,572,2,573,2,574,2,575,2,576,1,577,1,578,2,579,2,580,1,581,3,582,3,583,3,584,2,585,2,586,2,587,2,588,1,589,1,590,2,591,2,592,5,593,5,594,2,595,2,596,1,597,1,598,2,599,2,607,1,626,3,627,3],"k1":[7,1,8,1,22,1,23,1,24,1,25,1,74,1,75,1,76,1,78,1,81,1,82,1,90,1,92,1,101,1,102,1,170,2,171,2,172,2,174,2,175,2,176,2,181,2,182,2,201,1,202,1,205,1,206,1,244,1,245,1,254,1,255,1,259,2,260,1,266,1,267,1,297,1,299,1,301,1,309,1,415,1,416,1,417,1,418,1,421,4,423,2,424,1,425,1,428,1,429,1,430,1,431,1,433,1,434,1,435,1,436,1,437,1,440,1,441,1,442,1,443,1,444,1,445,1,448,1,449,1,450,1,451,1,454,1,457,3,458,3,459,4,460,4,463,4,464,4,465,4,466,4,467,1,468,1,471,1,472,1,473,1,474,1,477,1,478,1,479,1,480,1,483,1,484,1,487,2,488,2,489,2,490,2,497,1,498,1,499,2,500,2,501,2,502,2,512,2,514,1,515,1,516,1,517,1,519,1,520,1,521,3,528,1,529,2,530,2,531,2,534,2,535,1,536,2,537,2,538,2,540,4,541,4,542,1,543,1,544,3,545,3,546,3,556,2,566,1,567,1,568,1,569,3,571,2,572,2,573,2,574,2,575,2,578,2,579,2,580,1,581,3,582,3,583,3,584,2,585,2,586,2,587,2,592,3,593,3,596,1,597,1,598,2,599,2,604,1,626,3,627,3],"vex":[7,2,8,2,9,2,10,2,11,2,12,2,14,1,15,1,16,1,17,1,18,3,19,3,21,3,22,2,23,2,24,2,25,2,27,3,28,2,29,2,30,3,31,3,32,3,33,3,34,3,49,3,64,2,65,2,67,1,70,3,71,1,74,2,75,2,76,2,78,2,81,2,82,2,84,2,85,1,86,1,87,3,88,3,89,2,90,2,92,2,94,2,95,2,101,2,102,2,103,2,104,2,113,3,173,1,179,2,184,2,201,1,202,1,203,1,205,1,206,1,210,1,211,2,214,2,217,3,218,3,220,1,221,1,223,1,224,1,225,3,226,3,227,4,230,4,231,3,235,2,236,2,237,2,239,3,240,3,242,2,244,2,245,2,246,3,247,4,248,3,254,2,255,2,258,2,259,1,260,2,261,2,263,1,264,1,265,1,266,1,267,1,269,1,270,4,271,2,273,1,274,2,277,1,278,2,282,3,283,3,284,4,285,3,286,1,288,3,289,1,290,1,291,3,293,3,294,1,295,2,296,2,297,2,298,2,299,2,300,2,301,2,303,4,304,4,305,2,306,1,307,3,308,3,309,2,310,3,311,1,316,2,321,2,322,1,323,4,324,2,326,2,327,2,328,1,329,1,330,3,331,1,333,1,334,1,335,1,336,3,343,2,355,3,356,1,357,1,358,1,359,1,365,3,381,2,382,2,386,2,387,2,388,3,389,3,394,3,398,2,399,2,400,1,401,1,411,1,415,2,416,2,417,2,418,2,431,2,432,2,439,1,461,1,469,2,470,2,471,2,472,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2,485,2,486,2,504,2,505,2,509,2,512,1,526,1,527,1,529,1,532,1,534,2,535,3,536,2,547,2,566,2,567,2,568,2,608,4,609,1,610,1,626,2,627,2],"upper":[7,3,8,3,11,2,12,2,22,3,23,3,24,3,25,3,28,2,29,2,30,1,31,1,36,6,37,2,38,4,39,2,40,2,41,5,50,1,74,2,75,2,76,3,78,3,81,2,82,2,87,2,90,3,92,2,101,3,102,2,105,1,106,1,109,2,113,1,148,1,151,1,158,1,159,1,169,1,190,2,196,1,201,1,202,1,205,1,206,1,213,1,220,1,221,1,223,2,224,2,225,2,226,2,242,1,244,2,245,2,254,3,255,3,256,1,258,2,259,1,260,3,261,3,266,1,267,1,269,1,270,1,283,2,284,2,288,2,328,1,340,1,347,2,356,2,357,2,358,2,359,2,381,2,382,2,383,1,386,3,387,3,396,1,398,1,399,1,415,2,416,2,417,2,418,2,424,2,425,2,429,1,431,1,432,2,441,1,492,1,504,1,518,2,519,2,520,2,534,1,536,1,614,2,626,3,627,3,628,1,629,1,630,1,631,1,632,1,633,1],"maxvl":[7,3,8,3,9,2,10,2,11,2,12,2,18,2,19,2,22,3,23,3,24,3,25,3,28,2,29,2,30,2,31,2,64,2,65,2,67,2,74,2,75,3,76,3,78,3,81,2,82,3,85,2,86,2,87,2,88,2,90,3,92,2,101,3,102,2,103,3,104,3,105,1,106,1,151,1,201,1,202,1,203,2,204,1,205,1,206,1,207,1,208,1,213,1,214,3,219,2,220,2,221,2,222,2,223,2,224,2,235,3,236,3,237,4,239,1,240,1,242,1,244,3,245,3,246,2,247,2,254,3,255,3,258,2,259,1,260,3,261,3,265,1,266,1,267,1,269,1,270,2,271,2,273,1,274,2,277,1,278,2,286,2,287,1,288,2,289,2,290,2,291,3,292,1,293,3,294,1,295,3,296,2,297,3,298,2,299,3,300,2,301,3,303,3,304,3,305,3,306,1,307,2,308,2,309,3,310,2,316,2,321,2,323,2,324,2,326,2,327,3,328,1,330,2,333,1,343,2,356,2,357,2,358,2,359,2,381,2,382,2,386,3,387,3,388,2,389,2,398,3,399,3,400,2,401,2,415,2,416,2,417,2,418,2,423,1,429,1,431,2,432,2,441,1,452,1,453,1,469,1,470,1,475,1,476,1,481,1,482,1,485,1,486,1,509,1,512,1,529,2,532,1,534,1,535,1,536,1,549,1,550,1,552,1,553,1,554,1,555,1,558,2,559,2,566,2,567,2,568,2,590,1,591,1,594,1,595,1,626,3,627,3],"correspond":[7,3,8,3,9,2,10,2,11,6,12,6,18,1,19,1,20,2,22,3,23,3,24,3,25,3,28,6,29,6,30,2,31,2,32,2,34,2,64,1,65,1,67,1,74,2,75,3,76,3,78,3,81,2,82,3,85,2,86,2,87,2,88,2,90,3,92,2,101,3,102,2,103,2,104,1,105,5,106,5,109,1,143,1,150,2,151,1,179,2,185,1,186,1,199,2,200,2,201,1,202,1,203,2,204,1,205,1,206,1,207,1,208,1,209,1,213,1,214,1,215,1,216,1,219,2,220,2,221,2,222,2,223,2,224,2,227,1,228,1,229,1,230,1,231,1,232,1,235,1,236,1,237,2,242,2,244,4,245,4,246,1,247,1,253,2,254,3,255,3,258,2,259,1,260,3,261,3,265,1,266,3,267,5,269,3,270,3,271,6,272,1,273,6,274,4,277,8,278,6,282,2,283,2,286,1,287,1,288,1,289,1,290,1,291,1,292,1,293,7,294,5,295,3,296,2,297,3,298,2,299,3,300,2,301,3,303,3,304,3,305,5,306,3,307,1,308,1,309,5,310,1,316,3,321,3,323,1,324,1,326,7,327,2,328,1,330,1,333,1,343,5,356,2,357,2,358,1,359,1,363,4,364,1,378,2,381,4,382,6,386,3,387,3,388,2,389,2,398,3,399,3,400,2,401,2,403,2,404,1,405,1,406,1,415,2,416,2,417,2,418,2,421,2,422,1,429,1,431,2,432,2,441,1,452,1,453,1,459,1,460,1,463,4,464,4,465,4,466,4,472,4,478,4,487,2,488,2,491,3,492,3,493,2,494,2,495,2,496,2,497,2,498,2,501,2,502,2,503,3,504,4,505,5,509,5,511,1,522,2,523,2,524,2,525,2,529,2,532,2,533,1,534,1,535,1,536,1,539,1,540,1,541,1,542,5,543,5,545,4,546,4,547,5,548,2,551,2,556,2,558,2,559,2,560,2,566,2,567,3,568,2,570,2,571,4,578,2,579,2,582,2,583,2,590,2,591,2,594,1,595,1,598,2,599,2,604,2,605,2,606,2,608,3,620,1,622,2,625,4,626,3,627,3,628,2,629,2,630,2,631,2,632,2,633,2,634,1],"sse":[7,1,8,1,9,1,10,1,11,1,12,1,18,1,19,1,22,1,23,1,24,1,25,1,28,1,29,1,30,1,31,1,64,1,65,1,67,1,74,1,75,1,82,1,84,1,85,1,86,1,87,1,88,1,89,1,94,1,95,1,101,1,102,1,103,1,104,1,105,1,106,1,148,1,149,1,150,1,151,1,203,1,204,1,207,1,208,1,213,1,214,1,220,1,221,1,223,1,224,1,235,1,236,1,242,1,244,1,245,1,246,1,247,1,254,1,255,1,260,1,261,1,265,1,266,2,267,2,269,2,270,1,271,1,273,2,274,1,277,2,278,1,286,2,287,2,288,1,289,2,290,2,291,1,292,2,293,1,294,2,295,2,296,2,297,1,298,2,299,1,300,2,301,1,302,2,303,1,304,1,305,1,306,2,307,2,308,2,309,1,310,2,311,1,316,2,321,2,323,1,324,1,326,2,327,1,328,2,329,1,330,1,331,1,333,2,334,1,343,2,356,1,357,1,358,1,359,1,381,1,382,1,386,1,387,1,388,1,389,1,398,1,399,1,400,1,401,1,415,1,416,1,417,1,418,1,610,1,626,1,627,1,634,1],"distinct":[7,1,8,1,11,1,12,1,22,1,23,1,24,1,25,1,28,1,29,1,102,1,105,1,106,1,143,2,151,1,244,1,245,1,254,1,255,1,260,1,261,1,266,1,267,1,269,1,356,1,357,1,382,1,386,1,387,1,398,1,399,1,415,1,416,1,417,1,418,1,626,1,627,1],"unmodifi":[7,1,8,1,11,1,12,1,22,1,23,1,24,1,25,1,28,1,29,1,74,1,75,1,82,1,101,1,102,1,105,1,106,1,151,1,222,1,237,1,244,1,245,1,254,1,255,1,260,1,261,1,266,1,267,1,269,1,340,1,356,1,357,1,381,1,382,1,386,1,387,1,398,1,399,1,415,1,416,1,417,1,418,1,424,1,425,1,459,1,460,1,505,1,518,1,519,1,520,1,540,1,541,1,547,1,626,1,627,1],"addp":[8,1],"vaddp":[8,1],"sixteen":[8,2,23,2,25,2,75,4,81,4,92,4,102,4,255,2,387,2,434,4,444,2,468,12,472,4,474,12,478,4,480,16,484,16,493,3,494,3,605,3,606,3,627,2],"singl":[8,4,10,4,12,8,14,2,16,2,23,2,25,2,29,6,31,2,64,1,65,3,67,3,71,2,75,2,78,2,80,2,81,2,82,2,83,3,85,2,87,2,88,4,89,4,92,2,93,4,95,4,102,4,104,6,106,5,113,4,114,2,117,1,120,2,121,2,127,4,129,2,135,3,139,2,140,2,152,5,156,5,163,1,202,2,204,2,206,2,208,2,210,1,211,5,215,1,216,1,219,2,221,2,222,2,224,2,226,2,231,4,235,2,236,2,237,7,240,2,245,2,247,6,255,2,279,1,280,1,345,6,346,6,357,4,359,8,361,6,362,6,382,2,387,4,389,4,399,4,401,2,411,2,416,2,418,2,419,2,420,2,425,2,426,4,427,4,431,2,432,2,433,2,434,2,435,2,437,2,439,4,443,2,444,2,445,2,447,4,449,2,451,2,453,2,455,2,458,2,459,1,460,3,461,2,464,2,466,2,468,14,470,14,472,20,474,14,476,14,478,20,480,16,482,16,484,16,486,16,488,2,490,2,492,3,496,2,498,2,500,2,502,2,514,2,515,2,516,2,517,2,518,1,533,1,535,2,539,1,540,1,541,1,573,2,575,2,577,4,579,2,585,2,587,2,589,3,591,3,593,4,595,2,601,3,603,3,607,3,608,2,627,2],"addsd":[9,1],"vaddsd":[9,1],"low":[9,3,10,3,45,1,49,2,67,3,69,4,70,2,71,2,74,1,78,1,80,1,82,1,83,1,84,2,85,3,86,2,87,3,88,4,89,2,90,1,93,2,94,2,95,2,103,5,104,5,113,1,151,5,155,3,180,4,192,2,196,2,203,4,204,4,207,4,208,4,213,7,214,1,219,2,220,2,221,1,222,5,223,2,224,2,225,2,226,2,233,2,237,6,246,5,247,5,248,2,262,3,282,4,283,2,285,2,288,2,291,2,292,2,294,4,302,2,303,3,304,3,305,2,309,2,310,2,311,4,320,3,322,3,323,6,324,12,327,3,328,2,330,1,331,1,332,3,333,2,338,2,339,2,346,2,350,2,351,2,352,4,362,2,381,2,382,1,383,1,384,2,385,3,388,3,389,3,400,5,401,5,406,2,410,2,411,2,417,2,418,2,421,2,423,1,424,1,425,1,431,3,433,1,435,1,438,2,439,2,441,1,443,1,445,1,446,2,447,2,448,1,451,1,452,2,453,2,461,5,462,6,465,6,466,6,469,11,470,9,475,11,476,11,481,13,482,13,485,13,486,13,489,4,490,4,497,4,498,4,501,4,502,4,506,2,512,2,513,2,519,1,520,1,526,1,527,1,528,1,531,1,533,1,538,1,546,2,556,2,566,2,574,4,575,4,578,4,579,4,582,4,583,4,586,4,587,4,590,2,591,2,594,4,595,4,598,4,599,4,607,3,615,2,623,2,634,2],"sam":[9,1,10,1,14,1,15,1,16,1,17,1,30,1,31,1,39,2,51,1,52,1,53,2,54,2,55,5,59,1,61,2,63,2,72,2,96,2,101,1,103,1,104,1,108,1,115,1,116,1,117,1,118,3,119,1,122,1,123,1,124,1,125,1,126,1,127,1,128,2,130,2,131,1,132,1,133,1,134,1,135,1,136,1,137,1,138,1,141,2,143,3,145,3,153,1,158,1,159,1,167,1,184,1,185,1,189,1,203,1,204,1,207,1,208,1,209,2,212,2,215,2,216,2,232,1,242,2,246,2,247,1,249,1,251,1,256,1,268,1,270,1,272,1,293,2,294,2,305,1,313,1,315,1,321,1,327,1,330,1,341,1,342,1,343,2,345,1,346,1,354,1,358,1,359,1,361,1,362,1,364,1,370,2,371,1,381,1,388,1,389,1,390,1,391,2,392,2,394,1,396,1,400,1,401,1,408,1,412,1,413,1,414,1,456,2,530,1,532,1,533,1,596,1,597,1,598,1,599,1,611,1,612,1,613,1,622,2,625,2],"remain":[9,1,10,1,18,1,19,1,30,1,31,1,40,1,64,1,65,1,67,1,80,1,85,1,86,1,87,1,88,1,103,1,104,1,132,1,134,1,153,1,203,1,204,1,207,1,208,1,213,1,219,1,235,1,236,1,237,1,242,1,246,1,247,1,265,1,270,1,271,1,272,1,273,1,274,1,277,1,278,1,283,2,286,1,287,1,288,3,289,1,290,1,291,1,292,1,293,1,294,1,295,1,296,1,297,1,298,1,299,1,300,1,301,1,303,1,304,1,305,1,306,1,307,1,308,1,309,1,310,1,315,2,316,1,320,4,321,1,323,1,324,1,326,1,327,1,328,1,330,1,333,1,343,1,346,2,358,1,359,1,362,2,363,2,388,2,389,1,393,1,400,1,401,1,404,1,405,2,406,2,503,3,504,4],"vvvv":[9,2,10,2,18,1,19,1,70,2,71,2,89,2,95,2,103,2,104,2,113,2,179,1,184,1,210,2,211,2,217,4,218,4,225,1,226,1,227,2,230,2,231,2,239,4,240,4,247,1,284,2,285,2,288,1,323,1,336,1,394,1,411,2,424,1,425,1,427,2,428,1,429,1,430,1,433,1,434,1,435,1,436,1,437,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,447,1,448,1,449,1,450,1,451,1,457,1,458,1,459,1,460,1,461,2,467,1,468,1,469,2,470,2,471,1,472,1,475,2,476,2,477,1,478,1,479,1,480,1,481,2,482,2,483,1,484,1,485,2,486,2,488,1,489,1,490,1,495,1,496,1,512,2,513,1,518,2,519,1,520,1,521,1,534,2,536,2,539,1,540,1,541,1,544,1,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,576,1,577,1,580,1,581,1,596,1,597,1,609,1,610,1],"127":[9,1,10,1,64,2,65,1,67,1,85,1,86,1,87,1,88,1,103,2,104,1,169,1,195,1,203,1,219,1,237,2,242,1,246,1,388,2,389,1,400,1,401,1,452,1,453,1,465,2,466,2,469,1,470,1,475,1,476,1,481,1,482,1,485,1,486,1,497,2,498,2,501,2,502,2,578,2,579,2,582,2,583,2,586,2,587,2,590,2,591,2,594,1,595,1,598,2,599,2],"copi":[9,1,10,1,28,6,29,6,30,1,31,1,62,1,67,1,85,1,86,1,87,1,88,1,103,2,104,2,105,1,106,1,112,2,163,1,203,1,212,2,220,1,221,1,237,1,246,1,247,1,270,1,271,4,292,2,322,4,323,5,324,5,325,3,337,2,342,2,384,2,385,1,388,1,389,1,396,1,400,1,401,1,452,1,453,1,465,2,466,2,497,2,498,2,501,2,502,2,503,3,504,4,505,1,509,4,528,2,529,2,530,1,535,2,537,1,547,1,574,1,575,1,578,2,579,2,582,2,583,2,586,2,587,2,590,2,591,2,594,1,595,1,598,2,599,2,615,4,634,4],"quadword":[9,1,30,5,31,1,64,2,66,6,70,2,71,2,80,2,83,1,84,3,85,1,86,6,87,2,88,2,89,2,93,2,94,5,95,2,96,4,103,4,123,2,125,1,151,6,155,6,177,2,178,2,184,1,194,1,203,2,207,2,209,2,212,2,217,1,218,1,219,7,222,7,227,2,228,2,232,2,233,4,246,2,262,2,272,2,274,2,278,2,303,3,304,3,305,2,311,2,323,14,324,14,328,6,329,4,331,6,333,5,338,2,339,2,367,3,388,2,395,1,400,3,410,2,421,2,423,1,428,2,430,2,433,2,435,2,436,2,437,2,438,2,439,2,440,2,442,2,443,2,445,2,446,4,447,2,450,2,451,2,452,4,453,2,462,1,463,2,465,6,481,1,485,1,497,2,501,4,516,1,520,2,532,2,534,4,536,4,541,2,542,2,543,2,558,4,559,4,560,2,566,3,567,3,568,3,569,2,571,2,578,2,579,2,590,4,594,4,604,2],"element":[9,1,10,1,30,5,31,5,85,1,87,1,103,2,104,2,105,2,106,2,150,4,161,2,163,4,235,2,237,1,242,2,246,1,247,1,258,2,269,4,270,6,271,2,273,4,274,4,275,1,276,1,277,6,278,6,279,1,280,1,291,2,305,11,309,4,311,1,322,6,326,12,328,4,329,10,331,4,332,3,333,2,338,4,339,4,353,1,381,6,382,12,388,1,389,1,400,1,401,1,419,1,420,1,421,4,422,11,423,4,424,3,425,3,432,1,454,3,459,9,460,9,463,13,464,13,465,15,466,15,471,4,472,4,477,4,478,4,481,1,482,1,485,1,486,1,487,6,488,6,489,4,490,4,491,11,492,11,493,6,494,6,495,4,496,4,497,4,498,4,501,4,502,4,505,10,507,1,508,1,509,2,510,8,511,11,512,2,513,2,518,3,519,3,520,3,521,8,522,2,523,2,529,1,530,7,531,9,532,5,533,5,534,8,535,3,536,5,537,4,538,9,539,5,540,9,541,9,542,17,543,17,544,8,545,4,546,4,547,10,548,4,549,4,550,4,551,2,552,6,553,4,554,4,555,2,556,7,557,2,558,2,559,2,560,13,565,2,566,9,567,10,568,9,569,4,570,2,571,6,574,5,575,5,578,2,579,2,580,6,581,6,582,8,583,8,586,6,587,6,590,6,591,6,594,4,595,4,596,2,597,2,598,4,599,4,604,11,605,6,606,6,607,1,608,3],"accord":[9,1,10,1,49,2,63,2,66,2,67,1,70,2,71,2,76,1,77,1,78,1,80,1,81,1,83,1,84,1,85,1,86,2,87,2,89,1,94,1,103,1,104,1,118,2,119,2,122,2,125,1,135,1,141,2,162,1,194,2,217,1,218,1,234,1,235,1,236,1,237,1,239,1,240,1,246,1,247,1,257,1,258,2,272,4,274,1,275,2,276,1,278,1,279,2,280,1,305,1,321,2,353,1,356,1,357,1,358,1,359,1,367,1,381,1,382,1,386,1,387,1,388,1,389,1,395,1,398,1,399,1,400,1,401,1,407,2,410,2,411,2,423,2,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,452,2,453,2,461,2,462,3,463,1,464,1,465,1,466,1,481,1,482,1,485,1,486,1,487,2,488,2,489,2,490,2,503,3,504,3,512,2,521,2,528,2,529,2,531,2,534,3,535,2,536,3,538,2,544,2,549,1,550,1,552,1,553,1,554,1,555,1,558,1,559,1,571,4,576,1,577,1,578,2,579,2,582,2,583,2,588,1,589,1,590,2,591,2,592,2,593,2,594,2,595,2,598,2,599,2],"addss":[10,1],"vaddss":[10,1],"doubleword":[10,1,41,7,51,1,65,2,66,7,67,2,74,2,75,2,76,2,77,3,79,2,80,2,81,2,83,3,84,1,85,2,86,2,87,7,88,2,89,2,90,3,91,3,92,3,93,3,94,1,95,5,96,3,104,3,114,2,120,2,121,2,123,2,125,2,129,2,139,2,140,2,162,6,177,2,178,2,183,1,194,8,204,2,208,2,209,2,212,2,213,10,216,2,217,1,218,1,229,2,232,2,234,6,237,6,247,2,257,6,259,3,260,4,262,1,273,3,277,3,290,4,294,4,305,14,311,5,313,2,315,2,322,14,328,5,329,5,331,5,332,2,338,2,339,2,346,2,362,2,367,7,389,1,395,8,401,3,411,2,421,2,423,1,429,2,438,2,439,2,441,2,444,2,446,2,447,4,448,2,449,2,452,2,453,4,462,2,464,4,466,6,482,1,486,1,498,4,502,4,507,2,508,2,515,1,519,2,524,4,525,4,529,4,535,4,540,2,542,2,543,2,553,5,558,4,559,4,560,2,566,3,567,3,568,3,569,2,571,2,591,2,595,4,604,2],"addsubpd":[11,1],"vaddsubpd":[11,1],"odd":[11,4,12,4,235,2,471,4,472,4,477,4,478,4,506,2],"third":[11,2,12,2,21,2,27,2,28,2,29,2,30,1,31,1,49,4,64,2,65,2,67,1,85,3,86,1,87,1,88,1,101,2,102,2,105,2,106,2,142,1,143,2,152,3,156,3,180,2,190,2,219,2,220,1,221,1,222,2,223,1,224,1,237,1,248,2,270,4,271,2,282,2,283,2,285,2,291,2,305,4,320,1,321,1,322,2,325,2,356,2,357,2,358,2,359,2,365,2,379,1,380,1,421,2,422,2,463,2,464,2,465,2,466,2,467,6,468,6,469,6,470,6,471,6,472,6,473,6,474,6,475,6,476,6,477,6,478,6,479,6,480,6,481,5,482,5,483,6,484,6,485,5,486,5,491,1,492,1,497,2,498,2,501,2,502,2,503,3,504,4,509,2,511,2,526,2,527,2,528,2,529,5,530,5,531,4,532,2,533,1,534,4,535,4,536,4,537,2,538,4,545,2,546,2,556,2,558,1,559,1,567,2,569,2,570,2,571,2,572,2,573,2,574,2,575,2,578,2,579,2,582,2,583,2,586,2,587,2,590,2,591,2,598,2,599,2,607,6],"even":[11,4,12,4,129,1,132,1,134,1,166,1,189,2,214,2,236,2,305,7,390,2,412,1,426,1,427,1,455,1,471,4,472,4,477,4,478,4,491,2,492,2,506,2,542,2,543,2,616,1],"xmm8":[11,1,12,1,77,1,79,1,80,1,83,1,91,1,93,1,151,1,152,1,155,1,156,1,184,1,225,1,226,1,233,1,266,1,267,1,269,1,273,1,277,1,285,1,291,1,293,1,294,1,302,1,306,1,307,1,308,1,310,1,311,1,316,1,321,1,322,1,323,1,324,1,325,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,343,1,345,1,346,1,361,1,362,1],"xmm15":[11,1,12,1,77,1,79,1,80,1,83,1,91,1,93,1,151,1,152,1,155,1,156,1,184,1,225,1,226,1,233,1,266,1,267,1,269,1,273,1,277,1,285,1,291,1,293,1,294,1,302,1,306,1,307,1,308,1,310,1,311,1,316,1,321,1,322,1,323,1,324,1,325,1,328,1,329,1,330,1,331,1,333,1,334,1,335,1,343,1,345,1,346,1,361,1,362,1,609,2],"figur":[11,1,12,1,39,2,108,2,133,1,137,2,151,2,155,2,166,1,235,2,236,2,238,2,259,2,261,2,262,2,263,2,264,2,294,2,307,2,308,2,310,2,320,2,322,4,323,2,324,2,325,2,328,2,329,2,331,2,332,2,334,2,335,2,338,2,339,2,345,2,346,2,356,1,357,1,358,1,359,1,361,2,362,2,364,3,415,2,487,1,488,1,489,1,490,1,499,2,500,2,501,2,502,2,507,2,532,1,533,1,572,1,573,1,574,1,575,1,584,1,585,1,586,1,587,1,588,3,589,3,590,3,591,3],"3":[11,2,12,1,14,1,15,1,16,1,17,1,26,1,28,2,30,1,31,1,39,2,45,3,46,1,47,1,48,1,57,2,69,1,100,1,106,1,132,1,134,1,139,1,143,9,144,1,148,1,150,1,151,2,155,2,157,1,166,2,187,1,209,1,235,2,242,6,249,1,270,1,284,2,285,2,292,2,318,1,319,1,321,2,322,1,323,2,324,2,341,1,342,3,356,1,357,1,358,1,359,1,363,4,381,1,383,1,393,1,395,2,404,2,405,6,406,3,419,1,420,1,487,1,499,2,500,2,501,2,502,2,507,1,508,1,514,1,515,1,516,1,517,1,526,1,527,1,530,1,531,3,534,1,536,1,537,1,538,3,569,3,572,3,573,3,574,3,575,3,588,1,589,1,590,1,591,1,615,1,618,2,634,1],"addsubp":[12,1],"vaddsubp":[12,1],"adox":[13,3],"aesdec":[14,2],"vaesdec":[14,1],"round":[14,6,15,4,16,6,17,4,18,2,19,4,74,1,76,3,77,2,78,3,80,2,81,3,83,2,84,2,85,2,86,5,87,6,89,3,90,1,91,1,92,1,93,1,94,2,95,1,115,2,123,2,124,2,125,2,126,2,128,7,130,1,131,2,135,2,306,2,345,1,346,1,356,13,357,13,358,13,359,13,361,1,362,1,374,2,375,6,378,7,419,1,420,1,426,2,427,2,428,3,429,3,430,3,432,3,433,3,434,3,435,3,438,3,439,3,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,452,5,453,6,455,2,467,3,468,3,469,3,470,3,471,4,472,4,473,3,474,3,475,3,476,3,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4,485,4,486,4,576,1,577,1,578,1,579,1,581,4,583,4,584,2,585,2,586,2,587,2,588,10,589,10,590,10,591,10,592,1,593,1,594,1,595,1,597,4,599,4,600,2,601,2,602,2,603,2],"aes":[14,2,15,2,16,2,17,2,18,1,19,2],"decryption":[14,4,15,2,18,1],"flow":[14,2,15,2,16,2,17,2,403,1,406,1],"invers":[14,2,15,2,18,1,148,4],"cipher":[14,2,15,2,18,1,19,2],"depend":[14,4,15,4,16,4,17,4,30,2,31,2,57,1,66,2,79,1,96,2,100,2,105,2,106,2,133,1,137,2,138,1,144,2,157,2,158,2,159,2,162,2,167,2,186,2,194,2,195,2,199,2,200,2,234,4,238,2,241,2,243,5,256,2,257,2,270,2,271,2,315,1,345,1,346,1,350,1,364,1,367,2,370,2,395,2,459,1,460,1,497,1,498,1,505,2,509,2,531,1,538,1,540,1,541,1,547,2,548,2,551,2,624,2,628,1,629,1,630,1,631,1,632,1,633,1],"key":[14,2,15,2,16,2,17,2,18,2,19,4,281,5,315,1,409,2],"use":[14,2,16,2,26,2,37,2,40,2,44,2,50,1,51,4,56,1,59,2,60,2,63,2,68,2,69,1,77,1,79,1,80,1,83,1,84,1,86,1,87,2,89,1,91,1,93,1,94,1,95,1,96,3,99,4,100,2,108,2,132,1,133,1,134,1,138,1,143,1,144,1,151,1,152,1,155,1,156,1,157,2,160,4,164,6,165,2,166,1,167,2,169,1,184,3,187,1,188,1,189,1,191,3,192,2,193,2,194,1,197,3,199,2,200,2,209,2,210,2,211,2,212,2,213,3,215,2,216,5,217,1,227,2,228,2,229,4,230,2,231,2,232,2,233,1,238,2,241,2,243,2,249,4,265,1,268,2,272,2,281,1,282,2,283,2,286,1,287,1,289,1,290,1,291,2,293,1,306,1,313,2,315,3,318,2,319,1,321,1,326,1,341,2,342,2,344,1,350,2,351,1,352,1,353,1,354,1,367,1,370,1,385,1,402,3,413,2,426,1,427,1,452,1,453,1,463,1,464,1,465,1,466,1,491,2,492,2,565,3,612,2,613,1,620,2,623,1,628,1,629,1,630,1,631,1,632,1,633,1,634,1],"but":[14,1,16,1,55,1,56,1,66,2,112,1,119,1,124,2,141,1,147,1,162,1,169,1,189,2,194,1,195,3,197,2,199,2,200,2,216,1,228,1,234,3,251,2,257,1,268,1,281,2,305,3,311,1,315,2,328,1,341,1,342,1,344,1,352,2,367,1,395,1,413,1,530,1,537,1,565,1,613,2],"last":[14,2,15,2,16,2,17,2,18,1,133,1,137,2,161,2,275,1,279,1,340,1,353,1,364,2,379,1,380,1],"aesdeclast":[14,1,15,1],"non":[14,1,15,1,16,1,17,1,21,1,27,1,32,1,33,1,34,1,49,1,52,1,59,3,60,2,61,2,72,2,84,1,94,1,100,1,108,1,109,6,115,1,116,1,117,1,118,1,122,1,123,1,124,1,125,1,126,1,127,1,128,1,132,1,134,1,136,1,137,1,138,1,141,1,144,3,145,1,146,2,153,1,157,1,158,1,159,1,185,1,189,1,199,3,200,3,215,4,216,4,227,7,228,6,229,7,230,7,231,7,232,8,248,1,249,1,251,1,256,1,268,1,275,1,276,1,279,1,280,1,282,1,283,3,284,2,291,1,313,1,315,1,317,1,352,2,354,2,355,1,356,1,357,1,358,1,359,1,360,1,365,1,367,2,369,2,371,1,379,1,380,1,383,1,385,3,390,1,394,1,395,2,408,2,412,1,413,1,414,1,424,1,425,1,456,1,519,1,520,1,570,2,588,1,589,1,590,1,591,1,596,1,597,1,598,1,599,1,611,1,612,1,613,1],"destructiv":[14,1,15,1,16,1,17,1],"requir":[14,1,15,1,16,1,17,1,21,1,27,1,32,1,33,1,34,1,49,1,60,2,69,1,143,3,148,1,184,1,198,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,213,1,215,2,248,1,249,2,272,1,282,1,283,1,284,1,353,1,355,1,365,1,402,1,465,1,466,1,505,1,547,1],"fault":[14,1,15,1,16,1,17,1,56,1,112,1,116,2,148,1,149,1,150,1,165,1,228,1,272,1,413,1,419,1,420,1,426,1,463,1,464,1,465,2,466,2,505,4,507,1,508,1,518,1,522,1,523,1,524,1,525,1,539,1,547,4,557,2,561,1,562,1,563,1,564,1,565,1,622,1],"suppression":[14,1,15,1,16,1,17,1,148,1,149,1,150,1,272,1,419,1,420,1,426,1,507,1,508,1,518,1,522,1,523,1,524,1,525,1,539,1,557,2,561,1,562,1,563,1,564,1,565,1],"vaesdeclast":[15,1],"aesenc":[16,2],"vaesenc":[16,1],"encryption":[16,4,17,2,19,2],"aesencclast":[16,1],"aesenclast":[17,1],"vaesenclast":[17,1],"aesimc":[18,2],"vaesimc":[18,1],"invmixcolumn":[18,2],"transformation":[18,2,148,4,149,4,584,4,585,4,586,4,587,4],"should":[18,1,44,1,55,3,56,1,60,1,66,1,70,1,87,1,88,1,143,4,147,1,158,1,162,1,165,2,191,1,192,2,194,1,197,1,198,1,199,2,200,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,234,1,246,1,247,1,249,1,257,1,317,1,385,1,388,1,389,1,395,1,408,1,414,1,463,1,464,1,465,1,466,1,588,1,589,1,590,1,591,1,596,1,597,1,598,1,599,1,612,2,615,2,619,1,634,2],"appli":[18,1,100,1,157,1,505,1,547,1],"expand":[18,1,19,2,276,1,280,1,459,2,460,2,539,2,540,2,541,2],"except":[18,1,116,1,118,1,124,1,136,1,138,1,191,1,251,2,315,2,344,3,413,1],"order":[18,1,27,2,44,2,45,3,55,3,56,4,60,5,69,8,73,2,104,1,117,1,189,6,190,4,192,2,196,2,199,1,200,1,215,4,216,4,225,2,226,2,227,1,228,1,229,1,230,1,231,1,232,1,243,2,247,1,268,4,275,1,276,1,279,1,280,1,282,2,283,2,293,4,294,2,313,2,317,1,320,2,322,13,325,7,327,2,328,2,329,2,330,2,331,2,338,4,339,4,341,2,346,2,349,2,350,8,351,7,352,9,362,2,371,11,381,2,384,4,385,4,413,2,431,2,566,2,567,2,568,2,615,8,616,1,623,8,634,8],"prepar":[18,1],"them":[18,1,221,1,224,3,225,2,226,2,282,2,283,2,322,2,323,2,324,2,325,2,600,2,601,2],"defin":[18,1,30,4,31,4,57,1,62,1,148,4,149,2,166,1,169,1,270,4,276,1,280,1,344,1,353,2,356,1,357,1,358,1,359,1,368,2,385,1,393,1,432,1,463,1,464,1,465,1,466,1,514,1,515,1,516,1,517,1,588,1,589,1,590,1,591,1],"fip":[18,1],"197":[18,1],"reserv":[18,1,19,1,70,1,71,1,89,1,95,1,113,1,164,2,179,1,184,1,210,1,211,1,217,2,218,2,225,1,226,1,227,1,230,1,231,1,239,2,240,2,284,2,285,2,288,1,315,1,323,1,336,1,363,2,394,3,408,1,411,1,412,2,414,1,423,1,424,1,425,1,427,1,428,1,429,1,430,1,433,1,434,1,435,1,436,1,437,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,447,1,448,1,449,1,450,1,451,1,457,1,458,1,459,1,460,1,461,1,488,1,489,1,490,1,495,1,496,1,512,3,513,1,514,1,515,1,516,1,517,1,518,2,519,1,520,1,521,1,534,1,536,1,539,1,540,1,541,1,544,1,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,576,1,577,1,580,1,581,1,596,1,597,1,609,1,610,1,615,4,634,5],"1111b":[18,1,19,1,70,1,71,1,89,1,95,1,113,1,179,1,184,1,210,1,211,1,217,2,218,2,225,1,226,1,227,1,230,1,231,1,239,2,240,2,284,2,285,2,288,1,323,1,336,1,394,1,411,1,424,1,425,1,428,1,429,1,430,1,433,1,434,1,435,1,436,1,437,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,447,1,448,1,449,1,450,1,451,1,457,1,458,1,459,1,460,1,461,1,488,1,489,1,490,1,495,1,496,1,512,1,513,1,518,2,519,1,520,1,521,1,534,1,536,1,539,1,540,1,541,1,544,1,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,576,1,577,1,580,1,581,1,596,1,597,1,609,1,610,1],"otherwis":[18,1,19,1,20,2,26,2,30,1,31,1,68,3,69,3,70,1,71,1,85,2,89,1,95,1,99,1,113,1,158,1,160,1,179,1,184,1,210,1,211,1,217,2,218,2,225,1,226,1,227,3,230,3,231,3,239,2,240,2,243,1,253,2,266,2,267,2,270,2,273,2,274,2,277,2,278,2,279,1,280,1,284,2,285,2,288,1,291,2,307,1,308,1,310,1,316,2,323,1,326,1,336,1,337,2,342,1,349,3,379,1,380,1,394,2,404,1,405,1,406,2,411,1,424,2,425,2,427,1,428,1,429,1,430,1,433,1,434,1,435,1,436,1,437,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,447,1,448,1,449,1,450,1,451,1,456,2,457,1,458,1,459,1,460,1,461,1,488,1,489,1,490,1,495,1,496,1,504,1,512,1,513,1,518,3,519,2,520,2,521,1,526,1,527,1,531,1,534,1,536,1,538,1,539,1,540,1,541,1,544,1,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,570,2,571,2,576,3,577,3,578,2,579,2,580,1,581,1,592,1,593,1,594,1,595,1,596,1,597,1,609,1,610,1,615,1,616,3,618,1,634,1],"ud":[18,1,19,1,21,1,27,1,30,2,31,2,32,1,33,1,34,1,38,1,49,1,52,1,70,1,71,1,89,1,95,1,109,3,113,1,179,1,184,1,193,1,209,1,210,1,211,1,217,2,218,2,225,1,226,1,227,1,230,1,231,1,239,2,240,2,248,1,270,3,282,1,283,1,284,2,285,2,288,1,291,3,307,1,308,1,310,1,323,1,326,1,336,1,337,1,349,1,355,1,365,1,390,1,394,2,411,1,412,2,423,1,424,1,425,1,427,1,428,1,429,1,430,1,433,1,434,1,435,1,436,1,437,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,447,1,448,1,449,1,450,1,451,1,457,1,458,1,459,1,460,1,461,1,488,1,489,1,490,1,495,1,496,1,504,1,512,3,513,1,518,2,519,1,520,1,521,1,526,1,527,1,534,1,535,1,536,1,539,1,540,1,541,1,544,1,548,1,549,1,550,1,551,1,552,1,553,1,554,1,555,1,576,1,577,1,580,1,581,1,596,1,597,1,608,3,609,1,610,1,616,1],"aeskeygenassist":[19,1],"vaeskeygenassist":[19,1],"assist":[19,2],"comput":[19,2,130,4,131,4,132,6,134,2,146,2,147,2,148,2,149,2,187,2,196,1,258,2,320,3,329,1,331,1,346,2,362,2,375,2,378,2,388,2,389,2,407,2,419,2,420,2,421,1,454,2,457,2,458,2,507,2,508,2,580,2,581,2,582,2,583,2,594,2,595,2,596,2,597,2,598,2,599,2,617,2,620,3,622,2],"step":[19,2,154,1,419,2,420,2,507,2,508,2],"toward":[19,2,90,1,91,1,92,1,93,1,95,1,100,1,130,1,131,1,157,1,344,2,364,2,365,2,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1],"specifi":[19,4,27,2,41,2,45,4,46,2,47,2,48,2,49,4,50,4,55,2,56,2,60,2,62,2,66,7,105,1,106,1,113,2,125,1,128,2,129,1,133,2,135,1,136,2,137,2,141,2,142,2,143,2,144,2,159,2,161,4,162,6,164,2,166,5,168,1,169,6,177,2,178,2,183,2,184,2,186,4,187,2,194,3,195,2,196,2,199,2,200,2,209,1,215,2,227,1,228,1,229,1,230,1,231,1,232,1,234,7,248,2,256,2,257,6,285,2,291,2,292,2,312,2,317,2,318,5,319,4,327,4,328,5,329,5,330,4,331,5,336,1,344,2,350,2,353,3,354,1,355,2,356,2,357,2,358,2,359,2,364,2,365,3,367,5,379,1,380,1,395,3,413,4,432,2,456,2,461,3,462,3,463,4,464,4,465,4,466,4,487,5,488,5,489,5,490,5,491,3,492,3,493,3,494,3,499,6,500,6,501,6,502,6,505,2,534,2,536,2,542,2,543,2,547,2,556,1,558,4,559,4,560,2,566,2,567,4,568,2,569,1,584,1,585,1,586,1,587,1,588,3,589,3,590,3,591,3,592,1,593,1,594,1,595,1,604,2,605,3,606,3,608,1,615,2,618,4,623,2,624,3,628,2,629,2,630,2,631,2,632,2,633,2,634,2],"8":[19,2,27,2,49,2,56,1,60,1,62,1,67,1,69,2,105,2,106,2,108,2,117,2,128,1,132,2,133,2,134,2,137,4,138,1,148,11,149,13,150,3,159,4,161,4,162,2,164,2,168,1,169,1,177,4,178,4,180,2,189,1,190,2,195,1,209,1,210,2,211,2,216,3,218,1,226,4,242,2,256,4,257,2,261,6,262,2,275,4,276,3,279,1,285,2,291,2,292,2,293,2,302,1,312,1,320,8,322,2,325,1,327,2,328,1,330,2,332,1,340,1,342,1,364,1,368,2,371,1,381,1,383,3,413,1,424,3,459,3,460,2,463,1,464,1,465,1,466,1,487,2,488,2,492,2,512,2,514,1,515,2,516,2,517,2,519,2,520,3,526,2,527,2,540,1,541,3,542,2,543,2,556,4,558,3,559,3,560,4,565,1,572,2,573,2,604,2,609,1,610,1,611,1,612,1,613,1,615,1,621,1,624,1,628,1],"constant":[19,2,40,1,41,1,128,10,148,1,149,2,265,2,321,2,378,2,491,2,492,2,561,2,563,2],"bitwis":[20,2,21,2,22,2,23,2,24,2,25,2,171,2,172,2,174,2,175,2,176,2,179,4,181,2,182,2,252,2,253,2,254,2,255,2,266,2,267,4,316,2,336,4,343,2,570,4,571,4,608,3,625,2,626,2,627,2],"each":[20,2,26,2,30,5,31,5,39,2,56,1,62,5,64,5,65,5,112,1,116,1,117,2,124,1,128,2,136,1,137,1,138,1,148,1,153,1,164,2,169,3,195,2,199,1,200,1,201,2,202,2,205,2,206,2,216,1,242,7,252,4,253,4,258,2,266,2,267,2,269,2,270,2,272,2,275,2,276,2,279,2,280,2,281,2,283,2,289,4,290,8,293,4,295,2,296,2,297,2,298,2,299,2,300,2,301,2,302,2,306,6,307,2,308,2,309,4,310,2,313,2,316,2,321,6,322,2,323,4,324,4,325,2,326,2,327,1,328,2,329,4,331,2,343,4,350,2,351,2,352,2,353,1,356,2,357,2,364,2,381,2,382,7,419,2,420,2,454,3,455,1,463,2,464,2,465,2,466,2,487,5,488,5,489,3,490,3,491,3,492,3,495,5,496,5,497,1,498,1,499,1,500,1,505,3,507,2,508,2,513,2,514,4,515,4,516,4,517,4,521,4,528,1,530,2,531,2,532,4,533,4,534,3,536,3,537,2,538,2,544,2,545,4,546,4,547,3,548,2,551,2,556,9,557,2,565,4,566,1,567,1,568,1,569,6,570,2,571,4,572,1,573,1,574,1,575,1,607,1,615,3,623,2,625,4,634,2],"andn":[21,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1],"logical":[21,2,22,2,23,2,24,2,25,2,153,2,154,2,166,1,254,2,255,2,266,2,267,2,316,2,336,2,343,2,364,2,365,2,370,1,379,1,380,1,404,2,405,1,407,2,570,2,571,4,612,1,613,1,617,2,620,7,622,8,626,2,627,2,628,2,629,4,630,2,631,2,632,2,633,2],"invert":[21,2,179,2,608,3],"w1":[21,2,27,2,32,2,33,2,34,2,49,2,89,2,95,2,113,2,248,2,282,2,283,2,355,2,365,2,439,2,446,1,447,1,452,1,453,1],"ignor":[21,1,27,1,30,2,31,2,32,1,33,1,34,1,45,1,49,1,55,1,57,2,74,1,86,1,109,2,113,3,118,2,119,2,122,1,141,2,154,2,163,1,189,1,195,2,228,1,242,2,248,1,262,3,270,2,272,2,282,1,283,1,311,1,313,2,317,2,318,2,319,2,328,1,333,2,338,2,339,2,347,1,349,1,350,2,355,1,363,2,365,1,370,1,371,1,381,3,431,1,432,1,448,1,452,1,503,3,504,4,614,1,615,4,616,1,623,2,628,1,629,1,630,1,631,1,632,1,633,1,634,4],"attempt":[21,1,27,1,30,1,31,1,32,1,33,1,34,1,49,1,52,1,74,1,86,1,109,2,115,1,209,2,248,1,270,1,281,1,282,1,283,1,291,1,355,1,365,1,390,1,448,1,452,1,504,1,535,1,608,3,615,1,622,2,634,3],"l":[21,1,27,1,32,1,33,1,34,1,49,1,70,2,87,2,88,2,109,2,227,1,230,1,246,2,247,2,248,1,270,1,282,1,283,1,284,3,285,2,288,1,291,3,307,1,308,1,310,1,323,1,326,1,355,1,365,1,388,2,389,2,394,1,504,2,526,1,527,1,535,2],"caus":[21,1,27,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,2,40,1,49,1,52,1,55,1,57,2,72,1,77,1,80,1,83,1,91,1,93,1,112,1,116,1,119,2,124,1,136,1,137,1,138,1,141,2,154,1,167,2,186,2,191,1,192,1,193,2,199,1,200,1,209,3,233,1,248,1,249,1,268,1,270,1,282,1,283,1,291,1,312,2,344,1,350,1,353,2,355,1,360,2,365,1,383,1,390,1,408,1,412,1,491,1,492,1,504,1,505,1,535,1,547,1,608,3,610,1,611,2,615,1,617,2,620,4,622,1,634,4],"andnpd":[22,1],"vandnpd":[22,1],"andnp":[23,1],"vandnp":[23,1],"andpd":[24,1],"vandpd":[24,1],"andp":[25,1],"vandp":[25,1],"arpl":[26,3],"compar":[26,2,35,2,36,2,63,2,64,2,65,2,66,3,67,2,68,2,69,2,70,2,71,2,117,1,118,5,119,1,122,3,141,3,196,1,201,3,202,3,203,3,204,3,205,3,206,3,207,3,208,3,273,5,274,2,275,2,276,2,277,5,278,2,279,2,280,2,295,2,296,2,297,2,298,2,299,2,300,2,301,2,367,2,410,2,411,2,514,2,515,2,516,2,517,2,572,1,573,1],"rpl":[26,13,167,1],"field":[26,11,40,2,45,3,46,2,47,2,48,2,125,1,128,3,135,1,143,3,148,2,149,2,150,6,163,1,167,1,183,2,189,1,191,4,193,2,197,2,242,2,275,1,276,1,279,1,280,1,315,1,322,4,323,4,324,4,325,4,336,1,347,2,354,1,356,3,357,3,358,3,359,3,370,1,371,1,383,1,427,1,432,4,467,1,468,1,469,2,470,2,471,2,472,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2,485,2,486,2,503,3,504,4,506,4,526,6,527,4,532,1,533,2,572,1,573,1,574,1,575,1,588,3,589,3,590,3,591,3,608,1,614,2],"segment":[26,11,37,1,40,1,50,3,56,1,66,3,112,1,162,4,167,3,168,2,169,3,183,9,186,16,187,2,190,1,191,18,194,4,196,14,197,16,199,4,200,4,209,18,215,4,234,6,257,4,312,8,313,2,340,2,347,2,367,2,384,10,395,4,396,8,404,2,405,2,413,2,415,1,416,1,417,1,418,1,456,15,614,2,624,4],"selector":[26,9,167,2,183,2,186,8,191,8,196,2,197,8,209,6,312,4,340,1,384,10,396,6,403,3,404,3,405,3,406,3,422,1,456,4,510,3,511,1,607,3],"other":[26,2,32,2,51,1,55,3,56,1,57,2,60,1,96,1,108,5,112,1,132,1,153,1,164,2,166,2,169,2,195,1,215,1,216,1,228,1,249,1,272,2,281,1,282,2,291,2,292,1,293,2,294,2,313,1,315,1,317,5,318,1,341,1,342,1,344,2,361,1,362,1,371,2,408,1,412,1,413,1,414,1,491,1,492,1,505,1,521,2,542,1,543,1,547,1,560,1,592,1,593,1,594,1,595,1,600,1,601,1,602,1,603,1,604,1,612,1,613,1,623,1,634,1],"locat":[26,2,41,2,66,1,143,2,159,1,183,1,191,2,197,2,234,2,243,4,250,2,256,1,257,1,354,2,384,2,532,1,533,1,624,2,628,2,629,2,630,2,631,2,632,2,633,2],"less":[26,2,41,2,62,1,70,2,71,2,100,1,130,1,131,1,132,2,157,1,167,1,169,1,259,1,260,2,261,2,263,2,272,2,275,1,276,1,315,1,326,2,334,2,335,2,340,1,344,1,345,1,346,1,364,1,365,1,370,2,410,2,411,2,424,2,425,2,457,2,458,2,459,1,460,1,518,1,519,2,520,2,540,1,541,1,542,1,543,1,576,2,577,2,578,2,579,2,580,2,581,2,582,2,583,2,592,2,593,2,594,2,595,2,596,2,597,2,598,2,599,2],"than":[26,3,35,2,36,2,41,4,44,2,45,1,46,1,47,1,48,1,49,2,68,1,69,1,70,4,71,4,77,1,83,1,90,1,91,1,92,1,93,1,95,1,100,2,108,2,113,2,120,1,121,1,129,1,130,1,131,1,132,3,134,3,139,1,140,1,147,1,157,2,165,1,166,1,167,1,177,2,178,2,259,2,260,4,261,4,263,4,264,2,265,1,275,2,276,2,277,2,278,2,279,1,280,1,315,2,318,1,322,2,323,1,324,1,325,1,326,2,327,2,328,2,329,2,330,2,331,2,334,4,335,2,340,1,345,2,346,2,350,2,361,1,362,1,379,1,380,1,383,1,408,1,410,4,411,4,412,1,414,1,424,2,425,2,457,2,458,2,459,1,460,1,491,1,492,1,518,1,519,2,520,2,528,2,529,2,530,1,535,2,537,1,540,1,541,1,542,2,543,2,558,2,559,2,560,1,566,1,567,1,568,1,576,2,577,2,578,2,579,2,580,2,581,2,582,2,583,2,592,3,593,3,594,3,595,3,596,2,597,2,598,2,599,2,604,1,619,1,623,2],"zf":[26,4,32,2,62,2,70,2,71,2,119,2,169,2,175,3,179,4,183,3,195,3,196,2,281,2,336,2,353,7,363,2,370,3,407,2,410,2,411,2,456,5,608,6,635,2],"increas":[26,2],"match":[26,3,37,2,194,1,367,1,395,1,463,1,464,1,465,1,466,1],"chang":[26,2,39,1,50,1,168,1,195,1,268,1,315,2,352,1,379,1,380,1,385,1,403,1],"mad":[26,2,109,1,122,2,302,2,354,2,634,2],"provid":[26,1,44,2,56,1,60,1,66,3,107,2,112,2,121,1,137,1,140,1,142,1,147,1,162,3,164,2,189,1,191,1,192,2,194,3,197,1,212,2,215,1,234,3,249,2,257,3,268,2,281,2,364,1,367,2,370,1,371,1,379,1,380,1,382,4,385,1,393,1,395,3,404,2,405,2,409,2,412,2,537,2,569,1,617,2,619,1,624,3,628,2,629,2,630,2,631,2,632,2,633,2],"operat":[26,4,51,1,57,1,59,2,72,2,116,1,124,1,133,6,136,1,137,6,138,1,142,2,143,2,144,5,148,1,149,2,150,2,190,1,191,1,192,1,197,1,249,2,258,6,268,1,269,2,287,2,294,1,315,2,320,4,326,3,332,2,333,2,335,1,342,1,353,1,360,2,383,1,385,1,396,1,404,2,414,1],"system":[26,4,56,1,59,2,60,1,109,1,133,1,154,1,164,2,189,1,190,1,191,1,192,1,197,1,228,1,249,2,317,1,353,1,360,5,383,1,385,1,393,1,396,1,402,3,403,4,404,6,405,2,406,2,414,1,456,2],"procedur":[26,2,50,7,59,2,72,4,108,2,112,11,133,1,153,1,165,1,167,5,188,6,192,2,354,4,360,2,385,1,393,1,403,1,404,4,405,4,406,1,612,1,613,1],"also":[26,1,33,2,45,1,46,1,47,1,48,1,56,1,60,2,66,1,68,1,69,1,117,1,119,1,122,1,125,1,127,1,132,1,135,1,138,1,143,1,145,1,158,1,162,1,164,1,165,2,167,2,186,1,193,1,194,1,195,1,234,1,257,1,279,1,280,1,317,2,318,1,319,1,350,1,351,1,352,2,353,1,368,2,395,1,403,1,419,1,420,1,467,3,468,3,469,3,470,3,471,2,472,2,473,3,474,3,475,3,476,3,477,2,478,2,479,2,480,2,481,1,482,1,483,2,484,2,485,1,486,1,530,2,531,1,537,4,538,1,572,1,573,1,574,1,575,1,580,1,581,1,582,1,583,1,588,1,589,1,590,1,591,1,612,3,613,1,615,2,618,2,620,2,621,1,624,1,634,2],"application":[26,7,59,1,133,1,189,1,190,1,191,1,192,1,197,1,360,2,371,1,383,1,385,1],"generally":[26,1,169,1,195,1,463,1,464,1,465,1,466,1],"has":[26,1,36,1,38,2,56,1,60,1,108,1,109,1,113,1,130,1,131,1,132,1,133,1,158,2,163,1,166,1,191,1,192,2,193,2,196,2,197,1,279,1,280,1,281,1,353,1,412,1,572,1,573,1,574,1,575,1,615,1],"been":[26,1,108,1,132,1,133,2,137,1,143,3,351,1,491,1,492,1,542,1,543,1],"pass":[26,2,133,1,354,1],"program":[26,6,132,1,133,1,134,1,153,1,165,1,167,6,168,2,188,1,190,1,191,1,192,3,195,1,197,1,248,2,272,1,281,4,317,1,318,1,319,1,354,3,360,4,383,1,385,2,408,1,612,1,613,1],"privileg":[26,5,50,2,56,1,59,2,107,2,153,2,154,2,165,1,167,1,249,2,315,6,350,3,351,3,352,2,354,2,385,1,402,3,403,4,404,6,405,6,406,3,408,1,413,1,414,1,456,2,612,1,613,1,615,1,634,1],"level":[26,3,50,2,55,4,56,5,60,4,66,1,107,2,112,7,153,1,154,2,159,1,162,1,169,1,194,1,195,1,234,1,249,2,256,1,257,1,315,4,317,3,318,2,319,2,350,3,351,3,352,2,354,2,367,1,395,1,402,1,403,4,404,8,405,10,406,3,408,1,413,1,414,1,456,2,463,3,464,3,465,3,466,3,615,1,624,1,629,1,630,1,632,1,634,1],"plac":[26,2,41,1,153,2,177,2,178,2,184,2,268,2,288,2,321,2,354,2,356,2,357,2,358,2,359,2,491,1,492,1,542,1,543,1,557,2,588,2,589,2,590,2,591,2,618,1],"execution":[26,1,44,1,55,2,56,5,60,6,62,2,72,1,109,5,153,6,154,1,165,1,166,2,167,1,169,2,185,1,189,5,193,2,195,1,209,1,249,2,281,1,317,1,351,2,352,2,354,1,368,2,369,2,371,2,393,5,406,1,408,1,412,1,413,2,612,1,613,1,615,1,616,2,617,2,620,7,622,4,635,2],"ensur":[26,1,55,1,70,1,87,1,88,1,158,1,189,1,193,2,246,1,247,1,368,2,371,3,388,1,389,1,402,1,403,4,404,3,405,2,406,3,611,1],"receiv":[26,1,68,1,69,1,189,2,228,2,344,1,360,2,381,2,382,6,406,1],"lower":[26,1,33,2,35,6,38,5,39,2,40,2,41,5,148,1,158,1,180,2,190,4,220,1,221,2,242,1,279,1,280,1,283,2,315,2,342,2,358,2,378,2,381,1,382,2,396,1,437,1,491,1,492,1,609,1,610,3],"hav":[26,1,57,2,66,1,105,1,106,1,109,2,133,1,137,1,143,3,162,1,189,4,194,1,234,1,257,1,350,2,351,1,352,1,367,1,370,2,395,1,491,2,492,2,542,2,543,2,612,1,613,1,616,1,624,1],"higher":[26,1,27,2,36,2,49,2,113,2,177,2,178,2,189,1,214,2,371,1,542,2,543,2,610,2],"read":[26,1,35,1,36,1,37,1,38,1,40,1,56,2,60,2,66,2,68,1,69,1,162,4,189,1,193,1,194,2,199,2,200,1,212,1,215,3,227,1,228,9,229,1,230,1,231,1,232,1,234,4,248,2,257,4,312,1,337,2,348,2,349,2,350,5,351,5,352,5,355,2,367,2,395,3,402,1,404,1,405,1,456,1,615,2,623,4,634,2],"stack":[26,1,50,4,58,4,77,1,80,1,83,1,91,1,93,1,108,2,112,18,115,2,116,2,118,4,119,3,120,4,121,4,122,3,123,2,124,2,125,3,127,6,128,2,129,4,132,3,133,3,134,2,135,7,137,1,139,4,140,4,141,4,142,3,145,4,146,2,147,2,161,4,167,3,188,12,200,1,209,3,233,1,312,10,313,5,315,5,340,15,341,6,342,15,354,7,369,2,402,3,403,7,404,2,405,2,406,8],"call":[26,1,45,2,46,2,47,2,48,2,50,19,108,1,112,2,164,6,167,2,188,6,209,1,281,1,354,10,402,1,403,5,404,4,406,3],"encodabl":[26,1,99,1,160,1,187,1,284,1],"check":[26,1,37,2,40,2,52,2,56,1,115,1,116,2,117,2,118,1,119,1,122,1,124,1,132,1,133,2,134,1,136,2,137,1,138,2,141,1,143,1,144,1,164,1,169,2,183,3,195,1,196,2,329,1,331,1,353,1,390,2,413,3,415,1,416,1,417,1,418,1,456,2,487,10,488,2,489,2,490,2,611,2,615,1],"caller":[26,1],"chapter":[26,1,46,1,47,1,48,1,50,2,59,2,60,1,112,1,117,3,118,1,119,1,122,1,128,1,132,1,133,1,134,1,138,1,141,1,159,1,162,1,164,2,166,1,167,2,168,1,185,2,188,1,190,1,199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1,256,1,257,2,341,1,342,1,350,1,351,1,352,2,354,1,360,1,368,2,383,1,385,1,403,2,406,2,408,2,413,1,611,1,612,2,613,1,615,3,621,3,623,1],"protect":[26,1,50,1,59,2,133,1,137,2,153,1,165,1,167,1,168,1,186,2,190,2,191,1,192,4,197,1,209,1,216,1,227,1,229,1,230,1,231,1,232,1,312,1,315,2,350,1,354,1,384,2,396,1,404,1,405,1,612,1,613,1],"management":[26,1,50,1,109,1,249,2,360,3,393,1,413,1],"intel":[26,1,44,1,50,2,59,2,63,1,68,1,69,1,105,2,106,2,108,2,112,1,116,3,117,2,124,3,128,3,132,2,133,1,134,1,136,3,137,2,138,4,153,2,159,1,162,1,164,5,166,3,167,2,168,1,185,2,188,1,190,1,192,2,193,1,199,1,200,1,209,2,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,238,2,256,1,257,1,262,2,263,2,264,2,268,1,317,1,318,1,319,1,332,2,334,2,335,2,337,4,340,2,341,1,342,1,345,3,346,3,349,1,350,5,351,3,352,4,354,1,360,1,361,2,362,2,364,3,368,2,370,1,383,4,384,1,385,3,395,1,403,1,406,1,408,2,413,1,415,2,611,1,612,2,613,1,615,7,616,1,618,1,621,1,623,5,628,4,629,4,630,3,631,3,632,4,633,4,634,5],"ia":[26,1,44,1,50,2,59,2,63,1,105,2,106,2,108,2,112,1,116,1,117,4,118,2,119,1,124,1,125,1,128,1,132,1,133,1,134,1,136,1,137,2,138,2,141,1,144,2,153,1,159,1,162,1,164,2,166,4,167,2,168,1,185,2,188,1,190,1,192,1,193,2,199,1,200,1,209,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,238,2,256,1,257,1,262,2,263,2,264,2,268,2,317,1,318,1,319,1,332,2,334,2,335,2,337,2,341,1,342,1,345,3,346,3,350,1,351,1,352,2,354,1,360,1,361,2,362,2,364,3,368,2,370,1,383,1,384,1,385,2,395,1,403,1,404,1,405,1,406,1,408,1,413,1,415,2,611,1,612,2,613,1,615,3,618,1,619,1,621,1,623,1,628,4,629,4,630,3,631,3,632,4,633,4,634,1],"architectur":[26,1,50,2,59,2,63,1,105,2,106,2,108,2,112,1,116,1,117,3,124,1,128,1,132,1,133,1,134,1,136,1,137,2,138,2,159,1,162,1,164,2,166,3,167,2,168,1,185,2,188,1,190,1,193,1,199,1,200,1,209,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,238,2,256,1,257,1,262,2,263,2,264,2,317,1,318,1,319,1,332,2,334,2,335,2,337,2,341,1,342,1,345,3,346,3,349,1,350,5,351,3,352,4,354,1,360,1,361,2,362,2,364,3,368,2,370,1,383,1,385,1,395,1,403,1,406,1,408,1,413,1,415,2,611,1,612,2,613,1,615,7,616,1,618,1,621,1,623,5,628,4,629,4,630,3,631,3,632,4,633,4,634,5],"softwar":[26,1,44,1,50,2,55,1,56,1,59,2,60,2,63,1,70,1,72,2,73,1,87,1,88,1,105,3,106,3,108,2,109,4,112,1,116,1,117,3,124,1,128,1,132,2,133,1,134,2,136,1,137,2,138,2,144,1,147,1,154,1,159,1,162,1,164,5,165,1,166,3,167,4,168,1,183,1,185,2,188,1,190,2,191,1,192,1,196,1,197,1,199,1,200,1,209,2,215,2,216,2,227,1,228,1,229,1,230,1,231,1,232,1,238,2,246,1,247,1,248,2,249,1,256,1,257,1,262,2,263,2,264,2,281,3,287,1,332,3,333,1,334,2,335,2,337,4,341,1,342,1,345,3,346,3,349,1,350,1,351,2,352,3,354,1,360,1,361,2,362,2,364,3,368,2,370,1,383,2,385,2,388,1,389,1,395,1,396,1,402,2,403,4,404,2,405,2,406,3,408,1,412,2,413,1,415,2,456,1,569,1,611,1,612,3,613,1,615,4,616,1,618,1,621,1,623,2,628,4,629,4,630,3,631,3,632,4,633,4,634,2],"developer":[26,1,50,2,59,2,63,1,105,3,106,3,108,2,112,1,116,1,117,2,124,1,128,1,132,1,133,1,134,1,136,1,137,2,138,2,159,1,162,1,164,2,166,3,167,2,168,1,185,2,188,1,190,1,199,1,200,1,209,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,238,2,256,1,257,1,262,2,263,2,264,2,332,2,334,2,335,2,337,2,341,1,342,1,345,3,346,3,350,1,351,1,352,2,354,1,360,1,361,2,362,2,364,3,368,2,370,1,383,1,385,1,395,1,403,1,406,1,408,1,413,1,415,2,611,1,612,2,613,1,615,3,618,1,621,1,623,1,628,4,629,4,630,3,631,3,632,4,633,4,634,1],"manual":[26,1,50,2,59,2,63,1,105,3,106,3,108,2,112,1,116,1,117,2,124,1,128,1,132,1,133,1,134,1,136,1,137,2,138,2,159,1,162,1,164,2,166,3,167,2,168,1,185,2,188,1,190,1,199,1,200,1,209,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,238,2,256,1,257,1,262,2,263,2,264,2,317,1,318,1,319,1,332,2,334,2,335,2,337,2,341,1,342,1,345,3,346,3,350,1,351,1,352,2,354,1,360,1,361,2,362,2,364,3,368,2,370,1,383,1,385,1,395,1,403,1,406,1,408,1,413,1,415,2,611,1,612,2,613,1,615,3,618,1,621,1,623,1,628,4,629,4,630,3,631,3,632,4,633,4,634,1],"volum":[26,1,50,2,59,2,63,1,105,2,106,2,108,2,112,1,116,1,117,2,124,1,128,1,132,1,133,1,134,1,136,1,137,2,138,2,159,1,162,1,164,2,166,3,167,2,168,1,185,2,188,1,190,1,199,1,200,1,209,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,238,2,256,1,257,1,262,2,263,2,264,2,332,2,334,2,335,2,337,2,341,1,342,1,345,3,346,3,350,1,351,1,352,2,354,1,360,1,361,2,362,2,364,3,368,2,370,1,383,1,385,1,395,1,403,1,406,1,408,1,413,1,415,2,611,1,612,2,613,1,615,3,618,1,621,1,623,1,628,4,629,4,630,3,631,3,632,4,633,4,634,1],"3a":[26,1,50,1,59,1,166,3,167,2,168,1,209,1,228,1,341,1,368,2,413,1,612,2,613,1,615,2,621,1],"mor":[26,1,46,1,47,1,48,1,55,2,59,2,112,1,121,1,129,1,140,1,147,1,159,1,169,2,193,1,227,1,229,1,230,1,231,1,232,1,256,1,257,1,322,2,323,1,324,1,325,1,337,2,342,1,344,1,352,1,360,1,364,1,365,1,370,1,379,2,380,2,385,1,395,1,528,2,529,2,530,1,535,2,537,1,572,2,573,2,574,2,575,2,611,1,621,3],"information":[26,1,46,1,47,1,48,1,50,4,59,2,69,1,72,1,107,1,112,1,117,1,143,7,144,1,159,1,166,3,168,3,183,1,186,1,188,1,190,1,209,3,227,1,228,1,229,1,230,1,231,1,232,1,256,1,257,1,275,1,276,1,279,1,280,1,281,6,312,2,342,1,352,1,354,1,360,5,383,1,385,1,395,1,408,1,413,1,414,1,611,1,612,1,621,3,622,2],"about":[26,1,59,2,112,1,342,1,352,1,360,1,385,1],"bextr":[27,1],"extract":[27,12,32,2,105,2,106,2,113,3,225,2,226,2,265,2,283,2,284,2,461,3,462,3,495,2,496,2,497,2,498,2,556,2,561,2,562,2,563,2,564,2],"contiguous":[27,2,282,2,283,8,424,7,425,5,459,2,460,2,518,2,519,5,520,5,540,2],"index":[27,2,37,2,40,3,41,8,42,4,43,4,49,6,54,2,164,2,214,2,235,2,236,2,275,3,279,4,280,1,288,2,321,4,392,2,414,1,491,1,492,1,493,2,494,2,528,1,530,2,531,1,534,1,536,1,537,1,538,1,542,5,543,5,560,4,569,5,604,4,605,2,606,2,615,1,624,5],"specify":[27,4,38,1,40,1,50,3,64,2,65,2,66,3,67,2,109,2,112,2,125,2,135,2,162,2,163,3,164,2,168,3,186,5,190,2,194,2,234,2,242,6,249,1,257,2,285,6,291,4,292,5,350,2,354,2,356,2,357,2,358,2,359,2,367,2,383,2,395,2,404,1,405,1,414,1,487,2,488,2,489,2,490,2,491,3,492,3,514,2,515,2,516,2,517,2,569,3,588,2,589,2,590,2,591,2,615,1,620,4,624,3,628,2,629,2,630,2,631,2,632,2,633,2,634,1],"start":[27,10,45,1,67,1,73,2,180,2,184,2,303,1,304,3,379,1,380,1,381,2,382,2,419,1,420,1,424,1,425,1,459,1,460,1,507,1,508,1,519,1,520,1,540,1,541,1,556,2,618,2,620,2],"position":[27,8,34,2,45,2,46,2,47,2,48,2,96,6,105,1,106,1,242,2,269,2,283,2,344,4,358,2,359,2,364,1,610,2],"extraction":[27,2,461,3,462,3],"exceed":[27,2,41,2],"maximum":[27,2,50,1,72,1,77,1,83,1,90,1,91,1,92,1,93,1,95,1,169,1,201,2,202,2,203,2,204,2,295,2,296,2,297,2,404,2,405,2,414,1,576,2,577,2,578,2,579,2,580,2,581,2,582,2,583,2,592,2,593,2,594,2,595,2,596,2,597,2,598,2,599,2,600,1,601,1,602,1,603,1],"up":[27,2,33,2,112,1,128,2,132,1,134,1,184,2,188,2,251,2,302,2,402,1,408,1,414,1,423,1,424,2,425,2,435,2,445,2,459,2,460,2,463,12,464,12,465,12,466,12,491,3,492,3,493,2,494,2,514,1,515,1,516,1,517,1,518,3,519,2,520,2,539,2,540,2,541,2,560,2,569,1,604,2,605,2,606,2],"operandsiz":[27,2,49,4,112,3,365,1],"written":[27,2,28,2,29,2,40,4,55,2,56,2,60,2,64,4,65,3,67,1,68,2,69,2,85,1,87,1,101,2,102,2,143,2,165,4,199,4,200,3,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,213,2,215,1,216,1,227,1,229,1,230,1,231,1,232,1,242,2,262,3,263,2,264,2,271,2,275,1,276,1,279,1,280,1,311,1,317,1,321,2,332,3,333,2,334,2,335,2,340,1,365,2,378,1,384,2,385,1,396,1,404,1,405,1,421,2,422,2,424,2,425,2,487,2,488,2,489,2,490,2,495,2,496,2,497,2,498,2,499,2,500,2,501,2,502,2,509,2,510,2,511,2,514,1,515,1,516,1,517,1,518,1,519,2,520,2,521,2,530,2,531,2,532,1,533,1,537,2,538,2,542,2,543,2,549,1,550,1,552,1,553,1,554,1,555,1,566,1,568,1,569,2,572,2,573,2,574,2,575,2,576,1,577,1,578,1,579,1,581,2,582,2,583,2,597,2,598,2,599,2,615,1],"blendpd":[28,1],"vblendpd":[28,1],"merg":[28,2,29,2,199,1,216,1,223,1,224,1,421,1],"determin":[28,2,29,2,41,2,50,1,51,1,55,1,96,1,112,4,158,1,159,2,162,2,187,4,199,1,200,1,249,1,256,1,257,2,271,2,284,2,288,2,312,4,313,2,315,1,322,2,340,5,341,1,342,1,353,1,413,3,509,2,518,2,532,1,533,1,539,2,607,3,618,1],"whether":[28,2,29,2,119,1,144,2,195,2,199,1,200,1,271,2,350,1,456,2,509,2],"mask":[28,2,29,2,30,11,31,11,64,3,65,3,67,3,76,1,77,1,81,1,83,1,84,2,89,1,90,1,91,1,92,1,93,1,94,2,95,1,105,7,106,7,118,1,119,1,120,1,124,2,125,2,137,3,141,1,145,1,146,1,170,6,171,6,172,6,173,3,174,4,175,4,176,6,181,6,182,6,185,1,199,7,200,6,209,1,225,6,226,8,249,1,270,7,271,4,274,1,276,3,278,1,280,3,282,6,283,4,302,3,321,8,344,2,364,1,365,1,379,3,380,4,403,1,419,2,420,2,421,3,422,3,428,1,429,1,430,1,432,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,463,4,464,4,465,4,466,4,467,1,468,1,471,1,472,1,473,1,474,1,477,1,478,1,479,1,480,1,483,1,484,1,487,2,488,2,489,2,490,2,491,10,492,9,493,2,494,2,505,10,506,6,507,2,508,2,509,4,510,5,511,3,514,5,515,5,516,5,517,5,542,10,543,10,547,10,548,3,551,5,560,6,565,2,570,2,592,1,593,1,594,1,595,1,600,1,601,1,602,1,603,1,604,6,605,2,606,2,628,2,629,2,630,2,631,2,632,2,633,2],"els":[28,2,29,2,179,4,270,1,271,2,509,2,608,6,635,2],"blendp":[29,1],"vblendp":[29,1],"blendvpd":[30,3],"vblendvpd":[30,1],"copy":[30,2,31,2,34,2,49,2,51,5,96,6,107,6,112,1,135,2,159,2,162,2,163,1,173,2,188,2,209,2,213,2,219,1,222,1,238,2,241,2,256,2,257,2,270,2,285,2,291,4,292,1,317,1,322,4,323,2,324,2,325,2,342,2,344,1,528,2,529,2,534,4,535,2,536,4,624,2],"assignment":[30,1,31,1,270,1],"implicit":[30,1,31,1,154,2,248,2,270,3,378,2,408,1,414,1,628,2,629,2,630,2,631,2,632,2,633,2],"architectural":[30,2,31,2,55,2,268,1,270,2,350,3,620,2,622,2],"xmm0":[30,2,31,2,270,6,276,4,280,4,378,4,609,4],"implicitly":[30,1,31,1,270,1],"blendvp":[31,3],"vblendvp":[31,1],"dword":[31,4,106,1,152,10,156,15,213,1,242,2,284,8,285,1,291,4,295,2,297,2,298,2,299,2,301,2,303,6,304,5,309,2,359,2,372,2,373,2,374,2,375,2,376,2,377,2,378,4,454,3,491,1,492,2,493,2,494,2,496,4,509,2,511,2,521,2,522,2,523,2,531,1,533,2,538,1,544,2,557,2,575,4,587,6,605,2,606,2],"blsi":[32,3],"lowest":[32,2,33,2,34,2,293,6,317,1,358,2,359,4,419,1,459,1,460,1,507,1,508,1,540,1,541,1],"blsmsk":[33,3],"includ":[33,2,44,1,55,2,107,1,115,2,128,2,147,1,153,4,164,1,183,1,215,2,216,2,344,1,588,1,589,1,590,1,591,1,615,1,618,1,622,2],"blsr":[34,3],"reset":[34,2,108,1,133,1,153,2,154,4,185,1,279,1,280,1,351,2,352,2],"bndcl":[35,1],"address":[35,4,36,7,37,14,38,3,40,14,41,2,45,3,46,1,47,1,48,1,50,3,55,2,56,3,59,2,60,2,66,4,107,3,109,2,125,2,135,1,159,7,162,7,166,3,167,1,168,3,183,2,184,2,187,14,190,13,191,2,192,2,194,5,195,4,197,2,199,6,200,6,215,14,216,4,227,1,228,1,229,1,230,1,231,1,232,1,234,8,249,6,256,5,257,9,281,3,285,2,312,2,315,1,328,1,329,1,340,4,341,1,347,3,348,2,350,1,352,2,354,5,367,4,369,2,383,1,395,4,402,3,403,5,404,1,413,14,414,2,491,4,492,4,505,2,542,2,543,2,547,2,560,2,604,2,614,3,615,3,617,2,618,4,620,5,622,2,624,9,628,2,629,2,630,2,631,2,632,2,633,2,634,1],"bound":[35,4,36,6,37,10,38,11,39,4,40,7,41,25,556,1],"bnd":[35,4,36,6,38,4,40,2],"lb":[35,2,37,1,38,2],"bndstatus":[35,2,36,2],"01h":[35,2,36,2,56,1,249,1],"signal":[35,2,36,2,41,2,70,2,71,2,125,1,135,1,153,6,165,1,193,8,356,1,357,1,358,1,359,1,411,2,457,2,458,2,572,1,573,1,574,1,575,1,580,2,581,2,582,2,583,2,612,1,613,1,618,1],"br":[35,2,36,2,41,2],"exception":[35,2,36,2,38,1,39,2,41,4,57,2,70,3,71,3,76,2,77,4,80,2,81,2,83,4,84,4,89,2,90,2,91,4,92,2,93,4,94,4,95,2,100,1,108,1,109,2,116,13,118,5,119,6,120,2,124,8,125,3,128,2,130,1,131,1,132,1,133,3,134,1,135,4,136,5,137,9,138,7,141,5,143,5,144,2,145,1,146,1,147,2,153,2,154,1,157,1,164,11,167,8,185,4,186,2,191,1,193,2,209,6,210,2,211,2,217,1,227,2,230,2,231,2,233,2,249,2,265,1,281,1,286,2,287,2,289,2,290,2,293,2,306,1,315,1,321,2,341,2,342,1,345,1,346,1,349,3,350,1,353,2,356,2,357,2,358,2,359,2,383,1,393,2,402,1,403,1,406,2,411,3,412,7,419,3,420,3,426,1,428,2,429,2,430,2,431,1,432,1,433,2,434,2,435,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,456,1,463,2,464,2,465,2,466,2,491,6,492,6,535,1,542,7,543,7,560,5,572,1,573,1,574,1,575,1,576,2,577,2,578,2,579,2,588,1,589,1,590,1,591,1,594,2,595,2,600,1,601,1,602,1,603,1,604,5,611,5,615,3,616,3,623,1,628,1,629,1,630,1,631,1,632,1,633,1,634,3],"writ":[35,1,36,1,37,1,38,1,40,1,56,2,60,6,68,2,69,2,112,1,144,1,165,2,170,2,171,2,172,2,174,2,176,2,181,2,182,2,193,1,199,4,200,4,212,1,215,9,216,9,227,7,228,5,229,7,230,7,231,7,232,7,248,2,281,2,283,2,318,2,340,1,355,2,368,2,371,2,384,1,404,1,405,1,413,2,414,1,431,2,456,1,467,3,468,3,469,2,470,2,471,1,472,1,473,3,474,3,475,2,476,2,477,1,478,1,479,1,480,1,483,1,484,1,506,2,556,2,565,1,612,6,613,4,615,4,616,2,634,3],"bndcn":[36,2],"bndcu":[36,2],"ub":[36,2,37,1,38,2],"complement":[36,2,37,1,38,2,46,2,61,2,250,2,287,1,332,1,333,1],"befor":[36,1,41,1,50,1,55,1,56,1,60,1,66,1,77,1,80,1,83,1,91,1,93,1,96,3,108,2,112,2,116,2,120,1,121,1,122,2,124,1,127,2,129,1,133,2,136,2,137,1,138,3,139,1,140,1,158,1,162,1,165,1,183,1,189,5,194,1,195,1,196,2,209,1,215,2,216,2,233,1,234,1,257,1,341,2,351,2,352,1,356,1,357,1,358,1,359,1,368,2,371,2,393,2,395,1,402,1,403,1,406,3,491,1,492,1,542,1,543,1,581,2,583,2,597,2,599,2,611,3,612,1,613,1,624,1],"proceed":[36,1,165,1,611,2,612,1,613,1],"comparison":[36,2,37,1,62,1,63,2,64,19,65,18,66,4,67,16,68,2,69,2,118,2,119,6,122,5,138,1,141,5,169,1,179,2,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,275,1,276,1,279,1,280,1,353,1,367,8,514,17,515,16,516,16,517,17,521,2,571,2,572,3,573,3,574,2,575,2,608,3],"directly":[36,1,50,1,190,1,199,1],"already":[36,1,41,1,317,2,318,1,319,1,402,1,491,2,492,2,542,2,543,2,560,2,604,2,620,2],"revert":[36,1],"out":[36,1,132,2,134,2,147,1,189,1,256,1,257,5,353,2,364,2,371,1,379,1,380,1,539,1,556,1],"effectiv":[36,1,37,1,38,2,40,1,41,1,45,1,55,1,107,3,187,2,199,2,200,2,228,1,413,1],"computation":[36,1,37,1,38,2,40,1,275,1,276,1,305,3,311,1,345,2,361,2,386,2,387,2,467,2,468,2,469,2,470,2,473,2,474,2,475,2,476,2,576,2,577,2,578,2,579,2,592,2,593,2],"m32":[36,1,38,4,50,1],"identical":[36,1,38,2,248,1,491,1,492,1],"behavior":[36,1,38,3,56,2,59,1,60,2,70,1,87,1,88,1,143,1,147,1,199,1,200,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,209,1,246,1,247,1,317,2,318,2,319,1,348,2,351,1,352,3,356,1,357,1,358,1,359,1,360,1,384,1,385,3,388,1,389,1,588,1,589,1,590,1,591,1,612,1],"lea":[36,1,38,2,187,1],"bndldx":[37,3],"linear":[37,5,40,5,55,2,56,3,60,2,166,3,190,3,413,1],"construct":[37,2,40,2,353,1,367,1],"displacement":[37,2,40,2,45,2,46,1,47,1,48,1,50,1,168,1,459,1,460,1,539,1,540,1,541,1],"sib":[37,2,40,2,491,2,492,2],"mib":[37,8,40,8],"translation":[37,3,40,3,166,4,196,1,615,1],"tabl":[37,3,40,3,56,1,57,1,62,1,100,1,105,1,106,1,107,1,118,2,119,2,122,2,125,1,126,1,130,1,131,1,132,2,134,1,139,1,141,2,143,9,144,1,146,1,147,1,148,1,157,1,169,1,187,3,190,11,191,6,197,2,243,2,272,2,281,3,315,1,353,1,356,1,357,1,358,1,359,1,383,3,384,2,408,1,413,1,414,1,427,1,432,1,455,1,463,6,464,6,465,6,466,6,487,1,488,1,489,1,490,1,495,1,496,1,497,1,498,1,514,1,515,1,516,1,517,1,530,4,531,7,537,9,538,7,569,5,572,3,573,3,574,2,575,2,578,1,579,1,588,1,589,1,590,1,591,1,624,12],"entry":[37,3,40,3,107,2,209,1,402,1,404,1,405,1,615,1,624,4],"load":[37,2,39,2,50,1,55,1,56,3,58,2,60,1,62,1,66,1,68,4,69,2,72,1,108,1,112,1,115,3,123,2,128,2,143,2,162,1,183,7,184,5,185,2,186,9,189,5,190,7,191,6,192,5,194,8,196,8,197,7,209,9,210,3,211,3,215,3,217,1,218,1,220,3,221,3,223,3,224,3,228,5,234,1,237,1,239,2,240,2,257,1,312,4,313,4,328,1,329,1,347,2,350,4,351,4,352,7,363,2,371,2,383,2,385,1,395,1,403,7,404,4,405,4,406,14,413,3,419,1,420,1,423,3,456,1,459,2,460,2,491,4,492,4,493,1,494,1,505,2,507,1,508,1,512,2,539,3,540,2,541,2,542,2,543,2,547,2,614,2,619,2,623,4,624,1],"bte":[37,7,40,5],"pointer":[37,3,40,2,41,2,50,4,77,1,80,1,83,1,91,1,93,1,112,14,118,1,119,1,120,1,121,1,122,1,124,6,125,1,129,1,133,2,135,1,137,5,139,1,140,1,141,1,153,2,161,2,167,1,168,1,169,3,186,5,188,8,195,2,196,1,200,1,209,2,233,1,312,6,340,6,342,5,354,2,402,4,403,5,404,1,405,1,406,5,412,1],"fail":[37,1,68,1,69,1,622,2],"init":[37,1,153,2,623,1],"0x0":[37,3,175,1],"articulat":[37,1],"earlier":[37,1,44,2,68,1,69,1,117,1,188,2,268,1,619,2],"therefor":[37,1,132,1,134,1],"full":[37,1,166,1,459,1,460,1,539,1,540,1,541,1,628,2,629,2,630,2,631,2,632,2,633,2],"nor":[37,1,40,1,128,2,139,1,146,1,191,2,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,426,1,427,1,455,1,463,1,464,1,465,1,466,1],"referenc":[37,1,40,1,44,2,51,1,55,1,56,1,58,2,60,1,96,2,143,2,186,3,187,1,191,1,197,1,209,2,228,1,305,2,313,1,315,1,317,2,318,1,319,1,340,1,341,1,342,1,383,1,402,2,403,2,404,2,405,2,406,2,412,1,419,1,420,1,505,1,507,1,508,1,547,1,621,2],"overrid":[37,1,40,1,66,1,162,2,194,2,199,2,200,2,215,3,216,1,227,1,228,2,229,1,230,1,231,1,232,1,234,2,257,2,313,1,342,1,367,2,395,2,413,1,624,2],"apply":[37,1,40,1,132,1,134,1,281,2,327,2,330,1,353,1],"dur":[37,1,40,1,55,1,56,1,60,1,167,1,189,1,193,2,227,2,229,2,230,2,231,2,232,2,360,2,395,1,620,1,622,2],"assum":[37,1,40,1,66,1,115,1,130,1,131,1,132,2,134,1,139,1,146,1,147,1,162,2,194,2,227,2,230,2,231,2,232,2,234,1,257,2,367,2,395,2,459,1,460,1,539,1,540,1,541,1,624,1],"segmentation":[37,1,40,1],"canonical":[37,1,40,1,402,1,403,2,404,1,596,1,597,1,598,1,599,1],"violation":[37,1,40,1,268,4],"bndmk":[38,1],"m64":[38,4,50,1,58,2],"b":[38,2,63,1,116,2,146,3,148,5,149,6,370,1,375,4,378,3,531,1,538,1],"did":[38,1,414,1],"reg":[38,2,40,2,336,1,370,1,467,1,468,1,469,1,470,1,471,1,472,1,475,1,476,1,477,1,478,1,479,1,480,1,481,1,482,1,483,1,484,1,485,1,486,1,506,2,608,1],"retain":[38,1,55,2,60,6,73,1,147,1,358,2,359,2,421,1],"nop":[38,1,40,1,55,1,251,5,268,1],"invalid":[38,1,70,2,71,2,76,1,77,1,81,1,83,1,84,2,89,1,90,1,91,1,92,1,93,1,94,2,95,1,109,1,115,2,118,4,119,4,125,4,141,3,183,1,191,1,209,1,249,2,279,2,280,2,349,1,360,4,411,2,412,6,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,572,1,573,1,574,1,575,1,596,2,597,2,598,2,599,2,616,1],"opcod":[38,1,51,1,62,2,96,2,99,1,109,1,133,1,137,2,159,1,160,1,162,2,164,2,167,1,169,2,186,4,189,2,193,2,209,1,243,2,249,2,256,1,257,2,312,2,313,1,315,1,341,1,342,1,349,1,364,1,370,3,371,2,412,8,616,1,618,3],"rip":[38,1,50,1,195,1,403,2,406,2],"relativ":[38,1,50,2,56,1,60,1,135,1,168,3,169,3,184,1,190,1,195,2,215,1,216,1,345,2,346,2,361,2,362,2,371,2,432,1,457,2,458,2,491,2,492,2,556,1,576,2,577,2,578,2,579,2,580,2,581,4,582,2,583,4,592,2,593,2,594,2,595,2,596,2,597,4,598,2,599,4,620,4],"bndmov":[39,3],"mov":[39,6,55,4,62,8,117,2,138,1,142,1,173,2,184,1,192,2,209,5,210,8,211,8,213,3,215,2,216,2,217,3,218,2,219,4,220,3,221,3,222,4,223,3,224,3,227,2,229,2,230,2,231,2,232,2,233,2,234,10,237,7,239,3,240,3,317,1,318,1,319,1,340,2,353,2,381,2,382,2,385,1,505,2,518,1,539,1,547,2,607,9],"shown":[39,2,166,1,187,2,243,2,281,1,356,1,357,1,358,1,359,1,363,2,487,1,488,1,489,1,490,1,572,1,573,1,574,1,575,1,588,1,589,1,590,1,591,1],"5":[39,2,45,2,105,2,242,1,318,2,319,1,322,1,341,1,344,2,345,4,346,2,361,3,362,1,363,4,364,1,380,1,408,1,413,1,414,1,432,1,455,1,487,3,488,2,489,2,490,2,495,1,496,1,497,1,498,1,499,2,500,2,501,2,502,2,514,1,515,1,516,1,517,1,526,1,527,1,528,1,530,2,532,1,533,1,537,2,569,3,572,4,573,4,574,3,575,3,578,1,579,1,584,1,585,1,586,1,587,1,588,2,589,2,590,2,591,2,628,1,629,1,630,1,631,1,632,1,633,1],"bndstx":[40,3],"treat":[40,1,51,1,55,1,60,2,73,1,96,1,120,1,129,1,313,1,315,1,341,1,342,1,345,1,346,1,361,1,362,1,426,1,427,1,431,1,455,1,457,1,458,1,576,3,577,3,578,3,579,3,580,1,581,1,582,1,583,1,584,1,585,1,586,1,587,1,592,2,593,2,594,2,595,2,618,2,624,2],"thos":[40,1,56,1,60,1,105,1,106,1,142,1,145,2,193,1,370,1,402,1,403,2,404,2,405,2,406,2,421,1,491,3,492,3,542,3,543,3,610,2],"array":[41,17,107,1,491,2,492,2],"within":[41,4,112,1,132,1,134,2,168,1,242,15,322,2,413,2,454,1,530,1,531,2,537,1,538,2,556,2,572,1,573,1,574,1,575,1],"attribut":[41,4,50,2,51,3,56,1,60,1,66,2,96,3,112,4,133,1,137,2,159,1,162,4,169,1,186,2,187,11,190,4,191,1,192,2,194,2,197,1,199,2,200,2,234,4,238,2,241,2,256,1,257,4,313,8,315,8,341,7,342,7,367,2,395,2,624,2],"16":[41,2,44,4,45,1,50,3,51,3,62,1,66,2,69,3,96,2,133,1,137,2,143,2,144,1,148,1,149,2,151,1,159,3,162,4,169,2,177,4,178,4,180,2,183,2,184,5,186,7,187,1,190,6,191,1,192,2,194,2,195,2,196,3,197,2,210,1,211,3,215,4,217,1,218,1,227,2,230,2,231,2,234,2,238,2,242,2,256,3,257,4,258,2,261,6,262,2,265,5,275,4,276,3,279,1,281,1,285,4,286,6,287,6,288,2,289,6,290,6,292,2,293,4,294,2,302,1,306,7,307,2,308,2,310,2,312,1,313,4,315,6,321,2,322,4,323,2,324,2,325,2,326,1,332,1,340,4,341,4,342,9,350,1,383,2,384,11,385,5,396,5,408,1,415,1,416,1,417,1,418,1,419,2,420,1,425,3,431,2,432,2,454,1,456,3,460,3,463,1,464,1,465,1,466,1,488,2,507,2,508,2,512,2,514,1,515,1,517,1,519,3,531,2,538,2,540,2,542,2,555,4,560,2,573,2,593,2,604,2,618,1,620,4,621,1,624,2],"greater":[41,2,49,2,62,1,70,2,71,2,112,1,169,1,177,2,178,2,259,1,260,2,261,2,263,2,264,2,275,1,276,1,277,4,278,2,315,1,327,2,328,2,329,2,330,2,331,2,334,2,345,1,346,1,370,2,379,2,380,2,410,2,411,2,558,2,559,2,566,1,567,1,568,1],"plus":[41,2,588,1,589,1,590,1,591,1],"rang":[41,2,84,2,94,2,115,1,132,6,134,7,145,1,147,5,161,2,189,1,249,4,259,2,260,2,261,2,263,2,264,2,287,1,332,1,333,1,334,2,345,1,346,1,364,1,371,1,413,6,414,2,572,7,573,7,574,6,575,6],"sav":[41,2,50,2,59,1,116,1,124,1,133,2,136,1,137,6,138,1,143,2,144,2,153,2,188,2,402,2,403,7,406,2,412,1,630,4,631,4,632,4,633,4],"return":[41,2,50,1,64,2,65,2,67,2,70,2,71,2,72,3,76,2,77,2,78,1,80,1,81,2,83,2,84,3,85,1,86,2,87,2,89,2,90,2,91,2,92,2,93,2,94,3,95,2,146,1,167,12,168,2,188,1,198,2,201,5,202,5,203,6,204,6,205,5,206,5,207,6,208,6,275,1,279,1,295,2,296,2,297,2,298,2,299,2,300,2,301,2,314,2,345,2,346,2,350,2,353,1,354,10,356,2,357,2,358,2,359,2,360,3,361,3,362,3,393,1,405,4,406,2,409,2,410,2,411,2,428,2,429,2,430,2,431,1,433,2,434,2,435,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,452,2,453,2,514,2,515,2,516,2,517,2,576,2,577,2,578,2,579,2,580,3,581,3,582,3,583,3,588,1,589,1,590,1,591,1,592,4,593,4,594,4,595,4,596,5,597,5,598,5,599,5,623,3],"structur":[41,1,107,1,112,2,166,2,188,1,402,3,621,1],"just":[41,1,55,1,56,1,60,1,112,1,189,1,393,1],"itself":[41,1,195,1,402,1],"addressabl":[41,1],"via":[41,1,154,1,165,1,318,2,463,1,464,1,465,1,466,1,493,2,494,2,542,2,543,2,560,2,604,2,605,2,606,2],"offset":[41,1,42,2,43,2,45,8,46,6,47,6,48,6,50,7,113,4,168,4,169,4,186,5,187,2,195,4,196,1,215,2,242,14,284,2,354,1,461,3,462,3,503,3,504,4,620,4],"becaus":[41,1,56,1,60,1,62,1,99,1,132,1,134,1,137,1,158,2,160,1,164,1,169,1,199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1,268,2,317,1,353,1],"present":[41,1,317,1,318,1,319,1],"practic":[41,1],"avoid":[41,1,55,1,268,2],"extra":[41,1],"bus":[41,1,68,1,69,1,165,2,612,4,621,2],"cycl":[41,1,68,1,69,1,165,2,351,1,352,1,612,5,613,1],"obtain":[41,1,125,1,126,1,130,4,131,4,132,2,134,1,139,1,146,1,147,1,209,1,306,2,370,1,402,1],"bsf":[42,1,409,8],"search":[42,2,43,2],"found":[42,2,43,2,145,2,147,1,228,1,572,1,573,1,578,1,612,1],"undefin":[42,2,43,2,44,2,109,1,115,1,122,1,147,1,193,2,281,1,344,1,353,2,379,1,380,1,384,1,385,1,409,2,615,2,623,2,634,2],"bsr":[43,1,198,2],"bswap":[44,4,621,1],"revers":[44,2,121,1,140,2,313,2,315,2,341,2,342,2],"convert":[44,2,51,5,74,2,75,2,76,3,77,3,78,2,79,2,80,2,81,3,82,2,83,3,84,4,85,8,86,6,87,9,88,8,89,3,90,3,91,3,92,3,93,3,94,4,95,3,96,1,115,2,120,1,121,1,122,2,123,2,125,3,126,2,127,2,129,1,135,3,139,1,140,1,145,1,147,1,212,1,238,2,241,2,259,6,260,2,261,2,345,1,346,1,356,2,357,2,358,2,359,2,361,1,362,1,426,2,427,2,428,3,429,3,430,3,431,4,432,3,433,3,434,3,435,3,436,2,437,2,438,3,439,3,440,3,441,3,442,3,443,3,444,3,445,3,446,3,447,3,448,2,449,2,450,2,451,2,452,2,453,2,463,1,464,1,465,1,466,1,495,5,496,5,497,5,498,5,499,4,500,4,501,4,502,4,548,2,549,7,550,7,551,2,552,7,553,7,554,7,555,7,576,1,577,1,578,1,579,1,592,1,593,1,594,1,595,1],"littl":[44,2,212,1],"endian":[44,4,212,2],"big":[44,2,212,1],"vic":[44,2,114,1,120,1,121,1,129,1,139,1,140,1,212,1],"versa":[44,2,114,1,120,1,121,1,129,1,139,1,140,1,212,1],"swap":[44,2,212,3],"xchg":[44,2,193,2,621,2],"intel486tm":[44,1],"family":[44,2,117,1,384,1,615,1],"functionally":[44,1,184,2],"intel486":[44,1,68,1,116,1,124,1,136,1,138,1,384,1,619,1],"bt":[45,1,46,1,47,1,48,1],"str":[45,2,46,4,47,4,48,4,54,2,66,1,72,1,162,1,194,1,234,1,257,1,275,4,276,4,279,4,280,4,353,10,392,2,395,3,396,2],"designat":[45,2,46,2,47,2,48,2,381,2,382,2],"bitbas":[45,1,46,1,47,1,48,1],"bitoffset":[45,2,46,1,47,1,48,1],"pag":[45,1,46,1,47,1,48,1,52,2,55,1,56,2,60,1,69,1,107,9,112,1,166,2,169,1,196,3,390,2,413,1],"11":[45,1,46,1,47,1,48,1,294,2,569,1,633,1],"som":[45,1,46,1,47,1,48,1,51,1,60,2,62,1,72,1,96,1,120,1,121,1,129,1,139,1,140,1,144,1,147,1,164,2,169,1,195,1,209,1,268,1,313,1,315,1,341,1,342,1,370,1,375,2],"larger":[45,1,46,1,47,1,48,1,77,1,83,1,90,1,91,1,92,1,93,1,95,1,265,1],"31":[45,1,46,1,47,1,48,1,51,1,73,1,96,2,112,2,177,2,178,2,294,4,328,2,329,2,331,2,360,1,364,1,379,1,380,1,558,2,559,2,566,1,567,1,568,1,575,1,617,2],"combination":[45,1,46,1,47,1,48,1],"high":[45,2,51,3,69,4,80,1,86,2,104,1,106,2,151,4,155,3,190,4,219,4,220,1,221,1,222,2,243,2,247,1,248,3,307,2,308,2,320,1,322,2,323,10,324,4,327,1,329,2,330,3,331,2,338,2,339,2,346,2,349,2,350,6,351,4,352,4,362,2,381,2,382,1,383,1,384,2,385,1,415,2,416,2,503,3,504,3,526,1,527,1,545,2,567,2,568,2,607,3,615,6,616,1,623,6,629,1,630,1,632,1,634,6],"shift":[45,1,177,10,178,10,196,1,242,1,265,4,269,2,327,2,328,9,329,8,330,2,331,9,344,9,364,22,365,8,379,7,380,7,421,2,556,2,561,2,562,2,563,2,564,2,566,4,567,4,568,4],"combin":[45,1,199,1,200,1,215,4,216,4,227,1,228,3,229,1,230,1,231,1,232,1,292,1,371,1,463,2,464,2],"they":[45,1,56,1,60,2,66,1,107,1,117,1,118,2,121,1,124,2,137,1,140,1,142,1,153,1,189,2,190,3,234,1,281,2,353,1,364,1,384,1,463,1,464,1,465,1,466,1,491,1,492,1,542,1,543,1,560,1,604,1],"may":[45,1,51,2,55,5,60,6,66,1,70,1,87,1,88,1,96,2,108,1,109,4,117,1,143,1,147,1,158,1,164,1,165,1,184,3,187,1,189,3,193,2,194,2,199,2,200,2,215,2,216,1,228,6,234,2,246,1,247,1,249,3,257,2,272,1,281,3,313,2,315,3,341,2,342,2,345,2,346,2,347,1,351,2,352,2,371,1,388,1,389,1,390,2,393,1,403,1,406,2,408,1,413,1,414,4,415,1,416,1,417,1,418,1,461,3,462,3,491,1,492,1,542,1,543,1,572,1,573,1,574,1,575,1,611,1,614,1,618,1,624,2,629,2,633,2],"relationship":[45,1,63,1,370,2],"btc":[46,1,193,1],"test":[46,1,47,1,48,1,62,2,117,4,158,1,165,1,169,3,195,1,353,3,370,5,407,1,412,2,487,1,488,1,489,1,490,1,521,2],"mechanism":[46,1,47,1,48,1,55,1,56,1,60,1,353,1],"btr":[47,1,193,1],"bts":[48,1,193,2],"bzhi":[49,3],"saturat":[49,2,259,1,260,2,261,2,263,2,264,2,275,1,276,1,286,4,289,2,293,4,334,2,335,2,523,2,525,2],"link":[50,2,167,2],"branch":[50,4,110,2,111,2,117,2,138,3],"target":[50,7,168,4,169,5,195,2,249,2,281,8,322,4],"latter":[50,1],"inter":[50,2,354,2],"task":[50,3,59,3,167,12,168,2,191,4,197,15,396,6],"switch":[50,2,59,3,133,1,167,5,168,2,190,1,192,3,197,2,209,1,354,1,406,1],"ret":[50,1,112,1,188,1,209,1,354,4,393,2],"6":[50,1,112,1,164,2,190,4,196,1,209,1,238,2,259,2,261,2,275,1,276,1,279,1,280,1,322,1,341,1,344,3,346,2,354,1,362,2,363,2,364,1,379,1,380,1,383,2,403,1,406,1,487,1,503,2,504,2,528,1,530,1,537,1,556,2,565,3,628,1,629,1,632,1,633,1],"near":[50,7,168,4,195,1,354,2,620,2],"far":[50,1,167,2,169,3,186,2,209,1,354,1],"push":[50,1,112,2,115,2,123,2,127,6,128,2,132,3,134,2,145,2,340,4,341,9,342,8],"eip":[50,4,116,1,124,1,136,1,137,1,138,1,153,2,167,1,168,1,169,2,195,1,251,2,353,1,354,1,404,1],"later":[50,1,116,1,124,1,136,1,138,1,189,2,249,1,378,1,383,1],"current":[50,2,96,1,107,2,112,3,133,3,136,2,137,4,138,2,144,2,154,2,161,2,167,1,168,2,169,1,186,2,191,2,195,1,313,2,315,2,341,3,342,3,351,2,352,2,367,2,374,2,384,2,402,2,456,2,623,1],"absolut":[50,5,132,1,134,1,168,1,242,3,258,2,275,2,276,2,320,2,454,2],"cs":[50,1,109,3,153,2,166,1,167,1,168,1,191,2,209,2,215,4,281,1,348,2,354,1,403,2,404,3,405,4,406,2],"indirectly":[50,2],"m16":[50,1],"forc":[50,1,51,1,96,1,192,1,313,1,315,1,341,1,342,1,617,2],"esp":[50,2,112,3,188,2,209,3,313,4,341,5,404,1,406,1],"cbw":[51,6],"cdq":[51,3,96,9],"cwd":[51,6,96,9],"extension":[51,2,96,2,249,2,342,2,408,1,409,2,567,2],"every":[51,2,56,2,59,1,96,6,351,1,352,1,371,2,403,1,419,1,420,1,422,1,510,1,511,1],"eax":[51,3,56,1,60,1,68,4,69,8,72,3,96,6,100,4,107,1,109,2,154,3,157,4,159,2,194,6,243,3,249,2,256,2,275,1,276,1,281,6,313,2,341,2,349,3,350,9,351,4,352,4,367,4,395,5,408,1,413,2,414,1,615,4,616,3,617,4,622,2,623,9,628,4,629,4,630,4,631,4,632,4,633,4,634,4],"intend":[51,2,59,2,96,1,164,1,167,1,192,1,313,1,315,2,341,1,342,1,385,1,402,2,463,1,464,1,465,1,466,1],"thes":[51,1,62,1,96,1,105,1,106,1,107,1,112,1,116,3,121,1,122,1,124,3,128,2,136,3,137,3,138,3,140,1,164,2,165,1,167,3,186,1,193,1,195,1,287,1,313,3,315,3,320,2,335,1,337,2,341,3,342,5,353,1,367,1,370,1,383,2,395,1,404,1,505,4,530,1,537,1,542,1,543,1,547,4,610,2,618,1],"synonym":[51,1,96,1,313,1,315,1,341,1,342,1],"rax":[51,1,68,6,69,8,96,6,100,6,109,2,157,2,194,1,275,1,276,1,281,2,349,1,350,2,351,2,352,2,615,2,616,1,623,2,628,1,629,1,630,1,631,1,632,1,633,1,634,2],"clac":[52,2],"ac":[52,2,144,1,315,1,390,2],"eflag":[52,2,53,2,54,2,57,3,61,2,62,3,63,3,66,2,70,5,71,5,72,2,117,3,119,4,162,1,164,1,167,5,169,2,179,2,194,2,196,2,234,1,257,1,287,1,315,6,332,1,333,1,342,8,363,4,367,3,370,3,390,2,391,2,392,2,393,4,395,1,410,4,411,5,491,1,492,1,542,1,543,1,560,1,604,1],"disabl":[52,2,249,2,351,1,352,1],"alignment":[52,2,144,1,148,1,149,1,150,1,193,1,215,2,390,2,415,1,416,1,417,1,418,1],"user":[52,4,390,4,404,2,405,4,406,6],"smap":[52,2,390,2],"cr4":[52,2,143,1,166,2,342,2,349,2,350,1,351,1,352,1,383,1,385,1,390,2,616,2],"disallow":[52,2],"explicit":[52,2,66,3,154,2,162,3,194,3,234,3,257,3,312,2,367,3,390,2,395,3,408,2,414,2,624,3],"supervisor":[52,2,58,2,369,2,390,2],"cpl":[52,1,57,1,59,2,109,1,165,1,192,1,197,1,390,1,402,1,456,2,612,1,613,1,629,2,633,2],"clc":[53,1],"cld":[54,1],"df":[54,4,162,3,194,4,234,3,257,3,341,2,367,3,392,4,395,3],"esi":[54,2,66,1,194,3,234,2,257,5,313,2,341,2,392,2],"edi":[54,2,66,1,162,3,199,2,200,2,234,2,313,2,341,2,392,2,395,2],"cldemot":[55,10],"hint":[55,4,56,1,60,3,199,2,200,2,215,3,216,3,227,4,228,9,229,4,230,4,231,4,232,4,249,5,268,4,317,4,318,8,319,6,493,1,494,1,505,1,547,1,605,1,606,1,618,6],"hardwar":[55,5,60,4,154,4,164,2,165,1,281,1,337,2,393,3,413,9,414,1,612,1,613,1],"cach":[55,12,56,14,60,23,165,16,166,5,184,1,189,2,199,2,200,2,215,5,216,5,227,6,228,14,229,6,230,6,231,6,232,6,317,9,318,3,319,3,403,3,404,3,405,3,406,3,493,1,494,1,605,1,606,1,612,15,613,9],"lin":[55,19,56,8,60,18,165,1,184,1,215,2,216,2,227,1,228,7,229,1,230,1,231,1,232,1,317,6,318,3,319,3,493,1,494,1,605,1,606,1,612,2,613,2],"demot":[55,4],"closest":[55,2,618,3],"cor":[55,9,340,1],"distant":[55,2],"accelerat":[55,2],"subsequent":[55,2,58,2,60,2,186,1,191,1,209,1,228,2,351,1,352,1,530,1,537,1],"coherenc":[55,2,56,2,60,2],"domain":[55,2,56,2,60,2],"especially":[55,2],"such":[55,2,56,1,60,1,132,1,134,1,189,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,216,1,249,1,317,1,371,3,393,1,406,1,408,3,414,1],"manner":[55,2,63,2,105,2,106,2,275,1,276,1,279,1,280,1],"performanc":[55,2,60,3,184,1,189,2,199,1,268,6,350,8,371,2,395,1,404,2,405,2,408,4,414,4,610,1,615,1],"optimization":[55,2,60,2,317,1,318,2,319,1,623,1],"i":[55,2,70,1,71,1,114,1,117,2,119,2,120,1,121,1,127,1,129,1,139,1,140,1,141,2,142,2,159,14,162,13,173,1,256,15,257,17,259,1,265,1,305,3,411,1,432,1,463,1,464,1,465,1,466,1,491,1,492,1,493,2,494,2,542,3,543,3,560,3,576,2,577,2,578,2,579,2,596,2,597,2,598,2,599,2,604,3,605,2,606,2],"modify":[55,2,56,1,60,1,173,1,193,1,281,2,368,1,406,1,609,2,610,4,611,1],"choos":[55,2,60,2,228,1,370,1,408,2],"hierarchy":[55,2,56,4,60,10,215,2,216,2,227,2,228,2,229,2,230,2,231,2,232,2,318,3,319,3,493,1,494,1,612,2,613,1],"l3":[55,2],"typical":[55,2],"server":[55,2],"design":[55,2,146,1,402,1],"availability":[55,1,56,1,60,1,215,1,216,1,249,1],"presenc":[55,1,56,1,60,1,193,1,215,1,216,1,369,2,621,2],"cpuid":[55,2,56,3,60,3,69,1,72,7,117,1,154,2,215,2,216,2,249,3,281,2,349,1,350,3,363,1,371,2,408,1,413,3,414,1,616,1,623,1],"featur":[55,1,56,1,60,1,72,1,117,2,215,1,216,1,249,1,281,2,623,1,628,2,629,2,630,2,631,2,632,2,633,2,634,2],"25":[55,1,59,1,352,1,385,1],"ecx":[55,1,69,6,72,2,162,1,195,2,215,1,216,1,249,4,257,1,275,4,279,4,313,2,341,2,349,4,350,3,352,4,353,1,363,1,367,1,408,1,413,1,414,1,615,3,616,4,623,5,634,4],"leaf":[55,1,107,6,109,8,215,1,216,1,281,18,413,2],"07h":[55,1,215,1,216,1,349,1,616,1],"cpu":[55,1,60,1,215,1,216,1],"identification":[55,1,60,1,72,2,215,1,216,1],"do":[55,1,60,1,66,1,105,1,106,1,112,1,118,1,119,1,138,1,141,1,198,1,209,1,234,1,281,2,315,1,348,2,350,1,393,1,406,1,409,2,414,1,457,2,458,2,463,1,464,1,465,1,466,1,491,2,492,2,542,1,543,1,580,2,581,2,619,1],"respect":[55,4,56,4,60,4,148,2,189,1,317,2,371,4,413,1],"unorder":[55,1,70,4,71,4,118,1,119,4,122,3,141,4,317,1,410,6,411,4],"fenc":[55,1,56,1,60,2,199,1,200,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,317,1],"clwb":[55,1,56,1,60,9],"clflushopt":[55,1,56,1,60,2,317,1],"different":[55,1,57,1,70,1,87,1,88,1,168,3,169,1,187,2,199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1,246,1,247,1,343,2,354,1,388,1,389,1,393,1,491,1,492,1,565,2,569,1,572,1,573,1,612,1,613,1,625,2],"sinc":[55,1,199,1,618,2],"retir":[55,1],"after":[55,2,56,1,60,1,107,2,120,1,121,1,129,1,132,2,133,2,137,2,138,1,143,1,153,2,162,1,165,1,175,1,189,1,191,2,194,1,197,2,209,1,215,1,216,1,234,1,257,1,313,2,344,1,353,1,354,1,367,1,371,2,374,2,375,2,393,1,395,1,403,3,406,2,463,1,464,1,465,1,466,1,611,1,612,1,613,1],"issu":[55,1,116,1,124,1,136,1,137,1,138,1,165,2,189,3,215,1,216,2,251,1,371,1,600,1,601,1,602,1,603,1,612,2],"again":[55,1,66,1,73,1,234,2,367,1],"immediately":[55,1,133,1,185,1,306,2,393,1],"movement":[55,2,317,1,318,1,319,1],"penalty":[55,1,268,2,610,1],"affect":[55,1,56,2,57,2,60,2,116,2,187,2,191,2,192,2,193,1,195,1,281,1,317,1,318,1,319,1,344,1,345,1,346,1,348,2,353,2,355,2,360,1,361,1,362,1,379,1,380,1,576,2,577,2,578,2,579,2,592,1,593,1,594,2,595,2,616,1],"effect":[55,1,56,1,57,2,60,1,130,1,131,1,191,1,192,2,197,1,315,1,364,1,393,1,412,1,432,1,572,1,573,1,574,1,575,1],"cacheabl":[55,1],"likely":[55,1],"whil":[55,1,77,1,80,1,83,1,91,1,93,1,99,2,160,2,192,1,193,2,209,1,233,1,249,1,268,2,350,1,353,8,365,1,404,1,405,1,409,2,414,2,539,1,588,1,589,1,590,1,591,1,634,1],"uncacheabl":[55,1,227,1,229,1,230,1,231,1,232,1,318,1,319,1],"speculativ":[55,2,56,4,60,4,189,2,317,2],"fetch":[55,2,56,3,60,3,184,2,189,4,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,305,3,311,1,317,4,318,2,319,2,368,2,415,1,416,1,417,1,418,1],"tim":[55,1,56,1,59,1,60,1,161,2,189,1,195,1,228,2,242,1,317,1,351,7,352,6,353,4,408,1,414,1,612,2,613,2],"tied":[55,1,56,1,60,1,189,1,317,1],"prefetchh":[55,1,60,2],"speculatively":[55,1,56,2,60,2,189,4,317,1,616,2],"clflush":[56,9,60,2,317,1],"invalidat":[56,2,60,3,165,3,166,3,215,1,216,1,317,3,612,4,613,2,615,1],"modifi":[56,2,60,5,165,1,184,1,215,1,216,1,315,3,336,2,608,2,609,1,610,1,612,4,613,2],"back":[56,2,60,5,68,1,69,1,165,5,192,1,215,1,216,1,413,2,556,1,612,6,613,4,624,2],"clfsh":[56,1],"edx":[56,1,69,8,72,1,96,4,100,4,157,4,243,2,248,2,275,1,276,1,313,2,341,2,349,2,350,6,351,4,352,4,408,1,414,1,615,4,616,2,623,7,628,4,629,4,630,4,631,4,632,4,633,4,634,4],"19":[56,1,159,1,256,1,257,1,331,2,350,1,572,2,573,2,574,2,575,2],"align":[56,1,60,1,69,1,144,1,148,1,149,2,184,3,199,2,200,2,210,3,211,3,215,2,216,2,217,1,227,2,228,2,230,2,231,2,265,3,286,2,287,2,289,2,290,2,293,2,306,1,321,2,628,1,629,1,630,1,631,1,632,1,633,1],"ebx":[56,1,60,2,69,6,72,1,154,2,313,2,341,2,624,2],"fre":[56,1,60,1,189,1,317,1],"assign":[56,1,60,1],"wb":[56,1,60,1,189,1,228,1,317,1],"wc":[56,1,60,1,189,1,199,2,200,2,215,4,216,4,227,2,228,9,229,2,230,2,231,2,232,2,318,1,319,1],"wt":[56,1,60,1,189,1],"prefetch":[56,2,317,3,318,4,319,4,493,8,494,8,605,7,606,7],"h":[56,2,319,1,378,3],"sfenc":[56,1,60,1,199,1,200,1,215,1,216,1,227,1,229,1,230,1,231,1,232,1,317,1,371,13],"subject":[56,1,413,1],"permission":[56,1,413,1],"associat":[56,1,62,3,169,2,195,1,209,1,281,2,312,1,353,1,370,2,413,1,505,2,547,2],"flush":[56,1,143,1,165,7,228,4,345,2,346,2,426,1,427,1,455,1,457,1,458,1,576,1,577,1,578,1,579,1,580,1,581,1,582,1,583,1,596,1,597,1,598,1,599,1,612,4,613,2],"lik":[56,1,268,1,413,1,628,1,629,1,630,1,631,1,632,1,633,1],"d":[56,1,109,1,116,1,124,1,135,1,136,1,138,1,163,1,166,1,215,4,258,2,281,1,313,1,348,2,375,4,378,3,413,1,512,1,531,1,538,1],"cli":[57,7,393,2],"maskabl":[57,2,393,3],"external":[57,2,165,5,167,2,393,1,612,5,613,1],"interrupt":[57,4,116,3,124,3,136,3,137,1,138,4,153,4,164,8,167,19,190,4,209,2,249,1,315,1,353,3,360,4,383,3,393,10,402,1,403,1,406,2,491,1,492,1,542,1,543,1,560,1,604,1,612,1,613,1],"sti":[57,2,393,9],"generation":[57,2,70,1,87,1,88,1,246,1,247,1,383,1,388,1,389,1,393,1],"nmi":[57,2,153,4],"iopl":[57,2,315,3,342,2,393,1,621,2],"vme":[57,1,342,2,393,1],"pvi":[57,1,393,1],"activ":[57,1,153,1,393,1,424,2,425,2,518,3,519,2,520,2,539,3],"vif":[57,1,315,3,393,1],"leav":[57,1,112,2,188,5,281,5,321,2,340,1,393,1],"unaffect":[57,1,315,2,321,2,393,1],"action":[57,1,100,2,112,1,157,2,167,1,187,2,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,243,2,463,3,464,3,465,3,466,3],"clrssbsy":[58,1],"busy":[58,4,116,2,197,2,369,4],"shadow":[58,4,161,4,209,1,312,1,369,2,403,2,406,1],"token":[58,2,369,2,463,2,464,2,465,2,466,2],"mark":[58,2,108,2,118,1,119,1,120,1,121,1,122,1,125,1,129,1,135,1,139,1,140,1,141,1,191,1,197,2,369,2,622,2],"ssp":[58,2,369,6,403,3,406,2],"clt":[59,2],"ts":[59,4,192,2],"cr0":[59,2,109,2,192,9,385,4],"initialization":[59,2,124,1,190,1,197,1,353,1],"synchroniz":[59,1,228,1,611,1],"fpu":[59,1,77,4,80,4,83,4,91,4,93,4,108,12,114,2,115,2,116,6,117,1,118,2,120,3,121,3,122,2,123,2,124,7,125,1,127,3,128,7,129,5,132,3,133,14,134,3,135,3,136,5,137,9,138,9,139,3,140,3,141,2,142,1,143,4,144,2,146,2,147,2,200,3,233,4],"multitask":[59,1],"description":[59,1,62,1,116,1,117,2,124,1,128,1,136,1,138,1,162,1,169,1,185,2,257,1,588,1,589,1,590,1,591,1,621,2,628,1,629,1,630,1,631,1,632,1,633,1],"titl":[59,1,116,1,124,1,128,1,132,1,134,1,136,1,138,2,164,2,167,2,354,1,611,1],"control":[59,1,76,2,77,1,78,2,80,1,81,2,83,1,84,1,85,1,86,2,87,4,89,2,94,1,109,2,124,4,125,1,128,2,130,1,131,1,133,1,135,1,136,4,137,2,143,1,167,2,168,2,185,4,188,1,192,1,242,4,275,4,276,2,279,4,280,2,287,1,321,8,332,1,333,1,345,1,346,1,354,2,356,3,357,3,358,3,359,3,360,2,361,1,362,1,381,8,382,8,385,2,394,2,403,1,406,2,414,1,422,2,428,2,429,2,430,2,432,1,433,2,434,2,435,2,438,2,439,2,452,2,453,4,499,4,500,4,501,4,502,4,511,2,532,5,533,6,534,3,536,4,556,4,565,5,572,2,573,2,574,2,575,2,576,1,577,1,578,1,579,1,588,5,589,5,590,5,591,5,592,1,593,1,594,1,595,1,615,1,623,2,634,2],"vmx":[59,2,109,7,352,2,385,2],"root":[59,2,109,6,142,1,352,2,361,2,362,2,385,2,386,2,387,2,388,2,389,2,592,2,593,2,594,2,595,2,596,2,597,2,598,4,599,4],"3c":[59,1,337,2,352,1,360,1,385,1],"reduc":[60,2,132,2,134,2,228,1,268,2,584,3,585,3,586,3,587,3],"possibility":[60,2,117,1],"miss":[60,2],"24":[60,1,166,1,190,2,356,1,357,1,358,1,359,1,532,1,617,2],"older":[60,1,215,1,216,1],"being":[60,2,62,2,112,1,116,1,118,1,119,2,120,1,121,1,122,1,124,1,127,2,129,3,135,4,136,1,138,1,139,1,140,1,141,2,143,2,144,1,147,1,159,2,162,2,167,1,168,2,169,3,183,2,189,2,193,1,195,1,196,2,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,227,1,228,1,229,1,230,1,231,1,232,1,256,3,257,2,275,1,276,1,281,2,294,1,317,1,350,2,370,2,491,1,492,1,542,1,543,1,623,2],"younger":[60,1,215,2,216,3],"usag":[60,1,249,4,281,1],"expect":[60,1],"subsequently":[60,1],"recommend":[60,1,145,2,164,1,209,1,268,2,610,1],"appropriat":[60,1,72,1,109,2,120,1,132,1,134,1,415,1,416,1,417,1,418,1],"improv":[60,1,184,1,199,1,268,4,395,1,408,2,414,2],"cmc":[61,3],"cmova":[62,3],"cmovb":[62,2],"cmovc":[62,1],"cmov":[62,4,63,1,117,1],"cmovg":[62,2],"cmovl":[62,2],"cmovna":[62,2],"cmovnb":[62,3],"cmovnc":[62,1],"cmovn":[62,2],"cmovng":[62,2],"cmovnl":[62,2],"cmovno":[62,1],"cmovnp":[62,1],"cmovnz":[62,1],"cmovo":[62,1],"cmovp":[62,2],"cmovpo":[62,1],"cmovz":[62,1],"cmovcc":[62,4],"status":[62,4,63,5,66,2,116,4,117,2,118,2,119,3,122,2,124,4,128,2,132,1,133,1,134,1,137,2,138,5,141,2,143,1,169,3,185,4,192,2,281,2,367,2,370,2,385,3,394,2,407,2,635,2],"pf":[62,2,70,2,71,2,119,2,169,2,281,2,363,2,370,2,407,2,410,2,411,2],"condition":[62,11,63,3,105,2,106,2,117,4,118,4,119,1,122,3,125,1,132,1,134,1,135,2,138,2,141,4,143,1,169,11,185,1,195,3,228,2,259,4,260,2,287,1,332,1,333,1,353,3,370,8,456,1],"cc":[62,5,63,3,117,4,164,1,169,6,195,3,370,4],"satisfi":[62,3,169,2],"continu":[62,2,169,2,195,1,413,1,491,1,492,1,542,1,543,1,560,1,604,1],"specifically":[62,1,189,2,403,1,463,1,464,1,465,1,466,1,584,1,585,1,586,1,587,1],"temporary":[62,2,165,3,228,6,269,2,294,2],"unconditionally":[62,1,497,1,498,1],"regardless":[62,1,96,1,119,1,158,1,166,1,193,1,313,1,341,1,342,1,384,3,385,1,396,1,621,2],"conditional":[62,3,138,2,169,2,259,2,491,1,492,1],"given":[62,1,117,4,118,2,132,2,134,1,148,1,169,1,565,2,600,1,601,1,602,1,603,1],"column":[62,1,117,2,169,1,569,2],"abov":[62,3,97,1,98,1,117,2,169,2,189,1,193,1,284,2,285,3,312,1,340,1,363,1,370,1,371,1,419,1,420,1,507,1,508,1],"term":[62,2,169,2,370,2],"particular":[62,1,147,1,169,1,189,2],"sometim":[62,1,169,1],"way":[62,1,116,1,124,1,136,1,138,1,164,1,169,1,189,1,371,1],"alternat":[62,1,169,1,370,3,611,2],"0f":[62,1,189,1,371,1],"47h":[62,1,160,1],"cmp":[63,2,66,3,353,3],"j":[63,1,169,4],"appendix":[63,1,116,1,124,1,136,1,138,1,370,1],"show":[63,1,125,1,126,1,130,1,131,1,132,2,133,1,134,1,137,2,139,1,143,6,144,1,146,1,147,1,281,2,294,2,307,2,308,2,310,2,320,2,322,2,338,2,339,2,370,1,427,1,569,1],"cmppd":[64,1],"vcmppd":[64,1],"simd":[64,2,65,2,70,2,71,2,101,2,102,2,116,1,143,1,148,2,149,4,185,2,201,2,202,2,205,2,206,2,262,4,263,6,264,6,269,2,273,2,274,2,277,2,278,2,295,2,296,2,297,2,298,2,299,2,300,2,301,2,307,2,308,2,309,2,310,2,332,4,333,2,334,4,335,4,345,4,361,4,386,2,387,2,398,2,399,2,411,2,426,2,427,2,432,1,455,2,467,6,468,6,469,2,470,2,473,6,474,6,475,2,476,2,514,2,515,2,516,2,517,2,576,2,577,2,578,2,579,2,592,2,593,2],"predicat":[64,2,65,2,67,3,514,3,515,3,516,3,517,3],"opmask":[64,1,65,1,67,1,422,3,424,1,425,1,463,4,464,4,465,4,466,4,511,3,513,2,519,1,520,1,540,1,541,1],"under":[64,1,65,1,85,1,87,1,116,1,124,1,136,1,138,1,147,1,214,2,259,2,260,1,303,1,304,1,495,1,496,1,499,1,500,1,514,1,515,1,516,1,517,1,530,2,532,1,533,1,537,2,545,2,546,2,556,2,570,4,572,2,573,2,574,2,575,2,584,2,585,2,586,2,587,2],"k2":[64,1,65,1,67,1,170,2,171,2,172,2,174,2,175,2,176,2,181,2,182,2,274,1,278,1,487,2,488,2,489,2,490,2,514,1,515,1,516,1,517,1],"tru":[64,3,65,3,67,3,117,2,145,4,514,2,515,2,516,2,517,2],"fals":[64,3,65,3,67,3,413,1,514,2,515,2,516,2,517,2,610,1],"1s":[64,2,65,2,67,2,108,2,196,1,273,2,274,2,277,2,278,2,383,1],"0s":[64,2,65,2,67,2,77,1,80,1,83,1,91,1,93,1,108,2,199,1,200,2,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,233,1,237,2,273,2,274,2,277,2,278,2,285,2,320,1,327,4,328,2,330,4,331,2,383,1,394,2],"cmpp":[65,1],"vcmpp":[65,1],"destina":[65,1],"cmpsb":[66,2],"cmpsd":[66,2],"cmpsq":[66,2],"cmpsw":[66,2],"ds":[66,5,186,3,191,2,194,8,199,2,200,2,209,2,234,8,257,8,312,1,413,1,456,1,624,8],"si":[66,3,194,9,234,7,257,8,313,2,341,2],"rsi":[66,3,257,6],"es":[66,5,116,2,162,8,186,3,191,2,209,2,215,2,234,8,312,1,367,6,395,8,456,1],"di":[66,3,162,8,199,2,200,2,234,7,313,2,341,2,367,7,395,5],"rdi":[66,3,162,3,199,2,200,2],"overridden":[66,2,112,1,162,2,194,2,199,2,200,2,234,4,257,2,367,2,395,2,624,2],"assembly":[66,1,162,1,169,1,194,1,195,1,234,1,257,1,367,1,395,1,624,1],"explicitly":[66,1,162,1,194,1,234,1,257,1,367,1,395,1,412,2,624,1],"symbol":[66,2,162,2,194,2,234,2,257,2,367,2,395,2,624,2],"documentation":[66,2,162,2,194,2,234,2,257,2,367,2,395,2,624,2],"mislead":[66,1,162,1,194,1,234,1,257,1,367,1,395,1,624,1],"loca":[66,1],"tion":[66,1],"correctly":[66,1,162,1,194,1,234,1,257,1,395,1,413,1,576,2,577,2,578,2,579,2,592,1,593,1,594,1,595,1,624,1],"short":[66,1,126,2,162,1,168,3,194,1,234,1,257,1,367,1,395,1,624,1],"cmpss":[67,1],"vcmpss":[67,1],"lsb":[67,1],"max":[67,1,173,1,272,1,487,2,488,2,489,2,490,2,530,1,537,1,572,4,573,4],"kl":[67,1,173,1,487,2,488,2,489,2,490,2],"cmpxchg":[68,1,193,1],"availabl":[68,2,96,2,100,2,108,2,117,1,144,1,228,2,251,1,268,1,408,1,413,1,414,1],"simplify":[68,1,69,1,132,1,272,1],"interfac":[68,1,69,1],"without":[68,2,69,2,99,2,115,2,123,2,160,2,164,2,165,1,167,1,168,2,186,1,193,1,199,1,209,1,215,2,228,2,248,2,342,1,353,1,355,2,383,1],"regard":[68,1,69,1],"never":[68,1,69,1,456,2,616,1],"cmpxchg8b":[69,1],"rdx":[69,8,96,4,100,6,107,1,109,2,157,2,248,2,275,1,276,1,281,4,349,1,350,2,351,2,352,2,615,2,616,1,623,2,628,1,629,1,630,1,631,1,632,1,633,1,634,2],"rcx":[69,6,107,1,109,2,195,2,281,4,349,1,350,2,352,2,403,2,406,2,615,2,616,1,623,2,634,2],"rbx":[69,6,107,1,109,2,281,5,624,1],"64bits":[69,2,220,1,221,1,223,1,224,1],"cmpxchg16b":[69,2,193,1],"237":[69,1],"pentium":[69,1,116,1,124,1,136,1,138,1,268,2,384,2],"comisd":[70,2],"vcomisd":[70,3],"nan":[70,2,71,2,105,7,106,7,118,2,119,1,122,1,135,2,141,1,201,3,202,3,203,3,204,3,205,3,206,3,207,3,208,3,410,2,411,2,455,1,572,2,573,2,574,2,575,2,580,2,581,2,582,2,583,2,596,4,597,4,598,4,599,4],"qnan":[70,3,71,3,118,2,119,1,125,1,141,1,201,2,202,2,203,2,204,2,205,2,206,2,207,2,208,2,345,3,346,3,356,1,357,1,358,1,359,1,361,3,362,3,410,2,411,3,487,2,576,3,577,3,578,3,579,3,592,4,593,4,594,4,595,3],"snan":[70,4,71,4,119,1,125,1,141,1,201,4,202,4,203,4,204,4,205,4,206,4,207,4,208,4,345,2,346,2,356,1,357,1,358,1,359,1,361,2,362,2,410,2,411,4,487,2,576,2,577,2,578,2,579,2,592,2,593,2,594,2,595,2],"differ":[70,1,71,1,158,1,164,1,198,1,411,1],"ucomisd":[70,2,410,1],"unmask":[70,1,71,1,116,2,118,1,120,1,124,1,132,2,133,2,135,1,136,2,137,1,138,2,143,2,411,1,432,1,611,3],"encounter":[70,1,87,1,88,1,246,1,247,1,388,1,389,1],"unpredictabl":[70,1,87,1,88,1,246,1,247,1,318,1,388,1,389,1],"across":[70,1,87,1,88,1,246,1,247,1,388,1,389,1],"comiss":[71,2,117,1,411,2],"vcomiss":[71,1],"ucomiss":[71,2,411,2],"id":[72,2,315,1,530,1,531,4,537,1,538,4],"21":[72,2,155,1,315,1],"output":[72,1,109,2,159,1,256,1,257,1,281,4,409,2,426,1,427,1,455,1,556,1,565,1,572,6,573,6,574,6,575,6],"dependent":[72,1,105,1,106,1,143,1,184,2,228,1,249,4,317,3,318,3,319,3,408,2,414,2,600,1,601,1,602,1,603,1],"upon":[72,1,148,1,149,2,185,1,332,1,333,1,353,1,360,2],"well":[72,1,596,1,597,1,598,1,599,1,600,1,601,1,602,1,603,1],"pseudocod":[72,1],"vendor":[72,1,164,2],"crc32":[73,6],"accumulat":[73,3,455,2,522,2,523,2,524,2,525,2],"polynomial":[73,2,148,2,150,4],"11edc6f41h":[73,2],"r32":[73,3,99,1,160,1],"r64":[73,7],"00000000h":[73,2,84,1,94,1,95,1],"suppli":[73,1],"incrementally":[73,1],"new":[73,1,112,2,145,2,354,3],"input":[73,1,87,1,105,1,106,1,109,4,159,1,162,1,198,1,256,1,257,2,275,3,276,3,279,1,280,1,281,2,305,4,345,3,346,3,356,2,357,2,358,2,359,2,381,6,382,4,408,4,414,4,424,1,425,1,426,1,427,1,432,1,452,1,453,1,455,1,457,1,458,1,459,4,460,4,463,8,464,8,465,8,466,8,487,6,488,6,489,6,490,6,495,4,496,4,497,4,498,4,499,1,500,1,518,1,519,1,520,1,530,3,531,4,532,1,533,1,537,3,538,4,540,4,541,2,556,4,569,5,572,6,573,6,574,4,575,4,578,1,579,1,580,1,581,1,582,1,583,1,588,1,589,1,590,1,591,1,596,1,597,1,598,1,599,1],"process":[73,1,107,2,166,3,183,1,196,1,228,1,275,2,356,2,357,2,358,2,359,2,375,2,588,1,589,1,590,1,591,1,621,1],"reflect":[73,2,133,1,137,1,463,1,464,1,465,1,466,1,617,2,622,2],"quotient":[73,1,100,1,130,1,131,1,157,1],"likewis":[73,1],"crc":[73,3],"cvtdq2pd":[74,1],"vcvtdq2pd":[74,1],"embed":[74,1,76,1,78,1,81,1,86,1,87,2,89,1,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,448,1,452,1,453,2],"cvtdq2ps":[75,1],"vcvtdq2ps":[75,1],"cvtpd2dq":[76,1],"vcvtpd2dq":[76,1],"conversion":[76,1,77,1,78,1,80,1,81,1,83,1,84,1,85,1,86,2,87,2,89,1,90,1,91,1,92,1,93,1,94,1,95,1,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,452,2,453,2,499,1,500,1,501,1,502,1],"inexact":[76,1,77,1,78,1,80,1,81,1,83,1,84,1,85,1,86,2,87,2,89,1,90,1,91,1,92,1,93,1,94,1,95,1,128,2,130,1,131,1,428,1,429,1,430,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,452,2,453,2],"mxcsr":[76,1,77,1,78,1,80,1,81,1,83,1,84,1,85,1,86,2,87,2,89,1,94,1,116,1,143,4,144,2,185,8,345,1,346,1,361,1,362,1,394,4,426,1,427,1,428,1,429,1,430,1,431,2,432,1,433,1,434,1,435,1,438,1,439,1,452,2,453,2,455,1,457,2,458,2,463,1,464,1,465,1,466,1,576,4,577,4,578,4,579,4,580,2,581,2,582,2,583,2,592,2,593,2,594,3,595,3,600,1,601,1,602,1,603,1],"rais":[76,1,77,1,81,1,83,1,84,2,89,1,90,1,91,1,92,1,93,1,94,2,95,1,118,2,119,3,132,1,134,1,141,3,143,1,412,1,428,1,429,1,430,1,432,1,433,1,434,1,435,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,572,1,573,1,574,1,575,1,611,1],"indefinit":[76,1,77,1,81,1,83,1,84,2,89,1,90,1,91,1,92,1,93,1,94,2,95,1,125,1,361,1,362,1,428,1,433,1,440,1,443,1,592,1,593,1,594,1,595,1],"cvtpd2pi":[77,2],"mmx":[77,2,79,1,80,2,83,2,91,3,93,3,108,6,143,2,144,2,200,3,213,7,232,2,233,3,265,3,266,2,267,2,269,2,273,2,277,2,285,4,286,2,287,2,289,2,290,2,292,4,293,2,294,2,295,2,296,2,298,2,300,2,302,1,306,2,307,2,308,2,310,2,311,3,316,2,321,1,325,2,326,1,328,2,329,2,331,2,333,1,334,2,343,2],"technology":[77,2,79,1,80,2,83,2,91,3,93,3,108,4,143,2,144,2,153,1,200,3,213,7,232,2,233,3,266,2,267,2,269,2,273,2,277,2,285,4,292,2,295,2,296,2,298,2,300,2,302,1,307,2,308,2,310,2,311,3,316,2,325,2,328,2,329,2,331,2,333,1,334,2,343,2,403,1,406,1],"80000000h":[77,1,83,1,84,1,90,1,91,1,92,1,93,1,94,1,95,1,294,1],"transition":[77,1,80,1,83,1,91,1,93,1,200,1,233,1,404,1,610,1,620,4],"x87":[77,4,80,4,83,4,91,4,93,4,108,15,116,1,128,2,138,2,143,4,144,2,200,3,233,4,628,2,629,2,630,2,631,2,632,2,633,2,634,1],"tag":[77,1,80,1,83,1,91,1,93,1,108,11,124,4,133,1,137,2,200,1,233,1,279,1,280,1],"pend":[77,1,80,1,83,1,91,1,93,1,116,3,124,2,133,2,136,3,137,1,138,3,143,1,233,1,491,1,492,1,542,1,543,1,560,1,604,1,611,2],"handl":[77,1,80,1,83,1,91,1,93,1,116,3,118,1,124,2,133,2,136,3,137,1,138,3,233,1,259,4,260,2,262,2,263,2,264,2,332,2,334,2,335,2,611,3],"cvtpd2ps":[78,1],"vcvtpd2ps":[78,1],"cvtpi2pd":[79,1],"configuration":[79,1],"cvtpi2ps":[80,2],"cvtps2dq":[81,1],"vcvtps2dq":[81,1],"cvtps2pd":[82,1],"vcvtps2pd":[82,1],"cvtps2pi":[83,3],"cvtsd2si":[84,1],"vcvtsd2si":[84,1],"exc":[84,2,94,2,365,1,408,1,414,1,556,1],"80000000":[84,1,94,1,95,1],"cvtsd2ss":[85,1],"vcvtsd2ss":[85,1],"sse2":[85,2],"cvtsi2sd":[86,1],"vcvtsi2sd":[86,1],"w0":[86,1,452,1],"cvtsi2ss":[87,1],"vcvtsi2ss":[87,3],"thre":[87,2,104,1,143,2,158,5,163,1,176,2,181,2,182,2,219,1,222,1,247,1,292,2,346,2,354,1,356,1,357,1,358,1,359,3,362,2,467,2,468,2,469,2,470,2,473,2,474,2,475,2,476,2,569,4,588,1,589,1,590,1,591,1],"cvtss2sd":[88,1],"vcvtss2sd":[88,3],"cvtss2si":[89,1],"vcvtss2si":[89,1],"cvttpd2dq":[90,1],"vcvttpd2dq":[90,1],"truncat":[90,1,91,1,92,1,93,1,95,1,100,1,130,1,135,1,157,1,158,2,196,1,306,2,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,620,2],"cvttpd2pi":[91,2],"cvttps2dq":[92,1],"vcvttps2dq":[92,1],"cvttps2pi":[93,2],"cvttsd2si":[94,1],"vcvttsd2si":[94,1],"cvttss2si":[95,1],"vcvttss2si":[95,1],"cqo":[96,5],"dx":[96,4,100,4,157,4,159,4,162,4,243,2,256,4,257,4,313,2,341,2],"63":[96,2,132,5,134,6,177,2,178,2,328,2,329,2,331,2,364,1,406,1,558,2,559,2,566,1,567,1,568,1,574,1],"dividend":[96,3,100,4,120,2,121,2,130,4,131,3,157,4],"daa":[97,5],"detect":[97,2,98,2,119,1,268,2,360,2,505,1,547,1],"accordingly":[97,2,98,2],"das":[98,5],"borrow":[98,2,366,3],"dec":[99,3,193,1],"preserv":[99,2,115,2,123,2,135,1,160,2,220,2,221,2,223,2,224,2,353,1,463,4,464,4,465,4,466,4],"loop":[99,2,160,2,195,15,268,13,353,3,367,1],"counter":[99,2,160,2,195,2,344,1,350,3,351,7,352,5,408,1,414,1,558,1,559,1],"disturb":[99,2,160,2],"r16":[99,1,160,1],"48h":[99,1],"4fh":[99,1],"divisor":[100,5,120,2,121,2,130,2,131,2,157,5],"integral":[100,1,125,1,157,1,588,1,589,1,590,1,591,1],"chop":[100,1,126,2,157,1],"remainder":[100,2,130,9,131,8,157,2],"magnitud":[100,1,130,1,131,2,157,1,584,1,585,1,586,1,587,1],"de":[100,1,116,2,157,1,432,1,457,1,458,1,580,1,581,1,582,1,583,1],"error":[100,1,107,1,115,2,123,2,143,1,157,1,341,1,345,2,346,2,361,2,362,2,457,2,458,2,576,2,577,2,578,2,579,2,580,2,581,4,582,2,583,4,592,2,593,2,594,2,595,2,596,2,597,4,598,2,599,4,615,1],"rather":[100,1,120,1,121,1,129,1,139,1,140,1,157,1,165,1],"divpd":[101,1],"vdivpd":[101,1],"divp":[102,1],"vdivp":[102,1],"divsd":[103,1],"vdivsd":[103,1],"divss":[104,1],"vdivss":[104,1],"dppd":[105,2],"vdppd":[105,1],"replac":[105,2,106,2,164,1,250,2,459,1,460,1,540,1,541,1],"intermediat":[105,3,106,3,158,1,164,2,265,2,293,6,306,8,307,2,308,2,309,2,310,2,372,2,376,2,421,4,467,3,468,3,469,3,470,3,471,4,472,4,473,3,474,3,475,3,476,3,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4,485,4,486,4,522,2,523,4,524,2,525,4,545,2,546,2],"qword":[105,1,213,2,284,6,291,4,295,2,297,2,299,2,301,2,309,2,358,2,454,2,491,2,492,2,493,2,494,2,495,4,497,2,511,2,521,2,531,1,534,2,536,2,538,1,544,2,545,4,546,4,556,10,557,2,560,2,574,4,586,6,605,2,606,2,607,1],"forward":[105,1,106,1,201,1,202,1,205,1,206,1],"rul":[105,2,106,2],"vol":[105,1,106,1],"cover":[105,1,106,1],"horizontal":[105,2,106,2,148,1,289,2,290,4],"prioritization":[105,1,106,1],"propagation":[105,1,106,1,455,1],"implementation":[105,1,106,1,143,1,147,1,184,2,215,1,228,4,249,4,317,4,318,5,319,5,345,1,346,1,350,1,408,2,414,2,415,1,416,1,417,1,418,1,578,1],"computationally":[105,1,106,1],"propagat":[105,1,106,1,365,1],"dpp":[106,2],"vdpp":[106,1],"function":[107,5,109,6,132,1,145,2,165,2,268,1,281,8,413,2,569,2,612,2,615,1],"regular":[107,2],"main":[107,2,165,6,612,3,613,2],"epc":[107,5],"cryptographically":[107,2],"authenticat":[107,2],"decrypt":[107,2],"eldb":[107,3],"block":[107,2,112,2,162,1,188,1,242,26,257,1,265,2,281,1,353,1,367,1,454,1,507,2,508,2],"epcm":[107,2],"eldu":[107,3],"pageinfo":[107,1],"hold":[107,2,148,1,149,2,493,2,494,2,542,2,543,2,560,2,604,2,605,2,606,2],"slot":[107,2,556,4],"eldbc":[107,1],"elduc":[107,1],"very":[107,1],"similar":[107,1,158,1,184,2,323,2,324,2,325,2,572,1,573,1,621,1,624,1],"concurrency":[107,1],"conflict":[107,1],"acquir":[107,1],"sec":[107,1],"va":[107,1],"parameter":[107,1,354,1],"emm":[108,6],"empty":[108,2,118,1,119,1,120,1,121,1,122,1,124,2,125,1,129,1,135,1,139,1,140,1,141,1,327,2,328,2,329,2,330,2,331,2,364,1,566,2,567,2,568,2],"alias":[108,2,228,2],"end":[108,1,112,1,209,1,344,1,364,2,393,1,618,2,622,2],"subroutin":[108,2,393,1],"incorrect":[108,1,143,1,463,1,464,1,465,1,466,1],"enclv":[109,11],"invok":[109,3,138,1,281,1,403,3,406,1],"virtualization":[109,2],"sgx":[109,2],"manag":[109,2,281,1,623,1,628,1,629,1,632,1,633,1],"enclav":[109,2],"virtualiz":[109,2],"environment":[109,2,133,5,137,9,138,1,193,3],"specific":[109,2,147,1,165,1,281,3,350,1,351,1,352,1,360,1,615,3,628,2,629,2,630,2,631,2,632,2,633,2],"act":[109,2],"unus":[109,2,542,1,543,1],"pe":[109,1,116,2,192,5,432,1],"rflag":[109,1,342,3,403,3,406,2],"vm":[109,1,167,2,315,3,342,3],"smm":[109,1,360,9],"additionally":[109,1,242,1],"protection":[109,1,144,1,154,1,186,2,191,1,209,2,210,2,211,2,217,1,227,2,230,2,231,2,265,1,281,1,286,2,287,2,289,2,290,2,293,2,306,1,321,2,342,1,349,2,350,1,405,4,456,1,615,3,616,2,622,1,623,1,628,1,629,1,630,1,631,1,632,1,633,1,634,3],"gp":[109,1,144,1,154,1,186,1,191,1,209,1,210,2,211,2,217,1,227,2,230,2,231,2,265,1,281,1,286,2,287,2,289,2,290,2,293,2,306,1,321,2,342,1,349,2,350,1,408,1,414,1,615,1,616,2,622,1,623,1,628,1,629,1,630,1,631,1,632,1,633,1,634,4],"pg":[109,1,192,2],"enabl":[109,4,153,2,154,2,248,2,249,2,342,1,350,2,390,2,393,1,403,2,406,1,456,1,618,4,634,2],"vmc":[109,2],"intercept":[109,1],"invocation":[109,1],"various":[109,1,125,1,126,1,130,1,131,1,132,2,134,1,139,1,146,1,147,1,228,1,370,1,569,1],"exit":[109,1,268,2],"bitmap":[109,1,623,1,628,3,629,3,630,2,631,2,632,3,633,3],"ia32":[109,2,154,2,249,1,348,2,352,8,369,4,402,5,403,8,404,3,405,2,406,2,414,1,615,1,629,2,633,2],"efer":[109,2],"lma":[109,2],"impact":[109,1,251,2,612,1,613,1],"calculation":[109,1,132,1,146,1,147,1,148,1,149,2,187,1,372,2,373,2,376,2,377,2,463,1,464,1,465,1,466,1],"endbr32":[110,1],"terminat":[110,2,111,2,195,2,353,1],"indirect":[110,2,111,2],"endbr64":[111,1],"enter":[112,5,188,5,249,4,341,1,360,4,402,1,405,1,406,2,408,3,413,1,414,3],"fram":[112,20,188,12],"compris":[112,2,166,1,537,2,569,2],"spac":[112,4,159,2,188,2,251,2,256,2,257,2],"dynamic":[112,4],"storag":[112,8],"imm16":[112,2],"dynamically":[112,2],"allocat":[112,2,188,2,199,1],"giv":[112,2,328,2,329,2,331,2],"lexical":[112,2],"nest":[112,8,167,5],"display":[112,1,145,1],"area":[112,1,144,1,628,4,629,4,630,4,631,4,632,4,633,4],"stackaddrsiz":[112,1],"66h":[112,1,313,1,337,1,342,1,348,2],"thus":[112,1,138,1,189,2,212,1,215,1,216,1,371,1,402,1,634,1],"transfer":[112,1,126,2,162,1,168,2,173,2,194,1,213,2,237,2,257,1,282,2,283,2,354,2,395,1],"sp":[112,3,313,4,341,5,464,1,466,1,496,4,498,4,500,3,502,2],"rsp":[112,3,342,1,403,1,406,1],"bp":[112,3,164,1,313,2,341,2],"ebp":[112,3,188,4,313,2,341,2],"rbp":[112,3],"companion":[112,1,404,2,405,2,406,2],"languag":[112,2,188,1,370,1],"typically":[112,1,133,1,137,1,185,1,193,1],"releas":[112,1,188,4,354,2],"onto":[112,1,115,2,123,2,127,3,128,2,132,3,134,2,145,2,341,2,342,4],"minus":[112,1],"whenever":[112,1,351,1,352,1],"final":[112,1,306,2,373,2,377,2,463,2,464,2,487,2,488,2,489,2,490,2,569,2,581,4,583,4,597,4,599,4],"would":[112,1,556,1],"extractp":[113,1],"vextractp":[113,1],"fill":[113,1,190,2,196,1,226,2,228,2,284,2,285,1,329,4,364,1,379,1,380,1,383,2,567,1],"gpr":[113,1,173,4],"quantity":[113,1,384,3,385,1,396,1,628,1,629,1,632,1,633,1],"fadd":[114,1],"faddp":[114,1],"fiadd":[114,1],"st":[114,6,117,4,118,7,119,5,120,6,121,6,122,3,125,3,126,4,127,2,129,8,130,11,131,11,132,5,134,5,135,3,139,8,140,8,141,9,142,10,145,10,146,10,147,13],"fbld":[115,1],"9":[115,1,133,1,137,2,243,2,262,2,263,2,264,2,318,1,332,2,334,2,335,2,345,1,346,1,364,1,395,1,632,1],"fh":[115,1],"fclex":[116,4],"fnclex":[116,6],"ue":[116,2,432,1,457,1,458,1,580,1,581,1,582,1,583,1],"oe":[116,2],"ze":[116,2,465,1,466,1],"ie":[116,2,465,1,466,1,572,2,573,2,574,2,575,2],"fwait":[116,1,124,1,136,1,137,1,138,1,143,1,611,4],"separately":[116,1,124,1,136,1,137,1,138,1],"ms":[116,1,124,1,136,1,138,1],"dos":[116,1,124,1,136,1,138,1],"possibl":[116,1,124,1,136,1,138,1,268,2,456,1,569,2],"unusual":[116,1,124,1,136,1,138,1],"circumstanc":[116,2,124,2,136,2,138,2,147,1],"prior":[116,1,124,1,136,1,138,2,154,1,189,6,190,1,199,1,341,2,371,4,403,1,404,1,405,1,413,1,414,1,581,2,583,2,597,2,599,2,616,1],"wait":[116,1,124,1,136,1,138,1,165,1,249,3,268,11,351,1,352,2,611,5,612,1,613,1],"get":[116,1,124,1,136,1,138,1,402,1,463,1,464,1,465,1,466,1,624,2],"window":[116,1,124,1,136,1,138,1],"quark":[116,1,124,1,136,1,138,1],"tm":[116,1,124,1,136,1,138,1],"x1000":[116,1,124,1,136,1,138,1],"fcmovb":[117,2],"fcmov":[117,5],"fcmovnb":[117,2],"fcmovn":[117,1],"fcmovnu":[117,1],"fcmovu":[117,1],"os":[117,2,402,2,403,5,404,1,405,1,406,5],"optimiz":[117,1,146,1,228,1,249,5,404,2,405,2,408,9,413,1,414,9],"small":[117,1,147,1,332,3],"construction":[117,1],"help":[117,1],"eliminat":[117,1,610,1],"overhead":[117,1],"misprediction":[117,1],"scalar":[117,1,163,3,237,3,346,2,362,2,420,2,594,2,595,2,602,2,603,2],"fcmovcc":[117,1],"wer":[117,1,189,2,354,1],"introduc":[117,1,268,1],"p6":[117,1,384,1],"fcom":[118,4,141,3],"fcomp":[118,2,141,3],"fcompp":[118,2,141,3],"c0":[118,2,122,2,141,2],"c2":[118,2,122,2,132,2,134,2,141,2],"c3":[118,2,122,2,141,2],"class":[118,1,119,1,122,1,125,1,126,1,130,1,131,1,132,2,134,1,139,1,141,1,146,1,147,1],"fxam":[118,1,119,1,122,1,138,1,141,1],"examin":[118,1,119,1,122,1,138,1,141,1,349,1,616,1],"unsupport":[118,2,119,2,125,1,141,2,281,1,350,1],"arithmetic":[118,4,119,2,125,2,141,2,248,2,275,1,276,1,279,1,280,1,355,4,364,2,365,1,368,1,463,1,464,1,465,1,466,1],"pop":[118,3,119,2,120,3,121,3,122,2,125,2,126,2,129,3,135,2,139,3,140,3,141,3,146,2,147,2,161,2,167,2,188,2,312,2,313,5,315,7,354,2],"twic":[118,1,141,1,158,1],"fucom":[118,2,141,3],"differenc":[118,1,119,1,139,2,140,2,141,1,242,3,320,6,409,2,454,2],"how":[118,1],"fcomi":[119,4],"fcomip":[119,5],"fucomi":[119,4],"fucomip":[119,5],"kind":[119,1,141,1],"fdiv":[120,2,121,1],"fdivp":[120,3,121,1],"fidiv":[120,2,121,1],"z":[120,1,145,1,422,1,424,2,425,2,459,1,460,1,506,1,511,1,518,2,519,2,520,2,540,1,541,1,596,1,597,1,598,1,599,1],"fdivr":[121,2,132,1],"fdivrp":[121,3],"fidivr":[121,2],"efficient":[121,1,140,1,169,1,189,1,248,2,371,1],"ficom":[122,1],"ficomp":[122,2],"fild":[123,1],"finit":[124,3,132,1,133,2,134,1,150,2,268,1,487,1],"fninit":[124,5,133,2],"their":[124,2,148,1,149,1,150,1,165,1,421,1,491,1,492,1,493,2,494,2,542,3,543,3,560,2,584,1,585,1,586,1,587,1,604,2,605,2,606,2,612,1,613,1,615,1],"037fh":[124,2],"nearest":[124,2,128,1,131,1,426,1,427,1,455,1],"11b":[124,2,322,2],"fist":[125,4],"fistp":[125,3],"rc":[125,1,128,3,135,1,432,1],"too":[125,1,135,1,262,4,311,1,332,6,333,2],"larg":[125,1,135,1,262,3,311,1,332,3,333,2],"fisttp":[126,5],"truncation":[126,2,158,1,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,549,2,550,2,552,2,553,2,554,2,555,2],"accept":[126,2,195,1],"long":[126,2,353,1],"fld":[127,2],"automatically":[127,2,162,1,194,3,209,1,234,1,257,1,312,1,367,2,395,1,621,2],"duplicat":[127,1,214,3,235,2,236,2],"fld1":[128,1],"fldl2e":[128,1],"fldl2t":[128,1],"fldlg2":[128,1],"fldln2":[128,1],"fldpi":[128,1],"fldz":[128,1],"seven":[128,2],"commonly":[128,2,147,1,188,1,190,1,197,1],"log210":[128,1],"log2e":[128,1],"log102":[128,1],"loge2":[128,1],"internal":[128,2,165,4,228,6,612,4,613,4],"66":[128,2],"p":[128,2,584,1,585,1,586,1,587,1],"c1":[128,2],"log":[128,4,146,5,147,3],"approximation":[128,1,132,2,134,2,345,1,346,1,361,1,362,1,576,2,577,2,578,2,579,2,580,2,581,2,582,2,583,2,592,3,593,3,594,3,595,3],"pi":[128,1,132,1,134,1],"8087":[128,1,132,1],"287":[128,1],"math":[128,1,132,1],"coprocessor":[128,1,132,1],"fimul":[129,2],"fmul":[129,2],"fmulp":[129,3],"product":[129,5,158,5,243,2,455,2,507,2,508,2,545,2,546,2,584,1,585,1,586,1,587,1],"exclusiv":[129,1,193,2,317,1,318,2,343,2,344,2,605,1,606,1,625,2],"multipli":[129,1,242,4,293,2,294,2,503,3,504,4],"fprem":[130,1,138,1],"modulus":[130,4,131,4],"q":[130,2,131,2,258,1,278,1,512,2,531,1,538,1,566,1,568,1,569,3,571,1],"unless":[130,1,131,1,153,1,165,1,281,2,491,1,492,1,542,2,543,2,560,2,604,2],"partial":[130,1,131,1,132,2,424,1,425,1,459,1,460,1,518,1,519,1,520,1,540,1,541,1,628,2,629,2,630,2,631,2,632,2,633,2],"exact":[130,1,131,1,578,1],"underflow":[130,1,131,1,132,2,134,1,135,1,139,1,146,1,147,1,345,1,346,1,432,1,576,2,577,2,578,2,579,2,600,2,601,2,602,2,603,2],"fprem1":[131,1,138,1],"iee":[131,2,145,2,600,1,601,1,602,1,603,1],"half":[131,1,158,2,248,5,272,2,431,2,432,2,491,1,492,1,534,1,536,1],"fptan":[132,3],"approximat":[132,2,134,2,345,2,346,2,361,2,362,2,457,4,458,4,576,2,577,2,578,2,579,2,580,2,581,2,582,2,583,2,592,2,593,2,594,2,595,2,596,2,597,2,598,2,599,2],"tangent":[132,6],"radian":[132,2,134,1],"263":[132,1],"acceptabl":[132,1,134,1,147,1],"multipl":[132,1,134,1,154,1,199,1,200,1,215,1,227,1,228,1,229,1,230,1,231,1,232,1,281,2,419,1,420,1,454,2,463,1,464,1,465,1,466,1,507,1,508,1],"inaccurat":[132,1,134,1],"internally":[132,1,134,1,164,2,165,1],"argument":[132,2,134,2,147,1,219,6,222,6,270,2,617,2],"reduction":[132,2,134,2,148,2,150,2,584,4,585,4,586,4,587,4],"sufficient":[132,1,134,1],"accurat":[132,1,134,1],"saf":[132,1,134,1],"accurately":[132,1,134,1],"smaller":[132,1,134,1],"transcendental":[132,1,134,1],"accuracy":[132,1,134,1,147,1],"discussion":[132,1,134,1,341,1,628,1,629,1,632,1,633,1],"proper":[132,1,134,1,600,2,601,2,602,2,603,2],"maintain":[132,1,154,2],"intel287":[132,1],"trigonometric":[132,1],"instanc":[132,1,138,1,317,2,393,1],"cotangent":[132,1],"reciprocal":[132,1,345,2,346,2,361,2,362,2,463,1,464,1,465,1,466,1,576,2,577,2,578,2,579,2,580,4,581,4,582,4,583,4,592,2,593,2,594,2,595,2,596,4,597,4,598,4,599,4],"fnsav":[133,5,143,1],"fsav":[133,5,143,1],"re":[133,2,491,1,492,1,542,1,543,1,560,1,604,1],"initializ":[133,3],"consist":[133,1,137,2,166,1],"layout":[133,2,137,4,143,9,144,3],"80":[133,1,186,1],"imag":[133,2,137,1,143,6,144,1,167,2,342,2],"stream":[133,1,137,1,168,2,228,1,251,2],"unit":[133,1],"handler":[133,1,137,2,138,1,164,5,167,5,353,1,403,4,406,3],"clean":[133,1],"fsinco":[134,2],"sin":[134,5],"cosin":[134,5],"faster":[134,2],"fsin":[134,2],"fco":[134,2],"succession":[134,2],"tak":[134,1,142,1,146,1,147,1,154,1,251,2,282,2,367,1,419,1,420,1,569,2],"fst":[135,4],"fstp":[135,3],"significand":[135,2,145,8,499,1,500,1,501,1,502,1,584,1,585,1,586,1,587,1],"width":[135,2,215,4,312,1,340,1,350,3,380,1,413,1,491,1,492,1],"exponent":[135,2,145,11,495,5,496,5,497,5,498,5,584,1,585,1,586,1,587,1],"bia":[135,1],"numeric":[135,2,345,1,346,1],"o":[135,1,159,14,162,13,256,15,257,17],"denormal":[135,2,345,1,346,1,356,1,357,1,358,1,359,1,361,1,362,1,426,2,427,2,431,2,432,2,455,2,457,2,458,2,463,1,464,1,465,1,466,1,487,2,495,3,496,3,497,3,498,3,576,1,577,1,578,1,579,1,580,2,581,2,582,2,583,2,592,1,593,1,594,1,595,1,596,2,597,2,598,2,599,2],"simply":[135,1,147,1],"u":[135,1,345,1,346,1],"fit":[135,1],"identity":[135,1],"fnstcw":[136,6],"fstcw":[136,4],"fnstenv":[137,4],"fstenv":[137,4],"prevent":[137,1,227,2,230,2,231,2,287,1,332,1,333,1,341,1,413,1],"fnstsw":[138,8],"fstsw":[138,4],"primarily":[138,1],"direction":[138,1],"further":[138,1],"guarant":[138,1,147,1,345,2,346,2,413,1],"completion":[138,1,189,2,215,1,216,1],"fisub":[139,2,140,1],"fsub":[139,2,140,1],"fsubp":[139,3,140,1],"38":[139,1],"neither":[139,1,146,1,402,1],"src":[139,2,570,2,571,2,584,4,585,4,586,4,587,4],"dest":[139,2,584,1,585,1,586,1,587,1,608,6],"fisubr":[140,2],"fsubr":[140,2],"fsubrp":[140,3],"fucomp":[141,4],"fucompp":[141,4],"fxch":[142,1],"exchang":[142,4,402,3,619,2,621,4],"simpl":[142,1],"sequenc":[142,1,201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1,268,2,463,2,464,2,465,2,466,2,618,1,619,1],"squar":[142,1,361,2,362,2,386,2,387,2,388,2,389,2,592,2,593,2,594,2,595,2,596,2,597,2,598,4,599,4],"fxrstor":[143,13,628,1,629,1,630,1,631,1,632,1,633,1],"reload":[143,2],"previously":[143,2,615,2,634,2],"fxsav":[143,11,144,3,628,1,629,1,630,1,631,1,632,1,633,1],"boundary":[143,2,144,1,184,4,199,2,200,2,209,1,210,2,211,2,216,2,217,1,227,2,230,2,231,2,265,1,286,2,287,2,289,2,290,2,293,2,306,1,321,2,364,2,393,2,415,1,416,1,417,1,418,1,419,2,420,2,507,1,508,1,556,2,628,1,629,1,630,1,631,1,632,1,633,1],"map":[143,2,166,3,360,1,569,1],"fxsave64":[143,4],"fxrstor64":[143,4],"43":[143,3,144,1],"46":[143,3],"47":[143,3,403,1],"incompatibl":[143,1],"restoration":[143,1,360,2],"osfxsr":[143,1],"restor":[143,1,188,2,360,2,403,2,406,1,620,1,628,4,629,4],"next":[143,1,185,1,209,2,341,1,353,1,368,2,372,2,373,2,375,2,376,2,377,2,378,2,382,2,393,1],"occurrenc":[143,1],"32e":[144,2,166,1,384,1,404,1,405,1],"464":[144,2],"511":[144,2],"misalign":[144,1,193,1],"fxtract":[145,2],"separat":[145,2],"express":[145,4,584,2,585,2,586,2,587,2],"3fffh":[145,2],"bias":[145,2,495,2,496,2,497,2,498,2,584,1,585,1,586,1,587,1],"unbias":[145,2,495,6,496,6,497,6,498,6],"superset":[145,2],"logb":[145,2],"x":[145,2,146,2,148,13,149,8,150,5,189,1,371,1,463,1,464,1,465,1,466,1,499,3,500,3,501,2,502,2],"f2xm1":[145,1],"power":[145,1,249,2,268,3,364,1,408,4,414,4,600,2,601,2,602,2,603,2],"scal":[145,1,147,3,459,1,460,1,491,2,492,2,539,1,540,1,541,1,542,4,543,4,560,4,588,1,589,1,590,1,591,1,600,4,601,4,602,4,603,4,604,4],"representation":[145,1,150,2,370,1,495,5,496,5,497,5,498,5],"print":[145,1],"fyl2x":[146,2,147,1],"log2":[146,1,147,1],"positiv":[146,3,326,2,523,2,525,2,600,1,601,1,602,1,603,1],"opposit":[146,1,169,1,370,1,572,2,573,2],"built":[146,1],"logarithm":[146,1,147,3],"arbitrary":[146,1,569,1],"fyl2xp1":[147,3],"rely":[147,1],"epsilon":[147,3],"optimal":[147,1],"clos":[147,1],"expression":[147,1,569,1],"compound":[147,1],"interest":[147,1],"annuity":[147,1],"factor":[147,3,461,3,462,3,491,2,492,2,612,1,613,1],"equation":[147,1,600,1,601,1,602,1,603,1],"calculat":[147,1,158,1,242,6,314,2,374,4,454,3,572,2,573,2,574,2,575,2],"n":[147,2,164,4,308,1,459,1,460,1,463,1,464,1,465,1,466,1,539,1,540,1,541,1],"vgf2p8affineinvqb":[148,1],"affineinvb":[148,2],"affin":[148,4,149,4],"galois":[148,2,149,2],"28":[148,1,149,1,150,2,215,1,580,2,581,2,582,2,583,2,584,1,585,1,586,1,587,1,596,2,597,2,598,2,599,2],"inv":[148,2],"matrix":[148,2,149,2],"x8":[148,1,150,1],"x4":[148,1,150,1],"x3":[148,1,150,1,322,1],"correspondingly":[148,1,149,2],"16b":[148,1],"nibbl":[148,2],"vertical":[148,1],"axis":[148,2],"0x95":[148,1],"0x8a":[148,1],"vgf2p8affineqb":[149,1],"affineb":[149,2],"require16b":[149,1,150,1],"vgf2p8mulb":[150,1],"gf":[150,4],"haddpd":[151,2],"vhaddpd":[151,2],"17":[151,1,281,1,328,2,342,2,351,1,352,1,514,1,515,1,516,1,517,1],"haddp":[152,1],"vhaddp":[152,1],"fourth":[152,3,156,3,190,2,320,1,569,1],"hlt":[153,9],"stop":[153,2],"halt":[153,4],"smi":[153,2],"debug":[153,2,164,3,209,1],"binit":[153,2],"resum":[153,4,167,1,353,1,360,1,617,2,622,2],"hyper":[153,1],"thread":[153,1],"physical":[153,1],"individually":[153,1,566,1,567,1,568,1],"run":[153,1,165,1,192,1,385,1,396,2,404,4,612,1,613,1,619,1],"hreset":[154,9],"request":[154,3,318,2,628,2,629,2,630,2,631,2,632,2,633,2],"selectively":[154,2],"component":[154,4,623,1,628,4,629,4,630,4,631,4,632,4,633,4],"history":[154,4],"controll":[154,2],"enumerat":[154,2,281,2,408,1,413,1,414,1],"capability":[154,1,281,2],"20h":[154,2],"0h":[154,2,349,1,616,1],"what":[154,1,413,1],"msr":[154,2,249,1,348,2,351,5,352,11,369,4,402,5,403,9,404,4,405,3,406,2,414,2,615,18,629,2,633,2],"hsubpd":[155,4],"vhsubpd":[155,2],"horizontally":[155,2,286,2,287,4],"dp":[155,2,358,2,463,1,465,1,495,4,497,4,499,3,501,2],"fp":[155,2,358,2,463,1,464,1,465,1,466,1,495,7,496,7,497,7,498,7,499,3,500,3,501,2,502,2,572,3,573,3,574,2,575,2,584,6,585,6,586,6,587,6],"20":[155,1,196,2,338,2,572,1,573,1],"hsubp":[156,1],"vhsubp":[156,1],"idiv":[157,1],"51":[157,1],"imul":[158,2],"exactly":[158,1],"lost":[158,1,165,2],"port":[159,16,162,13,256,15,257,15],"65":[159,2,162,2,256,2,257,2],"535":[159,2,162,2,256,2,257,2],"255":[159,2,164,2,256,2],"shorter":[159,1,256,1],"inc":[160,3,193,1],"40h":[160,1],"incsspd":[161,1],"incsspq":[161,1],"discard":[161,2,364,2,407,2,620,1],"ins":[162,5,353,2],"insb":[162,3],"insd":[162,3],"insw":[162,3],"choic":[162,1,257,1],"rep":[162,4,257,4,353,15,367,1],"repz":[162,1,257,1,353,8],"repn":[162,1,257,1,353,9],"repnz":[162,1,257,1,353,8],"repeat":[162,1,242,1,257,1,353,18],"2b":[162,1,190,1,415,2],"insertp":[163,1],"vinsertp":[163,1],"zmask":[163,1],"count":[163,3,177,4,178,4,195,4,198,2,265,2,275,2,285,6,291,6,292,5,314,2,327,8,328,8,329,8,330,7,331,8,344,7,353,4,354,2,355,2,364,8,365,3,379,11,380,12,409,2,544,2,557,2,558,11,559,11,566,6,567,6,568,6],"overwritten":[163,1,530,1,537,1],"int":[164,5],"int1":[164,4],"int3":[164,4],"gat":[164,2,354,2],"descriptor":[164,2,166,4,183,7,186,1,190,9,191,11,196,7,197,7,209,3,312,2,313,1,383,3,384,4,403,5,404,5,405,5,406,5],"idt":[164,2,190,2],"special":[164,1,165,2,350,1,364,1,463,1,464,1,465,1,466,1,487,2,488,2,489,2,490,2,495,1,496,1,497,1,498,1,578,1,579,1,612,2],"breakpoint":[164,3,491,1,492,1,542,1,543,1,560,1,604,1],"overwrit":[164,1],"f1":[164,1],"db":[164,1],"dr6":[164,1],"reason":[164,1,228,2,268,2,281,1,406,1],"invd":[165,4,612,1],"direct":[165,2,215,12,216,13,612,2],"themselv":[165,2],"held":[165,2,215,1,216,1,353,1],"complet":[165,1,189,8,191,1,368,2,612,2,613,2,616,1],"responsibility":[165,1,403,2,404,1,405,1,406,1,612,1,613,1],"respond":[165,1,393,2,612,1,613,1],"devic":[165,2],"actively":[165,1],"car":[165,1],"pciwrit":[165,1],"temporarily":[165,1],"requirement":[165,1,618,1],"benefit":[165,1],"recovery":[165,1],"coherency":[165,1,612,1],"concern":[165,1,612,1],"wbinvd":[165,1,612,5],"invpcid":[166,12],"lookasid":[166,2,615,1],"buffer":[166,2,215,2,216,2,228,6,368,2,615,1],"tlb":[166,2,615,2],"identifier":[166,3,281,5],"pcid":[166,9],"invalidation":[166,2],"currently":[166,1,173,1,396,2,634,1],"000h":[166,3],"iret":[167,6],"iretd":[167,3],"iretq":[167,1],"initiat":[167,2,395,1],"interchangeably":[167,1],"nt":[167,2],"equally":[167,1],"routin":[167,1,189,2,371,2,404,2],"jmp":[168,2,169,1,209,1],"record":[168,2,367,2],"jump":[168,9,169,11,195,1,620,2],"rel8":[168,1,169,1],"refer":[168,1,370,2,403,1,406,1,618,2,620,2],"ja":[169,2],"jae":[169,1],"jb":[169,1],"jbe":[169,1],"jc":[169,1],"jcxz":[169,1],"je":[169,1],"jecxz":[169,1,353,1],"jg":[169,1],"jge":[169,1],"jl":[169,1],"jle":[169,1],"jna":[169,2],"jnb":[169,3],"jnc":[169,1],"jne":[169,1,353,1],"jng":[169,2],"jnl":[169,2],"jno":[169,1],"jnp":[169,1],"jns":[169,1],"jnz":[169,1,353,1],"jo":[169,1],"jp":[169,1],"jpe":[169,1],"jpo":[169,1],"jrcxz":[169,1],"js":[169,1],"jz":[169,1,353,1],"jcc":[169,1],"rel16":[169,1],"rel32":[169,1],"label":[169,1,195,1],"ad":[169,1,195,1,269,4,293,4,294,2,306,2,353,6,374,2,545,2,546,2],"77h":[169,1],"unconditional":[169,1],"illegal":[169,1],"kaddb":[170,1],"kaddd":[170,1],"kaddq":[170,1],"kaddw":[170,1],"k3":[170,2,171,2,172,2,176,2,181,2,182,2],"kandnb":[171,1],"kandnd":[171,1],"kandnq":[171,1],"kandnw":[171,1],"kandb":[172,1],"kandd":[172,1],"kandq":[172,1],"kandw":[172,1],"kmovb":[173,1],"kmovd":[173,1],"kmovq":[173,1],"kmovw":[173,1],"64b":[173,1],"knotb":[174,1],"knotd":[174,1],"knotq":[174,1],"knotw":[174,1],"kortestb":[175,1],"kortestd":[175,1],"kortestq":[175,1],"kortestw":[175,1],"don":[175,1,403,1],"korb":[176,1],"kord":[176,1],"korq":[176,1],"korw":[176,1],"kshiftlb":[177,1],"kshiftld":[177,1],"kshiftlq":[177,1],"kshiftlw":[177,1],"kshiftrb":[178,1],"kshiftrd":[178,1],"kshiftrq":[178,1],"kshiftrw":[178,1],"right":[178,2,183,6,265,4,269,2,306,2,329,5,330,2,331,5,344,3,355,2,364,6,365,5,379,1,380,1,421,2,559,2,563,2,564,2,567,4,568,4],"ktestb":[179,1],"ktestd":[179,1],"ktestq":[179,1],"ktestw":[179,1],"kunpckbw":[180,1],"kunpckdq":[180,1],"kunpckwd":[180,1],"kxnorb":[181,1],"kxnord":[181,1],"kxnorq":[181,1],"kxnorw":[181,1],"xnor":[181,2],"kxorb":[182,1],"kxord":[182,1],"kxorq":[182,1],"kxorw":[182,1],"lar":[183,2,191,1],"onc":[183,1,196,1],"lddqu":[184,3],"vlddqu":[184,1],"v":[184,8,185,2,242,2,263,2,264,2,265,2,269,2,273,3,286,2,287,4,289,2,290,4,293,2,294,1,326,9,328,3,329,2,331,2,332,6,333,1,334,2,335,2],"movdqu":[184,4,218,1],"m256":[184,2],"m128":[184,2,275,3,276,3,279,1,280,1],"cross":[184,1],"situation":[184,1,268,2,294,1,612,1],"movdqa":[184,2,217,1,228,1],"known":[184,1],"ldmxcsr":[185,3],"vldmxcsr":[185,1],"conjunction":[185,1,199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1],"stmxcsr":[185,1,394,1],"1f80h":[185,1],"meet":[185,1,618,1],"lds":[186,1],"les":[186,1],"lfs":[186,1],"lgs":[186,1],"lss":[186,1,209,1],"48":[186,2,406,1],"ss":[186,2,191,2,209,3,312,1,341,2,403,2,404,2,405,2,406,2,572,1,573,1],"fs":[186,3,191,2,209,2,312,1,347,3,456,1,614,3],"gs":[186,3,191,2,209,2,312,1,347,3,402,9,456,1,614,3],"hidden":[186,1,209,1,312,1],"null":[186,2,209,2,279,2,280,2],"0000":[186,1,209,1,523,2,525,2],"0003":[186,1,209,1],"whos":[186,1,209,1,242,2],"chosen":[187,2],"algorithm":[187,1,199,1,209,1],"symbolic":[187,1],"govern":[187,2,408,2,414,2],"55":[187,1],"old":[188,2,199,1],"detail":[188,1,193,1,315,1,317,1,318,1,319,1,337,2,350,1,351,1,352,1,354,1,403,2,404,1,405,1,406,2,465,1,466,1,572,2,573,2,574,1,575,1,628,2,629,2,630,2,631,2,632,2,633,2],"lfenc":[189,23,317,1,371,2],"serializ":[189,2,192,1,351,1,352,1,368,10,371,2,612,2,613,2,615,3],"until":[189,6,351,1,352,1,353,3,616,1],"locally":[189,2],"might":[189,2,199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1,403,1],"becom":[189,2,268,1,344,1,371,2,465,2,466,2],"globally":[189,2,352,2,371,4],"visibl":[189,2,352,2,371,4],"weakly":[189,3,199,1,200,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,371,3],"techniqu":[189,1,371,1],"degre":[189,1,371,1],"consumer":[189,1,371,1],"recogniz":[189,1,371,1,393,2,619,1],"know":[189,1,371,1],"vary":[189,1,371,1,612,1,613,1],"among":[189,1,371,1],"unknown":[189,1,371,1],"producer":[189,1,371,1],"consum":[189,1,268,2,371,1],"brought":[189,1,318,2,605,1,606,1],"specification":[189,1,371,1],"modr":[189,2,318,2,319,1,336,1,347,2,370,1,371,2,608,1,614,2],"m":[189,3,318,2,319,1,336,1,347,4,370,1,371,3,584,5,585,5,586,5,587,5,608,1,614,4],"e8":[189,1],"ae":[189,1,371,1],"ex":[189,1],"f":[189,1,371,1,378,3],"lgdt":[190,2,383,1],"lidt":[190,2,383,1],"global":[190,5,191,2,197,2,383,1,615,1],"gdtr":[190,5,383,1],"idtr":[190,5,383,3],"gdt":[190,2,191,2,197,2,209,1,384,2,403,2,404,2,405,2,406,2],"fifth":[190,2,320,1],"fix":[190,1,191,1,197,1,242,1,383,1,396,1,403,2,404,2,405,2,406,2,456,1,463,9,464,9,465,9,466,9,624,1],"sgdt":[190,1],"lldt":[191,3],"local":[191,4,384,2],"ldtr":[191,9,384,2],"ldt":[191,7,209,1,384,2,403,2,404,2,405,2,406,2],"tss":[191,2,197,6,396,2],"silently":[191,1],"verr":[191,1,456,5],"verw":[191,1,456,5],"lsl":[191,1,196,2],"lmsw":[192,3],"mp":[192,2],"em":[192,2],"cd":[192,2],"nw":[192,2],"am":[192,2],"wp":[192,2,215,2,216,2,227,1,229,1,230,1,231,1,232,1],"ne":[192,2],"et":[192,2],"286":[192,1,383,3,385,1],"intel386":[192,1,384,1,385,1],"whol":[192,1],"assert":[193,6],"accompany":[193,2],"turn":[193,2,345,1,346,1],"atomic":[193,2],"multiprocessor":[193,2],"shar":[193,3,612,1],"prepend":[193,1],"cmpxch8b":[193,1],"neg":[193,1,250,1],"sbb":[193,1,366,4],"xadd":[193,1,619,1],"list":[193,1,356,1,357,1,358,1,359,1,432,1,487,1,488,1,489,1,490,1,495,1,496,1,497,1,498,1,514,1,515,1,516,1,517,1,569,1,572,2,573,2,574,1,575,1,588,1,589,1,590,1,591,1,615,1],"absenc":[193,1,621,2],"integrity":[193,1],"observ":[193,1],"arbitrarily":[193,1],"lod":[194,4,353,2],"lodsb":[194,2],"lodsd":[194,2],"lodsq":[194,2],"lodsw":[194,2],"loopn":[195,1],"cx":[195,2,313,2,341,2],"over":[195,2,419,1,420,1],"ridden":[195,2],"67h":[195,2,215,6],"presumably":[195,1],"ip":[195,1],"reach":[195,1,408,1,414,1],"unscrambl":[196,2],"granular":[196,4,242,2,461,3,462,3,503,1,504,4,556,2],"granularity":[196,2,217,1,218,1,235,1,236,1,265,2,266,1,267,1,305,1,381,2,382,2,454,1,461,2,462,3,503,5,504,3,528,1,530,2,537,2,545,1,546,1,569,2,607,1],"translat":[196,1],"raw":[196,1],"ltr":[197,2],"establish":[197,1],"still":[197,1,415,1,416,1,417,1,418,1],"lzcnt":[198,4],"lead":[198,2,318,1,544,2,584,1,585,1,586,1,587,1],"maskmovdqu":[199,5,505,1,547,1],"vmaskmovdqu":[199,1],"natural":[199,2,200,2],"temporal":[199,4,200,4,215,4,216,4,227,8,228,7,229,8,230,8,231,8,232,8],"minimiz":[199,1,200,1,229,2,232,2],"pollution":[199,1,200,1,229,2,232,2],"implement":[199,2,200,2,215,1,216,1,227,2,228,4,229,2,230,2,231,2,232,2,249,1,268,1,272,1,350,2,402,1,514,1,515,1,516,1,517,1,569,1,621,3,623,2],"protocol":[199,2,200,2,215,3,216,3,227,3,228,3,229,3,230,3,231,3,232,3,621,4],"vs":[199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1],"consistency":[199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1],"model":[199,1,200,1,227,1,228,1,229,1,230,1,231,1,232,1,251,1,360,1,615,3],"mfenc":[199,1,200,1,215,1,216,1,227,1,228,1,229,1,230,1,231,1,232,1,317,1,371,2],"basis":[199,1,506,2],"ownership":[199,1,317,1,318,2],"doing":[199,1,455,1],"unnecessary":[199,1],"bandwidth":[199,1],"maskmovq":[200,4,505,1,547,1],"maxpd":[201,2],"vmaxpd":[201,1,572,1,573,1],"emulat":[201,1,202,1,203,1,204,1,205,1,206,1,207,1,208,1],"maxp":[202,2],"vmaxp":[202,1],"maxsd":[203,2],"vmaxsd":[203,1],"maxss":[204,2],"vmaxss":[204,1],"minpd":[205,2],"vminpd":[205,1,572,1,573,1],"minimum":[205,2,206,2,207,2,208,2,288,4,298,2,299,2,300,2,301,2,317,1,318,1,319,1],"minp":[206,2],"vminp":[206,1],"minsd":[207,2,208,1],"vminsd":[207,1],"minss":[208,1],"vminss":[208,1],"validat":[209,1,312,1],"suppress":[209,1],"inhibit":[209,2,393,2],"inhibition":[209,1,393,1],"delivery":[209,1,341,1,393,1,412,1],"event":[209,1,249,2,393,1,612,1,613,1],"deliver":[209,1,341,1,406,1,491,1,492,1,542,1,543,1,560,1,604,1],"together":[209,1,269,2,294,2,487,2,488,2,489,2,490,2],"movapd":[210,1],"vmovapd":[210,1],"unalign":[210,2,211,2,217,1,556,3],"vmovupd":[210,2,239,1],"float64":[210,2,239,1,422,2,497,1,580,2,582,4,596,2,598,4],"movap":[211,1],"vmovap":[211,1],"vmovup":[211,2,240,1],"float32":[211,2,240,1,422,2,498,1,581,2,583,4,597,2,599,4,601,2,603,2],"movb":[212,2],"movd":[213,1],"movq":[213,1],"vmovd":[213,1],"vmovq":[213,1],"movddup":[214,1],"vmovddup":[214,1],"adjacent":[214,2,235,2,286,2,287,4,289,2,290,4,293,4,294,4,524,2,525,2],"movdir64b":[215,7],"atomicity":[215,4,216,1],"normal":[215,3,228,1,402,1,415,1,416,1,417,1,418,1,431,1,463,1,464,1,465,1,466,1],"restriction":[215,2],"enforc":[215,3,216,1,415,1,416,1,417,1,418,1],"unlik":[215,2,216,2,408,1,505,1,547,1,620,2],"uc":[215,2,216,2,227,1,229,1,230,1,231,1,232,1],"irrespectiv":[215,1,216,1,457,2,458,2,580,2,581,2,582,2,583,2],"eligibl":[215,1,216,1],"eviction":[215,1,216,1,228,1],"comb":[215,1,216,1],"stronger":[215,1,216,1],"guarante":[215,2,216,1],"arriv":[215,1,216,3],"undivid":[215,1,216,1],"2a":[215,1,216,1,383,1],"movdiri":[216,5],"uncach":[216,1],"split":[216,2],"27":[216,1,572,1,573,1,574,1,575,1],"vmovdqa":[217,1],"vmovdqa32":[217,2],"vmovdqa64":[217,2],"int32":[217,2],"int64":[217,2],"vmovdqu":[217,1,218,1],"vmovdqu16":[218,2],"vmovdqu32":[218,2],"vmovdqu64":[218,2],"vmovdqu8":[218,2],"movhlp":[219,1],"vmovhlp":[219,1],"movhpd":[220,1],"vmovhpd":[220,1],"movhp":[221,1],"vmovhp":[221,1],"movlhp":[222,1],"vmovlhp":[222,1],"movlpd":[223,1],"vmovlpd":[223,1],"movlp":[224,1],"vmovlp":[224,1],"movmskpd":[225,1],"vmovmskpd":[225,1],"movmskp":[226,1],"vmovmskp":[226,1],"beyond":[226,2,259,3,260,2,261,2,263,2,264,2,334,2,364,2],"movntdq":[227,1],"vmovntdq":[227,2],"movntdqa":[228,7],"vmovntdqa":[228,1],"nontemporal":[228,3,505,1,547,1],"snoop":[228,2],"unread":[228,2],"portion":[228,2,340,1,419,1,420,1,503,3,504,4,507,1,508,1,556,1],"mis":[228,1],"speculation":[228,1],"agent":[228,1],"alter":[228,1,251,1,315,1],"natively":[228,1],"movnti":[229,2],"movntpd":[230,2],"vmovntpd":[230,1],"movntp":[231,2],"vmovntp":[231,1],"movntq":[232,2],"movq2dq":[233,2],"movsb":[234,2],"movsd":[234,2],"movsq":[234,1],"movsw":[234,2],"incr":[234,1],"ment":[234,1],"movshdup":[235,1],"vmovshdup":[235,1],"movsldup":[236,1],"vmovsldup":[236,1],"movss":[237,1],"vmovss":[237,1],"syntax":[237,2,272,1],"movsx":[238,1],"movsxd":[238,1],"movupd":[239,1],"movup":[240,1],"movzx":[241,1],"mpsadbw":[242,3],"vmpsadbw":[242,2],"sad":[242,11,454,7],"lan":[242,2,322,7,323,10,324,10,327,2,330,1,382,9],"stationary":[242,2],"slid":[242,2],"consecutiv":[242,2,419,1,420,1,507,1,508,1],"selectabl":[242,2],"imm":[242,3],"mpsadw":[242,1],"variabl":[242,1,374,6,375,2,532,2,533,2,558,1,559,1,562,2,564,2,618,1],"respectiv":[242,2,275,1,276,1,322,2,323,2,324,2,566,3,567,3,568,3,574,1,575,1,586,2,587,2],"mulpd":[244,1],"vmulpd":[244,1],"mulp":[245,1],"vmulp":[245,1],"mulsd":[246,1],"vmulsd":[246,3],"mulss":[247,1],"vmulss":[247,3],"mulx":[248,1],"interleav":[248,2,338,2,339,2,381,2,382,2,415,2,416,2,417,2,418,2],"mwait":[249,14,413,4],"principal":[249,2],"monitor":[249,10,350,7,413,13,414,3,615,1],"advanc":[249,2],"bio":[249,1],"misc":[249,1],"optional":[249,1,354,1],"prefer":[249,1,408,1,414,1],"break":[249,1],"definition":[249,1],"commenc":[249,1],"arm":[249,1,413,2],"inclusiv":[253,2],"orpd":[254,1],"vorpd":[254,1],"orp":[255,1],"vorp":[255,1],"outsb":[257,3],"outsd":[257,3],"outsw":[257,3],"pabsb":[258,5],"pabsd":[258,3],"pabsw":[258,3],"vpabsb":[258,2],"vpabsd":[258,2],"vpabsq":[258,1],"vpabsw":[258,1],"packssdw":[259,5],"packsswb":[259,5],"vpackssdw":[259,1],"vpacksswb":[259,1],"saturation":[259,4,260,2,263,4,264,4,334,2,335,2,508,2,549,4,550,4,552,4,553,4,554,4,555,4],"7fh":[259,2,263,2,334,2],"80h":[259,2,263,2,334,2],"7fffh":[259,1,263,2,334,2],"8000h":[259,1,263,2,294,1,334,2],"packusdw":[260,1],"vpackusdw":[260,1],"ffffh":[260,4,264,2],"0000h":[260,4,335,1],"packuswb":[261,1],"vpackuswb":[261,1],"ffh":[261,4,264,2],"paddb":[262,2],"paddd":[262,2],"paddq":[262,2],"paddw":[262,2],"vpaddb":[262,2],"vpaddd":[262,2],"vpaddq":[262,2],"vpaddw":[262,2],"illustration":[262,2,263,2,264,2,332,2,334,2,335,2,345,2,346,2,361,2,362,2],"wraparound":[262,2,332,2],"paragraph":[262,2,263,2,264,2,332,2,334,2,335,2],"individual":[262,3,263,2,264,2,294,2,328,2,329,2,331,2,332,3,334,2,335,2,522,2,523,2,524,2,525,2,558,2,559,2,566,2,567,2,568,2],"wrap":[262,3,294,2,311,1,332,3,333,2,556,1],"around":[262,3,294,2,311,1,332,3,333,2],"paddsb":[263,2],"paddsw":[263,2],"vpaddsb":[263,1],"vpaddsw":[263,1],"paddusb":[264,2],"paddusw":[264,2],"vpaddusb":[264,1],"vpaddusw":[264,1],"palignr":[265,3],"vpalignr":[265,1],"concatenat":[265,2,421,2,561,2,562,2,563,2,564,2],"composit":[265,4],"consider":[265,1,279,2,280,2,317,1,463,2,464,2,465,2,466,2,584,1,585,1,586,1,587,1],"2l":[265,1],"common":[265,1,491,2,492,2],"pand":[266,1],"vpand":[266,1],"vpandd":[266,1],"vpandq":[266,1],"pandn":[267,1],"vpandn":[267,1],"vpandnd":[267,1],"vpandnq":[267,1],"paus":[268,9,408,1],"spin":[268,12],"suffer":[268,2],"sever":[268,2],"greatly":[268,3],"extremely":[268,1],"quickly":[268,1,402,1],"lot":[268,1],"resourc":[268,1],"insert":[268,1,291,2,292,2,322,2,323,2,324,2,325,2,503,3,504,4,539,1],"consumption":[268,1],"backward":[268,1],"compatibl":[268,1,383,1],"xeon":[268,1,384,1],"delay":[268,3,393,1,414,1],"essentially":[268,1],"op":[268,1,272,1,514,1,515,1,516,1,517,1],"pavgb":[269,2],"pavgw":[269,2],"vpavgb":[269,1],"vpavgw":[269,1],"averag":[269,2],"pblendvb":[270,2],"vpblendvb":[270,1],"pblendw":[271,1],"vpblendw":[271,1],"pclmulqdq":[272,1],"vpclmulqdq":[272,1],"13":[272,2,487,2,488,2,489,2,490,2,623,1,628,4,629,4,630,3,631,3,632,4,633,4,634,1],"vl":[272,1,530,2,531,1,537,2,538,1],"compiler":[272,1,514,1,515,1,516,1,517,1],"pseudo":[272,1,514,1,515,1,516,1,517,1],"emit":[272,1],"pcmpeqb":[273,2],"pcmpeqd":[273,2],"pcmpeqw":[273,2],"vpcmpeqb":[273,1],"vpcmpeqd":[273,1],"vpcmpeqw":[273,1],"equality":[273,2,274,2,521,2],"pcmpeqq":[274,1],"vpcmpeqq":[274,2],"vpcmpestri":[275,1],"fragment":[275,3,276,3],"pcmpestri":[275,2,276,2,279,2,280,2],"pcmpestrm":[275,2,276,2,279,2,280,2],"pcmpistri":[275,2,276,2,279,2,280,2],"pcmpistrm":[275,2,276,2,279,2,280,2],"possibly":[275,1,276,1,279,1,280,1,424,1,425,1,519,1,520,1],"xmm1":[275,1,276,1,598,2,602,1,603,1],"xmm2":[275,1,276,1,602,1,603,1],"bit3":[275,1,276,1],"aggregation":[275,1,276,1,279,1,280,1],"intres2":[275,2,276,1,279,3,280,2],"standard":[275,1,276,1,279,1,280,1],"supply":[275,1,276,1,279,1,280,1],"relevant":[275,1,276,1,279,1,280,1],"vpcmpestrm":[276,1],"contol":[276,2],"pcmpgtb":[277,2],"pcmpgtd":[277,2],"pcmpgtw":[277,2],"vpcmpgtb":[277,1],"vpcmpgtd":[277,1,278,1],"vpcmpgtw":[277,1],"dat":[277,2],"pcmpgtq":[278,1],"vpcmpgtq":[278,1],"vpcmpistri":[279,1],"augment":[279,1,280,1],"cflag":[279,1,280,1],"vpcmpistrm":[280,1],"pconfig":[281,15],"configur":[281,2,572,1,573,1,574,1,575,1],"certain":[281,4],"platform":[281,2],"identifi":[281,2],"numerical":[281,1],"along":[281,1],"1bh":[281,1],"futur":[281,1,317,1,318,1,319,1],"mktm":[281,5],"pertain":[281,1],"keyid":[281,1],"struct":[281,2],"successful":[281,1,353,1,369,2,406,1,618,1],"failur":[281,2],"pdep":[282,5],"scatter":[282,2,560,2,604,2],"deposit":[282,2],"pext":[283,5],"pextrb":[284,2],"pextrd":[284,2],"pextrq":[284,2],"vpextrb":[284,2],"vpextrd":[284,2],"vpextrq":[284,1],"pextrw":[285,1],"vpextrw":[285,2],"phaddsw":[286,3],"vphaddsw":[286,1],"phaddd":[287,3],"phaddw":[287,3],"vphaddd":[287,1],"vphaddw":[287,1],"notation":[287,1,332,1,333,1,419,1,420,1,507,1,508,1],"undetect":[287,1,332,1,333,1],"phminposuw":[288,1],"vphminposuw":[288,1],"18":[288,2,306,6,329,2,403,1,406,1,569,1],"phsubsw":[289,3],"vphsubsw":[289,1],"phsubd":[290,3],"phsubw":[290,3],"vphsubd":[290,1],"vphsubw":[290,1],"pinsrb":[291,3],"pinsrd":[291,1],"pinsrq":[291,1],"vpinsrb":[291,1],"vpinsrd":[291,1],"vpinsrq":[291,2],"untouch":[291,2,292,1],"pinsrw":[292,1],"vpinsrw":[292,1],"avx":[292,2,610,1,634,2],"pmaddubsw":[293,3],"vpmaddubsw":[293,1],"vertically":[293,2,306,2],"2nd":[293,2,317,2,530,1,531,1,565,2,590,1,591,1],"pmaddwd":[294,2],"vpmaddwd":[294,1],"group":[294,1,320,5],"pmaxsb":[295,1],"pmaxsd":[295,1],"pmaxsw":[295,2],"vpmaxsb":[295,1],"vpmaxsd":[295,1],"vpmaxsq":[295,1],"vpmaxsw":[295,1],"pmaxub":[296,2],"pmaxuw":[296,1],"vpmaxub":[296,1],"vpmaxuw":[296,1],"pmaxud":[297,1],"vpmaxud":[297,1],"vpmaxuq":[297,1],"pminsb":[298,1],"pminsw":[298,2],"vpminsb":[298,1],"vpminsw":[298,1],"pminsd":[299,1],"vpminsd":[299,1],"vpminsq":[299,1],"pminub":[300,2],"pminuw":[300,1],"vpminub":[300,1],"vpminuw":[300,1],"pminud":[301,1],"vpminud":[301,1],"vpminuq":[301,1],"pmovmskb":[302,1],"vpmovmskb":[302,1],"pmovsxbd":[303,1],"pmovsxbq":[303,1],"pmovsxbw":[303,1],"pmovsxdq":[303,1],"pmovsxwd":[303,1],"pmovsxwq":[303,1],"vpmovsxbd":[303,1],"vpmovsxbq":[303,1],"vpmovsxbw":[303,1],"vpmovsxdq":[303,1],"vpmovsxwd":[303,1],"vpmovsxwq":[303,1],"pmovzxbd":[304,1],"pmovzxbq":[304,1],"pmovzxbw":[304,1],"pmovzxdq":[304,1],"pmovzxwd":[304,1],"pmovzxwq":[304,1],"vpmovzxbd":[304,1],"vpmovzxbq":[304,1],"vpmovzxbw":[304,1],"vpmovzxdq":[304,1],"vpmovzxwd":[304,1],"vpmovzxwq":[304,1],"pmuldq":[305,1],"vpmuldq":[305,1],"taken":[305,4,419,1,420,1],"3rd":[305,1,530,1,531,1,537,1,538,1],"5th":[305,1],"7th":[305,1],"pmulhrsw":[306,3],"vpmulhrsw":[306,1],"pmulhuw":[307,1],"vpmulhuw":[307,1],"pmulhw":[308,1],"vpmulhw":[308,1],"pmulld":[309,1],"vpmulld":[309,1],"vpmullq":[309,1],"pmullw":[310,1],"vpmullw":[310,1],"pmuludq":[311,1],"vpmuludq":[311,1],"amount":[312,2,317,1,318,1,319,1,340,2,612,1,613,1],"popa":[313,7,341,2],"popad":[313,7,341,2],"bx":[313,2,341,2,624,4],"pusha":[313,2,341,6],"pushad":[313,2,341,6],"necessary":[313,1,406,1,634,1],"popcnt":[314,1],"popf":[315,7,342,2],"popfd":[315,9,342,2],"popfq":[315,1],"pushf":[315,2,342,7],"pushfd":[315,2,342,7],"pushfq":[315,2,342,1],"rf":[315,2,342,2,491,1,492,1,542,1,543,1,560,1,604,1],"vip":[315,3,393,1],"insufficient":[315,1],"por":[316,1],"vpor":[316,1],"vpord":[316,1],"vporq":[316,1],"prefetchw":[317,6],"1st":[317,2,537,1,538,1],"exclusively":[317,1],"own":[317,1,615,1],"writeback":[317,1],"merely":[317,1,318,1,319,1],"closer":[317,1,318,2,319,2,521,2],"anticipation":[317,1,318,1,319,1],"characteristic":[317,1],"locality":[317,2,318,5,319,5,493,1,494,1,605,1,606,1],"overload":[317,1,318,1,319,1],"prefetchwt1":[318,2],"intent":[318,2],"prefetchnta":[319,1],"prefetcht0":[319,1],"prefetcht1":[319,1],"prefetcht2":[319,1],"psadbw":[320,3],"vpsadbw":[320,1],"14":[320,2,495,1,497,1,576,2,577,2,578,2,579,2,592,2,593,2,594,2,595,2],"79":[320,1],"143":[320,1],"207":[320,1],"192":[320,1],"271":[320,1],"sixth":[320,1],"335":[320,1],"320":[320,1],"seventh":[320,1],"eighth":[320,1],"399":[320,1],"384":[320,1],"463":[320,1],"447":[320,1],"pshufb":[321,3],"vpshufb":[321,1],"shuffl":[321,12,381,2,382,6],"permut":[321,4,526,2,527,2,530,2,531,2,532,3,533,3,537,2,538,2],"pshufd":[322,1,325,2],"vpshufd":[322,5,323,2,324,2],"operativ":[322,1,323,2,324,2],"10b":[322,1],"x2":[322,1],"x7":[322,1],"pshufhw":[323,1],"vpshufhw":[323,1],"illustrat":[323,2,324,2,325,2],"pshuflw":[324,1],"vpshuflw":[324,1],"pshufw":[325,3],"psignb":[326,4],"psignd":[326,4],"psignw":[326,4],"vpsignb":[326,1],"vpsignd":[326,1],"vpsignw":[326,1],"negat":[326,2,479,4,480,4,481,4,482,4,483,4,484,4,485,4,486,4],"pslldq":[327,1],"vpslldq":[327,1],"pslld":[328,2],"psllq":[328,2],"psllw":[328,2],"vpslld":[328,1],"vpsllq":[328,1],"vpsllw":[328,1],"psrad":[329,2],"psraw":[329,2],"vpsrad":[329,1],"vpsraq":[329,1],"vpsraw":[329,1],"psrldq":[330,1],"vpsrldq":[330,1],"psrld":[331,2],"psrlq":[331,2],"psrlw":[331,2],"vpsrld":[331,1],"vpsrlq":[331,1],"vpsrlw":[331,1],"psubb":[332,3],"psubd":[332,3],"psubw":[332,3],"vpsubb":[332,1],"vpsubd":[332,1],"vpsubw":[332,1],"psubq":[333,2],"vpsubq":[333,1],"psubsb":[334,2],"psubsw":[334,2],"vpsubsb":[334,1],"vpsubsw":[334,1],"psubusb":[335,2],"psubusw":[335,2],"vpsubusb":[335,1],"vpsubusw":[335,1],"ptest":[336,3],"vptest":[336,5],"ptwrit":[337,3],"send":[337,2],"trac":[337,4,615,1],"ptw":[337,2],"packet":[337,2],"triggeren":[337,2],"contexten":[337,2],"filteren":[337,2],"ptwen":[337,2],"instrumentation":[337,2],"punpckhbw":[338,1],"punpckhdq":[338,1],"punpckhqdq":[338,1],"punpckhwd":[338,1],"vpunpckhbw":[338,1],"vpunpckhdq":[338,1],"vpunpckhqdq":[338,1],"vpunpckhwd":[338,1],"punpcklbw":[339,1],"punpckldq":[339,1],"punpcklqdq":[339,1],"punpcklwd":[339,1],"vpunpcklbw":[339,1],"vpunpckldq":[339,1],"vpunpcklqdq":[339,1],"vpunpcklwd":[339,1],"22":[339,2,353,1,578,1],"recent":[340,1,395,1,413,1],"atom":[340,1],"report":[341,1,350,1,431,1,463,3,464,3,465,5,466,5,576,1,577,1,578,1,579,1,594,1,595,1],"shutdown":[341,1,360,4],"entir":[342,3,419,1,420,1,491,1,492,1,507,1,508,1,542,2,543,2,560,2,604,2],"pxor":[343,1],"vpxor":[343,1],"vpxord":[343,1],"vpxorq":[343,1],"rcl":[344,5],"rcr":[344,5],"rol":[344,3],"ror":[344,3],"rotat":[344,13,355,2,558,2,559,2],"cl":[344,2,364,1,379,3,380,3],"rotation":[344,1],"noth":[344,1],"rcpp":[345,2],"vrcpp":[345,1],"tiny":[345,4,346,4,432,1],"11111111110100000000000b":[345,1,346,1],"125":[345,1,346,1],"00000000000110000000001b":[345,1,346,1],"126":[345,1,346,1],"rcpss":[346,2],"vrcpss":[346,1],"rdfsbas":[347,1],"rdgsbas":[347,1],"rdpid":[348,3],"tsc":[348,2,352,8,414,1,615,1],"aux":[348,2,352,4],"c0000103h":[348,2,352,2],"rdpkru":[349,4],"pkru":[349,2,616,4],"pke":[349,2,616,2],"discover":[349,1,616,1,623,1],"ospk":[349,1,616,1],"rdpmc":[350,4],"pmc":[350,13],"fewer":[350,2,623,2],"unimplement":[350,2,615,1,623,2,634,1],"23":[350,1,356,1,357,1,358,1,359,1,457,2,458,2,579,1,581,2,583,2,597,2,599,2],"40":[350,1],"3b":[350,1,351,1,352,1],"pce":[350,2],"restrict":[350,1,351,1,352,1],"rdmsr":[350,1,351,1,402,1,404,1,405,1],"rdtsc":[351,5],"stamp":[351,7,352,6,408,1,414,1],"monotonically":[351,1,352,1],"clock":[351,1,352,1],"tsd":[351,1,352,1],"necessarily":[351,1],"similarly":[351,1,402,1,618,1],"item":[351,1,352,1,628,1,629,1,630,1,631,1,632,1,633,1],"guid":[351,1,352,1],"seek":[351,1,352,1],"rdtscp":[352,5],"longer":[353,2,354,1],"met":[353,2,456,1],"sto":[353,2,395,4],"sca":[353,3,367,4],"synonymous":[353,2],"f3h":[353,2,618,1],"rest":[353,2],"iteration":[353,2,530,1,537,1],"termination":[353,2],"suspend":[353,1,414,1,491,1,492,1,542,1,543,1,560,1,604,1],"happen":[353,1,491,1,492,1,542,1,543,1,560,1,604,1],"proc":[353,1],"respons":[353,1,463,4,464,4,465,4,466,4,592,1,593,1,594,1,595,1,600,3,601,3,602,3,603,3,612,1,613,1],"rorx":[355,3],"roundpd":[356,1],"vroundpd":[356,1],"sticky":[356,1,357,1,358,1,359,1,588,1,589,1,590,1,591,1],"daz":[356,1,357,1,358,1,359,1,431,1,457,1,458,1,463,1,464,1,465,1,466,1,576,1,577,1,578,1,579,1,580,1,581,1,582,1,583,1,592,1,593,1,594,1,595,1],"roundp":[357,1],"vroundp":[357,1],"roundsd":[358,1],"vroundsd":[358,1],"roundss":[359,1],"vroundss":[359,1],"rsm":[360,3],"dump":[360,2],"rsqrtp":[361,2],"vrsqrtp":[361,1],"negativ":[361,1,362,1,487,2,495,2,496,2,497,2,498,2,523,2,525,2,592,1,593,1,594,1,595,1,596,3,597,3,598,3,599,3,600,1,601,1,602,1,603,1],"rsqrtss":[362,2],"vrsqrtss":[362,1],"sahf":[363,2],"80000001h":[363,1],"lahf":[363,1],"sal":[364,2],"sar":[364,6],"shl":[364,2],"shr":[364,4],"unshift":[364,1],"sarx":[365,3],"shlx":[365,2],"shrx":[365,2],"keep":[365,1],"scasb":[367,3],"scasd":[367,3],"scasq":[367,2],"scasw":[367,3],"operational":[367,2],"modification":[368,2,395,1],"drain":[368,2],"setssbsy":[369,3],"verify":[369,2,456,2],"pl0":[369,4],"seta":[370,2],"setb":[370,2],"setc":[370,1],"setg":[370,3],"setl":[370,2],"setna":[370,2],"setnb":[370,2],"setnc":[370,1],"setn":[370,2],"setng":[370,2],"setnl":[370,3],"setno":[370,2],"setnp":[370,1],"setnz":[370,1],"seto":[370,1],"setp":[370,2],"setpo":[370,1],"setz":[370,1],"suffix":[370,2],"many":[370,1],"intelligibl":[370,1],"logically":[370,1],"setcc":[370,1],"collaps":[371,1],"f8":[371,1],"fx":[371,1],"sha1msg1":[372,3],"sha1":[372,4,373,4,374,6,375,6],"messag":[372,4,373,4,375,2,376,4,377,4,378,2],"schedul":[372,2,373,2,374,2,376,2,377,2],"sha1msg2":[373,3],"deriv":[373,2,403,1,404,1,405,1,406,1],"sha1nexte":[374,3],"sha1rnds4":[375,3],"c":[375,4,378,3],"pre":[375,2,378,2,419,2,420,2,459,1,460,1,539,1,540,1,541,1],"sha256msg1":[376,3],"sha256":[376,4,377,2,378,7],"sha256msg2":[377,3],"sha2":[377,2],"sha256rnds2":[378,3],"shld":[379,3],"upgrad":[379,1,380,1],"shrd":[380,3],"shufpd":[381,1],"vshufpd":[381,1],"shufp":[382,1],"vshufp":[382,1],"quadruplet":[382,4,533,1],"quadrupl":[382,4,533,3],"applicabl":[382,1],"sidt":[383,3],"umip":[383,1,385,1],"sldt":[384,3],"smsw":[385,3],"cr":[385,1],"sqrtpd":[386,1],"vsqrtpd":[386,1],"sqrtp":[387,1],"vsqrtp":[387,1],"sqrtsd":[388,1],"vsqrtsd":[388,3],"sqrtss":[389,1],"vsqrtss":[389,3],"stac":[390,2],"stc":[391,1],"std":[392,1],"prohibit":[393,1],"nonmaskabl":[393,1],"nmis":[393,2],"vstmxcsr":[394,1],"stosb":[395,3],"stosd":[395,2],"stosq":[395,1],"stosw":[395,2],"fast":[395,1,404,2,405,2],"tr":[396,3],"subpd":[398,1],"vsubpd":[398,1],"subp":[399,1],"vsubp":[399,1],"subsd":[400,1],"vsubsd":[400,1],"subss":[401,1],"vsubss":[401,1],"swapg":[402,8],"c0000102h":[402,2],"kernel":[402,14],"syscall":[402,1,403,12,406,4],"straightforward":[402,1],"method":[402,1],"could":[402,1],"accessibl":[402,2,456,2],"wrmsr":[402,2,403,2,404,2,405,1,615,4],"lstar":[403,4],"r11":[403,1,406,2],"fmask":[403,2],"c0000084h":[403,1],"star":[403,1,406,1],"correspondenc":[403,1,404,1,405,1,406,1],"sysret":[403,2,406,12],"alternatively":[403,1,406,1],"pl3":[403,1,406,1],"enforcement":[403,1,406,1],"cet":[403,2,406,2],"sysenter":[404,10,405,4],"sysexit":[404,2,405,7],"executiv":[404,2],"approach":[406,1],"wis":[407,2],"tpaus":[408,6],"instruct":[408,2,414,2],"light":[408,2,414,2],"weight":[408,2,414,2],"selection":[408,2,414,2,530,1,531,3,537,1,538,3],"waitpkg":[408,1,413,1,414,1],"abort":[408,1,617,6,618,1,620,4,622,2],"transactional":[408,2,620,8,622,1,635,2],"synchronization":[408,1,611,1,621,1],"wak":[408,1,413,1,414,1],"tzcnt":[409,11],"trail":[409,2],"vucomisd":[410,1],"vucomiss":[411,1],"ud01":[412,1],"ud1":[412,1],"ud2":[412,1],"though":[412,1],"umonitor":[413,9],"05h":[413,2],"trigger":[413,3,414,1,463,1,464,1,465,1,466,1,491,4,492,4,542,6,543,6,560,4,604,4],"umwait":[413,4,414,7],"ups":[413,1],"multipleprocessor":[413,1],"interoperat":[413,1],"nonzero":[414,1],"beforehand":[414,1],"quanta":[414,1],"32bit":[414,1],"e1h":[414,1],"unpckhpd":[415,1],"vunpckhpd":[415,1],"unpckhp":[416,1],"vunpckhp":[416,1],"unpcklpd":[417,1],"vunpcklpd":[417,1],"unpcklp":[418,1],"vunpcklp":[418,1],"v4fmaddps":[419,1],"v4fnmaddps":[419,1],"sequential":[419,2,420,2,507,2,508,2],"fus":[419,3,420,2],"sequentially":[419,3,420,3,507,2,508,2],"box":[419,1,420,1,507,1,508,1],"denot":[419,1,420,1,507,1,508,1],"tupl":[419,1,420,1,423,3,507,1,508,1],"tuple1":[419,1,420,1,507,1,508,1],"4x":[419,1,420,1,507,1,508,1],"imply":[419,1,420,1,507,1,508,1],"fma":[419,3,420,3,455,1],"post":[419,2,420,2],"computational":[419,2,420,2],"priority":[419,1,420,1,455,1],"etc":[419,1,420,1,565,2],"v4fmaddss":[420,1],"v4fnmaddss":[420,1],"valignd":[421,1],"valignq":[421,1],"1024":[421,2],"zmm1":[421,2,542,4,557,2,600,1,601,1,604,2],"vblendmpd":[422,1],"vblendmp":[422,1],"blend":[422,4,510,2,511,4],"relat":[422,1,510,1,511,1],"vbroadcastf128":[423,4],"vbroadcastf32x2":[423,2],"vbroadcastf32x4":[423,2],"vbroadcastf32x8":[423,2],"vbroadcastf64x2":[423,2],"vbroadcastf64x4":[423,2],"vbroadcastsd":[423,4],"vbroadcastss":[423,4],"vex256":[423,1,512,1],"f32x4":[423,1],"f64x2":[423,1],"wid":[423,3],"f32x8":[423,1],"f64x4":[423,1],"vcompresspd":[424,1],"compress":[424,3,425,3,459,1,460,1,518,2,519,3,520,3,539,1,540,1,541,1],"vcompressp":[425,1],"vcvtne2ps2bf16":[426,1],"bf16":[426,2,427,2,455,2],"consult":[426,1,427,1,455,1],"vcvtneps2bf16":[427,1],"0b1111":[427,1],"vcvtpd2qq":[428,1],"vcvtpd2udq":[429,1],"vcvtpd2uqq":[430,1],"vcvtph2ps":[431,1],"vcvtps2ph":[432,1],"ftz":[432,1,457,1,458,1,576,1,577,1,578,1,579,1,580,1,581,1,582,1,583,1,600,1,601,1,602,1,603,1],"dm":[432,1],"pm":[432,1],"um":[432,1],"several":[432,1],"vcvtps2qq":[433,1],"vcvtps2udq":[434,1],"vcvtps2uqq":[435,1],"vcvtqq2pd":[436,1],"vcvtqq2ps":[437,1],"vcvtsd2usi":[438,1],"vcvtss2usi":[439,1],"vcvttpd2qq":[440,1],"vcvttpd2udq":[441,1],"vcvttpd2uqq":[442,1],"vcvttps2qq":[443,1],"vcvttps2udq":[444,1],"vcvttps2uqq":[445,1],"vcvttsd2usi":[446,1],"vcvttss2usi":[447,1],"vcvtudq2pd":[448,1],"vcvtudq2ps":[449,1],"vcvtuqq2pd":[450,1],"vcvtuqq2ps":[451,1],"vcvtusi2sd":[452,1],"vcvtusi2ss":[453,1],"vdbpsadbw":[454,1],"superblock":[454,4],"super":[454,1],"vdpbf16ps":[455,1],"dot":[455,2,507,2,508,2],"accumulation":[455,1,507,2,508,2],"readabl":[456,4],"writabl":[456,6],"verifi":[456,4],"validation":[456,1],"anticipat":[456,1],"problem":[456,1],"vexp2pd":[457,1],"exponential":[457,4,458,4],"evaluation":[457,2,458,2],"vexp2ps":[458,1],"vexpandpd":[459,1],"spars":[459,3,460,3,539,1,540,3,541,3],"ascend":[459,1,460,1,540,1,541,1],"vexpandp":[460,1],"vextractf128":[461,3],"vextractf32x4":[461,4],"vextractf32x8":[461,2],"vextractf64x2":[461,3],"vextractf64x4":[461,2],"vextracti128":[462,3],"vextracti32x4":[462,4],"vextracti32x8":[462,3],"vextracti64x2":[462,4],"vextracti64x4":[462,1],"vfixupimmpd":[463,2,465,1,466,1],"quad":[463,2,552,2,553,2,554,2],"look":[463,3,464,3,465,3,466,3,569,1],"specifier":[463,2,464,2,465,2,466,2],"0000b":[463,2,464,2,465,2,466,2],"decod":[463,1,464,1,465,1,466,1],"involv":[463,1,464,1,465,1,466,1],"spec":[463,2,464,2,465,2,466,2],"although":[463,1,464,1,465,1,466,1,588,1,589,1,590,1,591,1],"rcp":[463,3,464,3,465,3,466,3],"you":[463,1,464,1,465,1,466,1,619,1],"inf":[463,2,464,2,465,2,466,2,487,2],"dx10":[463,1,464,1,465,1,466,1],"newton":[463,1,464,1,465,1,466,1],"raphson":[463,1,464,1,465,1,466,1],"approx":[463,1,464,1,465,1,466,1],"deal":[463,1,464,1,465,1,466,1],"fixup":[463,1,464,1,465,1,466,1],"vfixupimmp":[464,2],"vfixupimmsd":[465,1],"vfixupimmss":[466,1],"vfmadd132pd":[467,2],"vfmadd213pd":[467,2],"vfmadd231pd":[467,2],"infinit":[467,3,468,3,469,3,470,3,471,4,472,4,473,3,474,3,475,3,476,3,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4,485,4,486,4],"vfmadd132ps":[468,2],"vfmadd213ps":[468,2],"vfmadd231ps":[468,2],"vfmadd132sd":[469,2],"vfmadd213sd":[469,2],"vfmadd231sd":[469,2],"rm":[469,1,470,1,471,1,472,1,475,1,476,1,477,1,478,1,479,1,480,1,481,1,482,1,483,1,484,1,485,1,486,1],"vfmadd132ss":[470,2],"vfmadd213ss":[470,2],"vfmadd231ss":[470,2],"vfmaddsub132pd":[471,3],"vfmaddsub213pd":[471,2],"vfmaddsub231pd":[471,2],"vfmaddsub132ps":[472,3],"vfmaddsub213ps":[472,2],"vfmaddsub231ps":[472,2],"vfmsub132pd":[473,2],"vfmsub213pd":[473,2],"vfmsub231pd":[473,2],"vfmsub132ps":[474,2],"vfmsub213ps":[474,2],"vfmsub231ps":[474,2],"vfmsub132sd":[475,2],"vfmsub213sd":[475,2],"vfmsub231sd":[475,2],"vfmsub132ss":[476,2],"vfmsub213ss":[476,2],"vfmsub231ss":[476,2],"vfmsubadd132pd":[477,3],"vfmsubadd213pd":[477,2],"vfmsubadd231pd":[477,2],"vfmsubadd132ps":[478,3],"vfmsubadd213ps":[478,2],"vfmsubadd231ps":[478,2],"vfnmadd132pd":[479,3],"vfnmadd213pd":[479,2],"vfnmadd231pd":[479,2],"vfnmadd132ps":[480,3],"vfnmadd213ps":[480,2],"vfnmadd231ps":[480,2],"vfnmadd132sd":[481,3],"vfnmadd213sd":[481,2],"vfnmadd231sd":[481,2],"vfnmadd132ss":[482,3],"vfnmadd213ss":[482,2],"vfnmadd231ss":[482,2],"vfnmsub132pd":[483,3],"vfnmsub213pd":[483,2],"vfnmsub231pd":[483,2],"vfnmsub132ps":[484,3],"vfnmsub213ps":[484,2],"vfnmsub231ps":[484,2],"vfnmsub132sd":[485,3],"vfnmsub213sd":[485,2],"vfnmsub231sd":[485,2],"vfnmsub132ss":[486,3],"vfnmsub213ss":[486,2],"vfnmsub231ss":[486,2],"vfpclasspd":[487,1],"fpclasspd":[487,2],"category":[487,9,488,8,489,8,490,8],"classifi":[487,4,488,4,489,4,490,4],"against":[487,2,488,2,489,2,490,2],"ored":[487,2,488,2,489,2,490,2],"boolean":[487,2,488,2,489,2,490,2,569,7],"classification":[487,2,488,2,489,2,490,2],"poszero":[487,1],"negzero":[487,1],"posinf":[487,1],"neginf":[487,1],"classifier":[487,1],"vfpclassp":[488,1],"fpclassp":[488,2],"vfpclasssd":[489,1],"fpclasssd":[489,2],"vfpclassss":[490,1],"fpclassss":[490,2],"vgatherdpd":[491,1],"vgatherqpd":[491,1],"indic":[491,5,492,6,493,5,494,5,528,2,529,2,530,3,531,3,534,3,535,2,536,3,537,4,538,3,542,2,543,2,560,4,569,2,604,2,605,5,606,5,615,1],"vsib":[491,3,492,3,493,2,494,2,542,2,543,2,560,2,604,2,605,2,606,2],"conditionality":[491,1,492,1],"gather":[491,5,492,5,542,7,543,7,565,4],"rightmost":[491,1,492,1,542,1,543,1,560,1,604,1],"partially":[491,1,492,1,542,1,543,1,560,1,604,1],"trap":[491,1,492,1,542,1,543,1,560,1,604,1],"lieu":[491,1,492,1,542,1,543,1,560,1,604,1],"vgatherdp":[492,1],"vgatherqp":[492,1],"ed":[492,1],"vgatherpf0dpd":[493,1],"vgatherpf0dps":[493,1],"vgatherpf0qpd":[493,1],"vgatherpf0qps":[493,1],"t0":[493,1,605,1],"ps":[493,1,494,1,531,2,538,2,572,1,573,1,605,1,606,1],"pd":[493,1,494,1,531,2,538,2,605,1,606,1],"vgatherpf1dpd":[494,1],"vgatherpf1dps":[494,1],"vgatherpf1qpd":[494,1],"vgatherpf1qps":[494,1],"t1":[494,1,606,1],"vgetexppd":[495,1],"normaliz":[495,2,496,2,497,2,498,2,499,2,500,2,501,2,502,2,584,1,585,1,586,1,587,1],"getexp":[495,1,496,1,497,1,498,1],"vgetexpp":[496,1],"vgetexpsd":[497,1],"vgetexpss":[498,1],"vgetmantpd":[499,1],"mantissa":[499,4,500,4,501,4,502,4],"normalization":[499,2,500,2,501,2,502,2],"interv":[499,2,500,2,501,2,502,2],"sc":[499,2,500,2,501,2,502,2],"getmant":[499,1,500,1,501,1,502,1],"k":[499,1,500,1,501,1,502,1],"vgetmantp":[500,1],"vgetmantsd":[501,1],"vgetmantss":[502,1],"vinsertf128":[503,3],"vinsertf32x4":[503,4],"vinsertf32x8":[503,2],"vinsertf64x2":[503,4],"vinsertf64x4":[503,2],"vinserti128":[504,2],"vinserti32x4":[504,3],"vinserti32x8":[504,2],"vinserti64x2":[504,3],"vinserti64x4":[504,2],"7bits":[504,2],"vmaskmovpd":[505,1],"vmaskmovp":[505,1],"due":[505,2,547,2,612,1,613,1],"maskmov":[505,1,547,1],"vp2intersectd":[506,1],"vp2intersectq":[506,1],"modrm":[506,2],"off":[506,2],"vp4dpwssd":[507,1],"vp4dpwssds":[508,1],"vpblendd":[509,1],"vpblendmb":[510,1],"vpblendmw":[510,1],"vpblendmd":[511,1],"vpblendmq":[511,1],"vbroadcasti128":[512,1],"vbroadcasti32x4":[512,2],"vbroadcasti32x8":[512,1],"vbroadcasti64x2":[512,1],"vbroadcasti64x4":[512,2],"vpbroadcastb":[512,2],"vpbroadcastd":[512,2],"vpbroadcastq":[512,1],"vpbroadcastw":[512,1],"vpbroadcasti128":[512,2],"vpbroadcasti32x4":[512,1],"vpbroadcasti64x4":[512,1],"vpbroadcastmb2q":[513,1],"vpbroadcastmw2d":[513,1],"vpcmpb":[514,2],"vpcmpub":[514,2],"vpcmpd":[515,2],"vpcmpud":[515,2],"vpcmpq":[516,2],"vpcmpuq":[516,2],"vpcmpuw":[517,2],"vpcmpw":[517,2],"vpcompressb":[518,1],"vpcompressw":[518,1],"vpcompressd":[519,1],"vpcompressq":[520,1],"vpconflictd":[521,1],"vpconflictq":[521,1],"vpdpbusd":[522,1,523,1],"32b":[523,2,525,2],"0x7fff":[523,2,525,2],"ffff":[523,2,525,2],"0x8000":[523,2,525,2],"vpdpwssd":[524,1,525,1],"vperm2f128":[526,1],"vperm2i128":[527,1],"vpermb":[528,1],"vpermd":[529,3],"vpermw":[529,2],"vpermi2b":[530,1],"reus":[530,1,534,1,536,1,537,1],"vpermi2d":[531,1],"vpermi2pd":[531,1],"vpermi2ps":[531,1],"vpermi2q":[531,1],"vpermi2w":[531,1],"vpermilpd":[532,1],"resid":[532,1],"lie":[532,1,533,1],"vpermilp":[533,1],"26":[533,1],"vpermpd":[534,1],"com":[534,1,536,1,558,2,559,2],"vpermp":[535,2],"vpermq":[536,1],"vpermt2b":[537,1],"vpermt2d":[538,1],"vpermt2pd":[538,1],"vpermt2ps":[538,1],"vpermt2q":[538,1],"vpermt2w":[538,1],"vpexpandb":[539,1],"vpexpandw":[539,1],"int8":[539,1],"vpexpandd":[540,1],"vpexpandq":[541,1],"vpgatherdd":[542,1],"vpgatherdq":[542,1],"addr":[542,2,543,2,560,2,604,2],"vindex":[542,2,543,2,560,2,604,2],"vpgatherqd":[543,1],"vpgatherqq":[543,1],"vplzcntd":[544,1],"vplzcntq":[544,1],"vpmadd52huq":[545,1],"52":[545,6,546,6],"104":[545,4,546,4],"vpmadd52luq":[546,1],"vpmaskmovd":[547,1],"vpmaskmovq":[547,1],"vpmovb2m":[548,1],"vpmovd2m":[548,1],"vpmovq2m":[548,1],"vpmovw2m":[548,1],"vpmovdb":[549,3],"vpmovsdb":[549,3],"vpmovusdb":[549,3],"down":[549,3,550,3,552,3,553,3,554,3,555,3],"vpmovdw":[550,3],"vpmovsdw":[550,3],"vpmovusdw":[550,3],"vpmovm2b":[551,1],"vpmovm2d":[551,1],"vpmovm2q":[551,1],"vpmovm2w":[551,1],"vpmovqb":[552,3],"vpmovsqb":[552,3],"vpmovusqb":[552,3],"vpmovqd":[553,1],"vpmovsqd":[553,1],"vpmovusqd":[553,1],"vpmovqw":[553,2,554,3],"vpmovsqw":[553,2,554,3],"vpmovusqw":[553,2,554,3],"vpmovswb":[555,3],"vpmovuswb":[555,3],"vpmovwb":[555,3],"vpmultishiftqb":[556,1],"assembl":[556,2],"vpopcntb":[557,1],"vpopcntd":[557,1],"vpopcntq":[557,1],"vpopcntw":[557,1],"zmm2":[557,2,600,1,601,1],"vprold":[558,1],"vprolq":[558,1],"vprolvd":[558,1],"vprolvq":[558,1],"modulo":[558,2,559,2],"vprord":[559,1],"vprorq":[559,1],"vprorvd":[559,1],"vprorvq":[559,1],"vpscatterdd":[560,1],"vpscatterdq":[560,1],"vpscatterqd":[560,1],"vpscatterqq":[560,1],"vpshldd":[561,1],"vpshldq":[561,1],"vpshldw":[561,1],"vpshldvd":[562,1],"vpshldvq":[562,1],"vpshldvw":[562,1],"vpshrdd":[563,1],"vpshrdq":[563,1],"vpshrdw":[563,1],"vpshrdvd":[564,1],"vpshrdvq":[564,1],"vpshrdvw":[564,1],"vpshufbitqmb":[565,3],"going":[565,2],"src2":[565,1],"vpsllvd":[566,2],"vpsllvq":[566,1],"vpsllvw":[566,1],"vpsravd":[567,2],"vpsravq":[567,1],"vpsravw":[567,1],"msb":[567,2],"vpsrlvd":[568,2],"vpsrlvq":[568,1],"vpsrlvw":[568,1],"vpternlogd":[569,4],"vpternlogq":[569,1],"logic":[569,2],"0xe2":[569,1],"0xe4":[569,1],"vptestmb":[570,2],"vptestmd":[570,2],"vptestmq":[570,2],"vptestmw":[570,2],"vptestnmb":[571,2],"vptestnmd":[571,2],"vptestnmq":[571,1],"vptestnmw":[571,1],"nand":[571,2],"vrangepd":[572,2,573,1],"bits7":[572,1,573,1,574,1,575,1],"min":[572,4,573,4],"slightly":[572,1,573,1],"conceptually":[572,1,573,1],"abs":[572,2,573,2],"sd":[572,1,573,1],"magni":[572,1,573,1],"tud":[572,1,573,1],"vrangep":[573,1],"vrangesd":[574,1],"vrangess":[575,1],"vrcp14pd":[576,2],"vrcp14ps":[577,2],"vrcp14sd":[578,2],"numerically":[578,1],"vrcp14xx":[578,1],"vrcp14ss":[579,2],"vrcp28pd":[580,1],"quietiz":[580,1,581,1,582,1,583,1,596,1,597,1,598,1,599,1],"vrcp28ps":[581,1],"vrcp28sd":[582,1],"vrcp28ss":[583,1],"vreducepd":[584,1],"fractional":[584,1,585,1,586,1,587,1],"man2":[584,1,585,1,586,1,587,1],"vreducep":[585,1],"vreducesd":[586,1],"vreducess":[587,1],"vrndscalepd":[588,1],"29":[588,2,589,2,590,2,591,2],"fraction":[588,1,589,1,590,1,591,1],"notic":[588,1,589,1,590,1,591,1],"induc":[588,1,589,1,590,1,591,1],"vrndscalep":[589,1],"vrndscalesd":[590,1],"vrndscaless":[591,1],"vrsqrt14pd":[592,2],"vrsqrt14ps":[593,2],"vrsqrt14sd":[594,2],"vrsqrt14ss":[595,2],"vrsqrt28pd":[596,1],"divbyzero":[596,2,597,2,598,2,599,2],"vrsqrt28ps":[597,1],"vrsqrt28sd":[598,1],"vrsqrt28ss":[599,1],"vscalefpd":[600,1],"floor":[600,2,601,2,602,2,603,2],"zmm3":[600,3,601,3],"compliant":[600,1,601,1,602,1,603,1],"sae":[600,1,601,1,602,1,603,1],"vscalefp":[601,1],"vscalefsd":[602,1],"xmm3":[602,3,603,3],"vscalefss":[603,1],"vscatterdpd":[604,1],"vscatterdp":[604,1],"vscatterqpd":[604,1],"vscatterqp":[604,1],"vscatterpf0dpd":[605,1],"vscatterpf0dps":[605,1],"vscatterpf0qpd":[605,1],"vscatterpf0qps":[605,1],"rfo":[605,1,606,1],"vscatterpf1dpd":[606,1],"vscatterpf1dps":[606,1],"vscatterpf1qpd":[606,1],"vscatterpf1qps":[606,1],"vshuff32x4":[607,1],"vshuff64x2":[607,1],"vshufi32x4":[607,1],"vshufi64x2":[607,1],"vtestpd":[608,2],"vtestp":[608,6],"vzeroall":[609,3],"ymm0":[609,4,610,4],"ymm15":[609,2,610,2],"zmm0":[609,4,610,4],"zmm15":[609,2,610,2],"xmm7":[609,2],"ymm7":[609,2,610,2],"zmm7":[609,2,610,2],"zmm16":[609,2,610,2],"zmm31":[609,2,610,2],"vzeroupper":[610,3],"dependency":[610,1],"critical":[611,1],"consequenc":[612,1,613,1],"hierarchical":[612,1],"topology":[612,1],"wbnoinvd":[613,6],"wrfsbas":[614,1],"wrgsbas":[614,1],"mtrr":[615,1],"testability":[615,1],"deadlin":[615,1],"6e0h":[615,1],"x2apic":[615,1],"802h":[615,1],"83fh":[615,1],"wrpkru":[616,6],"xabort":[617,5],"rtm":[617,4,620,4,622,6,635,2],"fallback":[617,2,620,3,622,2],"outermost":[617,2,620,4,622,4],"xbegin":[617,2,620,11,622,4],"xacquir":[618,8],"xreleas":[618,10],"elision":[618,5],"satisfy":[618,1],"guidelin":[618,1],"hle":[618,2,635,2],"semantic":[618,1],"f3f2c6":[618,1],"f2h":[618,1],"c6":[618,1],"f2f3f0":[618,1],"path":[620,2],"duration":[621,2],"semaphor":[621,1],"xend":[622,6],"scop":[622,2],"commit":[622,4],"rollback":[622,2],"xgetbv":[623,3],"xcr":[623,6,634,10],"xcr0":[623,2,628,2,629,2,630,2,631,2,632,2,633,2,634,4],"0dh":[623,1],"xg1":[623,1],"logicaland":[623,1,633,2],"xinus":[623,1,628,1,629,1],"xsaveopt":[623,1,632,3],"xsav":[623,2,628,5,629,5,630,7,631,4,632,5,633,10,634,2],"xlat":[624,6],"xlatb":[624,4],"vxorpd":[626,1],"xorpd":[626,1],"vxorp":[627,1],"xorp":[627,1],"xrstor":[628,4,629,6,632,1,633,1],"rfbm":[628,2,629,2,630,2,631,2,632,2,633,2],"highlevel":[628,1,631,1,633,1],"outlin":[628,1,629,1,630,1,631,1,632,1,633,1],"track":[628,1,629,1,632,1,633,1],"xmodifi":[628,1,629,1,632,1,633,1],"info":[628,1,629,1,632,1,633,1],"xss":[629,2,633,2],"xsavec":[631,3],"xsetbv":[634,1],"xtest":[635,3],"query":[635,2],"transactionally":[635,4]}};
+export default segment;
@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"2595174f40f8840314393574272408ca0de2afba","docs":[["ADC","Add with Carry (immediate) adds an immediate value and the Carry flag value to a register value, and writes the result to the destination register."],["ADC","Add with Carry (register) adds a register value, the Carry flag value, and an optionally-shifted register value, and writes the result to the destination register."],["ADC","Add with Carry (register-shifted register) adds a register value, the Carry flag value, and a register-shifted register value.  It writes the result to the destination register, and can optionally update the condition flags based on the result."],["ADD","Add (immediate) adds an immediate value to a register value, and writes the result to the destination register."],["ADD","Add (register) adds a register value and an optionally-shifted register value, and writes the result to the destination register."],["ADD","Add (register-shifted register) adds a register value and a register-shifted register value. It writes the result to the destination register, and can optionally update the condition flags based on the result."],["ADD","Add to SP (immediate) adds an immediate value to the SP value, and writes the result to the destination register."],["ADD","Add to SP (register) adds an optionally-shifted register value to the SP value, and writes the result to the destination register."],["ADR","Form PC-relative address adds an immediate value to the PC value to form a PC-relative address, and writes the result to the destination register."],["AESD","AES single round decryption."],["AESE","AES single round encryption."],["AESIMC","AES inverse mix columns."],["AESMC","AES mix columns."],["AND","Bitwise AND (immediate) performs a bitwise AND of a register value and an immediate value, and writes the result to the destination register."],["AND","Bitwise AND (register) performs a bitwise AND of a register value and an optionally-shifted register value, and writes the result to the destination register."],["AND","Bitwise AND (register-shifted register) performs a bitwise AND of a register value and a register-shifted register value. It writes the result to the destination register, and can optionally update the condition flags based on the result."],["ASR","Arithmetic Shift Right (immediate) shifts a register value right by an immediate number of bits, shifting in copies of its sign bit, and writes the result to the destination register."],["ASRS","Arithmetic Shift Right, setting flags (immediate) shifts a register value right by an immediate number of bits, shifting in copies of its sign bit, and writes the result to the destination register."],["B","Branch causes a branch to a target address."],["BFC","Bit Field Clear clears any number of adjacent bits at any position in a register, without affecting the other bits in the register."],["BFI","Bit Field Insert copies any number of low order bits from a register into the same number of adjacent bits at any position in the destination register."],["BIC","Bitwise Bit Clear (immediate) performs a bitwise AND of a register value and the complement of an immediate value, and writes the result to the destination register."],["BIC","Bitwise Bit Clear (register) performs a bitwise AND of a register value and the complement of an optionally-shifted register value, and writes the result to the destination register."],["BIC","Bitwise Bit Clear (register-shifted register) performs a bitwise AND of a register value and the complement of a register-shifted register value. It writes the result to the destination register, and can optionally update the condition flags based on the result."],["BKPT","Breakpoint causes a Breakpoint Instruction exception."],["BL","Branch with Link calls a subroutine at a PC-relative address, and setting LR to the return address."],["BLX","Branch with Link and Exchange (register) calls a subroutine at an address specified in the register, and if necessary changes to the instruction set indicated by bit[0] of the register value. If the value in bit[0] is 0, the instruction set after the branch will be A32. If the value in bit[0] is 1, the instruction set after the branch will be T32."],["BX","Branch and Exchange causes a branch to an address and instruction set specified by a register."],["BXJ","Branch and Exchange, previously Branch and Exchange Jazelle."],["CBNZ","Compare and Branch on Nonzero and Compare and Branch on Zero compare the value in a register with zero, and conditionally branch forward a constant value. They do not affect the condition flags."],["CLREX","Clear-Exclusive clears the local monitor of the executing PE."],["CLZ","Count Leading Zeros returns the number of binary zero bits before the first binary one bit in a value."],["CMN","Compare Negative (immediate) adds a register value and an immediate value. It updates the condition flags based on the result, and discards the result."],["CMN","Compare Negative (register) adds a register value and an optionally-shifted register value. It updates the condition flags based on the result, and discards the result."],["CMN","Compare Negative (register-shifted register) adds a register value and a register-shifted register value. It updates the condition flags based on the result, and discards the result."],["CMP","Compare (immediate) subtracts an immediate value from a register value. It updates the condition flags based on the result, and discards the result."],["CMP","Compare (register) subtracts an optionally-shifted register value from a register value. It updates the condition flags based on the result, and discards the result."],["CMP","Compare (register-shifted register) subtracts a register-shifted register value from a register value. It updates the condition flags based on the result, and discards the result."],["CPS","Change PE State changes one or more of the PSTATE.{A, I, F} interrupt mask bits and, optionally, the PSTATE.M mode field, without changing any other PSTATE bits."],["CRC32","CRC32 performs a cyclic redundancy check (CRC) calculation on a value held in a general-purpose register. It takes an input CRC value in the first source operand, performs a CRC on the input value in the second source operand, and returns the output CRC value. The second source operand can be 8, 16, or 32 bits. To align with common usage, the bit order of the values is reversed as part of the operation, and the polynomial 0x04C11DB7 is used for the CRC calculation."],["CRC32C","CRC32C performs a cyclic redundancy check (CRC) calculation on a value held in a general-purpose register. It takes an input CRC value in the first source operand, performs a CRC on the input value in the second source operand, and returns the output CRC value. The second source operand can be 8, 16, or 32 bits. To align with common usage, the bit order of the values is reversed as part of the operation, and the polynomial 0x1EDC6F41 is used for the CRC calculation."],["CSDB","Consumption of Speculative Data Barrier is a memory barrier that controls speculative execution and data value prediction."],["DBG","In Armv8, DBG executes as a NOP. Arm deprecates any use of the DBG instruction."],["DCPS1","Debug Change PE State to EL1 allows the debugger to move the PE into EL1 from EL0 or to a specific mode at the current Exception level."],["DCPS2","Debug Change PE State to EL2 allows the debugger to move the PE into EL2 from a lower Exception level."],["DCPS3","Debug Change PE State to EL3 allows the debugger to move the PE into EL3 from a lower Exception level or to a specific mode at the current Exception level."],["DMB","Data Memory Barrier is a memory barrier that ensures the ordering of observations of memory accesses, see Data Memory Barrier (DMB)."],["DSB","Data Synchronization Barrier is a memory barrier that ensures the completion of memory accesses, see Data Synchronization Barrier (DSB)."],["EOR","Bitwise Exclusive OR (immediate) performs a bitwise Exclusive OR of a register value and an immediate value, and writes the result to the destination register."],["EOR","Bitwise Exclusive OR (register) performs a bitwise Exclusive OR of a register value and an optionally-shifted register value, and writes the result to the destination register."],["EOR","Bitwise Exclusive OR (register-shifted register) performs a bitwise Exclusive OR of a register value and a register-shifted register value. It writes the result to the destination register, and can optionally update the condition flags based on the result."],["ERET","Exception Return."],["ESB","Error Synchronization Barrier is an error synchronization event that might also update DISR and VDISR. This instruction can be used at all Exception levels and in Debug state."],["FLDM*X","FLDMDBX is the Decrement Before variant of this instruction, and FLDMIAX is the Increment After variant. FLDM*X loads multiple SIMD&FP registers from consecutive locations in the Advanced SIMD and floating-point register file using an address from a general-purpose register."],["FSTMDBX","FSTMX stores multiple SIMD&FP registers from the Advanced SIMD and floating-point register file to consecutive locations in using an address from a general-purpose register."],["HLT","Halting breakpoint causes a software breakpoint to occur."],["HVC","Hypervisor Call causes a Hypervisor Call exception. For more information see Hypervisor Call (HVC) exception.  Non-secure software executing at EL1 can use this instruction to call the hypervisor to request a service."],["ISB","Instruction Synchronization Barrier flushes the pipeline in the PE and is a context synchronization event. For more information, see Instruction Synchronization Barrier (ISB)."],["IT","If-Then makes up to four following instructions (the IT block) conditional. The conditions for the instructions in the IT block are the same as, or the inverse of, the condition the IT instruction specifies for the first instruction in the block."],["LDA","Load-Acquire Word loads a word from memory and writes it to a register. The instruction also has memory ordering semantics as described in Load-Acquire, Store-Release"],["LDAB","Load-Acquire Byte loads a byte from memory, zero-extends it to form a 32-bit word and writes it to a register. The instruction also has memory ordering semantics as described in Load-Acquire, Store-Release."],["LDAEX","Load-Acquire Exclusive Word loads a word from memory, writes it to a register and"],["LDAEXB","Load-Acquire Exclusive Byte loads a byte from memory, zero-extends it to form a 32-bit word, writes it to a register and"],["LDAEXD","Load-Acquire Exclusive Doubleword loads a doubleword from memory, writes it to two registers and"],["LDAEXH","Load-Acquire Exclusive Halfword loads a halfword from memory, zero-extends it to form a 32-bit word, writes it to a register and"],["LDAH","Load-Acquire Halfword loads a halfword from memory, zero-extends it to form a 32-bit word and writes it to a register. The instruction also has memory ordering semantics as described in Load-Acquire, Store-Release."],["LDC","Load data to System register (immediate) calculates an address from a base register value and an immediate offset, loads a word from memory, and writes it to the DBGDTRTXint System register. It can use offset, post-indexed, pre-indexed, or unindexed addressing. For information about memory accesses see Memory accesses."],["LDC","Load data to System register (literal) calculates an address from the PC value and an immediate offset, loads a word from memory, and writes it to the DBGDTRTXint System register. For information about memory accesses see Memory accesses."],["LDM","Load Multiple (Increment After, Full Descending) loads multiple registers from consecutive memory locations using an address from a base register. The consecutive memory locations start at this address, and the address just above the highest of those locations can optionally be written back to the base register."],["LDM","Load Multiple (exception return) loads multiple registers from consecutive memory locations using an address from a base register. The SPSR of the current mode is copied to the CPSR. An address adjusted by the size of the data loaded can optionally be written back to the base register."],["LDM","In an EL1 mode other than System mode, Load Multiple (User registers) loads multiple User mode registers from consecutive memory locations using an address from a base register. The registers loaded cannot include the PC. The PE reads the base register value normally, using the current mode to determine the correct Banked version of the register. This instruction cannot writeback to the base register."],["LDMDA","Load Multiple Decrement After (Full Ascending) loads multiple registers from consecutive memory locations using an address from a base register. The consecutive memory locations end at this address, and the address just below the lowest of those locations can optionally be written back to the base register."],["LDMDB","Load Multiple Decrement Before (Empty Ascending) loads multiple registers from consecutive memory locations using an address from a base register. The consecutive memory locations end just below this address, and the address of the lowest of those locations can optionally be written back to the base register."],["LDMED","Load Multiple Increment Before (Empty Descending) loads multiple registers from consecutive memory locations using an address from a base register. The consecutive memory locations start just above this address, and the address of the last of those locations can optionally be written back to the base register."],["LDR","Load Register (immediate) calculates an address from a base register value and an immediate offset, loads a word from memory, and writes it to a register. It can use offset, post-indexed, or pre-indexed addressing. For information about memory accesses see Memory accesses."],["LDR","Load Register (literal) calculates an address from the PC value and an immediate offset, loads a word from memory, and writes it to a register. For information about memory accesses see Memory accesses."],["LDR","Load Register (register) calculates an address from a base register value and an offset register value, loads a word from memory, and writes it to a register. The offset register value can optionally be shifted. For information about memory accesses, see Memory accesses."],["LDRB","Load Register Byte (immediate) calculates an address from a base register value and an immediate offset, loads a byte from memory, zero-extends it to form a 32-bit word, and writes it to a register. It can use offset, post-indexed, or pre-indexed addressing.  For information about memory accesses see Memory accesses."],["LDRB","Load Register Byte (literal) calculates an address from the PC value and an immediate offset, loads a byte from memory, zero-extends it to form a 32-bit word, and writes it to a register. For information about memory accesses see Memory accesses."],["LDRB","Load Register Byte (register) calculates an address from a base register value and an offset register value, loads a byte from memory, zero-extends it to form a 32-bit word, and writes it to a register. The offset register value can optionally be shifted.  For information about memory accesses see Memory accesses."],["LDRBT","Load Register Byte Unprivileged loads a byte from memory, zero-extends it to form a 32-bit word, and writes it to a register. For information about memory accesses see Memory accesses."],["LDRD","Load Register Dual (immediate) calculates an address from a base register value and an immediate offset, loads two words from memory, and writes them to two registers. It can use offset, post-indexed, or pre-indexed addressing. For information about memory accesses see Memory accesses."],["LDRD","Load Register Dual (literal) calculates an address from the PC value and an immediate offset, loads two words from memory, and writes them to two registers. For information about memory accesses see Memory accesses."],["LDRD","Load Register Dual (register) calculates an address from a base register value and a register offset, loads two words from memory, and writes them to two registers. It can use offset, post-indexed, or pre-indexed addressing. For information about memory accesses see Memory accesses."],["LDREX","Load Register Exclusive calculates an address from a base register value and an immediate offset, loads a word from memory, writes it to a register and"],["LDREXB","Load Register Exclusive Byte derives an address from a base register value, loads a byte from memory, zero-extends it to form a 32-bit word, writes it to a register and"],["LDREXD","Load Register Exclusive Doubleword derives an address from a base register value, loads a 64-bit doubleword from memory, writes it to two registers and"],["LDREXH","Load Register Exclusive Halfword derives an address from a base register value, loads a halfword from memory, zero-extends it to form a 32-bit word, writes it to a register and"],["LDRH","Load Register Halfword (immediate) calculates an address from a base register value and an immediate offset, loads a halfword from memory, zero-extends it to form a 32-bit word, and writes it to a register. It can use offset, post-indexed, or pre-indexed addressing.  For information about memory accesses see Memory accesses."],["LDRH","Load Register Halfword (literal) calculates an address from the PC value and an immediate offset, loads a halfword from memory, zero-extends it to form a 32-bit word, and writes it to a register. For information about memory accesses see Memory accesses."],["LDRH","Load Register Halfword (register) calculates an address from a base register value and an offset register value, loads a halfword from memory, zero-extends it to form a 32-bit word, and writes it to a register. The offset register value can be shifted left by 0, 1, 2, or 3 bits. For information about memory accesses see Memory accesses."],["LDRHT","Load Register Halfword Unprivileged loads a halfword from memory, zero-extends it to form a 32-bit word, and writes it to a register. For information about memory accesses see Memory accesses."],["LDRSB","Load Register Signed Byte (immediate) calculates an address from a base register value and an immediate offset, loads a byte from memory, sign-extends it to form a 32-bit word, and writes it to a register. It can use offset, post-indexed, or pre-indexed addressing.  For information about memory accesses see Memory accesses."],["LDRSB","Load Register Signed Byte (literal) calculates an address from the PC value and an immediate offset, loads a byte from memory, sign-extends it to form a 32-bit word, and writes it to a register. For information about memory accesses see Memory accesses."],["LDRSB","Load Register Signed Byte (register) calculates an address from a base register value and an offset register value, loads a byte from memory, sign-extends it to form a 32-bit word, and writes it to a register. The offset register value can be shifted left by 0, 1, 2, or 3 bits. For information about memory accesses see Memory accesses."],["LDRSBT","Load Register Signed Byte Unprivileged loads a byte from memory, sign-extends it to form a 32-bit word, and writes it to a register. For information about memory accesses see Memory accesses."],["LDRSH","Load Register Signed Halfword (immediate) calculates an address from a base register value and an immediate offset, loads a halfword from memory, sign-extends it to form a 32-bit word, and writes it to a register. It can use offset, post-indexed, or pre-indexed addressing.  For information about memory accesses see Memory accesses."],["LDRSH","Load Register Signed Halfword (literal) calculates an address from the PC value and an immediate offset, loads a halfword from memory, sign-extends it to form a 32-bit word, and writes it to a register. For information about memory accesses see Memory accesses."],["LDRSH","Load Register Signed Halfword (register) calculates an address from a base register value and an offset register value, loads a halfword from memory, sign-extends it to form a 32-bit word, and writes it to a register. The offset register value can be shifted left by 0, 1, 2, or 3 bits. For information about memory accesses see Memory accesses."],["LDRSHT","Load Register Signed Halfword Unprivileged loads a halfword from memory, sign-extends it to form a 32-bit word, and writes it to a register. For information about memory accesses see Memory accesses."],["LDRT","Load Register Unprivileged loads a word from memory, and writes it to a register. For information about memory accesses see Memory accesses."],["LSL","Logical Shift Left (immediate) shifts a register value left by an immediate number of bits, shifting in zeros, and writes the result to the destination register."],["LSLS","Logical Shift Left, setting flags (immediate) shifts a register value left by an immediate number of bits, shifting in zeros, and writes the result to the destination register."],["LSR","Logical Shift Right (immediate) shifts a register value right by an immediate number of bits, shifting in zeros, and writes the result to the destination register."],["LSRS","Logical Shift Right, setting flags (immediate) shifts a register value right by an immediate number of bits, shifting in zeros, and writes the result to the destination register."],["MCR","Move to System register from general-purpose register or execute a System instruction. This instruction copies the value of a general-purpose register to a System register, or executes a System instruction."],["MCRR","Move to System register from two general-purpose registers. This instruction copies the values of two general-purpose registers to a System register."],["MLA","Multiply Accumulate multiplies two register values, and adds a third register value. The least significant 32 bits of the result are written to the destination register. These 32 bits do not depend on whether the source register values are considered to be signed values or unsigned values."],["MLS","Multiply and Subtract multiplies two register values, and subtracts the product from a third register value. The least significant 32 bits of the result are written to the destination register. These 32 bits do not depend on whether the source register values are considered to be signed values or unsigned values."],["MOV","Move (immediate) writes an immediate value to the destination register."],["MOV","Move (register) copies a value from a register to the destination register."],["MOV","Move (register-shifted register) copies a register-shifted register value to the destination register. It can optionally update the condition flags based on the value."],["MOVT","Move Top writes an immediate value to the top halfword of the destination register. It does not affect the contents of the bottom halfword."],["MRC","Move to general-purpose register from System register. This instruction copies the value of a System register to a general-purpose register."],["MRRC","Move to two general-purpose registers from System register. This instruction copies the value of a System register to two general-purpose registers."],["MRS","Move Special register to general-purpose register moves the value of the APSR, CPSR, or SPSR_<current_mode> into a general-purpose register."],["MRS","Move to Register from Banked or Special register moves the value from the Banked general-purpose register or Saved Program Status Registers (SPSRs) of the specified mode, or the value of ELR_hyp, to a general-purpose register."],["MSR","Move to Banked or Special register from general-purpose register moves the value of a general-purpose register to the Banked general-purpose register or Saved Program Status Registers (SPSRs) of the specified mode, or to ELR_hyp."],["MSR","Move immediate value to Special register moves selected bits of an immediate value to the corresponding bits in the APSR, CPSR, or SPSR_<current_mode>."],["MSR","Move general-purpose register to Special register moves selected bits of a general-purpose register to the APSR, CPSR or SPSR_<current_mode>."],["MUL","Multiply multiplies two register values. The least significant 32 bits of the result are written to the destination register. These 32 bits do not depend on whether the source register values are considered to be signed values or unsigned values."],["MVN","Bitwise NOT (immediate) writes the bitwise inverse of an immediate value to the destination register."],["MVN","Bitwise NOT (register) writes the bitwise inverse of a register value to the destination register."],["MVN","Bitwise NOT (register-shifted register) writes the bitwise inverse of a register-shifted register value to the destination register. It can optionally update the condition flags based on the result."],["NOP","No Operation does nothing. This instruction can be used for instruction alignment purposes."],["ORN","Bitwise OR NOT (immediate) performs a bitwise (inclusive) OR of a register value and the complement of an immediate value, and writes the result to the destination register. It can optionally update the condition flags based on the result."],["ORN","Bitwise OR NOT (register) performs a bitwise (inclusive) OR of a register value and the complement of an optionally-shifted register value, and writes the result to the destination register. It can optionally update the condition flags based on the result."],["ORR","Bitwise OR (immediate) performs a bitwise (inclusive) OR of a register value and an immediate value, and writes the result to the destination register."],["ORR","Bitwise OR (register) performs a bitwise (inclusive) OR of a register value and an optionally-shifted register value, and writes the result to the destination register."],["ORR","Bitwise OR (register-shifted register) performs a bitwise (inclusive) OR of a register value and a register-shifted register value, and writes the result to the destination register. It can optionally update the condition flags based on the result."],["PKHBT","Pack Halfword combines one halfword of its first operand with the other halfword of its shifted second operand."],["PLD","Preload Data (immediate) signals the memory system that data memory accesses from a specified address are likely in the near future. The memory system can respond by taking actions that are expected to speed up the memory accesses when they do occur, such as preloading the cache line containing the specified address into the data cache."],["PLD","Preload Data (literal) signals the memory system that data memory accesses from a specified address are likely in the near future. The memory system can respond by taking actions that are expected to speed up the memory accesses when they do occur, such as preloading the cache line containing the specified address into the data cache."],["PLD","Preload Data (register) signals the memory system that data memory accesses from a specified address are likely in the near future. The memory system can respond by taking actions that are expected to speed up the memory accesses when they do occur, such as preloading the cache line containing the specified address into the data cache."],["PLI","Preload Instruction signals the memory system that instruction memory accesses from a specified address are likely in the near future. The memory system can respond by taking actions that are expected to speed up the memory accesses when they do occur, such as pre-loading the cache line containing the specified address into the instruction cache."],["PLI","Preload Instruction signals the memory system that instruction memory accesses from a specified address are likely in the near future. The memory system can respond by taking actions that are expected to speed up the memory accesses when they do occur, such as pre-loading the cache line containing the specified address into the instruction cache."],["POP","Pop Multiple Registers from Stack loads multiple general-purpose registers from the stack, loading from consecutive memory locations starting at the address in SP, and updates SP to point just above the loaded data."],["PSSBB","Physical Speculative Store Bypass Barrier is a memory barrier which prevents speculative loads from bypassing earlier stores to the same physical address."],["PUSH","Push Multiple Registers to Stack stores multiple general-purpose registers to the stack, storing to consecutive memory locations ending just below the address in SP, and updates SP to point to the start of the stored data."],["QADD","Saturating Add adds two register values, saturates the result to the 32-bit signed integer range -231 to (231 - 1), and writes the result to the destination register. If saturation occurs, it sets PSTATE.Q to 1."],["QADD16","Saturating Add 16 performs two 16-bit integer additions, saturates the results to the 16-bit signed integer range -215 <= x <= 215 - 1, and writes the results to the destination register."],["QADD8","Saturating Add 8 performs four 8-bit integer additions, saturates the results to the 8-bit signed integer range -27 <= x <= 27 - 1, and writes the results to the destination register."],["QASX","Saturating Add and Subtract with Exchange exchanges the two halfwords of the second operand, performs one 16-bit integer addition and one 16-bit subtraction, saturates the results to the 16-bit signed integer range -215 <= x <= 215 - 1, and writes the results to the destination register."],["QDADD","Saturating Double and Add adds a doubled register value to another register value, and writes the result to the destination register. Both the doubling and the addition have their results saturated to the 32-bit signed integer range -231 <= x <= 231 - 1. If saturation occurs in either operation, it sets PSTATE.Q to 1."],["QDSUB","Saturating Double and Subtract subtracts a doubled register value from another register value, and writes the result to the destination register. Both the doubling and the subtraction have their results saturated to the 32-bit signed integer range -231 <= x <= 231 - 1. If saturation occurs in either operation, it sets PSTATE.Q to 1."],["QSAX","Saturating Subtract and Add with Exchange exchanges the two halfwords of the second operand, performs one 16-bit integer subtraction and one 16-bit addition, saturates the results to the 16-bit signed integer range -215 <= x <= 215 - 1, and writes the results to the destination register."],["QSUB","Saturating Subtract subtracts one register value from another register value, saturates the result to the 32-bit signed integer range -231 <= x <= 231 - 1, and writes the result to the destination register. If saturation occurs, it sets PSTATE.Q to 1."],["QSUB16","Saturating Subtract 16 performs two 16-bit integer subtractions, saturates the results to the 16-bit signed integer range -215 <= x <= 215 - 1, and writes the results to the destination register."],["QSUB8","Saturating Subtract 8 performs four 8-bit integer subtractions, saturates the results to the 8-bit signed integer range -27 <= x <= 27 - 1, and writes the results to the destination register."],["RBIT","Reverse Bits reverses the bit order in a 32-bit register."],["REV","Byte-Reverse Word reverses the byte order in a 32-bit register."],["REV16","Byte-Reverse Packed Halfword reverses the byte order in each16-bit halfword of a 32-bit register."],["REVSH","Byte-Reverse Signed Halfword reverses the byte order in the lower 16-bit halfword of a 32-bit register, and sign-extends the result to 32 bits."],["RFE","Return From Exception loads two consecutive memory locations using an address in a base register"],["ROR","Rotate Right (immediate) provides the value of the contents of a register rotated by a constant value. The bits that are rotated off the right end are inserted into the vacated bit positions on the left."],["RORS","Rotate Right, setting flags (immediate) provides the value of the contents of a register rotated by a constant value. The bits that are rotated off the right end are inserted into the vacated bit positions on the left."],["RRX","Rotate Right with Extend provides the value of the contents of a register shifted right by one place, with the Carry flag shifted into bit[31]."],["RRXS","Rotate Right with Extend, setting flags provides the value of the contents of a register shifted right by one place, with the Carry flag shifted into bit[31]."],["RSB","Reverse Subtract (immediate) subtracts a register value from an immediate value, and writes the result to the destination register."],["RSB","Reverse Subtract (register) subtracts a register value from an optionally-shifted register value, and writes the result to the destination register."],["RSB","Reverse Subtract (register-shifted register) subtracts a register value from a register-shifted register value, and writes the result to the destination register. It can optionally update the condition flags based on the result."],["RSC","Reverse Subtract with Carry (immediate) subtracts a register value and the value of NOT (Carry flag) from an immediate value, and writes the result to the destination register."],["RSC","Reverse Subtract with Carry (register) subtracts a register value and the value of NOT (Carry flag) from an optionally-shifted register value, and writes the result to the destination register."],["RSC","Reverse Subtract (register-shifted register) subtracts a register value and the value of NOT (Carry flag) from a register-shifted register value, and writes the result to the destination register. It can optionally update the condition flags based on the result."],["SADD16","Signed Add 16 performs two 16-bit signed integer additions, and writes the results to the destination register. It sets PSTATE.GE according to the results of the additions."],["SADD8","Signed Add 8 performs four 8-bit signed integer additions, and writes the results to the destination register. It sets PSTATE.GE according to the results of the additions."],["SASX","Signed Add and Subtract with Exchange exchanges the two halfwords of the second operand, performs one 16-bit integer addition and one 16-bit subtraction, and writes the results to the destination register. It sets PSTATE.GE according to the results."],["SB","Speculation Barrier is a barrier that controls speculation."],["SBC","Subtract with Carry (immediate) subtracts an immediate value and the value of NOT (Carry flag) from a register value, and writes the result to the destination register."],["SBC","Subtract with Carry (register) subtracts an optionally-shifted register value and the value of NOT (Carry flag) from a register value, and writes the result to the destination register."],["SBC","Subtract with Carry (register-shifted register) subtracts a register-shifted register value and the value of NOT (Carry flag) from a register value, and writes the result to the destination register. It can optionally update the condition flags based on the result."],["SBFX","Signed Bit Field Extract extracts any number of adjacent bits at any position from a register, sign-extends them to 32 bits, and writes the result to the destination register."],["SDIV","Signed Divide divides a 32-bit signed integer register value by a 32-bit signed integer register value, and writes the result to the destination register. The condition flags are not affected."],["SEL","Select Bytes selects each byte of its result from either its first operand or its second operand, according to the values of the PSTATE.GE flags."],["SETEND","Set Endianness writes a new value to PSTATE.E."],["SETPAN","Set Privileged Access Never writes a new value to PSTATE.PAN."],["SEV","Send Event is a hint instruction. It causes an event to be signaled to all PEs in the multiprocessor system. For more information, see Wait For Event and Send Event."],["SEVL","Send Event Local is a hint instruction that causes an event to be signaled locally without requiring the event to be signaled to other PEs in the multiprocessor system. It can prime a wait-loop which starts with a WFE instruction."],["SHA1C","SHA1 hash update (choose)."],["SHA1H","SHA1 fixed rotate."],["SHA1M","SHA1 hash update (majority)."],["SHA1P","SHA1 hash update (parity)."],["SHA1SU0","SHA1 schedule update 0."],["SHA1SU1","SHA1 schedule update 1."],["SHA256H","SHA256 hash update part 1."],["SHA256H2","SHA256 hash update part 2."],["SHA256SU0","SHA256 schedule update 0."],["SHA256SU1","SHA256 schedule update 1."],["SHADD16","Signed Halving Add 16 performs two signed 16-bit integer additions, halves the results, and writes the results to the destination register."],["SHADD8","Signed Halving Add 8 performs four signed 8-bit integer additions, halves the results, and writes the results to the destination register."],["SHASX","Signed Halving Add and Subtract with Exchange exchanges the two halfwords of the second operand, performs one signed 16-bit integer addition and one signed 16-bit subtraction, halves the results, and writes the results to the destination register."],["SHSAX","Signed Halving Subtract and Add with Exchange exchanges the two halfwords of the second operand, performs one signed 16-bit integer subtraction and one signed 16-bit addition, halves the results, and writes the results to the destination register."],["SHSUB16","Signed Halving Subtract 16 performs two signed 16-bit integer subtractions, halves the results, and writes the results to the destination register."],["SHSUB8","Signed Halving Subtract 8 performs four signed 8-bit integer subtractions, halves the results, and writes the results to the destination register."],["SMC","Secure Monitor Call causes a Secure Monitor Call exception.  For more information see Secure Monitor Call (SMC) exception."],["SMLABB","Signed Multiply Accumulate (halfwords) performs a signed multiply accumulate operation. The multiply acts on two signed 16-bit quantities, taken from either the bottom or the top half of their respective source registers. The other halves of these source registers are ignored.  The 32-bit product is added to a 32-bit accumulate value and the result is written to the destination register."],["SMLAD","Signed Multiply Accumulate Dual performs two signed 16 x 16-bit multiplications. It adds the products to a 32-bit accumulate operand."],["SMLAL","Signed Multiply Accumulate Long multiplies two signed 32-bit values to produce a 64-bit value, and accumulates this with a 64-bit value."],["SMLALBB","Signed Multiply Accumulate Long (halfwords) multiplies two signed 16-bit values to produce a 32-bit value, and accumulates this with a 64-bit value. The multiply acts on two signed 16-bit quantities, taken from either the bottom or the top half of their respective source registers. The other halves of these source registers are ignored. The 32-bit product is sign-extended and accumulated with a 64-bit accumulate value."],["SMLALD","Signed Multiply Accumulate Long Dual performs two signed 16 x 16-bit multiplications. It adds the products to a 64-bit accumulate operand."],["SMLAWB","Signed Multiply Accumulate (word by halfword) performs a signed multiply accumulate operation. The multiply acts on a signed 32-bit quantity and a signed 16-bit quantity. The signed 16-bit quantity is taken from either the bottom or the top half of its source register. The other half of the second source register is ignored. The top 32 bits of the 48-bit product are added to a 32-bit accumulate value and the result is written to the destination register. The bottom 16 bits of the 48-bit product are ignored."],["SMLSD","Signed Multiply Subtract Dual performs two signed 16 x 16-bit multiplications. It adds the difference of the products to a 32-bit accumulate operand."],["SMLSLD","Signed Multiply Subtract Long Dual performs two signed 16 x 16-bit multiplications. It adds the difference of the products to a 64-bit accumulate operand."],["SMMLA","Signed Most Significant Word Multiply Accumulate multiplies two signed 32-bit values, extracts the most significant 32 bits of the result, and adds an accumulate value."],["SMMLS","Signed Most Significant Word Multiply Subtract multiplies two signed 32-bit values, subtracts the result from a 32-bit accumulate value that is shifted left by 32 bits, and extracts the most significant 32 bits of the result of that subtraction."],["SMMUL","Signed Most Significant Word Multiply multiplies two signed 32-bit values, extracts the most significant 32 bits of the result, and writes those bits to the destination register."],["SMUAD","Signed Dual Multiply Add performs two signed 16 x 16-bit multiplications. It adds the products together, and writes the result to the destination register."],["SMULBB","Signed Multiply (halfwords) multiplies two signed 16-bit quantities, taken from either the bottom or the top half of their respective source registers. The other halves of these source registers are ignored. The 32-bit product is written to the destination register. No overflow is possible during this instruction."],["SMULL","Signed Multiply Long multiplies two 32-bit signed values to produce a 64-bit result."],["SMULWB","Signed Multiply (word by halfword) multiplies a signed 32-bit quantity and a signed 16-bit quantity. The signed 16-bit quantity is taken from either the bottom or the top half of its source register. The other half of the second source register is ignored. The top 32 bits of the 48-bit product are written to the destination register. The bottom 16 bits of the 48-bit product are ignored. No overflow is possible during this instruction."],["SMUSD","Signed Multiply Subtract Dual performs two signed 16 x 16-bit multiplications. It subtracts one of the products from the other, and writes the result to the destination register."],["SRS","Store Return State stores the LR_<current_mode> and SPSR_<current_mode> to the stack of a specified mode. For information about memory accesses see Memory accesses."],["SSAT","Signed Saturate saturates an optionally-shifted signed value to a selectable signed range."],["SSAT16","Signed Saturate 16 saturates two signed 16-bit values to a selected signed range."],["SSAX","Signed Subtract and Add with Exchange exchanges the two halfwords of the second operand, performs one 16-bit integer subtraction and one 16-bit addition, and writes the results to the destination register. It sets PSTATE.GE according to the results."],["SSBB","Speculative Store Bypass Barrier is a memory barrier which prevents speculative loads from bypassing earlier stores to the same virtual address under certain conditions."],["SSUB16","Signed Subtract 16 performs two 16-bit signed integer subtractions, and writes the results to the destination register. It sets PSTATE.GE according to the results of the subtractions."],["SSUB8","Signed Subtract 8 performs four 8-bit signed integer subtractions, and writes the results to the destination register. It sets PSTATE.GE according to the results of the subtractions."],["STC","Store data to System register calculates an address from a base register value and an immediate offset, and stores a word from the DBGDTRRXint System register to memory. It can use offset, post-indexed, pre-indexed, or unindexed addressing. For information about memory accesses see Memory accesses."],["STL","Store-Release Word stores a word from a register to memory.  The instruction also has memory ordering semantics as described in Load-Acquire, Store-Release."],["STLB","Store-Release Byte stores a byte from a register to memory.  The instruction also has memory ordering semantics as described in Load-Acquire, Store-Release."],["STLEX","Store-Release Exclusive Word stores a word from a register to memory if the executing PE has exclusive access to the memory at that address, and returns a status value of 0 if the store was successful, or of 1 if no store was performed."],["STLEXB","Store-Release Exclusive Byte stores a byte from a register to memory if the executing PE has exclusive access to the memory at that address, and returns a status value of 0 if the store was successful, or of 1 if no store was performed."],["STLEXD","Store-Release Exclusive Doubleword stores a doubleword from two registers to memory if the executing PE has exclusive access to the memory at that address, and returns a status value of 0 if the store was successful, or of 1 if no store was performed."],["STLEXH","Store-Release Exclusive Halfword stores a halfword from a register to memory if the executing PE has exclusive access to the memory at that address, and returns a status value of 0 if the store was successful, or of 1 if no store was performed."],["STLH","Store-Release Halfword stores a halfword from a register to memory. The instruction also has memory ordering semantics as described in Load-Acquire, Store-Release."],["STM","Store Multiple (Increment After, Empty Ascending) stores multiple registers to consecutive memory locations using an address from a base register. The consecutive memory locations start at this address, and the address just above the last of those locations can optionally be written back to the base register."],["STM","In an EL1 mode other than System mode, Store Multiple (User registers) stores multiple User mode registers to consecutive memory locations using an address from a base register. The PE reads the base register value normally, using the current mode to determine the correct Banked version of the register. This instruction cannot writeback to the base register."],["STMDA","Store Multiple Decrement After (Empty Descending) stores multiple registers to consecutive memory locations using an address from a base register. The consecutive memory locations end at this address, and the address just below the lowest of those locations can optionally be written back to the base register."],["STMDB","Store Multiple Decrement Before (Full Descending) stores multiple registers to consecutive memory locations using an address from a base register. The consecutive memory locations end just below this address, and the address of the first of those locations can optionally be written back to the base register."],["STMFA","Store Multiple Increment Before (Full Ascending) stores multiple registers to consecutive memory locations using an address from a base register. The consecutive memory locations start just above this address, and the address of the last of those locations can optionally be written back to the base register."],["STR","Store Register (immediate) calculates an address from a base register value and an immediate offset, and stores a word from a register to memory. It can use offset, post-indexed, or pre-indexed addressing. For information about memory accesses see Memory accesses."],["STR","Store Register (register) calculates an address from a base register value and an offset register value, stores a word from a register to memory. The offset register value can optionally be shifted. For information about memory accesses see Memory accesses."],["STRB","Store Register Byte (immediate) calculates an address from a base register value and an immediate offset, and stores a byte from a register to memory. It can use offset, post-indexed, or pre-indexed addressing. For information about memory accesses see Memory accesses."],["STRB","Store Register Byte (register) calculates an address from a base register value and an offset register value, and stores a byte from a register to memory. The offset register value can optionally be shifted. For information about memory accesses see Memory accesses."],["STRBT","Store Register Byte Unprivileged stores a byte from a register to memory. For information about memory accesses see Memory accesses."],["STRD","Store Register Dual (immediate) calculates an address from a base register value and an immediate offset, and stores two words from two registers to memory. It can use offset, post-indexed, or pre-indexed addressing. For information about memory accesses see Memory accesses."],["STRD","Store Register Dual (register) calculates an address from a base register value and a register offset, and stores two words from two registers to memory. It can use offset, post-indexed, or pre-indexed addressing. For information about memory accesses see Memory accesses."],["STREX","Store Register Exclusive calculates an address from a base register value and an immediate offset, stores a word from a register to the calculated address if the PE has exclusive access to the memory at that address, and returns a status value of 0 if the store was successful, or of 1 if no store was performed."],["STREXB","Store Register Exclusive Byte derives an address from a base register value, stores a byte from a register to the derived address if the executing PE has exclusive access to the memory at that address, and returns a status value of 0 if the store was successful, or of 1 if no store was performed."],["STREXD","Store Register Exclusive Doubleword derives an address from a base register value, stores a 64-bit doubleword from two registers to the derived address if the executing PE has exclusive access to the memory at that address, and returns a status value of 0 if the store was successful, or of 1 if no store was performed."],["STREXH","Store Register Exclusive Halfword derives an address from a base register value, stores a halfword from a register to the derived address if the executing PE has exclusive access to the memory at that address, and returns a status value of 0 if the store was successful, or of 1 if no store was performed."],["STRH","Store Register Halfword (immediate) calculates an address from a base register value and an immediate offset, and stores a halfword from a register to memory. It can use offset, post-indexed, or pre-indexed addressing. For information about memory accesses see Memory accesses."],["STRH","Store Register Halfword (register) calculates an address from a base register value and an offset register value, and stores a halfword from a register to memory. The offset register value can be shifted left by 0, 1, 2, or 3 bits. For information about memory accesses see Memory accesses."],["STRHT","Store Register Halfword Unprivileged stores a halfword from a register to memory. For information about memory accesses see Memory accesses."],["STRT","Store Register Unprivileged stores a word from a register to memory. For information about memory accesses see Memory accesses."],["SUB","Subtract (immediate) subtracts an immediate value from a register value, and writes the result to the destination register."],["SUB","Subtract (register) subtracts an optionally-shifted register value from a register value, and writes the result to the destination register."],["SUB","Subtract (register-shifted register) subtracts a register-shifted register value from a register value, and writes the result to the destination register. It can optionally update the condition flags based on the result."],["SUB","Subtract from SP (immediate) subtracts an immediate value from the SP value, and writes the result to the destination register."],["SUB","Subtract from SP (register) subtracts an optionally-shifted register value from the SP value, and writes the result to the destination register."],["SVC","Supervisor Call causes a Supervisor Call exception. For more information, see Supervisor Call (SVC) exception."],["SXTAB","Signed Extend and Add Byte extracts an 8-bit value from a register, sign-extends it to 32 bits, adds the result to the value in another register, and writes the final result to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 8-bit value."],["SXTAB16","Signed Extend and Add Byte 16 extracts two 8-bit values from a register, sign-extends them to 16 bits each, adds the results to two 16-bit values from another register, and writes the final results to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 8-bit values."],["SXTAH","Signed Extend and Add Halfword extracts a 16-bit value from a register, sign-extends it to 32 bits, adds the result to a value from another register, and writes the final result to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 16-bit value."],["SXTB","Signed Extend Byte extracts an 8-bit value from a register, sign-extends it to 32 bits, and writes the result to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 8-bit value."],["SXTB16","Signed Extend Byte 16 extracts two 8-bit values from a register, sign-extends them to 16 bits each, and writes the results to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 8-bit values."],["SXTH","Signed Extend Halfword extracts a 16-bit value from a register, sign-extends it to 32 bits, and writes the result to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 16-bit value."],["TBB","Table Branch Byte or Halfword causes a PC-relative forward branch using a table of single byte or halfword offsets. A base register provides a pointer to the table, and a second register supplies an index into the table. The branch length is twice the value returned from the table."],["TEQ","Test Equivalence (immediate) performs a bitwise exclusive OR operation on a register value and an immediate value. It updates the condition flags based on the result, and discards the result."],["TEQ","Test Equivalence (register) performs a bitwise exclusive OR operation on a register value and an optionally-shifted register value. It updates the condition flags based on the result, and discards the result."],["TEQ","Test Equivalence (register-shifted register) performs a bitwise exclusive OR operation on a register value and a register-shifted register value. It updates the condition flags based on the result, and discards the result."],["TSB CSYNC","Trace Synchronization Barrier. This instruction is a barrier that synchronizes the trace operations of instructions."],["TST","Test (immediate) performs a bitwise AND operation on a register value and an immediate value. It updates the condition flags based on the result, and discards the result."],["TST","Test (register) performs a bitwise AND operation on a register value and an optionally-shifted register value. It updates the condition flags based on the result, and discards the result."],["TST","Test (register-shifted register) performs a bitwise AND operation on a register value and a register-shifted register value. It updates the condition flags based on the result, and discards the result."],["UADD16","Unsigned Add 16 performs two 16-bit unsigned integer additions, and writes the results to the destination register. It sets PSTATE.GE according to the results of the additions."],["UADD8","Unsigned Add 8 performs four unsigned 8-bit integer additions, and writes the results to the destination register. It sets PSTATE.GE according to the results of the additions."],["UASX","Unsigned Add and Subtract with Exchange exchanges the two halfwords of the second operand, performs one unsigned 16-bit integer addition and one unsigned 16-bit subtraction, and writes the results to the destination register. It sets PSTATE.GE according to the results."],["UBFX","Unsigned Bit Field Extract extracts any number of adjacent bits at any position from a register, zero-extends them to 32 bits, and writes the result to the destination register."],["UDF","Permanently Undefined generates an Undefined Instruction exception."],["UDIV","Unsigned Divide divides a 32-bit unsigned integer register value by a 32-bit unsigned integer register value, and writes the result to the destination register. The condition flags are not affected."],["UHADD16","Unsigned Halving Add 16 performs two unsigned 16-bit integer additions, halves the results, and writes the results to the destination register."],["UHADD8","Unsigned Halving Add 8 performs four unsigned 8-bit integer additions, halves the results, and writes the results to the destination register."],["UHASX","Unsigned Halving Add and Subtract with Exchange exchanges the two halfwords of the second operand, performs one unsigned 16-bit integer addition and one unsigned 16-bit subtraction, halves the results, and writes the results to the destination register."],["UHSAX","Unsigned Halving Subtract and Add with Exchange exchanges the two halfwords of the second operand, performs one unsigned 16-bit integer subtraction and one unsigned 16-bit addition, halves the results, and writes the results to the destination register."],["UHSUB16","Unsigned Halving Subtract 16 performs two unsigned 16-bit integer subtractions, halves the results, and writes the results to the destination register."],["UHSUB8","Unsigned Halving Subtract 8 performs four unsigned 8-bit integer subtractions, halves the results, and writes the results to the destination register."],["UMAAL","Unsigned Multiply Accumulate Accumulate Long multiplies two unsigned 32-bit values to produce a 64-bit value, adds two unsigned 32-bit values, and writes the 64-bit result to two registers."],["UMLAL","Unsigned Multiply Accumulate Long multiplies two unsigned 32-bit values to produce a 64-bit value, and accumulates this with a 64-bit value."],["UMULL","Unsigned Multiply Long multiplies two 32-bit unsigned values to produce a 64-bit result."],["UQADD16","Unsigned Saturating Add 16 performs two unsigned 16-bit integer additions, saturates the results to the 16-bit unsigned integer range 0 <= x <= 216 - 1, and writes the results to the destination register."],["UQADD8","Unsigned Saturating Add 8 performs four unsigned 8-bit integer additions, saturates the results to the 8-bit unsigned integer range 0 <= x <= 28 - 1, and writes the results to the destination register."],["UQASX","Unsigned Saturating Add and Subtract with Exchange exchanges the two halfwords of the second operand, performs one unsigned 16-bit integer addition and one unsigned 16-bit subtraction, saturates the results to the 16-bit unsigned integer range 0 <= x <= 216 - 1, and writes the results to the destination register."],["UQSAX","Unsigned Saturating Subtract and Add with Exchange exchanges the two halfwords of the second operand, performs one unsigned 16-bit integer subtraction and one unsigned 16-bit addition, saturates the results to the 16-bit unsigned integer range 0 <= x <= 216 - 1, and writes the results to the destination register."],["UQSUB16","Unsigned Saturating Subtract 16 performs two unsigned 16-bit integer subtractions, saturates the results to the 16-bit unsigned integer range 0 <= x <= 216 - 1, and writes the results to the destination register."],["UQSUB8","Unsigned Saturating Subtract 8 performs four unsigned 8-bit integer subtractions, saturates the results to the 8-bit unsigned integer range 0 <= x <= 28 - 1, and writes the results to the destination register."],["USAD8","Unsigned Sum of Absolute Differences performs four unsigned 8-bit subtractions, and adds the absolute values of the differences together."],["USADA8","Unsigned Sum of Absolute Differences and Accumulate performs four unsigned 8-bit subtractions, and adds the absolute values of the differences to a 32-bit accumulate operand."],["USAT","Unsigned Saturate saturates an optionally-shifted signed value to a selected unsigned range."],["USAT16","Unsigned Saturate 16 saturates two signed 16-bit values to a selected unsigned range."],["USAX","Unsigned Subtract and Add with Exchange exchanges the two halfwords of the second operand, performs one unsigned 16-bit integer subtraction and one unsigned 16-bit addition, and writes the results to the destination register. It sets PSTATE.GE according to the results."],["USUB16","Unsigned Subtract 16 performs two 16-bit unsigned integer subtractions, and writes the results to the destination register. It sets PSTATE.GE according to the results of the subtractions."],["USUB8","Unsigned Subtract 8 performs four 8-bit unsigned integer subtractions, and writes the results to the destination register. It sets PSTATE.GE according to the results of the subtractions."],["UXTAB","Unsigned Extend and Add Byte extracts an 8-bit value from a register, zero-extends it to 32 bits, adds the result to the value in another register, and writes the final result to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 8-bit value."],["UXTAB16","Unsigned Extend and Add Byte 16 extracts two 8-bit values from a register, zero-extends them to 16 bits each, adds the results to two 16-bit values from another register, and writes the final results to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 8-bit values."],["UXTAH","Unsigned Extend and Add Halfword extracts a 16-bit value from a register, zero-extends it to 32 bits, adds the result to a value from another register, and writes the final result to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 16-bit value."],["UXTB","Unsigned Extend Byte extracts an 8-bit value from a register, zero-extends it to 32 bits, and writes the result to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 8-bit value."],["UXTB16","Unsigned Extend Byte 16 extracts two 8-bit values from a register, zero-extends them to 16 bits each, and writes the results to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 8-bit values."],["UXTH","Unsigned Extend Halfword extracts a 16-bit value from a register, zero-extends it to 32 bits, and writes the result to the destination register. The instruction can specify a rotation by 0, 8, 16, or 24 bits before extracting the 16-bit value."],["VABA","Vector Absolute Difference and Accumulate subtracts the elements of one vector from the corresponding elements of another vector, and accumulates the absolute values of the results into the elements of the destination vector."],["VABAL","Vector Absolute Difference and Accumulate Long subtracts the elements of one vector from the corresponding elements of another vector, and accumulates the absolute values of the results into the elements of the destination vector."],["VABD","Vector Absolute Difference (floating-point) subtracts the elements of one vector from the corresponding elements of another vector, and places the absolute values of the results in the elements of the destination vector."],["VABD","Vector Absolute Difference (integer) subtracts the elements of one vector from the corresponding elements of another vector, and places the absolute values of the results in the elements of the destination vector."],["VABDL","Vector Absolute Difference Long (integer) subtracts the elements of one vector from the corresponding elements of another vector, and places the absolute values of the results in the elements of the destination vector."],["VABS","Vector Absolute takes the absolute value of each element in a vector, and places the results in a second vector. The floating-point version only clears the sign bit."],["VACGE","Vector Absolute Compare Greater Than or Equal takes the absolute value of each element in a vector, and compares it with the absolute value of the corresponding element of a second vector. If the first is greater than or equal to the second, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VACGT","Vector Absolute Compare Greater Than takes the absolute value of each element in a vector, and compares it with the absolute value of the corresponding element of a second vector. If the first is greater than the second, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VACLE","Vector Absolute Compare Less Than or Equal takes the absolute value of each element in a vector, and compares it with the absolute value of the corresponding element of a second vector. If the first is less than or equal to the second, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VACLT","Vector Absolute Compare Less Than takes the absolute value of each element in a vector, and compares it with the absolute value of the corresponding element of a second vector. If the first is less than the second, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VADD","Vector Add (floating-point) adds corresponding elements in two vectors, and places the results in the destination vector."],["VADD","Vector Add (integer) adds corresponding elements in two vectors, and places the results in the destination vector."],["VADDHN","Vector Add and Narrow, returning High Half adds corresponding elements in two quadword vectors, and places the most significant half of each result in a doubleword vector. The results are truncated. For rounded results, see VRADDHN."],["VADDL","Vector Add Long adds corresponding elements in two doubleword vectors, and places the results in a quadword vector. Before adding, it sign-extends or zero-extends the elements of both operands."],["VADDW","Vector Add Wide adds corresponding elements in one quadword and one doubleword vector, and places the results in a quadword vector. Before adding, it sign-extends or zero-extends the elements of the doubleword operand."],["VAND","Vector Bitwise AND (register) performs a bitwise AND operation between two registers, and places the result in the destination register."],["VBIC","Vector Bitwise Bit Clear (immediate) performs a bitwise AND between a register value and the complement of an immediate value, and returns the result into the destination vector."],["VBIC","Vector Bitwise Bit Clear (register) performs a bitwise AND between a register value and the complement of a register value, and places the result in the destination register."],["VBIF","Vector Bitwise Insert if False inserts each bit from the first source register into the destination register if the corresponding bit of the second source register is 0, otherwise leaves the bit in the destination register unchanged."],["VBIT","Vector Bitwise Insert if True inserts each bit from the first source register into the destination register if the corresponding bit of the second source register is 1, otherwise leaves the bit in the destination register unchanged."],["VBSL","Vector Bitwise Select sets each bit in the destination to the corresponding bit from the first source operand when the original destination bit was 1, otherwise from the second source operand."],["VCADD","Vector Complex Add."],["VCEQ","Vector Compare Equal to Zero takes each element in a vector, and compares it with zero.  If it is equal to zero, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCEQ","Vector Compare Equal takes each element in a vector, and compares it with the corresponding element of a second vector. If they are equal, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCGE","Vector Compare Greater Than or Equal to Zero takes each element in a vector, and compares it with zero. If it is greater than or equal to zero, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCGE","Vector Compare Greater Than or Equal takes each element in a vector, and compares it with the corresponding element of a second vector. If the first is greater than or equal to the second, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCGT","Vector Compare Greater Than Zero takes each element in a vector, and compares it with zero.  If it is greater than zero, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCGT","Vector Compare Greater Than takes each element in a vector, and compares it with the corresponding element of a second vector. If the first is greater than the second, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCLE","Vector Compare Less Than or Equal to Zero takes each element in a vector, and compares it with zero. If it is less than or equal to zero, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCLE","Vector Compare Less Than or Equal takes each element in a vector, and compares it with the corresponding element of a second vector. If the first is less than or equal to the second, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCLS","Vector Count Leading Sign Bits counts the number of consecutive bits following the topmost bit, that are the same as the topmost bit, in each element in a vector, and places the results in a second vector. The count does not include the topmost bit itself."],["VCLT","Vector Compare Less Than Zero takes each element in a vector, and compares it with zero.  If it is less than zero, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCLT","Vector Compare Less Than takes each element in a vector, and compares it with the corresponding element of a second vector. If the first is less than the second, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VCLZ","Vector Count Leading Zeros counts the number of consecutive zeros, starting from the most significant bit, in each element in a vector, and places the results in a second vector."],["VCMLA","Vector Complex Multiply Accumulate."],["VCMLA","Vector Complex Multiply Accumulate (by element)."],["VCMP","Vector Compare compares two floating-point registers, or one floating-point register and zero. It writes the result to the FPSCR flags. These are normally transferred to the PSTATE.{N, Z, C, V} Condition flags by a subsequent VMRS instruction."],["VCMPE","Vector Compare, raising Invalid Operation on NaN compares two floating-point registers, or one floating-point register and zero. It writes the result to the FPSCR flags. These are normally transferred to the PSTATE.{N, Z, C, V} Condition flags by a subsequent VMRS instruction."],["VCNT","Vector Count Set Bits counts the number of bits that are one in each element in a vector, and places the results in a second vector."],["VCVT","Vector Convert from single-precision to BFloat16 converts each 32-bit element in a vector from single-precision floating-point to BFloat16 format, and writes the result into a second vector. The result vector elements are half the width of the source vector elements."],["VCVT","Convert between double-precision and single-precision does one of the following"],["VCVT","Vector Convert between half-precision and single-precision converts each element in a vector from single-precision to half-precision floating-point, or from half-precision to single-precision, and places the results in a second vector."],["VCVT","Vector Convert between floating-point and integer converts each element in a vector from floating-point to integer, or from integer to floating-point, and places the results in a second vector."],["VCVT","Convert floating-point to integer with Round towards Zero converts a value in a register from floating-point to a 32-bit integer, using the Round towards Zero rounding mode, and places the result in a second register."],["VCVT","Convert integer to floating-point converts a 32-bit integer to floating-point using the rounding mode specified by the FPSCR, and places the result in a second register."],["VCVT","Vector Convert between floating-point and fixed-point converts each element in a vector from floating-point to fixed-point, or from fixed-point to floating-point, and places the results in a second vector."],["VCVT","Convert between floating-point and fixed-point converts a value in a register from floating-point to fixed-point, or from fixed-point to floating-point. Software can specify the fixed-point value as either signed or unsigned."],["VCVTA","Vector Convert floating-point to integer with Round to Nearest with Ties to Away converts each element in a vector from floating-point to integer using the Round to Nearest with Ties to Away rounding mode, and places the results in a second vector."],["VCVTA","Convert floating-point to integer with Round to Nearest with Ties to Away converts a value in a register from floating-point to a 32-bit integer using the Round to Nearest with Ties to Away rounding mode, and places the result in a second register."],["VCVTB","Convert to or from a half-precision value in the bottom half of a single-precision register does one of the following"],["VCVTB","Converts the single-precision value in a single-precision register to BFloat16 format and writes the result into the bottom half of a single precision register, preserving the top 16 bits of the destination register."],["VCVTM","Vector Convert floating-point to integer with Round towards -Infinity converts each element in a vector from floating-point to integer using the Round towards -Infinity rounding mode, and places the results in a second vector."],["VCVTM","Convert floating-point to integer with Round towards -Infinity converts a value in a register from floating-point to a 32-bit integer using the Round towards -Infinity rounding mode, and places the result in a second register."],["VCVTN","Vector Convert floating-point to integer with Round to Nearest converts each element in a vector from floating-point to integer using the Round to Nearest rounding mode, and places the results in a second vector."],["VCVTN","Convert floating-point to integer with Round to Nearest converts a value in a register from floating-point to a 32-bit integer using the Round to Nearest rounding mode, and places the result in a second register."],["VCVTP","Vector Convert floating-point to integer with Round towards +Infinity converts each element in a vector from floating-point to integer using the Round towards +Infinity rounding mode, and places the results in a second vector."],["VCVTP","Convert floating-point to integer with Round towards +Infinity converts a value in a register from floating-point to a 32-bit integer using the Round towards +Infinity rounding mode, and places the result in a second register."],["VCVTR","Convert floating-point to integer converts a value in a register from floating-point to a 32-bit integer, using the rounding mode specified by the FPSCR and places the result in a second register."],["VCVTT","Convert to or from a half-precision value in the top half of a single-precision register does one of the following"],["VCVTT","Converts the single-precision value in a single-precision register to BFloat16 format and writes the result in the top half of a single-precision register, preserving the bottom 16 bits of the register."],["VDIV","Divide divides one floating-point value by another floating-point value and writes the result to a third floating-point register."],["VDOT","BFloat16 floating-point (BF16) dot product (vector). This instruction delimits the source vectors into pairs of 16-bit BF16 elements. Within each pair, the elements in the first source vector are multiplied by the corresponding elements in the second source vector. The resulting single-precision products are then summed and added destructively to the single-precision element in the destination vector which aligns with the pair of BF16 values in the first source vector. The instruction does not update the FPSCR exception status."],["VDOT","BFloat16 floating-point indexed dot product (vector, by element). This instruction delimits the source vectors into pairs of 16-bit BF16 elements. Each pair of elements in the first source vector is multiplied by the indexed pair of elements in the second source vector. The resulting single-precision products are then summed and added destructively to the single-precision element in the destination vector which aligns with the pair of BFloat16 values in the first source vector. The instruction does not update the FPSCR exception status."],["VDUP","Duplicate general-purpose register to vector duplicates an element from a general-purpose register into every element of the destination vector."],["VDUP","Duplicate vector element to vector duplicates a single element of a vector into every element of the destination vector."],["VEOR","Vector Bitwise Exclusive OR performs a bitwise Exclusive OR operation between two registers, and places the result in the destination register. The operand and result registers can be quadword or doubleword. They must all be the same size."],["VEXT","Vector Extract extracts elements from the bottom end of the second operand vector and the top end of the first, concatenates them and places the result in the destination vector."],["VFMA","Vector Fused Multiply Accumulate multiplies corresponding elements of two vectors, and accumulates the results into the elements of the destination vector. The instruction does not round the result of the multiply before the accumulation."],["VFMAB","The Bfloat16 floating-point widening multiply-add long instruction widens the even-numbered (bottom) or odd-numbered (top) 16-bit elements in the first and second source vectors from Bfloat16 to single-precision format. The instruction then multiplies and adds these values to the overlapping single-precision elements of the destination vector."],["VFMAB","The BFloat16 floating-point widening multiply-add long instruction widens the even-numbered (bottom) or odd-numbered (top) 16-bit elements in the first source vector, and an indexed element in the second source vector from Bfloat16 to single-precision format. The instruction then multiplies and adds these values to the overlapping single-precision elements of the destination vector."],["VFMAL","Vector Floating-point Multiply-Add Long to accumulator (vector). This instruction multiplies corresponding values in the vectors in the two source SIMD&FP registers, and accumulates the product to the corresponding vector element of the destination SIMD&FP register. The instruction does not round the result of the multiply before the accumulation."],["VFMAL","Vector Floating-point Multiply-Add Long to accumulator (by scalar). This instruction multiplies the vector elements in the first source SIMD&FP register by the specified value in the second source SIMD&FP register, and accumulates the product to the corresponding vector element of the destination SIMD&FP register. The instruction does not round the result of the multiply before the accumulation."],["VFMS","Vector Fused Multiply Subtract negates the elements of one vector and multiplies them with the corresponding elements of another vector, adds the products to the corresponding elements of the destination vector, and places the results in the destination vector. The instruction does not round the result of the multiply before the addition."],["VFMSL","Vector Floating-point Multiply-Subtract Long from accumulator (vector). This instruction negates the values in the vector of one SIMD&FP register, multiplies these with the corresponding values in another vector, and accumulates the product to the corresponding vector element of the destination SIMD&FP register. The instruction does not round the result of the multiply before the accumulation."],["VFMSL","Vector Floating-point Multiply-Subtract Long from accumulator (by scalar). This instruction multiplies the negated vector elements in the first source SIMD&FP register by the specified value in the second source SIMD&FP register, and accumulates the product to the corresponding vector element of the destination SIMD&FP register. The instruction does not round the result of the multiply before the accumulation."],["VFNMA","Vector Fused Negate Multiply Accumulate negates one floating-point register value and multiplies it by another floating-point register value, adds the negation of the floating-point value in the destination register to the product, and writes the result back to the destination register. The instruction does not round the result of the multiply before the addition."],["VFNMS","Vector Fused Negate Multiply Subtract multiplies together two floating-point register values, adds the negation of the floating-point value in the destination register to the product, and writes the result back to the destination register. The instruction does not round the result of the multiply before the addition."],["VHADD","Vector Halving Add adds corresponding elements in two vectors of integers, shifts each result right one bit, and places the final results in the destination vector. The results of the halving operations are truncated. For rounded results, see VRHADD)."],["VHSUB","Vector Halving Subtract subtracts the elements of the second operand from the corresponding elements of the first operand, shifts each result right one bit, and places the final results in the destination vector. The results of the halving operations are truncated. There is no rounding version."],["VINS","Vector move Insertion. This instruction copies the lower 16 bits of the 32-bit source SIMD&FP register into the upper 16 bits of the 32-bit destination SIMD&FP register, while preserving the values in the remaining bits."],["VJCVT","Javascript Convert to signed fixed-point, rounding toward Zero. This instruction converts the double-precision floating-point value in the SIMD&FP source register to a 32-bit signed integer using the Round towards Zero rounding mode, and writes the result to the SIMD&FP destination register. If the result is too large to be accommodated as a signed 32-bit integer, then the result is the integer modulo 232, as held in a 32-bit signed integer."],["VLD1","Load single 1-element structure to one lane of one register loads one element from memory into one element of a register. Elements of the register that are not loaded are unchanged. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD1","Load single 1-element structure and replicate to all lanes of one register loads one element from memory into every element of one or two vectors. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD1","Load multiple single 1-element structures to one, two, three, or four registers loads elements from memory into one, two, three, or four registers, without de-interleaving. Every element of each register is loaded. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD2","Load single 2-element structure to one lane of two registers loads one 2-element structure from memory into corresponding elements of two registers. Elements of the registers that are not loaded are unchanged. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD2","Load single 2-element structure and replicate to all lanes of two registers loads one 2-element structure from memory into all lanes of two registers. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD2","Load multiple 2-element structures to two or four registers loads multiple 2-element structures from memory into two or four registers, with de-interleaving. For more information, see Element and structure load/store instructions.  Every element of each register is loaded. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD3","Load single 3-element structure to one lane of three registers loads one 3-element structure from memory into corresponding elements of three registers. Elements of the registers that are not loaded are unchanged. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD3","Load single 3-element structure and replicate to all lanes of three registers loads one 3-element structure from memory into all lanes of three registers. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD3","Load multiple 3-element structures to three registers loads multiple 3-element structures from memory into three registers, with de-interleaving. For more information, see Element and structure load/store instructions. Every element of each register is loaded. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD4","Load single 4-element structure to one lane of four registers loads one 4-element structure from memory into corresponding elements of four registers. Elements of the registers that are not loaded are unchanged. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD4","Load single 4-element structure and replicate to all lanes of four registers loads one 4-element structure from memory into all lanes of four registers. For details of the addressing mode see Advanced SIMD addressing mode."],["VLD4","Load multiple 4-element structures to four registers loads multiple 4-element structures from memory into four registers, with de-interleaving. For more information, see Element and structure load/store instructions. Every element of each register is loaded. For details of the addressing mode see Advanced SIMD addressing mode."],["VLDM","Load Multiple SIMD&FP registers loads multiple registers from consecutive locations in the Advanced SIMD and floating-point register file using an address from a general-purpose register."],["VLDR","Load SIMD&FP register (immediate) loads a single register from the Advanced SIMD and floating-point register file, using an address from a general-purpose register, with an optional offset."],["VLDR","Load SIMD&FP register (literal) loads a single register from the Advanced SIMD and floating-point register file, using an address from the PC value and an immediate offset."],["VMAX","Vector Maximum compares corresponding elements in two vectors, and copies the larger of each pair into the corresponding element in the destination vector."],["VMAX","Vector Maximum compares corresponding elements in two vectors, and copies the larger of each pair into the corresponding element in the destination vector."],["VMAXNM","This instruction determines the floating-point maximum number."],["VMIN","Vector Minimum compares corresponding elements in two vectors, and copies the smaller of each pair into the corresponding element in the destination vector."],["VMIN","Vector Minimum compares corresponding elements in two vectors, and copies the smaller of each pair into the corresponding element in the destination vector."],["VMINNM","This instruction determines the floating point minimum number."],["VMLA","Vector Multiply Accumulate multiplies corresponding elements in two vectors, and accumulates the results into the elements of the destination vector."],["VMLA","Vector Multiply Accumulate multiplies corresponding elements in two vectors, and adds the products to the corresponding elements of the destination vector."],["VMLA","Vector Multiply Accumulate multiplies elements of a vector by a scalar, and adds the products to corresponding elements of the destination vector."],["VMLAL","Vector Multiply Accumulate Long multiplies corresponding elements in two vectors, and add the products to the corresponding element of the destination vector. The destination vector element is twice as long as the elements that are multiplied."],["VMLAL","Vector Multiply Accumulate Long multiplies elements of a vector by a scalar, and adds the products to corresponding elements of the destination vector. The destination vector elements are twice as long as the elements that are multiplied."],["VMLS","Vector Multiply Subtract multiplies corresponding elements in two vectors, subtracts the products from corresponding elements of the destination vector, and places the results in the destination vector."],["VMLS","Vector Multiply Subtract multiplies corresponding elements in two vectors, and subtracts the products from the corresponding elements of the destination vector."],["VMLS","Vector Multiply Subtract multiplies elements of a vector by a scalar, and either subtracts the products from corresponding elements of the destination vector."],["VMLSL","Vector Multiply Subtract Long multiplies corresponding elements in two vectors, and subtract the products from the corresponding elements of the destination vector. The destination vector element is twice as long as the elements that are multiplied."],["VMLSL","Vector Multiply Subtract Long multiplies elements of a vector by a scalar, and subtracts the products from corresponding elements of the destination vector. The destination vector elements are twice as long as the elements that are multiplied."],["VMMLA","BFloat16 floating-point matrix multiply-accumulate. This instruction multiplies the 2x4 matrix of BF16 values in the first 128-bit source vector by the 4x2 BF16 matrix in the second 128-bit source vector. The resulting 2x2 single-precision matrix product is then added destructively to the 2x2 single-precision matrix in the 128-bit destination vector. This is equivalent to performing a 4-way dot product per destination element. The instruction does not update the FPSCR exception status."],["VMOV","Copy two general-purpose registers to or from a SIMD&FP register copies two words from two general-purpose registers into a doubleword register in the Advanced SIMD and floating-point register file, or from a doubleword register in the Advanced SIMD and floating-point register file to two general-purpose registers."],["VMOV","Copy 16 bits of a general-purpose register to or from a 32-bit SIMD&FP register.  This instruction transfers the value held in the bottom 16 bits of a 32-bit SIMD&FP register to the bottom 16 bits of a general-purpose register, or the value held in the bottom 16 bits of a general-purpose register to the bottom 16 bits of a 32-bit SIMD&FP register."],["VMOV","Copy immediate value to a SIMD&FP register places an immediate constant into every element of the destination register."],["VMOV","Copy between FP registers copies the contents of one FP register to another."],["VMOV","Copy a general-purpose register to a vector element copies a byte, halfword, or word from a general-purpose register into an Advanced SIMD scalar."],["VMOV","Copy a general-purpose register to or from a 32-bit SIMD&FP register. This instruction transfers the value held in a 32-bit SIMD&FP register to a general-purpose register, or the value held in a general-purpose register to a 32-bit SIMD&FP register."],["VMOV","Copy a vector element to a general-purpose register with sign or zero extension copies a byte, halfword, or word from an Advanced SIMD scalar to a general-purpose register. Bytes and halfwords can be either zero-extended or sign-extended."],["VMOV","Copy two general-purpose registers to a pair of 32-bit SIMD&FP registers transfers the contents of two consecutively numbered single-precision Floating-point registers to two general-purpose registers, or the contents of two general-purpose registers to a pair of single-precision Floating-point registers. The general-purpose registers do not have to be contiguous."],["VMOVL","Vector Move Long takes each element in a doubleword vector, sign or zero-extends them to twice their original length, and places the results in a quadword vector."],["VMOVN","Vector Move and Narrow copies the least significant half of each element of a quadword vector into the corresponding elements of a doubleword vector."],["VMOVX","Vector Move extraction. This instruction copies the upper 16 bits of the 32-bit source SIMD&FP register into the lower 16 bits of the 32-bit destination SIMD&FP register, while clearing the remaining bits to zero."],["VMRS","Move SIMD&FP Special register to general-purpose register moves the value of an Advanced SIMD and floating-point System register to a general-purpose register. When the specified System register is the FPSCR, a form of the instruction transfers the FPSCR.{N, Z, C, V} condition flags to the APSR.{N, Z, C, V} condition flags."],["VMSR","Move general-purpose register to SIMD&FP Special register moves the value of a general-purpose register to a floating-point System register."],["VMUL","Vector Multiply multiplies corresponding elements in two vectors, and places the results in the destination vector."],["VMUL","Vector Multiply multiplies corresponding elements in two vectors."],["VMUL","Vector Multiply multiplies each element in a vector by a scalar, and places the results in a second vector."],["VMULL","Vector Multiply Long multiplies corresponding elements in two vectors. The destination vector elements are twice as long as the elements that are multiplied."],["VMULL","Vector Multiply Long multiplies each element in a vector by a scalar, and places the results in a second vector. The destination vector elements are twice as long as the elements that are multiplied."],["VMVN","Vector Bitwise NOT (immediate) places the bitwise inverse of an immediate integer constant into every element of the destination register."],["VMVN","Vector Bitwise NOT (register) takes a value from a register, inverts the value of each bit, and places the result in the destination register. The registers can be either doubleword or quadword."],["VNEG","Vector Negate negates each element in a vector, and places the results in a second vector. The floating-point version only inverts the sign bit."],["VNMLA","Vector Negate Multiply Accumulate multiplies together two floating-point register values, adds the negation of the floating-point value in the destination register to the negation of the product, and writes the result back to the destination register."],["VNMLS","Vector Negate Multiply Subtract multiplies together two floating-point register values, adds the negation of the floating-point value in the destination register to the product, and writes the result back to the destination register."],["VNMUL","Vector Negate Multiply multiplies together two floating-point register values, and writes the negation of the result to the destination register."],["VORN","Vector bitwise OR NOT (register) performs a bitwise OR NOT operation between two registers, and places the result in the destination register.  The operand and result registers can be quadword or doubleword.  They must all be the same size."],["VORR","Vector Bitwise OR (immediate) performs a bitwise OR between a register value and an immediate value, and returns the result into the destination vector."],["VORR","Vector bitwise OR (register) performs a bitwise OR operation between two registers, and places the result in the destination register. The operand and result registers can be quadword or doubleword. They must all be the same size."],["VPADAL","Vector Pairwise Add and Accumulate Long adds adjacent pairs of elements of a vector, and accumulates the results into the elements of the destination vector."],["VPADD","Vector Pairwise Add (floating-point) adds adjacent pairs of elements of two vectors, and places the results in the destination vector."],["VPADD","Vector Pairwise Add (integer) adds adjacent pairs of elements of two vectors, and places the results in the destination vector."],["VPADDL","Vector Pairwise Add Long adds adjacent pairs of elements of two vectors, and places the results in the destination vector."],["VPMAX","Vector Pairwise Maximum compares adjacent pairs of elements in two doubleword vectors, and copies the larger of each pair into the corresponding element in the destination doubleword vector."],["VPMAX","Vector Pairwise Maximum compares adjacent pairs of elements in two doubleword vectors, and copies the larger of each pair into the corresponding element in the destination doubleword vector."],["VPMIN","Vector Pairwise Minimum compares adjacent pairs of elements in two doubleword vectors, and copies the smaller of each pair into the corresponding element in the destination doubleword vector."],["VPMIN","Vector Pairwise Minimum compares adjacent pairs of elements in two doubleword vectors, and copies the smaller of each pair into the corresponding element in the destination doubleword vector."],["VQABS","Vector Saturating Absolute takes the absolute value of each element in a vector, and places the results in the destination vector."],["VQADD","Vector Saturating Add adds the values of corresponding elements of two vectors, and places the results in the destination vector."],["VQDMLAL","Vector Saturating Doubling Multiply Accumulate Long multiplies corresponding elements in two doubleword vectors, doubles the products, and accumulates the results into the elements of a quadword vector."],["VQDMLSL","Vector Saturating Doubling Multiply Subtract Long multiplies corresponding elements in two doubleword vectors, subtracts double the products from corresponding elements of a quadword vector, and places the results in the same quadword vector."],["VQDMULH","Vector Saturating Doubling Multiply Returning High Half multiplies corresponding elements in two vectors, doubles the results, and places the most significant half of the final results in the destination vector. The results are truncated, for rounded results see VQRDMULH."],["VQDMULL","Vector Saturating Doubling Multiply Long multiplies corresponding elements in two doubleword vectors, doubles the products, and places the results in a quadword vector."],["VQMOVN","Vector Saturating Move and Narrow copies each element of the operand vector to the corresponding element of the destination vector."],["VQNEG","Vector Saturating Negate negates each element in a vector, and places the results in the destination vector."],["VQRDMLAH","Vector Saturating Rounding Doubling Multiply Accumulate Returning High Half. This instruction multiplies the vector elements of the first source SIMD&FP register with either the corresponding vector elements of the second source SIMD&FP register or the value of a vector element of the second source SIMD&FP register, without saturating the multiply results, doubles the results, and accumulates the most significant half of the final results with the vector elements of the destination SIMD&FP register. The results are rounded."],["VQRDMLSH","Vector Saturating Rounding Doubling Multiply Subtract Returning High Half. This instruction multiplies the vector elements of the first source SIMD&FP register with either the corresponding vector elements of the second source SIMD&FP register or the value of a vector element of the second source SIMD&FP register, without saturating the multiply results, doubles the results, and subtracts the most significant half of the final results from the vector elements of the destination SIMD&FP register. The results are rounded."],["VQRDMULH","Vector Saturating Rounding Doubling Multiply Returning High Half multiplies corresponding elements in two vectors, doubles the results, and places the most significant half of the final results in the destination vector. The results are rounded. For truncated results see VQDMULH."],["VQRSHL","Vector Saturating Rounding Shift Left takes each element in a vector, shifts them by a value from the least significant byte of the corresponding element of a second vector, and places the results in the destination vector. If the shift value is positive, the operation is a left shift. Otherwise, it is a right shift."],["VQRSHRN","Vector Saturating Rounding Shift Right, Narrow takes each element in a quadword vector of integers, right shifts them by an immediate value, and places the rounded results in a doubleword vector."],["VQSHL","Vector Saturating Shift Left (immediate) takes each element in a vector of integers, left shifts them by an immediate value, and places the results in a second vector."],["VQSHL","Vector Saturating Shift Left (register) takes each element in a vector, shifts them by a value from the least significant byte of the corresponding element of a second vector, and places the results in the destination vector. If the shift value is positive, the operation is a left shift. Otherwise, it is a right shift."],["VQSHRN","Vector Saturating Shift Right, Narrow takes each element in a quadword vector of integers, right shifts them by an immediate value, and places the truncated results in a doubleword vector."],["VQSUB","Vector Saturating Subtract subtracts the elements of the second operand vector from the corresponding elements of the first operand vector, and places the results in the destination vector. Signed and unsigned operations are distinct."],["VRADDHN","Vector Rounding Add and Narrow, returning High Half adds corresponding elements in two quadword vectors, and places the most significant half of each result in a doubleword vector. The results are rounded.  For truncated results, see VADDHN."],["VRECPE","Vector Reciprocal Estimate finds an approximate reciprocal of each element in the operand vector, and places the results in the destination vector."],["VRECPS","Vector Reciprocal Step multiplies the elements of one vector by the corresponding elements of another vector, subtracts each of the products from 2.0, and places the results into the elements of the destination vector."],["VREV16","Vector Reverse in halfwords reverses the order of 8-bit elements in each halfword of the vector, and places the result in the corresponding destination vector."],["VREV32","Vector Reverse in words reverses the order of 8-bit or 16-bit elements in each word of the vector, and places the result in the corresponding destination vector."],["VREV64","Vector Reverse in doublewords reverses the order of 8-bit, 16-bit, or 32-bit elements in each doubleword of the vector, and places the result in the corresponding destination vector."],["VRHADD","Vector Rounding Halving Add adds corresponding elements in two vectors of integers, shifts each result right one bit, and places the final results in the destination vector."],["VRINTA","Vector Round floating-point to integer towards Nearest with Ties to Away rounds a vector of floating-point values to integral floating-point values of the same size using the Round to Nearest with Ties to Away rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTA","Round floating-point to integer to Nearest with Ties to Away rounds a floating-point value to an integral floating-point value of the same size using the Round to Nearest with Ties to Away rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTM","Vector Round floating-point to integer towards -Infinity rounds a vector of floating-point values to integral floating-point values of the same size, using the Round towards -Infinity rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTM","Round floating-point to integer towards -Infinity rounds a floating-point value to an integral floating-point value of the same size using the Round towards -Infinity rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTN","Vector Round floating-point to integer to Nearest rounds a vector of floating-point values to integral floating-point values of the same size using the Round to Nearest rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTN","Round floating-point to integer to Nearest rounds a floating-point value to an integral floating-point value of the same size using the Round to Nearest rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTP","Vector Round floating-point to integer towards +Infinity rounds a vector of floating-point values to integral floating-point values of the same size using the Round towards +Infinity rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTP","Round floating-point to integer towards +Infinity rounds a floating-point value to an integral floating-point value of the same size using the Round towards +Infinity rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTR","Round floating-point to integer rounds a floating-point value to an integral floating-point value of the same size using the rounding mode specified in the FPSCR. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTX","Vector round floating-point to integer inexact rounds a vector of floating-point values to integral floating-point values of the same size, using the Round to Nearest rounding mode, and raises the Inexact exception when the result value is not numerically equal to the input value. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTX","Round floating-point to integer inexact rounds a floating-point value to an integral floating-point value of the same size, using the rounding mode specified in the FPSCR, and raises an Inexact exception when the result value is not numerically equal to the input value. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTZ","Vector round floating-point to integer towards Zero rounds a vector of floating-point values to integral floating-point values of the same size, using the Round towards Zero rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRINTZ","Round floating-point to integer towards Zero rounds a floating-point value to an integral floating-point value of the same size, using the Round towards Zero rounding mode. A zero input gives a zero result with the same sign, an infinite input gives an infinite result with the same sign, and a NaN is propagated as for normal arithmetic."],["VRSHL","Vector Rounding Shift Left takes each element in a vector, shifts them by a value from the least significant byte of the corresponding element of a second vector, and places the results in the destination vector. If the shift value is positive, the operation is a left shift. If the shift value is negative, it is a rounding right shift. For a truncating shift, see VSHL."],["VRSHR","Vector Rounding Shift Right takes each element in a vector, right shifts them by an immediate value, and places the rounded results in the destination vector. For truncated results, see VSHR."],["VRSHRN","Vector Rounding Shift Right and Narrow takes each element in a vector, right shifts them by an immediate value, and places the rounded results in the destination vector. For truncated results, see VSHRN."],["VRSQRTE","Vector Reciprocal Square Root Estimate finds an approximate reciprocal square root of each element in a vector, and places the results in a second vector."],["VRSQRTS","Vector Reciprocal Square Root Step multiplies the elements of one vector by the corresponding elements of another vector, subtracts each of the products from 3.0, divides these results by 2.0, and places the results into the elements of the destination vector."],["VRSRA","Vector Rounding Shift Right and Accumulate takes each element in a vector, right shifts them by an immediate value, and accumulates the rounded results into the destination vector.For truncated results, see VSRA."],["VRSUBHN","Vector Rounding Subtract and Narrow, returning High Half subtracts the elements of one quadword vector from the corresponding elements of another quadword vector, takes the most significant half of each result, and places the final results in a doubleword vector. The results are rounded. For truncated results, see VSUBHN."],["VSDOT","Dot Product vector form with signed integers. This instruction performs the dot product of the four 8-bit elements in each 32-bit element of the first source register with the four 8-bit elements of the corresponding 32-bit element in the second source register, accumulating the result into the corresponding 32-bit element of the destination register."],["VSDOT","Dot Product index form with signed integers. This instruction performs the dot product of the four 8-bit elements in each 32-bit element of the first source register with the four 8-bit elements of an indexed 32-bit element in the second source register, accumulating the result into the corresponding 32-bit element of the destination register."],["VSELEQ","Floating-point conditional select allows the destination register to take the value in either one or the other source register according to the condition codes in the APSR."],["VSHL","Vector Shift Left (immediate) takes each element in a vector of integers, left shifts them by an immediate value, and places the results in the destination vector."],["VSHL","Vector Shift Left (register) takes each element in a vector, shifts them by a value from the least significant byte of the corresponding element of a second vector, and places the results in the destination vector. If the shift value is positive, the operation is a left shift. If the shift value is negative, it is a truncating right shift."],["VSHLL","Vector Shift Left Long takes each element in a doubleword vector, left shifts them by an immediate value, and places the results in a quadword vector."],["VSHR","Vector Shift Right takes each element in a vector, right shifts them by an immediate value, and places the truncated results in the destination vector. For rounded results, see VRSHR."],["VSHRN","Vector Shift Right Narrow takes each element in a vector, right shifts them by an immediate value, and places the truncated results in the destination vector. For rounded results, see VRSHRN."],["VSLI","Vector Shift Left and Insert takes each element in the operand vector, left shifts them by an immediate value, and inserts the results in the destination vector. Bits shifted out of the left of each element are lost."],["VSMMLA","The widening integer matrix multiply-accumulate instruction multiplies the 2x8 matrix of signed 8-bit integer values held in the first source vector by the 8x2 matrix of signed 8-bit integer values in the second source vector. The resulting 2x2 32-bit integer matrix product is destructively added to the 32-bit integer matrix accumulator held in the destination vector. This is equivalent to performing an 8-way dot product per destination element."],["VSQRT","Square Root calculates the square root of the value in a floating-point register and writes the result to another floating-point register."],["VSRA","Vector Shift Right and Accumulate takes each element in a vector, right shifts them by an immediate value, and accumulates the truncated results into the destination vector. For rounded results, see VRSRA."],["VSRI","Vector Shift Right and Insert takes each element in the operand vector, right shifts them by an immediate value, and inserts the results in the destination vector. Bits shifted out of the right of each element are lost."],["VST1","Store single element from one lane of one register stores one element to memory from one element of a register. For details of the addressing mode see Advanced SIMD addressing mode."],["VST1","Store multiple single elements from one, two, three, or four registers stores elements to memory from one, two, three, or four registers, without interleaving.  Every element of each register is stored. For details of the addressing mode see Advanced SIMD addressing mode."],["VST2","Store single 2-element structure from one lane of two registers stores one 2-element structure to memory from corresponding elements of two registers. For details of the addressing mode see Advanced SIMD addressing mode."],["VST2","Store multiple 2-element structures from two or four registers stores multiple 2-element structures from two or four registers to memory, with interleaving. For more information, see Element and structure load/store instructions. Every element of each register is saved. For details of the addressing mode see Advanced SIMD addressing mode."],["VST3","Store single 3-element structure from one lane of three registers stores one 3-element structure to memory from corresponding elements of three registers. For details of the addressing mode see Advanced SIMD addressing mode."],["VST3","Store multiple 3-element structures from three registers stores multiple 3-element structures to memory from three registers, with interleaving. For more information, see Element and structure load/store instructions. Every element of each register is saved. For details of the addressing mode see Advanced SIMD addressing mode."],["VST4","Store single 4-element structure from one lane of four registers stores one 4-element structure to memory from corresponding elements of four registers. For details of the addressing mode see Advanced SIMD addressing mode."],["VST4","Store multiple 4-element structures from four registers stores multiple 4-element structures to memory from four registers, with interleaving. For more information, see Element and structure load/store instructions. Every element of each register is saved. For details of the addressing mode see Advanced SIMD addressing mode."],["VSTM","Store multiple SIMD&FP registers stores multiple registers from the Advanced SIMD and floating-point register file to consecutive memory locations using an address from a general-purpose register."],["VSTR","Store SIMD&FP register stores a single register from the Advanced SIMD and floating-point register file to memory, using an address from a general-purpose register, with an optional offset."],["VSUB","Vector Subtract (floating-point) subtracts the elements of one vector from the corresponding elements of another vector, and places the results in the destination vector."],["VSUB","Vector Subtract (integer) subtracts the elements of one vector from the corresponding elements of another vector, and places the results in the destination vector."],["VSUBHN","Vector Subtract and Narrow, returning High Half subtracts the elements of one quadword vector from the corresponding elements of another quadword vector, takes the most significant half of each result, and places the final results in a doubleword vector. The results are truncated. For rounded results, see VRSUBHN."],["VSUBL","Vector Subtract Long subtracts the elements of one doubleword vector from the corresponding elements of another doubleword vector, and places the results in a quadword vector. Before subtracting, it sign-extends or zero-extends the elements of both operands."],["VSUBW","Vector Subtract Wide subtracts the elements of a doubleword vector from the corresponding elements of a quadword vector, and places the results in another quadword vector. Before subtracting, it sign-extends or zero-extends the elements of the doubleword operand."],["VSUDOT","Dot Product index form with signed and unsigned integers. This instruction performs the dot product of the four signed 8-bit integer values in each 32-bit element of the first source register with the four unsigned 8-bit integer values in an indexed 32-bit element of the second source register, accumulating the result into the corresponding 32-bit element of the destination register."],["VSWP","Vector Swap exchanges the contents of two vectors. The vectors can be either doubleword or quadword. There is no distinction between data types."],["VTBL","Vector Table Lookup uses byte indexes in a control vector to look up byte values in a table and generate a new vector. Indexes out of range return 0."],["VTRN","Vector Transpose treats the elements of its operand vectors as elements of 2 x 2 matrices, and transposes the matrices."],["VTST","Vector Test Bits takes each element in a vector, and bitwise ANDs it with the corresponding element of a second vector. If the result is not zero, the corresponding element in the destination vector is set to all ones. Otherwise, it is set to all zeros."],["VUDOT","Dot Product vector form with unsigned integers. This instruction performs the dot product of the four 8-bit elements in each 32-bit element of the first source register with the four 8-bit elements of the corresponding 32-bit element in the second source register, accumulating the result into the corresponding 32-bit element of the destination register."],["VUDOT","Dot Product index form with unsigned integers. This instruction performs the dot product of the four 8-bit elements in each 32-bit element of the first source register with the four 8-bit elements of an indexed 32-bit element in the second source register, accumulating the result into the corresponding 32-bit element of the destination register."],["VUMMLA","The widening integer matrix multiply-accumulate instruction multiplies the 2x8 matrix of unsigned 8-bit integer values held in the first source vector by the 8x2 matrix of unsigned 8-bit integer values in the second source vector. The resulting 2x2 32-bit integer matrix product is destructively added to the 32-bit integer matrix accumulator held in the destination vector. This is equivalent to performing an 8-way dot product per destination element."],["VUSDOT","Dot Product vector form with mixed-sign integers. This instruction performs the dot product of the four unsigned 8-bit integer values in each 32-bit element of the first source register with the four signed 8-bit integer values in the corresponding 32-bit element of the second source register, accumulating the result into the corresponding 32-bit element of the destination register."],["VUSDOT","Dot Product index form with unsigned and signed integers. This instruction performs the dot product of the four unsigned 8-bit integer values in each 32-bit element of the first source register with the four signed 8-bit integer values in an indexed 32-bit element of the second source register, accumulating the result into the corresponding 32-bit element of the destination register."],["VUSMMLA","The widening integer matrix multiply-accumulate instruction multiplies the 2x8 matrix of unsigned 8-bit integer values held in the first source vector by the 8x2 matrix of signed 8-bit integer values in the second source vector. The resulting 2x2 32-bit integer matrix product is destructively added to the 32-bit integer matrix accumulator held in the destination vector. This is equivalent to performing an 8-way dot product per destination element."],["VUZP","Vector Unzip de-interleaves the elements of two vectors."],["VZIP","Vector Zip interleaves the elements of two vectors."],["WFE","Wait For Event is a hint instruction that indicates that the PE can enter a low-power state and remain there until a wakeup event occurs. Wakeup events include the event signaled as a result of executing the SEV instruction on any PE in the multiprocessor system. For more information, see Wait For Event and Send Event."],["WFI","Wait For Interrupt is a hint instruction that indicates that the PE can enter a low-power state and remain there until a wakeup event occurs. For more information, see Wait For Interrupt."],["YIELD","YIELD is a hint instruction. Software with a multithreading capability can use a YIELD instruction to indicate to the PE that it is performing a task, for example a spin-lock, that could be swapped out to improve overall system performance. The PE can use this hint to suspend and resume multiple software threads if it supports the capability."]],"lengths":[64,68,54,49,53,46,52,62,35,9,9,9,7,57,61,47,39,73,11,33,37,64,68,54,17,46,77,19,28,44,15,29,31,35,39,29,33,37,76,125,125,59,21,66,39,49,31,50,62,66,52,46,71,100,81,20,76,33,136,55,67,46,58,49,58,67,126,106,136,77,120,135,135,135,61,43,68,75,57,73,118,69,51,69,47,57,51,57,75,57,83,116,77,59,85,118,77,59,85,118,104,35,69,35,69,121,111,84,69,48,41,38,31,108,111,75,99,101,90,94,81,54,54,44,44,46,50,60,64,50,26,98,85,98,85,85,91,39,73,55,51,51,71,79,79,71,63,51,51,17,19,27,39,62,41,75,33,72,58,62,48,68,72,56,41,41,57,87,66,70,56,43,47,33,15,28,37,49,9,7,9,9,9,9,11,11,9,9,35,35,57,57,35,35,137,107,69,54,127,79,137,72,81,62,80,64,68,74,44,104,63,80,28,32,57,42,41,41,122,53,53,78,78,80,78,53,115,111,114,114,114,59,57,61,59,104,65,65,79,79,85,79,61,69,102,102,49,54,46,51,55,80,75,89,75,61,69,61,64,37,41,45,27,33,37,41,41,41,61,43,23,54,35,35,57,57,35,35,55,54,44,54,54,76,76,54,54,31,39,28,32,61,41,41,75,89,75,61,69,61,75,81,78,75,81,69,125,121,71,67,57,54,99,74,78,56,64,64,78,78,70,77,94,98,103,111,99,107,103,61,111,99,57,97,92,97,100,109,73,80,49,80,101,97,85,109,152,104,85,55,81,100,81,96,77,100,81,89,55,79,63,111,113,86,82,80,79,75,104,112,120,132,95,128,134,107,97,95,99,87,163,88,84,100,94,86,110,94,86,106,94,86,106,74,73,71,66,74,38,66,74,38,57,58,64,74,80,100,58,66,74,80,139,101,121,57,51,97,93,119,117,70,80,87,177,74,53,54,60,70,76,58,70,65,114,79,61,82,58,78,80,70,84,78,68,68,68,68,74,74,100,110,118,96,101,70,158,158,120,104,100,118,105,98,100,101,81,88,71,75,79,89,91,85,85,81,81,77,85,81,75,101,97,85,81,123,83,99,85,102,86,115,100,100,40,95,119,75,81,97,100,124,61,84,100,74,94,84,108,84,104,84,104,77,73,63,60,103,82,80,106,64,87,71,99,100,100,124,106,106,124,59,57,96,64,80],"postings":{"adc":[0,3,1,3,2,2],"add":[0,4,1,4,2,4,3,7,4,7,5,6,6,7,7,7,8,2,32,2,33,2,34,2,107,2,139,4,140,2,141,2,142,2,143,4,145,2,164,2,165,2,166,2,188,2,189,2,190,2,191,2,196,2,199,2,201,2,202,2,203,2,206,4,214,2,252,4,253,4,254,4,266,2,267,2,268,2,272,2,273,2,274,2,275,2,278,2,281,2,282,2,283,2,284,2,287,2,288,2,291,2,294,4,295,4,296,4,310,4,311,4,312,4,313,4,314,4,321,2,334,1,335,1,368,5,369,5,370,2,371,2,372,2,375,2,376,2,377,4,403,2,404,2,405,2,406,2,434,2,435,2,440,4,441,4,442,4,443,4,449,4,465,4,471,4],"carry":[0,4,1,4,2,4,156,2,157,3,161,4,162,4,163,2,168,4,169,4,170,4],"immediat":[0,4,3,4,6,4,8,2,13,4,16,4,17,4,21,4,25,1,32,4,35,4,48,4,56,1,66,4,67,2,74,4,75,2,77,4,78,2,80,2,81,4,82,2,84,2,88,4,89,2,91,2,92,4,93,2,95,2,96,4,97,2,99,2,100,2,101,4,102,4,103,4,104,4,109,4,112,2,118,9,119,1,121,4,125,4,127,4,131,2,154,2,155,2,158,4,161,4,168,4,218,2,231,4,233,4,235,2,236,4,238,2,242,4,244,2,245,2,246,4,249,4,251,1,259,4,263,4,316,4,394,2,395,2,415,4,431,4,438,4,460,2,461,4,463,2,486,2,487,2,490,2,495,4,497,2,498,2,499,2,500,2,503,2,504,2],"valu":[0,6,1,6,2,6,3,4,4,4,5,4,6,4,7,4,8,4,13,4,14,4,15,4,16,2,17,2,21,4,22,4,23,4,26,6,29,4,31,2,32,4,33,4,34,4,35,4,36,4,37,4,38,1,39,10,40,10,41,3,48,4,49,4,50,4,56,2,66,2,67,2,70,2,74,2,75,2,76,6,77,2,78,2,79,6,80,5,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,6,91,5,92,2,93,2,94,6,95,5,96,2,97,2,98,6,99,5,100,5,101,2,102,2,103,2,104,2,105,2,106,2,107,10,108,10,109,2,110,2,111,4,112,2,113,2,114,2,115,3,116,4,117,2,118,6,119,2,120,8,121,2,122,2,123,2,125,4,126,4,127,4,128,4,129,4,139,2,143,4,144,4,146,4,153,1,154,4,155,4,156,2,157,2,158,4,159,4,160,4,161,6,162,6,163,6,167,1,168,6,169,6,170,6,172,4,173,2,174,2,175,2,194,5,195,3,197,6,198,8,200,3,203,4,204,4,205,2,208,2,212,2,213,2,218,2,221,2,222,2,223,2,224,2,227,2,231,2,232,6,233,2,234,6,235,5,236,2,237,2,238,4,239,4,240,4,241,4,242,2,243,6,244,5,245,5,246,4,247,4,248,4,249,4,250,4,251,1,252,6,253,6,254,6,255,4,256,4,257,4,258,2,259,4,260,4,261,4,263,4,264,4,265,4,271,4,278,6,279,6,280,2,287,2,288,2,289,2,290,2,294,6,295,6,296,6,297,4,298,4,299,4,300,2,301,2,302,2,303,2,304,2,305,2,306,4,307,4,308,4,309,4,316,4,317,4,321,1,334,1,335,1,343,2,346,10,348,2,349,2,350,2,352,2,354,2,356,2,357,2,358,2,359,2,360,4,361,2,362,2,368,2,369,2,370,2,371,2,373,4,374,2,375,6,376,4,379,2,380,2,395,2,412,2,414,4,415,2,418,4,424,2,425,2,432,4,434,4,435,4,436,2,438,4,448,2,449,2,456,2,457,2,459,4,460,2,461,2,462,4,463,2,472,4,473,4,474,4,475,4,476,4,477,4,478,4,479,4,480,4,481,8,482,8,483,4,484,4,485,6,486,2,487,2,490,2,494,2,495,2,496,6,497,2,498,2,499,2,500,2,501,4,502,2,503,2,504,2,520,4,522,2,527,4,528,4,529,4,530,4],"flag":[0,3,1,3,2,4,3,1,4,1,5,2,6,1,7,1,13,1,14,1,15,2,17,3,21,1,22,1,23,2,29,2,32,2,33,2,34,2,35,2,36,2,37,2,48,1,49,1,50,2,58,3,102,3,104,3,107,1,109,1,110,1,111,2,120,1,121,1,122,1,123,2,125,2,126,2,127,1,128,1,129,2,155,3,156,2,157,6,158,1,159,1,160,2,161,3,162,3,163,4,168,3,169,3,170,4,172,2,173,2,197,1,208,1,246,1,247,1,248,2,249,1,250,1,259,2,260,2,261,2,263,2,264,2,265,2,271,2,279,1,280,1,336,4,337,4,380,1,424,4],"register":[0,7,1,11,2,12,3,7,4,11,5,12,6,5,7,9,8,2,13,7,14,11,15,12,16,4,17,7,19,4,20,4,21,7,22,11,23,12,26,6,27,2,28,1,29,2,32,2,33,6,34,10,35,2,36,6,37,10,39,2,40,2,48,7,49,11,50,12,51,2,53,7,54,7,56,1,59,2,60,2,61,2,62,2,63,2,64,2,65,2,66,8,67,6,68,12,69,7,70,15,71,12,72,12,73,12,74,6,75,4,76,14,77,6,78,4,79,12,80,10,81,6,82,4,83,10,84,6,85,6,86,6,87,6,88,6,89,4,90,12,91,10,92,6,93,4,94,12,95,10,96,6,97,4,98,12,99,10,100,10,101,4,102,7,103,4,104,7,105,12,106,12,107,8,108,8,109,5,110,9,111,10,112,2,113,12,114,12,115,6,116,15,117,15,118,2,119,9,120,6,121,5,122,9,123,10,125,4,126,8,127,7,128,11,129,12,133,2,136,9,138,7,139,4,140,2,141,2,142,2,143,6,144,6,145,2,146,6,147,2,148,2,149,2,150,2,151,2,152,2,153,3,154,2,155,5,156,2,157,5,158,7,159,11,160,12,161,7,162,11,163,12,164,2,165,2,166,2,167,2,168,7,169,11,170,12,171,4,172,6,188,2,189,2,190,2,191,2,192,2,193,2,195,6,198,4,200,6,205,2,206,2,207,6,209,6,210,2,214,2,216,2,217,2,218,8,219,2,220,2,221,2,222,2,223,2,224,2,225,2,226,10,227,13,228,10,229,10,230,10,231,6,232,12,233,6,234,12,235,10,236,6,237,10,238,6,239,6,240,6,241,6,242,6,243,12,244,10,245,10,246,7,247,11,248,12,249,5,250,9,251,1,252,6,253,6,254,6,255,4,256,4,257,4,258,4,259,2,260,6,261,10,263,2,264,6,265,10,266,2,267,2,268,2,269,4,271,6,272,2,273,2,274,2,275,2,276,2,277,2,278,2,281,2,282,2,283,2,284,2,285,2,286,2,291,2,292,2,293,2,294,6,295,6,296,6,297,4,298,4,299,4,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,7,316,3,317,9,318,9,319,9,320,1,321,3,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,4,335,5,336,5,337,5,338,1,340,1,341,1,342,1,343,5,344,3,345,1,346,6,347,1,348,5,349,3,350,6,351,1,352,5,353,1,354,5,355,1,356,5,357,5,358,3,359,6,360,3,363,6,364,1,365,7,366,1,367,1,370,5,371,7,372,1,373,5,374,7,375,9,376,7,377,1,378,1,379,5,380,5,381,7,382,3,383,7,384,7,385,5,386,7,387,7,388,5,389,7,390,7,391,5,392,7,393,9,394,9,395,7,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,17,414,13,415,5,416,5,417,7,418,13,419,7,420,15,421,1,422,1,423,5,424,13,425,9,426,1,427,1,428,1,429,1,430,1,431,3,432,9,433,1,434,7,435,7,436,5,437,9,438,3,439,9,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,9,457,9,458,1,459,1,461,1,462,2,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,492,6,493,6,494,4,495,1,496,3,497,1,498,1,499,1,500,1,502,5,503,1,504,1,505,5,506,7,507,5,508,7,509,5,510,7,511,5,512,7,513,9,514,9,515,1,516,1,517,1,518,1,519,1,520,6,521,1,522,1,523,1,524,1,525,6,526,6,528,6,529,6,531,1,532,1],"writ":[0,2,1,2,2,2,3,2,4,2,5,2,6,2,7,2,8,2,13,2,14,2,15,2,16,2,17,2,21,2,22,2,23,2,41,1,48,2,49,2,50,2,59,2,60,2,61,2,62,2,63,2,64,2,65,2,66,2,67,2,74,2,75,2,76,2,77,2,78,2,79,2,80,3,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,2,91,3,92,2,93,2,94,2,95,3,96,2,97,2,98,2,99,3,100,3,101,2,102,2,103,2,104,2,109,2,112,2,118,1,119,1,121,2,122,2,123,2,125,2,126,2,127,2,128,2,129,2,131,1,133,1,139,2,140,2,141,2,142,2,143,2,144,2,145,2,146,2,147,2,148,2,158,2,159,2,160,2,161,2,162,2,163,2,164,2,165,2,166,2,168,2,169,2,170,2,171,2,172,2,174,2,175,2,188,2,189,2,190,2,191,2,192,2,193,2,205,2,206,2,210,2,214,2,216,2,217,2,235,1,244,1,245,1,246,2,247,2,248,2,249,2,250,2,252,2,253,2,254,2,255,2,256,2,257,2,266,2,267,2,268,2,269,2,271,2,272,2,273,2,274,2,275,2,276,2,277,2,278,2,281,2,282,2,283,2,284,2,285,2,286,2,291,2,292,2,293,2,294,2,295,2,296,2,297,2,298,2,299,2,336,2,337,2,339,2,350,2,359,2,360,2,375,2,376,2,380,2,434,2,435,2,436,2,502,2],"result":[0,3,1,3,2,4,3,3,4,3,5,4,6,3,7,3,8,2,13,3,14,3,15,4,16,2,17,3,21,3,22,3,23,4,32,4,33,4,34,4,35,4,36,4,37,4,41,1,48,3,49,3,50,4,101,2,102,3,103,2,104,3,107,3,108,2,109,1,110,1,120,3,121,1,122,1,123,2,125,4,126,4,127,3,128,3,129,4,139,4,140,4,141,4,142,4,143,4,144,4,145,4,146,4,147,4,148,4,152,2,155,1,157,1,158,3,159,3,160,4,161,3,162,3,163,4,164,4,165,4,166,4,168,3,169,3,170,4,171,2,172,2,173,2,188,4,189,4,190,4,191,4,192,4,193,4,195,2,197,1,198,2,199,2,200,2,202,2,203,3,204,6,205,3,206,2,208,3,210,2,214,4,216,4,217,4,246,3,247,3,248,4,249,3,250,3,252,4,253,4,254,4,255,2,256,2,257,2,259,4,260,4,261,4,263,4,264,4,265,4,266,4,267,4,268,4,269,2,271,2,272,4,273,4,274,4,275,4,276,4,277,4,278,2,279,1,280,3,281,4,282,4,283,4,284,4,285,4,286,4,291,4,292,4,293,4,294,4,295,4,296,4,297,2,298,2,299,2,300,3,301,3,302,3,303,3,304,3,305,2,306,2,307,2,310,2,311,2,312,6,313,2,314,2,315,2,316,2,317,2,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,3,331,1,333,3,336,2,337,2,338,3,339,4,341,2,342,2,343,2,344,2,345,2,346,2,347,3,348,2,350,2,351,3,352,2,353,3,354,2,355,3,356,2,357,2,359,2,360,2,361,2,362,2,365,4,366,2,367,4,370,2,371,2,372,4,373,2,374,2,375,4,376,4,377,9,378,7,380,7,397,1,398,1,400,1,401,1,402,2,407,3,412,2,421,2,426,2,428,2,430,2,432,2,433,2,434,3,435,2,436,2,437,4,438,2,439,4,440,3,441,4,442,4,443,3,448,3,449,3,450,3,451,3,452,9,453,3,454,4,455,3,456,9,457,9,458,9,459,5,460,7,461,6,462,6,463,7,464,4,465,6,466,3,467,3,468,2,469,2,470,2,471,7,472,4,473,4,474,4,475,4,476,4,477,4,478,4,479,4,480,4,481,6,482,6,483,4,484,4,485,3,486,5,487,4,488,3,489,5,490,5,491,8,492,2,493,2,495,2,496,3,497,3,498,5,499,4,500,2,501,2,502,2,503,5,504,2,515,2,516,2,517,8,518,2,519,2,520,2,524,3,525,2,526,2,527,2,528,2,529,2,530,2,533,2],"destination":[0,5,1,5,2,2,3,5,4,5,5,2,6,5,7,5,8,2,13,5,14,5,15,2,16,2,17,5,20,2,21,5,22,5,23,2,48,5,49,5,50,2,101,2,102,5,103,2,104,5,107,2,108,2,109,5,110,5,111,2,112,2,119,1,120,2,121,5,122,5,123,2,125,2,126,2,127,5,128,5,129,2,139,2,140,2,141,2,142,2,143,2,144,2,145,2,146,2,147,2,148,2,155,3,157,3,158,5,159,5,160,2,161,5,162,5,163,2,164,2,165,2,166,2,168,5,169,5,170,2,171,2,172,2,188,2,189,2,190,2,191,2,192,2,193,2,195,2,200,2,205,2,206,2,207,2,209,2,210,2,214,2,216,2,217,2,246,5,247,5,248,2,249,5,250,5,252,2,253,2,254,2,255,2,256,2,257,2,266,2,267,2,268,2,269,2,271,2,272,2,273,2,274,2,275,2,276,2,277,2,281,2,282,2,283,2,284,2,285,2,286,2,291,2,292,2,293,2,294,2,295,2,296,2,297,2,298,2,299,2,300,2,301,2,302,2,303,2,304,2,306,2,307,2,308,2,309,2,310,2,311,2,315,2,316,2,317,2,318,4,319,4,320,4,322,2,323,2,324,2,325,2,326,2,327,2,328,2,329,2,331,2,332,2,334,1,335,1,346,2,350,2,361,2,362,2,363,3,364,3,365,2,366,2,367,2,368,2,369,2,370,2,371,2,372,4,373,2,374,2,375,4,376,4,377,2,378,2,379,2,380,2,396,2,397,2,399,2,400,2,402,2,403,2,404,2,405,4,406,4,407,4,408,2,409,2,410,4,411,4,412,4,415,2,423,2,426,2,429,2,430,2,431,2,432,2,434,4,435,4,436,2,437,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,448,2,449,2,452,2,454,2,455,2,456,2,457,2,458,2,459,2,462,2,464,2,466,2,467,2,468,2,469,2,470,2,471,2,485,2,486,2,487,3,489,2,490,2,492,2,493,2,494,2,495,2,496,2,498,2,499,3,500,2,501,4,503,2,504,2,515,2,516,2,520,2,522,1,524,2,525,2,526,2,527,4,528,2,529,2,530,4],"not":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,17,1,21,1,22,1,29,2,41,1,43,1,47,1,48,1,49,1,52,1,58,3,66,1,67,1,76,1,102,1,104,1,105,1,106,1,107,2,108,2,109,1,110,1,112,2,113,1,114,1,116,1,117,1,118,1,119,2,120,2,121,3,122,3,123,2,124,2,125,2,126,2,127,1,128,1,155,1,157,1,158,1,159,1,161,3,162,3,163,2,167,1,168,3,169,3,170,2,172,2,195,1,198,1,199,1,202,1,218,1,246,1,247,1,249,1,250,1,262,1,271,2,330,2,361,2,362,2,367,2,370,2,371,2,372,2,373,2,374,2,375,2,376,2,381,2,384,2,387,2,390,2,398,1,401,1,407,1,412,2,420,2,424,2,431,2,432,2,434,1,437,4,481,2,482,2,524,2],"pc":[0,3,1,3,3,3,4,3,6,3,7,3,8,6,13,3,14,3,17,3,21,3,22,3,25,3,41,1,48,3,49,3,67,2,68,3,69,2,70,2,71,3,72,3,73,3,75,2,78,2,82,2,89,2,93,2,97,2,102,3,104,3,109,3,110,3,121,3,122,3,127,3,128,3,136,3,138,1,155,3,157,3,158,3,159,3,161,3,162,3,168,3,169,3,226,1,228,1,229,1,230,1,246,3,247,3,249,3,250,3,258,2,395,2],"variant":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,21,1,22,1,48,1,49,1,53,4,109,1,110,1,121,1,122,1,127,1,128,1,158,1,159,1,161,1,162,1,168,1,169,1,246,1,247,1,249,1,250,1],"instruction":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,17,1,21,1,22,1,24,2,25,2,26,6,27,2,28,2,39,3,40,3,41,3,42,2,43,1,44,1,45,1,47,2,48,1,49,1,52,4,53,4,54,2,56,4,57,4,58,19,59,2,60,2,61,1,62,1,63,2,64,1,65,2,66,1,67,1,68,1,70,2,71,1,72,1,73,1,80,2,91,2,95,2,99,2,100,2,102,1,104,1,105,10,106,5,107,1,109,1,110,1,113,5,114,5,116,3,117,3,119,1,120,2,121,1,122,1,124,6,127,1,128,1,131,3,132,1,133,3,134,7,135,7,155,1,157,1,158,1,159,1,161,1,162,1,167,8,168,1,169,1,175,1,176,2,177,4,194,5,195,1,196,2,197,1,198,1,199,2,200,1,201,2,202,2,203,1,204,2,205,1,206,2,207,2,208,1,209,2,210,1,211,1,212,1,213,1,218,1,219,2,220,2,221,1,222,1,223,1,224,1,225,2,226,1,227,2,228,1,229,1,230,1,235,2,244,2,245,2,246,1,247,1,249,1,250,1,251,2,252,2,253,2,254,2,255,2,256,2,257,2,262,5,270,2,271,2,279,1,280,1,289,1,290,1,294,2,295,2,296,2,297,2,298,2,299,2,300,2,301,2,302,2,303,2,304,2,305,2,306,2,307,2,310,2,311,2,312,2,313,2,314,2,315,2,316,2,317,2,318,2,319,2,320,2,321,3,322,2,323,2,324,2,325,2,326,2,327,2,328,2,330,2,331,2,333,2,334,3,335,3,336,5,337,5,338,2,339,2,340,2,341,2,342,2,343,2,344,2,345,2,346,2,347,2,348,2,349,2,350,3,351,2,352,2,353,2,354,2,355,2,356,2,357,2,358,2,359,3,360,2,361,4,362,4,363,2,364,2,365,2,366,2,367,4,368,5,369,5,370,8,371,8,372,4,373,8,374,8,375,4,376,4,377,2,378,2,379,4,380,5,381,2,382,2,383,2,384,2,385,2,386,4,387,2,388,2,389,4,390,2,391,2,392,4,393,2,394,2,395,2,396,2,397,2,398,3,399,2,400,2,401,3,402,2,403,2,404,2,405,2,406,2,407,4,408,2,409,2,410,2,411,2,412,6,413,2,414,4,415,2,416,2,417,3,418,4,419,3,420,2,421,2,422,2,423,4,424,6,425,3,426,2,427,2,428,2,429,2,430,2,431,2,432,2,433,2,434,4,435,2,436,2,437,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,448,2,449,2,450,2,451,2,452,2,453,2,454,2,455,2,456,4,457,4,458,2,461,2,464,2,465,2,466,3,467,3,468,2,469,2,470,2,471,2,485,2,486,2,487,2,488,3,489,3,490,2,491,2,492,4,493,4,495,2,496,2,497,2,498,2,499,2,500,2,501,5,502,2,503,2,504,2,505,2,506,2,507,2,508,4,509,2,510,4,511,2,512,4,513,2,514,2,515,2,516,2,517,2,518,2,519,2,520,5,521,2,522,2,523,2,524,2,525,4,526,4,527,5,528,5,529,5,530,5,531,2,532,2,533,5,534,3,535,6],"updat":[0,1,1,1,2,2,3,1,4,1,5,2,6,1,7,1,13,1,14,1,15,2,17,1,21,1,22,1,23,2,32,2,33,2,34,2,35,2,36,2,37,2,48,1,49,1,50,2,52,2,102,1,104,1,107,1,109,1,110,1,111,2,118,1,119,1,120,1,121,1,122,1,123,2,125,2,126,2,127,1,128,1,129,2,136,2,138,2,155,1,157,1,158,1,159,1,160,2,161,1,162,1,163,2,168,1,169,1,170,2,178,2,180,2,181,2,182,2,183,2,184,2,185,2,186,2,187,2,197,1,208,1,246,1,247,1,248,2,249,1,250,1,259,2,260,2,261,2,263,2,264,2,265,2,279,1,280,1,361,2,362,2,412,2],"condition":[0,1,1,1,2,2,3,1,4,1,5,2,6,1,7,1,13,1,14,1,15,2,17,1,21,1,22,1,23,2,29,2,32,2,33,2,34,2,35,2,36,2,37,2,48,1,49,1,50,2,58,10,102,1,104,1,107,1,109,1,110,1,111,2,120,1,121,1,122,1,123,2,125,2,126,2,127,1,128,1,129,2,155,1,157,1,158,1,159,1,160,2,161,1,162,1,163,2,168,1,169,1,170,2,172,2,197,1,208,1,215,2,246,1,247,1,248,2,249,1,250,1,259,2,260,2,261,2,263,2,264,2,265,2,271,2,279,1,280,1,336,2,337,2,424,4,494,2],"bas":[0,1,1,1,2,2,3,1,4,1,5,2,6,1,7,1,13,1,14,1,15,2,17,1,21,1,22,1,23,2,32,2,33,2,34,2,35,2,36,2,37,2,48,1,49,1,50,2,66,2,68,4,69,4,70,6,71,4,72,4,73,4,74,2,76,2,77,2,79,2,80,5,81,2,83,2,84,2,85,2,86,2,87,2,88,2,90,2,91,5,92,2,94,2,95,5,96,2,98,2,99,5,100,5,102,1,104,1,107,1,109,1,110,1,111,2,120,1,121,1,122,1,123,2,125,2,126,2,127,1,128,1,129,2,153,3,155,1,157,1,158,1,159,1,160,2,161,1,162,1,163,2,168,1,169,1,170,2,197,1,208,1,218,2,226,4,227,6,228,4,229,4,230,4,231,2,232,2,233,2,234,2,235,5,236,2,237,2,238,2,239,2,240,2,241,2,242,2,243,2,244,5,245,5,246,1,247,1,248,2,249,1,250,1,258,2,259,2,260,2,261,2,263,2,264,2,265,2,279,1,280,1],"field":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,17,1,19,2,20,2,21,1,22,1,38,2,48,1,49,1,102,1,104,1,109,1,110,1,115,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1,171,2,246,1,247,1,249,1,250,1,251,1,269,2,322,1,323,1,324,1,325,1,326,1,327,1,328,1,331,1,338,1,363,1,364,1,366,1,524,1],"description":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,17,1,21,1,22,1,48,1,49,1,68,1,71,1,72,1,73,1,102,1,104,1,105,1,106,1,109,1,110,1,113,1,114,1,121,1,122,1,127,1,128,1,136,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1,246,1,247,1,249,1,250,1],"rd":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,17,1,21,1,22,1,48,1,49,1,102,1,104,1,109,1,110,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1,246,1,247,1,249,1,250,1],"identify":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,17,1,21,1,22,1,48,1,49,1,102,1,104,1,105,1,106,1,109,1,110,1,113,1,114,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1,246,1,247,1,249,1,250,1,251,1],"encod":[0,2,1,2,3,1,4,1,6,1,7,2,13,2,14,2,17,2,21,2,22,2,48,2,49,2,68,1,71,1,72,1,73,1,102,2,104,2,105,2,106,2,109,2,110,1,113,2,114,2,121,2,122,2,127,2,128,2,136,1,138,1,155,2,157,2,158,2,159,2,161,2,162,2,168,2,169,2,226,1,228,1,229,1,230,1,246,1,247,1,249,1,250,1,270,1],"wher":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,17,1,21,1,22,1,48,1,49,1,102,1,104,1,109,1,110,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,167,1,168,1,169,1,246,1,247,1,249,1,250,1],"permit":[0,1,1,1,3,1,4,1,6,1,7,1,13,1,14,1,17,1,21,1,22,1,41,1,48,1,49,1,58,2,66,2,67,2,68,1,70,1,71,1,72,1,73,1,102,1,104,1,105,1,106,1,109,1,110,1,113,1,114,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1,218,2,226,1,227,1,228,1,229,1,230,1,246,1,247,1,249,1,250,1,424,2,425,1],"arm":[0,1,1,1,7,1,13,1,14,1,17,1,21,1,22,1,42,2,48,1,49,1,52,1,53,1,54,1,102,1,104,1,109,1,115,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1,407,1,412,1,434,1],"deprecat":[0,1,1,1,7,1,13,1,14,1,17,1,21,1,22,1,42,2,48,1,49,1,53,1,54,1,58,1,102,1,104,1,109,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1],"any":[0,1,1,1,7,1,13,1,14,1,17,1,19,4,20,4,21,1,22,1,38,2,41,1,42,2,43,1,44,1,45,1,47,1,48,1,49,1,58,3,102,1,104,1,109,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,167,4,168,1,169,1,171,4,211,1,269,4,330,1,333,1,334,1,335,1,337,1,346,1,364,1,377,1,378,1,397,1,400,1,422,1,424,1,448,1,449,1,450,1,451,1,452,1,453,1,454,2,455,1,456,1,457,1,458,1,459,2,460,2,461,2,462,2,463,2,464,2,471,1,485,1,486,1,490,1,496,1,498,1,503,1,524,1,533,2],"use":[0,1,1,1,7,1,13,1,14,1,17,1,21,1,22,1,42,2,48,1,49,1,53,1,54,1,56,3,58,2,66,2,74,2,77,2,80,3,81,2,83,2,88,2,91,3,92,2,95,3,96,2,99,3,100,3,102,1,104,1,107,1,109,1,120,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,167,1,168,1,169,1,197,1,208,1,218,2,231,2,233,2,235,3,236,2,237,2,242,2,244,3,245,3,251,2,279,1,280,1,339,1,342,2,345,2,346,2,368,1,369,1,407,1,434,1,522,2,535,5],"thes":[0,1,1,1,7,1,13,1,14,1,17,1,21,1,22,1,48,1,49,1,102,1,104,1,105,1,106,1,107,2,108,2,109,1,113,1,114,1,120,2,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1,195,2,198,2,207,2,251,1,336,2,337,2,368,2,369,2,373,2,407,1,424,1,425,1,434,1,489,2],"however":[0,1,1,1,6,1,7,1,13,1,14,1,17,1,21,1,22,1,48,1,49,1,102,1,104,1,109,1,121,1,122,1,127,1,128,1,155,1,157,1,158,1,159,1,161,1,162,1,168,1,169,1,247,1,270,1],"optionally":[1,2,2,2,4,2,5,2,7,2,14,2,15,2,22,2,23,2,33,2,36,2,38,2,49,2,50,2,68,2,69,2,71,2,72,2,73,2,76,2,79,2,80,1,100,1,107,1,111,2,120,1,123,2,125,2,126,4,128,2,129,2,153,1,159,2,160,2,162,2,163,2,169,2,170,2,196,1,197,1,199,1,201,1,202,1,203,1,204,1,205,1,206,1,208,1,210,1,212,2,226,2,228,2,229,2,230,2,232,2,234,2,235,1,245,1,247,2,248,2,250,2,260,2,264,2,279,1,280,1,289,2],"shift":[1,2,2,4,4,2,5,4,7,2,14,2,15,4,16,6,17,6,22,2,23,4,33,2,34,4,36,2,37,4,49,2,50,4,76,2,79,2,80,1,90,2,94,2,98,2,100,1,101,6,102,6,103,6,104,6,111,4,123,4,126,2,128,2,129,4,130,2,156,4,157,5,159,2,160,4,162,2,163,4,169,2,170,4,204,2,212,2,232,2,234,2,235,1,243,2,245,1,247,2,248,4,250,2,260,2,261,4,264,2,265,4,289,2,377,2,378,2,459,10,460,4,461,4,462,10,463,4,471,2,485,14,486,4,487,4,490,4,495,5,496,13,497,4,498,4,499,4,500,6,503,4,504,6],"can":[2,2,5,2,15,2,23,2,39,2,40,2,41,1,50,2,52,2,56,2,58,3,66,3,67,1,68,3,69,2,71,3,72,3,73,3,74,2,76,2,77,2,79,2,80,1,81,2,83,2,88,2,90,2,91,1,92,2,94,2,95,1,96,2,98,2,99,1,100,1,105,1,106,1,107,1,111,2,113,1,114,1,120,1,123,2,124,3,125,2,126,2,129,2,131,2,132,2,133,2,134,2,135,2,136,1,153,1,160,2,163,2,170,2,177,2,194,1,196,1,197,1,199,1,200,1,201,1,202,1,203,1,204,1,205,1,206,1,208,1,210,1,218,3,226,2,228,2,229,2,230,2,231,2,232,2,233,2,234,2,235,1,236,2,237,2,242,2,243,2,244,1,245,1,248,2,251,1,252,2,253,2,254,2,255,2,256,2,257,2,279,1,280,1,294,2,295,2,296,2,297,2,298,2,299,2,306,1,307,1,312,1,330,1,333,1,339,1,346,3,350,1,359,1,363,1,364,1,365,2,368,1,369,1,377,1,378,1,380,1,397,1,400,1,407,1,412,1,419,2,422,1,432,2,434,1,437,2,439,2,440,2,442,1,443,2,450,1,451,1,452,1,453,1,454,2,458,1,459,1,460,2,461,2,462,1,463,2,464,1,465,1,466,1,471,1,485,1,486,1,487,1,488,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,503,1,504,1,521,2,523,1,524,1,531,1,532,1,533,3,534,3,535,4],"sp":[6,4,7,4,116,1,117,1,136,4,138,4,249,4,250,4],"adr":[8,1],"form":[8,4,60,2,62,2,64,2,65,2,76,1,77,2,78,2,79,2,80,2,85,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,115,1,118,1,120,1,424,2,492,2,493,2,520,2,525,2,526,2,528,2,529,2],"relativ":[8,4,25,3,258,2],"address":[8,4,18,2,25,6,26,2,27,2,28,1,51,3,53,2,54,2,66,4,67,2,68,9,69,6,70,2,71,9,72,9,73,9,74,4,75,2,76,2,77,4,78,2,79,2,80,5,81,4,82,2,83,4,84,2,85,2,86,2,87,2,88,4,89,2,90,2,91,5,92,4,93,2,94,2,95,5,96,4,97,2,98,2,99,5,100,5,131,4,132,4,133,4,134,4,135,4,136,5,137,2,138,4,153,4,215,2,218,4,221,2,222,2,223,2,224,2,226,8,227,2,228,8,229,8,230,8,231,4,232,2,233,4,234,2,235,5,236,4,237,4,238,6,239,6,240,6,241,6,242,4,243,2,244,5,245,5,381,4,382,4,383,4,384,4,385,4,386,4,387,4,388,4,389,4,390,4,391,4,392,4,393,2,394,2,395,2,505,4,506,4,507,4,508,4,509,4,510,4,511,4,512,4,513,2,514,2],"aesd":[9,1],"aes":[9,2,10,3,11,2,12,2],"singl":[9,2,10,2,258,2,339,4,340,2,341,6,349,2,350,7,358,2,359,7,361,4,362,4,364,2,368,4,369,4,381,2,382,2,383,2,384,2,385,2,387,2,388,2,390,2,391,2,394,2,395,2,412,4,417,1,419,1,420,4,505,2,506,2,507,2,509,2,511,2,514,2],"round":[9,2,10,2,203,1,204,1,205,1,312,2,334,1,335,1,339,2,342,4,343,6,344,2,345,4,346,4,347,6,348,6,350,1,351,6,352,6,353,6,354,6,355,6,356,6,357,2,359,1,367,2,368,3,369,3,370,2,371,2,372,2,373,2,374,2,375,2,376,2,377,2,378,2,380,6,407,5,434,5,452,2,456,4,457,4,458,4,459,2,460,4,462,1,463,1,465,4,471,3,472,8,473,8,474,8,475,8,476,8,477,8,478,8,479,8,480,6,481,8,482,6,483,8,484,8,485,4,486,4,487,4,490,4,491,4,496,1,498,2,499,2,503,2,517,2],"decryption":[9,2],"encryption":[10,2],"aesimc":[11,1],"invers":[11,2,58,2,121,2,122,2,123,2,431,2],"mix":[11,2,12,2,528,2],"column":[11,2,12,2],"aesmc":[12,1],"and":[13,2,14,2,15,1,524,2],"bitwis":[13,4,14,4,15,4,21,4,22,4,23,4,48,4,49,4,50,4,121,4,122,4,123,4,125,4,126,4,127,4,128,4,129,4,259,2,260,2,261,2,263,2,264,2,265,2,315,4,316,4,317,4,318,2,319,2,320,2,365,4,431,4,432,2,437,4,438,4,439,4,524,2],"perform":[13,2,14,2,15,2,21,2,22,2,23,2,39,4,40,4,48,2,49,2,50,2,125,2,126,2,127,2,128,2,129,2,140,2,141,2,142,2,145,2,147,2,148,2,164,2,165,2,166,2,188,2,189,2,190,2,191,2,192,2,193,2,195,2,196,3,199,3,200,2,201,3,202,3,206,3,210,3,214,2,216,2,217,2,221,2,222,2,223,2,224,2,238,2,239,2,240,2,241,2,259,2,260,2,261,2,263,2,264,2,265,2,266,2,267,2,268,2,272,2,273,2,274,2,275,2,276,2,277,2,281,2,282,2,283,2,284,2,285,2,286,2,287,2,288,2,291,2,292,2,293,2,315,2,316,2,317,2,321,1,334,2,335,2,365,2,368,1,369,1,412,2,437,2,438,2,439,2,466,1,467,1,488,1,489,1,492,2,493,2,501,2,520,2,525,2,526,2,527,2,528,2,529,2,530,2,535,2],"asr":[16,1,17,1],"arithmetic":[16,2,17,2,196,1,199,1,201,1,202,1,206,1,210,1,350,1,359,1,427,1,429,1,472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2],"right":[16,4,17,4,103,4,104,4,154,4,155,4,156,4,157,4,377,2,378,2,459,2,460,4,462,2,463,4,471,2,485,2,486,4,487,4,490,4,496,2,498,4,499,4,503,4,504,6],"number":[16,2,17,2,19,2,20,4,31,2,68,2,71,2,72,2,73,2,101,2,102,2,103,2,104,2,136,2,138,2,171,2,226,2,228,2,229,2,230,2,269,2,302,1,306,1,307,1,321,4,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,2,331,1,333,2,334,4,335,5,338,2,342,1,345,1,347,1,351,1,353,1,355,1,368,4,369,4,396,1,398,2,399,1,401,2,420,2,441,1,466,1,467,1,488,1,489,1],"bit":[16,4,17,4,19,6,20,6,21,2,22,2,23,2,26,6,31,4,38,4,39,4,40,4,58,1,60,2,62,2,64,2,65,2,77,2,78,2,79,2,80,2,85,2,86,2,87,2,88,2,89,2,90,4,91,2,92,2,93,2,94,4,95,2,96,2,97,2,98,4,99,2,101,2,102,2,103,2,104,2,107,4,108,4,115,1,118,6,119,4,120,4,139,2,140,4,141,4,142,6,143,2,144,2,145,6,146,2,147,4,148,4,149,6,150,2,151,4,152,6,154,4,155,4,156,2,157,3,164,2,165,2,166,4,171,6,172,4,188,2,189,2,190,4,191,4,192,2,193,2,194,2,195,6,196,4,197,6,198,13,199,5,200,16,201,4,202,5,203,4,204,8,205,6,206,2,207,4,208,4,209,14,210,2,213,2,214,4,216,2,217,2,240,2,243,2,252,8,253,10,254,8,255,8,256,8,257,8,266,2,267,2,268,4,269,6,271,4,272,2,273,2,274,4,275,4,276,2,277,2,278,8,279,6,280,4,281,4,282,4,283,6,284,6,285,4,286,4,287,2,288,4,290,2,291,4,292,2,293,2,294,8,295,10,296,8,297,8,298,8,299,8,305,2,312,3,316,2,317,2,318,6,319,6,320,6,330,13,333,5,338,6,339,3,343,3,344,3,346,4,348,2,350,5,352,2,354,2,356,2,357,3,359,5,361,2,362,2,363,4,364,3,366,1,368,3,369,3,377,2,378,2,379,10,380,6,412,6,414,16,418,6,420,2,422,3,423,10,432,2,433,2,440,3,442,3,443,3,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,459,1,460,1,461,1,462,1,463,1,464,1,465,3,468,2,469,4,470,6,471,2,487,3,491,3,492,10,493,10,495,5,499,3,500,6,501,8,504,6,520,10,523,3,524,2,525,10,526,10,527,8,528,10,529,10,530,8,531,3,532,3],"copy":[16,2,17,2,20,2,105,2,106,2,110,2,111,2,113,2,114,2,379,2,396,2,397,2,399,2,400,2,413,4,414,2,415,2,416,4,417,4,418,2,419,4,420,2,422,2,423,2,444,2,445,2,446,2,447,2,454,2],"sign":[16,2,17,2,92,4,93,4,94,4,95,4,96,4,97,4,98,4,99,4,107,2,108,2,120,2,139,2,140,2,141,2,142,2,143,2,144,2,145,2,146,2,147,2,148,2,152,4,164,4,165,4,166,2,171,4,172,6,188,4,189,4,190,6,191,6,192,4,193,4,195,6,196,4,197,4,198,8,199,4,200,10,201,4,202,4,203,4,204,4,205,4,206,4,207,4,208,4,209,8,210,4,212,6,213,6,214,2,216,4,217,4,252,4,253,4,254,4,255,4,256,4,257,4,289,2,290,2,305,2,312,1,313,2,314,2,324,1,325,1,326,1,327,1,328,1,330,3,331,1,333,1,342,1,345,1,346,4,347,1,351,1,353,1,355,1,380,8,419,4,421,2,422,1,433,2,442,1,454,2,459,1,460,2,461,2,462,1,463,2,464,2,465,1,472,4,473,4,474,4,475,4,476,4,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4,485,1,487,1,491,1,492,2,493,2,495,1,496,1,499,1,501,4,517,1,518,2,519,2,520,4,528,4,529,4,530,2],"set":[17,2,25,5,26,6,27,2,28,1,39,1,40,1,53,1,54,1,58,1,102,2,104,2,120,1,139,2,143,2,144,2,146,2,155,2,157,2,164,2,165,2,166,2,174,2,175,2,195,1,196,1,200,1,201,1,206,1,212,1,213,1,214,2,216,2,217,2,266,2,267,2,268,2,289,1,290,1,291,2,292,2,293,2,300,1,301,1,302,1,303,1,304,1,305,1,306,5,307,5,308,4,309,4,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,3,321,1,322,5,323,5,324,5,325,5,326,5,327,5,328,5,329,4,330,1,331,5,332,4,333,1,334,1,335,1,336,1,337,1,338,3,339,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,350,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,359,1,360,1,363,1,364,1,365,1,366,1,367,1,368,1,369,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,3,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,4,425,2,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,2,449,2,450,2,451,2,452,2,453,2,454,2,455,2,456,2,457,2,458,2,459,1,460,1,461,2,462,1,463,1,464,2,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,501,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,520,1,521,1,522,1,523,1,524,5,527,1,528,1,529,1,530,1,531,1,532,1],"b":[18,1],"branch":[18,4,25,3,26,6,27,4,28,5,29,6,41,1,51,1,58,2,68,2,69,1,71,2,72,2,73,2,136,2,258,6],"caus":[18,2,24,2,27,2,28,1,55,2,56,2,68,1,71,1,72,1,73,1,136,1,167,1,176,2,177,2,194,2,251,3,258,2,339,1,350,1,359,1,368,1,369,1,533,1,534,1],"target":[18,2,58,2],"bfc":[19,1],"clear":[19,4,21,2,22,2,23,2,30,4,305,2,316,2,317,2,423,2],"adjacent":[19,2,20,2,171,2,269,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2],"position":[19,2,20,2,154,2,155,2,171,2,269,2],"without":[19,2,38,2,58,1,177,2,334,1,335,1,368,1,369,1,383,2,456,2,457,2,506,2],"affect":[19,2,29,2,58,1,107,1,112,2,120,1,172,2,197,1,208,1,271,2,279,1,280,1],"other":[19,2,38,2,41,1,58,2,66,1,67,1,70,2,105,2,106,2,113,2,114,2,130,2,177,2,195,2,198,2,200,2,207,2,209,2,210,2,218,1,227,2,368,1,369,1,398,1,401,1,468,1,469,1,470,1,494,2],"bfi":[20,1],"insert":[20,2,154,2,155,2,318,4,319,4,500,4,504,4],"low":[20,2,346,1,533,3,534,3],"order":[20,2,39,2,40,2,41,1,46,2,47,1,59,2,60,2,61,1,62,1,63,1,64,1,65,2,68,1,70,1,71,1,72,1,73,1,149,2,150,2,151,2,152,2,167,3,219,2,220,2,221,1,222,1,223,1,224,1,225,2,226,1,227,1,228,1,229,1,230,1,346,1,468,2,469,2,470,2],"sam":[20,2,58,2,137,2,215,2,300,1,301,1,302,1,303,1,304,1,306,2,307,2,322,2,323,2,324,2,325,2,326,2,327,2,328,2,330,3,331,2,333,1,342,1,345,1,347,1,351,1,353,1,355,1,365,2,377,1,378,1,397,1,400,1,437,2,439,2,442,1,451,2,459,2,460,1,461,2,462,2,463,1,464,1,466,1,471,1,472,6,473,6,474,6,475,6,476,6,477,6,478,6,479,6,480,6,481,6,482,6,483,6,484,6,485,2,486,1,488,1,490,1,495,1,496,2,498,1,500,1,503,1,504,1,522,1,524,1],"bic":[21,3,22,3,23,2],"complement":[21,2,22,2,23,2,125,2,126,2,316,2,317,2],"bkpt":[24,1],"breakpoint":[24,5,55,5],"exception":[24,2,43,2,44,2,45,4,51,3,52,3,56,6,58,2,66,1,67,1,68,1,69,3,71,1,72,1,73,1,105,1,106,1,113,1,114,1,153,2,194,8,218,1,251,7,270,2,336,1,337,1,339,2,350,3,359,3,361,2,362,2,368,2,369,2,380,5,412,2,424,1,481,2,482,2,533,1,534,1],"alway":[24,1,55,1,485,1,496,1],"unconditional":[24,1,55,1],"even":[24,1,55,1,124,1,368,2,369,2],"insid":[24,1,55,1],"block":[24,1,55,1,58,12],"bl":[25,1],"blx":[25,1,26,1],"link":[25,3,26,2],"call":[25,3,26,2,56,9,194,7,251,10],"subroutin":[25,3,26,2],"lr":[25,3,116,1,117,1,211,2],"return":[25,3,31,2,39,2,40,2,51,7,58,2,68,1,69,3,71,1,72,1,73,1,115,1,153,4,211,2,221,2,222,2,223,2,224,2,238,2,239,2,240,2,241,2,258,2,312,2,316,2,398,1,401,1,438,2,452,2,456,2,457,2,458,2,465,2,491,2,517,2,522,2],"exchang":[25,1,26,2,27,2,28,4,142,4,145,4,166,4,190,4,191,4,196,1,199,1,201,1,202,1,206,1,210,1,214,4,268,4,274,4,275,4,283,4,284,4,291,4,521,2],"chang":[25,1,26,2,38,7,43,3,44,2,45,2,58,2,118,1,119,1,194,1,407,1,434,1],"a32":[25,2,26,2,39,1,40,1,80,1,91,1,95,1,99,1,100,1,107,1,197,1,208,1,235,1,244,1,245,1,279,1,280,1,501,1,520,1,527,1,528,1,529,1,530,1],"t32":[25,2,26,2,39,1,40,1,76,1,80,1,91,1,95,1,99,1,100,1,120,1,235,1,244,1,245,1,501,1,520,1,527,1,528,1,529,1,530,1],"specifi":[26,2,27,2,28,1,58,1,116,2,117,2,131,4,132,4,133,4,134,4,135,4,211,3,335,1,344,2,357,2,371,2,374,2,424,3,480,2,482,2],"necessary":[26,2],"indicat":[26,2,39,1,40,1,370,1,371,1,373,1,374,1,492,1,493,1,501,1,520,1,525,1,526,1,527,1,528,1,529,1,530,1,533,2,534,2,535,2],"0":[26,8,90,2,94,2,98,2,115,1,157,1,182,2,186,2,194,2,221,2,222,2,223,2,224,2,238,2,239,2,240,2,241,2,243,2,252,2,253,2,254,2,255,2,256,2,257,2,281,2,282,2,283,2,284,2,285,2,286,2,294,2,295,2,296,2,297,2,298,2,299,2,318,2,424,2,427,1,429,1,467,2,489,4,522,2],"after":[26,4,41,1,53,2,68,2,71,2,167,1,226,2,228,2],"will":[26,4,412,1],"1":[26,2,39,1,40,1,90,2,94,2,98,2,139,4,140,2,141,2,142,2,143,4,144,4,145,2,146,4,147,2,148,2,183,2,184,2,187,2,194,2,195,1,196,1,200,1,201,1,206,1,212,1,213,1,221,2,222,2,223,2,224,2,238,2,239,2,240,2,241,2,243,2,281,2,282,2,283,2,284,2,285,2,286,2,289,1,290,1,319,2,320,2,381,2,382,2,383,2,424,1,427,1,429,1],"bx":[27,1,28,2],"bxj":[28,2],"previously":[28,2,251,1],"jazell":[28,2],"armv8":[28,1,39,2,40,2,42,2,52,2,68,1,70,1,71,1,72,1,73,1,226,1,227,1,228,1,229,1,230,1,270,1,370,3,371,3,373,3,374,3,492,3,493,3,501,1,520,1,525,3,526,3,527,1,528,1,529,1,530,1],"behav":[28,1,52,1],"see":[28,1,38,1,43,1,44,1,45,1,46,2,47,2,51,1,52,1,53,1,54,1,56,3,57,2,59,2,60,2,61,2,62,2,63,2,64,2,65,2,66,3,67,3,68,3,70,1,71,3,72,3,73,3,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,100,2,105,2,106,2,113,2,114,2,115,1,116,1,117,1,118,1,119,1,131,1,132,1,133,1,134,1,135,1,136,2,138,1,153,1,176,2,194,3,211,3,218,3,219,2,220,2,221,2,222,2,223,2,224,2,225,2,226,3,227,1,228,3,229,3,230,3,231,2,232,2,233,2,234,2,235,2,236,2,237,2,238,2,239,2,240,2,241,2,242,2,243,2,244,2,245,2,251,3,271,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,3,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,2,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,3,378,1,379,1,380,2,381,3,382,3,383,3,384,3,385,3,386,5,387,3,388,3,389,5,390,3,391,3,392,5,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,2,405,1,406,2,407,1,408,1,409,2,410,1,411,2,413,1,414,1,415,1,416,1,417,2,418,1,419,2,420,1,421,1,422,1,423,1,424,2,425,1,426,1,427,2,428,2,429,2,430,2,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,2,449,2,450,3,451,3,452,5,453,3,454,2,455,2,456,2,457,2,458,5,459,2,460,2,461,2,462,2,463,2,464,2,465,3,466,2,467,2,468,1,469,1,470,1,471,2,485,3,486,3,487,3,488,2,489,2,490,3,491,3,495,1,496,2,497,1,498,3,499,3,500,1,502,1,503,3,504,1,505,3,506,3,507,3,508,5,509,3,510,5,511,3,512,5,513,1,514,1,515,1,516,1,517,3,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1,533,3,534,3,535,1],"mean":[28,1,66,1,67,1,105,1,106,1,113,1,114,1,218,1],"cbnz":[29,1],"cbz":[29,1],"compar":[29,6,32,2,33,2,34,2,35,2,36,2,37,2,306,4,307,4,308,4,309,4,322,4,323,4,324,4,325,4,326,4,327,4,328,4,329,4,331,4,332,4,336,4,337,4,396,2,397,2,399,2,400,2,444,2,445,2,446,2,447,2],"nonzero":[29,2],"zero":[29,4,31,4,60,2,62,2,64,2,65,2,77,2,78,2,79,2,80,2,85,2,87,2,88,2,89,2,90,2,91,2,101,2,102,2,103,2,104,2,269,2,294,2,295,2,296,2,297,2,298,2,299,2,306,2,307,2,308,2,309,2,313,2,314,2,322,8,323,2,324,8,325,2,326,8,327,2,328,8,329,2,331,8,332,2,333,4,336,2,337,2,342,1,343,4,345,1,346,2,380,4,419,4,421,2,423,2,472,4,473,4,474,4,475,4,476,4,477,4,478,4,479,4,480,4,481,4,482,4,483,8,484,8,518,2,519,2,524,4],"conditionally":[29,2],"forward":[29,2,258,2],"constant":[29,2,154,2,155,2,203,1,204,1,205,1,415,2,431,2],"they":[29,2,131,2,132,2,133,2,134,2,135,2,306,1,307,1,323,2,365,2,437,2,439,2,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,459,1,460,1,461,1,462,1,463,1,464,1],"do":[29,2,58,1,107,2,108,2,118,1,119,1,120,2,131,2,132,2,133,2,134,2,135,2,420,2],"clrex":[30,1],"exclusiv":[30,2,48,4,49,4,50,4,61,2,62,2,63,2,64,2,84,2,85,2,86,2,87,2,221,4,222,4,223,4,224,4,238,4,239,4,240,4,241,4,259,2,260,2,261,2,365,4],"local":[30,2,177,2],"monitor":[30,2,194,8,211,2],"execut":[30,2,38,1,41,1,42,2,43,2,44,1,45,1,52,1,53,2,54,2,56,3,58,1,66,1,67,1,105,5,106,1,113,1,114,1,115,2,116,2,117,2,118,2,119,2,175,1,194,2,211,2,218,1,221,2,222,2,223,2,224,2,239,2,240,2,241,2,262,1,300,2,301,2,302,2,303,2,304,2,305,2,306,2,307,2,310,2,311,2,312,2,313,2,314,2,315,2,316,2,317,2,318,2,319,2,320,2,321,2,322,2,323,2,324,2,325,2,326,2,327,2,328,2,330,2,331,2,333,2,334,2,335,2,336,2,337,2,338,2,340,2,341,2,342,2,343,2,344,2,345,2,346,2,347,2,348,2,349,2,351,2,352,2,353,2,354,2,355,2,356,2,357,2,358,2,360,2,363,2,364,2,365,2,366,2,367,2,370,2,371,2,372,2,373,2,374,2,375,2,376,2,377,2,378,2,379,2,380,2,381,2,382,2,383,2,384,2,385,2,386,2,387,2,388,2,389,2,390,2,391,2,392,2,393,2,394,2,395,2,396,2,397,2,399,2,400,2,402,2,403,2,404,2,405,2,406,2,407,2,408,2,409,2,410,2,411,2,413,2,414,2,415,2,416,2,417,2,418,2,419,2,420,2,421,2,422,2,423,2,424,3,425,2,426,2,427,2,428,2,429,2,430,2,431,2,432,2,433,2,434,2,435,2,436,2,437,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,448,2,449,2,450,2,451,2,452,2,453,2,454,2,455,2,456,2,457,2,458,2,461,2,464,2,465,2,466,2,467,2,468,2,469,2,470,2,471,2,485,2,486,2,487,2,488,2,489,2,490,2,491,2,495,2,496,2,497,2,498,2,499,2,500,2,502,2,503,2,504,2,505,2,506,2,507,2,508,2,509,2,510,2,511,2,512,2,513,2,514,2,515,2,516,2,517,2,518,2,519,2,521,2,522,2,523,2,524,2,531,2,532,2,533,2],"pe":[30,2,38,3,43,7,44,5,45,5,51,2,53,1,54,1,57,2,70,2,80,2,91,2,95,2,99,2,100,2,118,1,119,1,153,1,221,2,222,2,223,2,224,2,227,2,235,2,238,2,239,2,240,2,241,2,244,2,245,2,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1,533,4,534,2,535,4],"clz":[31,1],"count":[31,2,330,6,333,4,338,4],"lead":[31,2,330,2,333,2],"binary":[31,4],"befor":[31,2,47,1,53,2,72,2,73,2,196,1,199,1,201,1,202,1,203,1,204,1,205,1,206,1,210,1,229,2,230,2,252,2,253,2,254,2,255,2,256,2,257,2,294,2,295,2,296,2,297,2,298,2,299,2,313,2,314,2,367,2,370,2,371,2,372,2,373,2,374,2,375,2,376,2,518,2,519,2],"first":[31,2,39,2,40,2,58,2,130,2,173,2,229,2,306,2,307,2,308,2,309,2,318,2,319,2,320,2,325,2,327,2,329,2,332,2,335,1,361,4,362,4,366,2,368,2,369,2,371,2,374,2,378,2,412,2,456,2,457,2,459,1,462,1,464,2,485,1,492,2,493,2,496,1,501,2,520,2,525,2,526,2,527,2,528,2,529,2,530,2],"one":[31,2,38,2,130,2,142,4,145,4,146,2,156,2,157,2,166,4,190,4,191,4,210,2,214,4,268,4,274,4,275,4,283,4,284,4,291,4,300,2,301,2,302,2,303,2,304,2,306,2,307,2,308,2,309,2,314,4,322,2,323,2,324,2,325,2,326,2,327,2,328,2,329,2,330,1,331,2,332,2,333,1,336,2,337,2,338,2,340,2,349,2,358,2,360,2,364,1,372,2,373,2,375,2,377,3,378,3,381,8,382,6,383,4,384,4,385,2,387,4,388,2,390,4,391,2,397,1,398,1,400,1,401,1,416,2,417,1,419,1,422,1,454,1,459,1,460,1,461,1,462,1,463,1,464,1,467,2,471,3,485,1,486,1,489,2,490,1,491,2,494,2,496,1,498,1,503,1,505,8,506,4,507,4,509,4,511,4,515,2,516,2,517,2,518,2,524,3],"cmn":[32,1,33,1,34,1,58,1],"negativ":[32,2,33,2,34,2,485,2,496,2],"discard":[32,2,33,2,34,2,35,2,36,2,37,2,259,2,260,2,261,2,263,2,264,2,265,2],"cmp":[35,1,36,1,37,1,58,1],"subtract":[35,2,36,2,37,2,108,4,142,2,144,4,145,2,146,4,147,2,148,2,158,4,159,4,160,4,161,4,162,4,163,4,166,2,168,4,169,4,170,4,190,2,191,2,192,2,193,2,201,2,202,2,204,4,210,4,214,2,216,2,217,2,246,4,247,4,248,4,249,4,250,4,268,2,274,2,275,2,276,2,277,2,283,2,284,2,285,2,286,2,291,2,292,2,293,2,300,2,301,2,302,2,303,2,304,2,372,2,373,2,374,2,376,2,378,4,407,4,408,4,409,4,410,4,411,4,435,2,451,4,457,4,464,4,467,2,489,2,491,4,515,4,516,4,517,4,518,6,519,6],"cps":[38,2],"cpsid":[38,1],"cpsi":[38,1],"stat":[38,2,43,2,44,2,45,2,51,1,52,3,53,1,54,1,58,1,68,1,70,1,71,1,72,1,73,1,153,1,211,2,226,1,227,1,228,1,229,1,230,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1,533,3,534,3],"mor":[38,2,43,1,44,1,45,1,53,1,54,1,56,2,57,2,59,1,60,1,61,1,62,1,63,1,64,1,65,1,66,1,67,1,68,1,70,1,71,1,72,1,73,1,84,1,85,1,86,1,87,1,105,2,106,2,113,2,114,2,115,1,116,1,117,1,131,1,132,1,133,1,134,1,135,1,176,2,194,3,218,1,219,1,220,1,221,1,222,1,223,1,224,1,225,1,226,1,227,1,228,1,229,1,230,1,238,1,239,1,240,1,241,1,251,2,271,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,2,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,2,335,2,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,2,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,2,381,1,382,1,383,1,384,1,385,1,386,3,387,1,388,1,389,3,390,1,391,1,392,3,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,2,405,1,406,2,407,1,408,1,409,2,410,1,411,2,413,1,414,1,415,1,416,1,417,2,418,1,419,2,420,1,421,1,422,1,423,1,424,2,425,1,426,1,427,1,428,2,429,1,430,2,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,2,451,2,452,2,453,2,454,1,455,1,456,1,457,1,458,2,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,3,509,1,510,3,511,1,512,3,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1,533,2,534,2,535,1],"pstat":[38,8,41,1,51,1,58,1,118,2,119,2,139,2,143,2,144,2,146,2,164,2,165,2,166,2,173,2,174,2,175,2,195,1,196,1,200,1,201,1,206,1,212,1,213,1,214,2,216,2,217,2,266,2,267,2,268,2,289,1,290,1,291,2,292,2,293,2,336,2,337,2],"i":[38,2,115,1],"f":[38,2,115,1,118,1,119,1],"interrupt":[38,2,52,1,251,1,534,5],"mask":[38,2,52,1],"m":[38,4,115,1,118,2,119,2],"mod":[38,3,43,3,45,2,51,4,53,2,54,2,66,4,67,4,69,2,70,10,80,5,91,5,95,5,99,5,100,5,105,4,106,4,113,4,114,4,115,4,116,5,117,5,118,3,119,3,153,2,175,2,194,5,211,9,218,4,227,10,235,5,244,5,245,5,251,1,300,2,301,2,302,2,303,2,304,2,305,2,306,2,307,2,310,2,311,2,312,2,313,2,314,2,315,2,316,2,317,2,318,2,319,2,320,2,321,2,322,2,323,2,324,2,325,2,326,2,327,2,328,2,330,2,331,2,333,2,334,2,335,2,336,2,337,2,338,2,339,1,340,2,341,2,342,4,343,4,344,4,345,4,346,4,347,4,348,4,349,2,350,1,351,4,352,4,353,4,354,4,355,4,356,4,357,4,358,2,359,1,360,2,363,2,364,2,365,2,366,2,367,2,368,1,369,1,370,2,371,2,372,2,373,2,374,2,375,2,376,2,377,2,378,2,379,2,380,4,381,6,382,6,383,6,384,6,385,6,386,6,387,6,388,6,389,6,390,6,391,6,392,6,393,2,394,2,395,2,396,2,397,2,399,2,400,2,402,2,403,2,404,2,405,2,406,2,407,4,408,2,409,2,410,2,411,2,413,2,414,2,415,2,416,2,417,2,418,2,419,2,420,2,421,2,422,2,423,2,424,5,425,2,426,2,427,2,428,2,429,2,430,2,431,2,432,2,433,2,434,4,435,2,436,2,437,2,438,2,439,2,440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,448,2,449,2,450,2,451,2,452,2,453,2,454,2,455,2,456,2,457,2,458,2,461,2,464,2,465,2,466,2,467,2,468,2,469,2,470,2,471,2,472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2,485,2,486,2,487,2,488,2,489,2,490,2,491,2,495,2,496,2,497,2,498,2,499,2,500,2,502,2,503,2,504,2,505,6,506,6,507,6,508,6,509,6,510,6,511,6,512,6,513,2,514,2,515,2,516,2,517,2,518,2,519,2,521,2,522,2,523,2,524,2,531,2,532,2],"treat":[38,1,69,1,366,1,523,2],"nop":[38,1,42,2,52,1,124,3,175,1,262,1],"user":[38,1,51,1,68,1,70,6,71,1,72,1,73,1,80,2,91,2,95,2,99,2,100,2,115,2,116,1,117,1,118,1,119,1,153,1,175,1,194,1,211,1,226,1,227,6,228,1,229,1,230,1,235,2,244,2,245,2,424,1],"unless":[38,1],"defin":[38,1,131,1,132,1,133,1,134,1,135,1,270,1],"being":[38,2,115,1,118,1,119,2,167,1,203,1,204,1,205,1,366,1,380,2],"constrain":[38,1,51,1,118,1,153,1,211,1,227,1],"unpredictabl":[38,1,51,1,58,2,70,1,80,1,91,1,95,1,99,1,100,1,115,1,116,2,117,2,118,1,119,1,153,1,211,1,227,1,235,1,244,1,245,1],"elsewher":[38,1],"section":[38,1,270,1],"check":[38,1,39,2,40,2,51,1,118,1,119,1,153,1],"whether":[38,1,39,1,40,1,107,2,108,2,118,1,119,1,120,2,370,1,371,1,373,1,374,1,492,1,493,1,501,1,520,1,525,1,526,1,527,1,528,1,529,1,530,1],"written":[38,1,68,2,69,2,71,2,72,2,73,2,107,2,108,2,115,1,118,1,119,1,120,2,153,1,195,2,200,2,207,2,209,2,226,2,228,2,229,2,230,2],"legal":[38,1,118,1,119,1],"illegal":[38,1,51,2,118,1,119,1,153,2],"crc32":[39,4,40,1],"cyclic":[39,2,40,2],"redundancy":[39,2,40,2],"crc":[39,10,40,10],"calculation":[39,4,40,4],"held":[39,2,40,2,51,1,380,2,414,4,418,4,501,4,527,4,530,4],"general":[39,2,40,2,53,2,54,2,66,1,67,1,68,2,71,2,72,2,73,2,105,5,106,5,113,5,114,5,115,4,116,4,117,6,119,4,136,4,138,3,218,1,226,1,228,1,229,1,230,1,363,5,393,2,394,2,413,6,414,6,417,5,418,6,419,5,420,8,424,4,425,4,513,2,514,2],"purpos":[39,2,40,2,41,1,53,3,54,3,68,2,71,2,72,2,73,2,105,4,106,4,113,4,114,4,115,4,116,4,117,6,119,4,124,2,136,4,138,3,226,1,228,1,229,1,230,1,363,5,393,2,394,2,407,1,413,6,414,6,417,5,418,6,419,5,420,8,424,4,425,4,434,1,513,2,514,2],"tak":[39,2,40,2,131,2,132,2,133,2,134,2,135,2,305,2,306,2,307,2,308,2,309,2,322,2,323,2,324,2,325,2,326,2,327,2,328,2,329,2,331,2,332,2,346,1,421,2,432,2,448,2,459,2,460,2,461,2,462,2,463,2,485,2,486,2,487,2,490,2,491,2,494,2,495,2,496,2,497,2,498,2,499,2,500,2,503,2,504,2,517,2,524,2],"input":[39,4,40,4,472,4,473,4,474,4,475,4,476,4,477,4,478,4,479,4,480,4,481,6,482,6,483,4,484,4],"sourc":[39,6,40,6,107,2,108,2,120,2,195,4,198,4,200,4,207,4,209,4,318,4,319,4,320,4,321,1,334,1,335,2,339,2,346,1,361,8,362,8,363,1,368,2,369,4,370,2,371,4,374,4,379,2,380,2,412,4,423,2,456,6,457,6,487,1,492,4,493,4,494,2,499,1,501,4,520,4,525,4,526,4,527,4,528,4,529,4,530,4],"operand":[39,6,40,6,130,4,142,2,145,2,166,2,173,4,190,2,191,2,196,3,199,3,201,3,202,3,206,1,210,1,214,2,268,2,274,2,275,2,283,2,284,2,288,2,291,2,300,1,301,2,302,1,303,1,304,2,306,3,307,3,312,1,313,2,314,2,320,4,322,2,323,2,324,2,325,2,326,2,327,2,328,2,330,2,331,2,333,2,336,1,337,1,338,1,346,1,347,2,351,2,353,2,355,2,365,2,366,2,377,1,378,5,396,1,397,2,398,2,399,1,400,2,401,2,422,1,437,2,439,2,440,2,441,2,442,2,443,2,450,1,451,1,452,1,453,1,454,6,458,1,459,2,460,4,461,4,462,2,463,4,464,5,465,1,466,3,467,1,471,1,485,2,486,1,487,1,488,1,489,1,490,1,491,1,496,2,497,2,498,1,499,1,500,2,503,1,504,2,518,2,519,2,523,2,524,2],"second":[39,4,40,4,130,2,142,2,145,2,166,2,173,2,190,2,191,2,196,1,199,1,200,2,201,1,202,1,206,1,209,2,210,1,214,2,258,2,268,2,274,2,275,2,283,2,284,2,291,2,305,2,306,4,307,4,308,4,309,4,318,2,319,2,320,2,323,2,325,4,327,4,329,4,330,2,332,4,333,2,335,1,338,2,339,2,341,2,342,2,343,2,344,2,345,2,347,2,348,2,351,2,352,2,353,2,354,2,355,2,356,2,357,2,361,2,362,2,366,2,368,2,369,2,371,2,374,2,378,2,412,2,428,2,430,2,433,2,450,1,451,1,452,1,453,1,456,4,457,4,458,1,459,3,461,2,462,3,464,2,485,3,488,2,492,2,493,2,496,3,501,2,520,2,524,2,525,2,526,2,527,2,528,2,529,2,530,2],"output":[39,2,40,2,167,1],"8":[39,2,40,2,141,6,148,6,165,4,189,4,193,4,217,4,252,6,253,6,254,2,255,6,256,6,257,2,267,4,273,4,277,4,282,7,286,7,287,2,288,2,293,4,294,6,295,6,296,2,297,6,298,6,299,2,330,1,333,1,338,2,363,2,364,1,366,1,440,1,442,1,443,1,468,2,469,2,470,2,492,4,493,4,495,1,500,1,501,6,504,1,520,4,523,1,525,4,526,4,527,6,528,4,529,4,530,6,531,1,532,1],"16":[39,2,40,2,58,1,140,6,142,6,145,6,147,6,152,2,164,4,166,4,188,4,190,4,191,4,192,4,195,2,196,4,198,4,199,4,200,6,201,4,202,4,206,4,207,2,209,6,210,4,213,4,214,4,216,4,252,2,253,8,254,6,255,2,256,6,257,6,266,4,268,4,272,4,274,4,275,4,276,4,281,7,283,7,284,7,285,7,290,4,291,4,292,4,294,2,295,8,296,6,297,2,298,6,299,6,312,1,330,1,333,1,343,1,344,1,346,1,350,2,357,1,359,2,361,2,362,2,363,2,364,1,368,2,369,2,379,4,414,10,422,1,423,4,440,1,442,1,443,1,465,1,469,2,470,2,487,1,491,1,495,1,499,1,500,1,504,1,523,1,531,1,532,1],"32":[39,2,40,2,60,2,62,2,64,2,65,2,77,2,78,2,79,2,80,2,85,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,107,4,108,4,120,4,139,2,143,2,144,2,146,2,149,2,150,2,151,2,152,4,171,2,172,4,195,4,196,2,197,2,198,4,200,6,201,2,203,4,204,8,205,4,207,2,208,2,209,4,252,2,254,2,255,2,257,2,269,2,271,4,278,4,279,2,280,2,288,2,294,2,296,2,297,2,299,2,312,1,330,1,333,1,339,2,343,2,344,2,346,1,348,2,352,2,354,2,356,2,357,2,363,2,364,1,379,4,380,7,414,6,418,6,420,2,422,1,423,4,440,1,442,1,443,1,465,1,470,2,487,1,491,1,492,6,493,6,495,1,499,1,500,1,501,4,504,1,520,6,523,1,525,6,526,6,527,4,528,6,529,6,530,4,531,1,532,1],"align":[39,2,40,2,361,2,362,2],"common":[39,2,40,2],"usag":[39,2,40,2,116,1,117,1],"revers":[39,2,40,2,149,4,150,4,151,4,152,4,158,2,159,2,160,2,161,2,162,2,163,2,468,4,469,4,470,4],"part":[39,2,40,2,184,2,185,2,321,2,334,2,335,2],"operation":[39,2,40,2,43,1,44,1,45,1,68,1,71,1,72,1,73,1,124,2,136,1,143,2,144,2,195,2,196,1,200,2,201,1,212,1,213,1,259,2,260,2,261,2,262,2,263,2,264,2,265,2,289,1,290,1,315,2,334,1,335,1,336,1,337,3,342,2,345,2,346,2,365,2,377,2,378,2,417,1,419,1,437,2,439,2,459,2,462,2,464,2,466,1,467,1,471,1,485,2,488,1,489,1,496,2],"polynomial":[39,2,40,2,427,2,429,2],"0x04c11db7":[39,2],"used":[39,2,40,2,52,2,58,1,80,1,91,1,95,1,99,1,100,1,119,1,124,2,235,1,244,1,245,1,270,1],"optional":[39,1,40,1,370,1,371,1,373,1,374,1,394,2,492,1,493,1,501,1,514,2,520,1,525,1,526,1,527,1,528,1,529,1,530,1],"mandatory":[39,1,40,1,370,1,371,1,373,1,374,1,492,1,493,1,525,1,526,1],"all":[39,1,40,1,52,3,176,2,300,1,301,1,303,1,304,1,306,5,307,5,308,4,309,4,322,4,323,4,324,4,325,4,326,4,327,4,328,4,329,4,331,4,332,4,350,1,359,1,365,2,370,1,371,1,373,1,374,1,377,1,378,1,382,2,385,4,388,4,391,4,437,2,439,2,442,1,460,1,461,1,463,1,464,1,471,1,490,1,492,1,493,1,495,1,500,1,503,1,504,1,524,4,525,1,526,1],"implementation":[39,1,40,1,58,1,66,1,67,1,105,1,106,1,107,1,113,1,114,1,120,1,131,1,132,1,133,1,134,1,135,1,197,1,208,1,218,1,279,1,280,1,370,1,371,1,373,1,374,1,424,1,492,1,493,1,525,1,526,1],"implement":[39,1,40,1,52,1,262,1],"id":[39,1,40,1,370,1,371,1,373,1,374,1,424,1,492,1,493,1,501,1,520,1,525,1,526,1,527,1,528,1,529,1,530,1],"isar5":[39,1,40,1],"support":[39,1,40,1,53,1,54,1,59,1,60,1,61,1,62,1,63,1,64,1,65,1,76,1,84,1,85,1,86,1,87,1,219,1,220,1,221,1,222,1,223,1,224,1,225,1,238,1,239,1,240,1,241,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,3,371,3,372,1,373,3,374,3,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,492,2,493,2,495,1,496,1,497,1,498,1,499,1,500,1,501,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,520,1,521,1,522,1,523,1,524,1,525,2,526,2,527,1,528,1,529,1,530,1,531,1,532,1,535,2],"crc32c":[40,3],"0x1edc6f41":[40,2],"csdb":[41,3],"consumption":[41,2],"speculativ":[41,4,137,5,167,2,215,5],"data":[41,5,46,4,47,4,66,2,67,2,69,2,131,6,132,6,133,6,136,2,138,2,153,1,167,2,218,2,330,1,333,1,363,1,364,1,366,1,459,1,462,1,468,1,469,1,470,1,485,1,496,1,500,1,504,1,521,2,523,1,531,1,532,1],"barrier":[41,4,46,6,47,6,52,3,57,4,63,1,137,5,167,8,215,5,262,4],"memory":[41,2,46,8,47,4,59,7,60,7,61,6,62,6,63,5,64,6,65,7,66,6,67,6,68,6,69,2,70,2,71,6,72,6,73,6,74,6,75,6,76,6,77,6,78,6,79,6,80,9,81,6,82,6,83,6,84,5,85,5,86,5,87,5,88,6,89,6,90,6,91,9,92,6,93,6,94,6,95,9,96,6,97,6,98,6,99,9,100,9,131,9,132,8,133,9,134,8,135,8,136,4,137,2,138,4,153,2,167,1,211,4,215,2,218,6,219,7,220,7,221,8,222,8,223,8,224,8,225,7,226,6,227,2,228,6,229,6,230,6,231,6,232,6,233,6,234,6,235,9,236,6,237,6,238,5,239,5,240,5,241,5,242,6,243,6,244,9,245,9,381,2,382,2,383,2,384,2,385,2,386,2,387,2,388,2,389,2,390,2,391,2,392,2,505,2,506,2,507,2,508,2,509,2,510,2,511,2,512,2,513,2,514,2],"control":[41,2,58,1,66,1,67,1,105,1,106,1,113,2,114,1,167,2,218,1,350,1,359,1,522,2],"execution":[41,2,58,2,124,1,167,2,194,3,424,1,425,1,533,1,534,1],"prediction":[41,2,167,2],"no":[41,1,80,1,91,1,95,1,99,1,100,1,124,2,167,1,200,1,207,2,209,2,221,2,222,2,223,2,224,2,235,1,238,2,239,2,240,2,241,2,244,1,245,1,312,1,333,1,363,1,364,1,366,1,378,2,422,1,442,1,465,1,468,1,469,1,470,1,487,1,491,1,495,1,499,1,500,1,504,1,517,1,521,2,523,1,531,1,532,1],"than":[41,1,58,1,66,1,67,1,70,2,105,1,106,1,113,1,114,1,167,2,194,1,218,1,227,2,306,4,307,4,308,4,309,4,324,4,325,4,326,4,327,4,328,4,329,4,331,4,332,4,468,1,469,1,470,1],"appear":[41,1,47,1,167,3],"program":[41,1,47,1,116,2,117,2,124,1,167,3],"speculatively":[41,1],"using":[41,1,53,2,54,2,56,1,68,2,69,2,70,4,71,2,72,2,73,2,116,2,117,2,153,2,194,3,211,2,226,2,227,4,228,2,229,2,230,2,258,2,343,2,344,2,347,2,348,2,351,2,352,2,353,2,354,2,355,2,356,2,357,2,380,2,393,2,394,2,395,2,412,1,472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2,513,2,514,2],"definition":[41,2],"n":[41,1,115,1,336,2,337,2,424,4],"z":[41,1,115,1,336,2,337,2,424,4],"c":[41,1,115,1,336,2,337,2,424,4],"v":[41,1,115,1,336,2,337,2,424,4],"consider":[41,1,107,2,108,2,120,2],"dbg":[42,5],"dcps1":[43,4],"debug":[43,2,44,2,45,2,52,3,66,1,67,1,218,1],"el1":[43,5,56,2,70,2,116,1,117,1,194,4,211,2,227,2,424,1],"allow":[43,2,44,2,45,2,494,2],"debugger":[43,2,44,2,45,2],"mov":[43,2,44,2,45,2,105,2,106,2,109,5,110,5,111,4,112,2,113,2,114,2,115,4,116,4,117,4,118,5,119,5,379,2,421,2,422,2,423,2,424,4,425,4,454,2],"el0":[43,3],"specific":[43,2,45,2],"current":[43,2,45,2,51,2,69,2,70,2,115,1,116,1,117,1,118,1,119,1,211,2,227,2],"level":[43,2,44,2,45,4,52,3,118,1,119,1,533,1,534,1],"undefin":[43,1,44,1,45,1,53,1,54,1,58,1,70,1,105,1,106,1,113,1,114,1,153,1,194,1,211,1,227,1,270,5,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,2,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"el3":[43,1,45,4,116,2,117,2,194,4,211,3],"el2":[43,1,44,4,66,1,67,1,105,2,106,2,113,2,114,2,194,2,218,1,424,1],"doe":[43,1,47,1,58,1,66,1,67,1,76,1,105,1,106,1,112,2,113,1,114,1,124,2,218,1,330,2,340,2,349,2,358,2,361,2,362,2,367,2,370,2,371,2,372,2,373,2,374,2,375,2,376,2,407,1,412,2,424,1,434,1],"elr":[43,1,116,2,117,2],"hyp":[43,2,53,1,54,1,56,1,66,5,67,5,70,1,80,1,91,1,95,1,99,1,100,1,105,5,106,5,113,5,114,5,116,2,117,2,153,1,194,3,211,1,218,5,227,1,235,1,244,1,245,1,251,2,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,3,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"hsr":[43,1,56,2,251,3],"spsr":[43,1,51,2,69,2,115,3,116,3,117,3,118,3,119,3,211,2],"dlr":[43,1],"dspsr":[43,1],"becom":[43,1],"unknown":[43,1,115,1],"information":[43,1,44,1,45,1,53,1,54,1,56,2,57,2,59,2,60,2,61,2,62,2,63,2,64,2,65,2,66,3,67,3,68,1,70,1,71,1,72,1,73,1,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,100,2,105,2,106,2,113,2,114,2,115,1,116,1,117,1,131,1,132,1,133,1,134,1,135,1,176,2,194,3,211,2,218,3,219,2,220,2,221,2,222,2,223,2,224,2,225,2,226,1,227,1,228,1,229,1,230,1,231,2,232,2,233,2,234,2,235,2,236,2,237,2,238,2,239,2,240,2,241,2,242,2,243,2,244,2,245,2,251,2,271,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,2,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,2,381,1,382,1,383,1,384,1,385,1,386,3,387,1,388,1,389,3,390,1,391,1,392,3,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,2,405,1,406,2,407,1,408,1,409,2,410,1,411,2,413,1,414,1,415,1,416,1,417,2,418,1,419,2,420,1,421,1,422,1,423,1,424,2,425,1,426,1,427,2,428,2,429,2,430,2,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,2,451,2,452,2,453,2,454,1,455,1,456,1,457,1,458,2,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,3,509,1,510,3,511,1,512,3,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1,533,2,534,2,535,1],"dcp":[43,1,44,1,45,1],"dcps2":[44,3],"lower":[44,2,45,2,152,2,379,2,417,1,419,1,423,2],"dcps3":[45,3],"dmb":[46,3],"ensur":[46,2,47,2],"observation":[46,2],"access":[46,2,47,2,59,2,60,2,61,2,62,2,63,2,64,2,65,2,66,6,67,6,74,4,75,4,76,4,77,4,78,4,79,4,80,7,81,4,82,4,83,4,84,2,85,2,86,2,87,2,88,4,89,4,90,4,91,7,92,4,93,4,94,4,95,7,96,4,97,4,98,4,99,7,100,7,105,1,106,1,113,1,114,1,115,2,116,1,117,1,131,5,132,4,133,5,134,4,135,4,175,2,211,4,218,6,219,2,220,2,221,4,222,4,223,4,224,4,225,2,231,4,232,4,233,4,234,4,235,7,236,4,237,4,238,4,239,4,240,4,241,4,242,4,243,4,244,7,245,7,424,1],"dsb":[47,5],"synchronization":[47,4,52,5,57,6,59,1,60,1,61,1,62,1,63,1,64,1,65,1,84,1,85,1,86,1,87,1,219,1,220,1,221,1,222,1,223,1,224,1,225,1,238,1,239,1,240,1,241,1,262,2],"completion":[47,3],"aarch32":[47,2,51,1,68,2,70,1,71,2,72,2,73,2,105,1,106,1,113,1,114,1,136,1,153,1,194,2,211,1,226,1,227,1,228,1,229,1,230,1],"requir":[47,1,119,1,177,2],"aarch64":[47,1,116,1,117,1,194,1,211,1],"tlb":[47,1],"maintenanc":[47,1],"regardless":[47,1,194,1],"nxs":[47,1],"qualifier":[47,1],"eor":[48,3,49,3,50,2],"eret":[51,1],"hold":[51,2,321,3,334,3,335,3],"prefer":[51,2],"restor":[51,1,58,1],"event":[51,2,52,2,57,2,153,2,176,8,177,6,533,14,534,2],"system":[51,1,66,5,67,5,68,1,70,3,71,1,72,1,73,1,105,13,106,8,113,8,114,8,115,1,118,1,119,1,131,4,132,4,133,4,134,4,135,4,176,2,177,2,211,1,218,5,226,1,227,3,228,1,229,1,230,1,251,1,417,1,419,1,424,5,425,2,533,2,535,2],"esb":[52,1],"error":[52,5],"might":[52,2,53,1,54,1,58,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"also":[52,2,59,2,60,2,61,1,62,1,63,1,64,1,65,2,68,1,71,1,72,1,73,1,136,1,138,1,219,2,220,2,221,1,222,1,223,1,224,1,225,2,226,1,228,1,229,1,230,1,460,1,461,1,463,1],"disr":[52,2],"vdisr":[52,2],"serror":[52,1],"r":[52,1],"reliability":[52,1],"availability":[52,1],"serviceability":[52,1],"ras":[52,2],"specification":[52,1,398,1,401,1],"architectur":[52,1,58,1,270,1],"profil":[52,1],"extension":[52,1,419,2,522,1],"fldm":[53,3],"x":[53,3,140,2,141,2,142,2,143,2,144,2,145,2,146,2,147,2,148,2,196,4,199,4,201,4,202,4,206,4,210,4,281,2,282,2,283,2,284,2,285,2,286,2,523,2],"fldmdbx":[53,3],"decrement":[53,2,71,2,72,2,228,2,229,2],"fldmiax":[53,3],"increment":[53,2,68,2,73,2,226,2,230,2],"load":[53,2,59,6,60,6,61,5,62,5,63,5,64,5,65,6,66,4,67,4,68,8,69,9,70,8,71,8,72,8,73,8,74,4,75,4,76,4,77,4,78,4,79,4,80,4,81,4,82,4,83,4,84,4,85,4,86,4,87,4,88,4,89,4,90,4,91,4,92,4,93,4,94,4,95,4,96,4,97,4,98,4,99,4,100,4,134,2,135,2,136,9,137,2,153,4,215,2,219,2,220,2,221,1,222,1,223,1,224,1,225,2,226,1,228,1,229,1,230,1,381,6,382,4,383,6,384,6,385,4,386,8,387,6,388,4,389,8,390,6,391,4,392,8,393,4,394,4,395,4,508,2,510,2,512,2],"multipl":[53,2,54,2,68,5,69,5,70,6,71,5,72,5,73,5,136,4,138,4,226,5,227,6,228,5,229,5,230,5,383,2,386,4,389,4,392,4,393,4,506,2,508,4,510,4,512,4,513,4,535,2],"simd":[53,5,54,5,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,2,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,2,335,2,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,2,365,1,366,1,367,1,370,5,371,7,372,1,373,5,374,7,375,1,376,1,377,1,378,1,379,5,380,5,381,3,382,3,383,3,384,3,385,3,386,3,387,3,388,3,389,3,390,3,391,3,392,3,393,5,394,5,395,5,396,1,397,1,399,1,400,1,402,1,403,1,404,2,405,1,406,2,407,1,408,1,409,2,410,1,411,2,413,7,414,7,415,3,416,1,417,5,418,7,419,5,420,3,421,1,422,1,423,5,424,6,425,4,426,1,427,1,428,2,429,1,430,2,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,2,451,2,452,2,453,2,454,1,455,1,456,9,457,9,458,2,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,3,506,3,507,3,508,3,509,3,510,3,511,3,512,3,513,5,514,5,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"fp":[53,2,54,2,321,1,334,1,335,1,370,4,371,6,373,4,374,6,379,4,380,4,393,2,394,2,395,2,413,2,414,6,415,2,416,4,418,6,420,2,423,4,424,2,425,2,456,8,457,8,513,2,514,2],"consecutiv":[53,2,54,2,68,4,69,2,70,2,71,4,72,4,73,4,136,2,138,2,153,2,226,4,227,2,228,4,229,4,230,4,330,2,333,2,393,2,513,2],"location":[53,2,54,2,68,6,69,2,70,2,71,6,72,6,73,6,136,2,138,2,153,2,226,6,227,2,228,6,229,6,230,6,393,2,513,2],"advanc":[53,3,54,3,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,2,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,3,382,3,383,3,384,3,385,3,386,3,387,3,388,3,389,3,390,3,391,3,392,3,393,3,394,3,395,3,396,1,397,1,399,1,400,1,402,1,403,1,404,2,405,1,406,2,407,1,408,1,409,2,410,1,411,2,413,5,414,1,415,1,416,1,417,5,418,1,419,5,420,1,421,1,422,1,423,1,424,4,425,2,426,1,427,1,428,2,429,1,430,2,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,2,451,2,452,2,453,2,454,1,455,1,456,1,457,1,458,2,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,3,506,3,507,3,508,3,509,3,510,3,511,3,512,3,513,3,514,3,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"float":[53,3,54,3,300,1,301,1,302,4,303,1,304,1,305,3,306,2,307,2,310,3,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,2,322,2,323,2,324,2,325,2,326,2,327,2,328,2,330,1,331,2,333,1,334,2,335,2,336,6,337,6,338,1,339,3,340,1,341,3,342,10,343,8,344,8,345,10,346,9,347,6,348,5,349,1,350,1,351,6,352,5,353,6,354,5,355,6,356,5,357,8,358,1,359,1,360,7,361,2,362,2,363,1,364,1,365,1,366,1,367,1,368,3,369,3,370,3,371,3,372,1,373,3,374,3,375,7,376,5,377,1,378,1,379,1,380,5,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,3,394,3,395,3,396,2,397,1,398,3,399,2,400,1,401,3,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,412,2,413,5,414,1,415,1,416,1,417,3,418,1,419,3,420,5,421,1,422,1,423,1,424,5,425,4,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,3,434,5,435,5,436,3,437,1,438,1,439,1,440,1,441,4,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,3,467,3,468,1,469,1,470,1,471,1,472,6,473,6,474,6,475,6,476,6,477,6,478,6,479,6,480,6,481,6,482,6,483,6,484,6,485,1,486,1,487,1,488,3,489,3,490,1,491,1,494,2,495,1,496,1,497,1,498,1,499,1,500,1,502,5,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,3,514,3,515,3,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"point":[53,3,54,3,136,2,138,2,300,1,301,1,302,4,303,1,304,1,305,3,306,2,307,2,310,3,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,2,322,2,323,2,324,2,325,2,326,2,327,2,328,2,330,1,331,2,333,1,334,2,335,2,336,6,337,6,338,1,339,3,340,1,341,3,342,10,343,9,344,9,345,18,346,23,347,6,348,5,349,1,350,1,351,6,352,5,353,6,354,5,355,6,356,5,357,9,358,1,359,1,360,7,361,2,362,2,363,1,364,1,365,1,366,1,367,1,368,3,369,3,370,3,371,3,372,1,373,3,374,3,375,7,376,5,377,1,378,1,379,1,380,7,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,3,394,3,395,3,396,2,397,1,398,3,399,2,400,1,401,3,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,412,2,413,5,414,1,415,1,416,1,417,3,418,1,419,3,420,5,421,1,422,1,423,1,424,5,425,4,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,3,434,5,435,5,436,3,437,1,438,1,439,1,440,1,441,4,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,3,467,3,468,1,469,1,470,1,471,1,472,6,473,6,474,6,475,6,476,6,477,6,478,6,479,6,480,6,481,6,482,6,483,6,484,6,485,1,486,1,487,1,488,3,489,3,490,1,491,1,494,2,495,1,496,1,497,1,498,1,499,1,500,1,502,5,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,3,514,3,515,3,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"fil":[53,2,54,2,393,2,394,2,395,2,413,4,513,2,514,2],"except":[53,1,54,1,522,1],"disassembly":[53,1,54,1],"reassembly":[53,1,54,1],"disassembl":[53,1,54,1],"cod":[53,1,54,1,494,2],"depend":[53,1,54,1,107,2,108,2,120,2,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,350,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,359,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,2,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"cpacr":[53,1,54,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"nsacr":[53,1,54,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"hcptr":[53,1,54,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"security":[53,1,54,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"attempt":[53,1,54,1,66,1,67,1,105,1,106,1,113,1,114,1,118,1,119,1,218,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"trap":[53,1,54,1,66,5,67,5,105,6,106,6,113,6,114,6,116,1,117,1,194,2,211,2,218,5,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,2,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,3,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1,533,1,534,1],"enabl":[53,1,54,1,105,1,106,1,113,1,114,1,300,1,301,1,302,1,303,1,304,1,305,1,306,1,307,1,310,1,311,1,312,1,313,1,314,1,315,1,316,1,317,1,318,1,319,1,320,1,321,1,322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,334,1,335,1,336,1,337,1,338,1,340,1,341,1,342,1,343,1,344,1,345,1,346,1,347,1,348,1,349,1,350,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,359,1,360,1,363,1,364,1,365,1,366,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,377,1,378,1,379,1,380,1,381,1,382,1,383,1,384,1,385,1,386,1,387,1,388,1,389,1,390,1,391,1,392,1,393,1,394,1,395,1,396,1,397,1,399,1,400,1,402,1,403,1,404,1,405,1,406,1,407,1,408,1,409,1,410,1,411,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,421,1,422,1,423,1,424,1,425,1,426,1,427,1,428,1,429,1,430,1,431,1,432,1,433,1,434,1,435,1,436,1,437,1,438,1,439,1,440,1,441,1,442,1,443,1,444,1,445,1,446,1,447,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,461,1,464,1,465,1,466,1,467,1,468,1,469,1,470,1,471,1,485,1,486,1,487,1,488,1,489,1,490,1,491,1,495,1,496,1,497,1,498,1,499,1,500,1,502,1,503,1,504,1,505,1,506,1,507,1,508,1,509,1,510,1,511,1,512,1,513,1,514,1,515,1,516,1,517,1,518,1,519,1,521,1,522,1,523,1,524,1,531,1,532,1],"fstmdbx":[54,2],"fstmiax":[54,2],"fstmx":[54,2],"stor":[54,2,59,2,60,2,61,1,62,1,63,1,64,1,65,2,137,5,138,7,211,4,215,5,218,4,219,6,220,6,221,9,222,9,223,9,224,9,225,6,226,5,227,6,228,5,229,5,230,5,231,4,232,4,233,4,234,4,235,4,236,4,237,4,238,8,239,8,240,8,241,8,242,4,243,4,244,4,245,4,386,2,389,2,392,2,505,4,506,6,507,4,508,6,509,4,510,6,511,4,512,6,513,4,514,4],"fpexc":[54,1,305,1,310,1,340,1,343,1,344,1,346,1,347,1,348,1,349,1,351,1,352,1,353,1,354,1,355,1,356,1,357,1,358,1,360,1,367,1,370,1,371,1,372,1,373,1,374,1,375,1,376,1,379,1,380,1,394,1,395,1,402,1,407,1,413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1,423,1,424,1,425,1,426,1,433,1,434,1,435,1,436,1,502,1,513,1,514,1,515,1],"hlt":[55,1],"halt":[55,3],"softwar":[55,2,56,2,194,1,251,2,346,2,407,1,434,1,535,4],"occur":[55,2,69,1,131,2,132,2,133,2,134,2,135,2,139,2,143,2,144,2,146,2,195,2,196,1,198,1,199,1,200,2,201,1,202,1,210,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,459,1,460,1,461,1,462,1,463,1,464,1,533,2,534,2],"hvc":[56,5],"hypervisor":[56,9],"non":[56,2,66,2,67,2,105,1,106,1,113,1,114,1,194,2,218,2,424,1],"secur":[56,2,66,2,67,2,105,1,106,1,113,1,114,1,116,1,117,1,194,9,211,3,218,2,424,1],"request":[56,2],"servic":[56,2,251,1],"syndrom":[56,1,251,1],"report":[56,1],"ec":[56,1,251,1],"0x12":[56,1],"captur":[56,1],"argument":[56,1,116,1,117,1],"isb":[57,3],"flush":[57,2],"pipelin":[57,2],"context":[57,2],"mak":[58,3,80,1,91,1,95,1,99,1,100,1,235,1,244,1,245,1],"up":[58,2,131,2,132,2,133,2,134,2,135,2,522,2],"four":[58,2,141,2,148,2,165,2,189,2,193,2,217,2,267,2,273,2,277,2,282,2,286,2,287,2,288,2,293,2,383,4,386,4,390,4,391,4,392,4,492,4,493,4,506,4,508,4,511,4,512,4,520,4,525,4,526,4,528,4,529,4],"follow":[58,2,211,1,251,1,321,1,330,2,334,1,335,1,340,2,349,2,358,2],"conditional":[58,3,398,1,401,1,494,2],"specify":[58,2,203,1,204,1,205,1,211,1,252,2,253,2,254,2,255,2,256,2,257,2,294,2,295,2,296,2,297,2,298,2,299,2,346,2],"itself":[58,1,330,2],"but":[58,1,198,1,199,1,202,1,398,1,401,1],"tst":[58,1,263,1,264,1,265,1],"al":[58,1],"behavior":[58,1,68,1,70,1,71,1,72,1,73,1,105,1,106,1,113,1,114,1,226,1,227,1,228,1,229,1,230,1],"only":[58,1,115,1,118,1,120,1,175,1,194,1,198,1,199,1,202,1,305,2,417,1,419,1,433,2],"restoration":[58,1],"cpsr":[58,1,69,2,115,4,118,4,119,4],"consistent":[58,1],"such":[58,1,131,2,132,2,133,2,134,2,135,2],"mad":[58,1],"what":[58,1],"subsequent":[58,1,336,2,337,2],"many":[58,1,107,1,120,1,197,1,208,1,279,1,280,1],"performanc":[58,1,107,1,120,1,197,1,208,1,279,1,280,1,535,2],"reason":[58,1],"includ":[58,1,66,1,67,1,68,1,69,1,70,2,71,1,72,1,73,1,105,1,106,1,113,1,114,1,124,1,136,1,218,1,330,2,350,1,359,1,424,1,533,2],"itd":[58,1],"disabl":[58,1,105,1,106,1,113,1,114,1],"thos":[58,1,68,2,71,2,72,2,73,2,205,2,226,2,228,2,229,2,230,2],"them":[58,1,81,2,82,2,83,2,171,2,253,2,256,2,269,2,295,2,298,2,366,2,372,2,421,2,459,2,460,2,461,2,462,2,463,2,485,2,486,2,487,2,490,2,495,2,496,2,497,2,498,2,499,2,500,2,503,2,504,2],"lda":[59,1],"acquir":[59,4,60,4,61,3,62,3,63,3,64,3,65,4,219,2,220,2,221,1,222,1,223,1,224,1,225,2],"word":[59,4,60,2,61,4,62,2,64,2,65,2,66,2,67,2,69,1,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,85,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,100,2,150,2,153,1,200,2,203,3,204,3,205,3,209,2,218,2,219,4,221,4,231,2,232,2,236,2,237,2,238,2,245,2,413,2,417,4,419,4,469,4],"has":[59,2,60,2,61,1,62,1,64,1,65,2,167,1,219,2,220,2,221,3,222,3,223,3,224,3,225,2,238,2,239,2,240,2,241,2],"semantic":[59,2,60,2,61,1,62,1,64,1,65,2,137,1,167,1,215,1,219,2,220,2,221,1,222,1,223,1,224,1,225,2],"describ":[59,2,60,2,61,1,62,1,63,1,64,1,65,2,219,2,220,2,221,1,222,1,223,1,224,1,225,2,343,1,344,1,357,1,533,1,534,1],"releas":[59,2,60,2,61,1,62,1,63,1,64,1,65,2,219,4,220,4,221,3,222,3,223,3,224,3,225,4],"about":[59,2,60,2,61,2,62,2,63,2,64,2,65,2,66,2,67,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,100,2,105,1,106,1,113,1,114,1,211,2,218,2,219,2,220,2,221,2,222,2,223,2,224,2,225,2,231,2,232,2,233,2,234,2,235,2,236,2,237,2,238,2,239,2,240,2,241,2,242,2,243,2,244,2,245,2,271,1,364,1,404,1,406,1,409,1,411,1,417,1,419,1,427,1,428,1,429,1,430,1,450,1,451,1,452,1,453,1,458,1,535,1],"shar":[59,1,60,1,61,1,62,1,63,1,64,1,65,1,84,1,85,1,86,1,87,1,219,1,220,1,221,1,222,1,223,1,224,1,225,1,238,1,239,1,240,1,241,1],"semaphor":[59,1,60,1,61,1,62,1,63,1,64,1,65,1,84,1,85,1,86,1,87,1,219,1,220,1,221,1,222,1,223,1,224,1,225,1,238,1,239,1,240,1,241,1],"ldab":[60,1],"byt":[60,4,62,4,77,4,78,4,79,4,80,4,85,4,92,4,93,4,94,4,95,4,150,4,151,4,152,4,173,4,220,4,222,4,233,4,234,4,235,4,239,4,252,2,253,2,255,2,256,2,258,4,294,2,295,2,297,2,298,2,417,2,419,4,459,2,462,2,485,2,496,2,522,4],"extend":[60,2,62,2,64,2,65,2,77,2,78,2,79,2,80,2,85,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,152,2,156,2,157,2,171,2,198,2,252,4,253,4,254,4,255,4,256,4,257,4,269,2,294,4,295,4,296,4,297,4,298,4,299,4,313,4,314,4,346,2,419,4,421,2,518,4,519,4],"ldaex":[61,1],"ldaexb":[62,1],"ldaexd":[63,1],"doubleword":[63,4,86,4,223,4,240,4,306,1,307,1,312,2,313,2,314,4,365,2,413,4,421,2,422,2,432,2,437,2,439,2,440,1,441,1,442,1,443,1,444,4,445,4,446,4,447,4,450,2,451,2,453,2,454,1,460,2,463,2,465,2,470,4,491,2,497,2,517,2,518,4,519,4,521,2],"two":[63,2,81,4,82,4,83,4,86,2,106,4,107,2,108,2,114,4,120,2,139,2,140,2,142,2,145,2,147,2,153,2,164,2,166,2,188,2,190,2,191,2,192,2,195,2,196,2,197,2,198,4,199,2,201,2,202,2,203,2,204,2,205,2,206,2,207,2,208,2,210,2,213,2,214,2,216,2,223,2,236,4,237,4,240,2,253,4,256,2,266,2,268,2,272,2,274,2,275,2,276,2,278,6,279,2,280,2,281,2,283,2,284,2,285,2,290,2,291,2,292,2,295,4,298,2,310,2,311,2,312,2,313,2,315,2,321,1,334,1,336,2,337,2,365,2,367,2,370,2,376,2,377,2,382,2,383,4,384,4,385,4,386,4,396,2,397,2,399,2,400,2,402,2,403,2,405,2,407,2,408,2,410,2,412,1,413,8,420,8,426,2,427,2,429,2,434,2,435,2,436,2,437,2,439,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2,449,2,450,2,451,2,452,2,453,2,458,2,465,2,471,2,506,4,507,4,508,4,521,2,531,2,532,2],"act":[63,1,195,2,198,2,200,2],"requirement":[63,1],"ldaexh":[64,1],"halfword":[64,4,65,4,87,4,88,4,89,4,90,4,91,4,96,4,97,4,98,4,99,4,112,4,130,6,142,2,145,2,151,4,152,4,166,2,190,2,191,2,195,2,196,1,198,2,199,1,200,2,201,1,202,1,206,1,207,2,209,2,210,1,214,2,224,4,225,4,241,4,242,4,243,4,244,4,254,2,257,2,258,4,268,2,274,2,275,2,283,2,284,2,291,2,296,2,299,2,417,2,419,4,468,4],"ldah":[65,1],"ldc":[66,4,67,4],"calculat":[66,2,67,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,100,2,218,2,231,2,232,2,233,2,234,2,235,2,236,2,237,2,238,4,242,2,243,2,244,2,245,2,502,2],"offset":[66,4,67,2,74,4,75,2,76,4,77,4,78,2,79,4,80,4,81,4,82,2,83,4,84,2,88,4,89,2,90,4,91,4,92,4,93,2,94,4,95,4,96,4,97,2,98,4,99,4,100,4,218,4,231,4,232,4,233,4,234,4,235,4,236,4,237,4,238,2,242,4,243,4,244,4,245,4,258,2,394,2,395,2,514,2],"dbgdtrtxint":[66,3,67,3],"post":[66,2,74,2,77,2,80,1,81,2,83,2,88,2,91,1,92,2,95,1,96,2,99,1,100,1,218,2,231,2,233,2,235,1,236,2,237,2,242,2,244,1,245,1],"index":[66,4,74,4,77,4,80,1,81,4,83,4,88,4,91,1,92,4,95,1,96,4,99,1,100,1,218,4,231,4,233,4,235,1,236,4,237,4,242,4,244,1,245,1,258,2,362,4,369,2,493,4,520,4,522,5,526,4,529,4],"pre":[66,2,74,2,77,2,81,2,83,2,88,2,92,2,96,2,134,2,135,2,218,2,231,2,233,2,236,2,237,2,242,2],"unindex":[66,2,218,2],"would":[66,1,67,1,105,1,106,1,113,1,114,1,116,1,117,1,218,1,424,1,533,1,534,1],"absenc":[66,1,67,1,105,1,106,1,113,1,114,1,218,1],"generat":[66,1,67,1,105,1,106,1,113,1,114,1,194,2,218,1,251,1,270,2,339,1,350,1,359,1,368,1,369,1,380,2,424,1,522,2],"simplicity":[66,1,67,1,218,1,424,1],"pseudocod":[66,1,67,1,68,1,71,1,72,1,73,1,105,1,106,1,113,1,114,1,136,1,218,1,424,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,459,1,460,1,461,1,462,1,463,1,464,1],"show":[66,1,67,1,105,1,106,1,113,1,114,1,218,1,424,1],"possibl":[66,1,67,1,105,2,106,2,113,2,114,2,195,1,198,1,199,1,202,1,207,2,209,2,218,1,424,1],"literal":[67,2,75,2,78,2,82,2,89,2,93,2,97,2,132,2,395,2],"ldm":[68,3,69,1,70,1,71,2,72,2,73,3],"ldmfd":[68,1],"ldmia":[68,1],"full":[68,2,71,2,229,2,230,2],"descend":[68,2,73,2,228,2,229,2],"start":[68,2,73,2,136,2,138,2,177,2,226,2,230,2,333,2],"just":[68,2,71,2,72,2,73,2,136,2,138,2,226,2,228,2,229,2,230,2],"abov":[68,2,73,2,136,2,226,2,230,2],"highest":[68,4,71,2,72,2,73,2,136,2,138,2,226,2,228,2,229,2,230,2],"back":[68,2,69,2,71,2,72,2,73,2,80,1,91,1,95,1,99,1,100,1,153,1,226,2,228,2,229,2,230,2,235,1,244,1,245,1,375,2,376,2,434,2,435,2],"lowest":[68,2,71,4,72,4,73,2,136,2,138,2,226,2,228,4,229,2,230,2],"through":[68,1,71,1,72,1,73,1,136,1,138,1,226,1,228,1,229,1,230,1],"list":[68,1,71,1,72,1,73,1,136,1,138,1,226,1,228,1,229,1,230,1],"2":[68,1,70,1,71,1,72,1,73,1,90,2,94,2,98,2,139,2,140,2,141,2,142,2,143,2,144,2,145,2,146,2,147,2,148,2,185,2,198,1,199,1,202,1,226,1,227,1,228,1,229,1,230,1,243,2,281,1,282,1,283,1,284,1,285,1,286,1,370,1,371,1,373,1,374,1,380,1,384,4,385,4,386,4,467,2,489,2,492,1,493,1,501,1,507,4,508,4,520,1,523,4,525,1,526,1,527,1,528,1,529,1,530,1],"deprecation":[68,1,70,1,71,1,72,1,73,1,226,1,227,1,228,1,229,1,230,1],"som":[68,1,70,1,71,1,72,1,73,1,226,1,227,1,228,1,229,1,230,1,251,1],"feat":[68,1,70,1,71,1,72,1,73,1,226,1,227,1,228,1,229,1,230,1,262,1],"lsmaoc":[68,1,70,1,71,1,72,1,73,1,226,1,227,1,228,1,229,1,230,1],"interwork":[68,1,71,1,72,1,73,1,136,1],"relat":[68,1,71,1,72,1,73,1,226,1,228,1,229,1,230,1],"copi":[69,2],"adjust":[69,2,153,1],"siz":[69,2,153,1,302,1,306,2,307,2,322,1,323,1,324,1,325,1,326,1,327,1,328,1,331,1,347,1,351,1,353,1,355,1,365,2,397,1,400,1,437,2,439,2,459,1,460,1,461,2,462,1,463,1,468,1,469,1,470,1,472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2,485,1,486,1,487,1,495,1,496,1,498,1,499,1,500,1,504,1,524,1],"cannot":[70,4,167,1,196,1,201,1,206,1,210,1,227,2],"read":[70,2,119,1,131,1,133,1,227,2],"normally":[70,2,118,1,119,1,227,2,336,2,337,2],"determin":[70,2,227,2,398,2,401,2],"correct":[70,2,227,2],"bank":[70,2,116,8,117,8,227,2],"version":[70,2,227,2,305,2,378,2,433,2],"writeback":[70,2,76,1,227,2],"ldmda":[71,1],"ldmfa":[71,1],"ascend":[71,2,72,2,226,2,230,2],"end":[71,2,72,2,138,2,154,2,155,2,228,2,229,2,366,4],"below":[71,2,72,2,138,2,228,2,229,2],"ldmdb":[72,1],"ldmea":[72,1],"empty":[72,2,73,2,226,2,228,2],"ldmib":[73,1],"last":[73,2,226,2,230,2],"ldr":[74,1,75,1,76,2],"ldrb":[77,1,78,1,79,1],"ldrbt":[80,2],"unprivileg":[80,2,91,2,95,2,99,2,100,2,235,2,244,2,245,2],"restrict":[80,1,91,1,95,1,99,1,100,1,235,1,244,1,245,1],"wer":[80,1,91,1,95,1,99,1,100,1,235,1,244,1,245,1],"run":[80,2,91,2,95,2,99,2,100,2,235,2,244,2,245,2],"differenc":[80,1,91,1,95,1,99,1,100,1,201,2,202,2,235,1,244,1,245,1,287,4,288,4,300,2,301,2,302,2,303,2,304,2],"actually":[80,1,91,1,95,1,99,1,100,1,235,1,244,1,245,1],"leav":[80,1,91,1,95,1,99,1,100,1,124,1,235,1,244,1,245,1,318,2,319,2,522,1],"unchang":[80,1,91,1,95,1,99,1,100,1,124,1,235,1,244,1,245,1,318,2,319,2,381,2,384,2,387,2,390,2,522,1],"new":[80,1,91,1,95,1,99,1,100,1,174,2,175,2,235,1,244,1,245,1,522,2],"ldrd":[81,1,82,1,83,1],"dual":[81,2,82,2,83,2,196,2,199,2,201,2,202,2,206,2,210,2,236,2,237,2],"ldrex":[84,1],"ldrexb":[85,1],"deriv":[85,2,86,2,87,2,239,4,240,4,241,4],"ldrexd":[86,1],"64":[86,2,197,4,198,6,199,4,202,4,208,2,240,2,278,4,279,4,280,2,312,1,422,1,465,1,487,1,491,1,495,1,499,1,500,1,504,1],"ldrexh":[87,1],"ldrh":[88,1,89,1,90,1],"left":[90,2,94,2,98,2,101,4,102,4,154,2,155,2,204,2,243,2,459,4,461,4,462,4,485,4,495,5,496,4,497,4,500,6],"3":[90,2,94,2,98,2,115,1,243,2,370,1,371,1,373,1,374,1,387,4,388,4,389,4,489,2,492,1,493,1,509,4,510,4,525,1,526,1],"ldrht":[91,2],"ldrsb":[92,1,93,1,94,1],"ldrsbt":[95,2],"ldrsh":[96,1,97,1,98,1],"ldrsht":[99,2],"ldrt":[100,2],"lsl":[101,1,102,1],"logical":[101,2,102,2,103,2,104,2],"lsr":[103,1,104,1],"mcr":[105,4],"valid":[105,1,106,1,113,1,114,1,116,1,117,1],"interfac":[105,1,106,1,113,1,114,1],"configurabl":[105,1,106,1,113,1,114,1],"becaus":[105,1,106,1,113,1,114,1,118,1,119,1,407,1,434,1],"rang":[105,1,106,1,113,1,114,1,139,2,140,2,141,2,142,2,143,2,144,2,145,2,146,2,147,2,148,2,212,2,213,2,281,2,282,2,283,2,284,2,285,2,286,2,289,2,290,2,522,3],"mcrr":[106,4],"mla":[107,2],"multiply":[107,4,108,4,120,4,195,6,196,2,197,4,198,6,199,2,200,6,201,2,202,2,203,4,204,4,205,4,206,2,207,4,208,4,209,4,210,2,278,4,279,4,280,4,334,3,335,3,367,6,368,5,369,5,370,6,371,6,372,6,373,6,374,6,375,6,376,6,402,4,403,4,404,4,405,4,406,4,407,4,408,4,409,4,410,4,411,4,412,5,426,4,427,5,428,4,429,5,430,4,434,4,435,4,436,4,450,4,451,4,452,4,453,4,456,6,457,6,458,4,467,2,489,2,501,4,527,4,530,4],"accumulat":[107,2,195,7,196,5,197,4,198,8,199,4,200,7,201,3,202,2,203,4,204,2,278,4,279,4,288,4,300,4,301,4,334,2,335,2,367,4,370,2,371,2,373,2,374,2,375,2,402,4,403,2,404,2,405,2,406,2,412,2,434,2,440,4,450,4,456,4,490,4,492,2,493,2,501,2,503,4,520,2,525,2,526,2,527,2,528,2,529,2,530,2],"third":[107,2,108,2,360,2],"least":[107,2,108,2,120,2,363,1,412,1,422,2,459,2,462,2,485,2,496,2],"significant":[107,2,108,2,120,2,203,4,204,4,205,4,312,2,321,2,333,2,334,2,335,2,363,1,422,2,452,2,456,2,457,2,458,2,459,2,462,2,465,2,485,2,491,2,496,2,517,2],"unsign":[107,2,108,2,120,2,266,4,267,4,268,6,269,2,271,6,272,4,273,4,274,6,275,6,276,4,277,4,278,6,279,4,280,4,281,6,282,6,283,8,284,8,285,6,286,6,287,4,288,4,289,4,290,4,291,6,292,4,293,4,294,2,295,2,296,2,297,2,298,2,299,2,312,1,325,1,327,1,333,1,342,1,345,1,346,3,347,1,351,1,353,1,355,1,422,1,442,1,454,3,460,3,461,3,463,3,464,2,465,1,466,1,487,1,488,1,491,1,495,1,499,1,517,1,520,4,525,2,526,2,527,4,528,2,529,4,530,2],"option":[107,1,120,2,197,1,208,1,279,1,280,1],"adversely":[107,1,120,1,197,1,208,1,279,1,280,1],"mls":[108,1],"product":[108,2,195,2,196,2,198,2,199,2,200,4,201,2,202,2,203,1,205,1,206,2,207,2,209,4,210,2,361,4,362,4,370,2,371,2,372,2,373,2,374,2,375,2,376,2,403,2,404,2,405,2,406,2,407,3,408,2,409,2,410,2,411,2,412,4,434,3,435,2,450,2,451,2,453,2,467,2,489,2,492,4,493,4,501,4,520,4,525,4,526,4,527,4,528,4,529,4,530,4],"movt":[112,1],"top":[112,4,195,2,196,2,198,2,199,2,200,4,201,2,202,2,206,2,207,2,209,4,210,2,350,2,358,2,359,2,366,2,368,2,369,2],"content":[112,2,154,2,155,2,156,2,157,2,416,2,420,4,521,2],"bottom":[112,2,195,2,196,2,198,2,199,2,200,4,201,2,202,2,206,2,207,2,209,4,210,2,349,2,350,2,359,2,366,2,368,2,369,2,414,8],"mrc":[113,4],"mrrc":[114,4],"mrs":[115,3,116,4],"special":[115,2,116,2,117,2,118,2,119,2,424,2,425,2],"apsr":[115,4,118,3,119,3,424,2,494,2],"recommend":[115,1,407,1,434,1,535,1],"q":[115,1,139,2,143,2,144,2,146,2,195,1,196,1,200,1,201,1,206,1,212,1,213,1,289,1,290,1],"ge":[115,1,164,2,165,2,166,2,173,2,214,2,216,2,217,2,266,2,267,2,268,2,291,2,292,2,293,2],"e":[115,1,174,2],"sav":[116,2,117,2,508,2,510,2,512,2],"status":[116,2,117,2,221,2,222,2,223,2,224,2,238,2,239,2,240,2,241,2,361,2,362,2,412,2],"mon":[116,3,117,3],"effect":[116,1,117,1,124,1,131,1,132,1,133,1,134,1,135,1,167,1,194,1],"restriction":[116,1,117,1],"transfer":[116,1,117,1,336,2,337,2,414,2,417,2,418,2,419,2,420,2,424,2],"msr":[117,4,118,5,119,5],"select":[118,3,119,3,173,4,213,2,289,2,290,2,320,2,494,2],"correspond":[118,2,300,2,301,2,302,2,303,2,304,2,306,4,307,4,308,4,309,4,310,2,311,2,312,2,313,2,314,2,318,2,319,2,320,2,321,1,322,2,323,4,324,2,325,4,326,2,327,4,328,2,329,4,331,2,332,4,334,1,361,2,367,2,370,4,371,2,372,4,373,4,374,2,377,2,378,2,384,2,387,2,390,2,396,4,397,4,399,4,400,4,402,2,403,4,404,2,405,4,406,2,407,4,408,4,409,2,410,4,411,2,422,2,426,2,427,2,429,2,444,2,445,2,446,2,447,2,449,2,450,2,451,4,452,2,453,2,454,2,456,2,457,2,458,2,459,2,462,2,464,2,465,2,467,2,468,2,469,2,470,2,471,2,485,2,489,2,491,2,492,4,493,2,496,2,507,2,509,2,511,2,515,2,516,2,517,2,518,2,519,2,520,2,524,4,525,4,526,2,528,4,529,2],"modify":[118,1,119,2],"natur":[118,1,119,1],"reserv":[118,1,119,1],"useful":[118,1],"application":[118,1,119,1],"nzcvq":[118,1,119,1],"sequenc":[119,1],"mul":[120,2],"limit":[120,1],"few":[120,1],"mvn":[121,3,122,3,123,2],"noth":[124,2],"alignment":[124,2],"tim":[124,3],"guarant":[124,1],"increas":[124,1],"reduc":[124,1],"therefor":[124,1],"suitabl":[124,1],"loop":[124,1,177,2],"orn":[125,2,126,2],"inclusiv":[125,2,126,2,127,2,128,2,129,2],"orr":[127,3,128,3,129,2],"pkhbt":[130,1],"pkhtb":[130,1],"pack":[130,2,151,2],"combin":[130,2],"pld":[131,3,132,2,133,3],"pldw":[131,3,133,3],"preload":[131,5,132,5,133,5,134,3,135,3],"signal":[131,4,132,2,133,4,134,2,135,2,176,2,177,4,336,1,533,2],"likely":[131,3,132,2,133,3,134,2,135,2],"near":[131,2,132,2,133,2,134,2,135,2],"futur":[131,2,132,2,133,2,134,2,135,2],"respond":[131,2,132,2,133,2,134,2,135,2],"action":[131,2,132,2,133,2,134,2,135,2],"expect":[131,2,132,2,133,2,134,2,135,2,412,1],"spe":[131,2,132,2,133,2,134,2,135,2],"cach":[131,5,132,5,133,5,134,5,135,5,167,1],"lin":[131,2,132,2,133,2,134,2,135,2],"contain":[131,2,132,2,133,2,134,2,135,2],"pli":[134,2,135,2],"pop":[136,3],"stack":[136,4,138,4,211,2],"pssbb":[137,1],"physical":[137,5],"bypass":[137,5,215,5],"prevent":[137,2,215,2],"earlier":[137,2,215,2],"push":[138,3],"qadd":[139,1],"saturat":[139,4,140,4,141,4,142,4,143,4,144,4,145,4,146,4,147,4,148,4,212,5,213,5,281,4,282,4,283,4,284,4,285,4,286,4,289,5,290,5,448,3,449,3,450,3,451,3,452,3,453,3,454,3,455,3,456,5,457,5,458,3,459,3,460,3,461,3,462,3,463,3,464,3],"integer":[139,2,140,4,141,4,142,4,143,2,144,2,145,4,146,2,147,4,148,4,164,2,165,2,166,2,172,4,188,2,189,2,190,2,191,2,192,2,193,2,214,2,216,2,217,2,266,2,267,2,268,2,271,4,272,2,273,2,274,2,275,2,276,2,277,2,281,4,282,4,283,4,284,4,285,4,286,4,291,2,292,2,293,2,300,1,301,1,303,3,304,3,311,2,312,2,322,1,323,1,324,1,325,2,326,1,327,2,328,1,330,1,331,1,333,2,338,1,342,10,343,5,344,5,345,2,347,6,348,4,351,6,352,4,353,6,354,4,355,6,356,4,357,5,377,2,380,8,422,2,431,2,440,1,442,4,443,1,459,1,460,2,461,2,462,1,463,2,465,2,466,1,471,2,472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2,485,1,487,2,488,1,491,2,492,2,493,2,495,4,496,1,499,2,501,10,516,2,517,1,520,6,525,2,526,2,527,10,528,6,529,6,530,10],"231":[139,2,143,2,144,2,146,2],"saturation":[139,2,143,2,144,2,146,2,448,3,449,3,450,3,451,3,452,3,453,3,454,3,455,3,456,3,457,3,458,3,459,3,460,3,461,3,462,3,463,3,464,3],"31":[139,2,143,2,144,2,146,2,156,2,157,2],"qadd16":[140,1],"addition":[140,2,141,2,142,2,143,2,145,2,164,4,165,4,166,2,188,2,189,2,190,2,191,2,195,1,198,1,199,1,200,1,202,1,206,1,214,2,266,4,267,4,268,2,272,2,273,2,274,2,275,2,281,2,282,2,283,2,284,2,291,2,334,1,335,1,372,2,375,2,376,2],"215":[140,2,142,2,145,2,147,2],"15":[140,2,142,2,145,2,147,2],"qadd8":[141,1],"27":[141,2,148,2],"7":[141,2,148,2],"qasx":[142,1],"subtraction":[142,2,144,2,145,2,147,2,148,2,166,2,190,2,191,2,192,2,193,2,201,1,204,3,214,2,216,4,217,4,268,2,274,2,275,2,276,2,277,2,283,2,284,2,285,2,286,2,287,2,288,2,291,2,292,4,293,4],"qdadd":[143,1],"doubl":[143,6,144,6,301,1,304,1,340,2,380,2,417,1,419,1,450,4,451,4,452,4,453,4,456,4,457,4,458,4],"another":[143,2,144,2,146,2,252,2,253,2,254,2,294,2,295,2,296,2,300,2,301,2,302,2,303,2,304,2,360,2,372,2,373,2,375,2,416,2,467,2,489,2,491,2,502,2,515,2,516,2,517,2,518,2,519,2],"both":[143,2,144,2,194,1,313,2,336,1,337,1,518,2],"hav":[143,2,144,2,412,1,420,2],"their":[143,2,144,2,195,2,198,2,207,2,346,1,421,2],"either":[143,2,144,2,173,2,195,2,198,2,200,2,207,2,209,2,336,1,337,1,346,2,380,1,409,2,419,2,432,2,456,2,457,2,460,1,461,1,463,1,494,2,521,2],"qdsub":[144,1],"qsax":[145,1],"qsub":[146,1],"qsub16":[147,1],"qsub8":[148,1],"rbit":[149,1],"rev":[150,1],"rev16":[151,1],"each16":[151,2],"revsh":[152,1],"rfe":[153,2],"rfeda":[153,1],"rfedb":[153,1],"rfeia":[153,1],"rfeib":[153,1],"higher":[153,1,194,2,412,1,533,1,534,1],"ror":[154,1,155,1],"rotat":[154,6,155,6,156,2,157,2,179,2],"provid":[154,2,155,2,156,2,157,2,251,1,258,2],"off":[154,2,155,2],"vacat":[154,2,155,2],"rrx":[156,1,157,1],"plac":[156,2,157,2,302,2,303,2,304,2,305,2,310,2,311,2,312,2,313,2,314,2,315,2,317,2,330,2,333,2,338,2,341,2,342,2,343,2,344,2,345,2,347,2,348,2,351,2,352,2,353,2,354,2,355,2,356,2,357,2,365,2,366,2,372,2,377,2,378,2,407,2,415,2,421,2,426,2,428,2,430,2,431,2,432,2,433,2,437,2,439,2,441,2,442,2,443,2,448,2,449,2,451,2,452,2,453,2,455,2,458,2,459,2,460,2,461,2,462,2,463,2,464,2,465,2,466,2,467,2,468,2,469,2,470,2,471,2,485,2,486,2,487,2,488,2,489,2,491,2,495,2,496,2,497,2,498,2,499,2,515,2,516,2,517,2,518,2,519,2],"rsb":[158,3,159,3,160,2],"rsc":[161,3,162,3,163,2],"sadd16":[164,1],"accord":[164,2,165,2,166,2,173,2,214,2,216,2,217,2,266,2,267,2,268,2,291,2,292,2,293,2,494,2],"sadd8":[165,1],"sasx":[166,1],"sb":[167,4],"speculation":[167,5],"until":[167,1,533,2,534,2],"complet":[167,1],"later":[167,2],"particular":[167,1],"allocation":[167,2],"structur":[167,1,381,2,382,2,383,2,384,4,385,4,386,6,387,4,388,4,389,6,390,4,391,4,392,6,507,4,508,6,509,4,510,6,511,4,512,6],"entry":[167,1,251,1,533,1,534,1],"could":[167,1,535,2],"indicativ":[167,1],"present":[167,1],"stream":[167,2],"inform":[167,1],"taken":[167,1,194,4,195,2,198,2,200,2,207,2,209,2,251,1,350,1,359,1],"uncomplet":[167,1],"resourc":[167,1],"predict":[167,1],"fetch":[167,1],"sbc":[168,3,169,3,170,2],"sbfx":[171,1],"extract":[171,4,203,3,204,3,205,3,252,4,253,4,254,4,255,4,256,4,257,4,269,4,294,4,295,4,296,4,297,4,298,4,299,4,366,4],"sdiv":[172,1],"divid":[172,4,271,5,360,4,489,2],"sel":[173,1],"each":[173,2,253,2,256,2,295,2,298,2,305,2,306,2,307,2,308,2,309,2,312,2,318,2,319,2,320,2,321,1,322,2,323,2,324,2,325,2,326,2,327,2,328,2,329,2,330,2,331,2,332,2,333,2,334,1,335,1,338,2,339,2,341,2,342,2,345,2,347,2,351,2,353,2,355,2,361,2,362,2,377,2,378,2,383,2,386,2,389,2,392,2,396,2,397,2,399,2,400,2,421,2,422,2,428,2,430,2,432,2,433,2,444,2,445,2,446,2,447,2,448,2,454,2,455,2,459,2,460,2,461,2,462,2,463,2,465,2,466,2,467,2,468,2,469,2,470,2,471,2,485,2,486,2,487,2,488,2,489,2,490,2,491,2,492,2,493,2,495,3,496,2,497,2,498,2,499,2,500,4,503,2,504,4,506,2,508,2,510,2,512,2,517,2,520,2,524,2,525,2,526,2,528,2,529,2],"setend":[174,1],"endianness":[174,2],"setpan":[175,1],"privileg":[175,3],"never":[175,2],"pan":[175,2],"availabl":[175,1,194,1],"sev":[176,1,533,2],"send":[176,4,177,2,533,3],"hint":[176,2,177,2,533,2,534,2,535,4],"pes":[176,2,177,2],"multiprocessor":[176,2,177,2,533,2],"wait":[176,2,177,2,533,5,534,5],"sevl":[177,1],"locally":[177,2],"prim":[177,2],"wfe":[177,2,533,2],"sha1c":[178,1],"sha1":[178,2,179,2,180,2,181,2,182,2,183,2],"hash":[178,2,180,2,181,2,184,2,185,2],"choos":[178,2],"sha1h":[179,1],"fix":[179,2,343,1,344,1,345,8,346,14,357,1,380,2],"sha1m":[180,1],"majority":[180,2],"sha1p":[181,1],"parity":[181,2],"sha1su0":[182,1],"schedul":[182,2,183,2,186,2,187,2],"sha1su1":[183,1],"sha256h":[184,1],"sha256":[184,2,185,2,186,2,187,2],"sha256h2":[185,1],"sha256su0":[186,1],"sha256su1":[187,1],"shadd16":[188,1],"halv":[188,4,189,4,190,4,191,4,192,4,193,4,195,2,198,2,207,2,272,4,273,4,274,4,275,4,276,4,277,4,377,4,378,4,471,3],"shadd8":[189,1],"shasx":[190,1],"shsax":[191,1],"shsub16":[192,1],"shsub8":[193,1],"smc":[194,9],"hcr":[194,3,424,2],"tsc":[194,3],"scr":[194,5],"scd":[194,4],"smd":[194,1],"rather":[194,1],"smlabb":[195,1],"smlabt":[195,1],"smlatb":[195,1],"smlatt":[195,1],"quantity":[195,2,198,2,200,6,207,2,209,6],"half":[195,2,198,2,200,4,207,2,209,4,312,4,339,2,341,6,349,4,350,2,358,4,359,2,417,1,419,1,422,2,452,4,454,1,456,4,457,4,458,4,460,1,463,1,465,4,487,1,491,4,499,1,517,4],"respectiv":[195,2,198,2,207,2],"ignor":[195,2,198,2,200,4,207,2,209,4,346,1],"ad":[195,2,200,2,203,1,204,1,205,1,313,2,314,2,361,2,362,2,412,2,501,2,527,2,530,2],"overflow":[195,2,196,2,198,2,199,2,200,2,201,2,202,2,206,2,207,2,209,2,210,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,459,1,460,1,461,1,462,1,463,1,464,1],"dur":[195,2,196,1,198,1,199,1,200,2,201,1,202,1,207,2,209,2],"multiplication":[195,1,196,4,199,3,200,1,201,4,202,3,206,4,210,3,334,1,335,1,339,1,350,1,359,1,368,1,369,1],"smlad":[196,1],"smladx":[196,1],"produc":[196,1,197,2,198,2,199,1,201,1,202,1,206,1,208,2,210,1,278,2,279,2,280,2],"smlal":[197,2],"long":[197,2,198,2,199,2,202,2,208,2,278,2,279,2,280,2,301,2,304,2,313,2,368,2,369,2,370,2,371,2,373,2,374,2,405,4,406,4,410,4,411,4,421,2,429,4,430,4,440,2,443,2,450,2,451,2,453,2,497,2,518,2],"smlalbb":[198,1],"smlalbt":[198,1],"smlaltb":[198,1],"smlaltt":[198,1],"detect":[198,1,199,1,202,1],"instead":[198,1,199,1,202,1,203,1,204,1,205,1,450,1,451,1,452,1,453,1,458,1],"wrap":[198,1,199,1,202,1],"around":[198,1,199,1,202,1],"modulo":[198,1,199,1,202,1,380,2],"smlald":[199,1],"smlaldx":[199,1],"smlawb":[200,1],"smlawt":[200,1],"48":[200,4,209,4],"smlsd":[201,1],"smlsdx":[201,1],"smlsld":[202,1],"smlsldx":[202,1],"smmla":[203,1],"smmlar":[203,1],"most":[203,4,204,4,205,4,312,2,333,2,452,2,456,2,457,2,458,2,465,2,491,2,517,2],"truncat":[203,1,204,1,205,1,312,2,377,2,378,2,452,2,458,2,459,1,460,1,462,1,463,2,465,2,471,1,485,2,486,2,487,2,490,2,491,2,496,2,498,2,499,2,503,2,517,2],"cas":[203,1,204,1,205,1,251,2],"0x80000000":[203,1,204,1,205,1],"high":[203,1,204,1,205,1,312,2,412,1,452,2,456,2,457,2,458,2,465,2,491,2,517,2],"smml":[204,1],"smmlsr":[204,1],"smmul":[205,1],"smmulr":[205,1],"smuad":[206,1],"smuadx":[206,1],"together":[206,2,287,2,376,2,434,2,435,2,436,2],"smulbb":[207,1],"smulbt":[207,1],"smultb":[207,1],"smultt":[207,1],"smull":[208,2],"smulwb":[209,1],"smulwt":[209,1],"smusd":[210,1],"smusdx":[210,1],"srs":[211,4],"srsda":[211,1],"srsdb":[211,1],"srsia":[211,1],"srsib":[211,1],"functionality":[211,1],"ssat":[212,1],"selectabl":[212,2],"ssat16":[213,1],"ssax":[214,1],"ssbb":[215,1],"virtual":[215,2],"under":[215,2],"certain":[215,2],"ssub16":[216,1],"ssub8":[217,1],"stc":[218,4],"dbgdtrrxint":[218,3],"stl":[219,1],"stlb":[220,1],"stlex":[221,1],"successful":[221,2,222,2,223,2,224,2,238,2,239,2,240,2,241,2],"stlexb":[222,1],"stlexd":[223,1],"stlexh":[224,1],"stlh":[225,1],"stm":[226,2,227,1,228,2,229,1,230,1],"stmea":[226,1],"stmia":[226,1],"detail":[226,1,228,1,229,1,230,1,381,2,382,2,383,2,384,2,385,2,386,2,387,2,388,2,389,2,390,2,391,2,392,2,448,2,449,2,450,2,451,2,452,2,453,2,454,2,455,2,456,2,457,2,458,2,459,2,460,2,461,2,462,2,463,2,464,2,466,1,467,1,488,1,489,1,505,2,506,2,507,2,508,2,509,2,510,2,511,2,512,2],"stmda":[228,1],"stmdb":[229,1],"stmfd":[229,1],"stmfa":[230,1],"stmib":[230,1],"str":[231,1,232,1],"strb":[233,1,234,1],"strbt":[235,2],"strd":[236,1,237,1],"strex":[238,1],"strexb":[239,1],"strexd":[240,1],"strexh":[241,1],"strh":[242,1,243,1],"strht":[244,2],"strt":[245,2],"sub":[246,3,247,3,248,2,249,3,250,3],"svc":[251,5],"supervisor":[251,8],"swi":[251,1],"nam":[251,1],"still":[251,1],"found":[251,1],"documentation":[251,1],"operat":[251,1,321,1,334,1,335,1],"0x11":[251,1],"sxtab":[252,1],"final":[252,2,253,2,254,2,294,2,295,2,296,2,377,2,378,2,452,2,456,2,457,2,458,2,471,2,491,2,517,2],"rotation":[252,2,253,2,254,2,255,2,256,2,257,2,294,2,295,2,296,2,297,2,298,2,299,2],"24":[252,2,253,2,254,2,255,2,256,2,257,2,294,2,295,2,296,2,297,2,298,2,299,2],"sxtab16":[253,1],"sxtah":[254,1],"sxtb":[255,1],"sxtb16":[256,1],"sxth":[257,1],"tbb":[258,1],"tbh":[258,1],"tabl":[258,10,522,5],"pointer":[258,2],"supply":[258,2],"length":[258,2,300,1,301,2,303,1,304,2,421,2,440,1,443,1,454,1,497,1],"twic":[258,2,405,2,406,2,410,2,411,2,421,2,429,2,430,2,440,1,443,1,497,1],"teq":[259,1,260,1,261,1],"test":[259,2,260,2,261,2,263,2,264,2,265,2,524,2],"equivalenc":[259,2,260,2,261,2],"tsb":[262,1],"csync":[262,1],"trac":[262,4],"synchroniz":[262,2],"trf":[262,1],"uadd16":[266,1],"uadd8":[267,1],"uasx":[268,1],"ubfx":[269,1],"udf":[270,2],"permanently":[270,3],"udiv":[271,1],"uhadd16":[272,1],"uhadd8":[273,1],"uhasx":[274,1],"uhsax":[275,1],"uhsub16":[276,1],"uhsub8":[277,1],"umaal":[278,1],"umlal":[279,2],"umull":[280,2],"uqadd16":[281,1],"216":[281,1,283,1,284,1,285,1],"uqadd8":[282,1],"28":[282,1,286,1],"uqasx":[283,1],"uqsax":[284,1],"uqsub16":[285,1],"uqsub8":[286,1],"usad8":[287,1],"sum":[287,2,288,2,361,2,362,2,407,1,434,1],"absolut":[287,4,288,4,300,4,301,4,302,4,303,4,304,4,305,4,306,6,307,6,308,6,309,6,448,4],"usada8":[288,1],"usat":[289,1],"usat16":[290,1],"usax":[291,1],"usub16":[292,1],"usub8":[293,1],"uxtab":[294,1],"uxtab16":[295,1],"uxtah":[296,1],"uxtb":[297,1],"uxtb16":[298,1],"uxth":[299,1],"vaba":[300,1],"vector":[300,8,301,8,302,8,303,8,304,8,305,6,306,12,307,12,308,8,309,8,310,6,311,6,312,6,313,6,314,6,315,2,316,4,317,2,318,2,319,2,320,2,321,2,322,9,323,11,324,9,325,11,326,9,327,11,328,9,329,8,330,9,331,9,332,8,333,9,334,2,335,2,336,2,337,2,338,8,339,10,341,6,342,7,345,7,347,9,351,9,353,9,355,9,361,12,362,12,363,5,364,9,365,2,366,7,367,6,368,4,369,6,370,8,371,6,372,10,373,10,374,6,375,2,376,2,377,6,378,4,379,2,382,2,396,7,397,9,399,7,400,9,402,6,403,6,404,6,405,8,406,8,407,8,408,6,409,6,410,8,411,8,412,6,417,2,419,2,421,6,422,7,423,2,426,6,427,4,428,6,429,6,430,8,431,2,432,2,433,6,434,2,435,2,436,2,437,2,438,4,439,2,440,7,441,7,442,7,443,7,444,6,445,6,446,6,447,6,448,6,449,6,450,7,451,9,452,7,453,7,454,9,455,6,456,10,457,10,458,7,459,8,460,6,461,6,462,8,463,6,464,8,465,6,466,6,467,8,468,6,469,6,470,6,471,6,472,4,474,4,476,4,478,4,481,4,483,4,485,8,486,6,487,6,488,6,489,8,490,6,491,8,492,2,495,6,496,8,497,6,498,6,499,6,500,6,501,6,503,6,504,6,515,8,516,8,517,8,518,8,519,8,521,6,522,7,523,5,524,11,525,2,527,6,528,2,530,6,531,5,532,5],"element":[300,7,301,8,302,7,303,7,304,8,305,2,306,9,307,9,308,6,309,6,310,2,311,2,312,3,313,4,314,4,321,5,322,7,323,9,324,7,325,9,326,7,327,9,328,7,329,6,330,5,331,7,332,6,333,5,334,5,335,6,338,4,339,6,341,2,342,3,345,3,347,5,351,5,353,5,355,5,361,8,362,10,363,6,364,7,366,3,367,4,368,4,369,6,370,2,371,4,372,6,373,2,374,4,377,3,378,5,381,8,382,6,383,6,384,8,385,4,386,8,387,8,388,4,389,8,390,8,391,4,392,8,396,5,397,7,399,5,400,7,402,4,403,4,404,4,405,8,406,8,407,4,408,4,409,4,410,8,411,8,412,2,415,2,417,2,419,2,421,2,422,5,426,2,427,2,428,2,429,6,430,6,431,2,433,2,440,7,441,3,442,3,443,5,444,4,445,4,446,4,447,4,448,2,449,2,450,4,451,4,452,2,453,2,454,7,455,2,456,8,457,8,458,2,459,5,460,8,461,8,462,5,463,8,464,5,465,3,466,3,467,7,468,2,469,2,470,2,471,3,485,5,486,3,487,5,488,3,489,7,490,3,491,5,492,10,493,10,495,4,496,5,497,5,498,3,499,5,500,5,501,2,503,3,504,5,505,6,506,6,507,6,508,8,509,6,510,8,511,6,512,8,515,4,516,4,517,4,518,6,519,6,520,6,522,1,523,5,524,9,525,10,526,10,527,2,528,6,529,6,530,2,531,3,532,3],"vabal":[301,1],"vabd":[302,1,303,1],"vabdl":[304,1],"vab":[305,1],"vacg":[306,1],"greater":[306,4,307,4,324,4,325,4,326,4,327,4],"equal":[306,4,308,4,322,4,323,4,324,4,325,4,328,4,329,4,481,2,482,2],"otherwis":[306,2,307,2,308,2,309,2,318,2,319,2,320,2,322,2,323,2,324,2,325,2,326,2,327,2,328,2,329,2,331,2,332,2,398,1,401,1,459,2,462,2,524,2,533,1,534,1],"quadword":[306,1,307,1,312,2,313,2,314,4,365,2,421,2,422,2,432,2,437,2,439,2,440,1,443,1,450,2,451,4,453,2,454,1,460,2,463,2,465,2,491,4,497,2,517,4,518,2,519,4,521,2],"must":[306,1,307,1,338,1,365,2,437,2,439,2,442,1,460,2,461,2,463,2,464,1,486,1,490,1,495,1,498,1,500,1,503,1,504,1],"vacgt":[307,1],"vacl":[308,1],"less":[308,4,309,4,321,1,328,4,329,4,331,4,332,4,334,1,335,1],"vaclt":[309,1],"vadd":[310,1,311,1],"vaddhn":[312,1,465,2],"narrow":[312,2,422,2,454,2,460,2,463,2,465,2,487,2,491,2,499,2,517,2],"vraddhn":[312,2,465,1],"ther":[312,1,333,1,363,1,364,1,366,1,378,2,422,1,442,1,465,1,468,1,469,1,470,1,487,1,491,1,495,1,499,1,500,1,504,1,517,1,521,2,523,1,531,1,532,1,533,2,534,2],"distinction":[312,1,333,1,363,1,364,1,366,1,422,1,442,1,465,1,468,1,469,1,470,1,487,1,491,1,495,1,499,1,500,1,504,1,517,1,521,2,523,1,531,1,532,1],"between":[312,1,315,2,316,2,317,2,333,1,340,2,341,2,342,2,343,2,344,2,345,2,346,2,357,2,363,1,364,1,365,2,366,1,416,2,422,1,437,2,438,2,439,2,442,1,465,1,468,1,469,1,470,1,487,1,491,1,495,1,499,1,500,1,504,1,517,1,521,2,523,1,531,1,532,1],"vaddl":[313,1],"vaddw":[314,1],"wid":[314,2,519,2],"vand":[315,1],"vbic":[316,1,317,1],"vbif":[318,1],"fals":[318,2],"vbit":[319,1],"tru":[319,2],"vbsl":[320,1],"original":[320,2,421,2],"vcadd":[321,1],"complex":[321,4,334,4,335,5],"represent":[321,1,334,1,335,1],"pair":[321,2,334,2,335,1,361,6,362,8,396,2,397,2,399,2,400,2,420,4,440,2,441,2,442,2,443,2,444,4,445,4,446,4,447,4],"imaginary":[321,1,334,1,335,1],"real":[321,1,334,1,335,1],"computation":[321,1,334,1,335,1],"vceq":[322,1,323,1],"typ":[322,1,323,1,324,1,325,1,326,1,327,1,328,1,330,1,331,1,333,1,337,1,342,1,345,1,363,1,364,1,366,1,377,1,378,1,442,1,459,1,462,1,464,1,466,1,468,1,469,1,470,1,471,1,485,1,488,1,490,1,496,1,500,1,503,1,504,1,521,2,523,1,531,1,532,1],"vcg":[324,1,325,1],"vcgt":[326,1,327,1],"vcl":[328,1,329,1,330,1],"topmost":[330,6],"vclt":[331,1,332,1],"vclz":[333,1],"vcmla":[334,1,335,1],"fus":[334,1,335,1,367,2,368,1,369,1,372,2,375,2,376,2],"intermediat":[334,1,335,1,368,1,369,1],"vcmp":[336,1,337,1],"fpscr":[336,2,337,2,339,1,344,2,350,3,357,2,359,3,361,2,362,2,368,1,369,1,380,1,412,2,424,5,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,459,1,460,1,461,1,462,1,463,1,464,1,480,2,482,2],"vmr":[336,2,337,2,424,3],"rais":[336,1,337,3,481,2,482,2],"invalid":[336,1,337,3],"nan":[336,1,337,3,398,2,401,2,472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2],"vcnt":[338,1],"vcvt":[339,1,340,1,341,1,342,1,343,2,344,2,345,1,346,1,357,1],"convert":[339,4,340,2,341,4,342,4,343,4,344,4,345,4,346,4,347,4,348,4,349,2,350,2,351,4,352,4,353,4,354,4,355,4,356,4,357,4,358,2,359,2,380,4],"precision":[339,4,340,4,341,12,349,4,350,7,358,4,359,7,361,4,362,4,368,4,369,4,380,2,412,4,417,1,419,1,420,4],"bfloat16":[339,5,350,3,359,3,361,2,362,4,368,5,369,5,412,2],"format":[339,2,350,2,359,2,368,2,369,2],"width":[339,2,346,2,460,1,463,1],"unlik":[339,1,350,1,359,1,368,1,369,1],"nearest":[339,1,342,1,345,1,346,1,347,4,348,4,353,4,354,4,368,1,369,1,472,4,473,4,476,4,477,4,481,2],"cumulativ":[339,1,350,1,359,1,368,1,369,1,448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,459,1,460,1,461,1,462,1,463,1,464,1],"distinct":[342,1,345,1,347,1,351,1,353,1,355,1,464,2],"toward":[342,1,343,4,345,1,346,1,351,4,352,4,355,4,356,4,380,4,407,2,434,2,472,2,474,4,475,4,478,4,479,4,483,4,484,4],"conversion":[343,1,344,1,346,3,357,1],"remain":[346,1,379,2,423,2,533,2,534,2],"vcvta":[347,1,348,1],"tie":[347,4,348,4,472,4,473,4],"away":[347,4,348,4,472,4,473,4],"vcvtb":[349,1,350,1],"preserv":[350,2,359,2,379,2],"honor":[350,1,359,1],"apply":[350,1,359,1],"synchronous":[350,1,359,1,380,1],"vcvtm":[351,1,352,1],"infinity":[351,4,352,4,355,4,356,4,407,2,434,2,474,4,475,4,478,4,479,4],"vcvtn":[353,1,354,1],"vcvtp":[355,1,356,1],"vcvtr":[357,1],"vcvtt":[358,1,359,1],"vdiv":[360,1],"vdot":[361,1,362,1,412,1],"bf16":[361,6,362,2,412,5],"dot":[361,2,362,2,412,2,492,4,493,4,501,2,520,4,525,4,526,4,527,2,528,4,529,4,530,2],"delimit":[361,2,362,2],"within":[361,2],"multipli":[361,2,362,2,405,2,406,2,410,2,411,2,429,2,430,2],"destructively":[361,2,362,2,412,2,501,2,527,2,530,2],"vdup":[363,1,364,1],"duplicat":[363,4,364,4],"every":[363,2,364,2,382,2,383,2,386,2,389,2,392,2,415,2,431,2,506,2,508,2,510,2,512,2],"scalar":[364,3,371,2,374,2,404,4,406,4,409,4,411,4,417,4,419,4,428,4,430,4,450,3,451,3,452,3,453,3,458,3],"veor":[365,1],"vext":[366,1],"concatenat":[366,2],"vfma":[367,1],"accumulation":[367,2,370,2,371,2,373,2,374,2],"vfmab":[368,1,369,1],"vfmat":[368,1,369,1],"widen":[368,4,369,4,501,2,527,2,530,2],"odd":[368,2,369,2],"overlap":[368,2,369,2],"vfmal":[370,1,371,1],"accumulator":[370,2,371,2,373,2,374,2,501,2,527,2,530,2],"4":[370,1,371,1,373,1,374,1,390,4,391,4,392,4,412,2,492,1,493,1,511,4,512,4,525,1,526,1],"isar6":[370,1,371,1,373,1,374,1,492,1,493,1,501,1,520,1,525,1,526,1,527,1,528,1,529,1,530,1],"fhm":[370,1,371,1,373,1,374,1],"vfm":[372,1],"negat":[372,2,373,2,374,2,375,4,376,2,433,4,434,2,435,2,436,2,455,4],"vfmsl":[373,1,374,1],"vfnma":[375,1],"negation":[375,2,376,2,434,4,435,2,436,2],"vfnm":[376,1],"vhadd":[377,1,471,1],"vrhadd":[377,2,471,1],"vhsub":[378,1],"vin":[379,1],"insertion":[379,2],"upper":[379,2,417,1,419,1,423,2],"whil":[379,2,423,2],"vjcvt":[380,1],"javascript":[380,2],"too":[380,2],"larg":[380,2],"accommodat":[380,2],"232":[380,1],"vld1":[381,1,382,1,383,1],"lan":[381,2,382,2,384,2,385,4,387,2,388,4,390,2,391,4,505,2,507,2,509,2,511,2],"replicat":[382,2,385,2,388,2,391,2],"thre":[383,4,387,4,388,4,389,4,506,4,509,4,510,4],"de":[383,2,386,2,389,2,392,2,531,2],"interleav":[383,2,386,2,389,2,392,2,506,2,508,2,510,2,512,2,531,2,532,2],"vld2":[384,1,385,1,386,1],"vld3":[387,1,388,1,389,1],"vld4":[390,1,391,1,392,1],"vldm":[393,1],"vldmdb":[393,1],"vldmia":[393,1],"vldr":[394,1,395,1],"vmax":[396,1,397,1,398,1],"maximum":[396,2,397,2,398,2,444,2,445,2],"larger":[396,2,397,2,444,2,445,2],"vmaxnm":[398,1],"handl":[398,1,401,1],"consistenc":[398,1,401,1],"ieee754":[398,1,401,1],"2008":[398,1,401,1],"numerical":[398,2,401,2],"quiet":[398,1,401,1],"identical":[398,1,401,1,417,1,419,1],"vmin":[399,1,400,1,401,1],"minimum":[399,2,400,2,401,2,446,2,447,2],"smaller":[399,2,400,2,446,2,447,2],"vminnm":[401,1],"vmla":[402,1,403,1,404,1],"vmlal":[405,1,406,1],"vml":[407,2,408,1,409,1],"plus":[407,1,434,1],"minus":[407,1,434,1],"opposit":[407,1,434,1],"direction":[407,1,434,1],"defeat":[407,1,434,1],"vmlsl":[410,1,411,1],"vmmla":[412,2],"matrix":[412,10,501,10,527,10,530,10],"2x4":[412,2],"128":[412,6],"4x2":[412,2],"2x2":[412,4,501,2,527,2,530,2],"equivalent":[412,2,501,2,527,2,530,2],"way":[412,2,501,2,522,1,527,2,530,2],"per":[412,2,501,2,527,2,530,2],"deliver":[412,1],"peak":[412,1],"throughput":[412,2],"achiev":[412,1],"goal":[412,1],"should":[412,1],"significantly":[412,1],"vmov":[413,1,414,1,415,1,416,1,417,1,418,1,419,1,420,1],"consecutively":[420,2],"contiguous":[420,2],"vmovl":[421,1],"vmovn":[422,1],"vmovx":[423,1],"extraction":[423,2],"tid0":[424,2],"fpsid":[424,1],"group":[424,1],"primary":[424,1],"devic":[424,1],"identification":[424,1],"vmsr":[425,1],"vmul":[426,1,427,1,428,1],"over":[427,1,429,1],"vmull":[429,1,430,1],"vmvn":[431,1,432,1],"invert":[432,2,433,2],"vneg":[433,1],"vnmla":[434,2],"vnml":[435,1],"vnmul":[436,1],"vorn":[437,1],"vorr":[438,1,439,1],"vpadal":[440,1],"pairwis":[440,2,441,2,442,2,443,2,444,2,445,2,446,2,447,2],"vpadd":[441,1,442,1],"vpaddl":[443,1],"vpmax":[444,1,445,1],"vpmin":[446,1,447,1],"vqab":[448,1],"qc":[448,1,449,1,450,1,451,1,452,1,453,1,454,1,455,1,456,1,457,1,458,1,459,1,460,1,461,1,462,1,463,1,464,1],"vqadd":[449,1],"vqdmlal":[450,1],"vqdmlsl":[451,1],"vqdmulh":[452,1,458,2],"vqrdmulh":[452,2,458,1],"vqdmull":[453,1],"vqmovn":[454,1],"vqmovun":[454,1],"vqneg":[455,1],"vqrdmlah":[456,1],"vqrdmlsh":[457,1],"vqrshl":[459,1,462,1],"positiv":[459,2,462,2,485,2,496,2],"vqshl":[459,1,461,1,462,1],"vqrshrn":[460,1,463,1],"vqrshrun":[460,1,463,1],"vqshrn":[460,1,463,1],"vqshrun":[460,1,463,1],"vqshlu":[461,1],"vqsub":[464,1],"vrecp":[466,1,467,1],"reciprocal":[466,5,467,3,488,5,489,3],"estimat":[466,3,467,1,488,3,489,1],"find":[466,2,488,2],"approximat":[466,2,488,2],"squar":[466,1,488,4,489,2,502,4],"root":[466,1,488,4,489,2,502,4],"step":[466,1,467,3,488,1,489,3],"vrev16":[468,1],"vrev32":[469,1],"vrev64":[470,1],"vrinta":[472,1,473,1],"integral":[472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2],"giv":[472,4,473,4,474,4,475,4,476,4,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4],"infinit":[472,4,473,4,474,4,475,4,476,4,477,4,478,4,479,4,480,4,481,4,482,4,483,4,484,4],"propagat":[472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2],"normal":[472,2,473,2,474,2,475,2,476,2,477,2,478,2,479,2,480,2,481,2,482,2,483,2,484,2],"vrintm":[474,1,475,1],"vrintn":[476,1,477,1],"vrintp":[478,1,479,1],"vrintr":[480,1],"vrintx":[481,1,482,1],"inexact":[481,4,482,4],"numerically":[481,2,482,2],"vrintz":[483,1,484,1],"vrshl":[485,1,496,1],"vshl":[485,2,495,1,496,1],"vrshr":[486,1,498,2],"vshr":[486,2,498,1],"vrshrn":[487,1,499,2],"vshrn":[487,2,499,1],"vrsqrt":[488,1,489,1],"vrsra":[490,1,503,2],"vsra":[490,2,503,1],"vrsubhn":[491,1,517,2],"vsubhn":[491,2,517,1],"vsdot":[492,1,493,1],"dp":[492,1,493,1,525,1,526,1],"vseleq":[494,1],"vselg":[494,1],"vselgt":[494,1],"vselv":[494,1],"out":[495,1,500,2,504,2,522,3,535,2],"lost":[495,1,500,2,504,2],"vshll":[497,1],"vsli":[500,1],"vsmmla":[501,1],"2x8":[501,2,527,2,530,2],"8x2":[501,2,527,2,530,2],"i8mm":[501,1,520,1,527,1,528,1,529,1,530,1],"vsqrt":[502,1],"vsri":[504,1],"vst1":[505,1,506,1],"vst2":[507,1,508,1],"vst3":[509,1,510,1],"vst4":[511,1,512,1],"vstm":[513,1],"vstmdb":[513,1],"vstmia":[513,1],"vstr":[514,1],"vsub":[515,1,516,1],"vsubl":[518,1],"vsubw":[519,1],"vsudot":[520,1],"vswp":[521,1],"swap":[521,2,535,2],"vtbl":[522,1],"vtbx":[522,1],"lookup":[522,2],"look":[522,2],"work":[522,1],"vtrn":[523,1],"transpos":[523,4],"matric":[523,4],"vtst":[524,1],"vudot":[525,1,526,1],"vummla":[527,1],"vusdot":[528,1,529,1],"vusmmla":[530,1],"vuzp":[531,1],"unzip":[531,2],"vzip":[532,1],"zip":[532,2],"enter":[533,2,534,2],"power":[533,3,534,3],"wakeup":[533,4,534,2],"wfi":[534,2],"yield":[535,6],"multithread":[535,2],"capability":[535,4],"task":[535,2],"exampl":[535,2],"spin":[535,2],"lock":[535,2],"improv":[535,2],"overall":[535,2],"suspend":[535,2],"resum":[535,2],"thread":[535,2]}};
+export default segment;
@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"1b9def0546d12ddddb53910502fb330740e5c811","docs":[["ADC","Add with Carry"],["ADD","Add without Carry"],["ADIW","Add Immediate to Word"],["AND","Logical AND"],["ANDI","Logical AND with Immediate"],["ASR","Arithmetic Shift Right"],["BCLR","Bit Clear in SREG"],["BLD","Bit Load from the T Bit in SREG to a Bit in Register"],["BRBC","Branch if Bit in SREG is Cleared"],["BRBS","Branch if Bit in SREG is Set"],["BRCC","Branch if Carry Cleared"],["BRCS","Branch if Carry Set"],["BREAK","Break"],["BREQ","Branch if Equal"],["BRGE","Branch if Greater or Equal (Signed)"],["BRHC","Branch if Half Carry Flag is Cleared"],["BRHS","Branch if Half Carry Flag is Set"],["BRID","Branch if Global Interrupt is Disabled"],["BRIE","Branch if Global Interrupt is Enabled"],["BRLO","Branch if Lower (Unsigned)"],["BRLT","Branch if Less Than (Signed)"],["BRMI","Branch if Minus"],["BRNE","Branch if Not Equal"],["BRPL","Branch if Plus"],["BRSH","Branch if Same or Higher (Unsigned)"],["BRTC","Branch if the T Bit is Cleared"],["BRTS","Branch if the T Bit is Set"],["BRVC","Branch if Overflow Cleared"],["BRVS","Branch if Overflow Set"],["BSET","Bit Set in SREG"],["BST","Bit Store from Bit in Register to T Bit in SREG"],["CALL","Long Call to a Subroutine"],["CBI","Clear Bit in I/O Register"],["CBR","Clear Bits in Register"],["CLC","Clear Carry Flag"],["CLH","Clear Half Carry Flag"],["CLI","Clear Global Interrupt Enable Bit"],["CLN","Clear Negative Flag"],["CLR","Clear Register"],["CLS","Clear Sign Flag"],["CLT","Clear T Bit"],["CLV","Clear Overflow Flag"],["CLZ","Clear Zero Flag"],["COM","One’s Complement"],["CP","Compare"],["CPC","Compare with Carry"],["CPI","Compare with Immediate"],["CPSE","Compare Skip if Equal"],["DEC","Decrement"],["DES","Data Encryption Standard"],["EICALL","Extended Indirect Call to Subroutine"],["EIJMP","Extended Indirect Jump"],["ELPM","Extended Load Program Memory"],["EOR","Exclusive OR"],["FMUL","Fractional Multiply Unsigned"],["FMULS","Fractional Multiply Signed"],["FMULSU","Fractional Multiply Signed with Unsigned"],["ICALL","Indirect Call to Subroutine"],["IJMP","Indirect Jump"],["IN","Load an I/O Location to Register"],["INC","Increment"],["JMP","Jump"],["LAC","Load and Clear"],["LAS","Load and Set"],["LAT","Load and Toggle"],["LD","Load Indirect from Data Space to Register using X"],["LDI","Load Immediate"],["LDS","Load Direct from Data Space"],["LPM","Load Program Memory"],["LSL","Logical Shift Left"],["LSR","Logical Shift Right"],["MOV","Copy Register"],["MOVW","Copy Register Word"],["MUL","Multiply Unsigned"],["MULS","Multiply Signed"],["MULSU","Multiply Signed with Unsigned"],["NEG","Two’s Complement"],["NOP","No Operation"],["OR","Logical OR"],["ORI","Logical OR with Immediate"],["OUT","Store Register to I/O Location"],["POP","Pop Register from Stack"],["PUSH","Push Register on Stack"],["RCALL","Relative Call to Subroutine"],["RET","Return from Subroutine"],["RETI","Return from Interrupt"],["RJMP","Relative Jump"],["ROL","Rotate Left trough Carry"],["ROR","Rotate Right through Carry"],["SBC","Subtract with Carry"],["SBCI","Subtract Immediate with Carry SBI – Set Bit in I/O Register"],["SBI","Set Bit in I/O Register"],["SBIC","Skip if Bit in I/O Register is Cleared"],["SBIS","Skip if Bit in I/O Register is Set"],["SBIW","Subtract Immediate from Word"],["SBR","Set Bits in Register"],["SBRC","Skip if Bit in Register is Cleared"],["SBRS","Skip if Bit in Register is Set"],["SEC","Set Carry Flag"],["SEH","Set Half Carry Flag"],["SEI","Set Global Interrupt Enable Bit"],["SEN","Set Negative Flag"],["SER","Set all Bits in Register"],["SES","Set Sign Flag"],["SET","Set T Bit"],["SEV","Set Overflow Flag"],["SEZ","Set Zero Flag"],["SPM","Store Program Memory"],["ST","Store Indirect From Register to Data Space using Index X"],["STS","Store Direct to Data Space"],["SUB","Subtract Without Carry"],["SUBI","Subtract Immediate"],["SWAP","Swap Nibbles"],["TST","Test for Zero or Minus"],["WDR","Watchdog Reset"],["XCH","Exchange"]],"lengths":[14,15,33,14,15,36,8,18,37,37,41,41,51,67,69,44,44,44,44,67,68,40,69,40,70,41,41,41,41,9,17,36,22,29,15,17,35,15,21,15,14,15,15,11,20,26,20,17,49,144,49,40,120,16,194,154,208,49,38,14,49,20,74,73,72,195,11,78,112,27,32,21,40,52,40,47,15,9,14,15,15,24,24,51,17,40,34,34,48,14,21,22,29,29,33,28,15,15,15,17,24,15,15,15,14,15,15,143,177,78,12,24,8,21,21,61],"postings":{"adc":[0,1],"add":[0,2,1,3,2,2,60,1],"carry":[0,1,1,1,5,1,10,2,11,2,15,2,16,2,19,1,24,1,34,2,35,2,45,2,49,1,54,1,56,1,87,1,88,2,89,1,90,1,98,2,99,2,110,1],"two":[0,1,1,1,5,1,8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,44,1,45,1,47,1,48,1,54,2,55,3,56,3,60,1,69,1,70,1,73,1,74,1,75,1,76,2,87,1,88,2,89,1,110,1],"register":[0,2,1,2,2,4,3,3,4,2,7,3,30,2,32,3,33,4,34,1,35,1,36,1,37,1,38,4,39,1,40,1,41,1,42,1,43,1,44,2,45,2,46,2,47,1,48,2,49,5,50,3,51,3,52,5,53,3,54,1,55,1,56,1,57,3,58,3,59,3,60,2,62,6,63,6,64,6,65,9,66,1,67,4,68,4,71,4,72,5,73,1,74,1,75,1,76,1,78,3,79,2,80,3,81,2,82,2,85,1,89,2,90,3,91,3,92,3,93,3,94,4,95,4,96,2,97,2,98,1,99,1,100,1,101,1,102,2,103,1,104,1,105,1,106,1,107,6,108,9,109,4,110,2,111,3,112,1,113,3,115,5],"content":[0,1,3,1,4,1,33,1,48,1,53,1,60,1,76,1,78,1,79,1,82,1,95,1],"c":[0,1,1,1,5,1,10,2,11,2,19,2,24,2,34,1,48,1,60,1,69,1,70,2,87,2,88,2,89,1,90,1,98,1],"flag":[0,1,1,1,5,2,6,1,10,1,11,1,13,1,14,1,15,2,16,2,19,1,20,1,21,1,22,1,23,1,24,1,27,1,28,1,29,1,34,2,35,2,37,2,39,2,41,2,42,2,48,1,49,1,60,1,69,1,70,2,87,2,88,3,89,1,90,1,98,2,99,2,101,2,103,2,105,2,106,2],"plac":[0,1,1,1,2,1,3,1,4,1,5,1,33,1,48,1,49,4,52,1,53,1,54,1,55,1,56,1,60,1,69,1,70,1,73,1,74,1,75,1,78,1,79,1,87,1,88,1,89,1,90,1,94,1,95,1,110,1,111,1],"result":[0,1,1,1,2,1,3,1,4,1,5,1,33,1,48,1,49,3,52,1,53,1,54,5,55,4,56,5,60,1,65,1,68,1,70,1,73,1,78,1,79,1,88,1,89,1,90,1,94,1,95,1,108,1,110,1,111,1],"destination":[0,1,1,1,3,1,4,1,8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,48,1,52,1,53,1,60,1,68,1,71,1,72,1,78,1,79,1,89,1,90,1,95,1,110,1,111,1],"rd":[0,1,1,1,3,2,4,2,5,1,7,1,13,1,14,1,19,1,20,1,22,1,24,1,30,1,33,4,38,2,43,1,44,1,45,1,46,1,47,2,48,2,52,1,53,2,54,1,55,1,56,2,59,1,60,2,68,1,69,1,70,1,71,1,72,2,73,1,74,1,75,2,76,1,78,2,79,2,81,1,87,2,88,2,89,1,90,1,95,4,102,2,110,1,111,1,113,2],"without":[1,2,5,1,110,1],"adiw":[2,1],"immediat":[2,2,4,1,46,1,66,1,79,1,90,1,94,2,111,1],"word":[2,1,50,1,51,1,52,1,57,1,58,1,61,1,68,2,72,1,83,2,86,2,94,1,107,3],"valu":[2,1,5,1,48,2,52,1,60,1,68,1,69,1,70,1,76,1,87,1,88,2,94,1],"0":[2,1,5,1,10,1,11,1,19,1,24,1,32,1,34,1,52,1,68,1,69,1,70,1,87,1,88,1,91,1,92,1,93,1,94,1,98,1,107,1],"63":[2,1,8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,94,1],"pair":[2,3,72,4,94,3,107,2],"instruction":[2,2,8,1,9,1,10,2,11,2,12,4,13,4,14,4,15,2,16,2,17,2,18,2,19,4,20,4,21,2,22,4,23,2,24,4,25,2,26,2,27,2,28,2,31,2,32,1,34,1,35,1,36,3,37,1,38,2,39,1,40,1,41,1,42,1,43,1,44,2,45,2,46,2,47,2,48,1,49,4,50,2,51,2,52,4,54,4,55,3,56,4,57,1,58,1,60,1,61,1,62,2,63,2,64,2,65,3,67,2,68,4,71,1,72,2,73,2,74,2,75,2,77,1,81,2,82,2,83,2,86,1,91,1,92,3,93,3,94,2,96,2,97,2,98,1,99,1,100,1,101,1,102,1,103,1,104,1,105,1,106,1,107,4,108,2,109,2,111,1,113,1,114,2,115,1],"operat":[2,1,32,1,48,2,60,2,91,1,92,1,93,1,94,1],"upper":[2,1,94,1],"four":[2,1,94,1],"well":[2,1,94,1,111,1],"suit":[2,1,62,1,63,1,64,1,65,1,94,1,108,1,111,1,115,1],"operation":[2,1,5,1,48,1,52,1,54,2,55,3,56,2,60,1,62,1,63,1,64,1,65,2,68,1,69,1,70,1,77,2,87,1,88,1,94,1,107,1,108,1,111,1,115,1],"pointer":[2,1,31,1,50,2,51,1,52,4,57,3,58,2,62,2,63,2,64,2,65,7,68,3,81,1,82,1,83,1,84,1,85,1,94,1,108,7,111,1,115,2],"not":[2,1,12,4,22,2,31,1,46,1,48,1,49,1,50,1,51,1,52,1,54,2,55,2,56,2,57,1,58,1,60,1,61,1,65,3,67,1,68,2,72,1,73,2,74,1,75,1,81,1,82,1,83,1,85,3,86,1,94,1,107,2,108,3,109,1],"availabl":[2,1,12,1,31,1,48,1,50,1,51,1,52,1,54,1,55,1,56,1,57,1,58,1,60,1,61,1,65,1,67,1,68,1,72,1,73,1,74,1,75,1,81,1,82,1,94,1,107,1,108,1,109,1],"all":[2,1,5,1,12,1,31,1,38,1,44,1,45,1,46,1,48,1,50,1,51,1,52,1,54,1,55,1,56,1,57,1,58,1,60,1,61,1,65,2,67,1,68,1,69,1,70,1,72,1,73,1,74,1,75,1,81,1,82,1,87,1,88,1,94,1,102,1,107,2,108,2,109,1],"devic":[2,1,12,2,31,1,50,1,51,1,52,3,54,1,55,1,56,1,57,1,58,1,61,1,62,1,63,1,64,1,65,6,67,3,68,3,72,1,73,1,74,1,75,1,81,1,82,1,94,1,107,4,108,6,109,3,115,1],"refer":[2,1,12,1,31,1,50,1,51,1,52,2,54,1,55,1,56,1,57,1,58,1,61,1,65,1,67,2,68,2,72,1,73,1,74,1,75,1,81,1,82,1,94,1,107,2,108,1,109,2],"appendix":[2,1,12,1,31,1,50,1,51,1,52,1,54,1,55,1,56,1,57,1,58,1,61,1,67,1,68,1,72,1,73,1,74,1,75,1,81,1,82,1,94,1,107,1,109,1],"logical":[3,2,4,2,33,1,53,1,69,1,70,1,78,2,79,2,95,1,113,1],"perform":[3,1,4,1,33,1,38,1,43,1,44,1,45,1,46,1,47,1,48,1,49,4,53,1,54,3,55,1,56,3,60,1,73,1,74,1,75,1,77,1,78,1,79,1,95,1,113,1],"between":[3,1,4,1,33,1,38,1,44,1,45,1,46,1,47,1,53,1,54,3,55,3,56,3,78,1,79,1,95,1,113,1,115,1],"rr":[3,1,13,1,14,1,19,1,20,1,22,1,24,1,44,1,45,1,47,2,53,1,54,1,55,1,56,2,71,2,72,4,73,1,74,1,75,2,78,1,80,1,82,1],"andi":[4,1,33,1],"constant":[4,1,5,1,33,1,46,1,52,2,66,1,68,2,79,1,90,1,95,1,111,1],"asr":[5,1,88,1],"arithmetic":[5,1],"shift":[5,2,54,4,55,5,56,4,69,2,70,2,87,3,88,3],"right":[5,2,54,1,55,1,56,1,70,2,88,2],"bit":[5,3,6,1,7,5,8,3,9,3,17,1,18,1,25,2,26,2,29,2,30,5,32,2,33,2,36,2,38,1,40,2,49,3,50,1,51,1,52,4,54,11,55,9,56,11,57,2,58,2,62,3,63,3,64,3,65,2,66,1,67,1,68,3,69,3,70,3,73,4,74,4,75,4,85,1,87,3,88,3,90,1,91,2,92,3,93,3,95,2,96,3,97,3,100,2,102,1,104,2,107,3,108,2,109,1,115,2],"one":[5,1,43,2,48,1,49,2,52,1,54,2,55,1,56,3,60,1,62,1,63,1,64,1,65,1,67,1,68,1,69,1,70,1,71,1,72,1,87,1,88,1,107,2,108,1,109,1,115,1],"7":[5,1,17,1,18,1,36,1,54,3,55,2,56,3,69,1,70,1,87,1,88,1],"held":[5,1],"load":[5,1,7,1,52,2,59,2,62,2,63,2,64,2,65,2,66,2,67,2,68,2,69,1,70,1,71,1,72,1,81,1,84,1,85,1,102,1],"sreg":[5,1,6,2,7,2,8,2,9,2,29,2,30,2,34,1,35,1,36,1,37,1,39,1,40,1,41,1,42,1,48,1,60,1,69,1,70,1,98,1,99,1,100,1,101,1,103,1,104,1,105,1,106,1],"effectively":[5,1,69,1,70,1,87,1,88,2],"divid":[5,1,70,1,88,2],"sign":[5,2,13,2,14,4,20,4,22,2,39,2,48,1,54,2,55,4,56,7,60,1,69,1,74,4,75,4,87,1,88,1,103,2],"chang":[5,1,44,1,45,1,46,1,62,1,63,1,64,2,65,1,67,1,108,1,109,1,115,1],"can":[5,1,44,1,45,1,46,1,48,1,52,4,60,1,62,1,63,1,64,1,65,4,68,4,70,1,83,1,86,1,88,1,107,4,108,3],"used":[5,1,12,2,44,1,45,1,46,1,48,1,54,2,55,1,56,2,60,1,62,1,63,1,64,1,65,3,70,1,88,1,107,5,108,2],"round":[5,1,49,3,70,1,88,1],"bclr":[6,1,34,1,35,1,36,1,37,1,39,1,40,1,41,1,42,1],"clear":[6,2,8,2,10,2,14,1,15,2,17,1,22,1,23,1,24,1,25,2,27,2,32,2,33,2,34,2,35,2,36,2,37,2,38,3,39,2,40,2,41,2,42,2,62,3,69,1,70,1,92,2,96,2],"singl":[6,1,8,1,9,1,29,1,77,1,92,1,93,1,96,1,97,1],"bld":[7,1],"t":[7,2,25,3,26,3,30,2,40,2,104,2],"copy":[7,1,71,3,72,3],"status":[7,1,30,1,34,1,35,1,36,1,37,1,39,1,40,1,41,1,42,1,62,1,63,1,64,1,85,1,98,1,99,1,100,1,101,1,103,1,104,1,105,1,106,1,115,1],"b":[7,1,30,1],"brbc":[8,1,10,1,14,1,15,1,17,1,22,1,23,1,24,1,25,1,27,1],"branch":[8,4,9,4,10,4,11,4,13,5,14,5,15,4,16,4,17,4,18,4,19,5,20,5,21,4,22,5,23,4,24,5,25,4,26,4,27,4,28,4,44,1,45,1,46,1,48,2,60,2],"conditional":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,44,1,45,1,46,1],"relativ":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,83,2,86,2],"test":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,92,1,93,1,96,1,97,1,113,2],"relatively":[8,2,9,2,10,2,11,2,13,2,14,2,15,2,16,2,17,2,18,2,19,2,20,2,21,2,22,2,23,2,24,2,25,2,26,2,27,2,28,2],"pc":[8,5,9,5,10,5,11,5,13,5,14,5,15,5,16,5,17,5,18,5,19,5,20,5,21,5,22,5,23,5,24,5,25,5,26,5,27,5,28,5,83,2,86,2],"either":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,52,2,65,1,68,2,108,1],"direction":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1],"64":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,49,2,62,2,63,2,64,2,65,4,67,3,68,1,108,4,109,3,115,2],"parameter":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1],"k":[8,1,9,1,10,2,11,2,13,2,14,2,15,2,16,2,17,2,18,2,19,2,20,2,21,2,22,2,23,2,24,2,25,2,26,2,27,2,28,2,33,2,49,1,95,2],"offset":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1],"represent":[8,1,9,1,10,1,11,1,13,3,14,3,15,1,16,1,17,1,18,1,19,3,20,3,21,1,22,3,23,1,24,3,25,1,26,1,27,1,28,1],"s":[8,1,9,1,10,1,11,1,13,1,14,3,15,1,16,1,17,1,18,1,19,1,20,3,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,39,1,43,2,48,1,49,1,54,1,55,1,56,1,60,1,76,2,103,1],"complement":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,33,1,43,2,48,1,54,1,55,1,56,1,60,1,76,2],"form":[8,1,9,1,10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,49,1],"brb":[9,1,11,1,13,1,16,1,18,1,19,1,20,1,21,1,26,1,28,1],"set":[9,2,11,2,12,1,13,1,16,2,18,1,19,1,20,1,21,1,26,2,28,2,29,2,49,1,63,3,85,1,90,1,91,2,93,2,95,2,97,2,98,2,99,2,100,2,101,2,102,1,103,2,104,3,105,2,106,2,107,3],"brcc":[10,1],"equivalent":[10,1,11,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,95,1,98,1,99,1,101,1,102,1,103,1,104,1,105,1,106,1,113,1],"brc":[11,1],"break":[12,5],"chip":[12,3],"debug":[12,2],"system":[12,2],"application":[12,1,54,1,55,1,56,1,85,1],"softwar":[12,1,55,1],"execut":[12,1,13,1,14,1,19,1,20,1,22,1,24,1,36,1,49,3,100,1,114,1],"avr":[12,1,49,1,83,1,86,1,107,1],"cpu":[12,2,49,2],"stop":[12,2],"stat":[12,2],"giv":[12,1,55,1],"debugger":[12,1],"access":[12,1,62,2,63,2,64,2,65,3,67,3,107,1,108,3,109,3,115,2],"internal":[12,1,62,1,63,1],"resourc":[12,1],"lock":[12,1,52,1,68,1,107,2],"enabl":[12,1,17,1,18,2,36,2,85,1,100,2],"will":[12,2,13,1,14,1,19,1,20,1,22,1,24,1,31,1,33,1,36,2,38,1,73,1,100,1,113,1],"treat":[12,1],"nop":[12,1,77,1],"enter":[12,1,85,1],"breq":[13,1,48,1,60,1],"equal":[13,2,14,2,22,2,24,1,47,1],"zero":[13,1,22,1,42,2,106,2,113,2],"z":[13,2,22,2,42,1,50,1,51,1,52,7,57,2,58,2,62,2,63,2,64,2,68,6,106,1,107,3,111,1,115,2],"immediately":[13,1,14,1,19,1,20,1,22,1,24,1,36,1],"after":[13,1,14,1,19,1,20,1,22,1,24,1,31,1,36,1,44,1,45,1,46,1,49,1,73,1,82,1,83,1,107,1],"any":[13,1,14,1,19,1,20,1,22,1,24,1,100,1],"cp":[13,1,14,1,19,1,20,1,22,1,24,1,44,1],"cpi":[13,1,14,1,19,1,20,1,22,1,24,1,46,1],"sub":[13,1,14,1,19,1,20,1,22,1,24,1,110,1],"subi":[13,1,14,1,19,1,20,1,22,1,24,1,111,1],"occur":[13,1,14,1,19,1,20,1,22,1,24,1,36,1],"only":[13,1,14,1,19,1,20,1,22,1,24,1,48,1,60,1,62,1,63,1,64,1,65,1,108,1],"unsign":[13,2,19,3,22,2,24,3,48,1,54,5,56,3,60,1,69,1,70,1,73,4,75,3,87,1,88,1],"binary":[13,2,14,2,19,2,20,2,22,2,24,2,54,2,55,2,56,2],"number":[13,2,14,2,19,2,20,2,22,2,24,2,54,6,55,4,56,8,60,1,73,1,74,1,75,2],"1":[13,1,22,1,42,1,48,1,52,1,54,5,55,4,56,5,60,1,68,1,72,3,81,1,82,1,83,1,86,1,106,1,107,2],"brg":[14,1],"greater":[14,2,24,1],"than":[14,1,19,1,20,2,24,1,62,1,63,1,64,1,65,4,67,1,108,4,109,1,115,1],"4":[14,1,20,1,39,1,103,1],"brhc":[15,1],"half":[15,2,16,2,35,2,49,1,99,2],"h":[15,2,16,2,35,1,49,1,99,1],"5":[15,1,16,1,35,1,99,1],"brh":[16,1],"brid":[17,1],"global":[17,2,18,2,36,2,85,1,100,2],"interrupt":[17,2,18,2,36,4,85,5,100,3],"disabl":[17,1,36,1],"i":[17,2,18,2,32,3,36,1,50,1,51,1,52,1,59,2,62,1,63,1,64,1,65,3,67,2,80,2,90,1,91,3,92,3,93,3,100,1,108,3,109,2,115,1],"bri":[18,1],"brlo":[19,1],"lower":[19,1,32,1,91,1,92,1,93,1],"smaller":[19,1],"brlt":[20,1],"less":[20,2],"brmi":[21,1],"minus":[21,1,113,1],"negativ":[21,1,23,1,37,2,101,2,113,1],"n":[21,2,23,2,37,1,54,2,55,2,56,2,101,1],"2":[21,1,23,1,37,1,54,2,55,1,56,2,101,1],"brn":[22,1,48,1,60,1],"brpl":[23,1],"plus":[23,1],"brsh":[24,1],"sam":[24,1,54,2,55,2,56,2,65,1],"higher":[24,1],"execution":[24,1,49,1],"brtc":[25,1],"6":[25,1,26,1,40,1,54,1,55,1,56,1,104,1],"brt":[26,1],"brvc":[27,1],"overflow":[27,2,28,2,41,2,54,1,55,1,56,1,105,2],"v":[27,2,28,2,41,1,105,1],"3":[27,1,28,1,41,1,105,1],"brv":[28,1],"bset":[29,1,98,1,99,1,101,1,103,1,104,1,105,1,106,1],"bst":[30,1],"stor":[30,2,31,1,49,1,62,2,63,1,64,1,80,2,82,1,83,1,85,1,107,1,108,2,109,2,115,1],"call":[31,5,50,3,57,3,83,3],"long":[31,1],"subroutin":[31,2,50,2,57,3,83,1,84,2],"within":[31,1,57,1,58,1,61,1,83,1,86,1,114,1],"entir":[31,1,50,1,51,1,52,1,61,1,65,1,83,1,86,1,107,2,108,1],"program":[31,1,50,1,51,1,52,4,57,1,58,1,61,1,65,2,68,4,83,1,85,1,107,9,108,1],"memory":[31,1,50,1,51,1,52,3,57,1,58,1,61,1,62,1,63,1,64,1,65,5,67,3,68,3,83,2,86,2,107,8,108,3,109,3,115,1],"return":[31,1,83,1,84,3,85,4],"address":[31,1,32,1,51,1,52,2,58,1,61,1,65,1,67,1,68,2,83,4,84,1,85,1,86,3,91,1,92,1,93,1,107,3,108,1,109,1],"stack":[31,2,50,1,57,1,65,1,81,3,82,3,83,2,84,2,85,2,108,1],"see":[31,1,50,1,51,1,54,1,56,1,61,1,83,1,86,1,114,1],"also":[31,1,45,1,50,1,51,1,61,1,83,1,86,1],"rcall":[31,1,83,3],"use":[31,1,50,1,52,1,57,1,67,1,68,1,83,1,84,1,85,1,109,1],"post":[31,1,50,1,57,1,65,1,82,1,83,1,108,1],"decrement":[31,1,48,1,50,1,57,1,65,2,82,1,83,1,108,2],"schem":[31,1,50,1,57,1,83,1,84,1,85,1],"dur":[31,1,50,1,57,1,83,1,84,1,85,1],"cbi":[32,1],"o":[32,3,50,1,51,1,52,1,59,2,62,1,63,1,64,1,65,3,67,2,80,2,90,1,91,3,92,3,93,3,108,3,109,2,115,1],"specifi":[32,1,33,1,62,1,63,1,64,1,91,1,95,1],"32":[32,1,91,1,92,1,93,1],"31":[32,1,54,1,56,1,66,1,91,1,92,1,93,1],"cbr":[33,1],"mask":[33,1,95,1],"0xff":[33,1,102,2],"clc":[34,1],"clh":[35,1],"cli":[36,3],"no":[36,1,65,1,77,2,108,1],"even":[36,1],"simultaneously":[36,1,107,1],"cln":[37,1],"clr":[38,1],"exclusiv":[38,1,53,1],"itself":[38,1,113,1],"eor":[38,1,53,2],"cls":[39,1],"clt":[40,1],"clv":[41,1],"clz":[42,1],"com":[43,1],"compar":[44,2,45,2,46,2,47,2],"non":[44,1,45,1],"cpc":[45,1],"tak":[45,1],"account":[45,1,54,1,56,1],"previous":[45,1],"cps":[47,1],"skip":[47,2,92,2,93,2,96,2,97,2],"next":[47,1,92,1,93,1,96,1,97,1],"dec":[48,2],"subtract":[48,1,89,3,90,3,94,2,110,2,111,2],"affect":[48,1,49,1,60,1],"thus":[48,1,52,1,55,1,60,1,68,1],"allow":[48,1,50,1,51,1,57,1,58,1,60,1],"loop":[48,1,60,1],"counter":[48,1,60,1],"multipl":[48,1,60,1],"precision":[48,1,60,1],"computation":[48,1,60,1],"expect":[48,1,60,1],"consistently":[48,1,60,1],"des":[49,7],"data":[49,5,52,1,59,1,62,6,63,6,64,6,65,12,67,8,68,1,80,1,107,2,108,11,109,8,115,5],"encryption":[49,3],"standard":[49,4],"modul":[49,1],"extension":[49,1],"iteration":[49,2],"block":[49,1],"plaintext":[49,3],"ciphertext":[49,3],"fil":[49,3,50,1,51,1,57,1,58,1,59,1,62,1,63,1,64,1,65,2,67,1,80,1,108,2,109,1,115,1],"r0":[49,3,54,1,55,1,56,1,73,2,74,1,75,1,107,3],"r7":[49,2],"wher":[49,1,54,1,55,1,56,1],"lsb":[49,4],"msb":[49,4,54,1,56,1],"full":[49,1],"key":[49,3],"includ":[49,1],"parity":[49,1],"r8":[49,2],"r15":[49,3],"organiz":[49,1,52,1,68,1],"algorithm":[49,2],"sixteen":[49,1],"must":[49,1,54,1,55,1,56,1,67,1,85,1,107,1,109,1,114,1],"increas":[49,1],"order":[49,1],"correct":[49,1],"intermediat":[49,2],"each":[49,2],"operand":[49,1],"determin":[49,2,107,2],"whether":[49,1],"decryption":[49,1],"describ":[49,1],"specification":[49,1,114,1],"federal":[49,1],"information":[49,1],"process":[49,1,54,1,55,1,56,1],"publication":[49,1],"46":[49,1],"implementation":[49,1],"differ":[49,1],"becaus":[49,1],"initial":[49,2],"permutation":[49,2],"invers":[49,1],"doe":[49,1,68,1],"final":[49,1],"but":[49,1],"reduc":[49,1,65,1],"tim":[49,1,107,2,114,1],"eicall":[50,2],"extend":[50,1,51,1,52,1],"indirect":[50,3,51,3,57,2,58,2,62,1,63,1,64,1,65,2,108,2,115,1],"point":[50,1,51,1,52,1,54,4,55,4,56,4,57,1,58,1,62,1,63,1,64,1,65,1,68,1,108,1,115,1],"16":[50,1,51,1,52,1,54,3,55,2,56,3,57,2,58,2,62,1,63,1,64,1,65,1,66,1,67,1,68,1,73,2,74,2,75,2,108,1,109,1,115,1],"eind":[50,1,51,1],"spac":[50,2,51,2,52,3,57,1,59,1,62,3,63,3,64,3,65,8,67,5,68,1,80,1,107,1,108,7,109,5,115,2],"4m":[50,1,51,1,61,1],"icall":[50,1,57,2],"eijmp":[51,1],"jump":[51,3,58,3,61,2,86,2],"ijmp":[51,1,58,1],"elpm":[52,4],"byt":[52,5,54,3,55,3,56,3,62,1,63,1,64,1,65,4,67,1,68,4,73,2,74,2,75,2,81,1,87,1,88,2,107,2,108,4,109,1,115,1],"rampz":[52,2,62,1,63,1,64,1,68,1,107,3,115,1],"featur":[52,1,65,1,68,1,108,1],"100":[52,1,68,1],"effectiv":[52,1,68,1],"initialization":[52,1,68,1],"fetch":[52,1,68,1],"whil":[52,1,54,1,56,1,68,1,71,1,72,1],"least":[52,1,68,1,107,1],"significant":[52,1,68,1,107,1],"select":[52,1,68,1,73,1],"low":[52,1,54,1,55,1,56,1,65,1,68,1,73,1,74,1,75,1,107,1,108,1,112,1],"zlsb":[52,2,68,2],"high":[52,1,54,2,55,2,56,2,65,1,68,1,73,1,74,1,75,1,107,1,108,1,112,1],"theentir":[52,1],"left":[52,1,54,3,55,3,56,3,62,1,63,1,64,1,65,1,68,1,69,2,71,1,72,1,76,1,87,2,108,1,115,1],"unchang":[52,1,62,1,63,1,64,1,65,1,68,1,71,1,72,1,76,1,108,1,113,1,115,1],"increment":[52,1,60,1,65,2,68,1,81,1,84,1,85,1,108,2],"incrementation":[52,1,68,1],"apply":[52,1,68,1],"24":[52,1,65,1,108,1],"concatenation":[52,1],"self":[52,1,68,1],"capability":[52,1,68,1],"read":[52,1,68,1,115,1],"fus":[52,1,68,1],"documentation":[52,1,68,1,107,1],"detail":[52,1,65,1,67,1,68,1,107,1,108,1,109,1],"description":[52,1,68,1,107,1],"thes":[52,1,65,2,68,1,108,2],"combination":[52,1,65,1,68,1,108,1],"undefin":[52,1,65,1,68,1,108,1],"r30":[52,1,68,1],"r31":[52,1,68,1,111,1],"fmul":[54,4,55,2],"fractional":[54,4,55,4,56,6],"multiply":[54,1,55,2,56,1,69,1,73,1,74,1,75,1,87,1],"8":[54,2,55,2,56,2,66,1,73,2,74,2,75,2,83,1,86,1],"multiplication":[54,5,55,2,56,5,73,2,74,1,75,1],"let":[54,1,55,1,56,1],"q":[54,2,55,2,56,2],"denot":[54,1,55,1,56,1],"digit":[54,2,55,2,56,2],"radix":[54,4,55,4,56,4],"format":[54,9,55,5,56,9],"n1":[54,2,55,2,56,2],"q1":[54,2,55,2,56,2],"n2":[54,2,55,2,56,2],"q2":[54,2,55,2,56,2],"signal":[54,1,55,1,56,1],"widely":[54,1,55,1,56,1],"input":[54,3,55,2,56,4],"14":[54,2,55,2,56,2],"product":[54,4,55,3,56,4,73,1,74,1,75,1],"requir":[54,1,55,1,56,1],"incorporat":[54,1,55,1,56,1],"cycl":[54,1,55,1,56,1,77,1],"mul":[54,1,55,1,73,1,74,1],"most":[54,2,56,2],"commonly":[54,1,56,1],"therefor":[54,1,56,1],"useful":[54,1,56,1],"calculat":[54,1,56,1],"partial":[54,1,56,1],"15":[54,3,55,1,56,3],"yield":[54,1,56,1],"may":[54,1,56,1],"suffer":[54,1,56,1],"interpret":[54,1,56,1],"befor":[54,1,56,1,81,1,100,1],"taken":[54,1,56,1],"found":[54,1,56,1],"follow":[54,1,56,1,100,1],"exampl":[54,1,56,1],"multiplicand":[54,1,55,1,56,2,73,2,74,1,75,2],"multiplier":[54,1,55,1,56,2,73,2,74,1,75,2],"contain":[54,1,55,1,56,1,73,1,74,1],"implicit":[54,2,55,2,56,2],"lie":[54,1,55,1,56,1],"r1":[54,1,55,1,56,1,73,2,74,1,75,1,107,3],"0x80":[55,2,76,1],"0x8000":[55,1],"check":[55,1],"handl":[55,1,85,1],"fmulsu":[56,4],"mulsu":[56,1,75,1],"wid":[57,1,58,1],"lowest":[57,1,58,1],"64k":[57,1,58,1],"128":[57,1,58,1],"kb":[57,1,58,1,62,2,63,2,64,2,65,4,67,3,68,1,83,1,86,1,108,4,109,3,115,2],"section":[57,1,58,1],"location":[59,1,62,1,63,1,64,1,65,1,80,1,83,1,86,1,108,1,115,1],"inc":[60,2],"jmp":[61,1,86,1],"rjmp":[61,1,86,1],"lac":[62,1],"toward":[62,1,63,1,64,1],"sram":[62,2,63,2,64,2,65,1,67,1,108,1,109,1,115,1],"limit":[62,1,63,1,64,1,65,1,67,1,108,1,109,1,114,1,115,1],"current":[62,1,63,1,64,1,65,1,67,1,108,1,109,1,115,1],"segment":[62,2,63,2,64,2,65,2,67,2,108,2,109,2,115,2],"another":[62,1,63,1,64,1,65,1,67,1,71,1,72,1,108,1,109,1,115,1],"mor":[62,1,63,1,64,1,65,4,67,1,108,4,109,1,115,1],"area":[62,1,63,1,64,1,65,2,67,1,108,2,109,1,115,1],"has":[62,1,63,1,64,1,65,1,67,1,108,1,109,1,115,1],"especially":[62,1,63,1,64,1,65,1,108,1,115,1],"las":[63,1],"lat":[64,1],"toggl":[64,2],"ld":[65,6],"ldd":[65,1],"using":[65,2,108,2],"x":[65,10,108,10,111,1],"usually":[65,1,67,1,108,1,109,1],"consist":[65,1,67,1,108,1,109,1],"sheet":[65,1,67,1,108,1,109,1],"definition":[65,1,67,1,108,1,109,1],"rampx":[65,2,108,2],"pre":[65,1,81,1,84,1,85,1,108,1],"array":[65,1,108,1],"tabl":[65,1,108,1],"usag":[65,1,107,1,108,1],"updat":[65,2,108,2],"256":[65,1,108,1],"such":[65,2,108,2],"other":[65,1,107,1],"purpos":[65,1],"part":[65,1,108,1],"ad":[65,1,108,1],"variant":[65,1,108,1],"cor":[65,1],"avrrc":[65,1,67,1,109,1],"achiev":[65,1],"lpm":[65,1,68,5],"sinc":[65,1],"map":[65,1],"r26":[65,2,108,2],"r27":[65,2,108,2],"ldi":[66,1,102,1],"directly":[66,1,102,1],"lds":[67,2],"direct":[67,1,109,1],"suppli":[67,1,109,1],"rampd":[67,2,109,2],"abov":[67,1,109,1],"first":[68,1,107,1],"32k":[68,1],"lsl":[69,1,87,1],"lsr":[70,1,88,1],"mov":[71,1],"mak":[71,1,72,1],"sourc":[71,1,72,1],"movw":[72,1],"overwrit":[73,1],"thos":[73,1],"neg":[76,1],"replac":[76,1],"ori":[79,1,95,2],"out":[80,1],"pop":[81,3],"push":[82,3],"2k":[83,2,86,2],"onto":[83,1],"microcontroller":[83,1,86,1],"exceed":[83,1,86,1],"4k":[83,1,86,1],"every":[83,1,86,1],"ret":[84,2],"reti":[85,2],"automatically":[85,1],"routin":[85,2],"restor":[85,1],"pogram":[86,1],"rol":[87,1],"rotat":[87,1,88,1],"trough":[87,1],"combin":[87,1,88,2],"multi":[87,1,88,2],"ror":[88,1],"through":[88,1],"sbc":[89,1],"sbci":[90,1],"sbi":[90,1,91,1],"sbic":[92,1],"sbis":[93,1],"sbiw":[94,1],"sbr":[95,1,97,1],"sbrc":[96,1],"sec":[98,1],"seh":[99,1],"sei":[100,2],"pend":[100,1],"sen":[101,1],"ser":[102,1],"ses":[103,1],"sev":[105,1],"sez":[106,1],"spm":[107,4],"eras":[107,4],"pag":[107,7],"writ":[107,3,115,1],"already":[107,1],"boot":[107,2],"loader":[107,2],"som":[107,1],"written":[107,1],"fill":[107,1],"temporary":[107,1],"buffer":[107,1],"cas":[107,1],"flash":[107,1],"cod":[107,1],"so":[107,1],"concatenat":[107,1],"should":[107,1],"st":[108,5],"std":[108,1],"index":[108,1],"otherpurpos":[108,1],"sts":[109,2],"work":[111,1],"r16":[111,1],"very":[111,1],"y":[111,1],"swap":[112,3],"nibbl":[112,2],"tst":[113,1],"remain":[113,1],"wdr":[114,1],"watchdog":[114,3],"reset":[114,2],"timer":[114,2],"given":[114,1],"wd":[114,1],"prescaler":[114,1],"hardwar":[114,1],"xch":[115,1],"exchang":[115,2]}};
+export default segment;
@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"9ef59c802a4a5aa22e8e907ce6bdf114c0d656fd","docs":[["STOP","Halts execution"],["ADD","Addition operation"],["MUL","Multiplication operation"],["SUB","Subtraction operation"],["DIV","Integer division operation"],["SDIV","Signed integer division operation (truncated)"],["MOD","Modulo remainder operation"],["SMOD","Signed modulo remainder operation"],["ADDMOD","Modulo addition operation"],["MULMOD","Modulo multiplication operation"],["EXP","Exponential operation"],["SIGNEXTEND","Extend length of two’s complement signed integer"],["LT","Less-than comparison"],["GT","Greater-than comparison"],["SLT","Signed less-than comparison"],["SGT","Signed greater-than comparison"],["EQ","Equality comparison"],["ISZERO","Simple not operator"],["AND","Bitwise AND operation"],["OR","Bitwise OR operation"],["XOR","Bitwise XOR operation"],["NOT","Bitwise NOT operation"],["BYTE","Retrieve single byte from word"],["SHL","Left shift operation"],["SHR","Logical right shift operation"],["SAR","Arithmetic (signed) right shift operation"],["KECCAK256","Compute Keccak-256 hash"],["ADDRESS","Get address of currently executing account"],["BALANCE","Get balance of the given account"],["ORIGIN","Get execution origination address"],["CALLER","Get caller address"],["CALLVALUE","Get deposited value by the instruction/transaction responsible for this execution"],["CALLDATALOAD","Get input data of current environment"],["CALLDATASIZE","Get size of input data in current environment"],["CALLDATACOPY","Copy input data in current environment to memory"],["CODESIZE","Get size of code running in current environment"],["CODECOPY","Copy code running in current environment to memory"],["GASPRICE","Get price of gas in current environment"],["EXTCODESIZE","Get size of an account’s code"],["EXTCODECOPY","Copy an account’s code to memory"],["RETURNDATASIZE","Get size of output data from the previous call from the current environment"],["RETURNDATACOPY","Copy output data from the previous call to memory"],["EXTCODEHASH","Get hash of an account’s code"],["BLOCKHASH","Get the hash of one of the 256 most recent complete blocks"],["COINBASE","Get the block’s beneficiary address"],["TIMESTAMP","Get the block’s timestamp"],["NUMBER","Get the block’s number"],["DIFFICULTY","Get the block’s difficulty"],["GASLIMIT","Get the block’s gas limit"],["CHAINID","Get the chain ID"],["BASEFEE","Get the base fee"],["POP","Remove item from stack"],["MLOAD","Load word from memory"],["MSTORE","Save word to memory"],["MSTORE8","Save byte to memory"],["SLOAD","Load word from storage"],["SSTORE","Save word to storage"],["JUMP","Alter the program counter"],["JUMPI","Conditionally alter the program counter"],["GETPC","Get the value of the program counter prior to the increment corresponding to this instruction"],["MSIZE","Get the size of active memory in bytes"],["GAS","Get the amount of available gas, including the corresponding reduction for the cost of this instruction"],["JUMPDEST","Mark a valid destination for jumps"],["PUSH1","Place 1 byte item on stack"],["PUSH2","Place 2 byte item on stack"],["PUSH3","Place 3 byte item on stack"],["PUSH4","Place 4 byte item on stack"],["PUSH5","Place 5 byte item on stack"],["PUSH6","Place 6 byte item on stack"],["PUSH7","Place 7 byte item on stack"],["PUSH8","Place 8 byte item on stack"],["PUSH9","Place 9 byte item on stack"],["PUSH10","Place 10 byte item on stack"],["PUSH11","Place 11 byte item on stack"],["PUSH12","Place 12 byte item on stack"],["PUSH13","Place 13 byte item on stack"],["PUSH14","Place 14 byte item on stack"],["PUSH15","Place 15 byte item on stack"],["PUSH16","Place 16 byte item on stack"],["PUSH17","Place 17 byte item on stack"],["PUSH18","Place 18 byte item on stack"],["PUSH19","Place 19 byte item on stack"],["PUSH20","Place 20 byte item on stack"],["PUSH21","Place 21 byte item on stack"],["PUSH22","Place 22 byte item on stack"],["PUSH23","Place 23 byte item on stack"],["PUSH24","Place 24 byte item on stack"],["PUSH25","Place 25 byte item on stack"],["PUSH26","Place 26 byte item on stack"],["PUSH27","Place 27 byte item on stack"],["PUSH28","Place 28 byte item on stack"],["PUSH29","Place 29 byte item on stack"],["PUSH30","Place 30 byte item on stack"],["PUSH31","Place 31 byte item on stack"],["PUSH32","Place 32 byte (full word) item on stack"],["DUP1","Duplicate 1st stack item"],["DUP2","Duplicate 2nd stack item"],["DUP3","Duplicate 3rd stack item"],["DUP4","Duplicate 4th stack item"],["DUP5","Duplicate 5th stack item"],["DUP6","Duplicate 6th stack item"],["DUP7","Duplicate 7th stack item"],["DUP8","Duplicate 8th stack item"],["DUP9","Duplicate 9th stack item"],["DUP10","Duplicate 10th stack item"],["DUP11","Duplicate 11th stack item"],["DUP12","Duplicate 12th stack item"],["DUP13","Duplicate 13th stack item"],["DUP14","Duplicate 14th stack item"],["DUP15","Duplicate 15th stack item"],["DUP16","Duplicate 16th stack item"],["SWAP1","Exchange 1st and 2nd stack items"],["SWAP2","Exchange 1st and 3rd stack items"],["SWAP3","Exchange 1st and 4th stack items"],["SWAP4","Exchange 1st and 5th stack items"],["SWAP5","Exchange 1st and 6th stack items"],["SWAP6","Exchange 1st and 7th stack items"],["SWAP7","Exchange 1st and 8th stack items"],["SWAP8","Exchange 1st and 9th stack items"],["SWAP9","Exchange 1st and 10th stack items"],["SWAP10","Exchange 1st and 11th stack items"],["SWAP11","Exchange 1st and 12th stack items"],["SWAP12","Exchange 1st and 13th stack items"],["SWAP13","Exchange 1st and 14th stack items"],["SWAP14","Exchange 1st and 15th stack items"],["SWAP15","Exchange 1st and 16th stack items"],["SWAP16","Exchange 1st and 17th stack items"],["LOG0","Append log record with no topics"],["LOG1","Append log record with one topic"],["LOG2","Append log record with two topics"],["LOG3","Append log record with three topics"],["LOG4","Append log record with four topics"],["SLOADBYTES",""],["SSTOREBYTES",""],["SSIZE",""],["CREATE","Create a new account with associated code"],["CALL","Message-call into an account"],["CALLCODE","Message-call into this account with alternative account’s code"],["RETURN","Halt execution returning output data"],["DELEGATECALL","Message-call into this account with an alternative account’s code, but persisting the current values for sender and value"],["STATICCALL","Static message-call into an account"],["TXEXECGAS",""],["REVERT","Halt execution reverting state changes but returning data and remaining gas"],["INVALID","Designated invalid instruction"]],"lengths":[7,9,9,9,11,15,11,13,13,13,9,20,10,11,12,13,9,10,8,8,11,9,14,12,15,17,14,14,13,12,10,18,16,16,18,16,18,14,15,17,20,18,15,21,14,12,12,12,14,10,10,10,11,11,11,11,11,10,13,20,14,22,11,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,18,14,14,16,14,14,14,14,14,14,14,14,14,14,14,14,14,15,17,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,17,18,19,3,3,3,17,17,25,15,36,18,3,25,9],"postings":{"stop":[0,1],"halt":[0,2,138,2,142,2],"execution":[0,2,29,2,31,2,138,2,142,2],"input":[0,1,1,1,2,1,3,1,4,1,5,1,6,1,7,1,8,1,9,1,10,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,31,1,32,3,33,3,34,3,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1,62,1,63,1,64,1,65,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,81,1,82,1,83,1,84,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,1,93,1,94,1,95,1,96,1,97,1,98,1,99,1,100,1,101,1,102,1,103,1,104,1,105,1,106,1,107,1,108,1,109,1,110,1,111,1,112,1,113,1,114,1,115,1,116,1,117,1,118,1,119,1,120,1,121,1,122,1,123,1,124,1,125,1,126,1,127,1,128,1,129,1,130,1,131,1,132,1,133,1,134,1,135,1,136,1,137,1,138,1,139,1,140,1,141,1,142,1,143,1],"output":[0,1,1,1,2,1,3,1,4,1,5,1,6,1,7,1,8,1,9,1,10,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,3,41,3,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1,62,1,63,1,64,1,65,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,81,1,82,1,83,1,84,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,1,93,1,94,1,95,1,96,1,97,1,98,1,99,1,100,1,101,1,102,1,103,1,104,1,105,1,106,1,107,1,108,1,109,1,110,1,111,1,112,1,113,1,114,1,115,1,116,1,117,1,118,1,119,1,120,1,121,1,122,1,123,1,124,1,125,1,126,1,127,1,128,1,129,1,130,1,131,1,132,1,133,1,134,1,135,1,136,1,137,1,138,3,139,1,140,1,141,1,142,1,143,1],"add":[1,1],"addition":[1,2,8,2],"operation":[1,2,2,2,3,2,4,2,5,2,6,2,7,2,8,2,9,2,10,2,18,2,19,2,20,2,21,2,23,2,24,2,25,2],"b":[1,2,2,2,3,2,4,2,5,2,6,2,7,2,8,2,9,2,11,1,12,1,13,2,14,1,15,2,16,2,18,2,19,2,20,2,58,1,96,3,97,2,111,2,112,2,113,2,114,2,115,2,116,2,117,2,118,2,119,2,120,2,121,2,122,2,123,2,124,2,125,2,126,2],"mul":[2,1],"multiplication":[2,2,9,2],"sub":[3,1],"subtraction":[3,2],"div":[4,1],"integer":[4,2,5,2,11,2],"division":[4,2,5,2],"sdiv":[5,1],"sign":[5,2,7,2,11,2,14,2,15,2,25,2],"truncat":[5,2],"mod":[6,1],"modulo":[6,2,7,2,8,2,9,2],"remainder":[6,2,7,2],"smod":[7,1],"addmod":[8,1],"n":[8,2,9,2],"mulmod":[9,1],"exp":[10,1],"exponential":[10,2],"exponent":[10,2],"signextend":[11,1],"extend":[11,2],"length":[11,2],"two":[11,2,129,2],"s":[11,2,38,2,39,2,42,2,44,2,45,2,46,2,47,2,48,2,137,2,139,2],"complement":[11,2],"x":[11,1,22,1],"y":[11,1,22,1,51,1],"lt":[12,1],"less":[12,2,14,2],"than":[12,2,13,2,14,2,15,2],"comparison":[12,2,13,2,14,2,15,2,16,2],"gt":[13,1],"greater":[13,2,15,2],"slt":[14,1],"sgt":[15,1],"eq":[16,1],"equality":[16,2],"iszero":[17,1],"simpl":[17,2],"not":[17,2,21,3],"operator":[17,2],"0":[17,1],"bitwis":[18,2,19,2,20,2,21,2],"xor":[20,3],"byt":[22,3,54,2,60,2,63,2,64,2,65,2,66,2,67,2,68,2,69,2,70,2,71,2,72,2,73,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2],"retriev":[22,2],"singl":[22,2],"word":[22,2,52,2,53,2,55,2,56,2,94,2],"i":[22,1,32,2],"shl":[23,1],"left":[23,2],"shift":[23,3,24,4,25,4],"valu":[23,2,24,2,25,2,31,3,52,1,53,1,54,1,55,1,56,1,59,2,63,1,64,1,65,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,81,1,82,1,83,1,84,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,1,93,1,94,1,95,3,98,3,99,3,100,3,101,3,102,3,103,3,104,3,105,3,106,3,107,3,108,3,109,3,110,3,135,1,136,1,137,1,139,4],"shr":[24,1],"logical":[24,2],"right":[24,2,25,2],"sar":[25,1],"arithmetic":[25,2],"keccak256":[26,1],"comput":[26,2],"keccak":[26,2],"256":[26,2,43,2],"hash":[26,3,42,3,43,3],"offset":[26,1,34,1,36,1,39,1,41,1,52,1,53,1,54,1,127,1,128,1,129,1,130,1,131,1,135,1,138,1,142,1],"siz":[26,1,33,3,34,1,35,3,36,1,38,3,39,1,40,3,41,1,60,3,127,1,128,1,129,1,130,1,131,1,135,1,138,1,142,1],"address":[27,4,28,1,29,3,30,3,38,1,39,1,42,1,44,3,135,1,136,1,137,1,139,1,140,1],"get":[27,2,28,2,29,2,30,2,31,2,32,2,33,2,35,2,37,2,38,2,40,2,42,2,43,2,44,2,45,2,46,2,47,2,48,2,49,2,50,2,59,2,60,2,61,2],"currently":[27,2],"execut":[27,2],"account":[27,2,28,2,38,2,39,2,42,2,135,2,136,2,137,4,139,4,140,2],"balanc":[28,4],"given":[28,2],"origin":[29,1],"origination":[29,2],"caller":[30,3],"callvalu":[31,1],"deposit":[31,2],"instruction":[31,2,59,2,61,2,143,2],"transaction":[31,2],"responsibl":[31,2],"calldataload":[32,1],"data":[32,3,33,2,34,2,40,2,41,2,138,2,142,2],"current":[32,2,33,2,34,2,35,2,36,2,37,2,40,2,139,2],"environment":[32,2,33,2,34,2,35,2,36,2,37,2,40,2],"calldatasiz":[33,1],"calldatacopy":[34,1],"copy":[34,2,36,2,39,2,41,2],"memory":[34,2,36,2,39,2,41,2,52,2,53,2,54,2,60,2],"destoffset":[34,1,36,1,39,1,41,1],"codesiz":[35,1],"cod":[35,2,36,2,38,2,39,2,42,2,135,2,137,2,139,2],"run":[35,2,36,2],"codecopy":[36,1],"gaspric":[37,1],"pric":[37,3],"gas":[37,2,48,2,61,4,136,1,137,1,139,1,140,1,142,2],"extcodesiz":[38,1],"extcodecopy":[39,1],"returndatasiz":[40,1],"previous":[40,2,41,2],"call":[40,2,41,2,136,3,137,2,139,2,140,2],"returndatacopy":[41,1],"extcodehash":[42,1],"blockhash":[43,1],"one":[43,2,128,2],"most":[43,2],"recent":[43,2],"complet":[43,2],"block":[43,2,44,2,45,2,46,2,47,2,48,2],"blocknumber":[43,1,46,1],"coinbas":[44,1],"beneficiary":[44,2],"timestamp":[45,4],"number":[46,3],"difficulty":[47,4],"gaslimit":[48,2],"limit":[48,2],"chainid":[49,2],"chain":[49,2],"id":[49,2],"basefe":[50,2],"bas":[50,2],"fee":[50,2],"pop":[51,1],"remov":[51,2],"item":[51,2,63,2,64,2,65,2,66,2,67,2,68,2,69,2,70,2,71,2,72,2,73,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,100,2,101,2,102,2,103,2,104,2,105,2,106,2,107,2,108,2,109,2,110,2,111,2,112,2,113,2,114,2,115,2,116,2,117,2,118,2,119,2,120,2,121,2,122,2,123,2,124,2,125,2,126,2],"stack":[51,2,63,2,64,2,65,2,66,2,67,2,68,2,69,2,70,2,71,2,72,2,73,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2,95,2,96,2,97,2,98,2,99,2,100,2,101,2,102,2,103,2,104,2,105,2,106,2,107,2,108,2,109,2,110,2,111,2,112,2,113,2,114,2,115,2,116,2,117,2,118,2,119,2,120,2,121,2,122,2,123,2,124,2,125,2,126,2],"mload":[52,1],"load":[52,2,55,2],"mstor":[53,1],"sav":[53,2,54,2,56,2],"mstore8":[54,1],"sload":[55,1],"storag":[55,2,56,2],"key":[55,1,56,1],"sstor":[56,1],"jump":[57,1,62,2],"alter":[57,2,58,2],"program":[57,2,58,2,59,2],"counter":[57,3,58,3,59,3],"jumpi":[58,1],"conditionally":[58,2],"getpc":[59,1],"prior":[59,2],"increment":[59,2],"correspond":[59,2,61,2],"msiz":[60,1],"activ":[60,2],"amount":[61,2],"availabl":[61,2],"includ":[61,2],"reduction":[61,2],"cost":[61,2],"jumpdest":[62,1],"mark":[62,2],"valid":[62,2],"destination":[62,2],"push1":[63,1],"plac":[63,2,64,2,65,2,66,2,67,2,68,2,69,2,70,2,71,2,72,2,73,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,82,2,83,2,84,2,85,2,86,2,87,2,88,2,89,2,90,2,91,2,92,2,93,2,94,2],"1":[63,2],"push2":[64,1],"2":[64,2],"push3":[65,1],"3":[65,2],"push4":[66,1],"4":[66,2],"push5":[67,1],"5":[67,2],"push6":[68,1],"6":[68,2],"push7":[69,1],"7":[69,2],"push8":[70,1],"8":[70,2],"push9":[71,1],"9":[71,2],"push10":[72,1],"10":[72,2],"push11":[73,1],"11":[73,2],"push12":[74,1],"12":[74,2],"push13":[75,1],"13":[75,2],"push14":[76,1],"14":[76,2],"push15":[77,1],"15":[77,2],"push16":[78,1],"16":[78,2],"push17":[79,1],"17":[79,2],"push18":[80,1],"18":[80,2],"push19":[81,1],"19":[81,2],"push20":[82,1],"20":[82,2],"push21":[83,1],"21":[83,2],"push22":[84,1],"22":[84,2],"push23":[85,1],"23":[85,2],"push24":[86,1],"24":[86,2],"push25":[87,1],"25":[87,2],"push26":[88,1],"26":[88,2],"push27":[89,1],"27":[89,2],"push28":[90,1],"28":[90,2],"push29":[91,1],"29":[91,2],"push30":[92,1],"30":[92,2],"push31":[93,1],"31":[93,2],"push32":[94,1],"32":[94,2],"full":[94,2],"dup1":[95,1],"duplicat":[95,2,96,2,97,2,98,2,99,2,100,2,101,2,102,2,103,2,104,2,105,2,106,2,107,2,108,2,109,2,110,2],"1st":[95,2,111,2,112,2,113,2,114,2,115,2,116,2,117,2,118,2,119,2,120,2,121,2,122,2,123,2,124,2,125,2,126,2],"dup2":[96,1],"2nd":[96,2,111,2],"dup3":[97,1],"3rd":[97,2,112,2],"c":[97,3,112,2],"dup4":[98,1],"4th":[98,2,113,2],"dup5":[99,1],"5th":[99,2,114,2],"dup6":[100,1],"6th":[100,2,115,2],"dup7":[101,1],"7th":[101,2,116,2],"dup8":[102,1],"8th":[102,2,117,2],"dup9":[103,1],"9th":[103,2,118,2],"dup10":[104,1],"10th":[104,2,119,2],"dup11":[105,1],"11th":[105,2,120,2],"dup12":[106,1],"12th":[106,2,121,2],"dup13":[107,1],"13th":[107,2,122,2],"dup14":[108,1],"14th":[108,2,123,2],"dup15":[109,1],"15th":[109,2,124,2],"dup16":[110,1],"16th":[110,2,125,2],"swap1":[111,1],"exchang":[111,2,112,2,113,2,114,2,115,2,116,2,117,2,118,2,119,2,120,2,121,2,122,2,123,2,124,2,125,2,126,2],"swap2":[112,1],"swap3":[113,1],"swap4":[114,1],"swap5":[115,1],"swap6":[116,1],"swap7":[117,1],"swap8":[118,1],"swap9":[119,1],"swap10":[120,1],"swap11":[121,1],"swap12":[122,1],"swap13":[123,1],"swap14":[124,1],"swap15":[125,1],"swap16":[126,1],"17th":[126,2],"log0":[127,1],"append":[127,2,128,2,129,2,130,2,131,2],"log":[127,2,128,2,129,2,130,2,131,2],"record":[127,2,128,2,129,2,130,2,131,2],"no":[127,2],"topic":[127,2,128,3,129,2,130,2,131,2],"log1":[128,1],"log2":[129,1],"topic1":[129,1,130,1,131,1],"topic2":[129,1,130,1,131,1],"log3":[130,1],"thre":[130,2],"topic3":[130,1,131,1],"log4":[131,1],"four":[131,2],"topic4":[131,1],"sloadbyt":[132,1],"sstorebyt":[133,1],"ssiz":[134,1],"creat":[135,3],"new":[135,2],"associat":[135,2],"messag":[136,2,137,2,139,2,140,2],"argsoffset":[136,1,137,1,139,1,140,1],"argssiz":[136,1,137,1,139,1,140,1],"retoffset":[136,1,137,1,139,1,140,1],"retsiz":[136,1,137,1,139,1,140,1],"success":[136,1,137,1,139,1,140,1],"callcod":[137,1],"alternativ":[137,2,139,2],"return":[138,3,142,2],"delegatecall":[139,1],"but":[139,2,142,2],"persist":[139,2],"sender":[139,2],"staticcall":[140,1],"static":[140,2],"txexecga":[141,1],"revert":[142,3],"stat":[142,2],"chang":[142,2],"remain":[142,2],"invalid":[143,3],"designat":[143,2]}};
+export default segment;
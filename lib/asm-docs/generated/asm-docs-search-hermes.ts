@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"ada16787c0a37da125d207dd448a1b1b7bc71d8b","docs":[["BRANCHINST","Jumps to a different basic block."],["RETURNINST","Leaves the function and returns a value."],["ALLOCSTACKINST","Allocates a variable on the stack."],["LOADFRAMEINST","Loads a value from a variable."],["LOADSTACKINST","Loads a value from a stack allocated memory pointed by a reference."],["STOREFRAMEINST","Stores a value to a frame variable."],["STORESTACKINST","Stores a value to a stack allocated memory."],["ASNUMBERINST","Casts a JavaScript value into a number value."],["ASINT32INST","Casts a JavaScript value into a signed 32-bit integer value."],["ADDEMPTYSTRINGINST","Convert a value to string as if evaluating value + ''"],["CONDBRANCHINST","Jumps to one of two blocks depending on a condition value."],["COMPAREBRANCHINST","Performs  a binary comparison of the two operands and a conditional branch depending on the result."],["CREATEFUNCTION","Constructs a new function into the current scope from its code representation."],["BINARYOPERATORINST","Performs the binary operation on the two operands."],["DIRECTEVALINST","Implement a syntactical call to eval(arg) where eval is global property."],["CALLINST","Calls another function with some arguments."],["CONSTRUCTINST","Construct a new object with a constructor"],["CALLBUILTININST","Calls a builtin function passing \"undefined\" for this"],["CALLINTRINSICINST","Calls an unsafe compiler intrinsic, passing \"undefined\" for this"],["GETBUILTINCLOSUREINST","Get a closure of a builtin function"],["LOADPROPERTYINST","Loads the value of a field from a JavaScript object."],["TRYLOADGLOBALPROPERTYINST","Loads the value of an existing field from the global object or throw if it doesn't exist."],["DELETEPROPERTYINST","Deletes the value of a field from a JavaScript object."],["STOREPROPERTYINST","Stores a value to field in a JavaScript object."],["TRYSTOREGLOBALPROPERTYINST","Attempt to store a value into an existing field of the global object and throw if it doesn't exist."],["STOREOWNPROPERTYINST","Stores a value to an *own property* of JavaScript object."],["STORENEWOWNPROPERTYINST","Create a new *own property* in what is known to be a JavaScript object."],["STOREGETTERSETTERINST","Associates a pair of getter and setter with an *own* field in a JavaScript object, replacing the previous value."],["THROWIFHASRESTRICTEDGLOBALPROPERTYINST","Raises an exception if the given name is a restricted global property."],["ALLOCOBJECTINST","Allocates a new JavaScript object on the heap."],["ALLOCOBJECTLITERALINST","Allocates a new JavaScript object on the heap. During lowering pass it will be lowered to either an AllocObjectInst or a HBCAllocObjectFromBufferInst."],["ALLOCARRAYINST","Allocates a new JavaScript array on the heap."],["CREATEARGUMENTSINST","Allocates the JavaScript arguments array-like object on the heap."],["CREATEREGEXPINST","Construct a RegExp object from a regexp literal."],["SWITCHINST","The ‘switch‘ instruction is used to transfer control to one of different places."],["GETPNAMESINST","Generates the property enumerator, which is a collection of registers that hold the state of the enumerator (iterator, object base, index, size, etc)."],["GETNEXTPNAMEINST","Loads the next property from the object property enumerator."],["CATCHINST","This instruction catches an exception, and returns that exception."],["THROWINST","This instruction will throw an exception."],["CHECKHASINSTANCEINST","Check whether an object has a particular instance."],["TRYSTARTINST","Mark the beginning of the try blocks."],["TRYENDINST","Mark the end of the try blocks."],["PHIINST","This is a Phi node instruction."],["MOVINST","The MOV inst represents a low-level operation of moving one register to another."],["IMPLICITMOVINST","The ImplicitMov inst represents moving one register to another, except the mov will be performed implicitly by an immediately-subsequent instruction. This is used to express to the optimizer instructions which modify registers other than their destination."],["DEBUGGERINST","This instruction corresponds to the JavaScript debugger statement."],["GETNEWTARGETINST","Obtains the value of new.target in the current function or constructor."],["THROWIFEMPTYINST","Check whether the value is \"empty\", and if it is, throw ReferenceError, otherwise return it."],["COERCETHISNS","Coerces its argument using the rules of \"this\" coercion to object in non-strict mode."],["CREATEGENERATOR","Constructs a new GeneratorInnerFunction from its code representation, and wraps it in a Generator object."],["STARTGENERATOR","Jump to the proper first instruction to execute in a GeneratorInnerFunction"],["SAVEANDYIELD","Saves information needed to resume generator execution and yield."],["RESUMEGENERATOR","Perform the user-requested action on resuming a generator."],["ITERATORBEGIN","Begins array destructuring on a given iterable source."],["ITERATORNEXT","Destructures the next value from a given iterator."],["ITERATORCLOSE","Closes an iterator if it exists."],["UNREACHABLEINST","Crashes the VM (ifndef NDEBUG)."],["HBCGETGLOBALOBJECTINST","Obtain the \"global\" object"],["HBCCREATEFUNCTION","Create a new closure capturing the specified environment and using the specified body"],["HBCCREATEGENERATOR","Constructs a new Generator into the current scope from its code representation."],["HBCALLOCOBJECTFROMBUFFERINST","Allocates a new JavaScript object on the heap, and initializes it with values from the object buffer."],["HBCCALLNINST","Calls a function with a fixed number of arguments (from 1 to 4, inclusive)."]],"lengths":[29,38,70,22,31,33,34,27,36,34,56,62,39,34,48,46,56,45,43,18,49,47,31,55,56,66,77,87,40,65,59,65,50,38,68,73,58,54,35,83,47,40,44,44,74,27,41,42,33,45,45,48,59,68,63,38,26,20,44,40,51,60],"postings":{"branchinst":[0,2],"jump":[0,3,10,5,11,2,35,1,39,3,50,4],"different":[0,3,2,1,34,2],"basic":[0,5,1,1,10,1,34,1,37,1,40,1,42,2],"block":[0,5,1,1,10,7,11,4,34,2,36,1,37,3,40,5,41,3,42,4],"0":[0,1,1,1,2,1,3,1,4,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,43,1,44,1,45,1,46,1,48,1,49,1,50,1,51,1,52,1,53,2,54,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1],"bb1":[0,1,10,2,11,2],"singl":[0,1,1,1,2,1,42,1],"operand":[0,1,1,1,11,3,13,3,39,1],"target":[0,1,39,2,46,2],"terminat":[0,1,1,1],"doe":[0,1,1,1,2,1,10,1,12,1,29,1,30,1,31,1,32,1,33,1,37,1,40,1,41,2,42,1,43,1,44,1,45,1,46,1,48,1,49,1,50,1,57,1,58,1,59,1,60,1],"not":[0,1,1,1,2,3,10,1,12,1,14,1,16,1,25,1,26,1,27,1,29,2,30,1,31,1,32,1,33,1,34,1,37,1,40,1,41,2,42,1,43,1,44,1,45,1,46,1,48,1,49,1,50,1,53,1,57,1,58,1,59,1,60,1],"read":[0,1,1,1,2,1,3,2,4,2,7,1,8,1,9,1,10,1,11,1,12,1,13,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,42,1,43,1,44,1,45,1,46,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1],"writ":[0,1,1,1,2,1,5,1,6,1,7,1,8,1,9,1,10,1,11,1,12,1,13,1,15,1,16,1,17,1,18,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,2,40,1,41,1,42,1,43,1,44,1,45,1,46,1,48,1,49,1,50,1,51,1,52,1,53,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1],"memory":[0,1,1,1,2,1,3,1,4,4,5,2,6,4,7,1,8,1,9,1,10,1,11,1,12,1,13,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,43,1,44,1,45,1,46,1,48,1,49,1,50,1,51,1,52,1,53,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1],"returninst":[1,2],"leav":[1,2],"function":[1,4,2,3,12,6,15,4,16,3,17,3,18,1,19,2,32,1,34,1,46,4,49,4,53,1,61,4],"return":[1,5,19,1,20,1,23,1,37,3,39,3,45,1,46,1,47,2,50,1,52,3,53,2,54,1,55,2,57,1],"valu":[1,5,2,2,3,2,4,2,5,7,6,6,7,5,8,5,9,6,10,4,14,1,15,1,20,2,21,2,22,2,23,5,24,5,25,5,26,3,27,2,29,2,30,1,31,4,32,1,34,5,38,1,42,2,43,1,44,1,45,1,46,2,47,4,48,1,51,3,54,4,60,6,61,1],"17":[1,1],"notic":[1,1],"without":[1,1],"explicit":[1,1],"undefin":[1,1,15,1,16,2,17,4,18,3,27,3,46,1,54,3,61,1],"transfer":[1,1,34,2],"control":[1,1,15,1,17,1,18,1,34,2,38,1,61,1],"caller":[1,1],"current":[1,1,2,1,12,2,34,1,37,1,46,2,59,2],"allocstackinst":[2,2],"allocat":[2,4,4,2,6,3,16,1,29,2,30,2,31,3,32,2,35,1,60,2],"variabl":[2,6,3,5,5,5,10,1,47,1,51,1],"stack":[2,3,4,3,6,5,35,1,39,1,50,1,53,1,54,1],"nam":[2,2,20,1,21,1,22,1,25,1,26,1,28,6,36,1],"textual":[2,1],"representation":[2,1,12,2,49,2,59,2],"sourcecod":[2,1],"level":[2,1,43,2],"allocstack":[2,5],"depend":[2,1,10,2,11,2],"implementation":[2,1,45,1],"vm":[2,1,17,1,18,1,31,1,56,2],"may":[2,3,7,1,8,1,9,1,11,1,12,1,13,1,15,1,16,1,17,1,18,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,34,1,35,1,36,1,37,1,38,1,39,1,41,1,49,1,51,1,52,2,53,2,55,2,58,1,61,1],"pack":[2,1],"fram":[2,1,5,2,51,1,61,1],"used":[2,3,16,1,34,2,40,1,41,1,44,2,47,1],"instruction":[2,1,3,2,4,2,5,1,6,1,7,1,8,1,9,1,10,1,11,2,12,1,13,2,15,1,16,1,17,1,18,1,20,1,22,1,23,1,25,1,26,1,27,1,29,1,30,1,31,2,32,1,34,4,35,3,36,3,37,4,38,6,39,2,40,2,41,3,42,3,43,1,44,5,45,2,50,2,52,1,53,3,57,1,58,1,59,1,60,1,61,1],"represent":[2,2,12,1,30,1,35,1,43,2,44,2,49,1],"closur":[2,1,12,2,15,1,19,3,49,1,51,1,58,5,59,2,61,1],"creat":[2,1,12,1,23,1,25,3,26,5,27,3,29,2,30,1,31,1,32,1,48,1,49,2,58,3,59,1,60,1],"local":[2,1],"captur":[2,1,58,2],"itself":[2,1,41,1],"need":[2,1,29,1,42,1,51,2],"directly":[2,1],"possibl":[2,1],"sav":[2,1,5,1,6,1,50,1,51,3],"referenc":[2,2,4,2,5,1,6,1,15,1,20,1,23,1,57,1,61,1],"lifetim":[2,2],"exc":[2,1],"loadframeinst":[3,2],"load":[3,3,4,3,20,3,21,2,36,2],"1":[3,1,4,1,5,1,6,1,7,1,8,1,9,3,10,1,14,2,16,1,20,4,23,3,28,2,61,2],"address":[3,1,4,3,5,2,6,2,35,2],"must":[3,1,4,1,5,1,6,1,15,1,21,1,24,1,26,2,31,1,34,2,42,1,46,1,51,1,61,1],"valid":[3,1,4,1,5,1,6,1,43,1,44,1],"loadstackinst":[4,1],"point":[4,2],"loadinst":[4,1],"storeframeinst":[5,2],"stor":[5,4,6,3,23,3,24,4,25,3,26,1],"wher":[5,1,14,2,23,1,24,1,25,1,26,1,27,1,36,1,40,1],"will":[5,1,14,1,23,1,24,1,25,2,26,2,27,2,29,1,30,2,31,1,37,3,38,3,39,2,44,2,52,1,53,1,60,1],"storestackinst":[6,2],"allocation":[6,2,43,1,44,1],"asnumberinst":[7,2],"cast":[7,3,8,3,9,1],"javascript":[7,3,8,3,9,1,11,1,13,1,20,3,22,3,23,3,25,3,26,3,27,3,29,3,30,3,31,3,32,2,45,2,60,3],"number":[7,3,30,1,32,1,61,2],"input":[7,1,8,1,9,1,34,3,54,1],"follow":[7,1,8,1,9,1,11,1,13,1,20,1,22,1,23,1,25,1,26,1,27,1,28,1],"rul":[7,1,8,1,9,1,11,1,13,1,20,1,22,1,23,1,25,1,26,1,27,1,48,2],"convert":[7,1,8,1,9,2],"typ":[7,1,8,1,10,1,15,1,34,1,61,1],"asint32inst":[8,2],"sign":[8,3],"32":[8,3],"bit":[8,3],"integer":[8,3],"addemptystringinst":[9,2],"str":[9,3,21,1,24,1,26,1,28,1,30,1],"evaluat":[9,2,10,1,11,1,14,1,54,1],"ad":[9,1,56,1],"empty":[9,1,35,1,47,3],"es5":[9,1,16,1,20,2,23,2,46,1],"11":[9,1,16,1,20,1,23,1],"6":[9,1],"throw":[9,1,20,1,21,4,23,1,24,4,28,1,38,2,39,1,47,3,50,1,51,1,52,3,53,3,55,2],"condbranchinst":[10,2],"one":[10,3,11,1,13,1,27,1,32,1,34,3,38,1,43,2,44,2],"two":[10,3,11,2,13,2,35,2,36,1],"condition":[10,4,11,1],"cond":[10,2],"bb2":[10,2,11,2],"tru":[10,3,11,3,14,3,39,1,52,2,55,1],"fals":[10,2,11,2,39,2,52,1],"observ":[10,1],"program":[10,2,11,2],"otherwis":[10,1,11,1,26,1,29,1,46,1,47,2,52,1,55,1],"comparebranchinst":[11,1],"perform":[11,2,13,2,16,1,44,2,52,2,53,1],"binary":[11,4,13,4],"comparison":[11,2],"conditional":[11,2],"branch":[11,2],"result":[11,2,39,4,54,1],"comparebranch":[11,1],"x":[11,2,13,2],"y":[11,2,13,2],"operation":[11,1,13,3,20,1,23,1,43,2],"each":[11,1,13,1,34,1,37,2,42,1,53,1],"operator":[11,1,13,1,39,1],"defin":[11,1,13,1,16,1],"createfunction":[12,2],"construct":[12,2,16,2,33,2,37,1,49,2,59,2],"new":[12,3,16,3,25,1,26,4,27,1,29,3,30,3,31,3,46,3,48,1,49,4,58,3,59,3,60,3],"scop":[12,3,38,1,59,2],"cod":[12,3,49,3,59,2],"generat":[12,1,35,2,37,1,39,1,51,1],"access":[12,1,20,1,22,1,23,1,25,1,26,1,27,1,49,1,58,1,59,1],"lexical":[12,1],"call":[12,1,14,2,15,2,16,1,17,2,18,2,33,2,46,1,53,1,54,1,55,1,61,2],"binaryoperatorinst":[13,2],"directevalinst":[14,2],"implement":[14,3,28,1,47,1],"syntactical":[14,2],"eval":[14,4],"arg":[14,2],"global":[14,2,21,3,24,3,28,4,57,3],"property":[14,2,20,3,21,2,22,3,23,3,24,3,25,8,26,9,27,6,28,4,29,1,30,2,35,4,36,8,60,1],"value1":[14,3,31,1,42,1,60,1],"semantic":[14,1,28,1,32,1,34,1],"es6":[14,2,46,1,47,1],"performeval":[14,1],"evalrealm":[14,1],"strictcaller":[14,2],"direct":[14,1,46,1],"18":[14,1],"2":[14,1,16,4,20,1,23,2,40,1],"we":[14,1,41,1,43,1,44,1,54,1],"only":[14,1,32,1,37,1,39,1,40,1,41,1,43,1,44,1,46,1],"support":[14,1],"unknown":[14,1,28,1],"callinst":[15,2],"another":[15,2,43,2,44,2,50,1],"som":[15,2,35,1,36,1],"argument":[15,5,16,2,17,3,18,3,32,6,35,1,36,3,37,1,40,1,41,1,45,1,48,2,52,1,61,6],"calle":[15,3,46,1,61,3],"arg0":[15,2,16,2,17,2,18,2,61,2],"arg1":[15,1,16,1,17,1,18,1,61,1],"arg2":[15,1,16,1,17,1,18,1,61,1],"execut":[15,1,16,1,17,1,18,1,50,3,51,2,52,1,53,1,55,1,56,1,61,1],"argn":[15,1,16,1,17,1,18,1,61,1],"pass":[15,2,16,1,17,4,18,4,30,2,41,1,61,3],"map":[15,1,17,1,18,1,30,1,61,1],"parameter":[15,2,17,2,18,1,27,1,35,1,38,1,39,1,61,3],"unmap":[15,1,17,1,61,1],"initializ":[15,1,17,1,47,1,60,2,61,1],"constructinst":[16,2],"object":[16,4,20,5,21,5,22,5,23,5,24,5,25,6,26,6,27,6,29,7,30,4,32,3,33,2,35,4,36,2,39,3,46,1,48,3,49,3,53,1,57,3,60,5],"constructor":[16,7,33,1,46,4],"step":[16,1,53,1],"sec":[16,2,20,2,23,2],"13":[16,1],"suppli":[16,1],"callbuiltininst":[17,2],"builtin":[17,4,19,3],"builtinnumber":[17,2,19,2],"specific":[17,1,18,1],"way":[17,1,18,1],"callintrinsicinst":[18,2],"unsaf":[18,2],"compiler":[18,2],"intrinsic":[18,4],"intrinsicsindex":[18,2],"getbuiltinclosureinst":[19,2],"get":[19,2],"loadpropertyinst":[20,2,21,1],"field":[20,3,21,4,22,3,23,3,24,4,25,1,26,1,27,3],"getvalu":[20,1],"8":[20,1,23,1],"7":[20,1,23,1],"appli":[20,1,23,1],"tryloadglobalpropertyinst":[21,2],"exist":[21,5,24,5,25,1,26,1,27,1,55,2],"doesn":[21,3,24,3],"t":[21,3,24,3,32,1],"literal":[21,1,24,1,26,1,30,2,31,2,33,2,55,1,60,2],"similar":[21,1,24,1,56,1],"but":[21,1,24,1,50,1,53,1],"deletepropertyinst":[22,2],"delet":[22,2],"modify":[22,1,44,2],"storepropertyinst":[23,2,24,1],"4":[23,1,24,1,25,1,26,1,27,1,28,1,36,1,61,2],"modifi":[23,1,25,1,27,1],"putvalu":[23,1],"trystoreglobalpropertyinst":[24,2],"attempt":[24,2],"storeownpropertyinst":[25,2],"own":[25,3,26,3,27,2],"enumerabl":[25,3,26,3,27,3],"boolean":[25,1,26,1,55,1],"determin":[25,1,26,1,27,1],"whether":[25,2,26,2,27,2,39,3,47,2],"updat":[25,1,27,1],"instanc":[25,1,26,1,27,1,39,4],"regardless":[25,1,26,1,27,1],"sam":[25,1,26,1,27,1,34,1],"already":[25,1,26,1,27,1],"earlier":[25,1,26,1,27,1],"prototyp":[25,1,26,1,27,1,29,1],"chain":[25,1,26,1,27,1],"storenewownpropertyinst":[26,2],"what":[26,2],"known":[26,2],"impossibl":[26,1],"guarante":[26,1],"storegettersetterinst":[27,2],"associat":[27,2],"pair":[27,2,30,1,34,1,42,1],"getter":[27,5],"setter":[27,5],"replac":[27,3,53,1],"previous":[27,2],"accessor":[27,3],"both":[27,2,40,1],"even":[27,1,33,1],"throwifhasrestrictedglobalpropertyinst":[28,2],"rais":[28,2],"exception":[28,2,37,5,38,3,39,1,47,1,55,1],"given":[28,2,53,2,54,2],"restrict":[28,4],"check":[28,1,39,10,47,3,52,1],"again":[28,1],"es2023":[28,1],"9":[28,1],"14":[28,1],"allocobjectinst":[29,2,30,2],"heap":[29,3,30,3,31,3,32,2,60,3],"sizehint":[29,2,31,2],"literalnumber":[29,1],"parent":[29,5],"emptysentinel":[29,2],"null":[29,3],"indicat":[29,1],"least":[29,1],"many":[29,1],"slot":[29,1],"optional":[29,1],"mean":[29,2],"use":[29,2,36,1],"no":[29,1,36,1,45,2,47,1,55,1],"specifi":[29,1,58,5],"invalid":[29,1,39,1],"emptysenyinel":[29,1],"silently":[29,1],"ignor":[29,1,55,1],"allocobjectliteralinst":[30,2],"dur":[30,2,37,1],"lower":[30,4],"either":[30,2],"hbcallocobjectfrombufferinst":[30,2,60,2],"prop1":[30,1],"10":[30,1],"prop":[30,1],"vector":[30,1],"their":[30,1,44,2],"key":[30,1,60,1],"initial":[30,1,31,3,60,1],"list":[30,1,31,2,42,1,60,1],"allocarrayinst":[31,2],"array":[31,6,32,2,53,4,60,1],"value0":[31,1,42,1,43,1,44,1,48,1,60,1],"tell":[31,1],"siz":[31,2,35,2],"should":[31,1,32,1],"equal":[31,1],"larger":[31,1],"than":[31,1,44,2,54,1],"element":[31,3],"rest":[31,1],"all":[31,1,60,1],"non":[31,1,32,1,46,1,48,2,50,1,56,1,57,1,60,1],"after":[31,1,43,1,44,1],"elision":[31,1],"insert":[31,1,60,1],"separately":[31,1,60,1],"hint":[31,1],"createargumentsinst":[32,3],"lik":[32,2],"populat":[32,1],"copy":[32,1,61,1],"accord":[32,1],"strict":[32,1,48,2],"mod":[32,1,48,2],"set":[32,1,50,1,52,2,53,2,54,2],"length":[32,1,54,1],"isn":[32,1],"copi":[32,1],"count":[32,1],"ther":[32,1],"createregexpinst":[33,2],"regexp":[33,6],"pattern":[33,3],"flag":[33,3],"literalstr":[33,2],"equivalent":[33,1],"except":[33,1,44,2],"built":[33,1],"has":[33,1,39,2,47,1],"been":[33,1],"overridden":[33,1],"switchinst":[34,2],"switch":[34,2],"plac":[34,2],"default":[34,2],"val0":[34,1],"block0":[34,1,42,1],"val1":[34,1],"block1":[34,1,42,1],"accept":[34,1],"mor":[34,1],"destination":[34,2,35,1,36,2,44,2],"primitiv":[34,1],"js":[34,1],"within":[34,1],"identical":[34,1],"sequenc":[34,1],"statement":[34,2,45,2],"compar":[34,1],"cas":[34,1,35,1,39,1],"repeat":[34,1],"allow":[34,1],"getpnamesinst":[35,1,36,1],"enumerator":[35,6,36,3],"collection":[35,2],"register":[35,2,38,1,39,1,43,3,44,5,61,1],"hold":[35,2,39,1],"stat":[35,3,36,2,50,2],"iterator":[35,2,53,3,54,11,55,7],"bas":[35,2,50,1],"index":[35,2,54,3,55,1],"etc":[35,2],"getpnamesint":[35,1],"propertyaddr":[35,1,36,1],"baseaddr":[35,1,36,1],"indexaddr":[35,1,36,1],"sizeaddr":[35,1,36,1],"iteratoraddr":[35,1,36,1],"onempty":[35,1],"onlast":[35,1,36,1],"first":[35,1,36,1,50,2],"5":[35,1,39,1],"last":[35,1,36,1,42,1],"terminator":[35,1,36,1,38,1],"prepar":[35,1,36,1],"getnextpnameinst":[35,1,36,2],"consum":[35,1],"next":[36,4,50,1,51,4,52,1,53,2,54,4],"onsom":[36,1],"written":[36,1],"availabl":[36,1],"catchinst":[37,4,38,1,40,1],"catch":[37,3],"hav":[37,1,39,2,41,1,42,1],"finally":[37,1,52,1],"can":[37,1,53,1,56,1],"show":[37,1],"up":[37,1],"begin":[37,1,40,3,50,1,51,1,53,2],"coverag":[37,1],"depth":[37,1],"information":[37,1,51,2],"dynamically":[37,1],"later":[37,1],"bytecod":[37,1,43,1,44,1],"generation":[37,1],"throwinst":[38,2],"e":[38,1],"tak":[38,1,39,1,40,1,45,1],"contain":[38,1,40,1],"transition":[38,1],"cover":[38,1,40,1],"closest":[38,1],"checkhasinstanceinst":[39,2],"particular":[39,2],"left":[39,3],"right":[39,3],"ontru":[39,2],"onfals":[39,2],"instanceof":[39,2],"part":[39,1],"could":[39,1],"possibly":[39,1],"label":[39,1],"trystartinst":[40,2],"mark":[40,2,41,3,56,1],"try":[40,5,41,3],"catchtargetblock":[40,3],"trybodyblock":[40,3],"body":[40,1,58,5,59,3],"start":[40,1,61,1],"successor":[40,1],"nop":[40,1,41,1],"track":[40,1,41,1],"tryendinst":[41,2],"end":[41,3,61,1],"technically":[41,1],"touch":[41,1],"however":[41,1],"prevent":[41,1],"optimization":[41,1],"going":[41,1],"phiinst":[42,2],"phi":[42,3],"nod":[42,2],"incom":[42,4],"phinod":[42,1],"entry":[42,1],"locat":[42,1],"dominat":[42,1],"movinst":[43,2],"mov":[43,6,44,5],"inst":[43,2,44,2],"low":[43,2],"any":[43,1,44,1,48,1,52,1],"away":[43,1,44,1],"ssa":[43,1,44,1],"form":[43,1,44,1],"implicitmovinst":[44,2],"implicitmov":[44,3],"implicitly":[44,2],"immediately":[44,2],"subsequent":[44,2,52,1],"express":[44,2],"optimizer":[44,2],"other":[44,2,47,1],"debuggerinst":[45,2],"correspond":[45,2],"debugger":[45,2],"behavior":[45,1],"dependent":[45,1],"getnewtargetinst":[46,2],"obtain":[46,2,57,2],"class":[46,1],"invok":[46,1],"throwifemptyinst":[47,2],"referenceerror":[47,2],"tdz":[47,1],"functionality":[47,1],"declar":[47,1],"let":[47,1],"poison":[47,1],"until":[47,1],"they":[47,1,56,1],"potentially":[47,1,48,1],"sid":[47,1],"effect":[47,1],"coercethisn":[48,2],"coerc":[48,2],"using":[48,2,58,2],"coercion":[48,2],"creategenerator":[49,2,59,1],"generatorinnerfunction":[49,3,50,2,59,1],"wrap":[49,3,59,1],"generator":[49,4,50,1,51,2,52,2,59,3],"s":[49,1,58,2,59,2],"inner":[49,1],"environment":[49,1,58,6,59,4],"startgenerator":[50,2],"proper":[50,2],"basicblock":[50,2,51,1],"resumegenerator":[50,1,52,2],"internal":[50,1],"handl":[50,1],"request":[50,1,52,6],"user":[50,1,52,6],"restor":[50,1],"saveandyield":[51,3],"resum":[51,3,52,2],"execution":[51,3],"yield":[51,4],"upon":[51,1],"resumegeneratorinst":[51,1],"alongsid":[51,1],"ip":[51,1],"action":[52,2],"isreturn":[52,4],"output":[52,1],"continu":[52,2],"handler":[52,1],"exampl":[52,1],"befor":[52,1],"iteratorbegin":[53,2],"destructur":[53,3,54,3],"iterabl":[53,2],"sourc":[53,4,54,1],"sourceornext":[53,3,54,5],"out":[53,1],"location":[53,1,54,1],"iteration":[53,2,54,1],"els":[53,1,54,1],"method":[53,2,54,2],"remain":[53,1],"unmodifi":[53,1],"so":[53,1],"symbol":[53,1],"iteratornext":[54,2],"less":[54,1],"increment":[54,1],"actual":[54,1],"complet":[54,1],"signal":[54,1],"re":[54,1],"don":[54,1],"iteratorclos":[55,2],"clos":[55,3],"ignoreinnerexception":[55,3],"op":[55,1],"unreachableinst":[56,2],"crash":[56,2],"ifndef":[56,2],"ndebug":[56,2],"stub":[56,1],"verify":[56,1],"never":[56,1],"avoid":[56,1],"reorder":[56,1],"hbcgetglobalobjectinst":[57,2],"hbccreatefunction":[58,2],"hbccreategenerator":[59,1],"buffer":[60,2],"alternat":[60,1],"hbccallninst":[61,2],"fix":[61,2],"inclusiv":[61,2]}};
+export default segment;
@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"838150e4188470c7d057180c5747250b47330298","docs":[["AALOAD","Load reference from array"],["AASTORE","Store into reference array"],["ACONST_NULL","Push null"],["ALOAD","Load reference from local variable"],["ALOAD_0","Load reference from local variable"],["ALOAD_1","Load reference from local variable"],["ALOAD_2","Load reference from local variable"],["ALOAD_3","Load reference from local variable"],["ANEWARRAY","Create new array of reference"],["ARETURN","Return reference from method"],["ARRAYLENGTH","Get length of array"],["ASTORE","Store reference into local variable"],["ASTORE_0","Store reference into local variable"],["ASTORE_1","Store reference into local variable"],["ASTORE_2","Store reference into local variable"],["ASTORE_3","Store reference into local variable"],["ATHROW","Throw exception or error"],["BALOAD","Load byte or boolean from array"],["BASTORE","Store into byte or boolean array"],["BIPUSH","Push byte"],["CALOAD","Load char from array"],["CASTORE","Store into char array"],["CHECKCAST","Check whether object is of given type"],["D2F","Convert double to float"],["D2I","Convert double to int"],["D2L","Convert double to long"],["DADD","Add double"],["DALOAD","Load double from array"],["DASTORE","Store into double array"],["DCMPG","Compare double"],["DCMPL","Compare double"],["DCONST_0","Push double"],["DCONST_1","Push double"],["DDIV","Divide double"],["DLOAD","Load double from local variable"],["DLOAD_0","Load double from local variable"],["DLOAD_1","Load double from local variable"],["DLOAD_2","Load double from local variable"],["DLOAD_3","Load double from local variable"],["DMUL","Multiply double"],["DNEG","Negate double"],["DREM","Remainder double"],["DRETURN","Return double from method"],["DSTORE","Store double into local variable"],["DSTORE_0","Store double into local variable"],["DSTORE_1","Store double into local variable"],["DSTORE_2","Store double into local variable"],["DSTORE_3","Store double into local variable"],["DSUB","Subtract double"],["DUP","Duplicate the top operand stack value"],["DUP_X1","Duplicate the top operand stack value and insert two values down"],["DUP_X2","Duplicate the top operand stack value and insert two or three values down"],["DUP2","Duplicate the top one or two operand stack values"],["DUP2_X1","Duplicate the top one or two operand stack values and insert two or three values down"],["DUP2_X2","Duplicate the top one or two operand stack values and insert two, three, or four values down"],["F2D","Convert float to double"],["F2I","Convert float to int"],["F2L","Convert float to long"],["FADD","Add float"],["FALOAD","Load float from array"],["FASTORE","Store into float array"],["FCMPG","Compare float"],["FCMPL","Compare float"],["FCONST_0, 1","Push float"],["FCONST_2","Push float"],["FDIV","Divide float"],["FLOAD","Load float from local variable"],["FLOAD_0","Load float from local variable"],["FLOAD_1","Load float from local variable"],["FLOAD_2","Load float from local variable"],["FLOAD_3","Load float from local variable"],["FMUL","Multiply float"],["FNEG","Negate float"],["FREM","Remainder float"],["FRETURN","Return float from method"],["FSTORE","Store float into local variable"],["FSTORE_0","Store float into local variable"],["FSTORE_1","Store float into local variable"],["FSTORE_2","Store float into local variable"],["FSTORE_3","Store float into local variable"],["FSUB","Subtract float"],["GETFIELD","Fetch field from object"],["GETSTATIC","Get static field from class"],["GOTO","Branch always"],["GOTO_W","Branch always (wide index)"],["I2B","Convert int to byte"],["I2C","Convert int to char"],["I2D","Convert int to double"],["I2F","Convert int to float"],["I2L","Convert int to long"],["I2S","Convert int to short"],["IADD","Add int"],["IALOAD","Load int from array"],["IAND","Boolean AND int"],["IASTORE","Store into int array"],["ICONST_M1","Push int constant"],["ICONST_0","Push int constant"],["ICONST_1","Push int constant"],["ICONST_2","Push int constant"],["ICONST_3","Push int constant"],["ICONST_4","Push int constant"],["ICONST_5","Push int constant"],["IDIV","Divide int"],["IF_ACMPEQ","Branch if reference comparison succeeds"],["IF_ACMPNE","Branch if reference comparison succeeds"],["IF_ICMPEQ","Branch if int comparison succeeds"],["IF_ICMPNE","Branch if int comparison succeeds"],["IFEQ","Branch if int comparison with zero succeeds"],["IFNE","Branch if int comparison with zero succeeds"],["IFNONNULL","Branch if reference not null"],["IFNULL","Branch if reference is null"],["IINC","Increment local variable by constant"],["ILOAD","Load int from local variable"],["ILOAD_0","Load int from local variable"],["ILOAD_1","Load int from local variable"],["ILOAD_2","Load int from local variable"],["ILOAD_3","Load int from local variable"],["IMUL","Multiply int"],["INEG","Negate int"],["INSTANCEOF","Determine if object is of given type"],["INVOKEDYNAMIC","Invoke a dynamically-computed call site"],["INVOKEINTERFACE","Invoke interface method"],["INVOKESPECIAL","Invoke instance method; direct invocation of instance initialization methods and methods of the current class and its supertypes"],["INVOKESTATIC","Invoke a class (static) method"],["INVOKEVIRTUAL","Invoke instance method; dispatch based on class"],["IOR","Boolean OR int"],["IREM","Remainder int"],["IRETURN","Return int from method"],["ISHL","Shift left int"],["ISHR","Arithmetic shift right int"],["ISTORE","Store int into local variable"],["ISTORE_0","Store int into local variable"],["ISTORE_1","Store int into local variable"],["ISTORE_2","Store int into local variable"],["ISTORE_3","Store int into local variable"],["ISUB","Subtract int"],["IUSHR","Logical shift right int"],["IXOR","Boolean XOR int"],["JSR","Jump subroutine"],["JSR_W","Jump subroutine (wide index)"],["L2D","Convert long to double"],["L2F","Convert long to float"],["L2I","Convert long to int"],["LADD","Add long"],["LALOAD","Load long from array"],["LAND","Boolean AND long"],["LASTORE","Store into long array"],["LCMP","Compare long"],["LCONST_0","Push long constant"],["LCONST_1","Push long constant"],["LDC","Push item from run-time constant pool"],["LDC_W","Push item from run-time constant pool (wide index)"],["LDC2_W","Push long or double from run-time constant pool (wide index)"],["LDIV","Divide long"],["LLOAD","Load long from local variable"],["LLOAD_0","Load long from local variable"],["LLOAD_1","Load long from local variable"],["LLOAD_2","Load long from local variable"],["LLOAD_3","Load long from local variable"],["LMUL","Multiply long"],["LNEG","Negate long"],["LOOKUPSWITCH","Access jump table by key match and jump"],["LOR","Boolean OR long"],["LREM","Remainder long"],["LRETURN","Return long from method"],["LSHL","Shift left long"],["LSHR","Arithmetic shift right long"],["LSTORE","Store long into local variable"],["LSTORE_0","Store long into local variable"],["LSTORE_1","Store long into local variable"],["LSTORE_2","Store long into local variable"],["LSTORE_3","Store long into local variable"],["LSUB","Subtract long"],["LUSHR","Logical shift right long"],["LXOR","Boolean XOR long"],["MONITORENTER","Enter monitor for object"],["MONITOREXIT","Exit monitor for object"],["MULTIANEWARRAY","Create new multidimensional array"],["NEW","Create new object"],["NEWARRAY","Create new array"],["NOP","Do nothing"],["POP","Pop the top operand stack value"],["POP2","Pop the top one or two operand stack values"],["PUTFIELD","Set field in object"],["PUTSTATIC","Set static field in class"],["RET","Return from subroutine"],["RETURN","Return void from method"],["SALOAD","Load short from array"],["SASTORE","Store into short array"],["SIPUSH","Push short"],["SWAP","Swap the top two operand stack values"],["TABLESWITCH","Access jump table by index and jump"],["WIDE","Extend local variable index by additional bytes"]],"lengths":[47,41,22,43,43,43,43,43,107,80,35,47,47,47,47,47,47,56,43,24,50,48,58,40,33,32,33,47,48,29,29,26,26,33,47,46,46,46,46,33,30,31,69,50,49,49,49,49,33,31,46,49,42,59,56,33,33,33,33,47,48,29,29,30,28,33,43,43,43,43,43,33,30,31,69,45,45,45,45,45,33,66,68,48,65,36,36,33,40,34,36,33,47,37,46,31,31,31,31,31,31,31,42,35,35,38,38,36,36,60,57,53,43,43,43,43,43,33,31,59,67,76,99,82,76,37,35,73,47,51,45,45,45,45,45,33,51,39,58,76,40,40,45,33,47,36,48,61,26,26,49,76,78,38,47,46,46,46,46,33,31,109,37,35,69,48,53,50,49,49,49,49,33,54,39,18,18,64,89,30,16,23,32,66,68,47,51,50,48,39,29,118,26],"postings":{"aaload":[0,3],"load":[0,2,3,2,4,2,5,2,6,2,7,2,17,2,20,2,27,2,34,2,35,2,36,2,37,2,38,2,59,2,66,2,67,2,68,2,69,2,70,2,92,2,112,2,113,2,114,2,115,2,116,2,144,2,154,2,155,2,156,2,157,2,158,2,187,2],"referenc":[0,5,1,5,2,1,3,3,4,3,5,3,6,3,7,3,8,5,9,3,10,2,11,3,12,3,13,3,14,3,15,3,16,1,17,1,18,1,20,1,21,1,22,2,27,1,28,1,59,1,60,1,81,3,82,3,92,1,94,1,103,3,104,3,109,3,110,3,119,2,120,1,121,2,122,2,123,2,124,2,144,1,146,1,175,1,176,1,178,2,183,3,184,3,187,1,188,1],"array":[0,4,1,3,3,1,4,1,5,1,6,1,7,1,8,8,10,4,11,1,12,1,13,1,14,1,15,1,17,4,18,3,20,4,21,4,22,1,27,4,28,4,34,1,35,1,36,1,37,1,38,1,43,1,44,1,45,1,46,1,47,1,59,4,60,4,66,1,67,1,68,1,69,1,70,1,75,1,76,1,77,1,78,1,79,1,92,4,94,4,111,1,112,1,113,1,114,1,115,1,116,1,119,1,130,1,131,1,132,1,133,1,134,1,144,4,146,4,154,1,155,1,156,1,157,1,158,1,167,1,168,1,169,1,170,1,171,1,177,4,179,3,187,4,188,4],"instruction":[0,1,1,1,2,1,3,1,4,1,5,1,6,1,7,1,8,1,9,2,10,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,2,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1,62,1,63,1,64,1,65,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,2,75,1,76,1,77,1,78,1,79,1,80,1,81,1,82,1,83,4,84,4,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,1,93,1,94,1,95,1,96,1,97,1,98,1,99,1,100,1,101,1,102,1,103,1,104,1,105,1,106,1,107,1,108,1,109,4,110,4,111,1,112,1,113,1,114,1,115,1,116,1,117,1,118,1,119,1,120,1,121,1,122,1,123,1,124,1,125,1,126,1,127,2,128,1,129,1,130,1,131,1,132,1,133,1,134,1,135,1,136,1,137,1,138,6,139,6,140,1,141,1,142,1,143,1,144,1,145,1,146,1,147,1,148,1,149,1,150,1,151,1,152,1,153,1,154,1,155,1,156,1,157,1,158,1,159,1,160,1,161,3,162,1,163,1,164,2,165,1,166,1,167,1,168,1,169,1,170,1,171,1,172,1,173,1,174,1,175,1,176,1,177,1,178,1,179,1,180,1,181,1,182,1,183,1,184,1,185,1,186,2,187,1,188,1,189,1,190,1,191,3,192,1],"format":[0,1,1,1,2,1,3,1,4,1,5,1,6,1,7,1,8,1,9,1,10,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1,62,1,63,1,64,1,65,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,81,1,82,1,83,1,84,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,1,93,1,94,1,95,1,96,1,97,1,98,1,99,1,100,1,101,1,102,1,103,1,104,1,105,1,106,1,107,1,108,1,109,1,110,1,111,1,112,1,113,1,114,1,115,1,116,1,117,1,118,1,119,1,120,1,121,1,122,1,123,1,124,1,125,1,126,1,127,1,128,1,129,1,130,1,131,1,132,1,133,1,134,1,135,1,136,1,137,1,138,1,139,1,140,1,141,1,142,1,143,1,144,1,145,1,146,1,147,1,148,1,149,1,150,1,151,1,152,1,153,1,154,1,155,1,156,1,157,1,158,1,159,1,160,1,161,1,162,1,163,1,164,1,165,1,166,1,167,1,168,1,169,1,170,1,171,1,172,1,173,1,174,1,175,1,176,1,177,1,178,1,179,1,180,1,181,1,182,1,183,1,184,1,185,1,186,1,187,1,188,1,189,1,190,1,191,1,192,1],"operand":[0,3,1,2,2,2,3,2,4,2,5,2,6,2,7,2,8,3,9,4,10,3,11,3,12,3,13,3,14,3,15,3,16,2,17,3,18,2,19,2,20,3,21,2,22,1,23,4,24,4,25,4,26,3,27,3,28,2,29,2,30,2,31,2,32,2,33,3,34,2,35,2,36,2,37,2,38,2,39,3,40,3,41,3,42,4,43,3,44,3,45,3,46,3,47,3,48,3,49,5,50,5,51,5,52,5,53,5,54,5,55,4,56,4,57,4,58,3,59,3,60,2,61,2,62,2,63,2,64,2,65,3,66,2,67,2,68,2,69,2,70,2,71,3,72,3,73,3,74,4,75,3,76,3,77,3,78,3,79,3,80,3,81,1,82,1,83,1,84,1,85,4,86,4,87,4,88,4,89,4,90,4,91,3,92,3,93,3,94,2,95,2,96,2,97,2,98,2,99,2,100,2,101,2,102,3,103,2,104,2,105,2,106,2,107,2,108,2,109,2,110,2,111,1,112,2,113,2,114,2,115,2,116,2,117,3,118,3,119,2,120,2,121,1,122,1,123,1,124,1,125,3,126,3,127,4,128,3,129,3,130,3,131,3,132,3,133,3,134,3,135,3,136,3,137,3,138,2,139,2,140,4,141,4,142,4,143,3,144,3,145,3,146,2,147,5,148,2,149,2,150,1,151,1,152,1,153,3,154,2,155,2,156,2,157,2,158,2,159,3,160,3,161,1,162,3,163,3,164,4,165,3,166,3,167,3,168,3,169,3,170,3,171,3,172,3,173,3,174,3,175,1,176,1,177,3,178,2,179,2,180,1,181,4,182,4,183,1,184,1,185,1,186,2,187,3,188,2,189,2,190,4,191,1,192,1],"stack":[0,3,1,2,2,2,3,2,4,2,5,2,6,2,7,2,8,3,9,4,10,3,11,3,12,3,13,3,14,3,15,3,16,2,17,3,18,2,19,2,20,3,21,2,22,1,23,4,24,4,25,4,26,3,27,3,28,2,29,2,30,2,31,2,32,2,33,3,34,2,35,2,36,2,37,2,38,2,39,3,40,3,41,3,42,4,43,3,44,3,45,3,46,3,47,3,48,3,49,5,50,5,51,5,52,5,53,5,54,5,55,4,56,4,57,4,58,3,59,3,60,2,61,2,62,2,63,2,64,2,65,3,66,2,67,2,68,2,69,2,70,2,71,3,72,3,73,3,74,4,75,3,76,3,77,3,78,3,79,3,80,3,81,1,82,1,83,1,84,1,85,4,86,4,87,4,88,4,89,4,90,4,91,3,92,3,93,3,94,2,95,2,96,2,97,2,98,2,99,2,100,2,101,2,102,3,103,2,104,2,105,2,106,2,107,2,108,2,109,2,110,2,111,1,112,2,113,2,114,2,115,2,116,2,117,3,118,3,119,2,120,1,121,1,122,1,123,1,124,1,125,3,126,3,127,4,128,3,129,3,130,3,131,3,132,3,133,3,134,3,135,3,136,3,137,3,138,2,139,2,140,4,141,4,142,4,143,3,144,3,145,3,146,2,147,5,148,2,149,2,150,1,151,1,152,1,153,3,154,2,155,2,156,2,157,2,158,2,159,3,160,3,161,1,162,3,163,3,164,4,165,3,166,3,167,3,168,3,169,3,170,3,171,3,172,3,173,3,174,3,175,1,176,1,177,2,178,2,179,2,180,1,181,4,182,4,183,1,184,1,185,1,186,2,187,3,188,2,189,2,190,4,191,1,192,1],"arrayref":[0,3,1,3,8,2,10,2,17,3,18,3,20,3,21,3,27,3,28,3,59,3,60,3,92,3,94,3,144,3,146,3,177,1,179,1,187,3,188,3],"index":[0,4,1,3,3,5,4,1,5,1,6,1,7,1,8,3,11,4,12,1,13,1,14,1,15,1,17,4,18,3,20,4,21,5,22,3,27,4,28,5,34,6,43,6,59,4,60,5,66,5,67,1,68,1,69,1,70,1,75,4,76,1,77,1,78,1,79,1,81,3,82,3,84,2,92,4,94,5,111,5,112,5,113,1,114,1,115,1,116,1,119,3,120,3,121,3,122,3,123,3,124,3,130,4,131,1,132,1,133,1,134,1,139,2,144,4,146,5,150,4,151,7,152,7,154,6,167,6,178,3,183,3,184,3,185,3,187,4,188,5,191,3,192,2],"valu":[0,2,1,3,8,2,9,1,11,1,12,1,13,1,14,1,15,1,17,3,18,3,19,3,20,3,21,4,22,1,23,2,24,2,25,2,26,1,27,2,28,4,29,1,30,1,33,1,34,2,35,2,36,2,37,2,38,2,39,1,40,3,41,1,42,4,43,3,44,3,45,3,46,3,47,3,48,1,49,7,50,7,51,7,52,5,53,9,54,6,55,2,56,2,57,2,58,1,59,2,60,4,61,1,62,1,65,1,66,2,67,2,68,2,69,2,70,2,71,1,72,3,73,1,74,4,75,4,76,4,77,4,78,4,79,4,80,1,81,2,82,2,85,2,86,2,87,2,88,2,89,2,90,2,91,1,92,2,94,4,102,2,107,2,108,2,109,3,110,3,111,1,112,2,113,2,114,2,115,2,116,2,117,1,118,4,119,1,120,2,121,1,122,1,123,1,124,1,126,1,127,4,128,2,129,2,130,4,131,4,132,4,133,4,134,4,135,1,136,2,138,1,139,1,140,2,141,2,142,3,143,1,144,2,146,4,147,3,150,1,151,2,152,2,153,2,154,2,155,2,156,2,157,2,158,2,159,1,160,4,161,3,163,1,164,4,165,1,166,2,167,3,168,3,169,3,170,3,171,3,172,1,173,2,177,2,178,2,181,4,182,3,183,2,184,2,185,1,186,1,187,3,188,4,189,6,190,3,191,3],"must":[0,3,1,4,3,2,4,2,5,2,6,2,7,2,8,2,9,2,10,2,11,2,12,2,13,2,14,2,15,2,16,2,17,3,18,3,20,3,21,3,22,2,23,1,24,1,25,1,26,1,27,3,28,4,29,1,30,1,33,1,34,2,35,2,36,2,37,2,38,2,39,1,40,1,41,1,42,2,43,2,44,2,45,2,46,2,47,2,48,1,55,1,56,1,57,1,58,1,59,3,60,4,61,1,62,1,65,1,66,2,67,2,68,2,69,2,70,2,71,1,72,1,73,1,74,2,75,2,76,2,77,2,78,2,79,2,80,1,81,1,82,1,83,1,84,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,3,93,1,94,3,102,1,103,1,104,1,105,1,106,1,107,1,108,1,109,2,110,2,111,2,112,2,113,2,114,2,115,2,116,2,117,1,118,1,119,2,120,2,121,1,122,1,123,1,124,1,125,1,126,1,127,2,128,1,129,1,130,2,131,2,132,2,133,2,134,2,135,1,136,1,137,1,138,1,139,1,140,1,141,1,142,1,143,1,144,3,145,1,146,4,147,1,150,2,151,2,152,2,153,1,154,2,155,2,156,2,157,2,158,2,159,1,160,1,161,2,162,1,163,1,164,2,165,2,166,2,167,2,168,2,169,2,170,2,171,2,172,1,173,2,174,1,175,1,176,1,177,4,178,1,179,1,183,1,184,1,185,1,186,1,187,3,188,3,191,2],"typ":[0,3,1,4,8,5,9,3,10,1,11,2,12,2,13,2,14,2,15,2,16,1,17,4,18,4,20,3,21,3,22,4,23,1,24,1,25,1,26,1,27,3,28,4,29,1,30,1,33,1,39,1,40,1,41,1,42,2,43,1,44,1,45,1,46,1,47,1,48,1,55,1,56,1,57,1,58,1,59,3,60,4,61,1,62,1,65,1,71,1,72,1,73,1,74,2,75,1,76,1,77,1,78,1,79,1,80,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,3,93,1,94,3,102,1,103,1,104,1,105,1,106,1,107,1,108,1,109,1,110,1,117,1,118,1,119,4,125,1,126,1,127,2,128,1,129,1,130,1,131,1,132,1,133,1,134,1,135,1,136,1,137,1,138,1,139,1,140,1,141,1,142,1,143,1,144,3,145,1,146,4,147,1,153,1,159,1,160,1,162,1,163,1,164,2,165,2,166,2,167,1,168,1,169,1,170,1,171,1,172,1,173,2,174,1,175,1,176,1,177,1,178,3,179,1,185,1,186,1,187,3,188,3],"refer":[0,1,1,1,9,1,10,1,16,1,17,1,18,1,20,1,21,1,27,1,28,1,59,1,60,1,92,1,94,1,144,1,146,1,187,1,188,1],"whos":[0,1,1,1,17,1,18,1,20,1,21,1,27,1,28,1,59,1,60,1,92,1,94,1,144,1,146,1,187,1,188,1],"component":[0,2,1,1,8,3,17,2,18,1,20,2,21,2,27,2,28,2,59,2,60,2,92,2,94,2,144,2,146,2,177,1,187,2,188,2],"int":[0,1,1,1,8,1,10,1,17,2,18,1,19,1,20,2,21,2,24,3,27,1,28,1,56,3,59,1,60,1,85,4,86,4,87,3,88,3,89,3,90,4,91,4,92,5,93,4,94,5,95,3,96,3,97,3,98,3,99,3,100,3,101,3,102,4,105,3,106,3,107,3,108,3,111,2,112,3,113,3,114,3,115,3,116,3,117,4,118,4,125,4,126,4,127,4,128,4,129,4,130,3,131,3,132,3,133,3,134,3,135,4,136,4,137,4,142,3,144,1,146,1,147,3,161,1,165,1,166,1,173,1,177,1,179,1,187,2,188,2,189,1],"both":[0,1,17,1,18,1,20,1,21,1,26,1,27,1,29,1,30,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,41,1,43,1,44,1,45,1,46,1,47,1,48,1,58,1,59,1,61,1,62,1,65,1,71,1,73,1,80,1,91,1,92,1,93,1,94,1,102,1,103,2,104,2,105,2,106,2,117,1,125,1,126,1,128,1,129,1,135,1,136,1,137,1,143,1,144,1,145,1,147,2,153,1,154,1,155,1,156,1,157,1,158,1,159,1,162,1,163,1,167,1,168,1,169,1,170,1,171,1,172,1,174,1,187,1,188,1],"pop":[0,1,1,1,8,1,9,1,10,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,20,1,21,1,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,33,1,39,1,40,1,41,1,42,1,43,1,44,1,45,1,46,1,47,1,48,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1,62,1,65,1,71,1,72,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,1,93,1,94,1,102,1,103,1,104,1,105,1,106,1,107,1,108,1,109,1,110,1,117,1,118,1,119,1,125,1,126,1,127,1,128,1,129,1,130,1,131,1,132,1,133,1,134,1,135,1,136,1,137,1,140,1,141,1,142,1,143,1,144,1,145,1,146,1,147,1,153,1,159,1,160,1,162,1,163,1,164,1,165,1,166,1,167,1,168,1,169,1,170,1,171,1,172,1,173,1,174,1,179,1,181,6,182,3,187,1,188,1],"retriev":[0,1,17,1,20,1,27,1,59,1,92,1,144,1,187,1],"push":[0,1,2,3,3,1,4,1,5,1,6,1,7,1,8,1,9,1,10,1,17,1,19,3,20,1,23,1,24,1,25,1,26,1,27,1,31,3,32,3,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,48,1,49,1,52,1,55,1,56,1,57,1,58,1,59,1,63,3,64,3,65,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,1,80,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,1,93,1,95,3,96,3,97,3,98,3,99,3,100,3,101,3,102,1,112,1,113,1,114,1,115,1,116,1,117,1,118,1,125,1,126,1,127,1,128,1,129,1,135,1,136,1,137,1,138,1,139,1,140,1,141,1,142,1,143,1,144,1,145,1,147,3,148,3,149,3,150,2,151,2,152,2,153,1,154,1,155,1,156,1,157,1,158,1,159,1,160,1,162,1,163,1,164,1,165,1,166,1,172,1,173,1,174,1,178,1,187,1,189,3],"onto":[0,1,2,1,3,1,4,1,5,1,6,1,7,1,8,1,9,1,10,1,17,1,19,1,20,1,23,1,24,1,25,1,26,1,27,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,48,1,49,1,52,1,55,1,56,1,57,1,58,1,59,1,63,1,64,1,65,1,66,1,67,1,68,1,69,1,70,1,71,1,72,1,73,1,74,1,80,1,85,1,86,1,87,1,88,1,89,1,90,1,91,1,92,1,93,1,95,1,96,1,97,1,98,1,99,1,100,1,101,1,102,1,112,1,113,1,114,1,115,1,116,1,117,1,118,1,125,1,126,1,127,1,128,1,129,1,135,1,136,1,137,1,138,1,139,1,140,1,141,1,142,1,143,1,144,1,145,1,147,3,148,1,149,1,153,1,154,1,155,1,156,1,157,1,158,1,159,1,160,1,162,1,163,1,164,1,165,1,166,1,172,1,173,1,174,1,178,1,187,1,189,1],"aastor":[1,3],"stor":[1,2,11,2,12,2,13,2,14,2,15,2,18,2,21,3,28,3,43,2,44,2,45,2,46,2,47,2,60,3,75,2,76,2,77,2,78,2,79,2,94,3,130,2,131,2,132,2,133,2,134,2,146,3,167,2,168,2,169,2,170,2,171,2,188,3],"aconst":[2,3],"null":[2,7,8,1,109,3,110,3,192,1],"object":[2,1,8,1,9,1,16,1,22,2,81,2,119,2,175,2,176,2,178,3,183,2],"aload":[3,3,4,3,5,3,6,3,7,3],"local":[3,5,4,5,5,5,6,5,7,5,11,4,12,4,13,4,14,4,15,4,34,5,35,5,36,5,37,5,38,5,43,4,44,4,45,4,46,4,47,4,66,5,67,5,68,5,69,5,70,5,75,4,76,4,77,4,78,4,79,4,111,5,112,5,113,5,114,5,115,5,116,5,130,4,131,4,132,4,133,4,134,4,154,5,155,5,156,5,157,5,158,5,167,4,168,4,169,4,170,4,171,4,185,2,192,2],"variabl":[3,5,4,5,5,5,6,5,7,5,11,4,12,4,13,4,14,4,15,4,34,5,35,5,36,5,37,5,38,5,43,4,44,4,45,4,46,4,47,4,66,5,67,5,68,5,69,5,70,5,75,4,76,4,77,4,78,4,79,4,111,5,112,5,113,5,114,5,115,5,116,5,130,4,131,4,132,4,133,4,134,4,154,5,155,5,156,5,157,5,158,5,161,1,167,4,168,4,169,4,170,4,171,4,178,1,185,2,191,1,192,2],"objectref":[3,2,4,2,5,2,6,2,7,2,9,3,11,3,12,3,13,3,14,3,15,3,16,5,22,3,81,1,119,2,121,1,122,1,124,1,175,2,176,2,178,2,183,1],"unsign":[3,1,8,1,11,1,22,1,34,1,43,1,66,1,75,1,81,1,82,1,83,1,84,1,109,1,110,1,111,1,112,1,119,1,120,1,121,1,122,1,123,1,124,1,130,1,138,1,139,1,150,1,151,2,152,2,154,1,161,1,167,1,177,1,178,1,183,1,184,1,185,1,189,1],"byt":[3,1,11,1,17,4,18,3,19,4,34,1,43,1,66,1,75,1,83,1,84,1,85,3,111,2,112,1,120,1,127,1,130,1,150,1,154,1,161,3,167,1,177,1,185,1,191,4,192,2],"current":[3,1,4,1,5,1,6,1,7,1,8,1,9,5,11,1,12,1,13,1,14,1,15,1,16,1,22,1,34,1,35,1,36,1,37,1,38,1,42,5,43,1,44,1,45,1,46,1,47,1,66,1,67,1,68,1,69,1,70,1,74,5,75,1,76,1,77,1,78,1,79,1,81,1,82,1,111,1,112,1,113,1,114,1,115,1,116,1,119,1,120,1,121,1,122,3,123,1,124,1,127,5,130,1,131,1,132,1,133,1,134,1,150,1,151,2,152,2,154,1,155,1,156,1,157,1,158,1,161,1,164,5,167,1,168,1,169,1,170,1,171,1,178,1,183,1,184,1,185,1,186,4,191,1],"fram":[3,1,4,1,5,1,6,1,7,1,9,2,11,1,12,1,13,1,14,1,15,1,34,1,35,1,36,1,37,1,38,1,42,2,43,1,44,1,45,1,46,1,47,1,66,1,67,1,68,1,69,1,70,1,74,2,75,1,76,1,77,1,78,1,79,1,111,1,112,1,113,1,114,1,115,1,116,1,127,2,130,1,131,1,132,1,133,1,134,1,154,1,155,1,156,1,157,1,158,1,164,2,167,1,168,1,169,1,170,1,171,1,185,1,186,1],"2":[3,1,4,1,5,1,6,3,7,1,8,2,9,2,11,1,12,1,13,1,14,3,15,1,16,2,22,1,23,1,34,1,35,1,36,1,37,3,38,1,42,1,43,1,44,1,45,1,46,3,47,1,63,1,64,3,66,1,67,1,68,1,69,3,70,1,74,1,75,1,76,1,77,1,78,3,79,1,81,2,82,2,88,1,95,1,96,1,97,1,98,3,99,1,100,1,101,1,102,1,111,1,112,1,113,1,114,1,115,3,116,1,119,1,120,1,121,1,122,1,123,1,124,1,127,1,130,1,131,1,132,1,133,3,134,1,140,1,141,1,150,1,151,1,152,1,154,1,155,1,156,1,157,3,158,1,164,1,167,1,168,1,169,1,170,3,171,1,178,3,183,2,184,2,185,1,186,1],"6":[3,1,4,1,5,1,6,1,7,1,8,1,9,1,11,1,12,1,13,1,14,1,15,1,16,1,22,1,34,1,35,1,36,1,37,1,38,1,42,1,43,1,44,1,45,1,46,1,47,1,66,1,67,1,68,1,69,1,70,1,74,1,75,1,76,1,77,1,78,1,79,1,81,1,82,1,111,1,112,1,113,1,114,1,115,1,116,1,119,1,120,1,121,1,122,1,123,1,124,1,127,1,130,1,131,1,132,1,133,1,134,1,154,1,155,1,156,1,157,1,158,1,164,1,165,1,166,1,167,1,168,1,169,1,170,1,171,1,173,1,178,1,183,1,184,1,185,1,186,1],"contain":[3,1,4,1,5,1,6,1,7,1,34,1,35,1,36,1,37,1,38,1,66,1,67,1,68,1,69,1,70,1,83,1,84,1,109,1,110,1,111,1,112,1,113,1,114,1,115,1,116,1,138,1,139,1,154,1,155,1,156,1,157,1,158,1,177,1,185,1],"0":[4,2,12,2,31,5,32,3,35,2,44,2,63,6,64,4,67,2,76,2,95,1,96,3,97,1,98,1,99,1,100,1,101,1,113,2,120,2,121,1,131,2,147,1,148,3,149,1,155,2,161,1,168,2,185,1,191,1],"n":[4,4,5,4,6,4,7,4,12,3,13,3,14,3,15,3,35,5,36,5,37,5,38,5,44,5,45,5,46,5,47,5,67,4,68,4,69,4,70,4,76,3,77,3,78,3,79,3,113,4,114,4,115,4,116,4,131,3,132,3,133,3,134,3,155,5,156,5,157,5,158,5,168,5,169,5,170,5,171,5],"1":[5,2,8,1,13,2,31,1,32,3,34,1,35,1,36,3,37,1,38,1,43,2,44,2,45,4,46,2,47,2,51,1,52,1,53,1,54,1,63,3,64,1,68,2,77,2,81,1,82,1,95,2,96,2,97,4,98,2,99,2,100,2,101,2,114,2,120,1,121,1,122,1,123,1,124,1,132,2,147,2,148,1,149,3,150,1,151,1,152,1,154,1,155,1,156,3,157,1,158,1,167,2,168,2,169,4,170,2,171,2,177,1,178,1,182,1,183,1,184,1,191,2],"3":[7,2,8,1,9,2,15,2,38,2,47,2,70,2,79,2,81,1,82,1,95,1,96,1,97,1,98,1,99,3,100,1,101,1,116,2,121,3,122,5,123,5,124,4,134,2,158,2,171,2,178,2,183,1,184,1],"anewarray":[8,3],"creat":[8,3,177,4,178,2,179,3],"new":[8,5,177,2,178,7,179,2],"indexbyte1":[8,3,22,3,81,3,82,3,119,3,120,3,121,3,122,3,123,3,124,3,151,3,152,3,177,1,178,3,183,3,184,3,192,1],"indexbyte2":[8,3,22,3,81,3,82,3,119,3,120,3,121,3,122,3,123,3,124,3,151,3,152,3,177,1,178,3,183,3,184,3,192,1],"count":[8,4,121,1,179,3],"off":[8,1,179,1],"represent":[8,1,9,1,177,2,179,1],"number":[8,1,177,2,179,1],"used":[8,1,22,1,81,1,82,1,83,1,84,1,109,1,110,1,119,1,120,1,121,1,122,1,123,1,124,1,138,1,139,1,178,1,183,1,184,1],"construct":[8,1,22,1,81,1,82,1,83,1,84,1,109,1,110,1,119,1,120,1,121,1,122,1,123,1,124,1,138,1,139,1,161,1,178,1,183,1,184,1,191,1],"run":[8,2,22,2,81,2,82,2,119,2,120,2,121,2,122,2,123,2,124,2,150,4,151,5,152,5,178,2,183,2,184,2],"tim":[8,2,22,2,81,2,82,2,119,2,120,2,121,2,122,2,123,2,124,2,150,4,151,5,152,5,178,2,183,2,184,2],"constant":[8,2,22,2,31,1,32,1,63,1,64,1,81,2,82,2,95,3,96,3,97,3,98,3,99,3,100,3,101,3,111,2,119,2,120,2,121,2,122,2,123,2,124,2,148,3,149,3,150,4,151,5,152,5,178,2,183,2,184,2],"pool":[8,2,22,2,81,2,82,2,119,2,120,2,121,2,122,2,123,2,124,2,150,4,151,5,152,5,178,2,183,2,184,2],"class":[8,3,16,2,22,2,81,2,82,4,119,2,120,1,121,1,122,4,123,4,124,4,150,1,151,2,152,2,178,5,183,2,184,4],"wher":[8,1,22,1,81,1,82,1,83,1,84,1,109,1,110,1,119,1,120,1,121,1,122,1,123,1,124,1,128,1,129,1,136,1,138,1,139,1,151,1,152,1,165,1,166,1,173,1,178,1,183,1,184,1,189,1],"8":[8,1,22,1,23,1,81,1,82,1,83,1,84,1,88,1,109,1,110,1,119,1,120,1,121,1,122,1,123,1,124,1,138,1,139,1,140,1,141,1,151,1,152,1,161,1,178,1,183,1,184,1,189,1,191,1],"entry":[8,1,22,1,81,1,82,1,119,1,120,1,121,1,122,1,123,1,124,1,150,1,151,1,152,1,178,1,183,1,184,1],"symbolic":[8,1,22,1,81,2,82,2,119,1,120,1,121,2,122,2,123,2,124,2,178,1,183,2,184,2],"interfac":[8,2,22,1,82,1,119,1,121,7,122,4,123,4,178,2,184,1],"nam":[8,1,81,1,82,1,121,2,122,2,123,2,124,2,178,1,183,1,184,1],"resolv":[8,1,81,1,82,1,121,1,122,1,123,1,124,1,178,1,183,1,184,1],"5":[8,1,9,1,81,2,82,2,95,1,96,1,97,1,98,1,99,1,100,1,101,3,120,1,121,2,122,3,123,3,124,2,128,1,129,1,136,1,150,3,151,3,152,3,178,1,183,2,184,2],"4":[8,2,9,1,81,1,82,1,95,1,96,1,97,1,98,1,99,1,100,3,101,1,121,3,122,4,123,4,124,2,178,2,183,1,184,1],"length":[8,1,10,5,161,1,177,1,191,1],"allocat":[8,1,178,1],"garbag":[8,1,178,1],"collect":[8,1,178,1],"heap":[8,1,178,1],"all":[8,1,105,1,106,1,107,1,108,1],"initializ":[8,1,178,1],"default":[8,1,161,1,178,1,191,1],"areturn":[9,3],"return":[9,3,42,3,74,3,127,3,164,3,185,2,186,6],"method":[9,7,16,1,42,7,74,7,83,1,84,1,109,1,110,1,121,6,122,13,123,9,124,6,127,7,138,1,139,1,161,1,164,7,186,6,191,1],"empty":[9,1,42,1,74,1,127,1,164,1,186,1],"assignment":[9,1],"compatibl":[9,1],"jls":[9,1,102,1],"descriptor":[9,1,81,1,82,1,121,1,122,1,123,1,124,1,183,1,184,1],"synchroniz":[9,1,42,1,74,1,127,1,164,1,186,1],"monitor":[9,1,42,1,74,1,127,1,164,1,175,2,176,2,186,1],"enter":[9,1,42,1,74,1,127,1,164,1,175,2,186,1],"reenter":[9,1,42,1,74,1,127,1,164,1,186,1],"invocation":[9,1,42,1,74,1,122,2,127,1,164,1,186,1],"updat":[9,1,42,1,74,1,127,1,164,1,186,1],"possibly":[9,1,42,1,74,1,127,1,164,1,186,1],"exit":[9,1,42,1,74,1,127,1,164,1,176,2,186,1],"execution":[9,1,42,1,74,1,83,1,84,1,109,1,110,1,127,1,138,1,139,1,164,1,185,1,186,1],"monitorexit":[9,2,42,2,74,2,127,2,164,2,176,3,186,2],"thread":[9,1,42,1,74,1,127,1,164,1,186,1],"no":[9,1,42,1,74,1,83,1,84,1,111,1,127,1,164,1,180,1,185,1,186,1],"exception":[9,1,16,3,42,1,74,1,127,1,164,1,186,1],"thrown":[9,1,16,1,42,1,74,1,127,1,164,1,186,1],"invoker":[9,1,42,1,74,1,127,1,164,1],"any":[9,1,42,1,74,1,127,1,150,1,151,1,164,1,186,1],"other":[9,1,42,1,74,1,127,1,164,1],"discard":[9,1,42,1,74,1,127,1,142,1,164,1,186,1],"arraylength":[10,3],"get":[10,2,82,2],"determin":[10,1,119,2],"astor":[11,3,12,3,13,3,14,3,15,3],"top":[11,1,12,1,13,1,14,1,15,1,17,1,23,1,24,1,25,1,43,1,44,1,45,1,46,1,47,1,49,3,50,3,51,3,52,3,53,3,54,3,55,1,56,1,57,1,75,1,76,1,77,1,78,1,79,1,85,1,86,1,87,1,88,1,89,1,90,1,130,1,131,1,132,1,133,1,134,1,140,1,141,1,142,1,167,1,168,1,169,1,170,1,171,1,181,3,182,3,190,3],"returnaddress":[11,1,12,1,13,1,14,1,15,1,138,1,139,1,185,1],"set":[11,1,12,1,13,1,14,1,15,1,43,1,44,1,45,1,46,1,47,1,75,1,76,1,77,1,78,1,79,1,130,1,131,1,132,1,133,1,134,1,167,1,168,1,169,1,170,1,171,1,183,2,184,2],"athrow":[16,3],"throw":[16,2],"error":[16,2],"instanc":[16,1,122,4,124,2,178,3],"throwabl":[16,2],"subclass":[16,1],"search":[16,1],"first":[16,1,111,1,120,1,161,1,177,1,191,1],"handler":[16,1],"match":[16,1,161,4],"given":[16,1,22,2,119,2],"algorithm":[16,1],"10":[16,1],"baload":[17,3],"boolean":[17,3,18,3,93,2,125,2,127,1,137,2,145,2,162,2,174,2],"sign":[17,1,19,1,83,1,84,1,85,1,89,1,90,1,105,1,106,1,107,1,108,1,109,1,110,1,111,2,129,1,138,1,139,1,147,1,161,4,166,1,187,1,189,1,191,4],"extend":[17,1,19,1,20,1,85,1,86,1,89,1,90,1,111,1,187,1,189,1,192,2],"bastor":[18,3],"bipush":[19,3],"immediat":[19,1,111,1,189,1],"caload":[20,3],"char":[20,3,21,4,86,3,127,1],"zero":[20,1,86,1,107,3,108,3,120,1,136,1,161,1,173,1,191,1],"castor":[21,3],"truncat":[21,1,85,1,86,1,90,1,188,1],"checkcast":[22,3],"check":[22,2],"whether":[22,2],"d2f":[23,3],"convert":[23,3,24,3,25,3,55,3,56,3,57,3,85,2,86,2,87,3,88,3,89,2,90,2,140,3,141,3,142,3],"doubl":[23,3,24,3,25,3,26,4,27,4,28,5,29,3,30,3,31,3,32,3,33,4,34,3,35,3,36,3,37,3,38,3,39,4,40,4,41,4,42,4,43,3,44,3,45,3,46,3,47,3,48,4,55,3,87,3,140,3,152,2],"float":[23,3,29,1,30,1,55,3,56,3,57,3,58,4,59,4,60,5,61,4,62,4,63,3,64,3,65,4,66,3,67,3,68,3,69,3,70,3,71,4,72,4,73,4,74,4,75,3,76,3,77,3,78,3,79,3,80,4,88,3,141,3],"result":[23,3,24,3,25,2,26,3,29,1,30,1,33,3,39,3,40,3,41,2,48,3,55,3,56,3,57,3,58,3,61,1,62,1,65,3,71,3,72,3,73,2,80,3,85,3,86,3,87,3,88,3,89,3,90,3,91,3,93,3,102,3,103,1,104,1,105,1,106,1,107,1,108,1,117,3,118,3,119,1,125,3,126,3,128,3,129,3,135,3,136,3,137,3,140,3,141,3,142,3,143,3,145,3,147,1,153,3,159,3,160,3,162,3,163,3,165,3,166,3,172,3,173,3,174,3,178,1],"using":[23,1,88,1,140,1,141,1],"round":[23,2,88,2,140,2,141,2],"nearest":[23,1,88,1,140,1,141,1],"policy":[23,1,88,1,140,1,141,1],"d2i":[24,3],"d2l":[25,3],"long":[25,3,57,3,89,3,140,3,141,3,142,4,143,4,144,4,145,4,146,5,147,3,148,3,149,3,152,2,153,4,154,3,155,3,156,3,157,3,158,3,159,4,160,4,162,4,163,4,164,4,165,4,166,4,167,3,168,3,169,3,170,3,171,3,172,4,173,4,174,4],"dadd":[26,3],"add":[26,2,58,2,91,2,143,2],"value1":[26,3,29,2,30,2,33,3,39,3,41,2,48,3,50,3,51,1,52,1,53,1,54,1,58,3,61,2,62,2,65,3,71,3,73,2,80,3,91,3,93,3,102,3,103,2,104,2,105,2,106,2,117,3,125,3,126,4,128,3,129,3,135,3,136,3,137,3,143,3,145,3,147,5,153,3,159,3,162,3,163,4,165,3,166,3,172,3,173,3,174,3,182,1,190,2],"value2":[26,3,29,2,30,2,33,3,39,3,41,2,48,3,50,2,51,1,52,1,53,1,54,1,58,3,61,2,62,2,65,3,71,3,73,2,80,3,91,3,93,3,102,3,103,2,104,2,105,2,106,2,117,3,125,3,126,4,128,3,129,3,135,3,136,3,137,3,143,3,145,3,147,5,153,3,159,3,162,3,163,4,165,3,166,3,172,3,173,3,174,3,182,1,190,2],"daload":[27,3],"dastor":[28,3],"dcmpg":[29,2],"compar":[29,2,30,2,61,2,62,2,103,1,104,1,105,1,106,1,107,1,108,1,147,2],"dcmp":[29,1,30,1],"op":[29,1,30,1,61,1,62,1],"point":[29,1,30,1,61,1,62,1],"comparison":[29,1,30,1,61,1,62,1,103,3,104,3,105,4,106,4,107,4,108,4,147,1],"perform":[29,1,30,1,61,1,62,1,147,1],"dcmpl":[30,2],"dconst":[31,3,32,3],"d":[31,3,32,3],"ddiv":[33,3],"divid":[33,2,65,2,102,2,153,2],"dload":[34,3,35,3,36,3,37,3,38,3],"indic":[34,1,35,1,36,1,37,1,38,1,43,1,44,1,45,1,46,1,47,1,154,1,155,1,156,1,157,1,158,1,167,1,168,1,169,1,170,1,171,1],"dmul":[39,3],"multiply":[39,2,71,2,117,2,159,2],"dneg":[40,3],"negat":[40,2,72,2,118,2,160,2],"arithmetic":[40,1,72,1,118,1,129,2,160,1,166,2],"negation":[40,1,72,1,118,1,160,1],"drem":[41,3],"remainder":[41,2,73,2,126,2,163,2],"calculat":[41,1,73,1,93,1,109,1,110,1,125,1,128,1,129,1,136,1,137,1,145,1,151,1,152,1,162,1,165,1,166,1,173,1,174,1],"dreturn":[42,3],"hav":[42,1,74,1,127,1,164,1,186,1],"dstor":[43,3,44,3,45,3,46,3,47,3],"dsub":[48,3],"subtract":[48,2,80,2,135,2,172,2],"dup":[49,3,50,3,51,3],"duplicat":[49,4,50,4,51,4,52,4,53,4,54,4],"x1":[50,3,53,3],"insert":[50,3,51,3,53,3,54,3],"two":[50,3,51,3,52,3,53,5,54,5,182,3,190,3],"down":[50,3,51,3,53,2,54,2],"x2":[51,3,54,3],"thre":[51,3,53,2,54,2,161,1,191,2],"form":[51,1,52,1,53,1,54,1,182,1],"value3":[51,1,53,1,54,1],"dup2":[52,3,53,3,54,3],"one":[52,3,53,4,54,3,152,1,182,3],"back":[52,1],"original":[52,1,53,2,54,1],"order":[52,1,53,1,54,1,142,2],"beneath":[53,1],"four":[54,2,161,2,191,1],"value4":[54,1],"f2d":[55,3],"f2i":[56,3],"f2l":[57,3],"fadd":[58,3],"faload":[59,3],"fastor":[60,3],"fcmpg":[61,2],"fcmp":[61,1,62,1],"fcmpl":[62,2],"fconst":[63,3,64,3],"f":[63,3,64,3],"fdiv":[65,3],"fload":[66,3,67,3,68,3,69,3,70,3],"fmul":[71,3],"fneg":[72,3],"frem":[73,3],"freturn":[74,3],"fstor":[75,3,76,3,77,3,78,3,79,3],"fsub":[80,3],"getfield":[81,3],"fetch":[81,2],"field":[81,6,82,6,183,6,184,6],"giv":[81,1,82,1,121,1,122,1,123,1,124,1,183,1,184,1],"well":[81,1,82,1,121,1,122,1,123,1,124,1,183,1,184,1],"found":[81,1,82,1,121,1,122,1,123,1,124,1,183,1,184,1],"getstatic":[82,3],"static":[82,2,123,2,184,2],"goto":[83,5,84,5],"branch":[83,2,84,2,103,2,104,2,105,2,106,2,107,2,108,2,109,2,110,2],"alway":[83,2,84,2,120,1],"branchbyte1":[83,3,84,3,103,1,104,1,105,1,106,1,107,1,108,1,109,3,110,3,138,3,139,3],"branchbyte2":[83,3,84,3,103,1,104,1,105,1,106,1,107,1,108,1,109,3,110,3,138,3,139,3],"chang":[83,1,84,1,111,1,180,1,185,1],"undefin":[83,1,84,1,111,1,180,1,185,1,192,1],"16":[83,1,84,1,109,1,110,1,138,1,139,1,151,1,152,1,161,1,191,1],"bit":[83,1,84,1,109,1,110,1,128,2,129,2,136,2,138,1,139,1,142,2,151,1,152,1,161,4,165,2,166,2,173,2,191,4],"branchoffset":[83,2,84,2],"proc":[83,1,84,1,109,1,110,1,138,1,139,1],"offset":[83,1,84,1,109,3,110,3,138,3,139,3,161,2,191,3],"address":[83,2,84,2,109,2,110,2,138,4,139,4,161,1,191,1],"opcod":[83,2,84,2,109,2,110,2,138,2,139,2,161,2,191,2],"target":[83,1,84,1,109,1,110,1,138,1,139,1],"within":[83,1,84,1,109,1,110,1,138,1,139,1],"w":[84,5,139,6,151,3,152,3],"wid":[84,2,139,2,151,2,152,2,192,4],"branchbyte3":[84,3,139,3],"branchbyte4":[84,3,139,3],"32":[84,1,139,1,142,2,161,4,191,4],"24":[84,1,139,1,161,1,191,1],"i2b":[85,3],"i2c":[86,3],"i2d":[87,3],"i2f":[88,3],"i2l":[89,3],"i2s":[90,3],"short":[90,3,127,1,187,3,188,4,189,4],"iadd":[91,3],"iaload":[92,3],"iand":[93,3],"they":[93,1,103,1,104,1,105,1,106,1,125,1,137,1,145,1,147,1,162,1,174,1],"tak":[93,1,125,1,137,1,142,1,145,1,162,1,174,1],"bitwis":[93,1,125,1,137,1,145,1,162,1,174,1],"conjunction":[93,1],"iastor":[94,3],"iconst":[95,3,96,3,97,3,98,3,99,3,100,3,101,3],"m1":[95,2],"i":[95,3,96,3,97,3,98,3,99,3,100,3,101,3],"idiv":[102,3],"java":[102,1,153,1,185,1],"program":[102,1,153,1],"languag":[102,1,153,1],"expression":[102,1,153,1],"15":[102,1],"17":[102,1],"acmpeq":[103,2],"succ":[103,2,104,2,105,2,106,2,107,2,108,2],"acmp":[103,1,104,1],"cond":[103,1,104,1,105,1,106,1,107,1,108,1],"follow":[103,1,104,1,105,1,106,1,107,1,108,1,138,1,139,1,150,1,151,1,152,1,161,1,191,1],"acmpn":[104,2],"icmpeq":[105,2],"icmp":[105,1,106,1],"icmpn":[106,2],"ifeq":[107,2],"against":[107,1,108,1],"ifn":[108,2],"ifnonnull":[109,5],"not":[109,3,150,1,151,1],"ifnull":[110,5],"iinc":[111,3],"increment":[111,3],"const":[111,3],"amount":[111,1],"iload":[112,3,113,3,114,3,115,3,116,3],"imul":[117,3],"ineg":[118,3],"instanceof":[119,3],"invokedynamic":[120,3],"invok":[120,2,121,2,122,2,123,2,124,2],"dynamically":[120,3],"comput":[120,3],"call":[120,3],"sit":[120,3],"arg1":[120,1,121,1,122,1,123,1,124,1],"arg2":[120,1,121,1,122,1,123,1,124,1],"third":[120,1],"fourth":[120,1],"invokeinterfac":[121,3],"invokespecial":[122,3],"direct":[122,2],"initialization":[122,2],"supertyp":[122,2],"invokestatic":[123,3],"invokevirtual":[124,3],"dispatch":[124,2],"bas":[124,2,191,1],"ior":[125,3],"inclusiv":[125,1,162,1,185,1],"irem":[126,3],"ireturn":[127,3],"ishl":[128,3],"shift":[128,3,129,3,136,3,165,3,166,3,173,3],"left":[128,3,165,3],"s":[128,2,129,2,136,2,165,2,166,2,173,2,185,1],"position":[128,1,129,1,136,1,165,1,166,1,173,1],"low":[128,1,129,1,136,1,142,1,165,1,166,1,173,1,191,4],"ishr":[129,3],"right":[129,3,136,3,166,3,173,3],"extension":[129,1,136,1,166,1,173,1],"istor":[130,3,131,3,132,3,133,3,134,3],"isub":[135,3],"iushr":[136,3],"logical":[136,2,173,2],"ixor":[137,3],"xor":[137,2,174,2],"exclusiv":[137,1,174,1],"jsr":[138,6,139,6],"jump":[138,2,139,2,161,4,191,6],"subroutin":[138,2,139,2,185,2],"immediately":[138,1,139,1,161,2,191,3],"l2d":[140,3],"l2f":[141,3],"l2i":[142,3],"high":[142,1,191,4],"ladd":[143,3],"laload":[144,3],"land":[145,3],"lastor":[146,3],"lcmp":[147,3],"integer":[147,1],"greater":[147,1,161,1,177,1],"than":[147,2,161,1,177,1,191,1],"equal":[147,1,161,1,177,1,191,1],"less":[147,1,191,1],"lconst":[148,3,149,3],"l":[148,3,149,3],"ldc":[150,3,151,3],"item":[150,2,151,2],"valid":[150,1,151,1,152,1],"loadabl":[150,1,151,1,152,1],"assembl":[151,1,152,1,189,1],"ldc2":[152,3],"particular":[152,1],"ldiv":[153,3],"lload":[154,3,155,3,156,3,157,3,158,3],"lmul":[159,3],"lneg":[160,3],"lookupswitch":[161,5],"access":[161,2,191,2],"tabl":[161,2,191,3],"key":[161,3],"defaultbyte1":[161,2,191,2],"defaultbyte2":[161,1,191,1],"defaultbyte3":[161,1,191,1],"defaultbyte4":[161,1,191,1],"npairs1":[161,1],"npairs2":[161,1],"npairs3":[161,1],"npairs4":[161,1],"pair":[161,3],"after":[161,2,191,2],"between":[161,1,185,1,191,1],"act":[161,1,191,1],"pad":[161,2,191,2],"such":[161,1,177,1,191,1],"begin":[161,1,191,1],"multipl":[161,1,191,1],"start":[161,1,191,1],"sery":[161,1,191,1],"npair":[161,4],"each":[161,2,177,1,191,1],"consist":[161,1],"thes":[161,1,191,1],"byte1":[161,1,189,3,191,1],"byte2":[161,1,189,3,191,1],"byte3":[161,1,191,1],"byte4":[161,1,191,1],"lor":[162,3],"lrem":[163,3],"lreturn":[164,3],"lshl":[165,3],"lshr":[166,3],"lstor":[167,3,168,3,169,3,170,3,171,3],"lsub":[172,3],"lushr":[173,3],"logically":[173,1],"lxor":[174,3],"monitorenter":[175,3],"multianewarray":[177,3],"multidimensional":[177,2],"dimension":[177,6],"count1":[177,2],"count2":[177,2],"non":[177,1],"negativ":[177,1],"desir":[177,1],"second":[177,1],"etc":[177,1],"should":[178,1],"memory":[178,1],"their":[178,1],"initial":[178,1],"newarray":[179,3],"atyp":[179,1],"element":[179,1],"nop":[180,3],"do":[180,3],"noth":[180,3],"pop2":[182,3],"putfield":[183,3],"putstatic":[184,3],"ret":[185,3],"255":[185,1],"content":[185,1],"written":[185,1],"virtual":[185,1],"machin":[185,1],"pc":[185,1],"register":[185,1],"continu":[185,1],"ther":[185,1],"void":[186,3],"saload":[187,3],"sastor":[188,3],"sipush":[189,3],"intermediat":[189,2],"swap":[190,6],"tableswitch":[191,5],"lowbyte1":[191,1],"lowbyte2":[191,1],"lowbyte3":[191,1],"lowbyte4":[191,1],"highbyte1":[191,1],"highbyte2":[191,1],"highbyte3":[191,1],"highbyte4":[191,1],"constitut":[191,2],"treat":[191,1],"additional":[192,2],"196":[192,1],"0xc4":[192,1]}};
+export default segment;
@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"4763849f6da55165e342b29258df5beedefb54db","docs":[["RET","There are two forms of the ‘ret’ instruction: one that returns avalue and then causes control flow, and one that just causes controlflow to occur."],["BR","The conditional branch form of the ‘br’ instruction takes a single‘i1’ value and two ‘label’ values. The unconditional form of the‘br’ instruction takes a single ‘label’ value as a target."],["SWITCH","The ‘switch’ instruction uses three parameters: an integercomparison value ‘value’, a default ‘label’ destination, and anarray of pairs of comparison value constants and ‘label’s. The tableis not allowed to contain duplicate constant entries."],["INDIRECTBR","The ‘address’ argument is the address of the label to jump to. Therest of the arguments indicate the full set of possible destinationsthat the address may point to. Blocks are allowed to occur multipletimes in the destination list, though this isn’t particularly useful."],["INVOKE","The ‘exception’ label is a landingpad for the exception. As such,‘exception’ label is required to have the“landingpad” instruction, which contains theinformation about the behavior of the program after unwinding happens,as its first non-PHI instruction. The restrictions on the“landingpad” instruction’s tightly couples it to the “invoke”instruction, so that the important information contained within the“landingpad” instruction can’t be lost through normal code motion."],["CALLBR","This instruction should only be used to implement the “goto” feature of gccstyle inline assembly. Any other usage is an error in the IR verifier."],["RESUME","The ‘resume’ instruction requires one argument, which must have thesame type as the result of any ‘landingpad’ instruction in the samefunction."],["CATCHSWITCH","The parent argument is the token of the funclet that contains thecatchswitch instruction. If the catchswitch is not inside a funclet,this operand may be the token none."],["CATCHRET","The first argument to a ‘catchret’ indicates which catchpad itexits.  It must be a catchpad.The second argument to a ‘catchret’ specifies where control willtransfer to next."],["CLEANUPRET","The ‘cleanupret’ instruction requires one argument, which indicateswhich cleanuppad it exits, and must be a cleanuppad.If the specified cleanuppad is not the most-recently-entered not-yet-exitedfunclet pad (as described in the EH documentation),the cleanupret’s behavior is undefined."],["UNREACHABLE","The ‘unreachable’ instruction has no defined semantics."],["FNEG","The argument to the ‘fneg’ instruction must be afloating-point or vector offloating-point values."],["ADD","The two arguments to the ‘add’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["FADD","The two arguments to the ‘fadd’ instruction must befloating-point or vector offloating-point values. Both arguments must have identical types."],["SUB","Note that the ‘sub’ instruction is used to represent the ‘neg’instruction present in most other intermediate representations."],["FSUB","The two arguments to the ‘fsub’ instruction must befloating-point or vector offloating-point values. Both arguments must have identical types."],["MUL","The two arguments to the ‘mul’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["FMUL","The two arguments to the ‘fmul’ instruction must befloating-point or vector offloating-point values. Both arguments must have identical types."],["UDIV","The two arguments to the ‘udiv’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["SDIV","The two arguments to the ‘sdiv’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["FDIV","The two arguments to the ‘fdiv’ instruction must befloating-point or vector offloating-point values. Both arguments must have identical types."],["UREM","The two arguments to the ‘urem’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["SREM","The two arguments to the ‘srem’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["FREM","The two arguments to the ‘frem’ instruction must befloating-point or vector offloating-point values. Both arguments must have identical types."],["SHL","Both arguments to the ‘shl’ instruction must be the sameinteger or vector of integer type.‘op2’ is treated as an unsigned value."],["LSHR","Both arguments to the ‘lshr’ instruction must be the sameinteger or vector of integer type.‘op2’ is treated as an unsigned value."],["ASHR","Both arguments to the ‘ashr’ instruction must be the sameinteger or vector of integer type.‘op2’ is treated as an unsigned value."],["AND","The two arguments to the ‘and’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["OR","The two arguments to the ‘or’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["XOR","The two arguments to the ‘xor’ instruction must beinteger or vector of integer values. Botharguments must have identical types."],["EXTRACTELEMENT","The first operand of an ‘extractelement’ instruction is a value ofvector type. The second operand is an index indicatingthe position from which to extract the element. The index may be avariable of any integer type, and will be treated as an unsigned integer."],["INSERTELEMENT","The first operand of an ‘insertelement’ instruction is a value ofvector type. The second operand is a scalar value whosetype must equal the element type of the first operand. The third operandis an index indicating the position at which to insert the value. Theindex may be a variable of any integer type, and will be treated as anunsigned integer."],["SHUFFLEVECTOR","The first two operands of a ‘shufflevector’ instruction are vectorswith the same type. The third argument is a shuffle mask vector constantwhose element type is i32. The mask vector elements must be constantintegers or undef values. The result of the instruction is a vectorwhose length is the same as the shuffle mask and whose element type is thesame as the element type of the first two operands."],["EXTRACTVALUE","The first operand of an ‘extractvalue’ instruction is a value ofstruct or array type. The other operands areconstant indices to specify which value to extract in a similar manneras indices in a ‘getelementptr’ instruction."],["INSERTVALUE","The first operand of an ‘insertvalue’ instruction is a value ofstruct or array type. The second operand isa first-class value to insert. The following operands are constantindices indicating the position at which to insert the value in asimilar manner as indices in a ‘extractvalue’ instruction. The valueto insert must have the same type as the value identified by theindices."],["ALLOCA","The ‘alloca’ instruction allocates sizeof(<type>)*NumElementsbytes of memory on the runtime stack, returning a pointer of theappropriate type to the program. If “NumElements” is specified, it isthe number of elements allocated, otherwise “NumElements” is defaultedto be one. If a constant alignment is specified, the value result of theallocation is guaranteed to be aligned to at least that boundary. Thealignment may not be greater than 1 << 32. If not specified, or ifzero, the target can choose to align the allocation on any convenientboundary compatible with the type."],["LOAD","The argument to the load instruction specifies the memory address from whichto load. The type specified must be a first class type ofknown size (i.e. not containing an opaque structural type). Ifthe load is marked as volatile, then the optimizer is not allowed tomodify the number or order of execution of this load with othervolatile operations."],["STORE","There are two arguments to the store instruction: a value to store and anaddress at which to store it. The type of the <pointer> operand must be apointer to the first class type of the <value>operand. If the store is marked as volatile, then the optimizer is notallowed to modify the number or order of execution of this store with othervolatile operations.  Only values of first class types of known size (i.e. not containing an opaquestructural type) can be stored."],["FENCE","‘fence’ instructions take an ordering argument whichdefines what synchronizes-with edges they add. They can only be givenacquire, release, acq_rel, and seq_cst orderings."],["CMPXCHG","There are three arguments to the ‘cmpxchg’ instruction: an addressto operate on, a value to compare to the value currently be at thataddress, and a new value to place at that address if the compared valuesare equal. The type of ‘<cmp>’ must be an integer or pointer type whosebit width is a power of two greater than or equal to eight and lessthan or equal to a target-specific size limit. ‘<cmp>’ and ‘<new>’ musthave the same type, and the type of ‘<pointer>’ must be a pointer tothat type. If the cmpxchg is marked as volatile, then theoptimizer is not allowed to modify the number or order of execution ofthis cmpxchg with other volatile operations."],["ATOMICRMW","There are three arguments to the ‘atomicrmw’ instruction: anoperation to apply, an address whose value to modify, an argument to theoperation. The operation must be one of the following keywords"],["GETELEMENTPTR","The first argument is always a type used as the basis for the calculations.The second argument is always a pointer or a vector of pointers, and is thebase address to start from. The remaining arguments are indicesthat indicate which of the elements of the aggregate object are indexed.The interpretation of each index is dependent on the type being indexedinto. The first index always indexes the pointer value given as thesecond argument, the second index indexes a value of the type pointed to(not necessarily the value directly pointed to, since the first indexcan be non-zero), etc. The first type indexed into must be a pointervalue, subsequent types can be arrays, vectors, and structs. Note thatsubsequent types being indexed into can never be pointers, since thatwould require loading the pointer before continuing calculation."],["TRUNC-TO","The ‘trunc’ instruction takes a value to trunc, and a type to truncit to. Both types must be of integer types, or vectorsof the same number of integers. The bit size of the value must belarger than the bit size of the destination type, ty2. Equal sizedtypes are not allowed."],["ZEXT-TO","The ‘zext’ instruction takes a value to cast, and a type to cast itto. Both types must be of integer types, or vectors ofthe same number of integers. The bit size of the value must besmaller than the bit size of the destination type, ty2."],["SEXT-TO","The ‘sext’ instruction takes a value to cast, and a type to cast itto. Both types must be of integer types, or vectors ofthe same number of integers. The bit size of the value must besmaller than the bit size of the destination type, ty2."],["FPTRUNC-TO","The ‘fptrunc’ instruction takes a floating-pointvalue to cast and a floating-point type to cast it to.The size of value must be larger than the size of ty2. Thisimplies that fptrunc cannot be used to make a no-op cast."],["FPEXT-TO","The ‘fpext’ instruction takes a floating-pointvalue to cast, and a floating-point type to cast itto. The source type must be smaller than the destination type."],["FPTOUI-TO","The ‘fptoui’ instruction takes a value to cast, which must be ascalar or vector floating-point value, and a type tocast it to ty2, which must be an integer type. Ifty is a vector floating-point type, ty2 must be a vector integertype with the same number of elements as ty"],["FPTOSI-TO","The ‘fptosi’ instruction takes a value to cast, which must be ascalar or vector floating-point value, and a type tocast it to ty2, which must be an integer type. Ifty is a vector floating-point type, ty2 must be a vector integertype with the same number of elements as ty"],["UITOFP-TO","The ‘uitofp’ instruction takes a value to cast, which must be ascalar or vector integer value, and a type to cast it toty2, which must be an floating-point type. Ifty is a vector integer type, ty2 must be a vector floating-pointtype with the same number of elements as ty"],["SITOFP-TO","The ‘sitofp’ instruction takes a value to cast, which must be ascalar or vector integer value, and a type to cast it toty2, which must be an floating-point type. Ifty is a vector integer type, ty2 must be a vector floating-pointtype with the same number of elements as ty"],["PTRTOINT-TO","The ‘ptrtoint’ instruction takes a value to cast, which must bea value of type pointer or a vector of pointers, and atype to cast it to ty2, which must be an integer ora vector of integers type."],["INTTOPTR-TO","The ‘inttoptr’ instruction takes an integer value tocast, and a type to cast it to, which must be a pointertype."],["BITCAST-TO","The ‘bitcast’ instruction takes a value to cast, which must be anon-aggregate first class value, and a type to cast it to, which mustalso be a non-aggregate first class type. Thebit sizes of value and the destination type, ty2, must beidentical. If the source type is a pointer, the destination type mustalso be a pointer of the same size. This instruction supports bitwiseconversion of vectors to integers and to vectors of other types (aslong as they have the same size)."],["ADDRSPACECAST-TO","The ‘addrspacecast’ instruction takes a pointer or vector of pointer valueto cast and a pointer type to cast it to, which must have a differentaddress space."],["ICMP","The ‘icmp’ instruction takes three operands. The first operand isthe condition code indicating the kind of comparison to perform. It isnot a value, just a keyword. The possible condition codes are"],["FCMP","If the operands are floating-point scalars, then the result type is aboolean (i1)."],["PHI","The type of the incoming values is specified with the first type field.After this, the ‘phi’ instruction takes a list of pairs asarguments, with one pair for each predecessor basic block of the currentblock. Only values of first class type may be used asthe value arguments to the PHI node. Only labels may be used as thelabel arguments."],["SELECT","The ‘select’ instruction requires an ‘i1’ value or a vector of ‘i1’values indicating the condition, and two values of the same firstclass type."],["FREEZE","The ‘freeze’ instruction takes a single argument."],["CALL","This instruction requires several arguments"],["VA-ARG","This instruction takes a va_list* value and the type of theargument. It returns a value of the specified argument type andincrements the va_list to point to the next argument. The actualtype of va_list is target specific."],["LANDINGPAD","The optionalcleanup flag indicates that the landing pad block is a cleanup."],["CATCHPAD","The catchswitch operand must always be a token produced by acatchswitch instruction in a predecessor block. Thisensures that each catchpad has exactly one predecessor block, and it alwaysterminates in a catchswitch."],["CLEANUPPAD","The instruction takes a list of arbitrary values which are interpretedby the personality function."]],"lengths":[172,133,188,144,417,330,61,166,102,132,46,73,149,99,168,109,171,99,122,133,99,102,174,116,196,184,182,88,90,118,130,169,347,109,155,287,709,475,190,388,306,1074,152,135,137,110,111,133,132,122,122,151,178,250,166,346,453,226,158,235,679,154,281,198,181],"postings":{"ret":[0,14,1,2,4,3,5,1,35,1,41,2,60,6],"ther":[0,2,1,1,35,1,37,2,38,1,39,2,40,2,53,1,57,1,62,1,64,1],"two":[0,2,1,3,12,5,13,4,14,4,15,4,16,5,17,4,18,4,19,4,20,4,21,3,22,3,23,4,27,2,28,2,29,3,32,6,36,1,37,3,39,3,40,2,41,2,55,2,58,2,62,1],"form":[0,3,1,5,4,1,57,1],"instruction":[0,12,1,9,2,12,3,4,4,22,5,9,6,9,7,11,8,6,9,8,10,4,11,5,12,4,13,6,14,7,15,6,16,5,17,6,18,4,19,4,20,6,21,6,22,7,23,6,24,5,25,6,26,6,27,5,28,5,29,5,30,4,31,4,32,6,33,6,34,6,35,6,36,11,37,6,38,5,39,8,40,7,41,6,42,5,43,4,44,4,45,6,46,4,47,4,48,5,49,5,50,5,51,5,52,5,53,9,54,6,55,4,56,6,57,9,58,5,59,7,60,11,61,7,62,12,63,8,64,11],"one":[0,4,2,2,5,1,6,2,7,1,9,3,29,1,32,2,33,1,35,2,36,4,37,1,38,1,40,2,41,3,52,2,56,3,57,2,58,2,60,1,62,3,63,3,64,2],"return":[0,13,4,5,5,2,10,1,11,1,12,2,13,1,14,2,15,1,16,2,17,1,18,1,19,1,20,1,21,2,22,3,23,1,24,2,25,2,26,2,27,1,28,1,29,1,32,1,35,8,36,1,39,1,40,1,41,4,55,1,56,3,57,2,58,2,59,3,60,12,61,2],"avalu":[0,2,36,1,37,1],"caus":[0,4,1,1,4,1,5,1,60,2,61,1],"control":[0,4,1,3,2,3,3,1,4,4,5,2,7,1,8,3,9,2,60,1,63,1,64,2],"flow":[0,4,1,2,2,3,4,2,5,1,60,1],"just":[0,2,4,1,5,1,55,2,56,1,57,1,60,1],"controlflow":[0,2,5,1,60,1],"occur":[0,2,2,1,3,2,4,1,12,1,14,1,16,1,57,1,60,1],"syntax":[0,1,1,1,2,1,3,1,4,1,5,1,6,1,7,1,8,1,9,1,10,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1,62,1,63,1,64,1],"typ":[0,7,4,6,5,6,6,3,12,2,13,2,14,1,15,2,16,2,17,2,18,2,19,2,20,2,21,2,22,2,23,2,24,2,25,2,26,2,27,2,28,2,29,2,30,6,31,7,32,9,33,3,34,7,35,9,36,16,37,16,39,12,40,6,41,30,42,9,43,10,44,10,45,5,46,8,47,7,48,7,49,7,50,7,51,7,52,5,53,19,54,4,55,3,56,6,57,6,58,4,59,2,60,15,61,5,62,6,63,1,64,1],"valu":[0,11,1,7,2,12,4,6,5,5,6,1,9,2,11,3,12,5,13,3,14,4,15,3,16,5,17,3,18,5,19,5,20,3,21,2,22,4,23,3,24,4,25,4,26,4,27,2,28,2,29,2,30,6,31,10,32,3,33,8,34,12,35,2,36,20,37,15,39,17,40,6,41,11,42,6,43,6,44,7,45,6,46,4,47,9,48,9,49,8,50,8,51,11,52,8,53,11,54,2,55,13,56,3,57,8,58,10,59,8,60,8,61,4,62,3,64,2],"non":[0,2,4,3,5,1,7,5,24,1,25,1,26,1,32,1,41,3,53,2,57,1,59,1,60,3,62,1,63,2,64,2],"void":[0,5,4,1,5,2,36,1,37,2,38,2,60,6],"function":[0,6,1,1,3,2,4,12,5,12,8,1,9,2,10,1,23,1,35,3,36,1,57,1,60,23,61,4,62,6,63,1,64,5],"overview":[0,1,1,1,2,1,3,1,4,1,5,1,6,1,7,1,8,1,9,1,10,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,1,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,1,56,1,57,1,58,1,59,1,60,1,61,1,62,1,63,1,64,1],"used":[0,1,1,1,2,1,4,4,5,4,7,1,10,2,14,2,27,1,28,1,29,2,35,1,36,1,37,1,38,1,39,2,40,2,41,5,45,2,46,1,57,5,58,1,59,1,60,4,61,2,62,1,63,2,64,2],"optionallya":[0,1],"back":[0,2,40,1,53,1,54,1],"caller":[0,3,7,1,9,1,35,1,60,9,63,1],"argument":[0,2,1,4,2,1,3,6,4,7,5,7,6,3,7,4,8,6,9,3,11,3,12,3,13,5,14,2,15,5,16,3,17,5,18,3,19,3,20,5,21,4,22,3,23,5,24,4,25,4,26,4,27,3,28,3,29,3,30,1,31,1,32,3,33,1,34,1,35,1,36,6,37,6,38,4,39,5,40,7,41,12,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,2,56,3,57,5,58,4,59,5,60,12,61,12,62,2,63,1,64,3],"optionally":[0,1,41,1,56,1],"accept":[0,1,4,1,5,1,60,1],"singl":[0,1,1,4,30,1,36,4,37,1,41,1,52,1,59,2],"thereturn":[0,1,60,1],"must":[0,1,3,2,4,1,5,1,6,2,7,2,8,3,9,3,11,2,12,4,13,4,14,2,15,4,16,4,17,4,18,4,19,4,20,4,21,4,22,4,23,4,24,2,25,2,26,2,27,4,28,4,29,4,31,2,32,2,33,2,34,2,35,1,36,13,37,6,39,6,40,6,41,3,42,4,43,4,44,4,45,2,46,2,47,6,48,6,49,6,50,6,51,4,52,4,53,4,54,4,55,1,56,2,57,2,58,1,60,11,62,2,63,3,64,1],"firstclass":[0,1,58,2],"not":[0,2,2,2,4,2,5,3,7,2,8,2,9,4,10,1,14,2,18,2,19,1,21,1,22,2,33,2,35,8,36,14,37,11,38,1,39,4,40,1,41,11,42,2,54,3,55,1,56,10,59,1,60,10,61,3,62,3,63,2,64,5],"well":[0,1,3,1,36,3,37,1],"has":[0,2,1,1,2,1,3,3,6,1,8,1,9,2,10,3,12,1,14,1,16,1,18,1,19,1,22,2,23,1,35,1,36,3,37,3,38,2,41,2,57,1,58,1,60,1,62,2,63,4,64,3],"voidreturn":[0,1],"contain":[0,2,2,2,4,5,5,1,7,2,36,3,37,3,60,1,62,1,64,1],"no":[0,1,4,1,5,1,10,4,12,2,14,2,16,2,36,2,41,2,42,1,45,2,46,2,51,1,52,2,53,2,54,2,55,2,56,3,57,1,59,1,60,1],"ora":[0,1,51,2],"doe":[0,1,36,2,37,2,41,4,60,2,61,2,63,1,64,1],"match":[0,1,4,2,5,2,40,2,60,7,63,2],"avoid":[0,1],"returnvalu":[0,2,4,1,5,1,60,1],"semantic":[0,1,1,1,2,1,3,1,4,1,5,1,6,1,7,1,8,1,9,1,10,4,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,31,1,32,1,33,1,34,1,35,3,36,2,37,2,38,3,39,1,40,1,41,1,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,1,55,1,56,2,57,1,58,1,59,1,60,1,61,1,62,1,63,1,64,1],"execut":[0,1,2,1,7,2,8,1,13,1,15,1,17,1,20,1,23,1,35,1,36,1,45,1,63,1,64,1],"toth":[0,1,5,1,57,1,61,1],"call":[0,4,4,8,5,11,41,1,60,52,61,2,62,3,63,2,64,3],"s":[0,2,2,2,4,3,5,2,7,1,8,1,9,2,12,1,14,1,16,1,41,12,57,1,60,2,62,1,63,1,64,1],"context":[0,1],"execution":[0,2,1,1,36,2,37,2,39,2,40,1],"continu":[0,2,4,3,7,1,8,1,9,4,41,2,60,1,62,1],"theinstruction":[0,1,36,1],"after":[0,1,4,2,5,1,57,3,60,1],"invok":[0,2,4,12,57,1,62,1,63,1,64,1],"thebegin":[0,1],"normal":[0,1,4,7,8,2],"destination":[0,1,2,5,3,4,5,1,9,1,42,3,43,3,44,2,46,2,53,4,64,1],"block":[0,1,1,1,3,4,4,1,5,2,7,3,9,1,57,6,62,8,63,6,64,7],"returnsa":[0,1],"shall":[0,1,4,1,5,1,60,1],"set":[0,1,3,2,4,2,7,1,23,1,36,1,37,1,56,1,62,2],"exampl":[0,1,1,1,2,2,3,1,4,1,5,1,6,1,7,1,8,2,9,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,2,20,1,21,1,22,2,23,1,24,1,25,1,26,1,27,1,28,1,29,1,30,1,31,1,32,1,33,1,34,1,35,1,36,1,37,1,38,1,39,1,40,1,41,3,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,2,54,1,55,1,56,1,57,1,58,1,59,2,60,1,61,2,62,1,63,1,64,1],"i32":[0,3,1,3,2,8,4,6,5,3,6,1,12,2,14,4,16,4,18,2,19,2,21,2,22,2,24,15,25,13,26,13,27,6,28,6,29,8,30,3,31,4,32,40,33,2,34,7,35,6,36,7,37,7,39,9,40,2,41,44,42,3,43,6,44,5,47,2,48,2,49,1,50,1,52,3,53,3,55,1,57,2,59,18,60,12,62,3],"5":[0,2,32,2,41,3,55,5,56,3],"integer":[0,1,12,6,14,5,16,6,18,7,19,7,21,7,22,7,24,3,25,3,26,3,27,3,28,3,29,3,30,4,31,4,36,2,37,1,39,2,40,1,41,4,42,4,43,4,44,4,47,3,48,3,49,4,50,5,51,9,52,4,53,2,55,6,62,2,63,1],"i8":[0,2,25,4,26,4,41,14,42,5,44,1,47,1,48,1,49,1,50,1,51,1,53,4,58,3,60,5],"4":[0,2,12,2,13,2,14,2,15,2,16,2,17,2,18,2,19,2,20,2,21,2,22,2,23,2,24,4,25,4,26,4,27,3,28,3,29,3,30,1,31,2,32,14,35,2,39,1,41,14,51,2,52,2,54,2,55,5,56,3],"2":[0,2,2,1,12,1,14,1,16,1,24,7,25,7,26,6,32,3,36,1,41,8,42,2,43,2,44,2,53,5,54,1,56,1,59,5],"struct":[0,1,33,2,34,1,41,19,60,4],"br":[1,11,2,3,39,2,57,1],"conditional":[1,4,2,2],"branch":[1,5,2,2,3,1,58,1,59,2],"tak":[1,4,11,1,13,1,15,1,17,1,20,1,21,1,22,3,23,1,36,1,37,1,38,3,39,2,40,2,42,2,43,2,44,2,45,2,46,2,47,2,48,2,49,2,50,2,51,2,52,2,53,2,54,2,55,2,56,2,57,3,59,2,61,4,62,1,64,2],"i1":[1,5,2,1,39,6,41,1,42,4,43,2,44,2,47,1,48,1,55,6,56,5,58,10,59,3],"label":[1,11,2,13,3,8,4,22,5,17,7,11,8,2,9,3,39,3,57,3,59,2,63,1],"unconditional":[1,3,2,1],"target":[1,2,2,1,7,1,9,1,35,2,36,4,37,4,38,1,39,3,40,2,54,1,60,1,61,3,62,1,63,1,64,1],"cond":[1,5,55,2,56,2,58,1],"iftru":[1,2],"iffals":[1,2],"dest":[1,1,2,2],"transfer":[1,1,2,1,3,1,4,2,5,3,7,1,8,1,9,2,60,1,63,1,64,1],"adifferent":[1,1],"basic":[1,1,7,1,9,1,57,4,62,3,63,2,64,3],"current":[1,1,3,1,41,1,57,2],"ofthis":[1,1,39,2],"correspond":[1,1,2,1,24,1,25,1,26,1,36,9,37,1,49,1,50,1,52,2,57,2,62,1,63,2,64,2],"anunconditional":[1,1],"upon":[1,1,60,1,62,1],"evaluat":[1,1,58,1],"tru":[1,1,39,1,42,1,43,1,44,1,55,11,56,20,58,1,59,1,60,2],"fals":[1,1,39,1,42,1,55,7,56,6,59,1],"flowsto":[1,1],"poison":[1,1,2,1,3,1,12,1,14,1,16,1,18,1,19,1,24,1,25,1,26,1,30,2,31,2,32,1,36,3,41,1,47,1,48,1,54,3,59,7],"undef":[1,1,2,1,3,1,32,5,34,4,37,1,59,10,60,1,62,1],"undefinedbehavior":[1,1,2,1,3,1,41,1],"test":[1,1,4,1,60,1],"icmp":[1,1,55,13,59,1],"eq":[1,1,55,3,59,1],"b":[1,1,18,2,38,3,41,7,59,1],"ifequal":[1,2],"ifunequal":[1,2],"1":[1,1,2,1,19,1,22,1,24,5,25,6,26,7,27,5,28,7,29,7,31,1,32,4,34,5,35,2,36,4,37,4,39,2,40,1,41,14,42,1,43,2,44,3,45,1,47,4,48,4,49,1,50,2,53,1,54,2,56,1,57,1,58,1,59,1,60,1,62,1],"0":[1,1,2,3,13,2,14,1,15,4,17,2,20,2,23,2,25,1,26,2,27,8,28,5,29,6,30,1,31,1,32,4,33,1,34,2,39,1,41,10,43,1,44,1,45,2,47,1,48,1,49,2,50,2,52,1,56,8,57,2,59,2,60,1,62,1],"switch":[2,12],"use":[2,2,4,1,5,2,12,1,14,1,16,1,18,1,19,1,21,1,22,1,46,1,53,1,57,1,59,2,60,2,62,1],"thre":[2,2,36,1,37,1,39,2,40,2,55,2,56,1],"parameter":[2,2,4,2,5,2,36,2,39,2,60,2],"integercomparison":[2,2],"default":[2,3,4,1,5,1,7,2,13,1,15,1,17,1,20,1,23,1,39,2,40,1,41,1,45,1,49,1,50,1,60,1],"anarray":[2,2],"pair":[2,2,32,1,57,5],"comparison":[2,2,40,4,41,1,55,4,56,5],"constant":[2,4,3,1,35,2,36,1,37,1,41,4,62,3],"tableis":[2,2],"allow":[2,3,3,2,36,2,37,1,39,2,41,2,42,2,60,1],"duplicat":[2,2],"entry":[2,2,36,6,39,2,41,1,52,2,62,2],"intty":[2,2],"defaultdest":[2,1],"val":[2,4,11,1,14,1,15,1,30,5,31,5,33,1,34,7,36,2,37,2,39,3,40,19,59,1],"ofseveral":[2,1],"different":[2,1,41,1,59,3],"plac":[2,1,39,2,60,1],"generalization":[2,1],"many":[2,1],"possibledestination":[2,1],"specify":[2,1,8,2,32,1,33,2,36,3,37,1,39,1,62,1,63,1,64,1],"tabl":[2,4,27,1,28,1,29,1],"searchedfor":[2,1],"given":[2,1,38,1,39,1,41,3,55,1,56,1],"found":[2,1,62,1],"transferredto":[2,2],"otherwis":[2,2,35,2,36,1,55,3,57,1,58,1,59,1],"implementation":[2,1,3,1,4,1],"depend":[2,1,41,1,52,1,53,1,54,1],"property":[2,1],"machin":[2,1],"particular":[2,1,10,1],"may":[2,1,3,2,7,3,30,2,31,2,35,4,36,3,37,4,39,1,41,4,53,1,56,1,57,4,59,1,60,1,62,2,64,2],"cod":[2,1,4,2,10,1,36,3,37,4,41,3,55,4,56,3,60,1,61,1],"generat":[2,2,36,1,41,1,60,1],"indifferent":[2,1],"way":[2,1,35,1],"could":[2,1],"sery":[2,1],"ofchain":[2,1],"lookup":[2,1],"emulat":[2,2],"zext":[2,1,43,10],"truedest":[2,1],"falsedest":[2,1],"implement":[2,1,3,2,5,3,22,2,29,1,57,1],"jump":[2,1,3,4,5,1],"onzero":[2,1],"onon":[2,1],"ontwo":[2,1],"indirectbr":[3,5],"address":[3,12,4,2,5,2,35,4,36,4,37,3,39,2,40,2,41,15,51,1,53,1,54,4,60,3],"therest":[3,2],"indicat":[3,2,4,2,5,2,8,2,9,1,10,1,31,2,34,2,39,1,41,2,55,2,56,1,57,1,58,3,60,6,62,2],"full":[3,2,16,1],"possibl":[3,2,4,1,5,1,7,1,36,1,37,1,55,2,56,1,60,1],"destinationsthat":[3,2],"point":[3,2,11,5,13,6,15,6,17,6,20,6,23,6,36,3,37,1,40,4,41,7,45,5,46,7,47,6,48,6,49,2,50,3,56,6,57,3,58,3,60,3,61,3],"multipletim":[3,2],"list":[3,5,4,4,5,4,7,1,57,2,60,4,61,9,62,1,64,2],"though":[3,2],"isn":[3,2,36,1,59,2],"t":[3,2,4,2,22,1,36,1,37,1,39,1,40,1,59,2,63,1],"particularly":[3,2],"useful":[3,2],"ptr":[3,2,6,1,35,8,36,7,37,7,39,5,40,36,41,34,51,3,52,4,54,6,55,1,60,2,62,8,63,1],"dest1":[3,1],"dest2":[3,1],"indirect":[3,1,4,1,5,6],"alabel":[3,1],"within":[3,1,4,2,7,4,54,1,62,1,63,3,64,3],"whos":[3,1,4,1,5,1,6,1,32,2,36,1,37,1,40,3,60,1],"specifi":[3,2,4,2,5,2,8,1,9,2,24,1,25,1,26,1,30,1,31,1,33,2,34,1,35,7,36,3,37,2,38,1,39,2,40,3,57,2,60,3,61,4],"deriv":[3,1,41,2],"blockaddress":[3,1],"requir":[3,1,4,3,5,1,6,2,9,2,41,2,58,2,60,3,64,1],"so":[3,1,4,2,36,1],"dataflow":[3,1],"analysis":[3,1],"anaccurat":[3,1],"understand":[3,1],"cfg":[3,1],"allpossibl":[3,1],"otherwisethis":[3,1],"undefin":[3,2,8,1,9,2,18,2,19,3,21,1,22,2,24,1,25,1,26,1,32,7,35,1,36,6,37,3,41,1,47,2,48,2,60,1,63,1,64,1],"behavior":[3,2,4,2,8,1,9,2,18,2,19,3,21,2,22,3,36,6,37,3,60,1,63,1,64,1],"imply":[3,1,36,1,37,1,60,2],"tolabel":[3,1],"defin":[3,1,5,1,10,3,36,5,37,3,41,2,62,1],"other":[3,1,4,2,5,3,10,1,14,2,33,2,36,1,37,1,38,1,39,3,40,1,51,1,53,4,60,2,63,2],"hav":[3,1,4,2,6,2,12,2,13,2,14,1,15,2,16,2,17,2,18,2,19,2,20,2,21,2,22,2,23,2,27,2,28,2,29,2,34,2,35,1,36,1,37,1,38,1,39,1,41,2,53,2,54,2,56,2,60,2,62,1,64,1],"typically":[3,1,37,1],"through":[3,1,4,2,38,1,41,1,53,1,62,1],"register":[3,1,60,1],"addr":[3,1],"bb1":[3,1],"bb2":[3,1],"bb3":[3,1],"exception":[4,13,6,1,7,2,8,2,9,1,41,1,62,4,63,6,64,2],"landingpad":[4,8,6,3,62,17,63,1],"such":[4,2,37,1,38,1,41,2,60,1],"theinformation":[4,2],"about":[4,2,22,1,56,1],"program":[4,3,5,1,35,2,36,1,38,1,60,2],"unwind":[4,7,6,1,7,7,9,6,62,1,63,1,64,1],"happen":[4,2,37,1,38,3,41,1],"first":[4,3,5,1,7,1,8,2,24,1,30,2,31,4,32,4,33,3,34,4,36,2,37,4,41,9,53,5,55,2,56,1,57,5,58,1,60,1,63,2],"phi":[4,2,7,2,39,1,57,14,62,1,63,1,64,1],"restriction":[4,2,62,1,64,1],"tightly":[4,2],"coupl":[4,2],"important":[4,3],"information":[4,2,22,1,36,1,37,1,56,1,59,1,61,1,63,1],"can":[4,5,5,4,10,1,11,1,13,1,15,1,17,1,20,1,22,1,23,1,35,2,36,4,37,4,38,3,39,2,40,2,41,5,54,1,56,1,59,2,60,4,62,4,63,1,64,1],"lost":[4,2],"motion":[4,2],"result":[4,1,5,2,6,2,11,4,12,13,13,4,14,15,15,6,16,14,17,4,18,7,19,8,20,4,21,4,22,5,23,4,24,15,25,17,26,17,27,8,28,8,29,10,30,6,31,5,32,13,33,3,34,2,35,4,36,6,37,3,41,8,42,1,43,2,44,2,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,4,55,17,56,14,57,1,58,1,59,3,60,2,62,2,64,1],"cconv":[4,2,5,2,60,2],"attr":[4,2,5,2,60,2],"addrspac":[4,2,5,2,35,2,54,4,60,2],"num":[4,1,5,1,35,2,60,1],"ty":[4,2,5,2,11,2,12,8,13,2,14,8,15,2,16,8,17,2,18,4,19,4,20,2,21,2,22,2,23,2,24,8,25,4,26,4,27,2,28,2,29,2,30,4,31,6,32,6,34,1,35,1,36,2,37,2,39,3,40,2,41,5,42,1,43,1,44,1,45,1,46,1,47,4,48,4,49,4,50,4,51,1,52,1,53,1,55,1,56,1,57,1,58,3,59,3,60,2],"fnty":[4,2,5,2,60,2],"fnptrval":[4,2,5,2,60,2],"arg":[4,2,5,2,60,2,61,9,63,4,64,2],"fn":[4,1,5,1,60,1],"operand":[4,2,5,2,7,2,11,2,12,2,13,2,14,2,15,2,16,4,17,2,18,2,19,1,20,2,22,1,23,2,24,1,28,1,29,1,30,4,31,6,32,4,33,5,34,6,37,5,39,1,40,2,41,1,42,1,43,1,47,1,48,1,49,1,50,1,54,1,55,17,56,26,59,1,60,2,63,2,64,1],"bundl":[4,2,5,2,60,2,63,1,64,1],"specifiedfunction":[4,1,5,1],"possibility":[4,1,5,1],"either":[4,2,5,1,9,1,22,2,35,1,38,1,39,1,43,1,52,1,55,1,56,10,58,1],"calle":[4,5,5,1,60,9],"functionreturn":[4,1],"will":[4,2,5,1,25,1,26,1,30,2,31,2,36,1,37,1,42,1,43,1,60,2],"any":[4,1,5,3,6,2,11,1,13,1,15,1,17,1,18,1,19,1,20,1,21,1,22,1,23,1,24,2,25,1,26,1,30,2,31,2,35,3,36,1,37,1,41,3,53,1,56,3,57,2,58,1,60,2,61,1,62,1],"via":[4,1,7,1],"resum":[4,2,6,9,35,1],"handlingmechanism":[4,2],"interrupt":[4,1,6,1,8,1],"dynamicallynearest":[4,1],"several":[4,1,5,1,60,2,62,1,64,1],"optional":[4,5,5,5,9,2,36,10,37,4,38,1,39,2,40,2,52,2,57,1,58,1,60,8,62,1],"marker":[4,1,5,1,57,1,58,1,60,9],"callingconvention":[4,1,5,1,60,1],"should":[4,1,5,3,16,1,36,1,41,1,60,2],"isspecifi":[4,1,5,1,60,1],"using":[4,1,5,1,22,1,36,1,40,6,41,1,50,1,60,1],"c":[4,1,5,1,29,1,41,6,59,2,60,2,61,1],"convention":[4,1,5,1,60,7,62,1,64,1],"attribut":[4,4,5,4,36,3,37,1,39,1,40,1,60,9],"only":[4,1,5,5,7,1,32,1,33,1,35,1,36,2,37,2,38,3,41,4,53,1,57,5,58,1,60,3,62,2,64,1],"zeroext":[4,1,5,1,60,2],"signext":[4,1,5,1,60,2],"inreg":[4,1,5,1,60,2],"attributesar":[4,1,5,1,60,1],"valid":[4,1,5,1,32,1,36,1,37,1,57,1,60,1],"her":[4,1,5,1,60,1],"spaceof":[4,1,5,1,60,1],"spacefrom":[4,1,5,1,60,1],"datalayout":[4,1,5,1,35,2,60,1],"str":[4,1,5,1,35,2,60,1],"itself":[4,1,5,1,35,1,41,1,60,1],"also":[4,1,5,1,9,1,11,1,13,1,15,1,17,1,19,1,20,1,22,2,23,1,33,1,36,1,38,1,39,1,40,2,55,1,56,1,60,1,61,1],"thetyp":[4,1,5,1,40,1,60,1],"mark":[4,1,5,1,36,3,37,3,39,3,40,1,41,1,60,3],"signatur":[4,2,5,2,60,2],"being":[4,1,5,1,33,1,36,2,41,4,55,1,60,3,62,2,63,2,64,2],"theargument":[4,1,5,1,60,1,61,2],"impli":[4,1,5,1,60,1],"thistyp":[4,1,5,1,60,1],"omit":[4,1,5,1,36,1,37,1,60,1],"vararg":[4,1,5,1,60,7],"llvm":[4,1,5,1,7,1,12,1,14,1,16,1,35,3,40,2,41,4,60,3,61,1,62,2,63,1,64,2],"pointer":[4,1,5,1,33,1,35,4,36,6,37,6,39,8,40,5,41,32,51,6,52,3,53,7,54,11,55,5,59,3,60,4],"tob":[4,1,5,1,37,1,60,2],"most":[4,2,5,2,8,1,9,2,14,2,26,1,36,1,37,1,40,1,53,1,60,1],"cas":[4,2,5,1,19,1,22,2,41,4,60,1],"direct":[4,1,5,1,60,1],"invocation":[4,1],"butindirect":[4,1,60,1],"arbitrary":[4,1,5,1,60,1,64,2],"pointerto":[4,1,5,1,60,1],"functionsignatur":[4,1,5,1,60,1],"all":[4,1,5,1,32,1,36,2,37,1,41,3,59,2,60,2],"mustb":[4,1,5,1,9,1,42,1,60,1],"class":[4,1,5,1,34,2,36,2,37,4,53,4,57,2,60,1],"signatureindicat":[4,1,5,1,60,1],"variabl":[4,1,5,1,31,2,35,1,60,1,61,4,62,1],"number":[4,1,5,1,11,1,13,1,15,1,17,1,20,1,23,1,24,2,25,2,26,2,32,1,35,2,36,4,37,4,39,2,40,1,41,2,42,2,43,2,44,2,47,2,48,2,49,2,50,2,55,1,56,2,59,2,60,1,61,1],"theextra":[4,1,5,1,60,1],"reach":[4,2,5,2,10,1,43,1,44,1,63,1],"functionexecut":[4,1],"viath":[4,1],"design":[4,1,5,1],"operat":[4,1,5,1,39,2],"standard":[4,1,5,1,60,1],"regard":[4,1,5,1,49,1,50,1],"primary":[4,1,5,1],"differenc":[4,1,5,1,14,3,15,2,33,1],"itestablish":[4,1,5,1],"association":[4,1,5,1],"runtimelibrary":[4,1],"stack":[4,1,35,4,60,1,62,2,63,1,64,1],"languag":[4,2,22,1,60,1],"destructor":[4,1],"ensur":[4,1,36,1,37,1],"thatproper":[4,1],"cleanup":[4,1,7,1,9,2,62,8,64,6],"perform":[4,1,21,1,25,1,26,1,44,1,55,5,56,1,60,2],"longjmp":[4,1],"athrown":[4,1],"additionally":[4,1,60,1],"catch":[4,1,7,1,8,1,62,9,63,4],"claus":[4,1,62,13],"high":[4,1,36,1,42,1,43,1],"level":[4,1,58,1],"support":[4,1,53,2,61,2],"them":[4,1,60,1],"purpos":[4,1,39,1,57,1],"ssa":[4,1,57,1],"definition":[4,1,57,1],"returnedby":[4,1],"deem":[4,1],"edg":[4,1,38,3,57,2],"thecurrent":[4,1],"noreturn":[4,1,60,1],"availabl":[4,1,5,1,35,1],"retval":[4,4,60,1],"15":[4,2,27,1,28,1,29,1],"testcleanup":[4,2],"coldcc":[4,1],"testfnptr":[4,1],"callbr":[5,8],"goto":[5,5],"featur":[5,3],"gccstyl":[5,2],"inlin":[5,3,62,1],"assembly":[5,3],"usag":[5,2],"error":[5,2],"ir":[5,2,58,1,62,1,64,1],"verifier":[5,2],"fallthrough":[5,7],"butother":[5,1],"sexecution":[5,1],"exit":[5,1,9,2,63,1,64,1],"bottom":[5,1,62,1],"controlto":[5,1],"location":[5,2,36,3,39,3,40,2,54,1],"than":[5,1,24,1,35,2,36,2,37,3,38,1,39,3,40,2,41,1,42,3,43,2,44,2,45,2,46,2,51,3,52,2,55,12,56,16,60,1],"constraintsrefer":[5,1],"thes":[5,1,40,1,41,2,57,1,58,1,60,2],"additional":[5,2],"wher":[5,2,8,2,12,1,14,1,16,1,22,2,24,1,31,1,36,1,37,1,41,3,62,1,63,1,64,1],"goe":[5,1],"output":[5,3,23,1],"today":[5,1],"gcc":[5,1],"inlineassembly":[5,2],"provid":[5,1,38,1,60,2],"asm":[5,4],"without":[5,1,23,1,36,1,37,1,41,1,58,1],"constraint":[5,2,36,1,38,1,60,1],"r":[5,3,60,3],"i":[5,2,36,2,37,2,41,12,54,1,57,1],"x":[5,2,24,2,25,2,26,2,30,4,31,8,32,28,38,4,41,34,42,3,43,3,44,3,45,1,46,2,47,1,48,1,49,1,50,1,51,3,52,3,53,8,54,4,55,3,56,1,58,2,59,10,60,1,62,2],"thesam":[6,2,32,2,58,1],"samefunction":[6,2],"terminator":[6,1,7,1,8,1,9,1],"nosuccessor":[6,1],"propagation":[6,1,59,1],"exist":[6,1,8,1,37,1,38,1],"flight":[6,1,8,1],"exn":[6,1],"catchswitch":[7,12,9,1,63,7],"parent":[7,5,9,1,63,1,64,2],"token":[7,4,8,3,63,4,64,3],"funclet":[7,4,63,1,64,3],"thecatchswitch":[7,1],"insid":[7,2,64,1],"resultval":[7,2,61,1,62,3,63,2,64,2],"handler1":[7,3],"handler2":[7,2],"handl":[7,2,9,1,63,1],"system":[7,1],"describ":[7,2,8,1,9,3,41,1,63,1],"handlersthat":[7,1],"eh":[7,1,8,1,9,2,63,1,64,1],"personality":[7,1,8,1,9,1,62,3,63,3,64,7],"routin":[7,1,63,1,64,1],"another":[7,1,9,1,37,1],"begin":[7,2,9,1,62,1],"witheither":[7,1],"cleanuppad":[7,1,9,8,64,14],"destinationmust":[7,1],"legal":[7,1,9,1,35,1,41,1,56,1,60,1,61,1],"respect":[7,1,9,1],"link":[7,1,9,1],"inth":[7,1,38,1],"documentation":[7,1,8,1,9,3,63,2,64,1],"handler":[7,2,63,3],"nonempty":[7,1],"successor":[7,2,8,1,9,2],"each":[7,1,24,1,25,1,26,1,32,1,41,5,56,2,57,3,62,1,63,2],"catchpad":[7,1,8,7,63,13],"appropriat":[7,1,12,1,14,1,16,1,60,1,63,3,64,1],"ifpresent":[7,1],"both":[7,2,12,1,13,2,14,1,15,2,16,1,17,2,20,2,22,1,23,2,24,2,25,2,26,2,32,1,38,2,39,1,41,1,42,2,43,2,44,2,54,2,56,7,60,3],"pad":[7,1,8,1,9,2,37,1,59,1,62,9,63,1],"mean":[7,1,36,1,37,1,56,1,63,1],"thatit":[7,1],"last":[7,1],"basicblock":[7,1,57,1],"therefor":[7,1],"dispatch1":[7,1],"cs1":[7,1],"handler0":[7,2,63,2],"callerdispatch2":[7,1],"cs2":[7,1],"parenthandler":[7,1],"catchret":[8,11,63,1],"itexit":[8,2],"second":[8,2,30,2,31,2,34,2,39,1,41,6,58,1],"willtransfer":[8,2],"next":[8,2,61,3],"asingl":[8,1,37,1],"end":[8,1,9,1,35,1,41,2,53,1],"whoseunwind":[8,1],"get":[8,1,21,1,31,1,41,3],"chanc":[8,1],"arbitrarycod":[8,1],"destroy":[8,1],"activ":[8,1],"produc":[8,1,11,1,12,1,13,1,14,1,15,1,16,1,17,1,18,1,19,1,20,1,23,1,24,3,35,1,36,2,37,2,54,1,63,3],"recently":[8,1,9,2],"enter":[8,1,9,2,63,1,64,1],"yet":[8,1,9,2,61,1,63,1,64,1],"exitedfunclet":[8,1,9,2],"cleanupret":[9,12,64,1],"indicateswhich":[9,2],"hasan":[9,1],"out":[9,1,24,2,25,1,26,1,27,1,28,1,29,1],"callercleanupret":[9,1],"unreachabl":[10,6],"thisinstruction":[10,1,12,1,14,1],"inform":[10,1],"optimizer":[10,1,36,5,37,3,40,1,60,1],"portion":[10,1,62,1],"ofth":[10,1,12,1,14,1,41,1,43,2,44,2,60,1],"reachabl":[10,1],"codeafter":[10,1],"cannot":[10,1,32,1,39,1,42,1,45,2,46,1,47,1,48,1,49,1,50,1,62,1],"fact":[10,1],"fneg":[11,7],"afloat":[11,1],"vector":[11,2,12,2,13,2,14,1,15,2,16,2,17,2,18,3,19,3,20,2,21,3,22,4,23,2,24,4,25,4,26,4,27,2,28,2,29,2,30,5,31,5,32,16,41,16,43,2,44,2,47,6,48,6,49,6,50,6,51,8,52,1,53,8,54,2,55,7,56,4,58,7,59,2,60,2],"offloat":[11,2,13,2,15,2,17,2,20,2,23,2],"fast":[11,2,13,2,15,2,17,2,20,2,23,2,56,4,57,4,58,4,60,4],"math":[11,1,13,1,15,1,17,1,20,1,23,1,56,4,57,4,58,4,60,4],"flag":[11,1,13,1,15,1,17,1,20,1,23,1,39,1,56,5,57,3,58,4,60,4,62,4],"op1":[11,1,12,4,13,1,14,4,15,1,16,4,17,1,18,3,19,2,20,1,21,1,22,2,23,1,24,7,25,4,26,5,27,1,28,1,29,1,55,10,56,14],"yield":[11,2,12,5,13,2,14,6,15,3,16,5,17,2,18,3,19,3,20,2,21,2,22,2,23,2,24,8,25,7,26,7,27,4,28,4,29,5,30,3,31,3,32,6,33,1,34,4,35,5,36,3,37,5,38,4,39,3,40,2,41,4,42,5,43,4,44,4,45,3,46,3,47,4,48,4,49,3,50,3,51,4,52,5,53,5,54,2,55,18,56,22,58,2,59,2,60,6],"negation":[11,1],"float":[11,4,13,6,15,8,17,6,20,6,23,6,33,1,34,8,40,4,45,9,46,10,47,8,48,8,49,7,50,7,56,9,57,3,58,3,60,3],"copy":[11,1,44,1],"sign":[11,1,12,3,14,3,16,3,18,2,19,2,21,2,22,2,23,1,24,1,26,1,40,2,41,6,44,3,48,1,50,2,55,10],"bit":[11,1,12,1,14,1,19,1,22,1,24,5,25,5,26,4,36,2,37,3,40,1,42,7,43,5,44,6,46,1,51,3,52,3,53,4,54,1],"flip":[11,1],"mathflag":[11,1,13,1,15,1,17,1,20,1,23,1],"optimization":[11,2,13,2,15,2,17,2,20,2,23,2,56,2,57,2,58,2,60,6],"hint":[11,1,13,1,15,1,17,1,20,1,23,1,56,1,58,1,60,2],"enabl":[11,1,13,1,15,1,17,1,20,1,23,1,57,1,60,1],"otherwiseunsaf":[11,1,13,1,15,1,17,1,20,1,23,1],"var":[11,1,12,2,13,2,14,3,15,3,16,2,17,2,18,2,19,2,20,2,21,2,22,2,23,2,24,2,27,2,28,2,29,2],"add":[12,11,38,2,40,3,41,2,57,1,59,7,60,1],"beinteger":[12,1,16,1,18,1,19,1,21,1,22,1,27,1,28,1,29,1],"bothargument":[12,2,14,1,16,2,18,2,19,2,21,2,22,2,27,2,28,2,29,2],"identical":[12,2,13,2,14,1,15,2,16,2,17,2,18,2,19,2,20,2,21,2,22,2,23,2,27,2,28,2,29,2,55,1,56,1],"op2":[12,4,13,1,14,4,15,1,16,4,17,1,18,3,19,2,20,1,21,1,22,2,23,1,24,9,25,6,26,6,27,1,28,1,29,1,55,10,56,14],"nuw":[12,4,14,4,16,4,24,3,41,1],"nsw":[12,4,14,4,16,4,24,3,41,2,59,1],"sum":[12,3,13,2],"unsign":[12,3,14,3,16,3,18,2,19,2,21,3,22,2,24,2,25,2,26,2,30,2,40,2,41,2,47,1,49,1,55,8],"overflow":[12,2,14,2,16,2,19,1,22,2],"themathematical":[12,1,14,1],"modulo":[12,1,14,1,16,1,22,1],"n":[12,2,14,2,16,2,24,2,30,2,31,4,32,4,41,1,54,1,55,1,56,1,58,1],"width":[12,1,14,1,16,3,24,1,36,1,37,1,39,2,40,1,41,3],"becaus":[12,1,14,1,16,1,36,1,41,1,46,1,53,1,59,1,61,1],"complement":[12,1,14,1,16,1,41,1],"representation":[12,1,14,3,16,1,63,1],"stand":[12,1,14,1,16,1],"wrap":[12,2,14,2,16,2,41,4],"respectively":[12,2,14,2,16,2,62,1],"keyword":[12,1,14,1,16,1,18,1,19,1,24,2,25,1,26,1,40,2,41,6,55,2,56,1],"present":[12,1,14,3,16,1,18,1,19,1,24,2,25,1,26,1,32,1,41,3],"theresult":[12,1,14,1,16,2,22,1,54,1],"ifunsign":[12,1,14,1,16,1],"fadd":[13,7,40,3],"befloat":[13,1,15,1,17,1,20,1,23,1],"assum":[13,1,15,1,17,1,20,1,23,1,33,1,39,1,40,1,41,1,45,1,54,1],"pointenvironment":[13,1,15,1,17,1,20,1,23,1,45,1],"sub":[14,13,40,2],"represent":[14,2,32,1,35,1,49,1,50,1,57,1,60,1,62,1],"neg":[14,2],"intermediat":[14,2],"fsub":[15,8,40,3],"mul":[16,11,18,1,39,1],"product":[16,3,17,2],"multiplication":[16,1,41,1],"resultreturn":[16,1],"mathematical":[16,1],"thebit":[16,1,53,2],"sam":[16,1,22,2,23,2,24,1,25,1,26,1,30,1,31,1,32,6,34,3,36,2,37,1,39,2,40,1,41,4,42,2,43,2,44,2,47,2,48,2,49,2,50,2,51,1,52,1,53,5,54,2,55,1,56,1,57,1,58,3,59,3],"thecorrect":[16,1],"e":[16,1,36,2,37,2,54,1,57,1],"g":[16,1,52,2],"i64":[16,1,36,5,41,17,43,2,51,2,52,3,53,4],"need":[16,1,36,1,37,1],"besign":[16,1],"extend":[16,2,43,2,44,2,46,2,51,1,60,1],"zero":[16,1,18,2,19,3,21,2,22,4,24,1,25,3,26,1,33,1,35,1,41,2,43,3,47,1,48,1,51,4,52,3,53,1,60,1],"fullproduct":[16,1],"fmul":[17,7],"udiv":[18,10,19,1],"exact":[18,3,19,2,25,2,26,2],"quotient":[18,2,19,2,20,2],"division":[18,4,19,5,21,3,22,4,23,1],"aredistinct":[18,1,19,1,21,1,22,1],"operation":[18,2,19,2,21,2,22,2,25,1,26,1,29,1,35,1,36,3,37,3,38,4,39,6,40,5],"sdiv":[18,1,19,9],"elementof":[18,1,19,1,25,1,26,1],"divisor":[18,1,19,1,21,1,22,2],"isa":[18,1,19,1,25,1,26,1,34,2],"multipl":[18,1],"assuch":[18,1],"operandsround":[19,1],"toward":[19,1,47,1,48,1],"lead":[19,1,22,1],"rar":[19,1,22,1],"but":[19,1,22,2,23,1,33,1,35,1,36,1,37,1,38,1,56,1,57,1,59,1,60,1,63,1,64,1],"canoccur":[19,1,22,1],"doing":[19,1],"32":[19,1,22,1,24,1,25,1,26,1,35,2,36,1,37,1,51,3,52,2],"2147483648":[19,1,22,1],"would":[19,1,41,1],"round":[19,1,47,1,48,1,49,2,50,1],"fdiv":[20,7],"urem":[21,7,22,1],"remainder":[21,6,22,9,23,3],"unsigneddivision":[21,1],"alway":[21,1,25,1,26,1,36,1,41,6,42,1,43,1,44,1,46,1,53,1,55,1,56,4,59,1,63,2],"theremainder":[21,1],"srem":[21,1,22,8],"element":[21,1,22,1,24,1,30,3,31,4,32,17,35,2,41,12,47,2,48,2,49,2,50,2,53,1,55,1,56,3,58,2,59,2],"hasundefin":[21,1,22,1],"signeddivision":[22,1],"version":[22,1,41,1],"elementsmust":[22,1],"resultis":[22,1,31,1,47,1,48,1],"dividend":[22,1],"operator":[22,1,29,1],"signa":[22,1],"mor":[22,1,41,2,56,1,57,1,58,1,59,1,60,1,61,1],"thedifferenc":[22,1],"see":[22,2,35,1,36,3,37,1,41,2,52,2,56,1,59,1,61,2],"mathforum":[22,1],"atabl":[22,1],"how":[22,1,39,1,41,2,62,1,64,1],"various":[22,1],"pleas":[22,1],"wikipedia":[22,1],"modulooperation":[22,1],"doesn":[22,1,62,1,63,1],"actually":[22,1],"thisrul":[22,1],"let":[22,1,41,3],"frem":[23,7],"ofit":[23,1,29,1],"libm":[23,1],"fmod":[23,1],"anypossibility":[23,1],"errno":[23,1],"thedividend":[23,1],"shl":[24,14],"sameinteger":[24,1,25,1,26,1],"treat":[24,2,25,2,26,2,30,2,31,2,41,1,60,1],"shift":[24,6,25,7,26,6],"lefta":[24,1],"mod":[24,1,49,1],"statically":[24,1,25,1,26,1],"ordynamically":[24,1],"equal":[24,1,25,1,26,1,31,2,36,2,37,2,39,10,40,4,42,2,55,11,56,15],"larger":[24,1,41,1,42,1,45,3,46,2,51,1,52,1],"shiftedby":[24,1],"amount":[24,1,25,1,26,1],"poisonvalu":[24,2,25,1,26,1],"disagre":[24,1],"resultant":[24,1],"16":[24,1],"10":[24,1,41,6],"1024":[24,1,35,2],"lshr":[25,14],"logical":[25,2,27,1,28,1,29,1],"right":[25,3,26,3],"firstoperand":[25,1,26,1],"fill":[25,2,26,1,37,1,43,1],"themost":[25,1],"significant":[25,1,26,1,53,2],"afterth":[25,1],"dynamically":[25,1,26,1],"largerthan":[25,1,26,1,41,1],"3":[25,1,26,2,32,3,36,2,37,2,46,2,54,1],"0x7f":[25,1],"0x7fffffff":[25,1],"ashr":[26,14],"arithmetic":[26,2,40,2,41,1],"signextension":[26,1],"bitof":[26,1],"bitwis":[27,1,28,1,29,1],"twooperand":[27,1],"truth":[27,1,28,1,29,1],"in0":[27,1,28,1,29,1],"in1":[27,1,28,1,29,1],"40":[27,1,28,1,29,1],"8":[27,2,28,1,29,1,32,4,41,8,42,2,43,2,44,2],"inclusiv":[28,1,41,1],"itstwo":[28,1],"47":[28,1],"12":[28,1,29,1,41,2,60,1],"xor":[29,12,40,2],"exclusiv":[29,1],"scomplement":[29,1],"39":[29,1],"v":[29,2,53,3,59,6],"extractelement":[30,8,59,3],"ofvector":[30,1,31,1],"index":[30,5,31,3,33,5,41,34],"indicatingth":[30,2],"position":[30,3,31,3,33,1,34,3,60,1],"extract":[30,3,33,3],"avariabl":[30,2],"ty2":[30,2,31,2,42,6,43,6,44,6,45,5,46,2,47,8,48,8,49,6,50,6,51,8,52,4,53,7],"idx":[30,5,31,5,33,2,34,2,41,3],"vscal":[30,1,31,2,32,4],"scalar":[30,2,31,3,36,1,37,1,41,2,56,2,57,2,58,2,60,2],"elementfrom":[30,1],"exc":[30,2,31,2,36,1,37,1],"length":[30,3,31,3,32,4],"fix":[30,1,31,1,59,1],"scalabl":[30,1,31,1,32,1],"valueof":[30,1],"runtim":[30,1,31,1,35,2,36,2,57,1],"vec":[30,1,31,1],"insertelement":[31,8],"whosetyp":[31,2],"third":[31,2,32,2,41,2],"operandis":[31,2,39,1],"insert":[31,3,34,7],"theindex":[31,2],"anunsign":[31,2],"elt":[31,3,34,2],"avector":[31,1,56,1],"valuesar":[31,1,39,2,55,1],"thos":[31,1,56,1],"except":[31,1,34,1],"shufflevector":[32,11],"vectorswith":[32,2],"shuffl":[32,8],"mask":[32,16,41,2],"constantwhos":[32,2],"constantinteger":[32,2],"vectorwhos":[32,2],"v1":[32,6],"v2":[32,4],"m":[32,4,38,3,54,1],"construct":[32,1],"permutation":[32,1],"elementsfrom":[32,1],"input":[32,5,56,1,59,1],"asth":[32,1,57,2],"left":[32,1],"rightacross":[32,1],"theshuffl":[32,1],"select":[32,2,36,1,37,1,41,1,58,10],"copyto":[32,1],"negativ":[32,1,41,1],"indexinto":[32,1],"concatenat":[32,1],"ifth":[32,1,36,2,37,1,40,1,60,1],"inputvector":[32,1],"elementin":[32,1],"prevent":[32,1,60,1],"vectorelement":[32,1],"propagat":[32,1],"zeroinitializer":[32,1],"sinc":[32,1,33,1,41,4,42,1,59,1],"we":[32,1,41,1,60,1],"writ":[32,1,37,3,39,2],"indic":[32,1,33,6,34,2,41,1],"asliteral":[32,1],"unknown":[32,1],"compil":[32,1],"tim":[32,1],"identity":[32,1],"6":[32,1],"7":[32,1,42,2,43,2,44,2],"extractvalu":[33,7,34,2,39,2,60,2],"ofstruct":[33,1,34,1],"array":[33,3,34,2,41,7,57,1,58,1,60,1,62,3],"areconstant":[33,2],"similar":[33,2],"mannera":[33,2],"getelementptr":[33,3,41,32],"aggregat":[33,3,34,4,36,2,37,1,41,3,53,4,59,2],"member":[33,1,34,1],"fieldfrom":[33,1],"major":[33,1],"isomit":[33,1],"least":[33,1,35,2,36,1,37,1,38,2,39,1,53,1,62,1],"bound":[33,1,41,4,60,2],"byth":[33,1],"agg":[33,1],"insertvalu":[34,9],"follow":[34,2,40,2,41,2,55,1,56,1,60,3],"constantindic":[34,2],"asimilar":[34,2],"manner":[34,2],"valueto":[34,2,54,2],"identifi":[34,2],"theindic":[34,3],"field":[34,1,57,2],"inan":[34,1],"isthat":[34,1],"agg1":[34,2],"agg2":[34,1],"agg3":[34,1],"alloca":[35,15,36,1,37,1,60,1],"allocat":[35,10,41,6],"sizeof":[35,2,41,3,44,1,52,2],"numelementsbyt":[35,1],"memory":[35,9,36,7,37,4,39,5,40,2,41,3,53,1,54,1,59,1,60,1],"theappropriat":[35,2],"numelement":[35,6],"isth":[35,2,55,2,56,1],"defaultedto":[35,2],"alignment":[35,3,36,10,37,8,39,6,40,5],"theallocation":[35,2],"guarant":[35,2,60,1],"align":[35,7,36,14,37,5,39,3,40,2],"boundary":[35,2,36,1,41,1],"thealignment":[35,2,36,2,37,3],"greater":[35,2,36,1,37,1,39,4,40,2,55,8,56,6],"ifzero":[35,2],"choos":[35,2,58,1],"allocation":[35,3],"convenientboundary":[35,2],"compatibl":[35,2],"inalloca":[35,1,60,2],"fram":[35,1],"thecurrently":[35,1],"automatically":[35,2],"releas":[35,1,36,1,38,5,39,2],"thisfunction":[35,1],"spac":[35,3,36,1,37,1,41,4,53,1,54,5,60,1],"explicitlyspecifi":[35,1],"object":[35,2,38,1,41,8],"byt":[35,2,36,14,37,8,52,4],"siz":[35,1,36,6,37,6,39,4,40,3,41,2,42,6,43,5,44,4,45,4,51,2,52,2,53,6,58,2],"isuninitializ":[35,1],"load":[35,1,36,37,37,3,39,5,40,1,41,5,59,1,61,1],"uninitializ":[35,1],"undefinedvalu":[35,1],"insufficient":[35,1],"stackspac":[35,1],"d":[35,1,59,3,60,1],"releasedwhen":[35,1],"commonly":[35,1],"usedto":[35,1],"automatic":[35,1,60,1],"whenth":[35,1],"reclaim":[35,1],"returnedpointer":[35,1],"uniqu":[35,1],"order":[35,1,36,5,37,5,38,9,39,9,40,2,42,1,43,1,44,1,56,8,60,1,62,1],"ie":[35,1],"grow":[35,1],"outsid":[35,1,41,2],"meaningful":[35,1],"thetarget":[35,1],"assign":[35,1],"lifetim":[35,3],"start":[35,2,41,2,57,1],"initially":[35,1],"dead":[35,1],"precis":[35,1],"oflifetim":[35,1],"manipulat":[35,1],"intrinsic":[35,1,40,2,61,1],"whichto":[36,2],"ofknown":[36,2],"opaqu":[36,2],"structural":[36,2],"volatil":[36,5,37,5,39,5,40,3],"tomodify":[36,2],"othervolatil":[36,1,37,1],"nontemporal":[36,4,37,4],"nontemp":[36,3,37,3],"nod":[36,30,37,8,52,6,57,3],"invariant":[36,8,37,4],"empty":[36,10,37,4],"group":[36,5,37,4],"nonnull":[36,5],"dereferenceabl":[36,10,52,6,54,2,59,1],"deref":[36,5,52,4],"null":[36,6,41,1,52,3],"noundef":[36,4],"atomic":[36,6,37,6,38,3,39,2],"syncscop":[36,2,37,2,38,4,39,2,40,2],"scop":[36,2,37,2,38,1,39,1,40,1],"read":[36,3,39,2,40,1,53,1],"extra":[36,1,37,3],"acq":[36,1,37,1,38,2,39,2],"rel":[36,1,37,1,38,2,39,2],"they":[36,1,37,2,38,4,39,1,41,3,51,1,52,1,53,2,55,2,56,1],"seemultipl":[36,1,37,1],"stor":[36,2,37,27,39,2,40,1,41,1,59,1],"pointe":[36,1,37,1,60,1],"orfloat":[36,1,37,1],"power":[36,2,37,1,39,3,40,2],"toeight":[36,1,37,1],"less":[36,2,37,2,40,1,55,8,56,6],"specific":[36,1,37,1,39,2,40,1,60,1,61,2,62,1,63,1,64,2],"limit":[36,1,37,1,39,2,40,1],"beexplicitly":[36,1,37,1],"thepointe":[36,1,37,1],"theoperation":[36,1,37,1,40,3],"0or":[36,1,37,1],"abialignment":[36,1,37,1],"responsibility":[36,1,37,1],"emitterto":[36,1,37,1],"correct":[36,1,37,1,60,1],"overestimat":[36,1,37,1],"underestimat":[36,1,37,1],"alignmentmay":[36,1],"efficient":[36,1,37,1],"saf":[36,1],"themaximum":[36,1],"higherthan":[36,1],"up":[36,1,37,1,53,1,57,1,62,1],"alignmentvalu":[36,1,37,1],"safely":[36,1],"trap":[36,1,37,1],"defaultaddress":[36,1,37,1],"access":[36,3,37,1,41,3,60,1,61,1],"interfer":[36,1],"debuggingtool":[36,1],"sanitiz":[36,2,37,1],"thread":[36,1,37,1],"metadata":[36,32,37,6,52,6],"referenc":[36,9,37,2,52,2],"singlemetadata":[36,4,52,1],"nam":[36,7,37,1,52,1,60,1],"existenc":[36,4,37,1],"tell":[36,4],"generatorthat":[36,1],"expect":[36,1,37,1],"reus":[36,1,37,1],"cach":[36,2,37,2],"codegenerator":[36,1],"special":[36,1],"sav":[36,1,37,1],"bandwidth":[36,1,37,1],"sucha":[36,1],"movnt":[36,1,37,1],"x86":[36,1],"noentry":[36,2],"tag":[36,1],"hasto":[36,1],"thememory":[36,1],"isundefin":[36,1],"known":[36,3,37,3],"tonever":[36,1],"returnedinstead":[36,2],"analogous":[36,2],"andreturn":[36,1],"appli":[36,2,62,1],"metadatanam":[36,1,37,1,52,1],"theoptimizer":[36,1,39,2],"specifiedby":[36,1],"returnedvalu":[36,1],"appropriately":[36,1],"valueload":[36,1],"combin":[36,1],"lik":[36,2,37,1,41,1,60,2,63,1],"violation":[36,1],"loadedis":[36,1],"theminimum":[36,1,37,1],"hold":[36,1,37,1],"forexampl":[36,1,37,1],"i24":[36,1,37,1],"i20":[36,1,37,1],"integral":[36,1,37,1,54,1],"numberof":[36,1,37,1],"originallywritten":[36,1],"topad":[36,1],"ignor":[36,1,60,1],"impossibl":[36,1],"observepad":[36,1],"ptrstor":[36,1,37,1],"anaddress":[37,2],"apointer":[37,2,41,1,52,2],"notallow":[37,2,40,1],"modify":[37,2,39,4,40,4],"opaquestructural":[37,2],"voidstor":[37,1],"acquir":[37,1,38,5,40,1],"aren":[37,1],"alwayssaf":[37,1],"maximum":[37,1],"higher":[37,2],"however":[37,1],"datarac":[37,1],"introduc":[37,1,38,1],"adata":[37,1],"rac":[37,2],"allowedeven":[37,1],"situation":[37,1],"data":[37,1,41,1],"thefunction":[37,1],"entryof":[37,1],"instructiontell":[37,1],"generator":[37,2,61,1],"specialinstruction":[37,1],"onx86":[37,1],"content":[37,1,39,1,40,1],"updat":[37,1],"thelocation":[37,1],"isof":[37,1],"written":[37,1,40,1],"unspecifi":[37,1,39,1,40,1],"what":[37,1,38,2],"do":[37,1],"notbelong":[37,1],"overwritten":[37,1],"fenc":[38,14],"whichdefin":[38,2],"synchroniz":[38,4,39,1],"givenacquir":[38,1],"seq":[38,6],"cst":[38,6],"befor":[38,5,41,3],"edgesbetween":[38,1],"orderingsemantic":[38,1],"y":[38,4,41,1,42,1,43,1,44,1,45,1,46,1,47,1,48,1,49,1,50,1,51,1,52,1,53,1,54,2,59,1,60,1],"bothoperat":[38,1],"som":[38,2,41,1,60,1],"sequenc":[38,2,39,1,62,1],"xmodify":[38,1],"directly":[38,1,41,2],"sid":[38,1,54,1],"effect":[38,1,54,1,56,1],"sequencehead":[38,1],"observ":[38,1,59,2],"dependency":[38,1],"between":[38,1,57,1],"rather":[38,1],"explicit":[38,2],"mightprovid":[38,1],"resp":[38,1],"andstill":[38,1],"establish":[38,1],"addition":[38,1,41,3,60,1],"abov":[38,1,41,2],"participat":[38,1],"global":[38,1,62,1],"voidfenc":[38,2],"singlethread":[38,1],"agent":[38,1],"cmpxchg":[39,18],"addressto":[39,2],"compar":[39,6,55,4,56,2,62,1,63,1],"currently":[39,2,41,1,61,1],"thataddress":[39,2],"new":[39,7],"whosebit":[39,2],"eight":[39,2],"lessthan":[39,2],"musthav":[39,2,54,1],"tothat":[39,2],"weak":[39,2],"cmp":[39,9,59,1],"success":[39,8],"failur":[39,5],"atomically":[39,1,40,2],"itload":[39,1],"areequal":[39,1],"try":[39,1,62,1],"parametersmust":[39,1],"monotonic":[39,2],"thesiz":[39,1,40,1],"assumption":[39,1,40,1,41,1,60,1],"isdifferent":[39,1,40,1],"alignisn":[39,1,40,1],"pass":[39,1,61,1],"orequal":[39,1],"iswritten":[39,1],"original":[39,1,54,2],"together":[39,1,62,1],"spurious":[39,1],"ispermit":[39,1],"even":[39,1,41,1,59,2,60,1],"comparisonmatch":[39,1],"strong":[39,1],"onlyif":[39,1],"successful":[39,1],"ofidentify":[39,1],"fail":[39,1],"equivalent":[39,1,41,2,47,1],"atomicload":[39,1],"determin":[39,1],"orig":[39,2],"unorder":[39,1,56,8],"looploop":[39,1],"loop":[39,1,41,1,57,4],"squar":[39,2],"don":[39,1,51,3,52,3,53,1,58,1],"loopdon":[39,1],"atomicrmw":[40,10],"anoperation":[40,2],"apply":[40,2],"xchg":[40,3],"nand":[40,2],"max":[40,2],"min":[40,2],"umax":[40,2],"umin":[40,2],"fmax":[40,3],"fmin":[40,3],"integertyp":[40,1,47,2,48,2],"eightand":[40,1],"thismay":[40,1],"constraintsa":[40,1],"modifi":[40,1],"originalvalu":[40,1],"modification":[40,1,54,1],"maxnum":[40,2],"minnum":[40,2],"old":[40,1],"basis":[41,2],"calculation":[41,6],"thebas":[41,3],"remain":[41,3,42,1,55,1],"indicesthat":[41,2],"interpretation":[41,2,55,2],"dependent":[41,2],"indexedinto":[41,2],"thesecond":[41,2],"necessarily":[41,3],"indexcan":[41,2],"etc":[41,2],"pointervalu":[41,2],"subsequent":[41,2],"thatsubsequent":[41,2],"never":[41,2,60,1],"thatwould":[41,2],"ptrval":[41,3,54,3],"inrang":[41,8],"inbound":[41,5],"asubelement":[41,1],"structur":[41,5],"performsaddress":[41,1],"alsob":[41,1],"calculat":[41,1],"pack":[41,1],"allb":[41,1],"notrequir":[41,1],"valueswher":[41,1],"relevant":[41,1],"consider":[41,1,59,1],"fragment":[41,1],"compiledto":[41,1],"rt":[41,7],"char":[41,2],"int":[41,5],"20":[41,6],"st":[41,10],"doubl":[41,7,45,2,46,3,47,1,48,1,49,2,50,2,56,1,62,1],"z":[41,2,42,1,43,1,44,1,47,1,48,1,51,1,52,2,53,2,54,2,59,1,60,1],"foo":[41,3,59,2,60,6],"13":[41,8],"clang":[41,1],"nounwind":[41,1],"uwtabl":[41,1],"readnon":[41,1],"optsiz":[41,1],"ssp":[41,1],"arrayidx":[41,2],"indexindex":[41,1],"anotherstructur":[41,1],"thestructur":[41,1],"twodimension":[41,1],"subscript":[41,1],"thiselement":[41,1],"perfectly":[41,1],"partially":[41,1],"inner":[41,1],"codefor":[41,1],"testcas":[41,1],"t1":[41,2],"t2":[41,2],"t3":[41,2],"t4":[41,2],"t5":[41,2],"thefollow":[41,1],"rul":[41,3,59,1,60,2],"violat":[41,1],"bas":[41,4,55,1,56,1,58,1,60,1],"whichmean":[41,1],"thenull":[41,1],"thetruncation":[41,1],"preserv":[41,1],"pointerindex":[41,1],"sens":[41,4],"successiv":[41,2],"offset":[41,12],"ad":[41,3],"doesnot":[41,1,61,1],"interpret":[41,2,49,1,50,1,51,1,55,8],"unsignednumber":[41,1],"theunsign":[41,1],"corollary":[41,1],"notwrap":[41,1],"keywordapply":[41,1],"computation":[41,1],"wis":[41,1,59,2],"crossth":[41,1],"half":[41,1,45,2],"silently":[41,1],"theoffset":[41,1],"extendedor":[41,1],"truncat":[41,1,42,3,45,1],"basepointer":[41,1],"memorythough":[41,1],"storag":[41,1],"alias":[41,1,59,1],"section":[41,1,59,1,61,1],"moreinformation":[41,1],"orstor":[41,1],"ptrtoint":[41,2,51,10,53,1],"includ":[41,1,62,1,64,1],"operationsinvolv":[41,1],"involv":[41,1,53,1],"withth":[41,1],"comparisonsin":[41,1],"rang":[41,1],"selectedby":[41,1],"past":[41,1],"ofthat":[41,1],"allowedin":[41,1],"expression":[41,1],"often":[41,1],"confus":[41,1],"insightinto":[41,1],"work":[41,1],"faq":[41,1],"aptr":[41,2],"saptr":[41,1],"vptr":[41,1],"svptr":[41,1],"eptr":[41,1],"iptr":[41,1],"arr":[41,1],"i16":[41,2,42,3,43,3,44,5,53,4,55,4],"instead":[41,1,61,1],"vectorargument":[41,1],"every":[41,1],"argumentwill":[41,1],"effectively":[41,1],"broadcast":[41,1],"dur":[41,1],"distinct":[41,1],"ind1":[41,2],"ind4":[41,2],"look":[41,1],"mak":[41,1,45,2,46,2],"vectoriz":[41,1],"gather":[41,1],"v8f64":[41,1],"v8p0f64":[41,1],"passthru":[41,1],"trunc":[42,14],"truncit":[42,2],"vectorsof":[42,2],"belarger":[42,2],"sizedtyp":[42,2],"convert":[42,1,47,2,48,2,49,2,50,1,51,2,52,2,53,4,54,2],"sourc":[42,1,46,2,53,2,54,3],"op":[42,1,45,2,46,2,51,1,52,2,53,1,54,1,59,1],"cast":[42,1,43,4,44,4,45,7,46,7,47,2,48,2,49,4,50,4,51,5,52,3,53,5,54,7],"257":[42,1,43,2,49,2,50,2],"123":[42,1,47,2,48,2],"122":[42,1],"w":[42,1,59,5],"itto":[43,2,44,2,46,2],"besmaller":[43,2,44,2],"bitsuntil":[43,1],"sext":[44,10],"extension":[44,2,51,3,52,3],"signbit":[44,1],"highest":[44,1],"until":[44,1],"65535":[44,1],"fptrunc":[45,11],"pointvalu":[45,1,46,2,49,1],"thisimply":[45,2],"smaller":[45,1,46,3,51,1,52,1],"16777217":[45,1],"16777216":[45,1],"0e":[45,1,47,1,48,1],"300":[45,1,47,1],"infinity":[45,1],"fpext":[46,10],"chang":[46,1,53,1,60,1],"bitcast":[46,1,53,13,54,1,60,3],"125":[46,1],"125000e":[46,1],"00":[46,1],"fp128":[46,2],"0xl00000000000000004000900000000000":[46,1],"fptoui":[47,10],"ascalar":[47,2,48,2,49,2,50,2],"tocast":[47,2,48,2,52,2],"ifty":[47,1,48,1,49,1,50,1],"unsignedinteger":[47,1,49,1],"nearest":[47,1,48,1],"fit":[47,1,48,1],"04e":[47,1,48,1],"17":[47,1,48,1,58,2],"fptosi":[48,10],"247":[48,1],"uitofp":[49,9],"toty2":[49,1,50,1],"pointtyp":[49,2,50,2],"integerand":[49,1],"quantity":[49,1],"exactly":[49,1,50,1,63,2],"usingth":[49,1],"255":[49,1,52,2,53,1],"sitofp":[50,9],"andconvert":[50,1],"integerquantity":[50,1],"thevalu":[50,1],"roundingmod":[50,1],"bea":[51,2],"atyp":[51,2],"ofpointer":[51,1,53,2],"eithertruncat":[51,1],"truncation":[51,2,52,4],"areth":[51,1],"noth":[51,1,52,1],"typechang":[51,1],"p":[51,3],"architectur":[51,3,52,3],"inttoptr":[52,11,53,1],"pointertyp":[52,1],"byapply":[52,1],"64":[52,1],"four":[52,1],"anon":[53,2,59,1,60,1],"mustalso":[53,4],"beidentical":[53,2],"bitwiseconversion":[53,2],"aslong":[53,2],"withoutchang":[53,1],"itis":[53,1],"thisconversion":[53,1],"conversion":[53,1,54,3,60,1],"had":[53,1],"been":[53,1,63,1,64,1],"storedto":[53,1],"caveat":[53,1],"relation":[53,1],"toendianess":[53,1],"put":[53,1],"zeroof":[53,1],"littl":[53,1],"endian":[53,2],"whileelement":[53,1],"big":[53,1],"endianess":[53,1],"addrspacecast":[54,10],"differentaddress":[54,2],"pty":[54,2],"pty2":[54,4],"inaddress":[54,1],"complexvalu":[54,1],"spacepair":[54,1],"beperform":[54,1],"addressspac":[54,1],"resultand":[54,1],"refer":[54,1],"captur":[54,1],"anddestination":[54,1],"bereversibl":[54,1],"spaceshould":[54,1],"pattern":[54,1],"condition":[55,4,56,2,58,5,60,1],"kind":[55,2,56,1],"isnot":[55,2,56,2],"boolean":[55,1,56,2],"ofboolean":[55,1],"ne":[55,3],"ugt":[55,2,56,2],"uge":[55,2,56,2],"ult":[55,3,56,2],"ule":[55,3,56,2],"sgt":[55,3],"sge":[55,3],"slt":[55,2],"sle":[55,2],"theymust":[55,1],"accord":[55,1,56,1],"conditioncod":[55,1],"necessary":[55,2],"unequal":[55,1],"wer":[55,1],"byelement":[55,1],"elementsa":[55,1],"fcmp":[56,12],"aboolean":[56,2],"booleanvalu":[56,1],"beingcompar":[56,1],"oeq":[56,3],"ogt":[56,2],"oge":[56,2],"olt":[56,3],"ole":[56,2],"ord":[56,2],"nan":[56,2],"ueq":[56,3],"une":[56,2],"uno":[56,2],"neither":[56,1],"qnan":[56,16],"whil":[56,1,59,2],"meansthat":[56,1],"val1":[56,1,58,1],"val2":[56,1,58,1],"thecondition":[56,1],"thevector":[56,1],"performedalway":[56,1],"regardless":[56,2],"isequal":[56,1],"isgreater":[56,2],"isless":[56,2],"enableotherwis":[56,1,58,1,60,1],"unsaf":[56,1,57,1,58,1,60,1],"theonly":[56,1],"allowassumption":[56,1],"mad":[56,1],"namely":[56,1],"nnan":[56,1],"ninf":[56,1],"reassoc":[56,1],"incom":[57,3,60,1],"asargument":[57,2],"predecessor":[57,4,63,4],"currentblock":[57,2],"thelabel":[57,2],"val0":[57,1],"label0":[57,1],"ssagraph":[57,1],"blockand":[57,1],"isdeem":[57,1],"oneor":[57,1],"hintsto":[57,1],"flagsar":[57,1],"phis":[57,1],"vectortyp":[57,2],"nest":[57,1,58,1,60,1,63,1],"depth":[57,1,58,1,60,1],"logically":[57,1],"valuespecifi":[57,1],"thatexecut":[57,1],"prior":[57,1],"infinit":[57,1],"count":[57,1],"indvar":[57,2],"loopheader":[57,1],"nextindvar":[57,2],"selty":[58,2],"acondition":[58,1],"validfor":[58,1,60,1],"returnsth":[58,1],"valueargument":[58,1],"bevector":[58,1],"selection":[58,1],"entir":[58,1],"42":[58,1,60,1],"freez":[59,14],"stop":[59,1],"anarbitrary":[59,1],"areguarant":[59,1],"frozen":[59,4],"visiblewithout":[59,1],"x2":[59,2],"fr":[59,2],"f":[59,1],"k":[59,1],"poisonbr":[59,1],"bar":[59,2,60,1],"deterministic":[59,1],"tail":[60,13],"musttail":[60,7],"notail":[60,2],"simpl":[60,1],"optimizersshould":[60,1],"markermean":[60,1],"optimiz":[60,1],"presenc":[60,1],"disabl":[60,1],"guarante":[60,1],"unbound":[60,1],"growth":[60,1],"part":[60,1],"arecursiv":[60,1],"cycl":[60,1],"graph":[60,1],"preallocat":[60,1],"forward":[60,2],"appear":[60,1],"thunk":[60,1],"attributeand":[60,1],"unprototypedargument":[60,1],"similarly":[60,1],"evenif":[60,1],"accessvararg":[60,1],"obey":[60,2],"followingadditional":[60,1],"immediately":[60,2],"preced":[60,1],"possibly":[60,1],"valueproduc":[60,1],"iff":[60,1],"solong":[60,1],"prefix":[60,1],"undergo":[60,1],"sret":[60,3],"swifttailcc":[60,2],"tailcc":[60,3],"abi":[60,2],"impact":[60,2],"byval":[60,2],"prototyp":[60,2],"parametersor":[60,1],"differ":[60,1],"hand":[60,1],"swiftcc":[60,1],"swiftself":[60,1],"swiftasync":[60,1],"met":[60,1],"fastcc":[60,2],"retus":[60,1],"option":[60,1],"tailcallopt":[60,1],"guaranteedtailcallopt":[60,1],"conventionis":[60,1],"platform":[60,1],"aremet":[60,1],"tailcall":[60,1],"thecall":[60,1],"els":[60,1],"toa":[60,1],"specifiedvalu":[60,1],"argc":[60,1],"printf":[60,1],"msg":[60,1],"i32call":[60,1],"97":[60,1],"gr":[60,1],"gr1":[60,1],"normally":[60,1],"zz":[60,1],"matchth":[60,1],"c99":[60,2],"library":[60,2],"mayperform":[60,1],"under":[60,1],"someth":[60,1],"futur":[60,1],"bettersupport":[60,1],"freestand":[60,1],"environment":[60,1],"va":[61,18],"andincrement":[61,2],"actualtyp":[61,2],"arglist":[61,1],"argty":[61,1],"throughth":[61,1],"area":[61,1],"implementth":[61,1],"macro":[61,1],"typefrom":[61,1],"argumenthandl":[61,1],"vfprintf":[61,1],"intrinsicfunction":[61,1],"process":[61,1],"fully":[61,1],"manytarget":[61,1],"aggregatetyp":[61,1],"optionalcleanup":[62,1],"land":[62,10],"resultty":[62,3],"filter":[62,6],"handlingsystem":[62,1,63,1,64,1],"blockis":[62,1,64,1],"thecod":[62,1],"itdefin":[62,1],"suppli":[62,1],"uponr":[62,1],"andcontain":[62,1],"caughtor":[62,1],"unlik":[62,1],"throw":[62,2],"orth":[62,1],"re":[62,1],"andtherefor":[62,1],"withcall":[62,1],"arerepresent":[62,1,64,1],"top":[62,1],"merg":[62,1],"theclaus":[62,1],"append":[62,1],"unwound":[62,1,63,1,64,1],"due":[62,1,63,1,64,1],"thrown":[62,1,63,1,64,1],"against":[62,1,63,1],"turn":[62,1],"tmatch":[62,1],"thenunwind":[62,1],"further":[62,1],"destinationof":[62,1],"itsfirst":[62,1,64,1],"res":[62,3],"ztii":[62,2,63,1],"ztid":[62,1],"acatchswitch":[63,1],"thisensur":[63,2],"alwaysterminat":[63,2],"blockbegin":[63,1],"attempt":[63,1,64,1],"transfercontrol":[63,1],"whatever":[63,1,64,1],"routinerequir":[63,1],"know":[63,1],"controlwill":[63,1],"forth":[63,1],"ehpad":[63,1],"theexception":[63,1],"willnot":[63,1],"isentirely":[63,1],"consum":[63,1],"window":[63,1],"asdescrib":[63,1,64,1],"carry":[63,1,64,1],"dispatch":[63,1],"cs":[63,2,64,1],"tok":[63,1,64,1],"interpretedby":[64,2],"totransfer":[64,1],"run":[64,1],"action":[64,1],"additionalinformation":[64,1],"toexecut":[64,1],"tomatch":[64,1],"aid":[64,1],"ofan":[64,1],"exceptional":[64,1],"thecleanup":[64,1]}};
+export default segment;
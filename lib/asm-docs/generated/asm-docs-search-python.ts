@@ -0,0 +1,4 @@
+import {SearchSegment} from '../search.js';
+
+const segment: SearchSegment = {"hash":"195ef7e5ab2db5e02e18aa02c1473baeb3149674","docs":[["ASYNC_GEN_WRAP","Wraps the value on top of the stack in an async_generator_wrapped_value.\nUsed to yield in async generators."],["BEFORE_ASYNC_WITH","Resolves __aenter__ and __aexit__ from the object on top of the\nstack.  Pushes __aexit__ and result of __aenter__() to the stack."],["BEFORE_WITH","This opcode performs several operations before a with block starts.  First,\nit loads __exit__() from the context manager and pushes it onto\nthe stack for later use by WITH_EXCEPT_START.  Then,\n__enter__() is called. Finally, the result of calling the\n__enter__() method is pushed onto the stack."],["BINARY_OP","Implements the binary and in-place operators (depending on the value of\nop)."],["BINARY_SUBSCR","Implements TOS = TOS1[TOS]."],["BUILD_CONST_KEY_MAP","The version of BUILD_MAP specialized for constant keys. Pops the\ntop element on the stack which contains a tuple of keys, then starting from\nTOS1, pops count values to form values in the built dictionary."],["BUILD_LIST","Works as BUILD_TUPLE, but creates a list."],["BUILD_MAP","Pushes a new dictionary object onto the stack.  Pops 2 * count items\nso that the dictionary holds count entries:\n{..., TOS3: TOS2, TOS1: TOS}."],["BUILD_SET","Works as BUILD_TUPLE, but creates a set."],["BUILD_SLICE","Pushes a slice object on the stack.  argc must be 2 or 3.  If it is 2,\nslice(TOS1, TOS) is pushed; if it is 3, slice(TOS2, TOS1, TOS) is\npushed. See the slice() built-in function for more information."],["BUILD_STRING","Concatenates count strings from the stack and pushes the resulting string\nonto the stack."],["BUILD_TUPLE","Creates a tuple consuming count items from the stack, and pushes the\nresulting tuple onto the stack."],["CACHE","Rather than being an actual instruction, this opcode is used to mark extra\nspace for the interpreter to cache useful data directly in the bytecode\nitself. It is automatically hidden by all dis utilities, but can be\nviewed with show_caches=True."],["CALL","Calls a callable object with the number of arguments specified by argc,\nincluding the named arguments specified by the preceding\nKW_NAMES, if any.\nOn the stack are (in ascending order), either"],["CALL_FUNCTION_EX","Calls a callable object with variable set of positional and keyword\narguments.  If the lowest bit of flags is set, the top of the stack\ncontains a mapping object containing additional keyword arguments.\nBefore the callable is called, the mapping object and iterable object\nare each “unpacked” and their contents passed in as keyword and\npositional arguments respectively.\nCALL_FUNCTION_EX pops all arguments and the callable object off the stack,\ncalls the callable object with those arguments, and pushes the return value\nreturned by the callable object."],["CHECK_EG_MATCH","Performs exception matching for except*. Applies split(TOS) on\nthe exception group representing TOS1."],["CHECK_EXC_MATCH","Performs exception matching for except. Tests whether the TOS1 is an exception\nmatching TOS. Pops TOS and pushes the boolean result of the test."],["COMPARE_OP","Performs a Boolean operation.  The operation name can be found in\ncmp_op[opname]."],["CONTAINS_OP","Performs in comparison, or not in if invert is 1."],["COPY","Push the i-th item to the top of the stack. The item is not removed from its\noriginal location."],["COPY_FREE_VARS","Copies the n free variables from the closure into the frame.\nRemoves the need for special code on the caller’s side when calling\nclosures."],["DELETE_ATTR","Implements del TOS.name, using namei as index into co_names."],["DELETE_DEREF","Empties the cell contained in slot i of the “fast locals” storage.\nUsed by the del statement."],["DELETE_FAST","Deletes local co_varnames[var_num]."],["DELETE_GLOBAL","Works as DELETE_NAME, but deletes a global name."],["DELETE_NAME","Implements del name, where namei is the index into co_names\nattribute of the code object."],["DELETE_SUBSCR","Implements del TOS1[TOS]."],["DICT_MERGE","Like DICT_UPDATE but raises an exception for duplicate keys."],["DICT_UPDATE","Calls dict.update(TOS1[-i], TOS).  Used to build dicts."],["END_ASYNC_FOR","Terminates an async for loop.  Handles an exception raised\nwhen awaiting a next item.  If TOS is StopAsyncIteration pop 3\nvalues from the stack and restore the exception state using the second\nof them.  Otherwise re-raise the exception using the value\nfrom the stack.  An exception handler block is removed from the block stack."],["EXTENDED_ARG","Prefixes any opcode which has an argument too big to fit into the default one\nbyte. ext holds an additional byte which act as higher bits in the argument.\nFor each opcode, at most three prefixal EXTENDED_ARG are allowed, forming\nan argument from two-byte to four-byte."],["FORMAT_VALUE","Used for implementing formatted literal strings (f-strings).  Pops\nan optional fmt_spec from the stack, then a required value.\nflags is interpreted as follows"],["FOR_ITER","TOS is an iterator.  Call its __next__() method.  If\nthis yields a new value, push it on the stack (leaving the iterator below\nit).  If the iterator indicates it is exhausted, TOS is popped, and the byte\ncode counter is incremented by delta."],["GET_AITER","Implements TOS = TOS.__aiter__()."],["GET_ANEXT","Pushes get_awaitable(TOS.__anext__()) to the stack.  See\nGET_AWAITABLE for details about get_awaitable."],["GET_AWAITABLE","Implements TOS = get_awaitable(TOS), where get_awaitable(o)\nreturns o if o is a coroutine object or a generator object with\nthe CO_ITERABLE_COROUTINE flag, or resolves\no.__await__."],["GET_ITER","Implements TOS = iter(TOS)."],["GET_LEN","Push len(TOS) onto the stack."],["GET_YIELD_FROM_ITER","If TOS is a generator iterator or coroutine object\nit is left as is.  Otherwise, implements TOS = iter(TOS)."],["HAVE_ARGUMENT","This is not really an opcode.  It identifies the dividing line between\nopcodes which don’t use their argument and those that do\n(< HAVE_ARGUMENT and >= HAVE_ARGUMENT, respectively)."],["IMPORT_FROM","Loads the attribute co_names[namei] from the module found in TOS. The\nresulting object is pushed onto the stack, to be subsequently stored by a\nSTORE_FAST instruction."],["IMPORT_NAME","Imports the module co_names[namei].  TOS and TOS1 are popped and provide\nthe fromlist and level arguments of __import__().  The module\nobject is pushed onto the stack.  The current namespace is not affected: for\na proper import statement, a subsequent STORE_FAST instruction\nmodifies the namespace."],["IMPORT_STAR","Loads all symbols not starting with '_' directly from the module TOS to\nthe local namespace. The module is popped after loading all names. This\nopcode implements from module import *."],["IS_OP","Performs is comparison, or is not if invert is 1."],["JUMP_BACKWARD","Decrements bytecode counter by delta. Checks for interrupts."],["JUMP_BACKWARD_NO_INTERRUPT","Decrements bytecode counter by delta. Does not check for interrupts."],["JUMP_FORWARD","Increments bytecode counter by delta."],["JUMP_IF_FALSE_OR_POP","If TOS is false, increments the bytecode counter by delta and leaves TOS on the\nstack.  Otherwise (TOS is true), TOS is popped."],["JUMP_IF_TRUE_OR_POP","If TOS is true, increments the bytecode counter by delta and leaves TOS on the\nstack.  Otherwise (TOS is false), TOS is popped."],["KW_NAMES","Prefixes PRECALL.\nStores a reference to co_consts[consti] into an internal variable\nfor use by CALL. co_consts[consti] must be a tuple of strings."],["LIST_APPEND","Calls list.append(TOS1[-i], TOS).  Used to implement list comprehensions."],["LIST_EXTEND","Calls list.extend(TOS1[-i], TOS).  Used to build lists."],["LIST_TO_TUPLE","Pops a list from the stack and pushes a tuple containing the same values."],["LOAD_ASSERTION_ERROR","Pushes AssertionError onto the stack.  Used by the assert\nstatement."],["LOAD_ATTR","Replaces TOS with getattr(TOS, co_names[namei])."],["LOAD_BUILD_CLASS","Pushes builtins.__build_class__() onto the stack.  It is later called\nto construct a class."],["LOAD_CLASSDEREF","Much like LOAD_DEREF but first checks the locals dictionary before\nconsulting the cell.  This is used for loading free variables in class\nbodies."],["LOAD_CLOSURE","Pushes a reference to the cell contained in slot i of the “fast locals”\nstorage.  The name of the variable is co_fastlocalnames[i]."],["LOAD_CONST","Pushes co_consts[consti] onto the stack."],["LOAD_DEREF","Loads the cell contained in slot i of the “fast locals” storage.\nPushes a reference to the object the cell contains on the stack."],["LOAD_FAST","Pushes a reference to the local co_varnames[var_num] onto the stack."],["LOAD_GLOBAL","Loads the global named co_names[namei>>1] onto the stack."],["LOAD_METHOD","Loads a method named co_names[namei] from the TOS object. TOS is popped.\nThis bytecode distinguishes two cases: if TOS has a method with the correct\nname, the bytecode pushes the unbound method and TOS. TOS will be used as\nthe first argument (self) by CALL when calling the\nunbound method. Otherwise, NULL and the object return by the attribute\nlookup are pushed."],["LOAD_NAME","Pushes the value associated with co_names[namei] onto the stack."],["MAKE_CELL","Creates a new cell in slot i.  If that slot is empty then\nthat value is stored into the new cell."],["MAKE_FUNCTION","Pushes a new function object on the stack.  From bottom to top, the consumed\nstack must consist of values if the argument carries a specified flag value"],["MAP_ADD","Calls dict.__setitem__(TOS1[-i], TOS1, TOS).  Used to implement dict\ncomprehensions."],["MATCH_CLASS","TOS is a tuple of keyword attribute names, TOS1 is the class being matched\nagainst, and TOS2 is the match subject.  count is the number of positional\nsub-patterns."],["MATCH_KEYS","TOS is a tuple of mapping keys, and TOS1 is the match subject.  If TOS1\ncontains all of the keys in TOS, push a tuple containing the\ncorresponding values. Otherwise, push None."],["MATCH_MAPPING","If TOS is an instance of collections.abc.Mapping (or, more technically: if\nit has the Py_TPFLAGS_MAPPING flag set in its\ntp_flags), push True onto the stack.  Otherwise, push\nFalse."],["MATCH_SEQUENCE","If TOS is an instance of collections.abc.Sequence and is not an instance\nof str/bytes/bytearray (or, more technically: if it has\nthe Py_TPFLAGS_SEQUENCE flag set in its tp_flags),\npush True onto the stack.  Otherwise, push False."],["NOP","Do nothing code.  Used as a placeholder by the bytecode optimizer, and to\ngenerate line tracing events."],["POP_EXCEPT","Pops a value from the stack, which is used to restore the exception state."],["POP_JUMP_BACKWARD_IF_FALSE","If TOS is false, decrements the bytecode counter by delta.  TOS is popped."],["POP_JUMP_BACKWARD_IF_NONE","If TOS is None, decrements the bytecode counter by delta.  TOS is popped."],["POP_JUMP_BACKWARD_IF_NOT_NONE","If TOS is not None, decrements the bytecode counter by delta.  TOS is popped."],["POP_JUMP_BACKWARD_IF_TRUE","If TOS is true, decrements the bytecode counter by delta.  TOS is popped."],["POP_JUMP_FORWARD_IF_FALSE","If TOS is false, increments the bytecode counter by delta.  TOS is popped."],["POP_JUMP_FORWARD_IF_NONE","If TOS is None, increments the bytecode counter by delta.  TOS is popped."],["POP_JUMP_FORWARD_IF_NOT_NONE","If TOS is not None, increments the bytecode counter by delta.  TOS is popped."],["POP_JUMP_FORWARD_IF_TRUE","If TOS is true, increments the bytecode counter by delta.  TOS is popped."],["POP_TOP","Removes the top-of-stack (TOS) item."],["PRECALL","Prefixes CALL. Logically this is a no op.\nIt exists to enable effective specialization of calls.\nargc is the number of arguments as described in CALL."],["PREP_RERAISE_STAR","Combines the raised and reraised exceptions list from TOS, into an exception\ngroup to propagate from a try-except* block. Uses the original exception\ngroup from TOS1 to reconstruct the structure of reraised exceptions. Pops\ntwo items from the stack and pushes the exception to reraise or None\nif there isn’t one."],["PRINT_EXPR","Implements the expression statement for the interactive mode.  TOS is removed\nfrom the stack and printed.  In non-interactive mode, an expression statement\nis terminated with POP_TOP."],["PUSH_EXC_INFO","Pops a value from the stack. Pushes the current exception to the top of the stack.\nPushes the value originally popped back to the stack.\nUsed in exception handlers."],["PUSH_NULL","Pushes a NULL to the stack.\nUsed in the call sequence to match the NULL pushed by\nLOAD_METHOD for non-method calls."],["RAISE_VARARGS","Raises an exception using one of the 3 forms of the raise statement,\ndepending on the value of argc"],["RERAISE","Re-raises the exception currently on top of the stack. If oparg is non-zero,\npops an additional value from the stack which is used to set f_lasti\nof the current frame."],["RESUME","A no-op. Performs internal tracing, debugging and optimization checks."],["RETURN_GENERATOR","Create a generator, coroutine, or async generator from the current frame.\nClear the current frame and return the newly created generator."],["RETURN_VALUE","Returns with TOS to the caller of the function."],["SEND","Sends None to the sub-generator of this generator.\nUsed in yield from and await statements."],["SETUP_ANNOTATIONS","Checks whether __annotations__ is defined in locals(), if not it is\nset up to an empty dict. This opcode is only emitted if a class\nor module body contains variable annotations\nstatically."],["SET_ADD","Calls set.add(TOS1[-i], TOS).  Used to implement set comprehensions."],["SET_UPDATE","Calls set.update(TOS1[-i], TOS).  Used to build sets."],["STORE_ATTR","Implements TOS.name = TOS1, where namei is the index of name in\nco_names."],["STORE_DEREF","Stores TOS into the cell contained in slot i of the “fast locals”\nstorage."],["STORE_FAST","Stores TOS into the local co_varnames[var_num]."],["STORE_GLOBAL","Works as STORE_NAME, but stores the name as a global."],["STORE_NAME","Implements name = TOS. namei is the index of name in the attribute\nco_names of the code object. The compiler tries to use\nSTORE_FAST or STORE_GLOBAL if possible."],["STORE_SUBSCR","Implements TOS1[TOS] = TOS2."],["SWAP","Swap TOS with the item at position i."],["UNARY_INVERT","Implements TOS = ~TOS."],["UNARY_NEGATIVE","Implements TOS = -TOS."],["UNARY_NOT","Implements TOS = not TOS."],["UNARY_POSITIVE","Implements TOS = +TOS."],["UNPACK_EX","Implements assignment with a starred target: Unpacks an iterable in TOS into\nindividual values, where the total number of values can be smaller than the\nnumber of items in the iterable: one of the new values will be a list of all\nleftover items."],["UNPACK_SEQUENCE","Unpacks TOS into count individual values, which are put onto the stack\nright-to-left."],["WITH_EXCEPT_START","Calls the function in position 4 on the stack with arguments (type, val, tb)\nrepresenting the exception at the top of the stack.\nUsed to implement the call context_manager.__exit__(*exc_info()) when an exception\nhas occurred in a with statement."],["YIELD_VALUE","Pops TOS and yields it from a generator."]],"lengths":[31,28,63,20,10,52,14,57,14,52,24,24,100,85,123,56,39,22,16,27,37,20,39,14,16,24,10,22,24,87,68,90,47,25,32,77,10,16,29,53,37,64,42,15,18,24,10,47,47,40,22,24,22,21,16,23,53,54,14,41,20,34,88,18,28,87,42,78,61,50,60,23,29,24,24,27,24,24,24,27,24,12,35,73,36,41,34,50,56,42,34,10,23,46,22,24,22,31,16,16,40,10,15,8,8,10,8,77,22,77,10],"postings":{"async":[0,5,1,1,29,3,90,2],"gen":[0,1],"wrap":[0,5],"valu":[0,4,3,2,5,4,13,1,14,2,29,4,31,7,32,2,52,2,63,2,64,2,65,7,66,1,67,1,68,3,72,2,85,4,87,2,88,2,91,1,107,10,108,2,110,1],"top":[0,2,1,2,5,2,14,2,19,2,65,2,81,3,84,2,85,2,88,2,109,2],"stack":[0,2,1,4,2,4,5,2,7,3,9,2,10,4,11,4,13,3,14,4,15,1,19,2,29,7,31,4,32,2,34,2,37,2,40,2,41,2,47,2,48,2,52,2,53,2,55,2,58,2,59,2,60,2,61,3,63,2,65,4,69,2,70,2,72,3,81,2,83,2,84,2,85,6,86,2,88,5,107,1,108,2,109,6],"generator":[0,4,35,2,38,2,90,7,92,4,110,2],"used":[0,2,12,2,22,2,28,2,31,2,50,2,51,2,53,2,56,2,62,2,66,2,71,2,72,2,85,2,86,2,88,2,92,2,94,2,95,2,109,2],"yield":[0,2,32,2,38,1,89,2,92,2,110,3],"new":[0,1,1,1,2,1,3,1,5,1,7,2,10,1,12,1,13,1,14,1,15,1,16,1,18,1,19,1,20,1,22,1,27,1,28,1,29,1,31,1,32,2,33,1,34,1,35,1,37,1,38,1,43,1,44,1,45,1,47,1,48,1,49,1,51,1,52,1,53,1,56,1,62,1,64,5,65,2,66,1,67,1,68,1,69,1,70,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,82,1,83,1,85,1,86,1,88,1,89,1,90,1,92,1,93,1,95,1,102,1,107,2,109,1],"version":[0,1,1,1,2,1,3,1,5,3,7,1,10,1,12,1,13,1,14,1,15,1,16,1,18,1,19,1,20,1,22,2,27,1,28,1,29,2,31,1,33,2,34,1,35,2,37,1,38,1,39,1,43,1,44,1,45,1,47,2,48,2,49,1,51,1,52,1,53,1,56,2,57,1,59,1,61,1,62,1,64,1,65,1,66,2,67,2,68,2,69,1,70,1,72,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,82,1,83,1,85,1,86,1,88,2,89,1,90,1,92,1,93,1,95,1,97,1,102,1,109,2],"3":[0,1,1,1,2,1,3,1,5,1,7,1,9,4,10,1,12,1,13,1,14,1,15,1,16,1,18,1,19,1,20,1,22,2,27,1,28,1,29,4,31,1,33,2,34,1,35,2,37,1,38,1,39,1,43,1,44,1,45,1,47,2,48,2,49,1,51,1,52,1,53,1,56,2,57,1,59,1,61,1,62,1,64,1,65,1,66,2,67,2,68,2,69,1,70,1,72,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,82,1,83,1,85,1,86,1,87,2,88,2,89,2,90,1,92,1,93,1,95,1,97,1,102,1,109,2],"11":[0,1,2,1,3,1,12,1,13,1,15,1,16,1,19,1,20,1,22,1,29,1,35,1,44,1,45,1,47,1,48,1,49,1,56,1,57,1,59,1,61,1,64,1,67,1,68,1,72,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1,82,1,83,1,85,1,86,1,88,1,89,1,90,1,92,1,97,1,102,1,109,1],"befor":[1,1,2,3,14,2,31,3,56,2,61,1,66,1,107,1],"resolv":[1,2,35,2],"aenter":[1,4,35,1],"aexit":[1,4,35,1],"object":[1,2,7,2,9,2,13,5,14,14,25,2,33,1,35,4,38,2,40,2,41,2,59,2,62,4,65,2,100,2],"push":[1,2,2,4,7,2,9,6,10,2,11,2,13,1,14,2,15,2,16,2,19,2,31,1,32,2,34,2,37,2,40,2,41,2,52,2,53,2,55,2,57,2,58,2,59,2,60,2,61,1,62,4,63,2,65,2,67,3,68,5,69,4,70,4,83,2,85,5,86,5],"result":[1,2,2,2,10,2,11,2,16,2,31,1,40,2,107,1],"5":[1,1,7,1,33,1,34,1,35,1,38,1],"opcod":[2,2,12,3,30,4,39,5,42,2,93,2],"perform":[2,2,15,2,16,2,17,2,18,2,31,1,43,2,89,2],"several":[2,2],"operation":[2,2,17,4],"block":[2,2,29,4,83,2],"start":[2,4,5,2,42,2,89,1,109,1],"first":[2,2,56,2,62,2],"load":[2,2,40,2,42,4,53,1,54,1,55,1,56,5,57,3,58,1,59,3,60,1,61,3,62,3,63,1,86,2],"exit":[2,2,109,3],"context":[2,2,109,2],"manager":[2,2,109,2],"onto":[2,4,7,2,10,2,11,2,37,2,40,2,41,2,53,2,55,2,58,2,60,2,61,2,63,2,69,2,70,2,107,1,108,2],"later":[2,2,55,2],"use":[2,2,31,2,39,2,49,2,83,2,100,2],"except":[2,2,15,2,16,2,72,1,83,2,109,1],"enter":[2,4],"call":[2,4,13,5,14,9,20,2,28,2,31,3,32,2,35,2,49,2,50,2,51,2,55,2,62,4,66,2,82,6,86,4,94,2,95,2,109,4],"finally":[2,2],"method":[2,2,32,2,62,9,86,4],"binary":[3,3,4,1],"op":[3,3,17,3,18,1,43,1,82,2,89,2],"implement":[3,2,4,2,21,2,25,2,26,2,31,2,33,2,35,2,36,2,38,2,42,2,50,2,66,2,84,2,94,2,96,2,100,2,101,2,103,2,104,2,105,2,106,2,107,2,109,2],"plac":[3,2],"operator":[3,2],"depend":[3,2,87,2],"subscr":[4,1,26,1,101,1],"tos":[4,4,7,2,9,4,15,2,16,4,21,2,26,2,28,2,29,2,32,4,33,4,34,2,35,4,36,4,37,2,38,6,40,2,41,2,42,2,47,8,48,8,50,2,51,2,54,4,62,10,65,1,66,3,67,4,68,4,69,2,70,2,73,4,74,4,75,4,76,4,77,4,78,4,79,4,80,4,81,2,83,2,84,2,87,4,91,2,94,2,95,2,96,2,97,2,98,2,100,2,101,2,102,2,103,4,104,4,105,4,106,4,107,2,108,2,110,2],"tos1":[4,2,5,2,7,2,9,4,15,2,16,2,26,2,28,2,41,2,50,2,51,2,65,1,66,5,67,4,68,4,83,2,87,2,94,2,95,2,96,2,101,2],"build":[5,3,6,3,7,1,8,3,9,1,10,1,11,1,28,2,51,2,55,3,95,2],"const":[5,1,49,4,58,3],"key":[5,5,27,2,66,1,68,5],"map":[5,3,7,1,14,4,66,3,68,2,69,5],"specializ":[5,2],"constant":[5,2],"pop":[5,4,7,2,13,1,14,2,15,2,16,2,29,2,31,3,32,2,41,2,42,2,47,3,48,3,52,2,62,2,67,1,72,3,73,3,74,3,75,3,76,3,77,3,78,3,79,3,80,3,81,1,83,2,84,2,85,4,88,2,110,2],"element":[5,2],"contain":[5,2,12,1,14,4,18,1,22,2,52,2,57,2,59,4,65,2,68,4,93,2,97,2],"tupl":[5,2,6,2,8,2,11,5,49,2,52,3,65,4,67,3,68,4],"count":[5,2,7,5,10,2,11,2,67,3,107,2,108,2],"form":[5,2,30,2,87,2],"built":[5,2,9,2],"dictionary":[5,2,7,6,56,2,65,2],"6":[5,1,10,1,14,1,31,1,39,1,93,1],"list":[6,3,50,5,51,5,52,3,83,2,107,3],"work":[6,2,8,2,24,2,99,2],"but":[6,2,8,2,12,2,24,2,27,2,39,1,56,2,99,2],"creat":[6,2,7,2,8,2,11,2,64,2,90,4],"2":[7,2,9,4,22,1,35,1,87,1,89,1],"item":[7,4,11,2,15,2,19,4,29,3,72,1,81,2,83,2,88,1,102,2,107,4,109,1],"so":[7,2,12,1],"hold":[7,3,30,2],"entry":[7,2],"tos3":[7,2],"tos2":[7,2,9,2,67,4,101,2],"chang":[7,1,22,1,29,1,33,1,35,1,39,1,47,1,48,1,56,1,57,1,59,1,61,1,65,1,66,1,67,1,68,1,72,1,88,1,97,1,109,1],"instead":[7,1,65,1],"empty":[7,1,22,2,31,1,64,2,93,2],"pre":[7,1],"siz":[7,1],"set":[8,3,14,4,61,1,69,2,70,2,87,1,88,2,93,2,94,5,95,5],"slic":[9,9],"argc":[9,2,13,3,82,2,87,2],"must":[9,2,49,2,65,2],"see":[9,2,34,2],"function":[9,2,14,3,65,5,89,1,91,2,109,3],"mor":[9,2,57,1,69,2,70,2],"information":[9,2],"str":[10,5,31,5,49,2,65,2,70,2],"concatenat":[10,2],"consum":[11,2,65,2],"cach":[12,7],"rather":[12,2,47,1,48,1,109,1],"than":[12,2,47,1,48,1,107,2,109,1],"being":[12,2,67,2],"actual":[12,2],"instruction":[12,4,35,2,39,1,40,2,41,2,67,1,68,1],"mark":[12,2,89,1],"extra":[12,2],"spac":[12,3],"interpreter":[12,3],"useful":[12,2],"data":[12,3],"directly":[12,2,42,2],"bytecod":[12,3,44,2,45,2,46,2,47,2,48,2,57,1,62,4,71,2,73,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2],"itself":[12,2],"automatically":[12,2],"hidden":[12,2],"all":[12,2,13,1,14,2,42,4,68,2,107,2],"dis":[12,2],"utility":[12,2],"can":[12,3,17,2,107,2],"view":[12,2],"show":[12,2],"tru":[12,2,47,2,48,3,67,1,68,1,69,2,70,2,76,3,80,3],"logically":[12,1,82,2],"part":[12,1],"preced":[12,1,13,2],"many":[12,1],"expect":[12,1],"follow":[12,1,15,1,31,2],"exact":[12,1],"number":[12,1,13,2,67,2,82,2,107,6],"will":[12,1,62,2,107,2],"instruct":[12,1],"skip":[12,1],"over":[12,1],"them":[12,1,29,2],"runtim":[12,1],"populat":[12,1],"look":[12,1],"lik":[12,1,27,2,56,2],"arbitrary":[12,1],"great":[12,1],"car":[12,1],"should":[12,1],"taken":[12,1],"read":[12,1],"modify":[12,1,41,2],"raw":[12,1],"adaptiv":[12,1],"quicken":[12,1],"callabl":[13,7,14,10],"argument":[13,11,14,10,30,6,39,8,41,2,62,2,65,2,82,2,109,2],"specifi":[13,4,65,2],"includ":[13,2],"nam":[13,7,17,2,21,4,24,4,25,5,40,2,41,3,42,2,49,1,54,2,57,2,61,4,62,6,63,3,65,1,67,2,96,6,99,4,100,7],"kw":[13,2,49,1],"any":[13,2,30,2],"ascend":[13,2],"order":[13,2,65,1],"either":[13,2],"null":[13,2,61,1,62,2,86,5],"positional":[13,3,14,4,65,3,67,3],"self":[13,2,62,2],"remain":[13,1],"total":[13,1,107,2],"exclud":[13,1],"not":[13,1,18,2,19,2,29,1,35,1,39,2,41,2,42,2,43,2,45,2,57,1,70,2,72,1,75,3,79,3,88,1,93,2,105,3,109,1],"present":[13,1],"off":[13,1,14,2],"thos":[13,1,14,2,39,2,66,1],"return":[13,2,14,4,33,1,35,2,62,2,90,3,91,3],"ex":[14,3,107,1],"variabl":[14,2,20,2,49,2,56,2,57,2,61,1,65,1,93,2],"keyword":[14,6,65,2,67,3],"lowest":[14,2],"bit":[14,2,30,2,61,1],"flag":[14,2,31,7,35,2,65,3,69,4,70,4],"additional":[14,2,30,2,88,2],"iterabl":[14,2,35,2,107,4],"each":[14,2,30,2],"unpack":[14,2,107,3,108,3],"their":[14,2,39,2],"content":[14,2],"pass":[14,2],"respectively":[14,2,39,2],"check":[15,1,16,1,44,2,45,2,56,2,89,2,93,2],"eg":[15,1],"match":[15,9,16,5,67,5,68,3,69,1,70,1,86,2],"exception":[15,4,16,4,27,2,29,9,72,3,83,10,85,4,87,5,88,3,109,5],"apply":[15,2],"split":[15,2],"group":[15,2,83,4],"represent":[15,2,109,2],"cas":[15,2,62,2],"two":[15,1,30,2,62,2,83,2],"non":[15,3,67,1,68,2,74,3,75,3,78,3,79,3,83,2,84,2,86,2,88,2,92,2],"subgroup":[15,2],"full":[15,1],"ther":[15,1,83,2],"no":[15,1,22,1,33,1,45,1,56,1,57,1,59,1,82,2,89,2,97,1],"one":[15,1,29,1,30,2,72,1,83,2,87,2,88,1,107,2,109,1],"typ":[15,1,87,2,109,2],"exc":[16,1,85,1,109,2],"test":[16,4],"whether":[16,2,93,2],"boolean":[16,2,17,2,67,1,68,1],"compar":[17,1],"found":[17,2,40,2],"cmp":[17,2],"opnam":[17,2],"comparison":[18,2,43,2],"invert":[18,2,43,2,103,1],"1":[18,2,35,1,43,2,47,1,48,1,61,2,66,1,87,1,89,1],"9":[18,1,27,1,28,1,43,1,51,1,52,1,53,1,88,1,95,1,109,1],"copy":[19,1,20,3],"i":[19,2,22,3,28,2,50,2,51,2,56,1,57,5,59,3,64,2,66,2,94,2,95,2,97,3,102,2],"th":[19,2],"remov":[19,2,20,2,29,2,81,2,84,2],"original":[19,2,83,2],"location":[19,2],"fre":[20,3,56,2,65,1],"var":[20,1,23,2,60,2,98,2],"n":[20,2],"closur":[20,4,57,2,65,1],"fram":[20,2,88,2,90,4],"need":[20,2],"special":[20,2],"cod":[20,2,25,2,32,2,65,1,71,2,100,2],"caller":[20,2,91,2],"s":[20,2],"sid":[20,2],"delet":[21,1,22,1,23,3,24,5,25,1,26,1],"attr":[21,1,54,1,96,1],"del":[21,2,22,2,25,2,26,2],"using":[21,2,29,4,31,1,87,2],"namei":[21,2,25,2,40,2,41,2,54,2,61,3,62,2,63,2,96,2,100,2],"index":[21,2,25,2,96,2,100,2],"co":[21,2,22,1,23,2,25,2,35,2,40,2,41,2,49,4,54,2,56,1,57,3,58,2,59,1,60,2,61,2,62,2,63,2,96,2,97,1,98,2,100,2],"deref":[22,1,56,2,59,1,97,1],"cell":[22,2,56,2,57,2,59,4,64,5,65,1,97,2],"slot":[22,2,57,2,59,2,64,4,97,2],"fast":[22,2,23,1,40,2,41,2,57,3,59,2,60,1,97,2,98,1,100,2],"local":[22,2,23,2,42,2,56,2,57,2,59,2,60,2,93,2,97,2,98,2],"storag":[22,2,57,2,59,2,97,2],"statement":[22,2,41,2,53,2,84,4,87,2,92,2,109,2],"longer":[22,1,33,1,56,1,57,1,59,1,97,1],"offset":[22,1,56,1,57,1,59,1,97,1],"length":[22,1,56,1,57,1,59,1,97,1],"varnam":[22,1,23,2,56,1,57,1,59,1,60,2,97,1,98,2],"num":[23,2,60,2,98,2],"global":[24,3,61,4,99,3,100,2],"wher":[25,2,35,4,89,2,96,2,107,2],"attribut":[25,2,40,2,62,2,67,4,100,2],"dict":[27,3,28,5,66,4,93,2],"merg":[27,1],"updat":[27,2,28,3,95,3],"rais":[27,2,29,4,83,2,87,11,88,2],"duplicat":[27,2],"end":[29,1],"terminat":[29,2,84,2],"loop":[29,2],"handl":[29,2],"await":[29,2,35,2,89,1,92,2],"next":[29,2,32,2],"stopasynciteration":[29,2],"restor":[29,2,72,2],"stat":[29,2,72,2],"second":[29,2],"otherwis":[29,2,38,2,47,2,48,2,62,2,67,1,68,2,69,2,70,2],"re":[29,2,87,1,88,2],"handler":[29,2,85,2],"8":[29,1,66,1],"representation":[29,1,72,1,88,1,109,1],"now":[29,1,39,1,47,1,48,1,72,1,88,1,109,1],"consist":[29,1,65,2,72,1,88,1,109,1],"thre":[29,1,30,2,72,1,88,1,109,1],"extend":[30,3,51,3],"arg":[30,3],"prefix":[30,2,49,2,82,2],"has":[30,2,39,1,62,2,67,1,69,2,70,2,109,2],"too":[30,2],"big":[30,2],"fit":[30,2],"default":[30,2,65,2],"byt":[30,8,32,2,70,2,107,2],"ext":[30,2],"act":[30,2],"higher":[30,2],"most":[30,2],"prefixal":[30,2],"allow":[30,2],"four":[30,2],"format":[31,9],"literal":[31,2],"f":[31,2,88,2],"optional":[31,2],"fmt":[31,4],"spec":[31,4],"requir":[31,2,67,1],"interpret":[31,2],"0x03":[31,5],"0x00":[31,1],"0x01":[31,1,65,1],"0x02":[31,1,65,1],"repr":[31,1],"ascii":[31,1],"0x04":[31,2,65,2],"els":[31,1],"pyobject":[31,1],"iter":[32,1,36,3,38,3],"iterator":[32,6,38,2],"leav":[32,2,47,2,48,2],"below":[32,2],"indicat":[32,2,35,1,67,1,68,1],"exhaust":[32,2],"counter":[32,2,44,2,45,2,46,2,47,2,48,2,73,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2],"increment":[32,2,46,2,47,2,48,2,77,2,78,2,79,2,80,2],"delta":[32,2,44,2,45,2,46,2,47,3,48,3,73,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2],"get":[33,1,34,7,35,5,36,1,37,1,38,1],"aiter":[33,4],"7":[33,1,62,1,109,1],"awaitabl":[33,1,34,6,35,5],"support":[33,1],"anext":[34,3],"detail":[34,2],"about":[34,2],"o":[35,8],"coroutin":[35,4,38,2,90,2],"operand":[35,1,89,1],"nonzero":[35,1],"occur":[35,1,89,1,109,2],"after":[35,2,42,2,89,3,107,1],"previously":[35,1,67,1,68,1],"did":[35,1],"hav":[35,1,39,4],"oparg":[35,1,47,1,48,1,88,2],"len":[37,3],"10":[37,1,65,1,67,1,68,1,69,1,70,1],"left":[38,2,107,1,108,2],"really":[39,2],"identify":[39,2],"divid":[39,2],"lin":[39,2,71,2],"between":[39,2],"don":[39,2],"t":[39,2,83,2],"do":[39,2,71,2],"every":[39,1],"had":[39,1],"import":[40,1,41,7,42,3],"modul":[40,2,41,4,42,6,93,2],"subsequently":[40,2],"stor":[40,4,41,2,49,2,64,2,96,1,97,3,98,3,99,5,100,5,101,1],"provid":[41,2],"fromlist":[41,2],"level":[41,2],"current":[41,2,85,2,88,2,90,4],"namespac":[41,4,42,2],"affect":[41,2],"proper":[41,2],"subsequent":[41,2],"star":[42,1,83,1,107,2],"symbol":[42,2],"jump":[44,1,45,1,46,1,47,1,48,1,73,1,74,1,75,1,76,1,77,1,78,1,79,1,80,1],"backward":[44,1,45,1,73,1,74,1,75,1,76,1],"decrement":[44,2,45,2,73,2,74,2,75,2,76,2],"interrupt":[44,2,45,3],"doe":[45,2],"forward":[46,1,77,1,78,1,79,1,80,1],"fals":[47,3,48,2,67,1,68,1,69,2,70,2,73,3,77,3],"relativ":[47,1,48,1],"absolut":[47,1,48,1],"target":[47,1,48,1,107,2],"precall":[49,2,82,1],"referenc":[49,2,57,2,59,2,60,2],"consti":[49,4,58,2],"internal":[49,2,89,2],"append":[50,3],"comprehension":[50,2,66,2,94,2],"sam":[52,2],"assertion":[53,1],"error":[53,1],"assertionerror":[53,2],"assert":[53,2],"replac":[54,2],"getattr":[54,2],"class":[55,5,56,2,67,3,93,2],"builtin":[55,2],"construct":[55,2],"classderef":[56,1],"much":[56,2],"consult":[56,2],"body":[56,2,93,2],"4":[56,1,109,3],"fastlocalnam":[57,2],"effectively":[57,1],"alia":[57,1],"exist":[57,1,82,2],"keep":[57,1],"littl":[57,1],"readabl":[57,1],"low":[61,1,107,1],"distinguish":[62,2],"correct":[62,2],"unbound":[62,4],"lookup":[62,2],"associat":[63,2,65,1],"mak":[64,1,65,2],"bottom":[65,2],"carry":[65,2],"only":[65,2,93,2],"parameter":[65,3],"annotation":[65,1,93,5],"0x08":[65,1],"qualifi":[65,1],"add":[66,1,94,3],"setitem":[66,2],"wer":[66,1],"revers":[66,1],"against":[67,2],"subject":[67,2,68,2],"sub":[67,2,92,2],"pattern":[67,2],"instanc":[67,1,69,2,70,4,87,2],"extract":[67,1],"also":[67,1,68,1],"success":[67,1,68,1],"failur":[67,1,68,1],"correspond":[68,2],"collection":[69,2,70,2],"abc":[69,2,70,2],"technically":[69,2,70,2],"py":[69,2,70,2],"tpflag":[69,2,70,2],"tp":[69,2,70,2],"sequenc":[70,5,86,2,108,1],"bytearray":[70,2],"nop":[71,1],"noth":[71,2],"placeholder":[71,2],"optimizer":[71,2],"generat":[71,2],"trac":[71,2,89,2],"event":[71,2],"enabl":[82,2],"effectiv":[82,2],"specialization":[82,2],"describ":[82,2],"prep":[83,1],"rerais":[83,7,88,1],"combin":[83,2],"propagat":[83,2],"try":[83,2,100,2],"reconstruct":[83,2],"structur":[83,2],"isn":[83,2],"print":[84,3],"expr":[84,1],"expression":[84,4,89,3],"interactiv":[84,4],"mod":[84,4],"info":[85,1,109,2],"originally":[85,2],"back":[85,2],"vararg":[87,1],"0":[87,1,89,1],"previous":[87,1],"caus":[87,1],"currently":[88,2],"zero":[88,2],"lasti":[88,2],"resum":[89,2],"debug":[89,2],"optimization":[89,2],"clear":[90,2],"newly":[90,2],"send":[92,3],"setup":[93,1],"defin":[93,2],"up":[93,2],"emit":[93,2],"statically":[93,2],"compiler":[100,2],"possibl":[100,2],"swap":[102,3],"position":[102,2,109,3],"unary":[103,1,104,1,105,1,106,1],"negativ":[104,1],"positiv":[106,1],"assignment":[107,2],"individual":[107,2,108,2],"smaller":[107,2],"leftover":[107,2],"high":[107,1],"put":[107,1,108,2],"right":[107,1,108,2],"val":[109,2],"tb":[109,2]}};
+export default segment;
@@ -0,0 +1,13 @@
+import {SearchSegment} from '../search.js';
+
+export const SEARCH_SEGMENTS: Record<string, () => Promise<{default: SearchSegment}>> = {
+    '6502': () => import('./asm-docs-search-6502.js'),
+    'amd64': () => import('./asm-docs-search-amd64.js'),
+    'arm32': () => import('./asm-docs-search-arm32.js'),
+    'avr': () => import('./asm-docs-search-avr.js'),
+    'evm': () => import('./asm-docs-search-evm.js'),
+    'hermes': () => import('./asm-docs-search-hermes.js'),
+    'java': () => import('./asm-docs-search-java.js'),
+    'llvm': () => import('./asm-docs-search-llvm.js'),
+    'python': () => import('./asm-docs-search-python.js'),
+};
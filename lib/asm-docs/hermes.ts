@@ -22,14 +22,16 @@
 // ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 // POSSIBILITY OF SUCH DAMAGE.
 
-import {AssemblyInstructionInfo, BaseAssemblyDocumentationProvider} from './base.js';
-import {getAsmOpcode} from './generated/asm-docs-hermes.js';
+import {AssemblyInstructionInfo, BaseAssemblyDocumentationProvider, lazyAsmOpcodeGetter} from './base.js';
+
+const getAsmOpcode = lazyAsmOpcodeGetter(() => import('./generated/asm-docs-hermes.js'));
 
 export class HermesDocumentationProvider extends BaseAssemblyDocumentationProvider {
     public static get key() {
         return 'hermes';
     }
-    public override getInstructionInformation(instruction: string): AssemblyInstructionInfo | null {
-        return getAsmOpcode(instruction) || null;
+    public override async getInstructionInformation(instruction: string): Promise<AssemblyInstructionInfo | null> {
+        const getOpcode = await getAsmOpcode();
+        return getOpcode(instruction) || null;
     }
 }
@@ -22,14 +22,29 @@
 // ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 // POSSIBILITY OF SUCH DAMAGE.
 
-import {AssemblyInstructionInfo, BaseAssemblyDocumentationProvider} from './base.js';
+import {AsmDocsVersionDelta, AssemblyInstructionInfo, BaseAssemblyDocumentationProvider} from './base.js';
 import {getAsmOpcode} from './generated/asm-docs-python.js';
+import {BASE_VERSION, VERSION_DELTAS} from './generated/asm-docs-python-versions.js';
 
 export class PythonDocumentationProvider extends BaseAssemblyDocumentationProvider {
+    /** @param deltas How the docs of each major.minor version differ from the base ones. */
+    constructor(private readonly deltas: Record<string, AsmDocsVersionDelta> = VERSION_DELTAS) {
+        super();
+    }
     public static get key() {
         return 'python';
     }
-    public override getInstructionInformation(instruction: string): AssemblyInstructionInfo | null {
-        return getAsmOpcode(instruction) || null;
+    public override getInstructionInformation(instruction: string, version?: string): AssemblyInstructionInfo | null {
+        // The docs are versioned by major.minor, e.g. 3.8 for an interpreter of version 3.8.1
+        const docsVersion = version?.split('.').slice(0, 2).join('.');
+        const delta = docsVersion && Object.hasOwn(this.deltas, docsVersion) ? this.deltas[docsVersion] : undefined;
+        if (!delta) return getAsmOpcode(instruction) || null;
+
+        const opcode = instruction.toUpperCase();
+        if (delta.removed.includes(opcode)) return null;
+        if (Object.hasOwn(delta.changed, opcode)) return delta.changed[opcode];
+        const info = getAsmOpcode(opcode);
+        if (!info) return null;
+        return {...info, url: info.url.replace(`/${BASE_VERSION}/`, `/${docsVersion}/`)};
     }
 }
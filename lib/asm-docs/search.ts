@@ -0,0 +1,147 @@
+// Copyright (c) 2026, Compiler Explorer Authors
+// All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+//     * Redistributions of source code must retain the above copyright notice,
+//       this list of conditions and the following disclaimer.
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+// LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+// CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+// SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+// INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+// CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+// ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+// POSSIBILITY OF SUCH DAMAGE.
+
+import {SEARCH_SEGMENTS} from './generated/asm-docs-search.js';
+
+/**
+ * The search index of one architecture, written by etc/scripts/docenizers/searchindex.py.
+ *
+ * `docs` holds the [opcode, tooltip] of each instruction, `lengths` their
+ * token counts and `postings` maps each term to a flat [doc, tf, doc, tf...] list.
+ */
+export type SearchSegment = {
+    hash: string;
+    docs: [string, string][];
+    lengths: number[];
+    postings: Record<string, number[]>;
+};
+
+export type SearchResult = {
+    arch: string;
+    opcode: string;
+    tooltip: string;
+    score: number;
+};
+
+const BM25_K1 = 1.2;
+const BM25_B = 0.75;
+const TOKEN_RE = /[a-z0-9]+/g;
+const STOP_WORDS = new Set(
+    'a an and are as at be by for from if in into is it its of on or that the then this to was when which with'.split(
+        ' ',
+    ),
+);
+
+/** A light suffix stripper: plurals, -ing, -ed and a final e. Must match stem() in searchindex.py. */
+export function stem(word: string): string {
+    if (word.length <= 3 || !/^[a-z]+$/.test(word)) return word;
+    if (word.endsWith('ies') && word.length > 4) word = word.slice(0, -3) + 'y';
+    else if (word.endsWith('sses')) word = word.slice(0, -2);
+    else if (word.endsWith('s') && !/(ss|us|is)$/.test(word)) word = word.slice(0, -1);
+    for (const suffix of ['ing', 'ed']) {
+        if (word.endsWith(suffix) && word.length - suffix.length >= 3) {
+            word = word.slice(0, -suffix.length);
+            const last = word[word.length - 1];
+            if (last === word[word.length - 2] && !'lsz'.includes(last)) word = word.slice(0, -1);
+            break;
+        }
+    }
+    if (word.endsWith('e') && word.length > 3) word = word.slice(0, -1);
+    return word;
+}
+
+/** Splits a plain text query into terms, the way the docs were indexed. */
+export function tokenize(text: string): string[] {
+    return (text.toLowerCase().match(TOKEN_RE) || []).filter(token => !STOP_WORDS.has(token)).map(stem);
+}
+
+/** The postings of `term`, if indexed; a term like `constructor` must not reach the prototype of `postings`. */
+function getPostings(segment: SearchSegment, term: string): number[] | undefined {
+    return Object.hasOwn(segment.postings, term) ? segment.postings[term] : undefined;
+}
+
+/** The search index over the documentation of all architectures, ranked with BM25. */
+export class AsmDocsSearchIndex {
+    private readonly docCount: number;
+    private readonly averageLength: number;
+
+    constructor(private readonly segments: Record<string, SearchSegment>) {
+        let docCount = 0;
+        let totalLength = 0;
+        for (const segment of Object.values(segments)) {
+            docCount += segment.docs.length;
+            for (const length of segment.lengths) totalLength += length;
+        }
+        this.docCount = docCount;
+        this.averageLength = docCount ? totalLength / docCount : 0;
+    }
+
+    public get archs(): string[] {
+        return Object.keys(this.segments);
+    }
+
+    public search(query: string, arch?: string, limit = 10): SearchResult[] {
+        const scores = new Map<string, {arch: string; doc: number; score: number}>();
+        for (const term of new Set(tokenize(query))) {
+            let df = 0;
+            for (const segment of Object.values(this.segments)) {
+                const postings = getPostings(segment, term);
+                if (postings) df += postings.length / 2;
+            }
+            if (!df) continue;
+            const idf = Math.log(1 + (this.docCount - df + 0.5) / (df + 0.5));
+            for (const [segmentArch, segment] of Object.entries(this.segments)) {
+                const postings = getPostings(segment, term);
+                if (!postings || (arch && segmentArch !== arch)) continue;
+                for (let i = 0; i < postings.length; i += 2) {
+                    const [doc, tf] = [postings[i], postings[i + 1]];
+                    const norm = BM25_K1 * (1 - BM25_B + (BM25_B * segment.lengths[doc]) / this.averageLength);
+                    const key = `${segmentArch}:${doc}`;
+                    const entry = scores.get(key) || {arch: segmentArch, doc, score: 0};
+                    entry.score += (idf * tf * (BM25_K1 + 1)) / (tf + norm);
+                    scores.set(key, entry);
+                }
+            }
+        }
+        return [...scores.values()]
+            .sort((a, b) => b.score - a.score || a.arch.localeCompare(b.arch) || a.doc - b.doc)
+            .slice(0, limit)
+            .map(({arch, doc, score}) => {
+                const [opcode, tooltip] = this.segments[arch].docs[doc];
+                return {arch, opcode, tooltip, score};
+            });
+    }
+}
+
+let searchIndex: Promise<AsmDocsSearchIndex> | undefined;
+
+/** Loads the search index on first use; the segments are not part of server startup. */
+export function getSearchIndex(): Promise<AsmDocsSearchIndex> {
+    if (!searchIndex) {
+        searchIndex = Promise.all(
+            Object.entries(SEARCH_SEGMENTS).map(async ([arch, load]) => [arch, (await load()).default] as const),
+        ).then(segments => new AsmDocsSearchIndex(Object.fromEntries(segments)));
+    }
+    return searchIndex;
+}
@@ -25,11 +25,14 @@
 import express from 'express';
 
 import {BaseAssemblyDocumentationProvider, getDocumentationProviderTypeByKey} from '../asm-docs/index.js';
+import {getSearchIndex} from '../asm-docs/search.js';
+import {logger} from '../logger.js';
 import {propsFor} from '../properties.js';
 
 const MAX_STATIC_AGE = propsFor('asm-docs')('staticMaxAgeSecs', 10);
+const MAX_SEARCH_RESULTS = 100;
 
-const onDocumentationProviderRequest = (
+const onDocumentationProviderRequest = async (
     provider: BaseAssemblyDocumentationProvider,
     request: express.Request,
     response: express.Response,
@@ -37,7 +40,8 @@ const onDocumentationProviderRequest = (
     // If the request had no opcode parameter, we should fail. This assumes
     // no assembly language has a __unknown_opcode instruction.
     const instruction = (request.params.opcode || '__UNKNOWN_OPCODE').toUpperCase();
-    const information = provider.getInstructionInformation(instruction);
+    const version = typeof request.query.version === 'string' ? request.query.version : undefined;
+    const information = await provider.getInstructionInformation(instruction, version);
     if (information === null) {
         return response.status(404).send({error: `Unknown opcode '${instruction}'`});
     }
@@ -59,21 +63,47 @@ const onDocumentationProviderRequest = (
     }
 };
 
+const onSearchRequest = async (request: express.Request, response: express.Response) => {
+    const query = typeof request.query.q === 'string' ? request.query.q : '';
+    const arch = typeof request.query.arch === 'string' ? request.query.arch : undefined;
+    const limit = Math.min(parseInt(String(request.query.limit)) || 10, MAX_SEARCH_RESULTS);
+    if (!query) {
+        return response.status(400).send({error: 'Missing search query'});
+    }
+    const index = await getSearchIndex();
+    if (arch && !index.archs.includes(arch)) {
+        return response.status(404).send({error: `No documentation for '${arch}'`});
+    }
+    response.send(index.search(query, arch, limit));
+};
+
 /** Initialize API routes for assembly documentation */
 export const withAssemblyDocumentationProviders = (router: express.Router) =>
-    router.get('/asm/:arch/:opcode', (req, res) => {
-        if (MAX_STATIC_AGE > 0) {
-            res.setHeader('Cache-Control', `public, max-age=${MAX_STATIC_AGE}`);
-        }
-        const arch = req.params.arch;
-        // makeKeyedTypeGetter throws if the key is not found. We do not wish
-        // crash CE if this happens, so we catch the error and return a 404.
-        try {
-            const providerClass = getDocumentationProviderTypeByKey(arch);
-            onDocumentationProviderRequest(new providerClass(), req, res);
-        } catch {
-            res.status(404)
-                .json({error: `No documentation for '${arch}'`})
-                .send();
-        }
-    });
+    router
+        .get('/asm/search', async (req, res) => {
+            if (MAX_STATIC_AGE > 0) {
+                res.setHeader('Cache-Control', `public, max-age=${MAX_STATIC_AGE}`);
+            }
+            try {
+                await onSearchRequest(req, res);
+            } catch (e) {
+                logger.error('Error searching the assembly documentation:', e);
+                res.status(500).json({error: 'Search failed'});
+            }
+        })
+        .get('/asm/:arch/:opcode', async (req, res) => {
+            if (MAX_STATIC_AGE > 0) {
+                res.setHeader('Cache-Control', `public, max-age=${MAX_STATIC_AGE}`);
+            }
+            const arch = req.params.arch;
+            // makeKeyedTypeGetter throws if the key is not found. We do not wish
+            // crash CE if this happens, so we catch the error and return a 404.
+            try {
+                const providerClass = getDocumentationProviderTypeByKey(arch);
+                await onDocumentationProviderRequest(new providerClass(), req, res);
+            } catch {
+                res.status(404)
+                    .json({error: `No documentation for '${arch}'`})
+                    .send();
+            }
+        });
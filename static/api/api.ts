@@ -48,7 +48,10 @@ const request = async <R>(uri: string, options?: RequestInit): Promise<TypedResp
 
 /** GET /api/asm/:arch/:instruction */
 export const getAssemblyDocumentation = async (options: AssemblyDocumentationRequest) =>
-    await request<AssemblyDocumentationResponse>(`/asm/${options.instructionSet}/${options.opcode}`);
+    await request<AssemblyDocumentationResponse>(
+        `/asm/${options.instructionSet}/${options.opcode}` +
+            (options.version ? `?version=${encodeURIComponent(options.version)}` : ''),
+    );
 
 /** POST /api/format/:formatter */
 export const getFormattedCode = async (options: FormattingRequest) =>
@@ -51,7 +51,7 @@ import {CompilerState} from './compiler.interfaces.js';
 import {ComponentConfig, ToolViewState} from '../components.interfaces.js';
 import {LanguageLibs} from '../options.interfaces.js';
 import {GccDumpFiltersState, GccDumpViewSelectedPass} from './gccdump-view.interfaces.js';
-import {AssemblyInstructionInfo} from '../../lib/asm-docs/base.js';
+import {AssemblyInstructionInfo, InstructionGas, InstructionTiming} from '../../lib/asm-docs/base.js';
 import {PPOptions} from './pp-view.interfaces.js';
 import {CompilationStatus} from '../compiler-service.interfaces.js';
 import {WidgetState} from '../widgets/libs-widget.interfaces.js';
@@ -80,6 +80,8 @@ const OpcodeCache = new LruCache<string, CachedOpcode>({
         return JSON.stringify(n).length;
     },
 });
+// The instruction sets documented per version, whose documentation is looked up for the compiler's version.
+const VERSIONED_INSTRUCTION_SETS: AssemblyDocumentationInstructionSet[] = ['python'];
 
 function patchOldFilters(filters) {
     if (filters === undefined) return undefined;
@@ -3332,14 +3334,15 @@ export class Compiler extends MonacoPane<monaco.editor.IStandaloneCodeEditor, Co
         opcode: string,
         instructionSet: AssemblyDocumentationInstructionSet,
     ): Promise<AssemblyInstructionInfo | undefined> {
-        const cacheName = `asm/${instructionSet}/${opcode}`;
+        const version = VERSIONED_INSTRUCTION_SETS.includes(instructionSet) ? this.compiler?.semver : undefined;
+        const cacheName = version ? `asm/${instructionSet}/${opcode}/${version}` : `asm/${instructionSet}/${opcode}`;
         const cached = OpcodeCache.get(cacheName);
         if (cached) {
             if (cached.found) return cached.data as AssemblyInstructionInfo;
             throw new Error(cached.data as string);
         }
 
-        const response = await getAssemblyDocumentation({opcode, instructionSet});
+        const response = await getAssemblyDocumentation({opcode, instructionSet, version});
         const body = await response.json();
         if (response.status === 200) {
             OpcodeCache.set(cacheName, {found: true, data: body});
@@ -3351,6 +3354,52 @@ export class Compiler extends MonacoPane<monaco.editor.IStandaloneCodeEditor, Co
         }
     }
 
+    /** Formats the structured cost fields of an instruction, if any, as markdown for its hover. */
+    private getAsmCostSummary(info: AssemblyInstructionInfo): string {
+        if (info.gas) return this.getAsmGasSummary(info.gas);
+        if (info.cycles || info.words) {
+            const cycles = Object.entries(info.cycles ?? {}).map(([family, count]) =>
+                family === 'all' ? count : `${family}: ${count}`,
+            );
+            const parts = [
+                info.words ? `Words: ${info.words}` : '',
+                cycles.length > 0 ? `Cycles: ${cycles.join(', ')}` : '',
+            ];
+            return '\n\n' + parts.filter(part => part).join(', ');
+        }
+        const performance = info.performance;
+        if (!performance || performance.length === 0) return '';
+        // Measurements are listed oldest microarchitecture first, show the most recent ones.
+        const uarchs = _.uniq(performance.flatMap(form => Object.keys(form.uarchs))).slice(-6);
+        const rows = performance.slice(0, 8).map(form => {
+            const cells = uarchs.map(uarch => {
+                const timing = form.uarchs[uarch] as InstructionTiming | undefined;
+                return timing ? `${timing.latency ?? '-'} / ${timing.throughput ?? '-'}` : '';
+            });
+            return `| ${form.form} | ${cells.join(' | ')} |`;
+        });
+        return (
+            '\n\nLatency / reciprocal throughput (cycles):\n\n' +
+            `| Form | ${uarchs.join(' | ')} |\n` +
+            `|---|${uarchs.map(() => '---').join('|')}|\n` +
+            rows.join('\n')
+        );
+    }
+
+    /** The gas cost in the hardfork selected with --evm-version, or the current one. */
+    private getAsmGasSummary(gas: InstructionGas): string {
+        const fork = /--evm-version[= ](\w+)/.exec(this.options)?.[1];
+        let summary = '';
+        if (fork && gas.forks && fork in gas.forks) {
+            const cost = gas.forks[fork];
+            summary = cost === null ? `Not available before ${gas.since}` : `Gas (${fork}): ${cost}`;
+        } else if (gas.static !== undefined) {
+            summary = `Gas: ${gas.static}`;
+        }
+        if (gas.dynamic) summary += summary ? `, plus dynamic gas: ${gas.dynamic}` : `Dynamic gas: ${gas.dynamic}`;
+        return summary ? '\n\n' + summary : '';
+    }
+
     override onDidChangeCursorSelection(e) {
         if (this.awaitingInitialResults) {
             this.selection = e.selection;
@@ -3460,7 +3509,10 @@ export class Compiler extends MonacoPane<monaco.editor.IStandaloneCodeEditor, Co
                                 isWholeLine: false,
                                 hoverMessage: [
                                     {
-                                        value: response.tooltip + '\n\nMore information available in the context menu.',
+                                        value:
+                                            response.tooltip +
+                                            this.getAsmCostSummary(response) +
+                                            '\n\nMore information available in the context menu.',
                                         isTrusted: true,
                                     },
                                 ],
@@ -25,6 +25,7 @@
 import {expect} from 'chai';
 import express from 'express';
 
+import {PythonDocumentationProvider} from '../../lib/asm-docs/python.js';
 import {withAssemblyDocumentationProviders} from '../../lib/handlers/assembly-documentation.js';
 import {chai} from '../utils.js';
 
@@ -98,6 +99,51 @@ describe('Assembly Documentation API', () => {
         expect(res.body).to.deep.equal({error: `No documentation for 'not_an_arch'`});
     });
 
+    it('should return search results across architectures', async () => {
+        const res = await chai
+            .request(app)
+            .get('/api/asm/search?q=number%20of%20bits%20set%20to%201')
+            .set('Accept', 'application/json');
+        expect(res).to.have.status(200);
+        expect(res).to.be.json;
+        expect(res.body[0]).to.include({arch: 'amd64', opcode: 'POPCNT'});
+    });
+
+    it('should only search the requested architecture', async () => {
+        const res = await chai.request(app).get('/api/asm/search?q=add%20with%20carry&arch=avr');
+        expect(res).to.have.status(200);
+        expect(res.body).to.not.be.empty;
+        expect(res.body.map((result: {arch: string}) => result.arch)).to.deep.equal(res.body.map(() => 'avr'));
+    });
+
+    it('should search the docs of the TypeScript docenizers', async () => {
+        const res = await chai.request(app).get('/api/asm/search?q=atomically%20modify%20memory&arch=llvm');
+        expect(res).to.have.status(200);
+        expect(res.body[0]).to.include({arch: 'llvm', opcode: 'ATOMICRMW'});
+    });
+
+    it('should fall back to the base docs for unknown versions', async () => {
+        const res = await chai
+            .request(app)
+            .get('/api/asm/python/pop_top?version=2.7')
+            .set('Accept', 'application/json');
+        expect(res).to.have.status(200);
+        expect(res.body.url).to.contain('https://docs.python.org/3/library/dis.html');
+    });
+
+    it('should not match object prototype names in search queries', async () => {
+        // Only the hermes docs mention constructors; the other architectures must not match Object.prototype.
+        const res = await chai.request(app).get('/api/asm/search?q=constructor');
+        expect(res).to.have.status(200);
+        expect(res.body).to.not.be.empty;
+        expect(res.body.map((result: {arch: string}) => result.arch)).to.deep.equal(res.body.map(() => 'hermes'));
+    });
+
+    it('should return 400 for empty search queries', async () => {
+        const res = await chai.request(app).get('/api/asm/search');
+        expect(res).to.have.status(400);
+    });
+
     for (const [arch, cases] of Object.entries(TEST_MATRIX)) {
         for (const [opcode, tooltip, html, url] of cases) {
             it(`should process ${arch} text requests`, async () => {
@@ -134,3 +180,32 @@ describe('Assembly Documentation API', () => {
         }
     }
 });
+
+describe('Python documentation versions', () => {
+    const binaryAdd = {
+        tooltip: 'Implements TOS = TOS1 + TOS.',
+        html: '<p>Implements <code>TOS = TOS1 + TOS</code>.</p>',
+        url: 'https://docs.python.org/3.8/library/dis.html#opcode-BINARY_ADD',
+    };
+    const provider = new PythonDocumentationProvider({
+        '3.8': {removed: ['BINARY_OP'], changed: {BINARY_ADD: binaryAdd}},
+    });
+
+    it('should use the delta of the version over the base docs', () => {
+        expect(provider.getInstructionInformation('binary_add', '3.8.1')).to.deep.equal(binaryAdd);
+        expect(provider.getInstructionInformation('binary_op', '3.8.1')).to.be.null;
+        expect(provider.getInstructionInformation('binary_op', '3.12.0')).to.not.be.null;
+        expect(provider.getInstructionInformation('binary_op')).to.not.be.null;
+    });
+
+    it('should link the base docs of opcodes the version documents the same way to the version', () => {
+        const info = provider.getInstructionInformation('pop_top', '3.8.1');
+        expect(info?.url).to.contain('https://docs.python.org/3.8/library/dis.html');
+    });
+
+    it('should not look up versions on the prototype of the deltas', () => {
+        expect(provider.getInstructionInformation('pop_top', 'constructor')?.url).to.contain(
+            'https://docs.python.org/3/library/dis.html',
+        );
+    });
+});
@@ -29,6 +29,7 @@ export type AssemblyDocumentationInstructionSet =
     | 'arm32'
     | 'avr'
     | 'evm'
+    | 'hermes'
     | 'java'
     | 'llvm'
     | 'mos6502'
@@ -39,6 +40,8 @@ export interface AssemblyDocumentationRequest {
     instructionSet: AssemblyDocumentationInstructionSet;
     /** Instruction set opcode to look for */
     opcode: string;
+    /** Version of the instruction set, for the instruction sets documented per version */
+    version?: string;
 }
 
 export type AssemblyDocumentationResponse = AssemblyInstructionInfo;